@@ -0,0 +1,176 @@
+"""
+Measures the memory usage and throughput of the `commands_v2` cooldown storage.
+
+Usage:
+
+```
+$ python3 -m benchmarks.cooldown_store
+```
+
+Fills the cooldowns of a million entities, once with a ``CooldownUnit`` and a timer handle for each entity (the
+previous implementation) and once with ``CooldownStore``, then uses every entity's cooldown again.
+"""
+
+from time import perf_counter
+from tracemalloc import get_traced_memory, start as start_tracing, stop as stop_tracing
+
+from scarletio import LOOP_TIME, run_coroutine
+
+from hata import KOKORO
+from hata.ext.commands_v2.cooldown import CooldownStore
+
+
+KEY_BASE = 202610170000000000
+KEY_COUNT = 1000000
+LIMIT = 1
+RESET = 3600.0
+WEIGHT = 1
+
+
+class CooldownUnit:
+    """
+    A unit of the previous implementation.
+    
+    Attributes
+    ----------
+    expires_at : `float`
+        When the cooldown unit will expire in LOOP_TIME time.
+    uses_left : `int`
+        How much uses are left till the respective entity will be locked by cooldown.
+    """
+    __slots__ = ('expires_at', 'uses_left',)
+    
+    def __init__(self, expires_at, uses_left):
+        self.expires_at = expires_at
+        self.uses_left = uses_left
+
+
+def check_legacy(cache, key, handles):
+    """
+    Uses the given entity's cooldown as the previous implementation.
+    
+    Parameters
+    ----------
+    cache : `dict<int, CooldownUnit>`
+        The cooldown units.
+    key : `int`
+        The entity's identifier.
+    handles : `list<TimerHandle>`
+        Timer handles to cancel after the measurement.
+    
+    Returns
+    -------
+    expires_at : `float`
+    """
+    try:
+        unit = cache[key]
+    except KeyError:
+        at_ = LOOP_TIME() + RESET
+        cache[key] = CooldownUnit(at_, LIMIT)
+        handles.append(KOKORO.call_at(at_, dict.__delitem__, cache, key))
+        return 0.
+    
+    left = unit.uses_left
+    if left > 0:
+        unit.uses_left = left - WEIGHT
+        return 0.
+    
+    return unit.expires_at
+
+
+async def measure_legacy(keys):
+    """
+    Measures the previous implementation.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    keys : `list<int>`
+        The entities' identifiers.
+    
+    Returns
+    -------
+    memory : `int`
+    fill : `float`
+    use : `float`
+    """
+    cache = {}
+    # Created before tracing, so only the loop's references to the handles are measured.
+    handles = [None] * len(keys)
+    del handles[:]
+    
+    start_tracing()
+    start = perf_counter()
+    for key in keys:
+        check_legacy(cache, key, handles)
+    fill = perf_counter() - start
+    memory = get_traced_memory()[0]
+    stop_tracing()
+    
+    start = perf_counter()
+    for key in keys:
+        check_legacy(cache, key, handles)
+    use = perf_counter() - start
+    
+    for handle in handles:
+        handle.cancel()
+    
+    return memory, fill, use
+
+
+async def measure_store(keys):
+    """
+    Measures ``CooldownStore``.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    keys : `list<int>`
+        The entities' identifiers.
+    
+    Returns
+    -------
+    memory : `int`
+    fill : `float`
+    use : `float`
+    """
+    start_tracing()
+    store = CooldownStore(RESET)
+    start = perf_counter()
+    for key in keys:
+        store.check(key, LIMIT, WEIGHT)
+    fill = perf_counter() - start
+    memory = get_traced_memory()[0]
+    stop_tracing()
+    
+    start = perf_counter()
+    for key in keys:
+        store.check(key, LIMIT, WEIGHT)
+    use = perf_counter() - start
+    
+    store.clear()
+    return memory, fill, use
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    keys = [KEY_BASE + index for index in range(KEY_COUNT)]
+    
+    try:
+        for name, measure in (('legacy', measure_legacy), ('store', measure_store)):
+            memory, fill, use = run_coroutine(measure(keys), KOKORO)
+            print(
+                f'{name:>6}: {memory / 1048576.0:8.2f} MiB, fill {fill * 1000.0:9.3f} ms, '
+                f'use {use * 1000.0:9.3f} ms / {KEY_COUNT} entities'
+            )
+    
+    finally:
+        KOKORO.stop()
+
+
+if __name__ == '__main__':
+    main()
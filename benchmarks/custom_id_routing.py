@@ -0,0 +1,116 @@
+"""
+Measures routing custom ids to regex based component commands.
+
+Usage:
+
+```
+$ python3 -m benchmarks.custom_id_routing
+```
+
+Compares matching every regex pattern one by one with ``CustomIdRouter``, which combines them into a single
+alternation.
+
+1000 patterns are registered. Custom ids matching the first, the middle and the last pattern, and ones matching none
+are routed.
+"""
+
+from re import compile as re_compile
+from time import perf_counter
+
+from hata.ext.slash.converters import RegexMatcher
+from hata.ext.slash.custom_id_router import CustomIdRouter
+
+
+ROUNDS = 10
+PATTERN_COUNT = 1000
+ROUTE_COUNT = 1000
+
+
+def create_routes():
+    """
+    Creates the benchmarked routes.
+    
+    Returns
+    -------
+    routes : `dict<RegexMatcher, str>`
+    """
+    routes = {}
+    for index in range(PATTERN_COUNT):
+        routes[RegexMatcher(re_compile(f'command_{index}_(?P<user_id>\\d+)_(?P<page>\\d+)'))] = f'command_{index}'
+    
+    return routes
+
+
+def route_linear(routes, custom_id):
+    """
+    Routes the given custom id by matching the patterns one by one.
+    
+    Parameters
+    ----------
+    routes : `dict<RegexMatcher, str>`
+        The routes to match.
+    custom_id : `str`
+        The custom id to route.
+    
+    Returns
+    -------
+    route : `None | (str, RegexMatch)`
+    """
+    for regex_matcher in routes:
+        regex_match = regex_matcher(custom_id)
+        if (regex_match is not None):
+            return routes[regex_matcher], regex_match
+    
+    return None
+
+
+def measure(name, function, custom_id):
+    """
+    Measures the given function.
+    
+    Parameters
+    ----------
+    name : `str`
+        The measurement's name.
+    function : `callable`
+        The function to measure.
+    custom_id : `str`
+        The custom id to route.
+    """
+    best = None
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        for _ in range(ROUTE_COUNT):
+            function(custom_id)
+        elapsed = perf_counter() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    
+    print(f'{name:>32}: {best * 1000.0:8.3f} ms / {ROUTE_COUNT} routes')
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    routes = create_routes()
+    
+    start = perf_counter()
+    custom_id_router = CustomIdRouter()
+    for regex_matcher, command in routes.items():
+        custom_id_router[regex_matcher] = command
+    custom_id_router.route('')
+    print(f'{"build":>32}: {(perf_counter() - start) * 1000.0:8.3f} ms / {PATTERN_COUNT} patterns')
+    
+    for case, custom_id in (
+        ('first', 'command_0_202610170000_1'),
+        ('middle', f'command_{PATTERN_COUNT // 2}_202610170000_1'),
+        ('last', f'command_{PATTERN_COUNT - 1}_202610170000_1'),
+        ('miss', 'koishi_202610170000_1'),
+    ):
+        measure(f'linear ({case})', lambda custom_id: route_linear(routes, custom_id), custom_id)
+        measure(f'CustomIdRouter ({case})', custom_id_router.route, custom_id)
+
+
+if __name__ == '__main__':
+    main()
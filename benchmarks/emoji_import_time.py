@@ -0,0 +1,77 @@
+"""
+Measures the time of importing hata and the time of the first access of the builtin emojis.
+
+Usage:
+
+```
+$ python3 -m benchmarks.emoji_import_time [count]
+```
+
+Imports hata `count` (by default 10) times, each in a new interpreter, and prints the median import time. After it
+measures the first access of ``BUILTIN_EMOJIS``, which creates the builtin emojis and the first use of
+``EMOJI_ALL_RP``, which builds the all emoji matching pattern.
+"""
+
+import sys
+from statistics import median
+from subprocess import check_output
+
+
+IMPORT_COUNT = 10
+
+IMPORT_SCRIPT = """
+from time import perf_counter
+start = perf_counter()
+import hata
+print(perf_counter() - start)
+"""
+
+FIRST_ACCESS_SCRIPT = """
+from time import perf_counter
+import hata
+from hata.discord.core import BUILTIN_EMOJIS
+from hata.discord.emoji.parsing.pattern import EMOJI_ALL_RP
+start = perf_counter()
+BUILTIN_EMOJIS['heart']
+print(perf_counter() - start)
+start = perf_counter()
+EMOJI_ALL_RP.findall(':heart:')
+print(perf_counter() - start)
+"""
+
+
+def run_script(script):
+    """
+    Runs the given script in a new interpreter and returns the times it printed.
+    
+    Parameters
+    ----------
+    script : `str`
+        The script to run.
+    
+    Returns
+    -------
+    elapsed : `list<float>`
+    """
+    return [float(line) for line in check_output([sys.executable, '-c', script]).decode().splitlines()]
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if len(sys.argv) > 1:
+        count = int(sys.argv[1])
+    else:
+        count = IMPORT_COUNT
+    
+    import_elapsed = median(run_script(IMPORT_SCRIPT)[0] for index in range(count))
+    emojis_elapsed, pattern_elapsed = run_script(FIRST_ACCESS_SCRIPT)
+    
+    print(f'import hata:          {import_elapsed * 1000.0:8.1f} ms (median of {count})')
+    print(f'first emoji access:   {emojis_elapsed * 1000.0:8.1f} ms')
+    print(f'first pattern use:    {pattern_elapsed * 1000.0:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""
+Measures dispatching events to event handlers with and without inline dispatch.
+
+Usage:
+
+```
+$ python3 -m benchmarks.event_dispatch [path]
+```
+
+Replays a recorded event stream through the client's parsers, once creating a task for each event handler call and
+once with ``EventHandlerManager.inline_dispatch`` enabled. The measurement ends when every event handler returned.
+
+`path` can point to a json lines file of recorded dispatch events, each line being a `{"t": name, "d": data}` object
+(the same shape as the gateway's dispatch payloads). If not given, a stream of message create, message delete and typing
+events is generated.
+"""
+
+import sys
+from time import perf_counter
+
+from scarletio import from_json, run_coroutine, skip_ready_cycle
+
+from hata import Channel, ChannelType, Client, KOKORO
+from hata.discord.events.core import PARSERS, register_client, unregister_client
+from hata.discord.events.handling_helpers import call_parser
+
+
+EVENT_COUNT = 50000
+ROUNDS = 3
+
+CHANNEL_ID = 202610171000
+CLIENT_ID = 202610171001
+MESSAGE_ID_BASE = 202610180000000000
+USER_ID = 202610171002
+
+
+def generate_events():
+    """
+    Generates an event stream.
+    
+    Returns
+    -------
+    events : `list<(str, dict<str, object>)>`
+    """
+    events = []
+    for index in range(EVENT_COUNT):
+        message_id = str(MESSAGE_ID_BASE + index)
+        kind = index % 4
+        if kind == 3:
+            events.append((
+                'MESSAGE_DELETE',
+                {'channel_id': str(CHANNEL_ID), 'id': str(MESSAGE_ID_BASE + index - 1)},
+            ))
+        
+        elif kind == 2:
+            events.append((
+                'TYPING_START',
+                {'channel_id': str(CHANNEL_ID), 'user_id': str(USER_ID), 'timestamp': 1760659200},
+            ))
+        
+        else:
+            events.append((
+                'MESSAGE_CREATE',
+                {
+                    'author': {'id': str(USER_ID), 'username': 'koishi', 'discriminator': '0000'},
+                    'channel_id': str(CHANNEL_ID),
+                    'content': f'message {index}',
+                    'id': message_id,
+                    'type': 0,
+                },
+            ))
+    
+    return events
+
+
+def load_events(path):
+    """
+    Loads a recorded event stream.
+    
+    Parameters
+    ----------
+    path : `str`
+        Path to a json lines file.
+    
+    Returns
+    -------
+    events : `list<(str, dict<str, object>)>`
+    """
+    events = []
+    with open(path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                event = from_json(line)
+                events.append((event['t'], event['d']))
+    
+    return events
+
+
+async def replay(client, events, counter):
+    """
+    Replays the events and waits till every event handler returns.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client to replay the events with.
+    events : `list<(str, dict<str, object>)>`
+        The events to replay.
+    counter : `list<int>`
+        Counter of the returned event handlers.
+    
+    Returns
+    -------
+    elapsed : `float`
+    """
+    counter[0] = 0
+    
+    start = perf_counter()
+    for name, data in events:
+        parser = PARSERS.get(name, None)
+        if parser is not None:
+            call_parser(parser, client, data)
+    
+    # Not every event might call an event handler, so wait till the counter stops increasing.
+    last = -1
+    while counter[0] != last:
+        last = counter[0]
+        await skip_ready_cycle()
+    
+    return perf_counter() - start
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if len(sys.argv) > 1:
+        events = load_events(sys.argv[1])
+    else:
+        events = generate_events()
+    
+    client = Client('token_202610171003', client_id = CLIENT_ID)
+    channel = Channel.precreate(CHANNEL_ID, channel_type = ChannelType.private)
+    counter = [0]
+    
+    async def event_handler(client, *parameters):
+        counter[0] += 1
+    
+    client.events(event_handler, name = 'message_create')
+    client.events(event_handler, name = 'message_delete')
+    client.events(event_handler, name = 'typing')
+    
+    # Switches the parsers to call the event handlers as if the client would be running.
+    register_client(client)
+    try:
+        for inline_dispatch in (False, True):
+            client.events.inline_dispatch = inline_dispatch
+            best = None
+            for _ in range(ROUNDS):
+                elapsed = run_coroutine(replay(client, events, counter), KOKORO)
+                if (best is None) or (elapsed < best):
+                    best = elapsed
+            
+            mode = 'inline' if inline_dispatch else 'task'
+            print(f'{mode:>6}: {best * 1000.0:9.3f} ms / {len(events)} events, {counter[0]} event handler calls')
+    
+    finally:
+        unregister_client(client)
+        channel = None
+        client._delete()
+        client = None
+        KOKORO.stop()
+
+
+if __name__ == '__main__':
+    main()
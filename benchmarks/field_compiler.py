@@ -0,0 +1,219 @@
+"""
+Compares the compiled field tables to calling each field parser and putter one by one.
+
+Usage:
+
+```
+$ python3 -m benchmarks.field_compiler [path]
+```
+
+`path` can point to a json lines file of recorded dispatch events, each line being a `{"t": name, "d": data}` object.
+Its `MESSAGE_CREATE` and `GUILD_CREATE` events are used. If not given, these events are generated.
+
+The message fields are parsed from each `MESSAGE_CREATE` payload, the role fields are parsed from and put into the
+roles of each `GUILD_CREATE` payload.
+"""
+
+import sys
+from time import perf_counter
+
+from scarletio import from_json
+
+from hata import Message, Role
+from hata.discord.field_compiler import _compile_function, render_field_parser, render_field_putter
+from hata.discord.message.message.message import MESSAGE_FIELDS
+from hata.discord.role.role.role import ROLE_FIELDS
+
+
+MESSAGE_COUNT = 20000
+GUILD_COUNT = 20
+ROLE_COUNT = 250
+ROUNDS = 5
+
+CHANNEL_ID = 202610170100
+GUILD_ID_BASE = 202610170200
+MESSAGE_ID_BASE = 202610180000000000
+ROLE_ID_BASE = 202610190000000000
+USER_ID = 202610170101
+
+
+def generate_events():
+    """
+    Generates `MESSAGE_CREATE` and `GUILD_CREATE` events.
+    
+    Returns
+    -------
+    events : `list<(str, dict<str, object>)>`
+    """
+    events = []
+    
+    for index in range(MESSAGE_COUNT):
+        events.append((
+            'MESSAGE_CREATE',
+            {
+                'author': {'id': str(USER_ID), 'username': 'koishi', 'discriminator': '0000'},
+                'channel_id': str(CHANNEL_ID),
+                'content': f'message {index}',
+                'edited_timestamp': None,
+                'flags': 0,
+                'id': str(MESSAGE_ID_BASE + index),
+                'mention_everyone': False,
+                'mention_roles': [str(ROLE_ID_BASE), str(ROLE_ID_BASE + 1)] if index % 10 == 0 else [],
+                'mentions': [],
+                'nonce': str(index),
+                'pinned': False,
+                'timestamp': '2026-10-17T00:00:00.000000+00:00',
+                'tts': False,
+                'type': 0,
+            },
+        ))
+    
+    for guild_index in range(GUILD_COUNT):
+        events.append((
+            'GUILD_CREATE',
+            {
+                'id': str(GUILD_ID_BASE + guild_index),
+                'roles': [
+                    {
+                        'color': index * 1000,
+                        'flags': 0,
+                        'hoist': index % 5 == 0,
+                        'icon': None,
+                        'id': str(ROLE_ID_BASE + guild_index * ROLE_COUNT + index),
+                        'managed': False,
+                        'mentionable': index % 2 == 0,
+                        'name': f'role {index}',
+                        'permissions': '2248473465835073',
+                        'position': index,
+                        'unicode_emoji': None,
+                    }
+                    for index in range(ROLE_COUNT)
+                ],
+            },
+        ))
+    
+    return events
+
+
+def load_events(path):
+    """
+    Loads recorded events.
+    
+    Parameters
+    ----------
+    path : `str`
+        Path to a json lines file.
+    
+    Returns
+    -------
+    events : `list<(str, dict<str, object>)>`
+    """
+    events = []
+    with open(path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                event = from_json(line)
+                events.append((event['t'], event['d']))
+    
+    return events
+
+
+def measure(function):
+    """
+    Measures the given function.
+    
+    Parameters
+    ----------
+    function : `FunctionType`
+        The function to measure.
+    
+    Returns
+    -------
+    elapsed : `float`
+        The best elapsed time in seconds.
+    """
+    best = None
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    
+    return best
+
+
+def create_measured_functions(field_table, entities, datas):
+    """
+    Creates functions parsing and putting the given entities' fields with the given field table compiled with and
+    without inlining.
+    
+    Parameters
+    ----------
+    field_table : ``FieldTable``
+        The field table to measure.
+    entities : `list<object>`
+        The entities to parse into and put from.
+    datas : `list<dict<str, object>>`
+        The payloads to parse.
+    
+    Returns
+    -------
+    functions : `list<(str, FunctionType)>`
+    """
+    functions = []
+    
+    for inline in (False, True):
+        parse_name = f'parse_{field_table.name}_fields'
+        parse = _compile_function(parse_name, *render_field_parser(parse_name, field_table.parsers, inline = inline))
+        
+        def measured_parse(parse = parse):
+            for entity, data in zip(entities, datas):
+                parse(entity, data)
+        
+        functions.append((f'{field_table.name} parse {"inlined" if inline else "called"}', measured_parse))
+        
+        if field_table.putters:
+            put_name = f'put_{field_table.name}_fields'
+            put = _compile_function(put_name, *render_field_putter(put_name, field_table.putters, inline = inline))
+            
+            def measured_put(put = put):
+                for entity in entities:
+                    put(entity, {}, False)
+            
+            functions.append((f'{field_table.name} put {"inlined" if inline else "called"}', measured_put))
+    
+    return functions
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if len(sys.argv) > 1:
+        events = load_events(sys.argv[1])
+    else:
+        events = generate_events()
+    
+    message_datas = [data for name, data in events if name == 'MESSAGE_CREATE']
+    role_datas = [
+        role_data
+        for name, data in events if name == 'GUILD_CREATE'
+        for role_data in data.get('roles', ())
+    ]
+    
+    messages = [Message.from_data(data) for data in message_datas]
+    roles = [Role.from_data(data, 0) for data in role_datas]
+    
+    for title, function in (
+        *create_measured_functions(MESSAGE_FIELDS, messages, message_datas),
+        *create_measured_functions(ROLE_FIELDS, roles, role_datas),
+    ):
+        count = len(messages) if title.startswith('message') else len(roles)
+        elapsed = measure(function)
+        print(f'{title:>24}: {elapsed * 1000.0:9.3f} ms / {count} entities, {elapsed / count * 1e9:8.1f} ns each')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+"""
+Compares json and etf gateway payload decoding throughput.
+
+Usage:
+
+```
+$ python3 -m benchmarks.gateway_decode [recorded_payloads.jsonl]
+```
+
+If a file is given, each of its lines is used as a recorded gateway payload. Otherwise `GUILD_CREATE` and
+`PRESENCE_UPDATE` like payloads are generated.
+
+Both encodings are measured the way the gateway decodes them: zlib-stream decompression followed by decoding the
+decompressed bytes.
+"""
+
+import sys
+from json import dumps as to_json, loads as from_json
+from time import perf_counter
+from zlib import Z_SYNC_FLUSH, compressobj as create_zlib_compressor, decompressobj as create_zlib_decompressor
+
+from hata.discord.gateway.etf import etf_decode, etf_encode
+
+
+ROUNDS = 5
+
+
+def create_user_data(index):
+    """
+    Creates a user data.
+    
+    Parameters
+    ----------
+    index : `int`
+        The user's index.
+    
+    Returns
+    -------
+    user_data : `dict<str, object>`
+    """
+    return {
+        'id': str(202600000000000000 + index),
+        'username': f'user_{index}',
+        'global_name': f'User {index}',
+        'discriminator': '0',
+        'avatar': 'a_' + format(index, '030x'),
+        'bot': False,
+        'public_flags': 64,
+    }
+
+
+def create_guild_create_payload(member_count):
+    """
+    Creates a `GUILD_CREATE` like payload.
+    
+    Parameters
+    ----------
+    member_count : `int`
+        The amount of members to include.
+    
+    Returns
+    -------
+    payload : `dict<str, object>`
+    """
+    return {
+        'op': 0,
+        's': 1,
+        't': 'GUILD_CREATE',
+        'd': {
+            'id': '202600000000000001',
+            'name': 'Touhou Project',
+            'member_count': member_count,
+            'roles': [
+                {'id': str(202600000000100000 + index), 'name': f'role_{index}', 'permissions': '2248473465835073'}
+                for index in range(50)
+            ],
+            'channels': [
+                {'id': str(202600000000200000 + index), 'name': f'channel_{index}', 'type': 0, 'position': index}
+                for index in range(100)
+            ],
+            'members': [
+                {
+                    'user': create_user_data(index),
+                    'nick': None,
+                    'roles': [str(202600000000100000 + index % 50)],
+                    'joined_at': '2026-01-01T00:00:00.000000+00:00',
+                    'deaf': False,
+                    'mute': False,
+                    'flags': 0,
+                }
+                for index in range(member_count)
+            ],
+        },
+    }
+
+
+def create_presence_update_payload(index):
+    """
+    Creates a `PRESENCE_UPDATE` like payload.
+    
+    Parameters
+    ----------
+    index : `int`
+        The user's index.
+    
+    Returns
+    -------
+    payload : `dict<str, object>`
+    """
+    return {
+        'op': 0,
+        's': index + 2,
+        't': 'PRESENCE_UPDATE',
+        'd': {
+            'user': {'id': str(202600000000000000 + index)},
+            'guild_id': '202600000000000001',
+            'status': 'online',
+            'client_status': {'desktop': 'online'},
+            'activities': [
+                {
+                    'type': 2,
+                    'name': 'Spotify',
+                    'details': 'Bad Apple!!',
+                    'state': 'Alstroemeria Records',
+                    'timestamps': {'start': 1767225600000, 'end': 1767225819000},
+                    'assets': {'large_image': 'spotify:ab67616d0000b273', 'large_text': 'Lovelight'},
+                    'party': {'id': 'spotify:202600000000000000'},
+                    'sync_id': '2yI8nqEvmjcMM4ek2MrjYf',
+                    'created_at': 1767225600000,
+                },
+            ],
+        },
+    }
+
+
+def get_payloads():
+    """
+    Returns the payloads to benchmark with.
+    
+    Returns
+    -------
+    payloads : `list<dict<str, object>>`
+    """
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'r', encoding = 'utf-8') as file:
+            return [from_json(line) for line in file if line.strip()]
+    
+    payloads = [create_guild_create_payload(1000) for _ in range(5)]
+    payloads.extend(create_presence_update_payload(index) for index in range(5000))
+    return payloads
+
+
+def compress_stream(encoded_payloads):
+    """
+    Compresses the given payloads as a zlib-stream.
+    
+    Parameters
+    ----------
+    encoded_payloads : `list<bytes>`
+        The encoded payloads.
+    
+    Returns
+    -------
+    compressed_payloads : `list<bytes>`
+    """
+    compressor = create_zlib_compressor()
+    return [compressor.compress(payload) + compressor.flush(Z_SYNC_FLUSH) for payload in encoded_payloads]
+
+
+def measure(name, compressed_payloads, decoder, total_size):
+    """
+    Measures decoding the given payloads.
+    
+    Parameters
+    ----------
+    name : `str`
+        The measured encoding's name.
+    compressed_payloads : `list<bytes>`
+        The compressed payloads.
+    decoder : `callable`
+        The decoder to use.
+    total_size : `int`
+        The total decompressed size.
+    """
+    best = None
+    
+    for _ in range(ROUNDS):
+        decompressor = create_zlib_decompressor()
+        start = perf_counter()
+        for compressed_payload in compressed_payloads:
+            decoder(decompressor.decompress(compressed_payload))
+        
+        elapsed = perf_counter() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    
+    print(
+        f'{name:>20}: {best * 1000.0:10.2f} ms | {len(compressed_payloads) / best:12.0f} payloads/s | '
+        f'{total_size / best / 1024.0 / 1024.0:8.2f} MiB/s | {total_size / 1024.0:10.0f} KiB decompressed'
+    )
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    payloads = get_payloads()
+    
+    json_payloads = [to_json(payload, separators = (',', ':'), ensure_ascii = False).encode() for payload in payloads]
+    etf_payloads = [etf_encode(payload) for payload in payloads]
+    
+    json_compressed = compress_stream(json_payloads)
+    etf_compressed = compress_stream(etf_payloads)
+    
+    json_size = sum(len(payload) for payload in json_payloads)
+    etf_size = sum(len(payload) for payload in etf_payloads)
+    
+    print(f'{len(payloads)} payloads, best of {ROUNDS} rounds')
+    print(
+        f'compressed size: json {sum(len(data) for data in json_compressed) / 1024.0:.0f} KiB | '
+        f'etf {sum(len(data) for data in etf_compressed) / 1024.0:.0f} KiB'
+    )
+    
+    measure('json (bytes)', json_compressed, from_json, json_size)
+    measure('json (via str)', json_compressed, lambda data: from_json(data.decode('utf-8')), json_size)
+    measure('etf', etf_compressed, etf_decode, etf_size)
+
+
+if __name__ == '__main__':
+    main()
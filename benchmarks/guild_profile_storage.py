@@ -0,0 +1,210 @@
+"""
+Measures the memory used by guild profiles stored in a `dict` of each user and in the column based tables of the
+guilds.
+
+Usage:
+
+```
+$ python3 -m benchmarks.guild_profile_storage [count]
+```
+
+Generates `count` (by default 5 000 000) synthetic guild memberships spread between 50 guilds, each user being member
+of 2 guilds. Members have 0-3 roles of their guild's 30 roles, every 10th has a nick and every 50th boosts. Each
+membership is decoded from json, like the gateway does.
+
+The guild profiles are stored once in `dict`-s (the default) and once with ``GuildProfileMapping``-s (columnar guild
+profiles) and the retained memory is compared. At the end the time of looking up the guild profiles' roles is
+measured.
+"""
+
+import sys
+from time import perf_counter
+from tracemalloc import get_traced_memory, start as start_tracing, stop as stop_tracing
+
+from scarletio import from_json, to_json
+
+from hata.discord.user.guild_profile import GuildProfile, GuildProfileMapping
+
+
+MEMBERSHIP_COUNT = 5000000
+LOOKUP_COUNT = 1000000
+
+GUILD_COUNT = 50
+ROLE_COUNT = 30
+
+GUILD_ID_BASE = 202610170800
+ROLE_ID_BASE = 202610171000000
+USER_ID_BASE = 202610172000000
+JOINED_AT_BASE = 1600000000
+
+
+def create_guild_profile_data(index):
+    """
+    Creates a synthetic guild profile data.
+
+    Parameters
+    ----------
+    index : `int`
+        The membership's index.
+
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    guild_index = index % GUILD_COUNT
+    role_ids = sorted({
+        str(ROLE_ID_BASE + guild_index * ROLE_COUNT + (index * 7 + role_index * 13) % ROLE_COUNT)
+        for role_index in range(index % 4)
+    })
+
+    joined_at = JOINED_AT_BASE + index
+    data = {
+        'avatar': None,
+        'communication_disabled_until': None,
+        'deaf': False,
+        'flags': 0,
+        'joined_at': (
+            f'20{20 + joined_at % 5}-{1 + joined_at % 12:02}-{1 + joined_at % 28:02}T'
+            f'{joined_at % 24:02}:{joined_at % 60:02}:{joined_at % 59:02}.{joined_at % 1000:03}000+00:00'
+        ),
+        'mute': False,
+        'nick': (f'Nick {index}' if index % 10 == 0 else None),
+        'pending': False,
+        'premium_since': ('2024-05-14T00:00:00.000000+00:00' if index % 50 == 0 else None),
+        'roles': role_ids,
+    }
+    return data
+
+
+def iter_memberships(count):
+    """
+    Iterates over the synthetic memberships.
+
+    This function is an iterable generator.
+
+    Parameters
+    ----------
+    count : `int`
+        The amount of memberships to generate.
+
+    Yields
+    ------
+    user_id : `int`
+        The user's identifier.
+    guild_id : `int`
+        The guild's identifier.
+    data : `dict<str, object>`
+        Guild profile data.
+    """
+    user_count = max(count >> 1, 1)
+    for index in range(count):
+        yield (
+            USER_ID_BASE + index % user_count,
+            GUILD_ID_BASE + index % GUILD_COUNT,
+            from_json(to_json(create_guild_profile_data(index))),
+        )
+
+
+def measure_storage(count, guild_profiles_type):
+    """
+    Stores the synthetic guild profiles and measures the retained memory.
+
+    Parameters
+    ----------
+    count : `int`
+        The amount of memberships to store.
+    guild_profiles_type : `type`
+        The guild profiles container's type of each user.
+
+    Returns
+    -------
+    retained : `int`
+        The retained memory in bytes.
+    users_guild_profiles : `dict<int, dict<int, GuildProfile> | GuildProfileMapping>`
+        The stored guild profiles.
+    """
+    users_guild_profiles = {}
+    start_tracing()
+    try:
+        before, peak = get_traced_memory()
+
+        for user_id, guild_id, data in iter_memberships(count):
+            guild_profiles = users_guild_profiles.get(user_id, None)
+            if guild_profiles is None:
+                if guild_profiles_type is dict:
+                    guild_profiles = {}
+                else:
+                    guild_profiles = guild_profiles_type(user_id)
+                users_guild_profiles[user_id] = guild_profiles
+
+            guild_profiles[guild_id] = GuildProfile.from_data(data)
+
+        after, peak = get_traced_memory()
+    finally:
+        stop_tracing()
+
+    return after - before, users_guild_profiles
+
+
+def measure_lookup(users_guild_profiles, count):
+    """
+    Looks up the roles of the stored guild profiles and measures the elapsed time.
+
+    Parameters
+    ----------
+    users_guild_profiles : `dict<int, dict<int, GuildProfile> | GuildProfileMapping>`
+        The stored guild profiles.
+    count : `int`
+        The amount of guild profiles to look up.
+
+    Returns
+    -------
+    elapsed : `float`
+        The elapsed time in seconds.
+    """
+    keys = [(guild_profiles, guild_id) for guild_profiles in users_guild_profiles.values() for guild_id in guild_profiles]
+    keys = keys[:count]
+
+    start = perf_counter()
+    for guild_profiles, guild_id in keys:
+        guild_profiles[guild_id].role_ids
+
+    return perf_counter() - start
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if len(sys.argv) > 1:
+        count = int(sys.argv[1])
+    else:
+        count = MEMBERSHIP_COUNT
+
+    lookup_count = min(count, LOOKUP_COUNT)
+
+    dict_retained, users_guild_profiles = measure_storage(count, dict)
+    dict_elapsed = measure_lookup(users_guild_profiles, lookup_count)
+    users_guild_profiles = None
+
+    columnar_retained, users_guild_profiles = measure_storage(count, GuildProfileMapping)
+    columnar_elapsed = measure_lookup(users_guild_profiles, lookup_count)
+    users_guild_profiles = None
+
+    print(f'memberships: {count}')
+    print(
+        f'dict:     {dict_retained / 1048576.0:8.1f} MiB, {dict_retained / count:6.1f} B / membership, '
+        f'{dict_elapsed / lookup_count * 1e9:6.1f} ns / lookup'
+    )
+    print(
+        f'columnar: {columnar_retained / 1048576.0:8.1f} MiB, {columnar_retained / count:6.1f} B / membership, '
+        f'{columnar_elapsed / lookup_count * 1e9:6.1f} ns / lookup'
+    )
+    print(
+        f'saved:    {(dict_retained - columnar_retained) / 1048576.0:8.1f} MiB '
+        f'({(1.0 - columnar_retained / dict_retained) * 100.0:.1f}%)'
+    )
+
+
+if __name__ == '__main__':
+    main()
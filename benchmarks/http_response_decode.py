@@ -0,0 +1,161 @@
+"""
+Measures the cpu time and the memory used when decoding a Discord api response.
+
+Usage:
+
+```
+$ python3 -m benchmarks.http_response_decode
+```
+
+Compares the previous `str` round-trip (`from_json(body.decode('utf-8'))`) with ``_decode_response_body``, which
+parses directly from the raw body bytes if `orjson` is installed.
+
+The measured payloads are a `guild_user_get_chunk` with `limit = 1000` and an audit log page with 100 entries.
+"""
+
+from json import dumps as to_json, loads as from_json
+from time import perf_counter
+from tracemalloc import get_traced_memory, reset_peak, start as start_tracing, stop as stop_tracing
+
+from hata.discord.http.api_client import _decode_response_body, from_json_bytes
+
+
+ROUNDS = 20
+CONTENT_TYPE = 'application/json'
+
+
+def create_guild_user_chunk_body():
+    """
+    Creates a `guild_user_get_chunk` like body.
+    
+    Returns
+    -------
+    body : `bytes`
+    """
+    return to_json([
+        {
+            'user': {
+                'id': str(202600000000000000 + index),
+                'username': f'user_{index}',
+                'global_name': f'ユーザー {index}',
+                'discriminator': '0',
+                'avatar': format(index, '032x'),
+                'public_flags': 64,
+            },
+            'nick': None,
+            'roles': [str(202600000000100000 + index % 50), str(202600000000100050 + index % 7)],
+            'joined_at': '2026-01-01T00:00:00.000000+00:00',
+            'deaf': False,
+            'mute': False,
+            'flags': 0,
+        }
+        for index in range(1000)
+    ], ensure_ascii = False).encode()
+
+
+def create_audit_log_body():
+    """
+    Creates an audit log page like body.
+    
+    Returns
+    -------
+    body : `bytes`
+    """
+    return to_json({
+        'audit_log_entries': [
+            {
+                'id': str(202600000000300000 + index),
+                'user_id': str(202600000000000000 + index % 20),
+                'target_id': str(202600000000200000 + index),
+                'action_type': 25,
+                'changes': [{'key': '$add', 'new_value': [{'id': '202600000000100000', 'name': 'Moderator'}]}],
+                'reason': 'Touhou ' * 10,
+            }
+            for index in range(100)
+        ],
+        'users': [
+            {'id': str(202600000000000000 + index), 'username': f'user_{index}', 'discriminator': '0'}
+            for index in range(20)
+        ],
+        'webhooks': [],
+        'integrations': [],
+        'threads': [],
+        'guild_scheduled_events': [],
+        'application_commands': [],
+        'auto_moderation_rules': [],
+    }, ensure_ascii = False).encode()
+
+
+def decode_via_str(body, content_type_headers):
+    """
+    The previous decoding path.
+    
+    Parameters
+    ----------
+    body : `bytes`
+        Body to decode.
+    content_type_headers : `str`
+        Content type.
+    
+    Returns
+    -------
+    response_data : `object`
+    """
+    response_data = body.decode('utf-8')
+    if content_type_headers.startswith('application/json'):
+        response_data = from_json(response_data)
+    return response_data
+
+
+def measure(name, body, decoder):
+    """
+    Measures the given decoder.
+    
+    Parameters
+    ----------
+    name : `str`
+        The measurement's name.
+    body : `bytes`
+        Body to decode.
+    decoder : `callable`
+        Decoder to measure.
+    """
+    best = None
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        decoder(body, CONTENT_TYPE)
+        elapsed = perf_counter() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    
+    start_tracing()
+    reset_peak()
+    base, _ = get_traced_memory()
+    response_data = decoder(body, CONTENT_TYPE)
+    current, peak = get_traced_memory()
+    stop_tracing()
+    response_data = None
+    
+    print(
+        f'{name:>36}: {best * 1000.0:8.3f} ms/request | peak {(peak - base) / 1024.0:8.0f} KiB | '
+        f'retained {(current - base) / 1024.0:8.0f} KiB'
+    )
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    print(f'orjson available: {from_json_bytes is not None}')
+    
+    for name, body in (
+        ('guild_user_get_chunk (1000)', create_guild_user_chunk_body()),
+        ('audit_log_get_chunk (100)', create_audit_log_body()),
+    ):
+        print(f'{name}, body size: {len(body) / 1024.0:.0f} KiB')
+        measure('str round-trip', body, decode_via_str)
+        measure('_decode_response_body', body, _decode_response_body)
+
+
+if __name__ == '__main__':
+    main()
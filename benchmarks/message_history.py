@@ -0,0 +1,206 @@
+"""
+Measures the cpu time of channel message history operations on an unlimited history.
+
+Usage:
+
+```
+$ python3 -m benchmarks.message_history
+```
+
+Compares the previous `deque` based history (searched by ``message_relative_index``) with ``MessageQueue``.
+
+The measured scenarios are:
+- Late-arriving, out of order messages inserted into a large history.
+- Bulk deleting messages spread over the whole history.
+- Looking up messages by their identifier.
+"""
+
+from collections import deque
+from random import Random
+from time import perf_counter
+
+from hata.discord.channel.message_history import message_relative_index
+from hata.discord.channel.message_queue import MessageQueue
+
+
+ROUNDS = 3
+HISTORY_SIZES = (1000, 10000, 50000)
+LATE_MESSAGE_COUNT = 2000
+BULK_DELETE_COUNT = 100
+LOOKUP_COUNT = 2000
+BASE_ID = 202600000000000000
+
+
+class MessageStandIn:
+    """
+    Lightweight message with only an identifier.
+    
+    Attributes
+    ----------
+    id : `int`
+        The message's identifier.
+    """
+    __slots__ = ('id',)
+    
+    def __init__(self, message_id):
+        """
+        Creates a new message stand-in.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        """
+        self.id = message_id
+
+
+def deque_insert(messages, message):
+    """
+    Inserts a message into a deque history like the previous `Channel._create_old_message`.
+    
+    Parameters
+    ----------
+    messages : `deque<MessageStandIn>`
+        History.
+    message : ``MessageStandIn``
+        The message to insert.
+    """
+    index = message_relative_index(messages, message.id)
+    if (index == len(messages)) or (messages[index].id != message.id):
+        messages.insert(index, message)
+
+
+def deque_pop_multiple(messages, delete_ids):
+    """
+    Removes messages from a deque history like the previous `Channel._pop_multiple`.
+    
+    Parameters
+    ----------
+    messages : `deque<MessageStandIn>`
+        History.
+    delete_ids : `list<int>`
+        The messages' identifiers to delete.
+    """
+    delete_ids.sort(reverse = True)
+    for delete_id in delete_ids:
+        index = message_relative_index(messages, delete_id)
+        if (index != len(messages)) and (messages[index].id == delete_id):
+            del messages[index]
+
+
+def deque_get(messages, message_id):
+    """
+    Looks up a message in a deque history.
+    
+    Parameters
+    ----------
+    messages : `deque<MessageStandIn>`
+        History.
+    message_id : `int`
+        The message's identifier.
+    
+    Returns
+    -------
+    message : `None | MessageStandIn`
+    """
+    index = message_relative_index(messages, message_id)
+    if index != len(messages):
+        message = messages[index]
+        if message.id == message_id:
+            return message
+
+
+def queue_pop_multiple(messages, delete_ids):
+    """
+    Removes messages from a message queue history like `Channel._pop_multiple`.
+    
+    Parameters
+    ----------
+    messages : ``MessageQueue``
+        History.
+    delete_ids : `list<int>`
+        The messages' identifiers to delete.
+    """
+    delete_ids.sort(reverse = True)
+    for delete_id in delete_ids:
+        messages.pop_by_id(delete_id)
+
+
+def measure(name, setup, run):
+    """
+    Measures the given operation and prints the best round.
+    
+    Parameters
+    ----------
+    name : `str`
+        The measurement's name.
+    setup : `callable`
+        Creates the input of `run`. Not measured.
+    run : `callable`
+        The measured operation.
+    """
+    best = None
+    for _ in range(ROUNDS):
+        value = setup()
+        start = perf_counter()
+        run(value)
+        elapsed = perf_counter() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    
+    print(f'{name:>40}: {best * 1000.0:10.3f} ms')
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    random = Random(0)
+    
+    for history_size in HISTORY_SIZES:
+        print(f'history size: {history_size}')
+        
+        # Every second identifier is kept back to arrive late.
+        message_ids = [BASE_ID + (index << 1) for index in range(history_size)]
+        message_ids.reverse()
+        late_message_ids = [BASE_ID + (random.randrange(history_size) << 1) + 1 for _ in range(LATE_MESSAGE_COUNT)]
+        delete_ids = random.sample(message_ids, BULK_DELETE_COUNT)
+        lookup_ids = [random.choice(message_ids) for _ in range(LOOKUP_COUNT)]
+        
+        messages = [MessageStandIn(message_id) for message_id in message_ids]
+        late_messages = [MessageStandIn(message_id) for message_id in late_message_ids]
+        
+        measure(
+            f'late messages ({LATE_MESSAGE_COUNT}), deque',
+            (lambda: deque(messages)),
+            (lambda history: [deque_insert(history, message) for message in late_messages]),
+        )
+        measure(
+            f'late messages ({LATE_MESSAGE_COUNT}), MessageQueue',
+            (lambda: MessageQueue(messages)),
+            (lambda history: [history.add(message) for message in late_messages]),
+        )
+        measure(
+            f'bulk delete ({BULK_DELETE_COUNT}), deque',
+            (lambda: deque(messages)),
+            (lambda history: deque_pop_multiple(history, delete_ids.copy())),
+        )
+        measure(
+            f'bulk delete ({BULK_DELETE_COUNT}), MessageQueue',
+            (lambda: MessageQueue(messages)),
+            (lambda history: queue_pop_multiple(history, delete_ids.copy())),
+        )
+        measure(
+            f'lookup ({LOOKUP_COUNT}), deque',
+            (lambda: deque(messages)),
+            (lambda history: [deque_get(history, message_id) for message_id in lookup_ids]),
+        )
+        measure(
+            f'lookup ({LOOKUP_COUNT}), MessageQueue',
+            (lambda: MessageQueue(messages)),
+            (lambda history: [history.get(message_id) for message_id in lookup_ids]),
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures demuxing pre-encoded opus packets from Ogg and WebM containers.
+
+Usage:
+
+```
+$ python3 -m benchmarks.opus_passthrough
+```
+
+Demuxes ten minutes of 20 ms opus packets with each container and prints the CPU time spent per second of audio,
+which is the per-stream cost of ``OpusAudio`` (no ffmpeg process and no encoding).
+"""
+
+from io import BytesIO
+from time import process_time
+
+from hata.discord.voice.opus_containers.detect import create_opus_demuxer
+from hata.discord.voice.opus_containers.tests.helpers import create_ogg_opus_file, create_webm_opus_file
+
+
+DURATION = 600.0
+PACKET_COUNT = int(DURATION * 50)
+ROUNDS = 3
+
+
+def measure(data):
+    """
+    Demuxes every packet from the given file.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The file's content.
+    
+    Returns
+    -------
+    elapsed : `float`
+    packet_count : `int`
+    """
+    start = process_time()
+    demuxer = create_opus_demuxer(BytesIO(data))
+    packet_count = 0
+    while True:
+        packets = demuxer.read_packets()
+        if packets is None:
+            break
+        
+        packet_count += len(packets)
+    
+    return process_time() - start, packet_count
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    for name, data in (
+        ('ogg', create_ogg_opus_file(PACKET_COUNT, 50)),
+        ('webm', create_webm_opus_file(PACKET_COUNT, 250)),
+    ):
+        best = None
+        for _ in range(ROUNDS):
+            elapsed, packet_count = measure(data)
+            if (best is None) or (elapsed < best):
+                best = elapsed
+        
+        print(
+            f'{name:>4}: {best * 1000.0:8.3f} ms / {packet_count} packets, '
+            f'{best / DURATION * 1000000.0:6.2f} us CPU per audio second'
+        )
+
+
+if __name__ == '__main__':
+    main()
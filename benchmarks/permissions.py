@@ -0,0 +1,119 @@
+"""
+Measures the permission calculation of many guild users.
+
+Usage:
+
+```
+$ python3 -m benchmarks.permissions
+```
+
+Compares ``Guild.permissions_for`` and ``Channel.permissions_for`` with their cached counterparts, and with
+``Channel.cached_permissions_for_users``, which calculates the permissions of users with the same roles only once.
+
+The guild has 5000 users, 50 roles and a text channel with role and user specific permission overwrites.
+"""
+
+from time import perf_counter
+
+from hata import (
+    Channel, ChannelType, Guild, GuildProfile, PERMISSION_CACHE_STATISTICS, Permission, PermissionOverwrite,
+    PermissionOverwriteTargetType, Role, User
+)
+
+
+ROUNDS = 10
+USER_COUNT = 5000
+ROLE_COUNT = 50
+
+GUILD_ID = 202610170100
+CHANNEL_ID = 202610170101
+ROLE_ID_BASE = 202610170200
+USER_ID_BASE = 202610180000
+
+
+def create_guild():
+    """
+    Creates the benchmarked guild.
+    
+    Returns
+    -------
+    guild : ``Guild``
+    channel : ``Channel``
+    users : `list<User>`
+    """
+    roles = [Role.precreate(GUILD_ID, permissions = Permission().update_by_keys(view_channel = True))]
+    for index in range(ROLE_COUNT):
+        roles.append(Role.precreate(ROLE_ID_BASE + index, permissions = 1 << (index % 40)))
+    
+    users = []
+    for index in range(USER_COUNT):
+        user = User.precreate(USER_ID_BASE + index)
+        user.guild_profiles[GUILD_ID] = GuildProfile(
+            role_ids = [ROLE_ID_BASE + index % ROLE_COUNT, ROLE_ID_BASE + index % 7],
+        )
+        users.append(user)
+    
+    channel = Channel.precreate(
+        CHANNEL_ID,
+        channel_type = ChannelType.guild_text,
+        guild_id = GUILD_ID,
+        permission_overwrites = [
+            PermissionOverwrite(ROLE_ID_BASE + 1, target_type = PermissionOverwriteTargetType.role, deny = 2048),
+            PermissionOverwrite(USER_ID_BASE + 2, target_type = PermissionOverwriteTargetType.user, allow = 8192),
+        ],
+    )
+    
+    guild = Guild.precreate(GUILD_ID, channels = [channel], roles = roles, users = users)
+    return guild, channel, users
+
+
+def measure(name, function):
+    """
+    Measures the given function.
+    
+    Parameters
+    ----------
+    name : `str`
+        The measurement's name.
+    function : `callable`
+        The function to measure.
+    """
+    best = None
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    
+    print(f'{name:>44}: {best * 1000.0:8.3f} ms / {USER_COUNT} users')
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    guild, channel, users = create_guild()
+    
+    measure('Guild.permissions_for', lambda: [guild.permissions_for(user) for user in users])
+    measure('Guild.cached_permissions_for', lambda: [guild.cached_permissions_for(user) for user in users])
+    measure('Channel.permissions_for', lambda: [channel.permissions_for(user) for user in users])
+    measure('Channel.cached_permissions_for', lambda: [channel.cached_permissions_for(user) for user in users])
+    
+    def cold_bulk():
+        channel.metadata._invalidate_cache_permission()
+        channel.cached_permissions_for_users(users)
+    
+    def cold_single():
+        channel.metadata._invalidate_cache_permission()
+        for user in users:
+            channel.cached_permissions_for(user)
+    
+    measure('Channel.cached_permissions_for (cold)', cold_single)
+    measure('Channel.cached_permissions_for_users (cold)', cold_bulk)
+    
+    print(PERMISSION_CACHE_STATISTICS)
+
+
+if __name__ == '__main__':
+    main()
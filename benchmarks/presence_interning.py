@@ -0,0 +1,254 @@
+"""
+Measures the memory and the time used by parsing presence activities with and without interning.
+
+Usage:
+
+```
+$ python3 -m benchmarks.presence_interning [count]
+```
+
+Generates `count` (by default 1 000 000) synthetic presences: users playing a game, listening on Spotify or having a
+custom status, drawing their names, assets and texts from shared pools, while their timestamps and parties are unique.
+Each presence is decoded from json, like the gateway does, so their strings are separate objects.
+
+The activities are parsed once with interning disabled, then with interning enabled and the retained memory is
+compared. At the end updating the activities with the same and with a changed payload is measured.
+"""
+
+import sys
+from time import perf_counter
+from tracemalloc import get_traced_memory, start as start_tracing, stop as stop_tracing
+
+from scarletio import from_json, to_json
+
+from hata.discord.activity.activity_field_base import interning
+from hata.discord.user.user.fields import parse_activities
+
+
+PRESENCE_COUNT = 1000000
+UPDATE_COUNT = 100000
+
+GAME_COUNT = 50
+SONG_COUNT = 2000
+CUSTOM_STATUS_COUNT = 100
+
+APPLICATION_ID_BASE = 202610170500
+START_BASE = 1792195200000
+
+
+def create_presence_data(index):
+    """
+    Creates a synthetic presence data.
+    
+    Parameters
+    ----------
+    index : `int`
+        The presence's index.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    kind = index % 10
+    
+    if kind < 4:
+        game_index = index % GAME_COUNT
+        activity_data = {
+            'type': 0,
+            'name': f'Game {game_index}',
+            'application_id': str(APPLICATION_ID_BASE + game_index),
+            'details': 'Ranked match',
+            'state': 'In a party',
+            'assets': {
+                'large_image': f'{game_index}_large_image_asset_key',
+                'large_text': f'Game {game_index}',
+                'small_image': f'{game_index}_small_image_asset_key',
+                'small_text': 'Rank: Diamond',
+            },
+            'party': {'id': f'party_{index}', 'size': [1, 4]},
+            'timestamps': {'start': START_BASE + index},
+            'created_at': START_BASE + index,
+            'id': f'{index:016x}',
+        }
+    
+    elif kind < 7:
+        song_index = index % SONG_COUNT
+        activity_data = {
+            'type': 2,
+            'name': 'Spotify',
+            'details': f'Song title number {song_index}',
+            'state': f'Artist {song_index % 300}',
+            'assets': {
+                'large_image': f'spotify:ab67616d0000b273{song_index:024x}',
+                'large_text': f'Album {song_index % 700}',
+            },
+            'party': {'id': f'spotify:{index}'},
+            'timestamps': {'start': START_BASE + index, 'end': START_BASE + index + 200000},
+            'sync_id': f'{song_index:022x}',
+            'session_id': f'{index:032x}',
+            'flags': 48,
+            'created_at': START_BASE + index,
+            'id': 'spotify:1',
+        }
+    
+    else:
+        activity_data = {
+            'type': 4,
+            'name': 'Custom Status',
+            'state': f'Custom status number {index % CUSTOM_STATUS_COUNT}',
+            'created_at': START_BASE + index,
+            'id': 'custom',
+        }
+    
+    return {'activities': [activity_data], 'status': 'online', 'client_status': {'desktop': 'online'}}
+
+
+def disable_interning():
+    """
+    Disables interning of the activity fields and strings.
+    
+    Returns
+    -------
+    restore : `FunctionType`
+        Function to call to enable interning again.
+    """
+    intern_activity_field = interning.intern_activity_field
+    intern = interning.intern
+    
+    interning.intern_activity_field = lambda field_type, data: field_type.from_data(data)
+    interning.intern = str
+    
+    def restore():
+        interning.intern_activity_field = intern_activity_field
+        interning.intern = intern
+    
+    return restore
+
+
+def measure_parsing(encoded):
+    """
+    Parses the given presences' activities and measures the retained memory.
+    
+    Parameters
+    ----------
+    encoded : `list<str>`
+        Json encoded presences.
+    
+    Returns
+    -------
+    retained : `int`
+        The retained memory in bytes.
+    activities : `list<list<Activity>>`
+        The parsed activities.
+    """
+    activities = []
+    start_tracing()
+    try:
+        before, peak = get_traced_memory()
+        
+        for line in encoded:
+            activities.append(parse_activities(from_json(line)))
+        
+        after, peak = get_traced_memory()
+    finally:
+        stop_tracing()
+    
+    return after - before, activities
+
+
+def measure_parsing_time(encoded):
+    """
+    Parses the given presences' activities and measures the elapsed time.
+    
+    Parameters
+    ----------
+    encoded : `list<str>`
+        Json encoded presences.
+    
+    Returns
+    -------
+    elapsed : `float`
+        The elapsed time in seconds.
+    """
+    elapsed = 0.0
+    for line in encoded:
+        data = from_json(line)
+        start = perf_counter()
+        parse_activities(data)
+        elapsed += perf_counter() - start
+    
+    return elapsed
+
+
+def measure_updates(activities, count):
+    """
+    Updates the given activities with the same and with a changed payload and measures the elapsed time.
+    
+    Parameters
+    ----------
+    activities : `list<list<Activity>>`
+        Activities to update.
+    count : `int`
+        The amount of activities to update.
+    
+    Returns
+    -------
+    same_elapsed : `float`
+        The elapsed time in seconds updating with the same payload.
+    changed_elapsed : `float`
+        The elapsed time in seconds updating with a changed payload.
+    """
+    datas = [create_presence_data(index)['activities'][0] for index in range(count)]
+    changed_datas = [{**data, 'state': 'Changed'} for data in datas]
+    
+    start = perf_counter()
+    for index in range(count):
+        activities[index][0]._difference_update_attributes(datas[index])
+    same_elapsed = perf_counter() - start
+    
+    start = perf_counter()
+    for index in range(count):
+        activities[index][0]._difference_update_attributes(changed_datas[index])
+    changed_elapsed = perf_counter() - start
+    
+    return same_elapsed, changed_elapsed
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if len(sys.argv) > 1:
+        count = int(sys.argv[1])
+    else:
+        count = PRESENCE_COUNT
+    
+    encoded = [to_json(create_presence_data(index)) for index in range(count)]
+    
+    restore = disable_interning()
+    try:
+        plain_retained, activities = measure_parsing(encoded)
+        activities = None
+        plain_elapsed = measure_parsing_time(encoded)
+    finally:
+        restore()
+    
+    interned_retained, activities = measure_parsing(encoded)
+    interned_elapsed = measure_parsing_time(encoded)
+    
+    print(f'presences: {count}')
+    print(f'not interned: {plain_retained / 1048576.0:8.1f} MiB, {plain_elapsed / count * 1e9:8.1f} ns / presence')
+    print(f'interned:     {interned_retained / 1048576.0:8.1f} MiB, {interned_elapsed / count * 1e9:8.1f} ns / presence')
+    print(
+        f'saved:        {(plain_retained - interned_retained) / 1048576.0:8.1f} MiB '
+        f'({(1.0 - interned_retained / plain_retained) * 100.0:.1f}%)'
+    )
+    
+    update_count = min(count, UPDATE_COUNT)
+    same_elapsed, changed_elapsed = measure_updates(activities, update_count)
+    print(f'update with same payload:    {same_elapsed / update_count * 1e9:8.1f} ns / activity')
+    print(f'update with changed payload: {changed_elapsed / update_count * 1e9:8.1f} ns / activity')
+
+
+if __name__ == '__main__':
+    main()
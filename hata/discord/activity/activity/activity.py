@@ -8,6 +8,7 @@ from ...http.urls import (
     build_activity_asset_image_small_url, build_activity_asset_image_small_url_as
 )
 
+from ..activity_field_base.interning import digest_data
 from ..activity_metadata import ActivityMetadataBase
 
 from .constants import (
@@ -24,13 +25,17 @@ class Activity(RichAttributeErrorBaseType):
     
     Attributes
     ----------
+    _data_digest : `None | bytes`
+        The digest of the data the activity was created from or updated with last time. Used to skip updating the
+        activity with the same data.
+    
     metadata : ``ActivityMetadataBase``
         Metadata of the activity containing extra fields about itself.
     
     type : ``ActivityType``
         The activity's type.
     """
-    __slots__ = ('metadata', 'type')
+    __slots__ = ('_data_digest', 'metadata', 'type')
     
     def __new__(cls, name = None, *, activity_type = ..., **keyword_parameters):
         """
@@ -124,6 +129,7 @@ class Activity(RichAttributeErrorBaseType):
             )
         
         self = object.__new__(cls)
+        self._data_digest = None
         self.metadata = metadata
         self.type = activity_type
         return self
@@ -200,6 +206,7 @@ class Activity(RichAttributeErrorBaseType):
         metadata = activity_type.metadata_type.from_data(data)
         
         self = object.__new__(cls)
+        self._data_digest = digest_data(data)
         self.metadata = metadata
         self.type = activity_type
         return self
@@ -255,6 +262,7 @@ class Activity(RichAttributeErrorBaseType):
         else:
             self.metadata = metadata_type.from_data(data)
         
+        self._data_digest = digest_data(data)
         self.type = activity_type
     
     
@@ -317,6 +325,13 @@ class Activity(RichAttributeErrorBaseType):
         | url               | `None | str`                      |
         +-------------------+-----------------------------------+
         """
+        # Most presence updates repeat the same activities, skip parsing them.
+        data_digest = digest_data(data)
+        if data_digest == self._data_digest:
+            return {}
+        
+        self._data_digest = data_digest
+        
         activity_type = parse_type(data)
         metadata_type = activity_type.metadata_type
         
@@ -348,6 +363,7 @@ class Activity(RichAttributeErrorBaseType):
         new : `instance<type<self>>`
         """
         new = object.__new__(type(self))
+        new._data_digest = self._data_digest
         new.metadata = self.metadata.copy()
         new.type = self.type
         return new
@@ -454,6 +470,7 @@ class Activity(RichAttributeErrorBaseType):
             )
         
         new = object.__new__(type(self))
+        new._data_digest = None
         new.metadata = metadata
         new.type = activity_type
         return new
@@ -24,6 +24,7 @@ def _assert_fields_set(activity):
         The activity to check.
     """
     vampytest.assert_instance(activity, Activity)
+    vampytest.assert_instance(activity._data_digest, bytes, nullable = True)
     vampytest.assert_instance(activity.metadata, ActivityMetadataBase)
     vampytest.assert_instance(activity.type, ActivityType)
 
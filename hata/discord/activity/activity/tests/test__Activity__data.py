@@ -182,3 +182,49 @@ def test__Activity__difference_update_attributes():
     vampytest.assert_eq(old_attributes['url'], old_url)
     vampytest.assert_eq(old_attributes['state'], old_state)
     vampytest.assert_eq(old_attributes['session_id'], old_session_id)
+
+
+def test__Activity__difference_update_attributes__same_data():
+    """
+    Tests whether ``Activity._difference_update_attributes`` works as expected.
+    
+    Case: updating with the same data as created from.
+    """
+    data = {
+        'type': ActivityType.playing.value,
+        'name': 'ZYTOKINE',
+        'state': 'Hollow',
+        'assets': {'large_image': 'Ensemble'},
+    }
+    
+    activity = Activity.from_data(data)
+    metadata = activity.metadata
+    assets = activity.assets
+    
+    old_attributes = activity._difference_update_attributes({**data, 'assets': {'large_image': 'Ensemble'}})
+    vampytest.assert_eq(old_attributes, {})
+    vampytest.assert_is(activity.metadata, metadata)
+    vampytest.assert_is(activity.assets, assets)
+    
+    old_attributes = activity._difference_update_attributes({**data, 'state': 'NEXT'})
+    vampytest.assert_eq(old_attributes, {'state': 'Hollow'})
+    vampytest.assert_eq(activity.state, 'NEXT')
+
+
+def test__Activity__difference_update_attributes__bool_and_int():
+    """
+    Tests whether ``Activity._difference_update_attributes`` works as expected.
+    
+    Case: updating with data differing only in a boolean and an integer of the same value.
+    """
+    data = {
+        'type': ActivityType.playing.value,
+        'name': 'ZYTOKINE',
+        'instance': True,
+    }
+    
+    activity = Activity.from_data(data)
+    data_digest = activity._data_digest
+    
+    activity._difference_update_attributes({**data, 'instance': 1})
+    vampytest.assert_ne(activity._data_digest, data_digest)
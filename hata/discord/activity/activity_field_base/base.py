@@ -6,8 +6,10 @@ from scarletio import RichAttributeErrorBaseType
 class ActivityFieldBase(RichAttributeErrorBaseType):
     """
     Base class for activity fields.
+    
+    Activity fields are not modified after creation, so they can be shared between activities.
     """
-    __slots__ = ()
+    __slots__ = ('__weakref__',)
     
     def __new__(cls):
         """
@@ -0,0 +1,233 @@
+__all__ = ()
+
+from hashlib import blake2b
+from json import dumps as dump_to_json
+from sys import intern
+
+from scarletio import WeakValueDictionary, set_docs
+
+
+ACTIVITY_FIELDS = WeakValueDictionary()
+
+
+def freeze_data(value):
+    """
+    Converts the given json value to a hashable one. Objects are converted to `frozenset`-s of their items and arrays
+    to `tuple`-s. Booleans and floats are paired with their type, so they do not equal to the same valued integers.
+    
+    Parameters
+    ----------
+    value : `object`
+        The value to freeze.
+    
+    Returns
+    -------
+    frozen : `object`
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return frozenset([(key, freeze_data(item)) for key, item in value.items()])
+    
+    if value_type is list:
+        return tuple([freeze_data(item) for item in value])
+    
+    if (value_type is bool) or (value_type is float):
+        return (value_type, value)
+    
+    return value
+
+
+def serialize_data(data):
+    """
+    Serializes the given json data into a canonical string. Equal data always produce the same string, while not
+    equal data always produce different ones.
+    
+    Parameters
+    ----------
+    data : `dict<str, object>`
+        The data to serialize.
+    
+    Returns
+    -------
+    serialized : `str`
+    """
+    return dump_to_json(data, ensure_ascii = False, separators = (',', ':'), sort_keys = True)
+
+
+def digest_data(data):
+    """
+    Returns the digest of the given json data's canonical serialization. Equal data always produce the same digest,
+    while finding not equal data with the same digest is not feasible.
+    
+    Parameters
+    ----------
+    data : `dict<str, object>`
+        The data to digest.
+    
+    Returns
+    -------
+    digest : `bytes`
+    """
+    return blake2b(serialize_data(data).encode(), digest_size = 32).digest()
+
+
+def intern_activity_field(field_type, data):
+    """
+    Returns an activity field for the given data. If an activity field was already created from equal data and it is
+    still alive, returns that one.
+    
+    Activity fields are not modified after creation, so they can be shared between the activities.
+    
+    Parameters
+    ----------
+    field_type : ``type<ActivityFieldBase>``
+        The activity field's type.
+    data : `dict<str, object>`
+        Activity field data.
+    
+    Returns
+    -------
+    field : ``ActivityFieldBase``
+    """
+    key = (field_type, freeze_data(data))
+    
+    try:
+        field = ACTIVITY_FIELDS[key]
+    except KeyError:
+        field = field_type.from_data(data)
+        ACTIVITY_FIELDS[key] = field
+    
+    return field
+
+
+def interned_entity_parser_factory(field_key, entity_type):
+    """
+    Returns an activity field parser, which returns `None` if the field is missing and shares the fields parsed from
+    equal data.
+    
+    Parameters
+    ----------
+    field_key : `str`
+        The field's key used in payload.
+    entity_type : ``type<ActivityFieldBase>``
+        The activity field's type.
+    
+    Returns
+    -------
+    parser : `FunctionType`
+    """
+    def parser(data):
+        nonlocal field_key
+        nonlocal entity_type
+        
+        entity_data = data.get(field_key, None)
+        if entity_data is None:
+            return None
+        
+        return intern_activity_field(entity_type, entity_data)
+    
+    set_docs(
+        parser,
+        """
+        Parses out an activity field from the given payload. Fields parsed from equal data are shared.
+        
+        > This function is generated.
+        
+        Parameters
+        ----------
+        data : `dict<str, object>`
+            Entity data.
+        
+        Returns
+        -------
+        field : ``None | ActivityFieldBase``
+        """
+    )
+    
+    return parser
+
+
+def interned_nullable_string_parser_factory(field_key):
+    """
+    Returns a nullable string parser, which interns the parsed strings.
+    
+    Parameters
+    ----------
+    field_key : `str`
+        The field's key used in payload.
+    
+    Returns
+    -------
+    parser : `FunctionType`
+    """
+    def parser(data):
+        nonlocal field_key
+        
+        field_value = data.get(field_key, None)
+        if (field_value is None) or (not field_value):
+            return None
+        
+        return intern(field_value)
+    
+    set_docs(
+        parser,
+        """
+        Parses out a nullable string from the given payload and interns it.
+        
+        > This function is generated.
+        
+        Parameters
+        ----------
+        data : `dict<str, object>`
+            Entity data.
+        
+        Returns
+        -------
+        field_value : `None | str`
+        """
+    )
+    
+    return parser
+
+
+def interned_force_string_parser_factory(field_key):
+    """
+    Returns a string parser, which returns empty string if the field is missing and interns the parsed strings.
+    
+    Parameters
+    ----------
+    field_key : `str`
+        The field's key used in payload.
+    
+    Returns
+    -------
+    parser : `FunctionType`
+    """
+    def parser(data):
+        nonlocal field_key
+        
+        field_value = data.get(field_key, None)
+        if (field_value is None):
+            return ''
+        
+        return intern(field_value)
+    
+    set_docs(
+        parser,
+        """
+        Parses out a string from the given payload and interns it.
+        
+        > This function is generated.
+        
+        Parameters
+        ----------
+        data : `dict<str, object>`
+            Entity data.
+        
+        Returns
+        -------
+        field_value : `str`
+        """
+    )
+    
+    return parser
@@ -0,0 +1,92 @@
+import vampytest
+
+from ..interning import digest_data, freeze_data, serialize_data
+
+
+def _iter_options():
+    yield 'koishi', 'koishi'
+    yield 12, 12
+    yield True, (bool, True)
+    yield 1.0, (float, 1.0)
+    yield None, None
+    yield [1, 2], (1, 2)
+    yield {'size': [1, 2]}, frozenset((('size', (1, 2)),))
+    yield {'a': 1, 'b': {'c': 'd'}}, frozenset((('a', 1), ('b', frozenset((('c', 'd'),)))))
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__freeze_data(input_value):
+    """
+    Tests whether ``freeze_data`` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to freeze.
+    
+    Returns
+    -------
+    output : `object`
+    """
+    output = freeze_data(input_value)
+    hash(output)
+    return output
+
+
+def test__freeze_data__key_order():
+    """
+    Tests whether ``freeze_data`` works as intended.
+    
+    Case: key order does not matter.
+    """
+    vampytest.assert_eq(
+        freeze_data({'name': 'koishi', 'size': [1, 2]}),
+        freeze_data({'size': [1, 2], 'name': 'koishi'}),
+    )
+
+
+def test__freeze_data__number_types():
+    """
+    Tests whether ``freeze_data`` works as intended.
+    
+    Case: booleans, integers and floats of the same value are not equal.
+    """
+    vampytest.assert_ne(freeze_data({'value': True}), freeze_data({'value': 1}))
+    vampytest.assert_ne(freeze_data({'value': 1.0}), freeze_data({'value': 1}))
+    vampytest.assert_ne(freeze_data({'value': True}), freeze_data({'value': 1.0}))
+
+
+def test__serialize_data__key_order():
+    """
+    Tests whether ``serialize_data`` works as intended.
+    
+    Case: key order does not matter.
+    """
+    vampytest.assert_eq(
+        serialize_data({'name': 'koishi', 'size': [1, 2]}),
+        serialize_data({'size': [1, 2], 'name': 'koishi'}),
+    )
+
+
+def test__serialize_data__number_types():
+    """
+    Tests whether ``serialize_data`` works as intended.
+    
+    Case: booleans, integers and floats of the same value are not equal.
+    """
+    vampytest.assert_ne(serialize_data({'value': True}), serialize_data({'value': 1}))
+    vampytest.assert_ne(serialize_data({'value': 1.0}), serialize_data({'value': 1}))
+    vampytest.assert_ne(serialize_data({'value': True}), serialize_data({'value': 1.0}))
+
+
+def test__digest_data():
+    """
+    Tests whether ``digest_data`` works as intended.
+    """
+    output = digest_data({'name': 'koishi', 'size': [1, 2]})
+    vampytest.assert_instance(output, bytes)
+    vampytest.assert_eq(len(output), 32)
+    
+    vampytest.assert_eq(output, digest_data({'size': [1, 2], 'name': 'koishi'}))
+    vampytest.assert_ne(output, digest_data({'name': 'koishi', 'size': [1, 3]}))
+    vampytest.assert_ne(digest_data({'value': True}), digest_data({'value': 1}))
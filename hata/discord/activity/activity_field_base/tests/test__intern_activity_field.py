@@ -0,0 +1,52 @@
+import vampytest
+
+from ...activity_assets import ActivityAssets
+from ...activity_party import ActivityParty
+
+from ..interning import ACTIVITY_FIELDS, intern_activity_field
+
+
+def test__intern_activity_field__shared():
+    """
+    Tests whether ``intern_activity_field`` works as intended.
+    
+    Case: equal data.
+    """
+    output_0 = intern_activity_field(ActivityAssets, {'large_image': 'koishi', 'small_image': 'satori'})
+    output_1 = intern_activity_field(ActivityAssets, {'small_image': 'satori', 'large_image': 'koishi'})
+    
+    vampytest.assert_instance(output_0, ActivityAssets)
+    vampytest.assert_is(output_0, output_1)
+    vampytest.assert_eq(output_0, ActivityAssets(image_large = 'koishi', image_small = 'satori'))
+
+
+def test__intern_activity_field__different():
+    """
+    Tests whether ``intern_activity_field`` works as intended.
+    
+    Case: different data or type.
+    """
+    output_0 = intern_activity_field(ActivityParty, {'id': 'koishi', 'size': [1, 4]})
+    output_1 = intern_activity_field(ActivityParty, {'id': 'koishi', 'size': [2, 4]})
+    output_2 = intern_activity_field(ActivityAssets, {'large_image': 'koishi'})
+    
+    vampytest.assert_is_not(output_0, output_1)
+    vampytest.assert_instance(output_0, ActivityParty)
+    vampytest.assert_instance(output_2, ActivityAssets)
+
+
+def test__intern_activity_field__released():
+    """
+    Tests whether ``intern_activity_field`` works as intended.
+    
+    Case: released after not used.
+    """
+    data = {'large_image': 'orin'}
+    key = (ActivityAssets, frozenset(data.items()))
+    
+    output = intern_activity_field(ActivityAssets, data)
+    vampytest.assert_instance(output, ActivityAssets)
+    vampytest.assert_in(key, ACTIVITY_FIELDS)
+    
+    del output
+    vampytest.assert_not_in(key, ACTIVITY_FIELDS)
@@ -1,9 +1,8 @@
 __all__ = ()
 
 from ...field_parsers import (
-    entity_id_parser_factory, flag_parser_factory, force_string_parser_factory, nullable_array_parser_factory,
-    nullable_entity_parser_factory, nullable_functional_parser_factory, nullable_string_parser_factory,
-    preinstanced_parser_factory
+    entity_id_parser_factory, flag_parser_factory, nullable_array_parser_factory, nullable_entity_parser_factory,
+    nullable_functional_parser_factory, nullable_string_parser_factory, preinstanced_parser_factory
 )
 from ...field_putters import (
     entity_id_optional_putter_factory, flag_optional_putter_factory, force_string_putter_factory,
@@ -19,6 +18,9 @@ from ...field_validators import (
 from ...utils import datetime_to_millisecond_unix_time, millisecond_unix_time_to_datetime
 
 from ..activity_assets import ActivityAssets
+from ..activity_field_base.interning import (
+    interned_entity_parser_factory, interned_force_string_parser_factory, interned_nullable_string_parser_factory
+)
 from ..activity_party import ActivityParty
 from ..activity_secrets import ActivitySecrets
 from ..activity_timestamps import ActivityTimestamps
@@ -36,7 +38,7 @@ validate_application_id = entity_id_validator_factory('application_id', NotImple
 
 # assets
 
-parse_assets = nullable_entity_parser_factory('assets', ActivityAssets)
+parse_assets = interned_entity_parser_factory('assets', ActivityAssets)
 put_assets = nullable_entity_optional_putter_factory('assets', ActivityAssets)
 validate_assets = nullable_entity_validator_factory('assets', ActivityAssets)
 
@@ -99,7 +101,7 @@ validate_created_at = nullable_date_time_validator_factory('created_at')
 
 # details
 
-parse_details = nullable_string_parser_factory('details')
+parse_details = interned_nullable_string_parser_factory('details')
 put_details = nullable_string_optional_putter_factory('details')
 validate_details = nullable_string_validator_factory('details', 0, 1024)
 
@@ -186,7 +188,7 @@ validate_id = entity_id_validator_factory('activity_id')
 
 # name
 
-parse_name = force_string_parser_factory('name')
+parse_name = interned_force_string_parser_factory('name')
 put_name = force_string_putter_factory('name')
 validate_name = force_string_validator_factory('name', 0, 1024)
 
@@ -211,7 +213,7 @@ validate_session_id = nullable_string_validator_factory('session_id', 0, 1024)
 
 # state
 
-parse_state = nullable_string_parser_factory('state')
+parse_state = interned_nullable_string_parser_factory('state')
 put_state = nullable_string_optional_putter_factory('state')
 validate_state = nullable_string_validator_factory('state', 0, 1024)
 
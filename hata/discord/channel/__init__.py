@@ -6,8 +6,11 @@ from .forum_tag_update import *
 from .permission_overwrite import *
 from .voice_channel_effect import *
 
+from .message_archive_iterator import *
+from .message_cache_policy import *
 from .message_history import *
 from .message_iterator import *
+from .message_queue import *
 
 
 __all__ = (
@@ -19,6 +22,9 @@ __all__ = (
     *permission_overwrite.__all__,
     *voice_channel_effect.__all__,
     
+    *message_archive_iterator.__all__,
+    *message_cache_policy.__all__,
     *message_history.__all__,
     *message_iterator.__all__,
+    *message_queue.__all__,
 )
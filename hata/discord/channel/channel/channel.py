@@ -1,6 +1,5 @@
 __all__ = ('Channel',)
 
-from collections import deque
 from re import I as re_ignore_case, compile as re_compile, escape as re_escape, match as re_match, search as re_search
 
 from scarletio import LOOP_TIME, copy_docs, export, include
@@ -34,7 +33,9 @@ from ..channel_metadata.fields import (
 )
 from ..channel_metadata.private_group import CHANNEL_METADATA_ICON
 from ..forum_tag import create_partial_forum_tag_from_id
-from ..message_history import MessageHistory, MessageHistoryCollector, message_relative_index
+from ..message_cache_policy import MESSAGE_CACHE_POLICY
+from ..message_history import MessageHistory, MessageHistoryCollector
+from ..message_queue import MessageQueue
 
 from .preinstanced import ChannelType
 from .fields import (
@@ -271,6 +272,7 @@ class Channel(DiscordEntity, immortal = True):
                     metadata._created(self, client, strong_cache)
             else:
                 self.guild_id = guild_id
+                MESSAGE_CACHE_POLICY.discard_messages(self.messages)
                 self._message_history = None
                 
                 metadata = channel_type.metadata_type.from_data(data)
@@ -855,6 +857,24 @@ class Channel(DiscordEntity, immortal = True):
         return self.metadata._get_cached_permissions_for(self, user)
     
     
+    def cached_permissions_for_users(self, users):
+        """
+        Returns the permissions for each of the given users at the channel. Users with the same roles are calculated
+        only once, and the results are stored in the channel's permission cache.
+        
+        Parameters
+        ----------
+        users : ``iterable<UserBase>``
+            The users to calculate their permissions of.
+        
+        Returns
+        -------
+        permissions_by_user_id : ``dict<int, Permission>``
+            The calculated permissions of the users.
+        """
+        return self.metadata._get_cached_permissions_for_users(self, users)
+    
+    
     def permissions_for_roles(self, *roles):
         """
         Returns the channel permissions of an imaginary user who would have the listed roles.
@@ -1150,6 +1170,7 @@ class Channel(DiscordEntity, immortal = True):
         client : `None`, ``Client``
             The parent client entity.
         """
+        MESSAGE_CACHE_POLICY.discard_messages(self.messages)
         self.metadata._delete(self, client)
     
     
@@ -1169,7 +1190,9 @@ class Channel(DiscordEntity, immortal = True):
         ------
         channel : ``Channel``
         """
-        yield from self.metadata._iter_delete(self, client)
+        for channel in self.metadata._iter_delete(self, client):
+            MESSAGE_CACHE_POLICY.discard_messages(channel.messages)
+            yield channel
     
     
     @classmethod
@@ -2542,6 +2565,7 @@ class Channel(DiscordEntity, immortal = True):
     @message_keep_limit.setter
     def message_keep_limit(self, message_keep_limit):
         if message_keep_limit <= 0:
+            MESSAGE_CACHE_POLICY.discard_messages(self.messages)
             self._message_history = None
         
         else:
@@ -2572,35 +2596,14 @@ class Channel(DiscordEntity, immortal = True):
             return message
         
         messages = self._maybe_create_queue()
-        message_id = message.id
-        
         if (messages is not None):
-            if messages and (messages[0].id > message_id):
-                index = message_relative_index(messages, message_id)
-                max_length = messages.maxlen
-                if max_length is None:
-                    max_length_reached = False
-                else:
-                    if max_length == len(messages):
-                        max_length_reached = True
-                    else:
-                        max_length_reached = False
-                
-                if index == len(messages):
-                    if not max_length_reached:
-                        messages.append(message)
-                else:
-                    if max_length_reached:
-                        messages.pop()
-                        self.message_history_reached_end = False
-                    
-                    messages.insert(index, message)
+            added, dropped = messages.add(message)
+            if (dropped is not None):
+                self.message_history_reached_end = False
+                MESSAGE_CACHE_POLICY.discard(dropped.id)
             
-            else:
-                messages_length = len(messages)
-                messages.appendleft(message)
-                if messages_length != len(messages):
-                    self.message_history_reached_end = False
+            if added:
+                MESSAGE_CACHE_POLICY.track(message)
         
         return message
     
@@ -2624,16 +2627,15 @@ class Channel(DiscordEntity, immortal = True):
         The created message cannot be added to the channel's message history, if it has no more spaces.
         """
         message = Message.from_data(message_data)
-        message_id = message.id
         
         messages = self.messages
-        if (messages is not None) and messages and (message_id > messages[-1].id):
-            index = message_relative_index(messages, message_id)
-            if index != len(messages):
-                if messages[index].id != message_id:
-                    self._maybe_increase_queue_size().insert(index, message)
-        else:
-            self._maybe_increase_queue_size().append(message)
+        if (messages is None) or (messages.get(message.id, None) is None):
+            added, dropped = self._maybe_increase_queue_size().add(message)
+            if (dropped is not None):
+                MESSAGE_CACHE_POLICY.discard(dropped.id)
+            
+            if added:
+                MESSAGE_CACHE_POLICY.track_old(message)
         
         return message
     
@@ -2658,16 +2660,20 @@ class Channel(DiscordEntity, immortal = True):
         message_id = int(message_data['id'])
         messages = self.messages
         if (messages is not None):
-            index = message_relative_index(messages, message_id)
-            if index != len(messages):
-                message = messages[index]
-                if message.id == message_id:
-                    return message, True
+            message = messages.get(message_id, None)
+            if (message is not None):
+                MESSAGE_CACHE_POLICY.touch(message_id)
+                return message, True
         
         message = Message.from_data(message_data)
         
         if chained:
-            self._maybe_increase_queue_size().append(message)
+            added, dropped = self._maybe_increase_queue_size().add(message)
+            if (dropped is not None):
+                MESSAGE_CACHE_POLICY.discard(dropped.id)
+            
+            if added:
+                MESSAGE_CACHE_POLICY.track_old(message)
         
         return message, False
     
@@ -2704,12 +2710,12 @@ class Channel(DiscordEntity, immortal = True):
         
         Returns
         -------
-        messages : `deque`
+        messages : ``MessageQueue``
         """
         messages = self.messages
         if messages is None:
             # Create unlimited size.
-            self.messages = messages = deque()
+            self.messages = messages = MessageQueue()
             self._add_message_collection_delay(110.0)
         else:
             max_length = messages.maxlen
@@ -2719,7 +2725,7 @@ class Channel(DiscordEntity, immortal = True):
             else:
                 # Switch to unlimited if we hit our current limit.
                 if len(messages) == max_length:
-                    self.messages = messages = deque(messages)
+                    self.messages = messages = MessageQueue(messages)
                     self._add_message_collection_delay(110.0)
         
         return messages
@@ -2731,7 +2737,7 @@ class Channel(DiscordEntity, immortal = True):
         
         Returns
         -------
-        messages : `deque`, `None`
+        messages : `None | MessageQueue`
         """
         messages = self.messages
         if messages is None:
@@ -2740,9 +2746,9 @@ class Channel(DiscordEntity, immortal = True):
                 if self._message_history_collector is None:
                     messages = None
                 else:
-                    self.messages = messages = deque(maxlen = None)
+                    self.messages = messages = MessageQueue()
             else:
-                self.messages = messages = deque(maxlen = message_keep_limit)
+                self.messages = messages = MessageQueue(None, message_keep_limit)
         else:
             
             max_length = messages.maxlen
@@ -2750,7 +2756,7 @@ class Channel(DiscordEntity, immortal = True):
                 if self._message_history_collector is None:
                     self.message_history_reached_end = False
                 else:
-                    self.messages = messages = deque(messages, maxlen = None)
+                    self.messages = messages = MessageQueue(messages)
         
         return messages
     
@@ -2767,11 +2773,9 @@ class Channel(DiscordEntity, immortal = True):
             if limit == 0:
                 new_messages = None
             else:
-                new_messages = deque(
-                    (old_messages[index] for index in range(min(limit, len(old_messages)))),
-                    maxlen = limit,
-                )
+                new_messages = MessageQueue(old_messages, limit)
         
+        MESSAGE_CACHE_POLICY.discard_dropped(old_messages, new_messages)
         self.messages = new_messages
         self._cancel_message_collection()
         self.message_history_reached_end = False
@@ -2792,22 +2796,20 @@ class Channel(DiscordEntity, immortal = True):
         """
         messages = self.messages
         if (messages is not None):
-            index = message_relative_index(messages, delete_id)
-            if index != len(messages):
-                message = messages[index]
-                if message.id == delete_id:
-                    del messages[index]
-                    if (self._message_history_collector is not None):
-                        if len(messages) < self._message_keep_limit:
-                            self._switch_to_limited()
-                    
-                    try:
-                        del MESSAGES[delete_id]
-                    except KeyError:
-                        pass
-                    
-                    message.deleted = True
-                    return message
+            message = messages.pop_by_id(delete_id)
+            if (message is not None):
+                MESSAGE_CACHE_POLICY.discard(delete_id)
+                if (self._message_history_collector is not None):
+                    if len(messages) < self._message_keep_limit:
+                        self._switch_to_limited()
+                
+                try:
+                    del MESSAGES[delete_id]
+                except KeyError:
+                    pass
+                
+                message.deleted = True
+                return message
         
         try:
             message = MESSAGES.pop(delete_id)
@@ -2837,78 +2839,34 @@ class Channel(DiscordEntity, immortal = True):
         """
         found = []
         missed = []
-        delete_length = len(delete_ids)
-        if not delete_length:
+        if not delete_ids:
             return found, missed
         
         messages = self.messages
         delete_ids.sort(reverse = True)
-        if messages is None:
-            messages_length = 0
-        else:
-            messages_length = len(messages)
-        
-        if messages is None:
-            messages_index = 0
-        else:
-            messages_index = message_relative_index(messages, delete_ids[0])
-        delete_index = 0
         
-        while True:
-            if delete_index == delete_length:
-                break
+        for delete_id in delete_ids:
+            if messages is None:
+                message = None
+            else:
+                message = messages.pop_by_id(delete_id)
             
-            if messages_index == messages_length:
-                while True:
-                    delete_id = delete_ids[delete_index]
-                    try:
-                        message = MESSAGES.pop(delete_id)
-                    except KeyError:
-                        missed.append(delete_id)
-                    else:
-                        message.deleted = True
-                        found.append(message)
-                        
-                    delete_index += 1
-                    if delete_index == delete_length:
-                        break
-                    
+            if message is None:
+                try:
+                    message = MESSAGES.pop(delete_id)
+                except KeyError:
+                    missed.append(delete_id)
                     continue
-                break
             
-            message = messages[messages_index]
-            delete_id = delete_ids[delete_index]
-            message_id = message.id
-            
-            if message_id == delete_id:
-                del messages[messages_index]
+            else:
+                MESSAGE_CACHE_POLICY.discard(delete_id)
                 try:
                     del MESSAGES[delete_id]
                 except KeyError:
                     pass
-                
-                message.deleted = True
-                found.append(message)
-                
-                messages_length -= 1
-                delete_index += 1
-                continue
             
-            if message_id > delete_id:
-                messages_index += 1
-                continue
-            
-            delete_index += 1
-            
-            try:
-                message = MESSAGES.pop(delete_id)
-            except KeyError:
-                missed.append(delete_id)
-            else:
-                message.deleted = True
-                found.append(message)
-            
-            continue
+            message.deleted = True
+            found.append(message)
         
         if (
             (messages is not None) and
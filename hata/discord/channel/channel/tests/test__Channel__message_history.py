@@ -0,0 +1,45 @@
+import vampytest
+
+from ....message import Message
+
+from ...message_queue import MessageQueue
+
+from ..channel import Channel
+from ..preinstanced import ChannelType
+
+
+def test__Channel__pop_message():
+    """
+    Tests whether ``Channel._pop_message`` works as intended.
+    """
+    channel_id = 202410170200
+    message_0 = Message.precreate(202410170201, channel_id = channel_id)
+    message_1 = Message.precreate(202410170202, channel_id = channel_id)
+    
+    channel = Channel.precreate(channel_id, channel_type = ChannelType.guild_text)
+    channel.messages = MessageQueue([message_0, message_1], 10)
+    
+    output = channel._pop_message(message_0.id)
+    vampytest.assert_is(output, message_0)
+    vampytest.assert_true(message_0.deleted)
+    vampytest.assert_eq([*channel.messages], [message_1])
+
+
+def test__Channel__pop_multiple():
+    """
+    Tests whether ``Channel._pop_multiple`` works as intended.
+    """
+    channel_id = 202410170210
+    message_0 = Message.precreate(202410170211, channel_id = channel_id)
+    message_1 = Message.precreate(202410170212, channel_id = channel_id)
+    message_2 = Message.precreate(202410170213, channel_id = channel_id)
+    missing_message_id = 202410170214
+    
+    channel = Channel.precreate(channel_id, channel_type = ChannelType.guild_text)
+    channel.messages = MessageQueue([message_0, message_1, message_2], 10)
+    
+    found, missed = channel._pop_multiple([message_0.id, missing_message_id, message_2.id])
+    
+    vampytest.assert_eq(found, [message_2, message_0])
+    vampytest.assert_eq(missed, [missing_message_id])
+    vampytest.assert_eq([*channel.messages], [message_1])
@@ -9,6 +9,7 @@ from ....user import GuildProfile, User, VoiceState
 
 from ...channel import Channel
 from ...forum_tag import ForumTag
+from ...permission_overwrite import PermissionOverwrite, PermissionOverwriteTargetType
 
 from ..preinstanced import ChannelType
 
@@ -417,6 +418,67 @@ def test__Channel__cached_permissions_for():
         clients = None
 
 
+def test__Channel__cached_permissions_for_users():
+    """
+    Tests whether ``Channel.cached_permissions_for_users`` works as intended.
+    """
+    channel_id = 202610170010
+    guild_id = 202610170011
+    owner_id = 202610170012
+    user_id_0 = 202610170013
+    user_id_1 = 202610170014
+    user_id_2 = 202610170015
+    role_id = 202610170016
+    
+    default_permissions = Permission().update_by_keys(view_channel = True, send_messages = True)
+    role_permissions = Permission().update_by_keys(view_channel = True, manage_messages = True)
+    
+    role_default = Role.precreate(guild_id, permissions = default_permissions)
+    role = Role.precreate(role_id, permissions = role_permissions)
+    
+    users = []
+    for user_id in (owner_id, user_id_0, user_id_1, user_id_2):
+        user = User.precreate(user_id)
+        user.guild_profiles[guild_id] = GuildProfile(role_ids = [role_id])
+        users.append(user)
+    
+    channel = Channel.precreate(
+        channel_id,
+        channel_type = ChannelType.guild_text,
+        guild_id = guild_id,
+        permission_overwrites = [
+            PermissionOverwrite(
+                user_id_2,
+                target_type = PermissionOverwriteTargetType.user,
+                deny = Permission().update_by_keys(send_messages = True),
+            ),
+        ],
+    )
+    
+    guild = Guild.precreate(
+        guild_id, channels = [channel], owner_id = owner_id, roles = [role_default, role], users = users
+    )
+    
+    output = channel.cached_permissions_for_users(users)
+    
+    vampytest.assert_instance(output, dict)
+    vampytest.assert_eq(
+        output,
+        {user.id: channel.permissions_for(user) for user in users},
+    )
+    vampytest.assert_eq(output[user_id_0], output[user_id_1])
+    vampytest.assert_ne(output[user_id_0], output[user_id_2])
+    vampytest.assert_eq(output[owner_id], channel.permissions_for(users[0]))
+    
+    vampytest.assert_eq(
+        {*channel.metadata._cache_permission.keys()},
+        {owner_id, user_id_0, user_id_1, user_id_2},
+    )
+    
+    # Keep reference
+    guild = guild
+
+
 def test__Channel__iter_applied_tag_ids():
     """
     Tests whether ``Channel.iter_applied_tag_ids`` works as intended.
@@ -583,6 +583,26 @@ class ChannelMetadataBase(RichAttributeErrorBaseType):
         return self._get_permissions_for(channel_entity, user)
     
     
+    def _get_cached_permissions_for_users(self, channel_entity, users):
+        """
+        Returns the permissions for each of the given users at the channel. Uses and fills the permission cache.
+        
+        Parameters
+        ----------
+        channel_entity : ``Channel``
+            The channel entity owning the metadata.
+        
+        users : ``iterable<UserBase>``
+            The users to calculate their permissions of.
+        
+        Returns
+        -------
+        permissions_by_user_id : ``dict<int, Permission>``
+            The calculated permissions of the users.
+        """
+        return {user.id: self._get_cached_permissions_for(channel_entity, user) for user in users}
+    
+    
     def _get_permissions_for_roles(self, channel_entity, roles):
         """
         Returns the channel permissions of an imaginary user who would have the listed roles.
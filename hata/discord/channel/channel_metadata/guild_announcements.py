@@ -17,8 +17,8 @@ class ChannelMetadataGuildAnnouncements(ChannelMetadataGuildTextBase):
     
     Attributes
     ----------
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     default_thread_auto_archive_after : `int`
         The default duration (in seconds) for newly created threads to automatically archive the themselves. Defaults
         to `3600`. Can be one of: `3600`, `86400`, `259200`, `604800`.
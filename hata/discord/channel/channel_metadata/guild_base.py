@@ -1,17 +1,16 @@
 __all__ = ('ChannelMetadataGuildBase',)
 
-from scarletio import copy_docs, export, include
+from scarletio import copy_docs, export
 
 from ...permission.permission import PERMISSION_MASK_VIEW_CHANNEL
+from ...permission.permission_cache_statistics import PERMISSION_CACHE_STATISTICS
+from ...user import ClientUserBase
 
 from .fields import parse_name, parse_parent_id, put_name, put_parent_id, validate_name, validate_parent_id
 
 from .base import ChannelMetadataBase
 
 
-Client = include('Client')
-
-
 @export
 class ChannelMetadataGuildBase(ChannelMetadataBase):
     """
@@ -19,8 +18,8 @@ class ChannelMetadataGuildBase(ChannelMetadataBase):
     
     Attributes
     ----------
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     name : `str`
         The channel's name.
     parent_id : `int`
@@ -295,23 +294,35 @@ class ChannelMetadataGuildBase(ChannelMetadataBase):
     
     @copy_docs(ChannelMetadataBase._get_cached_permissions_for)
     def _get_cached_permissions_for(self, channel_entity, user):
-        if not isinstance(user, Client):
+        if not isinstance(user, ClientUserBase):
             return self._get_permissions_for(channel_entity, user)
         
+        # The entries are validated by the role identifiers, so we do not need to be notified about every user update.
+        # Users outside of the guild are marked with `...`.
+        guild_profile = user.guild_profiles.get(channel_entity.guild_id, None)
+        role_ids = ... if guild_profile is None else guild_profile.role_ids
+        
         permission_cache = self._cache_permission
         if permission_cache is None:
             self._cache_permission = permission_cache = {}
         else:
             try:
-                return permission_cache[user.id]
+                cached_role_ids, permissions = permission_cache[user.id]
             except KeyError:
                 pass
+            else:
+                if cached_role_ids is role_ids:
+                    PERMISSION_CACHE_STATISTICS.hits += 1
+                    return permissions
         
+        PERMISSION_CACHE_STATISTICS.misses += 1
         permissions = self._get_permissions_for(channel_entity, user)
-        permission_cache[user.id] = permissions
+        permission_cache[user.id] = (role_ids, permissions)
         return permissions
     
     
     @copy_docs(ChannelMetadataBase._invalidate_cache_permission)
     def _invalidate_cache_permission(self):
-        self._cache_permission = None
+        if (self._cache_permission is not None):
+            self._cache_permission = None
+            PERMISSION_CACHE_STATISTICS.invalidations += 1
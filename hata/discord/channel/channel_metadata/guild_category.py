@@ -11,8 +11,8 @@ class ChannelMetadataGuildCategory(ChannelMetadataGuildMainBase):
     
     Attributes
     ----------
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     parent_id : `int`
         The channel's parent's identifier.
     name : `str`
@@ -15,8 +15,8 @@ class ChannelMetadataGuildDirectory(ChannelMetadataGuildMainBase):
     
     Attributes
     ----------
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     name : `str`
         The channel's name.
     parent_id : `int`
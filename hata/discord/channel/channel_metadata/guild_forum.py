@@ -9,8 +9,8 @@ class ChannelMetadataGuildForum(ChannelMetadataGuildForumBase):
     
     Attributes
     ----------
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     available_tags : `None`, `tuple` of ``ForumTag``
         The available tags to assign to the child-thread channels.
     default_forum_layout : ``ForumLayout``
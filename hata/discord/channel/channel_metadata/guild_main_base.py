@@ -7,6 +7,7 @@ from ...permission import Permission
 from ...permission.permission import (
     PERMISSION_ALL, PERMISSION_MASK_ADMINISTRATOR, PERMISSION_MASK_VIEW_CHANNEL, PERMISSION_NONE
 )
+from ...permission.permission_cache_statistics import PERMISSION_CACHE_STATISTICS
 from ...user import ClientUserBase
 
 from .fields import (
@@ -23,8 +24,8 @@ class ChannelMetadataGuildMainBase(ChannelMetadataGuildBase):
     
     Attributes
     ----------
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     name : `str`
         The channel's name.
     parent_id : `int`
@@ -426,6 +427,47 @@ class ChannelMetadataGuildMainBase(ChannelMetadataGuildBase):
         return result
     
     
+    @copy_docs(ChannelMetadataGuildBase._get_cached_permissions_for_users)
+    def _get_cached_permissions_for_users(self, channel_entity, users):
+        guild_id = channel_entity.guild_id
+        guild = GUILDS.get(guild_id, None)
+        if guild is None:
+            return {user.id: PERMISSION_NONE for user in users}
+        
+        owner_id = guild.owner_id
+        permission_overwrites = self.permission_overwrites
+        
+        # Users with the same roles have the same permissions, except the owner and the ones with own overwrite.
+        permissions_by_role_ids = {}
+        permissions_by_user_id = {}
+        
+        for user in users:
+            user_id = user.id
+            
+            if (user_id == owner_id) or ((permission_overwrites is not None) and (user_id in permission_overwrites)):
+                guild_profile = None
+            else:
+                guild_profile = user.guild_profiles.get(guild_id, None)
+            
+            if guild_profile is None:
+                permissions_by_user_id[user_id] = self._get_cached_permissions_for(channel_entity, user)
+                continue
+            
+            role_ids = guild_profile.role_ids
+            try:
+                permissions = permissions_by_role_ids[role_ids]
+            except KeyError:
+                permissions = self._get_cached_permissions_for(channel_entity, user)
+                permissions_by_role_ids[role_ids] = permissions
+            else:
+                PERMISSION_CACHE_STATISTICS.hits += 1
+                self._cache_permission[user_id] = (role_ids, permissions)
+            
+            permissions_by_user_id[user_id] = permissions
+        
+        return permissions_by_user_id
+    
+    
     def _get_base_permissions_for_roles(self, channel_entity, roles):
         """
         Returns the channel permissions of an imaginary user who would have the listed roles. This method is called
@@ -18,8 +18,8 @@ class ChannelMetadataGuildStage(ChannelMetadataGuildVoiceBase):
     
     Attributes
     ----------
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     
     bitrate : `int`
         The bitrate (in bits) of the voice channel.
@@ -25,8 +25,8 @@ class ChannelMetadataGuildThreadBase(ChannelMetadataGuildBase):
     ----------
     _created_at : `None | DateTime`
         When the channel was created.
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     archived : `bool`
         Whether the thread is archived.
     archived_at : `None | DateTime`
@@ -557,6 +557,27 @@ class ChannelMetadataGuildThreadBase(ChannelMetadataGuildBase):
         return parent.permissions_for(user)
     
     
+    @copy_docs(ChannelMetadataGuildBase._get_cached_permissions_for)
+    def _get_cached_permissions_for(self, channel_entity, user):
+        # Use the parent's cache, since that is the one invalidated when its permission overwrites change.
+        try:
+            parent = CHANNELS[self.parent_id]
+        except KeyError:
+            return PERMISSION_NONE
+        
+        return parent.cached_permissions_for(user)
+    
+    
+    @copy_docs(ChannelMetadataGuildBase._get_cached_permissions_for_users)
+    def _get_cached_permissions_for_users(self, channel_entity, users):
+        try:
+            parent = CHANNELS[self.parent_id]
+        except KeyError:
+            return {user.id: PERMISSION_NONE for user in users}
+        
+        return parent.cached_permissions_for_users(users)
+    
+    
     @copy_docs(ChannelMetadataGuildBase._get_permissions_for_roles)
     def _get_permissions_for_roles(self, channel_entity, roles):
         try:
@@ -15,8 +15,8 @@ class ChannelMetadataGuildThreadPrivate(ChannelMetadataGuildThreadBase):
     ----------
     _created_at : `None | DateTime`
         When the channel was created.
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     archived : `bool`
         Whether the thread s archived.
     archived_at : `None | DateTime`
@@ -19,8 +19,8 @@ class ChannelMetadataGuildThreadPublic(ChannelMetadataGuildThreadBase):
     ----------
     _created_at : `None | DateTime`
         When the channel was created.
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
     applied_tag_ids : `None | tuple<int>`
          The tags' identifier which have been applied to the thread. Applicable for threads of a forum.
     archived : `bool`
@@ -0,0 +1,423 @@
+__all__ = ('MessageArchiveIterator', )
+
+from collections import deque
+
+from scarletio import CancelledError, RichAttributeErrorBaseType, Task, alchemy_incendiary, shield, to_json
+
+from ..core import KOKORO
+from ..exceptions import DiscordException, ERROR_CODES
+from ..utils import log_time_converter
+
+
+MESSAGE_ARCHIVE_CHUNK_SIZE = 100
+MESSAGE_ARCHIVE_PREFETCH_DEFAULT = 2
+
+MESSAGE_ARCHIVE_IGNORED_ERROR_CODES = frozenset((
+    ERROR_CODES.unknown_message, # message deleted
+    ERROR_CODES.unknown_channel, # message's channel deleted
+    ERROR_CODES.missing_access, # client removed
+    ERROR_CODES.missing_permissions, # permissions changed meanwhile
+))
+
+
+def _get_message_data_id(message_data):
+    """
+    Returns the identifier of the given message data.
+    
+    Parameters
+    ----------
+    message_data : `dict<str, object>`
+        Message data.
+    
+    Returns
+    -------
+    message_id : `int`
+    """
+    return int(message_data['id'])
+
+
+def _write_json_lines(file, message_datas):
+    """
+    Writes the given message datas into the given file, one json object per line.
+    
+    Parameters
+    ----------
+    file : `TextIOWrapper`
+        The file to write to.
+    message_datas : `list<dict<str, object>>`
+        The message datas to write.
+    """
+    file.write(''.join([to_json(message_data) + '\n' for message_data in message_datas]))
+    file.flush()
+
+
+class MessageArchiveIterator(RichAttributeErrorBaseType):
+    """
+    An asynchronous iterator over a channel's message history, yielding the raw message datas ordered by their
+    identifier. Unlike ``MessageIterator`` it does not create ``Message``-s and does not touch the channel's message
+    cache, so it can be used to export channels of any size.
+    
+    The next chunk is requested as soon as the previous one arrives, while less than `prefetch` chunks are waiting for
+    the consumer. Since each request continues from the previous chunk's last message, only a single request is in
+    flight at a time, keeping the iteration within the channel's rate limit.
+    
+    Attributes
+    ----------
+    _chunks : `deque<list<dict<str, object>>>`
+        The requested chunks waiting for the consumer.
+    
+    _exception : `None | BaseException`
+        Exception occurred while requesting, raised to the consumer after the requested chunks are exhausted.
+    
+    _exhausted : `bool`
+        Whether there are no more chunks to request.
+    
+    _message_datas : `deque<dict<str, object>>`
+        The message datas of the chunk being yielded.
+    
+    _query : `dict<str, object>`
+        Query parameters to request with.
+    
+    _request_task : ``None | Task<None>``
+        The task requesting the next chunk.
+    
+    after : `int`
+        The lower bound (exclusive) of the messages' identifiers. `0` if not bounded.
+    
+    before : `int`
+        The upper bound (exclusive) of the messages' identifiers. `0` if not bounded.
+    
+    channel_id : `int`
+        The respective channel's identifier.
+    
+    client : ``Client``
+        Client to request with.
+    
+    converter : `None | FunctionType`
+        Converter called on each yielded message data.
+    
+    message_count : `int`
+        How much messages were yielded or exported.
+    
+    oldest_first : `bool`
+        Whether the messages are yielded from the oldest one.
+    
+    prefetch : `int`
+        How much chunks can be requested ahead of the consumer.
+    
+    request_count : `int`
+        How much chunks were requested.
+    """
+    __slots__ = (
+        '_chunks', '_exception', '_exhausted', '_message_datas', '_query', '_request_task', 'after', 'before',
+        'channel_id', 'client', 'converter', 'message_count', 'oldest_first', 'prefetch', 'request_count'
+    )
+    
+    def __new__(
+        cls,
+        client,
+        channel_id,
+        *,
+        after = None,
+        before = None,
+        converter = None,
+        oldest_first = False,
+        prefetch = MESSAGE_ARCHIVE_PREFETCH_DEFAULT,
+    ):
+        """
+        Creates a message archive iterator.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The client, who will execute the api requests.
+        
+        channel_id : `int`
+            The channel's identifier what's messages will be requested.
+        
+        after : ``None | int | DiscordEntity | DateTime`` = `None`, Optional (Keyword only)
+            Only messages created after this are yielded.
+        
+        before : ``None | int | DiscordEntity | DateTime`` = `None`, Optional (Keyword only)
+            Only messages created before this are yielded.
+        
+        converter : `None | FunctionType` = `None`, Optional (Keyword only)
+            Converter to call on each yielded message data, like to create lightweight records from them.
+        
+        oldest_first : `bool` = `False`, Optional (Keyword only)
+            Whether the messages should be yielded from the oldest one.
+        
+        prefetch : `int` = `MESSAGE_ARCHIVE_PREFETCH_DEFAULT`, Optional (Keyword only)
+            How much chunks can be requested ahead of the consumer.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        after = log_time_converter(after)
+        before = log_time_converter(before)
+        
+        if not isinstance(prefetch, int):
+            raise TypeError(
+                f'`prefetch` can be `int`, got {type(prefetch).__name__}; {prefetch!r}.'
+            )
+        
+        if prefetch < 1:
+            raise ValueError(
+                f'`prefetch` can be greater than or equal to `1`, got {prefetch!r}.'
+            )
+        
+        query = {'limit': MESSAGE_ARCHIVE_CHUNK_SIZE}
+        if oldest_first:
+            query['after'] = after
+        elif before:
+            query['before'] = before
+        
+        self = object.__new__(cls)
+        self._chunks = deque()
+        self._exception = None
+        self._exhausted = False
+        self._message_datas = deque()
+        self._query = query
+        self._request_task = None
+        self.after = after
+        self.before = before
+        self.channel_id = channel_id
+        self.client = client
+        self.converter = converter
+        self.message_count = 0
+        self.oldest_first = oldest_first
+        self.prefetch = prefetch
+        self.request_count = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the message archive iterator's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        # channel_id
+        repr_parts.append(' channel_id = ')
+        repr_parts.append(repr(self.channel_id))
+        
+        # message_count
+        repr_parts.append(', message_count = ')
+        repr_parts.append(repr(self.message_count))
+        
+        # request_count
+        repr_parts.append(', request_count = ')
+        repr_parts.append(repr(self.request_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def _maybe_request(self):
+        """
+        Starts requesting the next chunk if not yet requesting and the consumer is not too much behind.
+        """
+        if (self._request_task is None) and (not self._exhausted) and (len(self._chunks) < self.prefetch):
+            self._request_task = Task(KOKORO, self._request_chunk())
+    
+    
+    async def _request_chunk(self):
+        """
+        Requests the next chunk, then continues with the one after if applicable.
+        
+        This method is a coroutine.
+        """
+        try:
+            try:
+                message_datas = await self.client.api.message_get_chunk(self.channel_id, self._query)
+            except CancelledError:
+                self._exhausted = True
+                raise
+            
+            except BaseException as err:
+                self._exhausted = True
+                
+                if not (isinstance(err, DiscordException) and (err.code in MESSAGE_ARCHIVE_IGNORED_ERROR_CODES)):
+                    self._exception = err
+                return
+            
+            self.request_count += 1
+            self._process_chunk(message_datas)
+        
+        finally:
+            self._request_task = None
+        
+        self._maybe_request()
+    
+    
+    def _process_chunk(self, message_datas):
+        """
+        Orders the given chunk, drops the messages out of the iterator's bounds and updates the query to continue from.
+        
+        Parameters
+        ----------
+        message_datas : `list<dict<str, object>>`
+            The requested message datas.
+        """
+        if len(message_datas) < MESSAGE_ARCHIVE_CHUNK_SIZE:
+            self._exhausted = True
+        
+        oldest_first = self.oldest_first
+        message_datas.sort(key = _get_message_data_id, reverse = not oldest_first)
+        
+        if oldest_first:
+            limit = self.before
+        else:
+            limit = self.after
+        
+        if limit:
+            for index, message_data in enumerate(message_datas):
+                message_id = _get_message_data_id(message_data)
+                if (message_id >= limit) if oldest_first else (message_id <= limit):
+                    del message_datas[index:]
+                    self._exhausted = True
+                    break
+        
+        if not message_datas:
+            self._exhausted = True
+            return
+        
+        self._query['after' if oldest_first else 'before'] = _get_message_data_id(message_datas[-1])
+        self._chunks.append(message_datas)
+    
+    
+    async def _get_chunk(self):
+        """
+        Returns the next chunk, waiting for it to be requested if required.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        chunk : `None | list<dict<str, object>>`
+            Returns `None` if there are no more messages.
+        
+        Raises
+        ------
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        while True:
+            chunks = self._chunks
+            if chunks:
+                chunk = chunks.popleft()
+                self._maybe_request()
+                return chunk
+            
+            request_task = self._request_task
+            if (request_task is not None):
+                await shield(request_task, KOKORO)
+                continue
+            
+            if self._exhausted:
+                exception = self._exception
+                if (exception is not None):
+                    self._exception = None
+                    raise exception
+                
+                return None
+            
+            self._maybe_request()
+    
+    
+    def __aiter__(self):
+        """Returns self."""
+        return self
+    
+    
+    async def __anext__(self):
+        """
+        Yields the next message data of the iterator's channel, or its converted value if the iterator has a
+        converter.
+        
+        This method is a coroutine.
+        
+        Raises
+        ------
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        message_datas = self._message_datas
+        while not message_datas:
+            chunk = await self._get_chunk()
+            if chunk is None:
+                raise StopAsyncIteration
+            
+            message_datas.extend(chunk)
+        
+        message_data = message_datas.popleft()
+        self.message_count += 1
+        
+        converter = self.converter
+        if (converter is not None):
+            message_data = converter(message_data)
+        
+        return message_data
+    
+    
+    async def export(self, path):
+        """
+        Appends the not yet yielded message datas to the given file as json lines. Writing is done inside of an
+        executor, meanwhile the next chunk is requested.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        path : `str`
+            Path to the file to append to.
+        
+        Returns
+        -------
+        message_count : `int`
+            How much messages were written.
+        
+        Raises
+        ------
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        message_count = 0
+        
+        with open(path, 'a', encoding = 'utf-8') as file:
+            message_datas = self._message_datas
+            if message_datas:
+                chunk = [*message_datas]
+                message_datas.clear()
+            else:
+                chunk = await self._get_chunk()
+            
+            while (chunk is not None):
+                await KOKORO.run_in_executor(alchemy_incendiary(_write_json_lines, (file, chunk)))
+                message_count += len(chunk)
+                self.message_count += len(chunk)
+                chunk = await self._get_chunk()
+        
+        return message_count
+    
+    
+    def close(self):
+        """
+        Stops the iteration, cancelling the ongoing request and dropping the requested chunks.
+        """
+        self._exhausted = True
+        self._chunks.clear()
+        self._message_datas.clear()
+        
+        request_task = self._request_task
+        if (request_task is not None):
+            self._request_task = None
+            request_task.cancel()
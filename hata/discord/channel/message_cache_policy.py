@@ -0,0 +1,286 @@
+__all__ = ('MESSAGE_CACHE_POLICY', 'MessageCachePolicy',)
+
+from collections import OrderedDict
+
+from scarletio import RichAttributeErrorBaseType
+
+from ...env import MESSAGE_CACHE_GLOBAL_LIMIT
+
+from ..core import CHANNELS, MESSAGES
+
+
+class MessageCachePolicy(RichAttributeErrorBaseType):
+    """
+    Process wide message cache policy.
+    
+    Tracks the new messages added to the channels' message histories in least recently used order. If more messages
+    are tracked than the policy's limit, the least recently used ones are removed from their channel's message history
+    together with the older messages of the same channel, so message histories stay continuous.
+    Removed messages stay accessible through `MESSAGES` till they are referenced elsewhere.
+    
+    Attributes
+    ----------
+    _entries : `OrderedDict<int, int>`
+        Message identifier to channel identifier relation, from the least to the most recently used.
+    evictions : `int`
+        The amount of messages removed from a channel's message history because of the policy.
+    hits : `int`
+        The amount of message lookups when the message was cached.
+    limit : `int`
+        The maximal amount of messages to keep. `0` means no limit.
+    misses : `int`
+        The amount of message lookups when the message was not cached.
+    """
+    __slots__ = ('_entries', 'evictions', 'hits', 'limit', 'misses')
+    
+    def __new__(cls, limit):
+        """
+        Creates a new message cache policy.
+        
+        Parameters
+        ----------
+        limit : `int`
+            The maximal amount of messages to keep. `0` means no limit.
+        """
+        self = object.__new__(cls)
+        self._entries = OrderedDict()
+        self.evictions = 0
+        self.hits = 0
+        self.limit = limit
+        self.misses = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the message cache policy's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' limit = ')
+        repr_parts.append(repr(self.limit))
+        
+        repr_parts.append(', tracked = ')
+        repr_parts.append(repr(len(self._entries)))
+        
+        repr_parts.append(', hits = ')
+        repr_parts.append(repr(self.hits))
+        
+        repr_parts.append(', misses = ')
+        repr_parts.append(repr(self.misses))
+        
+        repr_parts.append(', evictions = ')
+        repr_parts.append(repr(self.evictions))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns the amount of tracked messages."""
+        return len(self._entries)
+    
+    
+    def get(self, message_id):
+        """
+        Gets the message for the given identifier from `MESSAGES` and updates the counters.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        
+        Returns
+        -------
+        message : `None | Message`
+        """
+        message = MESSAGES.get(message_id, None)
+        if message is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.touch(message_id)
+        
+        return message
+    
+    
+    def touch(self, message_id):
+        """
+        Marks the message as recently used.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        """
+        entries = self._entries
+        if message_id in entries:
+            entries.move_to_end(message_id)
+    
+    
+    def track(self, message):
+        """
+        Starts tracking the given message added to its channel's message history. If the policy's limit is exceeded
+        evicts the least recently used messages.
+        
+        Does nothing if the policy has no limit.
+        
+        Parameters
+        ----------
+        message : ``Message``
+            The message to track.
+        """
+        limit = self.limit
+        if not limit:
+            return
+        
+        entries = self._entries
+        entries[message.id] = message.channel_id
+        entries.move_to_end(message.id)
+        
+        while len(entries) > limit:
+            message_id, channel_id = entries.popitem(False)
+            self._evict(message_id, channel_id)
+    
+    
+    def track_old(self, message):
+        """
+        Starts tracking the given message loaded into its channel's message history from its history.
+        
+        Loaded messages are older than the other messages of their channel, so they are tracked as the least recently
+        used ones. This way if the policy's limit is exceeded, they are evicted first and the message histories stay
+        continuous while loading them.
+        
+        Does nothing if the policy has no limit.
+        
+        Parameters
+        ----------
+        message : ``Message``
+            The message to track.
+        """
+        limit = self.limit
+        if not limit:
+            return
+        
+        entries = self._entries
+        entries[message.id] = message.channel_id
+        entries.move_to_end(message.id, False)
+        
+        while len(entries) > limit:
+            message_id, channel_id = entries.popitem(False)
+            self._evict(message_id, channel_id)
+    
+    
+    def discard(self, message_id):
+        """
+        Stops tracking the message.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        """
+        self._entries.pop(message_id, None)
+    
+    
+    def discard_messages(self, messages):
+        """
+        Stops tracking the given messages. Called when a channel's message history is removed.
+        
+        Parameters
+        ----------
+        messages : `None | MessageQueue`
+            The removed message history.
+        """
+        entries = self._entries
+        if (not entries) or (messages is None):
+            return
+        
+        for message in messages:
+            entries.pop(message.id, None)
+    
+    
+    def discard_dropped(self, old_messages, new_messages):
+        """
+        Stops tracking the messages of a channel's old message history, which are not present in the new one. Called
+        when a channel's message history is replaced with a shorter one.
+        
+        Parameters
+        ----------
+        old_messages : `None | MessageQueue`
+            The old message history.
+        new_messages : `None | MessageQueue`
+            The new message history.
+        """
+        if new_messages is None:
+            self.discard_messages(old_messages)
+            return
+        
+        entries = self._entries
+        if (not entries) or (old_messages is None):
+            return
+        
+        for message in old_messages:
+            message_id = message.id
+            if new_messages.get(message_id, None) is None:
+                entries.pop(message_id, None)
+    
+    
+    def clear(self):
+        """
+        Stops tracking every message and resets the counters.
+        """
+        self._entries.clear()
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+    
+    
+    def get_statistics(self):
+        """
+        Returns the policy's counters.
+        
+        Returns
+        -------
+        statistics : `dict<str, int>`
+        """
+        return {
+            'evictions': self.evictions,
+            'hits': self.hits,
+            'limit': self.limit,
+            'misses': self.misses,
+            'tracked': len(self._entries),
+        }
+    
+    
+    def _evict(self, message_id, channel_id):
+        """
+        Removes the message and the older ones from its channel's message history.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        channel_id : `int`
+            The message's channel's identifier.
+        """
+        channel = CHANNELS.get(channel_id, None)
+        if channel is None:
+            return
+        
+        messages = channel.messages
+        if messages is None:
+            return
+        
+        # The message might have been already removed by the channel's own limit.
+        if messages.get(message_id, None) is None:
+            return
+        
+        # Message histories have to be continuous, so remove the older messages as well.
+        index = messages.relative_index(message_id)
+        while len(messages) > index:
+            self.discard(messages.pop().id)
+            self.evictions += 1
+        
+        channel.message_history_reached_end = False
+
+
+MESSAGE_CACHE_POLICY = MessageCachePolicy(MESSAGE_CACHE_GLOBAL_LIMIT)
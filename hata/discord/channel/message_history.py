@@ -1,6 +1,5 @@
 __all__ = ('message_relative_index',)
 
-from collections import deque
 from datetime import datetime as DateTime, timezone as TimeZone
 from time import time as current_time
 
@@ -9,6 +8,9 @@ from scarletio import LOOP_TIME, WeakReferer
 from ..core import KOKORO
 from ..utils import DATETIME_FORMAT_CODE
 
+from .message_cache_policy import MESSAGE_CACHE_POLICY
+from .message_queue import MessageQueue
+
 
 
 # searches the relative index of a message in a list
@@ -20,7 +22,7 @@ def message_relative_index(messages, message_id):
     
     Parameters
     ----------
-    messages : `deque` of ``Message``
+    messages : ``MessageQueue``, `deque` of ``Message``
         The message history of a channel.
     message_id : `int`
         A messages' id to search.
@@ -29,6 +31,9 @@ def message_relative_index(messages, message_id):
     -------
     index : `int`
     """
+    if isinstance(messages, MessageQueue):
+        return messages.relative_index(message_id)
+    
     bot = 0
     top = len(messages)
     while True:
@@ -144,7 +149,7 @@ class MessageHistory:
     message_history_reached_end : `bool`
         Whether the channel's message's are loaded till their end. If the channel's message history reach it's end
         no requests will be requested to get older messages.
-    messages : `deque` of ``Message`` objects
+    messages : `None`, ``MessageQueue``
         The channel's message history.
     """
     __slots__ = ('_message_keep_limit', '_message_history_collector', 'message_history_reached_end', 'messages',)
@@ -174,17 +179,15 @@ class MessageHistory:
             The amount of messages to keep.
         """
         if self._message_keep_limit != message_keep_limit:
+            old_messages = self.messages
             if message_keep_limit == 0:
                 new_messages = None
             else:
-                old_messages = self.messages
                 if old_messages is None:
                     new_messages = None
                 else:
-                    new_messages = deque(
-                        (old_messages[i] for i in range(min(message_keep_limit, len(old_messages)))),
-                        maxlen = message_keep_limit,
-                    )
+                    new_messages = MessageQueue(old_messages, message_keep_limit)
             
+            MESSAGE_CACHE_POLICY.discard_dropped(old_messages, new_messages)
             self.messages = new_messages
             self._message_keep_limit = message_keep_limit
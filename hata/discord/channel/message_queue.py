@@ -0,0 +1,692 @@
+__all__ = ('MessageQueue',)
+
+from bisect import bisect_left
+
+from scarletio import RichAttributeErrorBaseType
+
+
+MESSAGE_QUEUE_BLOCK_LOAD = 256
+
+
+class MessageQueue(RichAttributeErrorBaseType):
+    """
+    Ordered message container used as a channel's message history.
+    
+    Messages are ordered by their identifier, the newest message is at index `0` and the oldest at the end, same as
+    the `deque` used before. Instead of a `deque`, messages are stored in a blocked list, what allows `O(log n)`
+    positional access, insertion and removal, meanwhile a lookup by message identifier is `O(1)`.
+    
+    The container implements the subset of `deque`'s interface used on message histories, but the position of an
+    inserted message is always decided by its identifier.
+    
+    Attributes
+    ----------
+    _block_keys : `list<list<int>>`
+        The negated message identifiers for each block.
+    _blocks : `list<list<Message>>`
+        Blocks of messages.
+    _by_id : `dict<int, Message>`
+        Message identifier to message relation.
+    _index_tree : `None | list<int>`
+        Binary indexed tree over the blocks' lengths. Set as `None` if the blocks were restructured.
+    _maxes : `list<int>`
+        The last key of each block.
+    maxlen : `None | int`
+        The maximal amount of messages the container can hold.
+    """
+    __slots__ = ('_block_keys', '_blocks', '_by_id', '_index_tree', '_maxes', 'maxlen')
+    
+    def __new__(cls, messages = None, maxlen = None):
+        """
+        Creates a new message queue.
+        
+        Parameters
+        ----------
+        messages : `None | iterable<Message>` = `None`, Optional
+            Messages to create the queue with.
+        
+        maxlen : `None | int` = `None`, Optional
+            The maximal amount of messages the container can hold. If more messages are given, the oldest ones are
+            dropped.
+        """
+        self = object.__new__(cls)
+        self._block_keys = []
+        self._blocks = []
+        self._by_id = {}
+        self._index_tree = None
+        self._maxes = []
+        self.maxlen = maxlen
+        
+        if (messages is not None):
+            self._extend(messages)
+        
+        return self
+    
+    
+    def _extend(self, messages):
+        """
+        Fills up the empty message queue with the given messages.
+        
+        Parameters
+        ----------
+        messages : `iterable<Message>`
+            Messages to add.
+        """
+        by_id = self._by_id
+        for message in messages:
+            by_id[message.id] = message
+        
+        ordered = sorted(by_id.values(), key = _get_message_queue_key)
+        
+        maxlen = self.maxlen
+        if (maxlen is not None) and (len(ordered) > maxlen):
+            for message in ordered[maxlen:]:
+                del by_id[message.id]
+            
+            del ordered[maxlen:]
+        
+        blocks = self._blocks
+        block_keys = self._block_keys
+        maxes = self._maxes
+        
+        for start in range(0, len(ordered), MESSAGE_QUEUE_BLOCK_LOAD):
+            block = ordered[start : start + MESSAGE_QUEUE_BLOCK_LOAD]
+            keys = [-message.id for message in block]
+            blocks.append(block)
+            block_keys.append(keys)
+            maxes.append(keys[-1])
+    
+    
+    def __repr__(self):
+        """Returns the message queue's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' length = ')
+        repr_parts.append(repr(len(self)))
+        
+        maxlen = self.maxlen
+        if (maxlen is not None):
+            repr_parts.append(', maxlen = ')
+            repr_parts.append(repr(maxlen))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns the message queue's length."""
+        return len(self._by_id)
+    
+    
+    def __iter__(self):
+        """Iterates over the messages of the queue, from the newest to the oldest."""
+        for block in self._blocks:
+            yield from block
+    
+    
+    def __reversed__(self):
+        """Iterates over the messages of the queue, from the oldest to the newest."""
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+    
+    
+    def __contains__(self, message):
+        """Returns whether the message is in the queue."""
+        try:
+            message_id = message.id
+        except AttributeError:
+            return False
+        
+        other = self._by_id.get(message_id, None)
+        return (other is not None) and (other == message)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two message queues are equal."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if len(self) != len(other):
+            return False
+        
+        for message_0, message_1 in zip(self, other):
+            if message_0 is not message_1:
+                return False
+        
+        return True
+    
+    
+    __hash__ = None
+    
+    
+    def __getitem__(self, index):
+        """Returns the message at the given index."""
+        block_index, position = self._locate_index(index)
+        return self._blocks[block_index][position]
+    
+    
+    def __delitem__(self, index):
+        """Removes the message at the given index."""
+        block_index, position = self._locate_index(index)
+        self._delete(block_index, position)
+    
+    
+    def copy(self):
+        """
+        Copies the message queue.
+        
+        Returns
+        -------
+        new : `instance<type<self>>`
+        """
+        new = object.__new__(type(self))
+        new._block_keys = [keys.copy() for keys in self._block_keys]
+        new._blocks = [block.copy() for block in self._blocks]
+        new._by_id = self._by_id.copy()
+        new._index_tree = None
+        new._maxes = self._maxes.copy()
+        new.maxlen = self.maxlen
+        return new
+    
+    
+    __copy__ = copy
+    
+    
+    def clear(self):
+        """
+        Removes all the messages from the queue.
+        """
+        self._block_keys.clear()
+        self._blocks.clear()
+        self._by_id.clear()
+        self._index_tree = None
+        self._maxes.clear()
+    
+    
+    def get(self, message_id, default = None):
+        """
+        Returns the message for the given identifier.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        
+        default : `object` = `None`, Optional
+            Default value to return if the message is not found.
+        
+        Returns
+        -------
+        message : ``Message``, `default`
+        """
+        return self._by_id.get(message_id, default)
+    
+    
+    def relative_index(self, message_id):
+        """
+        Returns the relative index of the given message identifier. If the message is not in the queue, returns
+        the index where it should be.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        
+        Returns
+        -------
+        index : `int`
+        """
+        block_index, position = self._locate_key(-message_id)
+        return self._get_block_offset(block_index) + position
+    
+    
+    def add(self, message):
+        """
+        Adds the message to the queue at its ordered position.
+        
+        If the message is already in the queue it is not added again. If the queue is full, the oldest message is
+        dropped, or if the new message would be the oldest, it is not added.
+        
+        Parameters
+        ----------
+        message : ``Message``
+            The message to add.
+        
+        Returns
+        -------
+        added : `bool`
+            Whether the message was added.
+        
+        dropped : `None | Message`
+            The oldest message if it was dropped to make space.
+        """
+        message_id = message.id
+        by_id = self._by_id
+        if message_id in by_id:
+            return False, None
+        
+        maxlen = self.maxlen
+        if (maxlen is not None) and (len(by_id) >= maxlen):
+            if (not maxlen) or (-message_id > self._maxes[-1]):
+                return False, None
+            
+            dropped = self._delete(len(self._blocks) - 1, len(self._blocks[-1]) - 1)
+        else:
+            dropped = None
+        
+        self._insert(message)
+        return True, dropped
+    
+    
+    def pop_by_id(self, message_id):
+        """
+        Removes the message with the given identifier from the queue.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        
+        Returns
+        -------
+        message : `None | Message`
+        """
+        if message_id not in self._by_id:
+            return None
+        
+        block_index, position = self._locate_key(-message_id)
+        return self._delete(block_index, position)
+    
+    
+    # deque compatibility
+    
+    def append(self, message):
+        """
+        Adds the message to the queue. If the queue is full, drops the newest message, like `deque.append`.
+        
+        Parameters
+        ----------
+        message : ``Message``
+            The message to add.
+        """
+        if message.id in self._by_id:
+            return
+        
+        maxlen = self.maxlen
+        if (maxlen is not None) and (len(self) >= maxlen):
+            if not maxlen:
+                return
+            
+            self._delete(0, 0)
+        
+        self._insert(message)
+    
+    
+    def appendleft(self, message):
+        """
+        Adds the message to the queue. If the queue is full, drops the oldest message, like `deque.appendleft`.
+        
+        Parameters
+        ----------
+        message : ``Message``
+            The message to add.
+        """
+        if message.id in self._by_id:
+            return
+        
+        maxlen = self.maxlen
+        if (maxlen is not None) and (len(self) >= maxlen):
+            if not maxlen:
+                return
+            
+            self._delete(len(self._blocks) - 1, len(self._blocks[-1]) - 1)
+        
+        self._insert(message)
+    
+    
+    def insert(self, index, message):
+        """
+        Inserts the message into the queue. The position is decided by the message's identifier, so `index` is
+        ignored.
+        
+        Parameters
+        ----------
+        index : `int`
+            Index, kept for `deque` compatibility.
+        
+        message : ``Message``
+            The message to add.
+        
+        Raises
+        ------
+        IndexError
+            - If the queue is full.
+        """
+        if message.id in self._by_id:
+            return
+        
+        maxlen = self.maxlen
+        if (maxlen is not None) and (len(self) >= maxlen):
+            raise IndexError(f'{type(self).__name__} already at its maximum size')
+        
+        self._insert(message)
+    
+    
+    def pop(self):
+        """
+        Removes and returns the oldest message.
+        
+        Returns
+        -------
+        message : ``Message``
+        
+        Raises
+        ------
+        IndexError
+            - If the queue is empty.
+        """
+        blocks = self._blocks
+        if not blocks:
+            raise IndexError(f'pop from an empty {type(self).__name__}')
+        
+        return self._delete(len(blocks) - 1, len(blocks[-1]) - 1)
+    
+    
+    def popleft(self):
+        """
+        Removes and returns the newest message.
+        
+        Returns
+        -------
+        message : ``Message``
+        
+        Raises
+        ------
+        IndexError
+            - If the queue is empty.
+        """
+        if not self._blocks:
+            raise IndexError(f'pop from an empty {type(self).__name__}')
+        
+        return self._delete(0, 0)
+    
+    
+    # internals
+    
+    def _locate_key(self, key):
+        """
+        Returns the block index and the position inside of it for the given key.
+        
+        Parameters
+        ----------
+        key : `int`
+            Negated message identifier.
+        
+        Returns
+        -------
+        block_index : `int`
+        position : `int`
+        """
+        maxes = self._maxes
+        if not maxes:
+            return 0, 0
+        
+        block_index = bisect_left(maxes, key)
+        if block_index == len(maxes):
+            block_index -= 1
+            return block_index, len(self._block_keys[block_index])
+        
+        return block_index, bisect_left(self._block_keys[block_index], key)
+    
+    
+    def _locate_index(self, index):
+        """
+        Returns the block index and the position inside of it for the given index.
+        
+        Parameters
+        ----------
+        index : `int`
+            Index of a message.
+        
+        Returns
+        -------
+        block_index : `int`
+        position : `int`
+        
+        Raises
+        ------
+        TypeError
+            - If `index` is not `int`.
+        IndexError
+            - If `index` is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError(f'{type(self).__name__} indices must be integers, got {type(index).__name__}; {index!r}.')
+        
+        length = len(self)
+        if index < 0:
+            index += length
+        
+        if index < 0 or index >= length:
+            raise IndexError(f'{type(self).__name__} index out of range')
+        
+        blocks = self._blocks
+        
+        # Fast paths for both ends, as they are the most common ones.
+        first_block_length = len(blocks[0])
+        if index < first_block_length:
+            return 0, index
+        
+        last_block_length = len(blocks[-1])
+        if index >= length - last_block_length:
+            return len(blocks) - 1, index - (length - last_block_length)
+        
+        index_tree = self._get_index_tree()
+        
+        # Binary indexed tree search for the block.
+        block_count = len(blocks)
+        position = 0
+        step = 1 << block_count.bit_length()
+        while step:
+            next_position = position + step
+            if next_position <= block_count and index_tree[next_position] <= index:
+                position = next_position
+                index -= index_tree[next_position]
+            
+            step >>= 1
+        
+        return position, index
+    
+    
+    def _get_index_tree(self):
+        """
+        Returns the binary indexed tree of the blocks' lengths, building it if required.
+        
+        Returns
+        -------
+        index_tree : `list<int>`
+        """
+        index_tree = self._index_tree
+        if index_tree is None:
+            blocks = self._blocks
+            block_count = len(blocks)
+            index_tree = [0] * (block_count + 1)
+            for block_index in range(block_count):
+                position = block_index + 1
+                index_tree[position] += len(blocks[block_index])
+                parent = position + (position & -position)
+                if parent <= block_count:
+                    index_tree[parent] += index_tree[position]
+            
+            self._index_tree = index_tree
+        
+        return index_tree
+    
+    
+    def _update_index_tree(self, block_index, delta):
+        """
+        Updates the binary indexed tree after a block's length changed.
+        
+        Parameters
+        ----------
+        block_index : `int`
+            The changed block's index.
+        delta : `int`
+            Length difference.
+        """
+        index_tree = self._index_tree
+        if index_tree is None:
+            return
+        
+        block_count = len(index_tree) - 1
+        position = block_index + 1
+        while position <= block_count:
+            index_tree[position] += delta
+            position += position & -position
+    
+    
+    def _get_block_offset(self, block_index):
+        """
+        Returns the amount of messages before the given block.
+        
+        Parameters
+        ----------
+        block_index : `int`
+            The block's index.
+        
+        Returns
+        -------
+        offset : `int`
+        """
+        if not block_index:
+            return 0
+        
+        index_tree = self._get_index_tree()
+        offset = 0
+        position = block_index
+        while position:
+            offset += index_tree[position]
+            position -= position & -position
+        
+        return offset
+    
+    
+    def _insert(self, message):
+        """
+        Inserts the message at its ordered position. The message should not be in the queue.
+        
+        Parameters
+        ----------
+        message : ``Message``
+            The message to insert.
+        """
+        message_id = message.id
+        key = -message_id
+        self._by_id[message_id] = message
+        
+        blocks = self._blocks
+        block_keys = self._block_keys
+        maxes = self._maxes
+        
+        if not blocks:
+            blocks.append([message])
+            block_keys.append([key])
+            maxes.append(key)
+            self._index_tree = None
+            return
+        
+        block_index = bisect_left(maxes, key)
+        if block_index == len(maxes):
+            block_index -= 1
+            block = blocks[block_index]
+            keys = block_keys[block_index]
+            block.append(message)
+            keys.append(key)
+            maxes[block_index] = key
+        
+        else:
+            block = blocks[block_index]
+            keys = block_keys[block_index]
+            position = bisect_left(keys, key)
+            block.insert(position, message)
+            keys.insert(position, key)
+        
+        self._update_index_tree(block_index, 1)
+        
+        if len(block) > (MESSAGE_QUEUE_BLOCK_LOAD << 1):
+            blocks.insert(block_index + 1, block[MESSAGE_QUEUE_BLOCK_LOAD:])
+            block_keys.insert(block_index + 1, keys[MESSAGE_QUEUE_BLOCK_LOAD:])
+            del block[MESSAGE_QUEUE_BLOCK_LOAD:]
+            del keys[MESSAGE_QUEUE_BLOCK_LOAD:]
+            maxes.insert(block_index, keys[-1])
+            self._index_tree = None
+    
+    
+    def _delete(self, block_index, position):
+        """
+        Deletes the message at the given position.
+        
+        Parameters
+        ----------
+        block_index : `int`
+            The block's index.
+        position : `int`
+            Position inside of the block.
+        
+        Returns
+        -------
+        message : ``Message``
+        """
+        blocks = self._blocks
+        block_keys = self._block_keys
+        maxes = self._maxes
+        
+        block = blocks[block_index]
+        keys = block_keys[block_index]
+        
+        message = block.pop(position)
+        del keys[position]
+        del self._by_id[message.id]
+        
+        if not block:
+            del blocks[block_index]
+            del block_keys[block_index]
+            del maxes[block_index]
+            self._index_tree = None
+            return message
+        
+        if position == len(block):
+            maxes[block_index] = keys[-1]
+        
+        self._update_index_tree(block_index, -1)
+        
+        # Merge small blocks into their neighbour to keep the amount of blocks low.
+        if (len(block) < (MESSAGE_QUEUE_BLOCK_LOAD >> 1)) and (len(blocks) > 1):
+            if block_index == len(blocks) - 1:
+                block_index -= 1
+            
+            blocks[block_index].extend(blocks[block_index + 1])
+            block_keys[block_index].extend(block_keys[block_index + 1])
+            maxes[block_index] = maxes[block_index + 1]
+            del blocks[block_index + 1]
+            del block_keys[block_index + 1]
+            del maxes[block_index + 1]
+            self._index_tree = None
+        
+        return message
+
+
+def _get_message_queue_key(message):
+    """
+    Returns the sort key of a message inside of a message queue.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The message to get its key of.
+    
+    Returns
+    -------
+    key : `int`
+    """
+    return -message.id
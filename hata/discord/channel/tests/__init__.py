@@ -0,0 +1 @@
+# Only required for relative import support
@@ -0,0 +1,417 @@
+from collections import deque
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+import vampytest
+from scarletio import Task, from_json, skip_ready_cycle
+
+from ...client import Client
+from ...core import CHANNELS
+from ...exceptions import DiscordException, ERROR_CODES
+from ...http import DiscordApiClient
+
+from ..message_archive_iterator import MessageArchiveIterator
+
+
+class TestDiscordApiClient(DiscordApiClient):
+    __slots__ = ('__dict__',)
+    
+    async def discord_request(self, handler, method, url, data = None, query = None, headers = None, reason = None):
+        raise RuntimeError('Real request during testing.')
+
+
+def _assert_fields_set(message_archive_iterator):
+    """
+    Asserts whether every fields are set of a message archive iterator.
+    
+    Parameters
+    ----------
+    message_archive_iterator : ``MessageArchiveIterator``
+        Instance to check.
+    """
+    vampytest.assert_instance(message_archive_iterator, MessageArchiveIterator)
+    vampytest.assert_instance(message_archive_iterator._chunks, deque)
+    vampytest.assert_instance(message_archive_iterator._exception, BaseException, nullable = True)
+    vampytest.assert_instance(message_archive_iterator._exhausted, bool)
+    vampytest.assert_instance(message_archive_iterator._message_datas, deque)
+    vampytest.assert_instance(message_archive_iterator._query, dict)
+    vampytest.assert_instance(message_archive_iterator._request_task, Task, nullable = True)
+    vampytest.assert_instance(message_archive_iterator.after, int)
+    vampytest.assert_instance(message_archive_iterator.before, int)
+    vampytest.assert_instance(message_archive_iterator.channel_id, int)
+    vampytest.assert_instance(message_archive_iterator.client, Client)
+    vampytest.assert_instance(message_archive_iterator.message_count, int)
+    vampytest.assert_instance(message_archive_iterator.oldest_first, bool)
+    vampytest.assert_instance(message_archive_iterator.prefetch, int)
+    vampytest.assert_instance(message_archive_iterator.request_count, int)
+
+
+def _create_client_with_history(client_id, channel_id, message_ids):
+    """
+    Creates a client, which api returns messages from the given history.
+    
+    Parameters
+    ----------
+    client_id : `int`
+        The client's identifier.
+    channel_id : `int`
+        The channel's identifier.
+    message_ids : `list<int>`
+        The messages' identifiers in the channel's history.
+    
+    Returns
+    -------
+    client : ``Client``
+    queries : `list<dict<str, object>>`
+        The requested queries.
+    """
+    queries = []
+    
+    async def mock_message_get_chunk(input_channel_id, input_query):
+        nonlocal channel_id
+        nonlocal message_ids
+        nonlocal queries
+        
+        vampytest.assert_eq(input_channel_id, channel_id)
+        queries.append(input_query.copy())
+        
+        await skip_ready_cycle()
+        
+        limit = input_query['limit']
+        if 'after' in input_query:
+            after = input_query['after']
+            selected = sorted(message_id for message_id in message_ids if message_id > after)[:limit]
+        else:
+            before = input_query.get('before', 0)
+            selected = sorted(
+                (message_id for message_id in message_ids if (not before) or (message_id < before)), reverse = True,
+            )[:limit]
+        
+        return [{'id': str(message_id), 'content': 'orin'} for message_id in sorted(selected, reverse = True)]
+    
+    api = TestDiscordApiClient(True, 'token_' + str(client_id))
+    api.message_get_chunk = mock_message_get_chunk
+    
+    client = Client(
+        token = 'token_' + str(client_id),
+        api = api,
+        client_id = client_id,
+    )
+    
+    return client, queries
+
+
+def test__MessageArchiveIterator__new__min_fields():
+    """
+    Tests whether ``MessageArchiveIterator.__new__`` works as intended.
+    
+    Case: minimal amount of fields given.
+    """
+    client_id = 202610170300
+    channel_id = 202610170301
+    
+    client = Client(
+        token = 'token_' + str(client_id),
+        client_id = client_id,
+    )
+    
+    try:
+        message_archive_iterator = MessageArchiveIterator(client, channel_id)
+        _assert_fields_set(message_archive_iterator)
+        
+        vampytest.assert_eq(message_archive_iterator._query, {'limit': 100})
+        vampytest.assert_is(message_archive_iterator.client, client)
+        vampytest.assert_eq(message_archive_iterator.channel_id, channel_id)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__MessageArchiveIterator__new__max_fields():
+    """
+    Tests whether ``MessageArchiveIterator.__new__`` works as intended.
+    
+    Case: maximal amount of fields given.
+    """
+    client_id = 202610170302
+    channel_id = 202610170303
+    after = 202610170304
+    before = 202610170305
+    converter = str
+    oldest_first = True
+    prefetch = 1
+    
+    client = Client(
+        token = 'token_' + str(client_id),
+        client_id = client_id,
+    )
+    
+    try:
+        message_archive_iterator = MessageArchiveIterator(
+            client,
+            channel_id,
+            after = after,
+            before = before,
+            converter = converter,
+            oldest_first = oldest_first,
+            prefetch = prefetch,
+        )
+        _assert_fields_set(message_archive_iterator)
+        
+        vampytest.assert_eq(message_archive_iterator._query, {'limit': 100, 'after': after})
+        vampytest.assert_eq(message_archive_iterator.after, after)
+        vampytest.assert_eq(message_archive_iterator.before, before)
+        vampytest.assert_is(message_archive_iterator.converter, converter)
+        vampytest.assert_eq(message_archive_iterator.oldest_first, oldest_first)
+        vampytest.assert_eq(message_archive_iterator.prefetch, prefetch)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def _iter_options__new__invalid():
+    yield 'prefetch type incorrect', {'prefetch': 'koishi'}, TypeError
+    yield 'prefetch value incorrect', {'prefetch': 0}, ValueError
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__invalid()).named_first().returning_last())
+def test__MessageArchiveIterator__new__invalid(keyword_parameters):
+    """
+    Tests whether ``MessageArchiveIterator.__new__`` works as intended.
+    
+    Case: invalid parameters.
+    
+    Parameters
+    ----------
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the iterator with.
+    
+    Returns
+    -------
+    exception_type : `type<BaseException>`
+    """
+    client_id = 202610170306
+    
+    client = Client(
+        token = 'token_' + str(client_id),
+        client_id = client_id,
+    )
+    
+    try:
+        try:
+            MessageArchiveIterator(client, 202610170307, **keyword_parameters)
+        except (TypeError, ValueError) as err:
+            return type(err)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__MessageArchiveIterator__repr():
+    """
+    Tests whether ``MessageArchiveIterator.__repr__`` works as intended.
+    """
+    client_id = 202610170308
+    
+    client = Client(
+        token = 'token_' + str(client_id),
+        client_id = client_id,
+    )
+    
+    try:
+        message_archive_iterator = MessageArchiveIterator(client, 202610170309)
+        
+        output = repr(message_archive_iterator)
+        vampytest.assert_instance(output, str)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__MessageArchiveIterator__aiter__newest_first():
+    """
+    Tests whether ``MessageArchiveIterator.__aiter__`` works as intended.
+    
+    Case: newest first, bounded by `after`.
+    
+    This function is a coroutine.
+    """
+    client_id = 202610170310
+    channel_id = 202610170311
+    message_ids = [*range(202610170400, 202610170650)]
+    after = 202610170410
+    
+    client, queries = _create_client_with_history(client_id, channel_id, message_ids)
+    
+    try:
+        message_archive_iterator = MessageArchiveIterator(client, channel_id, after = after)
+        
+        output = [int(message_data['id']) async for message_data in message_archive_iterator]
+        
+        vampytest.assert_eq(
+            output,
+            sorted((message_id for message_id in message_ids if message_id > after), reverse = True),
+        )
+        vampytest.assert_eq(message_archive_iterator.message_count, len(output))
+        vampytest.assert_eq(message_archive_iterator.request_count, 3)
+        vampytest.assert_eq(
+            queries,
+            [
+                {'limit': 100},
+                {'limit': 100, 'before': 202610170550},
+                {'limit': 100, 'before': 202610170450},
+            ],
+        )
+        
+        # Channel cache is not touched
+        vampytest.assert_not_in(channel_id, CHANNELS)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__MessageArchiveIterator__aiter__oldest_first():
+    """
+    Tests whether ``MessageArchiveIterator.__aiter__`` works as intended.
+    
+    Case: oldest first, bounded by `before`, with converter.
+    
+    This function is a coroutine.
+    """
+    client_id = 202610170312
+    channel_id = 202610170313
+    message_ids = [*range(202610170400, 202610170650)]
+    before = 202610170520
+    
+    client, queries = _create_client_with_history(client_id, channel_id, message_ids)
+    
+    try:
+        message_archive_iterator = MessageArchiveIterator(
+            client,
+            channel_id,
+            before = before,
+            converter = lambda message_data: int(message_data['id']),
+            oldest_first = True,
+        )
+        
+        output = [message_id async for message_id in message_archive_iterator]
+        
+        vampytest.assert_eq(output, [message_id for message_id in message_ids if message_id < before])
+        vampytest.assert_eq(message_archive_iterator.request_count, 2)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__MessageArchiveIterator__prefetch():
+    """
+    Tests whether ``MessageArchiveIterator`` requests ahead of the consumer.
+    
+    This function is a coroutine.
+    """
+    client_id = 202610170314
+    channel_id = 202610170315
+    message_ids = [*range(202610170400, 202610170900)]
+    
+    client, queries = _create_client_with_history(client_id, channel_id, message_ids)
+    
+    try:
+        message_archive_iterator = MessageArchiveIterator(client, channel_id, prefetch = 2)
+        
+        await message_archive_iterator.__anext__()
+        for _ in range(10):
+            await skip_ready_cycle()
+        
+        # 1 consumed + 2 prefetched
+        vampytest.assert_eq(message_archive_iterator.request_count, 3)
+        vampytest.assert_eq(len(message_archive_iterator._chunks), 2)
+        
+        message_archive_iterator.close()
+        vampytest.assert_true(message_archive_iterator._exhausted)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__MessageArchiveIterator__aiter__error():
+    """
+    Tests whether ``MessageArchiveIterator.__aiter__`` works as intended.
+    
+    Case: request errors.
+    
+    This function is a coroutine.
+    """
+    client_id = 202610170316
+    channel_id = 202610170317
+    
+    async def mock_message_get_chunk(input_channel_id, input_query):
+        exception = DiscordException(None, None, None, None)
+        exception.code = ERROR_CODES.missing_access
+        raise exception
+    
+    api = TestDiscordApiClient(True, 'token_' + str(client_id))
+    api.message_get_chunk = mock_message_get_chunk
+    
+    client = Client(
+        token = 'token_' + str(client_id),
+        api = api,
+        client_id = client_id,
+    )
+    
+    try:
+        message_archive_iterator = MessageArchiveIterator(client, channel_id)
+        output = [message_data async for message_data in message_archive_iterator]
+        vampytest.assert_eq(output, [])
+        
+        api.message_get_chunk = None
+        message_archive_iterator = MessageArchiveIterator(client, channel_id)
+        with vampytest.assert_raises(TypeError):
+            await message_archive_iterator.__anext__()
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__MessageArchiveIterator__export():
+    """
+    Tests whether ``MessageArchiveIterator.export`` works as intended.
+    
+    This function is a coroutine.
+    """
+    client_id = 202610170318
+    channel_id = 202610170319
+    message_ids = [*range(202610170400, 202610170650)]
+    
+    client, queries = _create_client_with_history(client_id, channel_id, message_ids)
+    
+    try:
+        message_archive_iterator = MessageArchiveIterator(client, channel_id, oldest_first = True)
+        
+        first = await message_archive_iterator.__anext__()
+        
+        with TemporaryDirectory() as directory_path:
+            path = join_paths(directory_path, 'archive.jsonl')
+            output = await message_archive_iterator.export(path)
+            
+            with open(path, 'r', encoding = 'utf-8') as file:
+                lines = file.read().splitlines()
+        
+        vampytest.assert_eq(output, len(message_ids) - 1)
+        vampytest.assert_eq(
+            [int(from_json(line)['id']) for line in lines],
+            message_ids[1:],
+        )
+        vampytest.assert_eq(int(first['id']), message_ids[0])
+        vampytest.assert_eq(message_archive_iterator.message_count, len(message_ids))
+    
+    finally:
+        client._delete()
+        client = None
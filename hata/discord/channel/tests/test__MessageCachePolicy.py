@@ -0,0 +1,425 @@
+import vampytest
+
+from ...message import Message
+
+from ..channel import Channel, ChannelType
+from ..message_cache_policy import MESSAGE_CACHE_POLICY, MessageCachePolicy
+from ..message_queue import MessageQueue
+
+
+def _assert_fields_set(message_cache_policy):
+    """
+    Asserts whether every attribute is set of the given message cache policy.
+    
+    Parameters
+    ----------
+    message_cache_policy : ``MessageCachePolicy``
+        The message cache policy to check.
+    """
+    vampytest.assert_instance(message_cache_policy, MessageCachePolicy)
+    vampytest.assert_instance(message_cache_policy._entries, dict)
+    vampytest.assert_instance(message_cache_policy.evictions, int)
+    vampytest.assert_instance(message_cache_policy.hits, int)
+    vampytest.assert_instance(message_cache_policy.limit, int)
+    vampytest.assert_instance(message_cache_policy.misses, int)
+
+
+def test__MessageCachePolicy__new():
+    """
+    Tests whether ``MessageCachePolicy.__new__`` works as intended.
+    """
+    limit = 20
+    
+    message_cache_policy = MessageCachePolicy(limit)
+    _assert_fields_set(message_cache_policy)
+    
+    vampytest.assert_eq(message_cache_policy.limit, limit)
+    vampytest.assert_eq(len(message_cache_policy), 0)
+
+
+def test__MessageCachePolicy__repr():
+    """
+    Tests whether ``MessageCachePolicy.__repr__`` works as intended.
+    """
+    message_cache_policy = MessageCachePolicy(20)
+    
+    output = repr(message_cache_policy)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in('limit = 20', output)
+
+
+def test__MessageCachePolicy__get():
+    """
+    Tests whether ``MessageCachePolicy.get`` works as intended.
+    """
+    message = Message.precreate(202410170300)
+    
+    message_cache_policy = MessageCachePolicy(20)
+    
+    output = message_cache_policy.get(202410170300)
+    vampytest.assert_is(output, message)
+    
+    output = message_cache_policy.get(202410170301)
+    vampytest.assert_is(output, None)
+    
+    vampytest.assert_eq(message_cache_policy.hits, 1)
+    vampytest.assert_eq(message_cache_policy.misses, 1)
+
+
+def test__MessageCachePolicy__track__no_limit():
+    """
+    Tests whether ``MessageCachePolicy.track`` works as intended.
+    
+    Case: No limit.
+    """
+    message = Message.precreate(202410170310, channel_id = 202410170311)
+    
+    message_cache_policy = MessageCachePolicy(0)
+    message_cache_policy.track(message)
+    
+    vampytest.assert_eq(len(message_cache_policy), 0)
+
+
+def test__MessageCachePolicy__track__evict():
+    """
+    Tests whether ``MessageCachePolicy.track`` works as intended.
+    
+    Case: Limit exceeded, evicting across channels.
+    """
+    channel_id_0 = 202410170320
+    channel_id_1 = 202410170321
+    
+    message_0 = Message.precreate(202410170322, channel_id = channel_id_0)
+    message_1 = Message.precreate(202410170323, channel_id = channel_id_1)
+    message_2 = Message.precreate(202410170324, channel_id = channel_id_0)
+    message_3 = Message.precreate(202410170325, channel_id = channel_id_1)
+    
+    channel_0 = Channel.precreate(channel_id_0, channel_type = ChannelType.guild_text)
+    channel_0.messages = MessageQueue([message_0, message_2], 10)
+    channel_1 = Channel.precreate(channel_id_1, channel_type = ChannelType.guild_text)
+    channel_1.messages = MessageQueue([message_1, message_3], 10)
+    
+    message_cache_policy = MessageCachePolicy(3)
+    for message in (message_0, message_1, message_2):
+        message_cache_policy.track(message)
+    
+    # Touching `message_0` makes `message_1` the least recently used one.
+    message_cache_policy.get(message_0.id)
+    message_cache_policy.track(message_3)
+    
+    vampytest.assert_eq(len(message_cache_policy), 3)
+    vampytest.assert_eq(message_cache_policy.evictions, 1)
+    vampytest.assert_eq([*channel_0.messages], [message_2, message_0])
+    vampytest.assert_eq([*channel_1.messages], [message_3])
+
+
+def test__MessageCachePolicy__track__evict_older():
+    """
+    Tests whether ``MessageCachePolicy.track`` works as intended.
+    
+    Case: Evicting a message removes the older ones of the same channel as well.
+    """
+    channel_id = 202410170330
+    
+    message_0 = Message.precreate(202410170331, channel_id = channel_id)
+    message_1 = Message.precreate(202410170332, channel_id = channel_id)
+    message_2 = Message.precreate(202410170333, channel_id = channel_id)
+    
+    channel = Channel.precreate(channel_id, channel_type = ChannelType.guild_text)
+    channel.messages = MessageQueue([message_0, message_1, message_2], 10)
+    
+    message_cache_policy = MessageCachePolicy(2)
+    message_cache_policy.track(message_1)
+    message_cache_policy.track(message_2)
+    message_cache_policy.track(message_0)
+    
+    vampytest.assert_eq(message_cache_policy.evictions, 2)
+    vampytest.assert_eq(len(message_cache_policy), 1)
+    vampytest.assert_eq([*channel.messages], [message_2])
+    vampytest.assert_false(channel.message_history_reached_end)
+
+
+def test__MessageCachePolicy__discard():
+    """
+    Tests whether ``MessageCachePolicy.discard`` works as intended.
+    """
+    message = Message.precreate(202410170340, channel_id = 202410170341)
+    
+    message_cache_policy = MessageCachePolicy(20)
+    message_cache_policy.track(message)
+    message_cache_policy.discard(message.id)
+    message_cache_policy.discard(message.id)
+    
+    vampytest.assert_eq(len(message_cache_policy), 0)
+
+
+def test__MessageCachePolicy__get_statistics():
+    """
+    Tests whether ``MessageCachePolicy.get_statistics`` works as intended.
+    """
+    message_cache_policy = MessageCachePolicy(20)
+    message_cache_policy.get(202410170350)
+    
+    output = message_cache_policy.get_statistics()
+    vampytest.assert_instance(output, dict)
+    vampytest.assert_eq(
+        output,
+        {
+            'evictions': 0,
+            'hits': 0,
+            'limit': 20,
+            'misses': 1,
+            'tracked': 0,
+        },
+    )
+
+
+def test__MessageCachePolicy__channel_maxlen():
+    """
+    Tests whether the messages dropped by their channel's own message limit are not tracked anymore.
+    """
+    channel_id = 202410170350
+    
+    message_0 = Message.precreate(202410170351, channel_id = channel_id)
+    message_1 = Message.precreate(202410170352, channel_id = channel_id)
+    
+    channel = Channel.precreate(channel_id, channel_type = ChannelType.guild_text)
+    channel.messages = MessageQueue([message_0, message_1], 2)
+    
+    limit = MESSAGE_CACHE_POLICY.limit
+    MESSAGE_CACHE_POLICY.limit = 20
+    try:
+        MESSAGE_CACHE_POLICY.track(message_0)
+        MESSAGE_CACHE_POLICY.track(message_1)
+        
+        message_2 = channel._create_new_message({'id': str(202410170353), 'channel_id': str(channel_id)})
+        
+        vampytest.assert_eq([*channel.messages], [message_2, message_1])
+        vampytest.assert_not_in(message_0.id, MESSAGE_CACHE_POLICY._entries)
+        vampytest.assert_in(message_1.id, MESSAGE_CACHE_POLICY._entries)
+        vampytest.assert_in(message_2.id, MESSAGE_CACHE_POLICY._entries)
+    finally:
+        MESSAGE_CACHE_POLICY.clear()
+        MESSAGE_CACHE_POLICY.limit = limit
+
+
+def test__MessageCachePolicy__track_old():
+    """
+    Tests whether ``MessageCachePolicy.track_old`` works as intended.
+    
+    Case: Old messages are evicted before the other ones.
+    """
+    channel_id = 202610171200
+    
+    message_0 = Message.precreate(202610171201, channel_id = channel_id)
+    message_1 = Message.precreate(202610171202, channel_id = channel_id)
+    message_2 = Message.precreate(202610171203, channel_id = channel_id)
+    
+    channel = Channel.precreate(channel_id, channel_type = ChannelType.guild_text)
+    channel.messages = MessageQueue([message_0, message_1, message_2], 10)
+    
+    message_cache_policy = MessageCachePolicy(2)
+    message_cache_policy.track(message_2)
+    message_cache_policy.track_old(message_1)
+    message_cache_policy.track_old(message_0)
+    
+    vampytest.assert_eq(message_cache_policy.evictions, 1)
+    vampytest.assert_eq([*message_cache_policy._entries.keys()], [message_1.id, message_2.id])
+    vampytest.assert_eq([*channel.messages], [message_2, message_1])
+
+
+def test__MessageCachePolicy__discard_messages():
+    """
+    Tests whether ``MessageCachePolicy.discard_messages`` works as intended.
+    """
+    channel_id = 202610171210
+    
+    message_0 = Message.precreate(202610171211, channel_id = channel_id)
+    message_1 = Message.precreate(202610171212, channel_id = channel_id)
+    message_2 = Message.precreate(202610171213, channel_id = 202610171214)
+    
+    message_cache_policy = MessageCachePolicy(20)
+    for message in (message_0, message_1, message_2):
+        message_cache_policy.track(message)
+    
+    message_cache_policy.discard_messages(None)
+    message_cache_policy.discard_messages(MessageQueue([message_0, message_1]))
+    
+    vampytest.assert_eq([*message_cache_policy._entries.keys()], [message_2.id])
+
+
+def test__MessageCachePolicy__discard_dropped():
+    """
+    Tests whether ``MessageCachePolicy.discard_dropped`` works as intended.
+    """
+    channel_id = 202610171220
+    
+    message_0 = Message.precreate(202610171221, channel_id = channel_id)
+    message_1 = Message.precreate(202610171222, channel_id = channel_id)
+    message_2 = Message.precreate(202610171223, channel_id = channel_id)
+    
+    old_messages = MessageQueue([message_0, message_1, message_2])
+    new_messages = MessageQueue(old_messages, 2)
+    
+    message_cache_policy = MessageCachePolicy(20)
+    for message in (message_0, message_1, message_2):
+        message_cache_policy.track(message)
+    
+    message_cache_policy.discard_dropped(old_messages, new_messages)
+    vampytest.assert_eq([*message_cache_policy._entries.keys()], [message_1.id, message_2.id])
+    
+    message_cache_policy.discard_dropped(new_messages, None)
+    vampytest.assert_eq(len(message_cache_policy), 0)
+
+
+def _create_tracked_channel(channel_id, message_ids, maxlen):
+    """
+    Creates a channel with messages tracked by ``MESSAGE_CACHE_POLICY``.
+    
+    Parameters
+    ----------
+    channel_id : `int`
+        The channel's identifier.
+    message_ids : `list<int>`
+        The messages' identifiers.
+    maxlen : `None | int`
+        The maximal length of the channel's message history.
+    
+    Returns
+    -------
+    channel : ``Channel``
+    messages : `list<Message>`
+    """
+    messages = [Message.precreate(message_id, channel_id = channel_id) for message_id in message_ids]
+    
+    channel = Channel.precreate(channel_id, channel_type = ChannelType.guild_text)
+    channel.messages = MessageQueue(messages, maxlen)
+    
+    for message in messages:
+        MESSAGE_CACHE_POLICY.track(message)
+    
+    return channel, messages
+
+
+def test__MessageCachePolicy__channel_switch_to_limited():
+    """
+    Tests whether the messages dropped when a channel's message history is switched back to limited are not tracked
+    anymore.
+    """
+    limit = MESSAGE_CACHE_POLICY.limit
+    MESSAGE_CACHE_POLICY.limit = 20
+    try:
+        channel, (message_0, message_1, message_2) = _create_tracked_channel(
+            202610171230, [202610171231, 202610171232, 202610171233], None
+        )
+        channel._message_keep_limit = 2
+        
+        channel._switch_to_limited()
+        
+        vampytest.assert_eq([*channel.messages], [message_2, message_1])
+        vampytest.assert_eq([*MESSAGE_CACHE_POLICY._entries.keys()], [message_1.id, message_2.id])
+    finally:
+        MESSAGE_CACHE_POLICY.clear()
+        MESSAGE_CACHE_POLICY.limit = limit
+
+
+def _iter_options__channel_message_keep_limit():
+    yield 1, 1
+    yield 0, 0
+
+
+@vampytest._(vampytest.call_from(_iter_options__channel_message_keep_limit()).returning_last())
+def test__MessageCachePolicy__channel_message_keep_limit(message_keep_limit):
+    """
+    Tests whether the messages dropped when a channel's message keep limit is decreased are not tracked anymore.
+    
+    Parameters
+    ----------
+    message_keep_limit : `int`
+        The message keep limit to set.
+    
+    Returns
+    -------
+    output : `int`
+    """
+    limit = MESSAGE_CACHE_POLICY.limit
+    MESSAGE_CACHE_POLICY.limit = 20
+    try:
+        channel, messages = _create_tracked_channel(
+            202610171240, [202610171241, 202610171242, 202610171243], 10
+        )
+        
+        channel.message_keep_limit = message_keep_limit
+        
+        channel_messages = channel.messages
+        vampytest.assert_eq(len(MESSAGE_CACHE_POLICY), 0 if channel_messages is None else len(channel_messages))
+        
+        for message in (() if channel_messages is None else channel_messages):
+            vampytest.assert_in(message.id, MESSAGE_CACHE_POLICY._entries)
+        
+        return len(MESSAGE_CACHE_POLICY)
+    finally:
+        MESSAGE_CACHE_POLICY.clear()
+        MESSAGE_CACHE_POLICY.limit = limit
+
+
+def _iter_options__channel_delete():
+    yield lambda channel: channel._delete(None)
+    yield lambda channel: [*channel._iter_delete(None)]
+
+
+@vampytest._(vampytest.call_from(_iter_options__channel_delete()))
+def test__MessageCachePolicy__channel_delete(delete):
+    """
+    Tests whether the messages of a deleted channel are not tracked anymore.
+    
+    Parameters
+    ----------
+    delete : `FunctionType`
+        Deletes the channel.
+    """
+    limit = MESSAGE_CACHE_POLICY.limit
+    MESSAGE_CACHE_POLICY.limit = 20
+    try:
+        channel, messages = _create_tracked_channel(202610171250, [202610171251, 202610171252], 10)
+        other_message = Message.precreate(202610171253, channel_id = 202610171254)
+        MESSAGE_CACHE_POLICY.track(other_message)
+        
+        delete(channel)
+        
+        vampytest.assert_eq([*MESSAGE_CACHE_POLICY._entries.keys()], [other_message.id])
+    finally:
+        MESSAGE_CACHE_POLICY.clear()
+        MESSAGE_CACHE_POLICY.limit = limit
+
+
+def _iter_options__channel_load():
+    yield lambda channel, message_data: channel._create_old_message(message_data)
+    yield lambda channel, message_data: channel._create_find_message(message_data, True)[0]
+
+
+@vampytest._(vampytest.call_from(_iter_options__channel_load()))
+def test__MessageCachePolicy__channel_load(load):
+    """
+    Tests whether the messages loaded into a channel's message history are tracked.
+    
+    Parameters
+    ----------
+    load : `FunctionType`
+        Loads the message.
+    """
+    channel_id = 202610171260
+    
+    limit = MESSAGE_CACHE_POLICY.limit
+    MESSAGE_CACHE_POLICY.limit = 20
+    try:
+        channel, (message_1, ) = _create_tracked_channel(channel_id, [202610171262], 1)
+        
+        message_0 = load(channel, {'id': str(202610171261), 'channel_id': str(channel_id)})
+        
+        vampytest.assert_eq([*channel.messages], [message_1, message_0])
+        vampytest.assert_eq([*MESSAGE_CACHE_POLICY._entries.keys()], [message_0.id, message_1.id])
+    finally:
+        channel._cancel_message_collection()
+        MESSAGE_CACHE_POLICY.clear()
+        MESSAGE_CACHE_POLICY.limit = limit
@@ -0,0 +1,254 @@
+import vampytest
+
+from ...message import Message
+
+from ..message_queue import MESSAGE_QUEUE_BLOCK_LOAD, MessageQueue
+
+
+def _assert_fields_set(message_queue):
+    """
+    Asserts whether every attribute is set of the given message queue.
+    
+    Parameters
+    ----------
+    message_queue : ``MessageQueue``
+        The message queue to check.
+    """
+    vampytest.assert_instance(message_queue, MessageQueue)
+    vampytest.assert_instance(message_queue._block_keys, list)
+    vampytest.assert_instance(message_queue._blocks, list)
+    vampytest.assert_instance(message_queue._by_id, dict)
+    vampytest.assert_instance(message_queue._index_tree, list, nullable = True)
+    vampytest.assert_instance(message_queue._maxes, list)
+    vampytest.assert_instance(message_queue.maxlen, int, nullable = True)
+
+
+def _get_message_ids(message_queue):
+    """
+    Returns the message identifiers of the given message queue in order.
+    
+    Parameters
+    ----------
+    message_queue : ``MessageQueue``
+        The message queue to get the message identifiers of.
+    
+    Returns
+    -------
+    message_ids : `list<int>`
+    """
+    return [message.id for message in message_queue]
+
+
+def test__MessageQueue__new__0():
+    """
+    Tests whether ``MessageQueue.__new__`` works as intended.
+    
+    Case: No fields given.
+    """
+    message_queue = MessageQueue()
+    _assert_fields_set(message_queue)
+    
+    vampytest.assert_eq(len(message_queue), 0)
+    vampytest.assert_is(message_queue.maxlen, None)
+
+
+def test__MessageQueue__new__1():
+    """
+    Tests whether ``MessageQueue.__new__`` works as intended.
+    
+    Case: Messages and limit given.
+    """
+    messages = [Message.precreate(message_id) for message_id in (202410170010, 202410170013, 202410170011)]
+    
+    message_queue = MessageQueue(messages, 2)
+    _assert_fields_set(message_queue)
+    
+    vampytest.assert_eq(message_queue.maxlen, 2)
+    vampytest.assert_eq(_get_message_ids(message_queue), [202410170013, 202410170011])
+
+
+def test__MessageQueue__repr():
+    """
+    Tests whether ``MessageQueue.__repr__`` works as intended.
+    """
+    message_queue = MessageQueue([Message.precreate(202410170020)], 10)
+    
+    output = repr(message_queue)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(message_queue).__name__, output)
+    vampytest.assert_in('length = 1', output)
+    vampytest.assert_in('maxlen = 10', output)
+
+
+def test__MessageQueue__getitem():
+    """
+    Tests whether ``MessageQueue.__getitem__`` works as intended.
+    """
+    message_0 = Message.precreate(202410170030)
+    message_1 = Message.precreate(202410170031)
+    message_2 = Message.precreate(202410170032)
+    
+    message_queue = MessageQueue([message_0, message_1, message_2])
+    
+    vampytest.assert_is(message_queue[0], message_2)
+    vampytest.assert_is(message_queue[1], message_1)
+    vampytest.assert_is(message_queue[-1], message_0)
+    
+    with vampytest.assert_raises(IndexError):
+        message_queue[3]
+
+
+def test__MessageQueue__contains():
+    """
+    Tests whether ``MessageQueue.__contains__`` works as intended.
+    """
+    message_0 = Message.precreate(202410170040)
+    message_1 = Message.precreate(202410170041)
+    
+    message_queue = MessageQueue([message_0])
+    
+    vampytest.assert_in(message_0, message_queue)
+    vampytest.assert_not_in(message_1, message_queue)
+    vampytest.assert_not_in(None, message_queue)
+
+
+def test__MessageQueue__add():
+    """
+    Tests whether ``MessageQueue.add`` works as intended.
+    """
+    message_0 = Message.precreate(202410170050)
+    message_1 = Message.precreate(202410170051)
+    message_2 = Message.precreate(202410170052)
+    message_3 = Message.precreate(202410170053)
+    
+    message_queue = MessageQueue([message_1, message_3], 3)
+    
+    vampytest.assert_eq(message_queue.add(message_2), (True, None))
+    vampytest.assert_eq(_get_message_ids(message_queue), [202410170053, 202410170052, 202410170051])
+    
+    # Already added
+    vampytest.assert_eq(message_queue.add(message_2), (False, None))
+    
+    # Would be the oldest one of a full queue.
+    vampytest.assert_eq(message_queue.add(message_0), (False, None))
+    vampytest.assert_eq(_get_message_ids(message_queue), [202410170053, 202410170052, 202410170051])
+
+
+def test__MessageQueue__add__drops_oldest():
+    """
+    Tests whether ``MessageQueue.add`` works as intended.
+    
+    Case: Full queue, dropping the oldest message.
+    """
+    message_0 = Message.precreate(202410170060)
+    message_1 = Message.precreate(202410170061)
+    message_2 = Message.precreate(202410170062)
+    
+    message_queue = MessageQueue([message_0, message_2], 2)
+    
+    vampytest.assert_eq(message_queue.add(message_1), (True, message_0))
+    vampytest.assert_eq(_get_message_ids(message_queue), [202410170062, 202410170061])
+    vampytest.assert_is(message_queue.get(202410170060), None)
+
+
+def test__MessageQueue__pop_by_id():
+    """
+    Tests whether ``MessageQueue.pop_by_id`` works as intended.
+    """
+    message_0 = Message.precreate(202410170070)
+    message_1 = Message.precreate(202410170071)
+    
+    message_queue = MessageQueue([message_0, message_1])
+    
+    vampytest.assert_is(message_queue.pop_by_id(202410170070), message_0)
+    vampytest.assert_is(message_queue.pop_by_id(202410170070), None)
+    vampytest.assert_eq(_get_message_ids(message_queue), [202410170071])
+
+
+def test__MessageQueue__pop():
+    """
+    Tests whether ``MessageQueue.pop`` and ``MessageQueue.popleft`` works as intended.
+    """
+    message_0 = Message.precreate(202410170080)
+    message_1 = Message.precreate(202410170081)
+    
+    message_queue = MessageQueue([message_0, message_1])
+    
+    vampytest.assert_is(message_queue.pop(), message_0)
+    vampytest.assert_is(message_queue.popleft(), message_1)
+    
+    with vampytest.assert_raises(IndexError):
+        message_queue.pop()
+
+
+def _iter_options__relative_index():
+    message_ids = [202410170090, 202410170092, 202410170094]
+    
+    yield message_ids, 202410170095, 0
+    yield message_ids, 202410170094, 0
+    yield message_ids, 202410170093, 1
+    yield message_ids, 202410170092, 1
+    yield message_ids, 202410170090, 2
+    yield message_ids, 202410170089, 3
+    yield [], 202410170090, 0
+
+
+@vampytest._(vampytest.call_from(_iter_options__relative_index()).returning_last())
+def test__MessageQueue__relative_index(message_ids, message_id):
+    """
+    Tests whether ``MessageQueue.relative_index`` works as intended.
+    
+    Parameters
+    ----------
+    message_ids : `list<int>`
+        Message identifiers to create the queue with.
+    message_id : `int`
+        The message identifier to get its index of.
+    
+    Returns
+    -------
+    output : `int`
+    """
+    message_queue = MessageQueue([Message.precreate(message_id) for message_id in message_ids])
+    output = message_queue.relative_index(message_id)
+    vampytest.assert_instance(output, int)
+    return output
+
+
+def test__MessageQueue__many_messages():
+    """
+    Tests whether ``MessageQueue`` works as intended.
+    
+    Case: Enough messages to split into multiple blocks, inserted and removed out of order.
+    """
+    message_count = MESSAGE_QUEUE_BLOCK_LOAD * 5
+    base_id = 202410170100000
+    message_ids = [base_id + ((index * 7919) % message_count) for index in range(message_count)]
+    
+    message_queue = MessageQueue()
+    for message_id in message_ids:
+        message_queue.add(Message.precreate(message_id))
+    
+    expected_message_ids = sorted(message_ids, reverse = True)
+    vampytest.assert_eq(_get_message_ids(message_queue), expected_message_ids)
+    vampytest.assert_true(len(message_queue._blocks) > 1)
+    
+    for index in (0, 1, MESSAGE_QUEUE_BLOCK_LOAD, message_count // 2, message_count - 1):
+        vampytest.assert_eq(message_queue[index].id, expected_message_ids[index])
+        vampytest.assert_eq(message_queue.relative_index(expected_message_ids[index]), index)
+    
+    for message_id in message_ids[::2]:
+        message_queue.pop_by_id(message_id)
+    
+    expected_message_ids = sorted(message_ids[1::2], reverse = True)
+    vampytest.assert_eq(_get_message_ids(message_queue), expected_message_ids)
+    vampytest.assert_eq(len(message_queue), len(expected_message_ids))
+    
+    for index in range(0, len(expected_message_ids), 97):
+        vampytest.assert_eq(message_queue[index].id, expected_message_ids[index])
+        vampytest.assert_eq(message_queue.relative_index(expected_message_ids[index]), index)
+    
+    vampytest.assert_eq(
+        [message.id for message in reversed(message_queue)],
+        expected_message_ids[::-1],
+    )
@@ -1,22 +1,26 @@
 from .compounds import *
 
+from .cache_snapshot import *
 from .client import *
 from .client_wrapper import *
 from .fields import *
 from .functionality_helpers import *
 from .ready_state import *
 from .request_helpers import *
+from .shard_cluster import *
 from .utils import *
 
 
 __all__ = (
     *compounds.__all__,
     
+    *cache_snapshot.__all__,
     *client.__all__,
     *client_wrapper.__all__,
     *fields.__all__,
     *functionality_helpers.__all__,
     *ready_state.__all__,
     *request_helpers.__all__,
+    *shard_cluster.__all__,
     *utils.__all__,
 )
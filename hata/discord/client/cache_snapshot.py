@@ -0,0 +1,355 @@
+__all__ = ('CacheSnapshot',)
+
+from os import getpid, makedirs, replace as replace_file
+from os.path import exists, join as join_paths
+from struct import Struct
+from warnings import warn
+from zlib import compress as zlib_compress, decompress as zlib_decompress
+
+from scarletio import RichAttributeErrorBaseType
+
+from ..gateway.etf import etf_decode, etf_encode
+from ..guild import Guild
+from ..user import User
+
+
+CACHE_SNAPSHOT_MAGIC = b'HCSN'
+CACHE_SNAPSHOT_VERSION = 1
+CACHE_SNAPSHOT_HEADER = Struct('>4sB')
+
+# Volatile guild fields which are not worth restoring, or which would trigger events if restored.
+CACHE_SNAPSHOT_EXCLUDED_GUILD_FIELDS = ('activity_instances', 'presences', 'stage_instances', 'voice_states')
+
+
+class CacheSnapshot(RichAttributeErrorBaseType):
+    """
+    Snapshot of a client's guilds with their channels, roles, emojis, stickers and users.
+    
+    Saved snapshots are stored as compressed erlang external term format. Loading one puts its entities into the
+    caches, so they are usable before the client receives its guilds. When the client receives a guild, its data
+    overwrites the loaded one, since the loaded guilds are not bound to any clients.
+    
+    If `HATA_CACHE_SNAPSHOT_DIRECTORY` is set, clients save their snapshot when disconnecting and load it when
+    connecting.
+    
+    Attributes
+    ----------
+    guilds : `list<Guild>`
+        The snapshot's guilds. Loaded snapshots keep them alive till they are reconciled.
+    users : `dict<int, list<ClientUserBase>>`
+        The loaded users of each guild. Used to remove the guild profiles of the users, who are not confirmed by the
+        received guild data.
+    """
+    __slots__ = ('guilds', 'users')
+    
+    def __new__(cls, guilds):
+        """
+        Creates a new cache snapshot.
+        
+        Parameters
+        ----------
+        guilds : `iterable<Guild>`
+            The guilds to snapshot.
+        """
+        self = object.__new__(cls)
+        self.guilds = [*guilds]
+        self.users = {}
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the cache snapshot's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' guilds = ')
+        repr_parts.append(repr(len(self.guilds)))
+        
+        repr_parts.append(', users = ')
+        repr_parts.append(repr(sum(len(users) for users in self.users.values())))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    @classmethod
+    def from_client(cls, client):
+        """
+        Creates a snapshot of the given client's guilds.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The client to snapshot.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        """
+        return cls(client.guilds)
+    
+    
+    def to_bytes(self):
+        """
+        Serializes the snapshot.
+        
+        Returns
+        -------
+        raw_snapshot : `bytes`
+        """
+        guild_datas = []
+        
+        for guild in self.guilds:
+            guild_data = guild.to_data(include_internals = True)
+            for key in CACHE_SNAPSHOT_EXCLUDED_GUILD_FIELDS:
+                guild_data.pop(key, None)
+            
+            guild_datas.append(guild_data)
+        
+        return b''.join([
+            CACHE_SNAPSHOT_HEADER.pack(CACHE_SNAPSHOT_MAGIC, CACHE_SNAPSHOT_VERSION),
+            zlib_compress(etf_encode(guild_datas)),
+        ])
+    
+    
+    @classmethod
+    def from_bytes(cls, raw_snapshot):
+        """
+        Deserializes a snapshot putting its entities into the caches.
+        
+        Parameters
+        ----------
+        raw_snapshot : `bytes-like`
+            The serialized snapshot.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        
+        Raises
+        ------
+        ValueError
+            - If `raw_snapshot` is not a snapshot.
+            - If the snapshot was created with an other version.
+        """
+        header_size = CACHE_SNAPSHOT_HEADER.size
+        if len(raw_snapshot) < header_size:
+            raise ValueError(f'Not a cache snapshot; length = {len(raw_snapshot)!r}.')
+        
+        magic, version = CACHE_SNAPSHOT_HEADER.unpack_from(raw_snapshot)
+        if magic != CACHE_SNAPSHOT_MAGIC:
+            raise ValueError(f'Not a cache snapshot; magic = {magic!r}.')
+        
+        if version != CACHE_SNAPSHOT_VERSION:
+            raise ValueError(
+                f'Cache snapshot version mismatch; got {version!r}; expected {CACHE_SNAPSHOT_VERSION!r}.'
+            )
+        
+        with memoryview(raw_snapshot) as view:
+            guild_datas = etf_decode(zlib_decompress(view[header_size:]))
+        
+        guilds = []
+        users_by_guild = {}
+        
+        for guild_data in guild_datas:
+            guild = Guild.from_data(guild_data)
+            guild_id = guild.id
+            guilds.append(guild)
+            
+            # Users are only parsed by guilds when presences are cached, so do it ourselves.
+            guild_users = guild.users
+            users = []
+            for guild_profile_data in guild_data.get('members', ()):
+                user = User.from_data(guild_profile_data['user'], guild_profile_data, guild_id, strong_cache = False)
+                guild_users[user.id] = user
+                guild._update_user_name_index(user.id)
+                users.append(user)
+            
+            users_by_guild[guild_id] = users
+        
+        self = cls(guilds)
+        self.users = users_by_guild
+        return self
+    
+    
+    def save(self, path):
+        """
+        Saves the snapshot to the given path. The file is replaced atomically.
+        
+        Parameters
+        ----------
+        path : `str`
+            The path to save the snapshot to.
+        
+        Raises
+        ------
+        OSError
+            If writing the file failed.
+        """
+        temporary_path = f'{path}.{getpid()}.tmp'
+        
+        with open(temporary_path, 'wb') as file:
+            file.write(self.to_bytes())
+        
+        replace_file(temporary_path, path)
+    
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Loads the snapshot from the given path, putting its entities into the caches.
+        
+        Parameters
+        ----------
+        path : `str`
+            The path to load the snapshot from.
+        
+        Returns
+        -------
+        self : `instance<cls>`
+        
+        Raises
+        ------
+        OSError
+            If reading the file failed.
+        ValueError
+            - If the file is not a snapshot.
+            - If the snapshot was created with an other version.
+        """
+        with open(path, 'rb') as file:
+            raw_snapshot = file.read()
+        
+        return cls.from_bytes(raw_snapshot)
+    
+    
+    def attach(self, client):
+        """
+        Reconciles the snapshot when the client gets ready the first time.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The client to reconcile the snapshot with.
+        """
+        client.events(self._handle_ready, name = 'ready')
+    
+    
+    async def _handle_ready(self, client):
+        """
+        Reconciles the snapshot and removes itself from the client's event handlers.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The client who got ready.
+        """
+        client.events.remove(self._handle_ready, name = 'ready')
+        self.reconcile()
+    
+    
+    def reconcile(self):
+        """
+        Reconciles the loaded entities with the received ones.
+        
+        Received guild data confirms only a part of the guild's users, the rest might have left meanwhile, so the guild
+        profiles of the not confirmed loaded users are removed. They are added back with fresh data when the guild's
+        users are requested. The guilds which were not received by any client are released, together with their
+        users' guild profiles.
+        """
+        users_by_guild = self.users
+        
+        for guild in self.guilds:
+            guild_id = guild.id
+            users = users_by_guild.get(guild_id, None)
+            if users is None:
+                continue
+            
+            if guild.clients:
+                guild_users = guild.users
+            else:
+                guild_users = {}
+            
+            for user in users:
+                if user.id not in guild_users:
+                    user.guild_profiles.pop(guild_id, None)
+        
+        self.guilds = []
+        self.users = {}
+
+
+def get_cache_snapshot_path(client, directory):
+    """
+    Returns the path of the client's cache snapshot.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The respective client.
+    
+    directory : `str`
+        The directory to store the cache snapshots in.
+    
+    Returns
+    -------
+    path : `str`
+    """
+    return join_paths(directory, f'{client.id}.snapshot')
+
+
+def load_cache_snapshot(client, directory):
+    """
+    Loads the client's cache snapshot if it has any and reconciles it when the client gets ready.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client to load the cache snapshot of.
+    
+    directory : `str`
+        The directory to store the cache snapshots in.
+    
+    Returns
+    -------
+    cache_snapshot : ``None | CacheSnapshot``
+    """
+    path = get_cache_snapshot_path(client, directory)
+    if not exists(path):
+        return None
+    
+    try:
+        cache_snapshot = CacheSnapshot.load(path)
+    except (OSError, ValueError) as exception:
+        warn(f'Could not load cache snapshot from {path!r}: {exception!r}', RuntimeWarning)
+        return None
+    
+    cache_snapshot.attach(client)
+    return cache_snapshot
+
+
+def save_cache_snapshot(client, directory):
+    """
+    Saves the client's cache snapshot.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client to save the cache snapshot of.
+    
+    directory : `str`
+        The directory to store the cache snapshots in.
+    
+    Returns
+    -------
+    saved : `bool`
+    """
+    path = get_cache_snapshot_path(client, directory)
+    
+    try:
+        makedirs(directory, exist_ok = True)
+        CacheSnapshot.from_client(client).save(path)
+    except OSError as exception:
+        warn(f'Could not save cache snapshot to {path!r}: {exception!r}', RuntimeWarning)
+        return False
+    
+    return True
@@ -10,7 +10,7 @@ from scarletio import (
     run_coroutine, sleep, write_exception_async
 )
 
-from ...env import CACHE_USER
+from ...env import CACHE_SNAPSHOT_DIRECTORY, CACHE_USER
 from ...ext import get_setup_functions, run_setup_functions
 
 from ..activity import ACTIVITY_UNKNOWN
@@ -23,8 +23,10 @@ from ..events.handling_helpers import ensure_shutdown_event_handlers, ensure_voi
 from ..exceptions import (
     DiscordException, DiscordGatewayException, INTENT_ERROR_CODES, InvalidToken, RESHARD_ERROR_CODES
 )
-from ..gateway.utils import DiscordGatewayClientBase, create_gateway, reshard_gateway
-from ..http import DiscordApiClient, RateLimitProxy
+from ..gateway.utils import (
+    DiscordGatewayClientBase, DiscordGatewayClientShardGroup, create_gateway, reshard_gateway
+)
+from ..http import RATE_LIMIT_GROUP_SNAPSHOT, DiscordApiClient, RateLimitProxy
 from ..localization.utils import LOCALE_DEFAULT
 from ..user import (
     ClientUserBase, ClientUserPBase, PremiumType, RelationshipType, Status, User, UserBase, UserFlag,
@@ -37,6 +39,7 @@ from ..user.user.fields import (
     validate_premium_type, validate_primary_guild_badge, validate_status
 )
 
+from .cache_snapshot import load_cache_snapshot, save_cache_snapshot
 from .compounds import CLIENT_COMPOUNDS
 from .fields import (
     validate_activity, validate_additional_owner_ids, validate_api, validate_application_id, validate_client_id,
@@ -725,6 +728,7 @@ class Client(
                                 continue
                             
                             guild.users[client_id] = self
+                            guild._update_user_name_index(client_id)
             
             # This part should run at both case, except when there is no alter_ego detected when caching users.
             for client in CLIENTS.values():
@@ -859,6 +863,7 @@ class Client(
                     continue
                 
                 guild.users[client_id] = alter_ego
+                guild._update_user_name_index(client_id)
             
             for client in CLIENTS.values():
                 if (client is not self) and client.running:
@@ -1125,6 +1130,10 @@ class Client(
         self._gateway_url = data['url']
         self._gateway_time = LOOP_TIME()
         
+        # Shard groups run a part of the shards partitioned by an outer process. Do not touch them.
+        if isinstance(self.gateway, DiscordGatewayClientShardGroup):
+            return
+        
         old_shard_count = self.shard_count
         if old_shard_count <= 0:
             old_shard_count = 1
@@ -1264,6 +1273,10 @@ class Client(
         
         self.running = True
         register_client(self)
+        
+        if (CACHE_SNAPSHOT_DIRECTORY is not None):
+            load_cache_snapshot(self, CACHE_SNAPSHOT_DIRECTORY)
+        
         Task(KOKORO, self._connect())
         return True
     
@@ -1433,6 +1446,10 @@ class Client(
         
         self.running = False
         
+        # Save the snapshot while the guilds are still cached. Do not overwrite it if no guild was received.
+        if (CACHE_SNAPSHOT_DIRECTORY is not None) and self.guilds:
+            save_cache_snapshot(self, CACHE_SNAPSHOT_DIRECTORY)
+        
         await ensure_voice_client_shutdown_event_handlers(self)
         
         # Log off if user account
@@ -1443,6 +1460,9 @@ class Client(
         # cancel shards
         await self.gateway.close()
         
+        # Do not lose the rate limit group sizes learned since the last scheduled save.
+        RATE_LIMIT_GROUP_SNAPSHOT.save()
+        
         await ensure_shutdown_event_handlers(self)
     
     
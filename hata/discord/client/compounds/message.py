@@ -8,7 +8,7 @@ from scarletio import Compound, Task, TaskGroup
 from ...bases import maybe_snowflake, maybe_snowflake_pair
 from ...builder.serialization import create_serializer
 from ...builder.serialization_configuration import SerializationConfiguration
-from ...channel import Channel, MessageIterator, message_relative_index
+from ...channel import Channel, MessageArchiveIterator, MessageIterator, message_relative_index
 from ...core import CHANNELS, KOKORO, MESSAGES
 from ...exceptions import DiscordException, ERROR_CODES
 from ...http import DiscordApiClient
@@ -1960,3 +1960,57 @@ class ClientCompoundMessageEndpoints(Compound):
             - If `chunk_size` is out of range [1:].
         """
         return await MessageIterator(self, channel, chunk_size)
+    
+    
+    def message_archive_iterator(
+        self,
+        channel,
+        *,
+        after = None,
+        before = None,
+        converter = None,
+        oldest_first = False,
+        prefetch = 2,
+    ):
+        """
+        Returns an asynchronous iterator over the given text channel's message history, yielding the raw message
+        datas ordered by their identifier. The messages are not cached, so it can be used to export channels of any
+        size.
+        
+        Parameters
+        ----------
+        channel : ``int | Channel``
+            The channel from were the messages will be requested.
+        after : ``None | int | DiscordEntity | DateTime`` = `None`, Optional (Keyword only)
+            Only messages created after this are yielded.
+        before : ``None | int | DiscordEntity | DateTime`` = `None`, Optional (Keyword only)
+            Only messages created before this are yielded.
+        converter : `None | FunctionType` = `None`, Optional (Keyword only)
+            Converter to call on each yielded message data, like to create lightweight records from them.
+        oldest_first : `bool` = `False`, Optional (Keyword only)
+            Whether the messages should be yielded from the oldest one.
+        prefetch : `int` = `2`, Optional (Keyword only)
+            How much chunks can be requested ahead of the consumer.
+        
+        Returns
+        -------
+        message_archive_iterator : ``MessageArchiveIterator``
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        channel_id = get_channel_id(channel, Channel.is_in_group_textual)
+        
+        return MessageArchiveIterator(
+            self,
+            channel_id,
+            after = after,
+            before = before,
+            converter = converter,
+            oldest_first = oldest_first,
+            prefetch = prefetch,
+        )
@@ -1,6 +1,6 @@
 __all__ = ()
 
-from collections import deque
+from heapq import heappop, heappush
 
 from scarletio import CancelledError, Future, Task, TaskGroup, WeakReferer, set_docs, sleep
 
@@ -15,6 +15,9 @@ READY_STATE_TO_DO_GUILD_IDS = set()
 GUILD_RECEIVE_TIMEOUT = 5.0
 SHARD_CONNECT_TIMEOUT = 12.0
 
+# The amount of gateway operations left for heartbeats, presence and voice state updates while requesting users.
+USER_REQUEST_RATE_LIMIT_RESERVE = 10
+
 USER_REQUEST_STATE_NONE = 0
 USER_REQUEST_STATE_TIMEOUT = 1
 USER_REQUEST_STATE_DONE = 2
@@ -26,26 +29,34 @@ class ShardUserRequester:
     """
     User requested task of a shard.
     
+    Received guilds are requested by their user count in descending order, and the requests are paced by the shard's
+    gateway rate limit, so the burst budget is used up right away.
+    
     Attributes
     ----------
     can_request_users : `bool`
         Whether the client can request users with it's gateway.
-    gateway : ``DiscordGateway``
+    gateway : ``DiscordGatewayClientBase``
         The shard's gateway.
+    guild_count : `int`
+        The amount of guilds the shard received on ready.
     guild_create_waiter : `None`, ``Future``
         Water to wait for guild create event. Used when no more guild id is received to use up.
-    guild_ids : `set` of `int`
+    guild_ids : `set<int>`
         The guild's id to request the users of.
-    received_guild_ids : `deque` of `tuple` (`int`, `bool`)
-        A queue of received tuples. Each tuple contains a guild's identifier and whether it's users should be
-        requested.
+    received_guild_ids : `list<tuple<int, int, bool>>`
+        A heap of the received guilds. Each element contains the guild's negated user count, the guild's identifier
+        and whether it's users should be requested.
+    request_count : `int`
+        The amount of sent user requests.
     state : `int`
         A state containing the requester's state.
     task : `None`, ``Task`` of ``._runner``
         A task executing the user requesting.
     """
     __slots__ = (
-        'can_request_users', 'gateway', 'guild_create_waiter', 'guild_ids', 'received_guild_ids', 'state', 'task'
+        'can_request_users', 'gateway', 'guild_count', 'guild_create_waiter', 'guild_ids', 'received_guild_ids',
+        'request_count', 'state', 'task'
     )
     
     def __new__(cls, gateway, guild_ids, can_request_users):
@@ -54,9 +65,9 @@ class ShardUserRequester:
         
         Parameters
         ----------
-        gateway : ``DiscordGateway``
+        gateway : ``DiscordGatewayClientBase``
             The shard's gateway.
-        guild_ids : `set` of `int`
+        guild_ids : `set<int>`
             The guild's id to request the users of.
         can_request_users : `bool`
             Whether the client can request users with it's gateway.
@@ -64,9 +75,11 @@ class ShardUserRequester:
         self = object.__new__(cls)
         self.can_request_users = can_request_users
         self.gateway = gateway
+        self.guild_count = len(guild_ids)
         self.guild_ids = guild_ids
-        self.received_guild_ids = deque()
+        self.received_guild_ids = []
         self.guild_create_waiter = None
+        self.request_count = 0
         self.state = USER_REQUEST_STATE_NONE
         self.task = Task(KOKORO, self._runner())
         return self
@@ -81,6 +94,7 @@ class ShardUserRequester:
             guild_ids = self.guild_ids
             received_guild_ids = self.received_guild_ids
             can_request_users = self.can_request_users
+            gateway = self.gateway
             
             if can_request_users:
                 sub_data = {
@@ -110,7 +124,16 @@ class ShardUserRequester:
                     finally:
                         self.guild_create_waiter = None
                 
-                guild_id, should_request_users = received_guild_ids.popleft()
+                # Do not pop yet, while we wait for the rate limit, larger guilds might be received.
+                guild_id = received_guild_ids[0][1]
+                
+                if can_request_users and (guild_id in READY_STATE_TO_DO_GUILD_IDS) and received_guild_ids[0][2]:
+                    delay = gateway.get_rate_limit_delay(USER_REQUEST_RATE_LIMIT_RESERVE)
+                    if delay > 0.0:
+                        await sleep(delay, KOKORO)
+                        continue
+                
+                negated_user_count, guild_id, should_request_users = heappop(received_guild_ids)
                 guild_ids.discard(guild_id)
                 
                 if not can_request_users:
@@ -125,8 +148,8 @@ class ShardUserRequester:
                     continue
                 
                 sub_data['guild_id'] = guild_id
-                await self.gateway.send_as_json(data)
-                await sleep(0.6, KOKORO)
+                await gateway.send_as_json(data)
+                self.request_count += 1
         
         except (CancelledError, GeneratorExit):
             self.state = USER_REQUEST_STATE_CANCELLED
@@ -153,7 +176,7 @@ class ShardUserRequester:
             task.cancel()
     
     
-    def feed(self, guild_id, should_request_users):
+    def feed(self, guild_id, should_request_users, user_count):
         """
         Feeds a guild identifier to the shard user requesters.
         
@@ -163,6 +186,8 @@ class ShardUserRequester:
             The guild's identifier.
         should_request_users : `bool`
             Whether the guild's users should be requested.
+        user_count : `int`
+            The guild's user count. Larger guilds are requested first.
         
         Returns
         -------
@@ -170,7 +195,7 @@ class ShardUserRequester:
             Whether the request is queued up.
         """
         if guild_id in self.guild_ids:
-            self.received_guild_ids.append((guild_id, should_request_users))
+            heappush(self.received_guild_ids, (-user_count, guild_id, should_request_users))
             
             request_enqueued = True
         else:
@@ -192,6 +217,22 @@ class ShardUserRequester:
             The guild's identifier.
         """
         self.guild_ids.discard(guild_id)
+    
+    
+    def get_progress(self):
+        """
+        Returns the shard user requester's progress.
+        
+        Returns
+        -------
+        progress : `dict<str, int>`
+        """
+        return {
+            'guild_count': self.guild_count,
+            'guilds_left': len(self.guild_ids),
+            'guilds_queued': len(self.received_guild_ids),
+            'request_count': self.request_count,
+        }
 
 
 if CACHE_PRESENCE:
@@ -264,7 +305,7 @@ class ReadyState:
         self = object.__new__(cls)
         self.shard_count = client.shard_count
         self.shard_user_requesters = {}
-        self.task = Task(KOKORO, self._runner())
+        self.task = Task(KOKORO, self._runner(client.gateway.get_shard_count()))
         self.shard_ready_waiter = None
         self.client_reference = WeakReferer(client)
         
@@ -290,10 +331,10 @@ class ReadyState:
         else:
             shard_user_requester.cancel()
         
-        shard_count = client.shard_count
         gateway = client.gateway
-        if shard_count:
-            gateway = gateway.gateways[shard_id]
+        shard_gateway = gateway.get_shard_gateway(shard_id)
+        if (shard_gateway is not None):
+            gateway = shard_gateway
         
         guild_ids = set(int(guild_data['id']) for guild_data in guild_datas)
         
@@ -351,24 +392,25 @@ class ReadyState:
             request_enqueued = False
         else:
             if shard_user_requester.state == USER_REQUEST_STATE_NONE:
-                request_enqueued = shard_user_requester.feed(guild_id, should_request_users)
+                request_enqueued = shard_user_requester.feed(guild_id, should_request_users, guild.user_count)
             else:
                 request_enqueued = False
         
         return request_enqueued
     
     
-    async def _runner(self):
+    async def _runner(self, shard_count):
         """
         Runner task of the ready state waiting for all guild users to be requested.
         
         This method is a coroutine.
+        
+        Parameters
+        ----------
+        shard_count : `int`
+            The amount of shards ran by the client's gateway to wait for.
         """
         try:
-            shard_count = self.shard_count
-            if not shard_count:
-                shard_count = 1
-            
             while True:
                 tasks = None
                 done_tasks = 0
@@ -416,6 +458,28 @@ class ReadyState:
             for shard_user_requester in self.shard_user_requesters.values():
                 shard_user_requester.cancel()
     
+    def get_progress(self):
+        """
+        Returns the ready state's progress summed up for its ready shards.
+        
+        Returns
+        -------
+        progress : `dict<str, int>`
+        """
+        progress = {
+            'guild_count': 0,
+            'guilds_left': 0,
+            'guilds_queued': 0,
+            'request_count': 0,
+            'shard_count': len(self.shard_user_requesters),
+        }
+        
+        for shard_user_requester in self.shard_user_requesters.values():
+            for key, value in shard_user_requester.get_progress().items():
+                progress[key] += value
+        
+        return progress
+    
     def __iter__(self):
         """
         Waits till the ready state receives all of it's shards and guilds, or till timeout occurs.
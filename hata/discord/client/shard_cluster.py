@@ -0,0 +1,732 @@
+__all__ = ('ShardCluster', 'ShardClusterWorker', 'partition_shard_ids',)
+
+from multiprocessing import get_context
+from multiprocessing.connection import wait as wait_connections
+from time import monotonic
+
+from scarletio import RichAttributeErrorBaseType, from_json, to_json, write_exception_sync
+
+from ..core import KOKORO
+from ..gateway.client_shard_group import DiscordGatewayClientShardGroup
+
+from .client import Client
+
+
+SHARD_CLUSTER_MESSAGE_READY = 1
+SHARD_CLUSTER_MESSAGE_GUILD_CREATE = 2
+SHARD_CLUSTER_MESSAGE_GUILD_DELETE = 3
+SHARD_CLUSTER_MESSAGE_DISPATCH = 4
+SHARD_CLUSTER_MESSAGE_STOP = 5
+SHARD_CLUSTER_MESSAGE_CONNECTED = 6
+
+SHARD_CLUSTER_MESSAGE_KIND_TO_EVENT_NAME = {
+    SHARD_CLUSTER_MESSAGE_CONNECTED: 'connected',
+    SHARD_CLUSTER_MESSAGE_READY: 'ready',
+    SHARD_CLUSTER_MESSAGE_GUILD_CREATE: 'guild_create',
+    SHARD_CLUSTER_MESSAGE_GUILD_DELETE: 'guild_delete',
+}
+
+# Timeout per shard.
+SHARD_CLUSTER_CONNECT_TIMEOUT = 60.0
+# Identifies are rate limited by application, so the processes share their identify rate limit too.
+SHARD_CLUSTER_IDENTIFY_INTERVAL = 5.0
+SHARD_CLUSTER_STOP_TIMEOUT = 30.0
+
+
+def partition_shard_ids(shard_count, worker_count):
+    """
+    Partitions the shards between the workers. Each worker gets a continuous range of shards, the first ones getting
+    one more if the shards cannot be split evenly.
+    
+    Parameters
+    ----------
+    shard_count : `int`
+        The total amount of shards.
+    worker_count : `int`
+        The amount of workers.
+    
+    Returns
+    -------
+    partitions : `tuple<tuple<int>>`
+    
+    Raises
+    ------
+    ValueError
+        - If `worker_count` is less than `1`.
+        - If `worker_count` is greater than `shard_count`.
+    """
+    if worker_count < 1:
+        raise ValueError(f'`worker_count` must be at least `1`, got {worker_count!r}.')
+    
+    if shard_count < worker_count:
+        raise ValueError(
+            f'`worker_count` cannot be greater than `shard_count`; got worker_count = {worker_count!r}; '
+            f'shard_count = {shard_count!r}.'
+        )
+    
+    base, extra = divmod(shard_count, worker_count)
+    
+    partitions = []
+    start = 0
+    for worker_index in range(worker_count):
+        end = start + base + (worker_index < extra)
+        partitions.append(tuple(range(start, end)))
+        start = end
+    
+    return tuple(partitions)
+
+
+def _encode_shard_cluster_message(kind, name, data):
+    """
+    Encodes a message sent between the cluster and its workers.
+    
+    Parameters
+    ----------
+    kind : `int`
+        The message's kind.
+    name : `None | str`
+        Event name for dispatch messages.
+    data : `object`
+        Json serializable payload.
+    
+    Returns
+    -------
+    raw_message : `bytes`
+    """
+    return to_json([kind, name, data]).encode()
+
+
+def _decode_shard_cluster_message(raw_message):
+    """
+    Decodes a message sent between the cluster and its workers.
+    
+    Parameters
+    ----------
+    raw_message : `bytes`
+        The message to decode.
+    
+    Returns
+    -------
+    kind : `int`
+        The message's kind.
+    name : `None | str`
+        Event name for dispatch messages.
+    data : `object`
+        The message's payload.
+    """
+    kind, name, data = from_json(raw_message)
+    return kind, name, data
+
+
+def _run_shard_cluster_worker(connection, worker_index, token, shard_count, shard_ids, setup, client_parameters):
+    """
+    Entry point of the worker processes.
+    
+    Parameters
+    ----------
+    connection : ``Connection``
+        Connection to the cluster.
+    worker_index : `int`
+        The worker's index.
+    token : `str`
+        The client's token.
+    shard_count : `int`
+        The total amount of shards.
+    shard_ids : `tuple<int>`
+        The worker's shards' identifiers.
+    setup : `None | callable`
+        Called with the worker's client and the worker itself before connecting.
+    client_parameters : `dict<str, object>`
+        Additional parameters to create the client with.
+    """
+    client = Client(token, shard_count = shard_count, **client_parameters)
+    worker = ShardClusterWorker(client, connection, worker_index, shard_ids)
+    client.gateway = DiscordGatewayClientShardGroup(client, shard_ids, worker._handle_connected)
+    if (setup is not None):
+        setup(client, worker)
+    
+    try:
+        worker.run()
+    finally:
+        # The event loop is not a daemon thread, the process would not exit while it is running.
+        KOKORO.stop()
+
+
+class ShardClusterWorker(RichAttributeErrorBaseType):
+    """
+    The worker process side of a ``ShardCluster``.
+    
+    Forwards the client's guild changes and the custom events passed to ``.send`` to the cluster.
+    
+    Attributes
+    ----------
+    client : ``Client``
+        The worker's client running the worker's shards.
+    connection : ``Connection``
+        Connection to the cluster.
+    shard_ids : `tuple<int>`
+        The worker's shards' identifiers.
+    worker_index : `int`
+        The worker's index.
+    """
+    __slots__ = ('client', 'connection', 'shard_ids', 'worker_index')
+    
+    def __new__(cls, client, connection, worker_index, shard_ids):
+        """
+        Creates a new shard cluster worker and registers its event handlers to the client.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The worker's client running the worker's shards.
+        connection : ``Connection``
+            Connection to the cluster.
+        worker_index : `int`
+            The worker's index.
+        shard_ids : `tuple<int>`
+            The worker's shards' identifiers.
+        """
+        self = object.__new__(cls)
+        self.client = client
+        self.connection = connection
+        self.shard_ids = shard_ids
+        self.worker_index = worker_index
+        
+        client.events(self._handle_ready, name = 'ready')
+        client.events(self._handle_guild_create, name = 'guild_create')
+        client.events(self._handle_guild_delete, name = 'guild_delete')
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the shard cluster worker's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' worker_index = ')
+        repr_parts.append(repr(self.worker_index))
+        
+        repr_parts.append(', shard_ids = ')
+        repr_parts.append(repr(self.shard_ids))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def send(self, name, data):
+        """
+        Forwards a custom event to the cluster.
+        
+        Parameters
+        ----------
+        name : `str`
+            The event's name.
+        data : `object`
+            Json serializable payload.
+        """
+        self._send(SHARD_CLUSTER_MESSAGE_DISPATCH, name, data)
+    
+    
+    def _send(self, kind, name, data):
+        """
+        Sends a message to the cluster. If the cluster is gone, does nothing.
+        
+        Parameters
+        ----------
+        kind : `int`
+            The message's kind.
+        name : `None | str`
+            Event name for dispatch messages.
+        data : `object`
+            Json serializable payload.
+        """
+        try:
+            self.connection.send_bytes(_encode_shard_cluster_message(kind, name, data))
+        except OSError:
+            pass
+    
+    
+    def _handle_connected(self):
+        """
+        Tells the cluster that the worker's shards connected, so it can start the next worker.
+        """
+        self._send(SHARD_CLUSTER_MESSAGE_CONNECTED, None, None)
+    
+    
+    async def _handle_ready(self, client):
+        """
+        Sends the client's guilds to the cluster after the worker's shards received their guilds.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The worker's client.
+        """
+        self._send(SHARD_CLUSTER_MESSAGE_READY, None, [guild.id for guild in client.guilds])
+    
+    
+    async def _handle_guild_create(self, client, guild):
+        """
+        Forwards a guild creation to the cluster.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The worker's client.
+        guild : ``Guild``
+            The created guild.
+        """
+        self._send(SHARD_CLUSTER_MESSAGE_GUILD_CREATE, None, guild.id)
+    
+    
+    async def _handle_guild_delete(self, client, guild, guild_profile):
+        """
+        Forwards a guild deletion to the cluster.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The worker's client.
+        guild : ``Guild``
+            The deleted guild.
+        guild_profile : `None | GuildProfile`
+            The client's guild profile at the guild.
+        """
+        self._send(SHARD_CLUSTER_MESSAGE_GUILD_DELETE, None, guild.id)
+    
+    
+    def run(self):
+        """
+        Connects the worker's client and keeps it running till the cluster tells it to stop or till the cluster is
+        gone.
+        """
+        client = self.client
+        connection = self.connection
+        try:
+            if client.start():
+                while True:
+                    try:
+                        raw_message = connection.recv_bytes()
+                    except (EOFError, OSError):
+                        break
+                    
+                    kind, name, data = _decode_shard_cluster_message(raw_message)
+                    if kind == SHARD_CLUSTER_MESSAGE_STOP:
+                        break
+        
+        finally:
+            if client.running:
+                client.stop()
+            
+            connection.close()
+
+
+class ShardCluster(RichAttributeErrorBaseType):
+    """
+    Runs the shards of a client split between multiple worker processes. Each worker process runs its own client with
+    a part of the shards, so parsing and caching is done in parallel.
+    
+    The workers forward their guild changes and custom events to the cluster. The cluster keeps an aggregate cache of
+    which worker owns which guild and calls its handlers with the forwarded events.
+    
+    Attributes
+    ----------
+    _connections : `list<None | Connection>`
+        Connection to each worker. `None` if the worker is not running.
+    _processes : `list<None | Process>`
+        Each worker's process. `None` if the worker is not running.
+    client_parameters : `dict<str, object>`
+        Additional parameters to create the workers' clients with.
+    connected_worker_indexes : `set<int>`
+        The indexes of the workers which shards connected.
+    guild_ids : `dict<int, int>`
+        Guild identifier to worker index relation of every guild of the workers.
+    handlers : `dict<str, list<callable>>`
+        Event handlers by event name. Called with the cluster, the worker's index and the event's payload.
+    ready_worker_indexes : `set<int>`
+        The indexes of the workers which received all of their guilds.
+    setup : `None | callable`
+        Called inside of every worker process with the worker's client and the worker itself before connecting.
+        Use it to register the worker's own event handlers.
+    shard_count : `int`
+        The total amount of shards.
+    token : `str`
+        The client's token.
+    worker_shard_ids : `tuple<tuple<int>>`
+        The shards' identifiers of each worker.
+    """
+    __slots__ = (
+        '_connections', '_processes', 'client_parameters', 'connected_worker_indexes', 'guild_ids', 'handlers',
+        'ready_worker_indexes', 'setup', 'shard_count', 'token', 'worker_shard_ids'
+    )
+    
+    def __new__(cls, token, setup = None, *, client_parameters = None, shard_count, worker_count):
+        """
+        Creates a new shard cluster.
+        
+        Parameters
+        ----------
+        token : `str`
+            The client's token.
+        setup : `None | callable` = `None`, Optional
+            Called inside of every worker process with the worker's client and the worker itself before connecting.
+            Must be picklable, so define it at module level.
+        client_parameters : `None | dict<str, object>` = `None`, Optional (Keyword only)
+            Additional parameters to create the workers' clients with.
+        shard_count : `int` (Keyword only)
+            The total amount of shards.
+        worker_count : `int` (Keyword only)
+            The amount of worker processes.
+        
+        Raises
+        ------
+        ValueError
+            - If `worker_count` is less than `1`.
+            - If `worker_count` is greater than `shard_count`.
+        """
+        worker_shard_ids = partition_shard_ids(shard_count, worker_count)
+        
+        if client_parameters is None:
+            client_parameters = {}
+        
+        self = object.__new__(cls)
+        self._connections = [None] * worker_count
+        self._processes = [None] * worker_count
+        self.client_parameters = client_parameters
+        self.connected_worker_indexes = set()
+        self.guild_ids = {}
+        self.handlers = {}
+        self.ready_worker_indexes = set()
+        self.setup = setup
+        self.shard_count = shard_count
+        self.token = token
+        self.worker_shard_ids = worker_shard_ids
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the shard cluster's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' shard_count = ')
+        repr_parts.append(repr(self.shard_count))
+        
+        repr_parts.append(', worker_count = ')
+        repr_parts.append(repr(len(self.worker_shard_ids)))
+        
+        repr_parts.append(', ready = ')
+        repr_parts.append(repr(len(self.ready_worker_indexes)))
+        
+        repr_parts.append(', guild_count = ')
+        repr_parts.append(repr(len(self.guild_ids)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def add_handler(self, name, handler):
+        """
+        Adds an event handler to the cluster.
+        
+        Parameters
+        ----------
+        name : `str`
+            The event's name. Can be `'connected'`, `'ready'`, `'guild_create'`, `'guild_delete'` or any custom event
+            name sent by the workers.
+        handler : `callable`
+            The event handler. Called with the cluster, the worker's index and the event's payload.
+        
+        Returns
+        -------
+        handler : `callable`
+        """
+        self.handlers.setdefault(name, []).append(handler)
+        return handler
+    
+    
+    def get_worker_index(self, guild_id):
+        """
+        Returns the index of the worker which runs the shard of the given guild.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The guild's identifier.
+        
+        Returns
+        -------
+        worker_index : `int`
+        """
+        shard_id = (guild_id >> 22) % self.shard_count
+        
+        for worker_index, shard_ids in enumerate(self.worker_shard_ids):
+            if shard_id <= shard_ids[-1]:
+                return worker_index
+        
+        # Should not happen
+        return 0
+    
+    
+    def feed(self, worker_index, raw_message):
+        """
+        Processes a message received from a worker.
+        
+        Parameters
+        ----------
+        worker_index : `int`
+            The worker's index.
+        raw_message : `bytes`
+            The received message.
+        """
+        kind, name, data = _decode_shard_cluster_message(raw_message)
+        
+        if kind == SHARD_CLUSTER_MESSAGE_DISPATCH:
+            pass
+        
+        elif kind == SHARD_CLUSTER_MESSAGE_GUILD_CREATE:
+            self.guild_ids[data] = worker_index
+        
+        elif kind == SHARD_CLUSTER_MESSAGE_GUILD_DELETE:
+            self.guild_ids.pop(data, None)
+        
+        elif kind == SHARD_CLUSTER_MESSAGE_CONNECTED:
+            self.connected_worker_indexes.add(worker_index)
+        
+        elif kind == SHARD_CLUSTER_MESSAGE_READY:
+            self._remove_guilds_of(worker_index)
+            
+            guild_ids = self.guild_ids
+            for guild_id in data:
+                guild_ids[guild_id] = worker_index
+            
+            self.ready_worker_indexes.add(worker_index)
+        
+        else:
+            return
+        
+        if name is None:
+            name = SHARD_CLUSTER_MESSAGE_KIND_TO_EVENT_NAME[kind]
+        
+        self._call_handlers(name, worker_index, data)
+    
+    
+    def _call_handlers(self, name, worker_index, data):
+        """
+        Calls the event handlers of the given event. Exceptions are written to `stderr`.
+        
+        Parameters
+        ----------
+        name : `str`
+            The event's name.
+        worker_index : `int`
+            The worker's index.
+        data : `object`
+            The event's payload.
+        """
+        handlers = self.handlers.get(name, None)
+        if handlers is None:
+            return
+        
+        for handler in handlers:
+            try:
+                handler(self, worker_index, data)
+            except BaseException as err:
+                if isinstance(err, (KeyboardInterrupt, SystemExit)):
+                    raise
+                
+                write_exception_sync(err)
+    
+    
+    def _remove_guilds_of(self, worker_index):
+        """
+        Removes the guilds of the given worker from the aggregate cache.
+        
+        Parameters
+        ----------
+        worker_index : `int`
+            The worker's index.
+        """
+        guild_ids = self.guild_ids
+        for guild_id in [guild_id for guild_id, index in guild_ids.items() if index == worker_index]:
+            del guild_ids[guild_id]
+    
+    
+    def _start_worker(self, worker_index):
+        """
+        Starts the worker process for the given index.
+        
+        Parameters
+        ----------
+        worker_index : `int`
+            The worker's index.
+        """
+        context = get_context('spawn')
+        parent_connection, child_connection = context.Pipe()
+        
+        process = context.Process(
+            target = _run_shard_cluster_worker,
+            args = (
+                child_connection, worker_index, self.token, self.shard_count, self.worker_shard_ids[worker_index],
+                self.setup, self.client_parameters
+            ),
+            daemon = True,
+        )
+        process.start()
+        child_connection.close()
+        
+        self._connections[worker_index] = parent_connection
+        self._processes[worker_index] = process
+    
+    
+    def _close_worker(self, worker_index):
+        """
+        Closes the connection to the given worker and drops its guilds.
+        
+        Parameters
+        ----------
+        worker_index : `int`
+            The worker's index.
+        """
+        connection = self._connections[worker_index]
+        if (connection is not None):
+            self._connections[worker_index] = None
+            connection.close()
+        
+        self.connected_worker_indexes.discard(worker_index)
+        self.ready_worker_indexes.discard(worker_index)
+        self._remove_guilds_of(worker_index)
+    
+    
+    def poll(self, timeout = None):
+        """
+        Waits for messages from the workers and processes them.
+        
+        Parameters
+        ----------
+        timeout : `None | float` = `None`, Optional
+            The maximal time to wait.
+        
+        Returns
+        -------
+        running : `bool`
+            Whether any worker is still connected.
+        """
+        connections = self._connections
+        connection_to_worker_index = {
+            connection: worker_index for worker_index, connection in enumerate(connections) if (connection is not None)
+        }
+        if not connection_to_worker_index:
+            return False
+        
+        for connection in wait_connections([*connection_to_worker_index.keys()], timeout):
+            worker_index = connection_to_worker_index[connection]
+            try:
+                raw_message = connection.recv_bytes()
+            except (EOFError, OSError):
+                self._close_worker(worker_index)
+                continue
+            
+            self.feed(worker_index, raw_message)
+        
+        return any(connection is not None for connection in connections)
+    
+    
+    def start(self, connect_timeout = SHARD_CLUSTER_CONNECT_TIMEOUT):
+        """
+        Starts the workers one after the other. Each worker is started only after the previous one's shards
+        connected, so the shards' identifies are spread out the same way as if they were ran from one process.
+        
+        The workers do not wait for each other to receive their guilds and to request their users.
+        
+        Parameters
+        ----------
+        connect_timeout : `float` = `SHARD_CLUSTER_CONNECT_TIMEOUT`, Optional
+            The maximal time to wait for a shard of a worker to connect.
+        
+        Returns
+        -------
+        success : `bool`
+            Whether every worker started up.
+        """
+        for worker_index, shard_ids in enumerate(self.worker_shard_ids):
+            if worker_index:
+                # The previous worker identified its last shards right now.
+                deadline = monotonic() + SHARD_CLUSTER_IDENTIFY_INTERVAL
+                while True:
+                    timeout = deadline - monotonic()
+                    if timeout <= 0.0:
+                        break
+                    
+                    if not self.poll(timeout):
+                        return False
+            
+            self._start_worker(worker_index)
+            
+            connection = self._connections[worker_index]
+            deadline = monotonic() + connect_timeout * len(shard_ids)
+            while worker_index not in self.connected_worker_indexes:
+                if (self._connections[worker_index] is not connection):
+                    return False
+                
+                timeout = deadline - monotonic()
+                if (timeout <= 0.0) or (not wait_connections([connection], timeout)):
+                    return False
+                
+                self.poll(0.0)
+        
+        return True
+    
+    
+    def run(self, connect_timeout = SHARD_CLUSTER_CONNECT_TIMEOUT):
+        """
+        Starts the workers and processes their messages till all of them are stopped.
+        
+        Parameters
+        ----------
+        connect_timeout : `float` = `SHARD_CLUSTER_CONNECT_TIMEOUT`, Optional
+            The maximal time to wait for a shard of a worker to connect.
+        """
+        try:
+            if self.start(connect_timeout):
+                while self.poll():
+                    pass
+        
+        finally:
+            self.stop()
+    
+    
+    def stop(self, timeout = SHARD_CLUSTER_STOP_TIMEOUT):
+        """
+        Tells every worker to stop and waits for them. Terminates the workers that did not stop in time.
+        
+        Parameters
+        ----------
+        timeout : `float` = `SHARD_CLUSTER_STOP_TIMEOUT`, Optional
+            The maximal time to wait for each worker to stop.
+        """
+        raw_message = _encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_STOP, None, None)
+        
+        for connection in self._connections:
+            if (connection is not None):
+                try:
+                    connection.send_bytes(raw_message)
+                except OSError:
+                    pass
+        
+        processes = self._processes
+        for worker_index, process in enumerate(processes):
+            if process is None:
+                continue
+            
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+            
+            processes[worker_index] = None
+            self._close_worker(worker_index)
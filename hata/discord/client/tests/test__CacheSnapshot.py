@@ -0,0 +1,316 @@
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+import vampytest
+
+from ...channel import Channel, ChannelType
+from ...guild import Guild
+from ...role import Role
+from ...user import GuildProfile, User
+
+from ..cache_snapshot import (
+    CACHE_SNAPSHOT_HEADER, CACHE_SNAPSHOT_MAGIC, CacheSnapshot, get_cache_snapshot_path, load_cache_snapshot,
+    save_cache_snapshot
+)
+from ..client import Client
+
+
+def _assert_fields_set(cache_snapshot):
+    """
+    Asserts whether every field of the given cache snapshot is set.
+    
+    Parameters
+    ----------
+    cache_snapshot : ``CacheSnapshot``
+        The cache snapshot to check.
+    """
+    vampytest.assert_instance(cache_snapshot, CacheSnapshot)
+    vampytest.assert_instance(cache_snapshot.guilds, list)
+    vampytest.assert_instance(cache_snapshot.users, dict)
+
+
+def _create_guild(guild_id):
+    """
+    Creates a guild with a channel, a role and a user.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The guild's identifier.
+    
+    Returns
+    -------
+    guild : ``Guild``
+    user : ``User``
+    """
+    channel = Channel.precreate(guild_id + 1, channel_type = ChannelType.guild_text, guild_id = guild_id, name = 'orin')
+    role = Role.precreate(guild_id, guild_id = guild_id, name = 'everyone')
+    user = User.precreate(guild_id + 2, name = 'koishi')
+    user.guild_profiles[guild_id] = GuildProfile(nick = 'satori', role_ids = [guild_id])
+    
+    guild = Guild.precreate(guild_id, channels = [channel], name = 'chiruno', roles = [role], users = [user])
+    return guild, user
+
+
+def test__CacheSnapshot__new():
+    """
+    Tests whether ``CacheSnapshot.__new__`` works as intended.
+    """
+    guild, user = _create_guild(202610170900)
+    
+    cache_snapshot = CacheSnapshot([guild])
+    _assert_fields_set(cache_snapshot)
+    
+    vampytest.assert_eq(cache_snapshot.guilds, [guild])
+    vampytest.assert_eq(cache_snapshot.users, {})
+
+
+def test__CacheSnapshot__repr():
+    """
+    Tests whether ``CacheSnapshot.__repr__`` works as intended.
+    """
+    guild, user = _create_guild(202610170910)
+    
+    cache_snapshot = CacheSnapshot([guild])
+    
+    output = repr(cache_snapshot)
+    vampytest.assert_instance(output, str)
+
+
+def test__CacheSnapshot__from_client():
+    """
+    Tests whether ``CacheSnapshot.from_client`` works as intended.
+    """
+    guild, user = _create_guild(202610170920)
+    client = Client(
+        'token_202610170921',
+        client_id = 202610170922,
+    )
+    
+    try:
+        client.guilds.add(guild)
+        
+        cache_snapshot = CacheSnapshot.from_client(client)
+        _assert_fields_set(cache_snapshot)
+        vampytest.assert_eq(cache_snapshot.guilds, [guild])
+    
+    finally:
+        client.guilds.clear()
+        client._delete()
+        client = None
+
+
+def test__CacheSnapshot__to_bytes__from_bytes():
+    """
+    Tests whether ``CacheSnapshot.to_bytes`` and ``CacheSnapshot.from_bytes`` work as intended.
+    """
+    guild_id = 202610170930
+    guild, user = _create_guild(guild_id)
+    
+    output = CacheSnapshot([guild]).to_bytes()
+    vampytest.assert_instance(output, bytes)
+    vampytest.assert_true(output.startswith(CACHE_SNAPSHOT_MAGIC))
+    
+    # Outdate the cached entities, loading should restore them.
+    guild.name = 'okuu'
+    guild.users.clear()
+    del user.guild_profiles[guild_id]
+    
+    cache_snapshot = CacheSnapshot.from_bytes(output)
+    _assert_fields_set(cache_snapshot)
+    
+    vampytest.assert_eq(cache_snapshot.guilds, [guild])
+    vampytest.assert_eq(cache_snapshot.users, {guild_id: [user]})
+    vampytest.assert_eq(guild.name, 'chiruno')
+    vampytest.assert_eq(guild.users, {user.id: user})
+    vampytest.assert_eq([*guild.channels.keys()], [guild_id + 1])
+    vampytest.assert_eq([*guild.roles.keys()], [guild_id])
+    
+    guild_profile = user.get_guild_profile_for(guild)
+    vampytest.assert_is_not(guild_profile, None)
+    vampytest.assert_eq(guild_profile.nick, 'satori')
+
+
+def test__CacheSnapshot__from_bytes__user_name_index():
+    """
+    Tests whether ``CacheSnapshot.from_bytes`` works as intended.
+    
+    Case: The guild's user name index is updated.
+    """
+    guild_id = 202610170935
+    guild, user = _create_guild(guild_id)
+    
+    output = CacheSnapshot([guild]).to_bytes()
+    
+    guild.users.clear()
+    # Build the index without the user
+    vampytest.assert_is(guild.get_user('koishi'), None)
+    
+    CacheSnapshot.from_bytes(output)
+    
+    vampytest.assert_is(guild.get_user('koishi'), user)
+    vampytest.assert_is(guild.get_user('satori'), user)
+
+
+def _iter_options__from_bytes__value_error():
+    yield b''
+    yield b'pudding'
+    yield CACHE_SNAPSHOT_HEADER.pack(CACHE_SNAPSHOT_MAGIC, 0)
+
+
+@vampytest.raising(ValueError)
+@vampytest._(vampytest.call_from(_iter_options__from_bytes__value_error()))
+def test__CacheSnapshot__from_bytes__value_error(raw_snapshot):
+    """
+    Tests whether ``CacheSnapshot.from_bytes`` works as intended.
+    
+    Case: `ValueError`.
+    
+    Parameters
+    ----------
+    raw_snapshot : `bytes`
+        Value to load.
+    """
+    CacheSnapshot.from_bytes(raw_snapshot)
+
+
+def test__CacheSnapshot__save__load():
+    """
+    Tests whether ``CacheSnapshot.save`` and ``CacheSnapshot.load`` work as intended.
+    """
+    guild_id = 202610170940
+    guild, user = _create_guild(guild_id)
+    
+    with TemporaryDirectory() as directory:
+        path = join_paths(directory, 'snapshot')
+        CacheSnapshot([guild]).save(path)
+        
+        guild.name = 'okuu'
+        
+        cache_snapshot = CacheSnapshot.load(path)
+        _assert_fields_set(cache_snapshot)
+        
+        vampytest.assert_eq(cache_snapshot.guilds, [guild])
+        vampytest.assert_eq(guild.name, 'chiruno')
+
+
+def test__CacheSnapshot__reconcile():
+    """
+    Tests whether ``CacheSnapshot.reconcile`` works as intended.
+    """
+    guild_id_0 = 202610170950
+    guild_id_1 = 202610170960
+    guild_0, user_0 = _create_guild(guild_id_0)
+    guild_1, user_1 = _create_guild(guild_id_1)
+    
+    user_2 = User.precreate(202610170953, name = 'orin')
+    user_2.guild_profiles[guild_id_0] = GuildProfile(nick = 'rin')
+    guild_0.users[user_2.id] = user_2
+    
+    client = Client(
+        'token_202610170970',
+        client_id = 202610170971,
+    )
+    
+    try:
+        cache_snapshot = CacheSnapshot.from_bytes(CacheSnapshot([guild_0, guild_1]).to_bytes())
+        
+        # Received guild confirming only one of its users, the other one might have left meanwhile.
+        guild_0.clients.append(client)
+        guild_0.users.clear()
+        guild_0.users[user_2.id] = user_2
+        
+        cache_snapshot.reconcile()
+        
+        vampytest.assert_eq(cache_snapshot.guilds, [])
+        vampytest.assert_eq(cache_snapshot.users, {})
+        
+        vampytest.assert_eq(guild_0.users, {user_2.id: user_2})
+        vampytest.assert_in(guild_id_0, user_2.guild_profiles)
+        vampytest.assert_not_in(guild_id_0, user_0.guild_profiles)
+        vampytest.assert_not_in(guild_id_1, user_1.guild_profiles)
+    
+    finally:
+        guild_0.clients.clear()
+        client._delete()
+        client = None
+
+
+async def test__CacheSnapshot__attach():
+    """
+    Tests whether ``CacheSnapshot.attach`` works as intended.
+    
+    This function is a coroutine.
+    """
+    guild_id = 202610170980
+    guild, user = _create_guild(guild_id)
+    client = Client(
+        'token_202610170981',
+        client_id = 202610170982,
+    )
+    
+    try:
+        cache_snapshot = CacheSnapshot([guild])
+        cache_snapshot.attach(client)
+        
+        await client.events.ready(client)
+        vampytest.assert_eq(cache_snapshot.guilds, [])
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__get_cache_snapshot_path():
+    """
+    Tests whether ``get_cache_snapshot_path`` works as intended.
+    """
+    client = Client(
+        'token_202610171000',
+        client_id = 202610171001,
+    )
+    
+    try:
+        output = get_cache_snapshot_path(client, 'snapshots')
+        vampytest.assert_eq(output, join_paths('snapshots', '202610171001.snapshot'))
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__save_cache_snapshot__load_cache_snapshot():
+    """
+    Tests whether ``save_cache_snapshot`` and ``load_cache_snapshot`` work as intended.
+    """
+    guild_id = 202610171010
+    guild, user = _create_guild(guild_id)
+    client = Client(
+        'token_202610171011',
+        client_id = 202610171012,
+    )
+    
+    try:
+        with TemporaryDirectory() as directory:
+            directory = join_paths(directory, 'snapshots')
+            
+            output = load_cache_snapshot(client, directory)
+            vampytest.assert_is(output, None)
+            
+            client.guilds.add(guild)
+            output = save_cache_snapshot(client, directory)
+            vampytest.assert_true(output)
+            client.guilds.clear()
+            
+            guild.name = 'okuu'
+            
+            output = load_cache_snapshot(client, directory)
+            vampytest.assert_instance(output, CacheSnapshot)
+            vampytest.assert_eq(output.guilds, [guild])
+            vampytest.assert_eq(guild.name, 'chiruno')
+            vampytest.assert_eq(client.events.ready, output._handle_ready)
+    
+    finally:
+        client.guilds.clear()
+        client._delete()
+        client = None
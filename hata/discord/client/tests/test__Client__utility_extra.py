@@ -2,6 +2,8 @@ import vampytest
 
 from ...channel import Channel, ChannelType
 from ...core import USERS
+from ...guild import Guild
+from ...user import GuildProfile, User
 
 from ..client import Client
 
@@ -60,3 +62,73 @@ def test__Client__delete__2():
         vampytest.assert_in(client.id, USERS)
     finally:
         client = None
+
+
+def test__Client__maybe_replace_alter_ego__user_name_index():
+    """
+    Tests whether ``Client._maybe_replace_alter_ego`` works as intended.
+    
+    Case: The guild's user name index is updated.
+    """
+    guild_id = 202610171000
+    client_id = 202610171001
+    
+    client = Client(
+        'token_202610171002',
+        client_id = client_id,
+        name = 'satori',
+    )
+    
+    try:
+        # Replace the client with an alter ego, as it was received before the client was finalised
+        alter_ego = User._create_empty(client_id)
+        alter_ego.name = 'koishi'
+        alter_ego.guild_profiles[guild_id] = GuildProfile()
+        USERS[client_id] = alter_ego
+        guild = Guild.precreate(guild_id, users = [alter_ego])
+        
+        # Build the index
+        vampytest.assert_is(guild.get_user('koishi'), alter_ego)
+        
+        client._maybe_replace_alter_ego()
+        
+        vampytest.assert_is(guild.users[client_id], client)
+        vampytest.assert_is(guild.get_user('satori'), client)
+        vampytest.assert_is(guild.get_user('koishi'), None)
+    finally:
+        client._delete()
+        client = None
+
+
+def test__Client__delete__user_name_index():
+    """
+    Tests whether ``Client._delete`` works as intended.
+    
+    Case: The guild's user name index is updated.
+    """
+    guild_id = 202610171010
+    client_id = 202610171011
+    
+    client = Client(
+        'token_202610171012',
+        client_id = client_id,
+        name = 'satori',
+    )
+    
+    try:
+        # mark the client as finalised by setting it into `USERS`
+        USERS[client_id] = client
+        client.guild_profiles[guild_id] = GuildProfile(nick = 'orin')
+        guild = Guild.precreate(guild_id, users = [client])
+        
+        # Build the index
+        vampytest.assert_is(guild.get_user('orin'), client)
+        
+        client._delete()
+        
+        alter_ego = guild.users[client_id]
+        vampytest.assert_is_not(alter_ego, client)
+        vampytest.assert_is(guild.get_user('satori'), alter_ego)
+        vampytest.assert_is(guild.get_user('orin'), alter_ego)
+    finally:
+        client = None
@@ -0,0 +1,221 @@
+from multiprocessing import Pipe
+
+import vampytest
+
+from ..shard_cluster import (
+    SHARD_CLUSTER_MESSAGE_CONNECTED, SHARD_CLUSTER_MESSAGE_DISPATCH, SHARD_CLUSTER_MESSAGE_GUILD_CREATE,
+    SHARD_CLUSTER_MESSAGE_GUILD_DELETE, SHARD_CLUSTER_MESSAGE_READY, SHARD_CLUSTER_MESSAGE_STOP, ShardCluster,
+    _decode_shard_cluster_message, _encode_shard_cluster_message
+)
+
+
+def _assert_fields_set(cluster):
+    """
+    Asserts whether every field of the given shard cluster is set.
+    
+    Parameters
+    ----------
+    cluster : ``ShardCluster``
+        The shard cluster to check.
+    """
+    vampytest.assert_instance(cluster, ShardCluster)
+    vampytest.assert_instance(cluster._connections, list)
+    vampytest.assert_instance(cluster._processes, list)
+    vampytest.assert_instance(cluster.client_parameters, dict)
+    vampytest.assert_instance(cluster.connected_worker_indexes, set)
+    vampytest.assert_instance(cluster.guild_ids, dict)
+    vampytest.assert_instance(cluster.handlers, dict)
+    vampytest.assert_instance(cluster.ready_worker_indexes, set)
+    vampytest.assert_instance(cluster.shard_count, int)
+    vampytest.assert_instance(cluster.token, str)
+    vampytest.assert_instance(cluster.worker_shard_ids, tuple)
+
+
+def test__ShardCluster__new():
+    """
+    Tests whether ``ShardCluster.__new__`` works as intended.
+    """
+    cluster = ShardCluster('token_202610170400', shard_count = 5, worker_count = 2)
+    _assert_fields_set(cluster)
+    
+    vampytest.assert_eq(cluster.worker_shard_ids, ((0, 1, 2), (3, 4)))
+    vampytest.assert_eq(cluster._connections, [None, None])
+
+
+def test__ShardCluster__repr():
+    """
+    Tests whether ``ShardCluster.__repr__`` works as intended.
+    """
+    cluster = ShardCluster('token_202610170401', shard_count = 5, worker_count = 2)
+    
+    output = repr(cluster)
+    vampytest.assert_instance(output, str)
+
+
+def _iter_options__get_worker_index():
+    yield 0, 0
+    yield 2 << 22, 0
+    yield 3 << 22, 1
+    yield 9 << 22, 1
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_worker_index()).returning_last())
+def test__ShardCluster__get_worker_index(guild_id):
+    """
+    Tests whether ``ShardCluster.get_worker_index`` works as intended.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The guild's identifier.
+    
+    Returns
+    -------
+    output : `int`
+    """
+    cluster = ShardCluster('token_202610170402', shard_count = 5, worker_count = 2)
+    return cluster.get_worker_index(guild_id)
+
+
+def test__encode_shard_cluster_message():
+    """
+    Tests whether ``_encode_shard_cluster_message`` and ``_decode_shard_cluster_message`` work as intended.
+    """
+    raw_message = _encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_DISPATCH, 'pudding', {'koishi': 1})
+    vampytest.assert_instance(raw_message, bytes)
+    
+    output = _decode_shard_cluster_message(raw_message)
+    vampytest.assert_eq(output, (SHARD_CLUSTER_MESSAGE_DISPATCH, 'pudding', {'koishi': 1}))
+
+
+def test__ShardCluster__feed():
+    """
+    Tests whether ``ShardCluster.feed`` works as intended.
+    """
+    cluster = ShardCluster('token_202610170403', shard_count = 4, worker_count = 2)
+    
+    calls = []
+    
+    def handler(cluster, worker_index, data):
+        nonlocal calls
+        calls.append((worker_index, data))
+    
+    for name in ('connected', 'ready', 'guild_create', 'guild_delete', 'pudding'):
+        cluster.add_handler(name, handler)
+    
+    cluster.feed(1, _encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_CONNECTED, None, None))
+    vampytest.assert_eq(cluster.connected_worker_indexes, {1})
+    vampytest.assert_eq(cluster.ready_worker_indexes, set())
+    
+    cluster.feed(1, _encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_READY, None, [2, 3]))
+    vampytest.assert_eq(cluster.guild_ids, {2: 1, 3: 1})
+    vampytest.assert_eq(cluster.ready_worker_indexes, {1})
+    
+    cluster.feed(1, _encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_GUILD_CREATE, None, 4))
+    cluster.feed(1, _encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_GUILD_DELETE, None, 2))
+    vampytest.assert_eq(cluster.guild_ids, {3: 1, 4: 1})
+    
+    cluster.feed(0, _encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_DISPATCH, 'pudding', 'flan'))
+    
+    # Reconnecting worker replaces its guilds.
+    cluster.feed(1, _encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_READY, None, [5]))
+    vampytest.assert_eq(cluster.guild_ids, {5: 1})
+    
+    vampytest.assert_eq(calls, [(1, None), (1, [2, 3]), (1, 4), (1, 2), (0, 'flan'), (1, [5])])
+
+
+def test__ShardCluster__poll():
+    """
+    Tests whether ``ShardCluster.poll`` works as intended.
+    """
+    cluster = ShardCluster('token_202610170404', shard_count = 4, worker_count = 2)
+    
+    parent_connection_0, child_connection_0 = Pipe()
+    parent_connection_1, child_connection_1 = Pipe()
+    cluster._connections[:] = [parent_connection_0, parent_connection_1]
+    
+    try:
+        child_connection_0.send_bytes(_encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_READY, None, [6]))
+        child_connection_1.send_bytes(_encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_READY, None, [7]))
+        
+        while len(cluster.ready_worker_indexes) < 2:
+            output = cluster.poll(1.0)
+            vampytest.assert_true(output)
+        
+        vampytest.assert_eq(cluster.guild_ids, {6: 0, 7: 1})
+        
+        # Closed worker connection drops the worker's guilds.
+        child_connection_1.close()
+        output = cluster.poll(1.0)
+        vampytest.assert_true(output)
+        vampytest.assert_eq(cluster._connections, [parent_connection_0, None])
+        vampytest.assert_eq(cluster.guild_ids, {6: 0})
+        
+        cluster.stop()
+        output = _decode_shard_cluster_message(child_connection_0.recv_bytes())
+        vampytest.assert_eq(output, (SHARD_CLUSTER_MESSAGE_STOP, None, None))
+    
+    finally:
+        parent_connection_0.close()
+        parent_connection_1.close()
+        child_connection_0.close()
+        child_connection_1.close()
+
+
+def test__ShardCluster__start():
+    """
+    Tests whether ``ShardCluster.start`` works as intended.
+    
+    Case: The worker connects, but it does not get ready.
+    """
+    class TestShardCluster(ShardCluster):
+        __slots__ = ()
+        
+        def _start_worker(self, worker_index):
+            parent_connection, child_connection = Pipe()
+            child_connections.append(child_connection)
+            child_connection.send_bytes(_encode_shard_cluster_message(SHARD_CLUSTER_MESSAGE_CONNECTED, None, None))
+            self._connections[worker_index] = parent_connection
+    
+    child_connections = []
+    cluster = TestShardCluster('token_202610170405', shard_count = 2, worker_count = 1)
+    
+    try:
+        output = cluster.start(1.0)
+        vampytest.assert_instance(output, bool)
+        vampytest.assert_true(output)
+        vampytest.assert_eq(cluster.connected_worker_indexes, {0})
+        vampytest.assert_eq(cluster.ready_worker_indexes, set())
+    
+    finally:
+        for connection in (*cluster._connections, *child_connections):
+            if (connection is not None):
+                connection.close()
+
+
+def test__ShardCluster__start__timeout():
+    """
+    Tests whether ``ShardCluster.start`` works as intended.
+    
+    Case: The worker does not connect in time.
+    """
+    class TestShardCluster(ShardCluster):
+        __slots__ = ()
+        
+        def _start_worker(self, worker_index):
+            parent_connection, child_connection = Pipe()
+            child_connections.append(child_connection)
+            self._connections[worker_index] = parent_connection
+    
+    child_connections = []
+    cluster = TestShardCluster('token_202610170406', shard_count = 2, worker_count = 1)
+    
+    try:
+        output = cluster.start(0.01)
+        vampytest.assert_instance(output, bool)
+        vampytest.assert_false(output)
+    
+    finally:
+        for connection in (*cluster._connections, *child_connections):
+            if (connection is not None):
+                connection.close()
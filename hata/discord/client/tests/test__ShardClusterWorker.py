@@ -0,0 +1,103 @@
+from multiprocessing import Pipe
+
+import vampytest
+
+from ...guild import Guild
+
+from ..client import Client
+from ..shard_cluster import (
+    SHARD_CLUSTER_MESSAGE_CONNECTED, SHARD_CLUSTER_MESSAGE_DISPATCH, SHARD_CLUSTER_MESSAGE_GUILD_CREATE,
+    SHARD_CLUSTER_MESSAGE_GUILD_DELETE, SHARD_CLUSTER_MESSAGE_READY, ShardClusterWorker, _decode_shard_cluster_message
+)
+
+
+def _assert_fields_set(worker):
+    """
+    Asserts whether every field of the given shard cluster worker is set.
+    
+    Parameters
+    ----------
+    worker : ``ShardClusterWorker``
+        The shard cluster worker to check.
+    """
+    vampytest.assert_instance(worker, ShardClusterWorker)
+    vampytest.assert_instance(worker.client, Client)
+    vampytest.assert_instance(worker.shard_ids, tuple)
+    vampytest.assert_instance(worker.worker_index, int)
+
+
+def test__ShardClusterWorker__new():
+    """
+    Tests whether ``ShardClusterWorker.__new__`` works as intended.
+    """
+    client = Client(
+        'token_202610170500',
+        client_id = 202610170501,
+        shard_count = 4,
+    )
+    parent_connection, child_connection = Pipe()
+    
+    try:
+        worker = ShardClusterWorker(client, child_connection, 1, (2, 3))
+        _assert_fields_set(worker)
+        
+        vampytest.assert_is(worker.connection, child_connection)
+        vampytest.assert_eq(worker.shard_ids, (2, 3))
+        vampytest.assert_eq(worker.worker_index, 1)
+        
+        output = repr(worker)
+        vampytest.assert_instance(output, str)
+    
+    finally:
+        parent_connection.close()
+        child_connection.close()
+        client._delete()
+        client = None
+
+
+async def test__ShardClusterWorker__forwarding():
+    """
+    Tests whether ``ShardClusterWorker`` forwards the events to the cluster.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_202610170502',
+        client_id = 202610170503,
+        shard_count = 4,
+    )
+    parent_connection, child_connection = Pipe()
+    guild = Guild.precreate(202610170504)
+    
+    try:
+        worker = ShardClusterWorker(client, child_connection, 1, (2, 3))
+        client.guilds.add(guild)
+        
+        worker._handle_connected()
+        await worker._handle_ready(client)
+        await worker._handle_guild_create(client, guild)
+        await worker._handle_guild_delete(client, guild, None)
+        worker.send('pudding', {'flan': 2})
+        
+        output = [_decode_shard_cluster_message(parent_connection.recv_bytes()) for _ in range(5)]
+        vampytest.assert_eq(
+            output,
+            [
+                (SHARD_CLUSTER_MESSAGE_CONNECTED, None, None),
+                (SHARD_CLUSTER_MESSAGE_READY, None, [guild.id]),
+                (SHARD_CLUSTER_MESSAGE_GUILD_CREATE, None, guild.id),
+                (SHARD_CLUSTER_MESSAGE_GUILD_DELETE, None, guild.id),
+                (SHARD_CLUSTER_MESSAGE_DISPATCH, 'pudding', {'flan': 2}),
+            ],
+        )
+        
+        # The cluster is gone, should not raise.
+        parent_connection.close()
+        worker.send('pudding', None)
+    
+    finally:
+        parent_connection.close()
+        child_connection.close()
+        client.guilds.discard(guild)
+        client._delete()
+        client = None
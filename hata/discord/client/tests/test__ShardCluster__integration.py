@@ -0,0 +1,453 @@
+from functools import partial as partial_func
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import environ
+from threading import Thread
+from time import monotonic, sleep as blocking_sleep
+from zlib import Z_SYNC_FLUSH, compressobj as create_zlib_compressor
+
+import vampytest
+from scarletio import from_json, run_coroutine, to_json
+from scarletio.web_common import ConnectionClosed
+from scarletio.web_socket import WebSocketServer
+
+from ...core import KOKORO
+from ...gateway.constants import (
+    GATEWAY_OPERATION_CLIENT_DISPATCH, GATEWAY_OPERATION_CLIENT_HEARTBEAT,
+    GATEWAY_OPERATION_CLIENT_HEARTBEAT_ACKNOWLEDGE, GATEWAY_OPERATION_CLIENT_HELLO, GATEWAY_OPERATION_CLIENT_IDENTIFY
+)
+
+from ..shard_cluster import SHARD_CLUSTER_IDENTIFY_INTERVAL, ShardCluster
+
+
+APPLICATION_ID = 202610171200
+CLIENT_ID = 202610171201
+SHARD_COUNT = 4
+TOKEN = 'token_202610171202'
+WORKER_COUNT = 2
+
+TIMEOUT = 60.0
+
+
+def _get_guild_id(shard_id, joined):
+    """
+    Returns a guild identifier which belongs to the given shard.
+    
+    Parameters
+    ----------
+    shard_id : `int`
+        The shard's identifier.
+    joined : `bool`
+        Whether to return the identifier of the guild joined after ready, or the one received on ready.
+    
+    Returns
+    -------
+    guild_id : `int`
+    """
+    return ((1000 + joined) * SHARD_COUNT + shard_id) << 22
+
+
+def _setup_worker(client, worker):
+    """
+    Registers an event handler forwarding the name of the created guilds as a custom event to the cluster.
+    
+    Ran inside of the worker processes.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The worker's client.
+    worker : ``ShardClusterWorker``
+        The worker.
+    """
+    async def guild_create(client, guild):
+        worker.send('guild_name', [guild.id, guild.name])
+    
+    client.events(guild_create, name = 'guild_create')
+
+
+class FakeRestRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answers the requests done by the workers' clients while logging in.
+    """
+    def do_GET(self):
+        """
+        Answers a get request.
+        """
+        path = self.path
+        if path == '/users/@me':
+            status = 200
+            data = {
+                'id': str(CLIENT_ID),
+                'username': 'cluster',
+                'discriminator': '0',
+                'avatar': None,
+                'bot': True,
+            }
+        
+        elif path == '/gateway/bot':
+            status = 200
+            data = {
+                'url': self.server.gateway_url,
+                'shards': SHARD_COUNT,
+                'session_start_limit': {
+                    'total': 1000,
+                    'remaining': 1000,
+                    'reset_after': 0,
+                    'max_concurrency': SHARD_COUNT,
+                },
+            }
+        
+        else:
+            status = 404
+            data = {
+                'code': 0,
+                'message': '404: Not Found',
+            }
+        
+        body = to_json(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    
+    def log_message(self, format, *parameters):
+        """
+        Silences request logging.
+        """
+        pass
+
+
+class FakeGateway:
+    """
+    Gateway server speaking enough of the protocol to get shards connected and ready.
+    
+    Attributes
+    ----------
+    closes : `list<(int, int)>`
+        The shards' identifiers and close codes of the closed connections in order.
+    identifies : `list<(float, dict<str, object>)>`
+        The received identify payloads and their receive time in order.
+    web_sockets : `dict<int, (WebSocketServerProtocol, zlib.Compress, list<int>)>`
+        Connected web sockets, their compressor and their sequence by shard identifier.
+    """
+    __slots__ = ('closes', 'identifies', 'web_sockets')
+    
+    def __new__(cls):
+        """
+        Creates a new fake gateway.
+        """
+        self = object.__new__(cls)
+        self.closes = []
+        self.identifies = []
+        self.web_sockets = {}
+        return self
+    
+    
+    async def _send(self, web_socket, compressor, data):
+        """
+        Sends a zlib-stream compressed message on the given web socket.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        web_socket : ``WebSocketServerProtocol``
+            The web socket to send the message on.
+        compressor : `zlib.Compress`
+            The connection's compressor.
+        data : `dict<str, object>`
+            The message to send.
+        """
+        await web_socket.send(compressor.compress(to_json(data).encode()) + compressor.flush(Z_SYNC_FLUSH))
+    
+    
+    async def dispatch(self, shard_id, event, data):
+        """
+        Dispatches an event to the given shard.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        shard_id : `int`
+            The shard's identifier.
+        event : `str`
+            The event's name.
+        data : `dict<str, object>`
+            The event's payload.
+        """
+        web_socket, compressor, sequence = self.web_sockets[shard_id]
+        sequence[0] += 1
+        await self._send(
+            web_socket,
+            compressor,
+            {
+                'op': GATEWAY_OPERATION_CLIENT_DISPATCH,
+                's': sequence[0],
+                't': event,
+                'd': data,
+            },
+        )
+    
+    
+    async def __call__(self, web_socket):
+        """
+        Handles a connected shard.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        web_socket : ``WebSocketServerProtocol``
+            The connected web socket.
+        """
+        compressor = create_zlib_compressor()
+        sequence = [0]
+        shard_id = -1
+        
+        await self._send(
+            web_socket,
+            compressor,
+            {
+                'op': GATEWAY_OPERATION_CLIENT_HELLO,
+                'd': {
+                    'heartbeat_interval': 45000,
+                },
+            },
+        )
+        
+        try:
+            while True:
+                message = from_json(await web_socket.receive())
+                operation = message['op']
+                
+                if operation == GATEWAY_OPERATION_CLIENT_HEARTBEAT:
+                    await self._send(web_socket, compressor, {'op': GATEWAY_OPERATION_CLIENT_HEARTBEAT_ACKNOWLEDGE})
+                    continue
+                
+                if operation != GATEWAY_OPERATION_CLIENT_IDENTIFY:
+                    continue
+                
+                identify_data = message['d']
+                self.identifies.append((monotonic(), identify_data))
+                shard_id = identify_data['shard'][0]
+                self.web_sockets[shard_id] = (web_socket, compressor, sequence)
+                
+                guild_id = _get_guild_id(shard_id, False)
+                
+                await self.dispatch(
+                    shard_id,
+                    'READY',
+                    {
+                        'v': 10,
+                        'application': {
+                            'id': str(APPLICATION_ID),
+                            'flags': 0,
+                        },
+                        'guilds': [
+                            {
+                                'id': str(guild_id),
+                                'unavailable': True,
+                            },
+                        ],
+                        'session_id': f'session_{shard_id}',
+                        'shard': [shard_id, SHARD_COUNT],
+                        'user': {
+                            'id': str(CLIENT_ID),
+                            'username': 'cluster',
+                            'discriminator': '0',
+                            'avatar': None,
+                            'bot': True,
+                        },
+                    },
+                )
+                
+                await self.dispatch(
+                    shard_id,
+                    'GUILD_CREATE',
+                    {
+                        'id': str(guild_id),
+                        'name': f'ready_{shard_id}',
+                    },
+                )
+        
+        except ConnectionClosed as exception:
+            self.closes.append((shard_id, exception.code))
+
+
+async def _start_gateway_server(gateway):
+    """
+    Starts the gateway server on a free local port.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    gateway : ``FakeGateway``
+        The gateway handling the connections.
+    
+    Returns
+    -------
+    server : ``WebSocketServer``
+    """
+    return await WebSocketServer(KOKORO, '127.0.0.1', 0, gateway)
+
+
+async def _close_gateway_server(server):
+    """
+    Closes the gateway server.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    server : ``WebSocketServer``
+        The server to close.
+    """
+    await server.close()
+
+
+def _poll_until(cluster, check):
+    """
+    Processes the messages of the cluster's workers till `check` returns `True`.
+    
+    Parameters
+    ----------
+    cluster : ``ShardCluster``
+        The cluster to poll.
+    check : `callable`
+        Called after every poll without parameters.
+    """
+    deadline = monotonic() + TIMEOUT
+    while not check():
+        timeout = deadline - monotonic()
+        vampytest.assert_true(timeout > 0.0)
+        vampytest.assert_true(cluster.poll(timeout))
+
+
+def test__ShardCluster__integration():
+    """
+    Tests whether ``ShardCluster`` works as intended.
+    
+    Case: Workers connecting to a local gateway, receiving events and shutting down.
+    """
+    gateway = FakeGateway()
+    gateway_server = run_coroutine(_start_gateway_server(gateway), KOKORO)
+    gateway_port = gateway_server.server.sockets[0].getsockname()[1]
+    
+    rest_server = ThreadingHTTPServer(('127.0.0.1', 0), FakeRestRequestHandler)
+    rest_server.gateway_url = f'ws://127.0.0.1:{gateway_port}/'
+    rest_thread = Thread(target = rest_server.serve_forever, daemon = True)
+    rest_thread.start()
+    
+    # Worker processes are spawned, so they import the library again with the environment of this process.
+    old_api_endpoint = environ.get('HATA_API_ENDPOINT', None)
+    environ['HATA_API_ENDPOINT'] = f'http://127.0.0.1:{rest_server.server_address[1]}'
+    
+    events = []
+    
+    def handler(name, cluster, worker_index, data):
+        nonlocal events
+        events.append((name, worker_index, data))
+    
+    cluster = ShardCluster(TOKEN, _setup_worker, shard_count = SHARD_COUNT, worker_count = WORKER_COUNT)
+    for name in ('connected', 'ready', 'guild_create', 'guild_name'):
+        cluster.add_handler(name, partial_func(handler, name))
+    
+    try:
+        vampytest.assert_true(cluster.start(TIMEOUT))
+        _poll_until(cluster, lambda: len(cluster.ready_worker_indexes) == WORKER_COUNT)
+        
+        vampytest.assert_eq(
+            cluster.guild_ids,
+            {_get_guild_id(shard_id, False): shard_id // 2 for shard_id in range(SHARD_COUNT)},
+        )
+        
+        # Guilds joined after ready are dispatched.
+        for shard_id in range(SHARD_COUNT):
+            run_coroutine(
+                gateway.dispatch(
+                    shard_id,
+                    'GUILD_CREATE',
+                    {
+                        'id': str(_get_guild_id(shard_id, True)),
+                        'name': f'joined_{shard_id}',
+                    },
+                ),
+                KOKORO,
+            )
+        
+        _poll_until(cluster, lambda: sum(event[0] == 'guild_name' for event in events) == SHARD_COUNT)
+        _poll_until(cluster, lambda: len(cluster.guild_ids) == SHARD_COUNT * 2)
+        
+        processes = [*cluster._processes]
+    
+    finally:
+        cluster.stop(TIMEOUT)
+        
+        if old_api_endpoint is None:
+            del environ['HATA_API_ENDPOINT']
+        else:
+            environ['HATA_API_ENDPOINT'] = old_api_endpoint
+        
+        rest_server.shutdown()
+        rest_server.server_close()
+    
+    try:
+        # Identify ordering: the second worker identifies only after the first one's shards identified and the
+        # identify interval passed.
+        identify_shard_ids = [identify_data['shard'] for receive_time, identify_data in gateway.identifies]
+        vampytest.assert_eq(sorted(identify_shard_ids[:2]), [[0, SHARD_COUNT], [1, SHARD_COUNT]])
+        vampytest.assert_eq(sorted(identify_shard_ids[2:]), [[2, SHARD_COUNT], [3, SHARD_COUNT]])
+        vampytest.assert_true(
+            gateway.identifies[2][0] - gateway.identifies[1][0] >= SHARD_CLUSTER_IDENTIFY_INTERVAL
+        )
+        
+        for receive_time, identify_data in gateway.identifies:
+            vampytest.assert_eq(identify_data['token'], TOKEN)
+        
+        # Dispatch: the events arrive from the worker owning the shard.
+        vampytest.assert_eq(
+            [event for event in events if event[0] == 'connected'],
+            [('connected', 0, None), ('connected', 1, None)],
+        )
+        
+        vampytest.assert_eq(
+            sorted(event for event in events if event[0] == 'ready'),
+            [
+                ('ready', 0, sorted(_get_guild_id(shard_id, False) for shard_id in (0, 1))),
+                ('ready', 1, sorted(_get_guild_id(shard_id, False) for shard_id in (2, 3))),
+            ],
+        )
+        
+        vampytest.assert_eq(
+            sorted(event for event in events if event[0] == 'guild_create'),
+            [('guild_create', shard_id // 2, _get_guild_id(shard_id, True)) for shard_id in range(SHARD_COUNT)],
+        )
+        
+        vampytest.assert_eq(
+            sorted(event for event in events if event[0] == 'guild_name'),
+            [
+                ('guild_name', shard_id // 2, [_get_guild_id(shard_id, True), f'joined_{shard_id}'])
+                for shard_id in range(SHARD_COUNT)
+            ],
+        )
+        
+        # Shutdown: every worker exited by itself, closing its shards' connections.
+        for process in processes:
+            vampytest.assert_eq(process.exitcode, 0)
+        
+        vampytest.assert_eq(cluster._connections, [None] * WORKER_COUNT)
+        vampytest.assert_eq(cluster._processes, [None] * WORKER_COUNT)
+        vampytest.assert_eq(cluster.guild_ids, {})
+        
+        deadline = monotonic() + TIMEOUT
+        while (len(gateway.closes) < SHARD_COUNT) and (monotonic() < deadline):
+            blocking_sleep(0.1)
+        
+        vampytest.assert_eq(sorted(gateway.closes), [(shard_id, 1000) for shard_id in range(SHARD_COUNT)])
+    
+    finally:
+        run_coroutine(_close_gateway_server(gateway_server), KOKORO)
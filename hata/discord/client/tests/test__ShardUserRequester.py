@@ -0,0 +1,130 @@
+import vampytest
+from scarletio import skip_ready_cycle
+
+from ...gateway.client_base import DiscordGatewayClientBase
+from ...gateway.constants import GATEWAY_OPERATION_CLIENT_REQUEST_GUILD_USERS
+
+from ..ready_state import (
+    READY_STATE_TO_DO_GUILD_IDS, ShardUserRequester, USER_REQUEST_STATE_DONE, USER_REQUEST_STATE_NONE
+)
+
+
+class TestGateway(DiscordGatewayClientBase):
+    __slots__ = ('delays', 'sent')
+    
+    def __new__(cls, delays):
+        self = object.__new__(cls)
+        self.delays = delays
+        self.sent = []
+        return self
+    
+    
+    def get_rate_limit_delay(self, reserve):
+        delays = self.delays
+        if delays:
+            return delays.pop(0)
+        
+        return 0.0
+    
+    
+    async def send_as_json(self, data):
+        vampytest.assert_eq(data['op'], GATEWAY_OPERATION_CLIENT_REQUEST_GUILD_USERS)
+        self.sent.append(data['d']['guild_id'])
+
+
+def _assert_fields_set(shard_user_requester):
+    """
+    Asserts whether every field of the given shard user requester is set.
+    
+    Parameters
+    ----------
+    shard_user_requester : ``ShardUserRequester``
+        The shard user requester to check.
+    """
+    vampytest.assert_instance(shard_user_requester, ShardUserRequester)
+    vampytest.assert_instance(shard_user_requester.can_request_users, bool)
+    vampytest.assert_instance(shard_user_requester.gateway, DiscordGatewayClientBase)
+    vampytest.assert_instance(shard_user_requester.guild_count, int)
+    vampytest.assert_instance(shard_user_requester.guild_ids, set)
+    vampytest.assert_instance(shard_user_requester.received_guild_ids, list)
+    vampytest.assert_instance(shard_user_requester.request_count, int)
+    vampytest.assert_instance(shard_user_requester.state, int)
+
+
+async def test__ShardUserRequester__new():
+    """
+    Tests whether ``ShardUserRequester.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    gateway = TestGateway([])
+    guild_ids = {202610170700, 202610170701}
+    
+    shard_user_requester = ShardUserRequester(gateway, guild_ids, True)
+    try:
+        _assert_fields_set(shard_user_requester)
+        
+        vampytest.assert_is(shard_user_requester.gateway, gateway)
+        vampytest.assert_is(shard_user_requester.guild_ids, guild_ids)
+        vampytest.assert_eq(shard_user_requester.guild_count, 2)
+        vampytest.assert_eq(shard_user_requester.state, USER_REQUEST_STATE_NONE)
+    
+    finally:
+        shard_user_requester.cancel()
+
+
+async def test__ShardUserRequester__runner():
+    """
+    Tests whether ``ShardUserRequester._runner`` works as intended.
+    
+    Case: Larger guilds first, waiting for the rate limit.
+    
+    This function is a coroutine.
+    """
+    guild_id_0 = 202610170702
+    guild_id_1 = 202610170703
+    guild_id_2 = 202610170704
+    guild_id_3 = 202610170705
+    
+    gateway = TestGateway([0.0, 0.001])
+    guild_ids = {guild_id_0, guild_id_1, guild_id_2, guild_id_3}
+    READY_STATE_TO_DO_GUILD_IDS.update(guild_ids)
+    
+    shard_user_requester = ShardUserRequester(gateway, guild_ids, True)
+    try:
+        vampytest.assert_true(shard_user_requester.feed(guild_id_0, True, 10))
+        vampytest.assert_true(shard_user_requester.feed(guild_id_1, True, 300))
+        vampytest.assert_true(shard_user_requester.feed(guild_id_2, False, 500))
+        vampytest.assert_true(shard_user_requester.feed(guild_id_3, True, 20))
+        vampytest.assert_false(shard_user_requester.feed(202610170706, True, 20))
+        
+        vampytest.assert_eq(
+            shard_user_requester.get_progress(),
+            {
+                'guild_count': 4,
+                'guilds_left': 4,
+                'guilds_queued': 4,
+                'request_count': 0,
+            },
+        )
+        
+        task = shard_user_requester.task
+        vampytest.assert_is_not(task, None)
+        await task
+        
+        vampytest.assert_eq(shard_user_requester.state, USER_REQUEST_STATE_DONE)
+        vampytest.assert_eq(gateway.sent, [guild_id_1, guild_id_3, guild_id_0])
+        vampytest.assert_eq(
+            shard_user_requester.get_progress(),
+            {
+                'guild_count': 4,
+                'guilds_left': 0,
+                'guilds_queued': 0,
+                'request_count': 3,
+            },
+        )
+    
+    finally:
+        shard_user_requester.cancel()
+        READY_STATE_TO_DO_GUILD_IDS.difference_update((guild_id_0, guild_id_1, guild_id_2, guild_id_3))
+        await skip_ready_cycle()
@@ -0,0 +1,54 @@
+import vampytest
+
+from ..shard_cluster import partition_shard_ids
+
+
+def _iter_options__passing():
+    yield 1, 1, ((0,),)
+    yield 4, 2, ((0, 1), (2, 3))
+    yield 5, 2, ((0, 1, 2), (3, 4))
+    yield 7, 3, ((0, 1, 2), (3, 4), (5, 6))
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+def test__partition_shard_ids__passing(shard_count, worker_count):
+    """
+    Tests whether ``partition_shard_ids`` works as intended.
+    
+    Case: passing.
+    
+    Parameters
+    ----------
+    shard_count : `int`
+        The total amount of shards.
+    worker_count : `int`
+        The amount of workers.
+    
+    Returns
+    -------
+    output : `tuple<tuple<int>>`
+    """
+    return partition_shard_ids(shard_count, worker_count)
+
+
+def _iter_options__value_error():
+    yield 4, 0
+    yield 2, 3
+
+
+@vampytest.raising(ValueError)
+@vampytest._(vampytest.call_from(_iter_options__value_error()))
+def test__partition_shard_ids__value_error(shard_count, worker_count):
+    """
+    Tests whether ``partition_shard_ids`` works as intended.
+    
+    Case: `ValueError`.
+    
+    Parameters
+    ----------
+    shard_count : `int`
+        The total amount of shards.
+    worker_count : `int`
+        The amount of workers.
+    """
+    partition_shard_ids(shard_count, worker_count)
@@ -117,6 +117,8 @@ Resolution Tables
     Contains each builtin (unicode) ``Emoji`` by name.
     
     Version selector 16 emojis can be also access by putting `_vs16` postfix after their name.
+    
+    The builtin emojis are created when either `BUILTIN_EMOJIS` or `UNICODE_TO_EMOJI` is accessed first.
 
 - `UNICODE_TO_EMOJI` : `dict`
     
@@ -158,7 +160,10 @@ __all__ = (
     'TEAMS', 'UNICODE_TO_EMOJI', 'USERS'
 )
 
-from scarletio import WeakKeyDictionary, WeakValueDictionary, create_event_loop, get_event_loop
+from scarletio import WeakKeyDictionary, WeakValueDictionary, create_event_loop, get_event_loop, include
+
+
+create_builtin_emojis = include('create_builtin_emojis')
 
 
 CLIENTS = {}
@@ -192,8 +197,90 @@ APPLICATION_ID_TO_CLIENT = {}
 INTERACTION_EVENT_RESPONSE_WAITERS = WeakValueDictionary()
 INTERACTION_EVENT_MESSAGE_WAITERS = WeakKeyDictionary()
 
-BUILTIN_EMOJIS = {}
-UNICODE_TO_EMOJI = {}
+
+class BuiltinEmojiTable(dict):
+    """
+    Builtin emoji table with its builtin emojis created.
+    """
+    __slots__ = ()
+
+
+BUILTIN_EMOJIS_LOADING = False
+
+
+def _load_builtin_emojis():
+    """
+    Creates the builtin emojis, then marks the builtin emoji tables as loaded.
+    
+    If creating the builtin emojis fails, the tables are cleared and they are tried to be loaded again on next access.
+    """
+    global BUILTIN_EMOJIS_LOADING
+    
+    # The tables are filled up while loading; do not start loading again.
+    if BUILTIN_EMOJIS_LOADING:
+        return
+    
+    BUILTIN_EMOJIS_LOADING = True
+    try:
+        try:
+            create_builtin_emojis()
+        except:
+            dict.clear(BUILTIN_EMOJIS)
+            dict.clear(UNICODE_TO_EMOJI)
+            raise
+        
+        BUILTIN_EMOJIS.__class__ = BuiltinEmojiTable
+        UNICODE_TO_EMOJI.__class__ = BuiltinEmojiTable
+    finally:
+        BUILTIN_EMOJIS_LOADING = False
+
+
+def _lazy_builtin_emoji_table_method_factory(dict_method):
+    """
+    Creates a method, which creates the builtin emojis before calling the given `dict` method.
+    
+    Parameters
+    ----------
+    dict_method : `MethodDescriptorType | WrapperDescriptorType`
+        The `dict` method to call.
+    
+    Returns
+    -------
+    method : `FunctionType`
+    """
+    def method(self, *positional_parameters, **keyword_parameters):
+        _load_builtin_emojis()
+        return dict_method(self, *positional_parameters, **keyword_parameters)
+    
+    method.__name__ = dict_method.__name__
+    method.__doc__ = dict_method.__doc__
+    return method
+
+
+class LazyBuiltinEmojiTable(dict):
+    """
+    Builtin emoji table, which creates the builtin emojis on first access. Then it becomes a ``BuiltinEmojiTable``,
+    so later accesses are not slowed down.
+    """
+    __slots__ = ()
+    
+    for method_name in (
+        '__contains__', '__delitem__', '__eq__', '__getitem__', '__ior__', '__iter__', '__len__', '__ne__', '__or__',
+        '__repr__', '__reversed__', '__ror__', '__setitem__', 'clear', 'copy', 'get', 'items', 'keys', 'pop',
+        'popitem', 'setdefault', 'update', 'values',
+    ):
+        # `__or__`, `__ror__`, `__ior__` and `__reversed__` are not defined on older python versions.
+        dict_method = getattr(dict, method_name, None)
+        if (dict_method is not None):
+            locals()[method_name] = _lazy_builtin_emoji_table_method_factory(dict_method)
+    
+    del method_name, dict_method
+    
+    __hash__ = None
+
+
+BUILTIN_EMOJIS = LazyBuiltinEmojiTable()
+UNICODE_TO_EMOJI = LazyBuiltinEmojiTable()
 
 try:
     KOKORO = get_event_loop()
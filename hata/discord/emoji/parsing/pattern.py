@@ -2,11 +2,11 @@ __all__ = ('EMOJI_ALL_RP',)
 
 from re import compile as re_compile, escape as re_escape, U as re_unicode
 
-from scarletio import call
+from scarletio import RichAttributeErrorBaseType
 
 from ...utils import EMOJI_RP
 
-from ..unicode.unicodes import UNICODES
+from ..unicode.unicodes import get_unicodes
 
 
 def trie_node_sort_key(node):
@@ -196,9 +196,6 @@ class TrieNode:
         return into
 
 
-EMOJI_ALL_RP = EMOJI_RP
-
-@call
 def build_all_emoji_pattern():
     """
     Builds an emoji matching pattern which matches not only the custom, but the custom emojis as well.
@@ -207,13 +204,13 @@ def build_all_emoji_pattern():
     -------
     pattern : `re.Pattern`
     """
-    global EMOJI_ALL_RP
+    unicodes = get_unicodes()
     
     into = []
     into.append('(?:(')
     
     pattern_core = TrieNode(None)
-    for unicode in UNICODES:
+    for unicode in unicodes:
         pattern_core.extend_with_raw_string(unicode.value)
         for value in unicode.iter_unicode_aliases():
             pattern_core.extend_with_raw_string(value)
@@ -224,7 +221,7 @@ def build_all_emoji_pattern():
     into.append(')|(?<!\\\\)\\:(')
     
     pattern_core = TrieNode(None)
-    for unicode in UNICODES:
+    for unicode in unicodes:
         pattern_core.extend_with_raw_string(unicode.name)
         for alias in unicode.iter_aliases():
             pattern_core.extend_with_raw_string(alias)
@@ -236,4 +233,67 @@ def build_all_emoji_pattern():
     into.append(EMOJI_RP.pattern)
     into.append(')')
     
-    EMOJI_ALL_RP = re_compile(''.join(into), re_unicode)
+    return re_compile(''.join(into), re_unicode)
+
+
+class LazyPattern(RichAttributeErrorBaseType):
+    """
+    Pattern built on first use. Its attributes are looked up from the built pattern.
+    
+    Attributes
+    ----------
+    _builder : `FunctionType`
+        Function to build the pattern with.
+    
+    _pattern : `None | re.Pattern`
+        The built pattern.
+    """
+    __slots__ = ('_builder', '_pattern')
+    
+    def __new__(cls, builder):
+        """
+        Creates a new lazy pattern.
+        
+        Parameters
+        ----------
+        builder : `FunctionType`
+            Function to build the pattern with.
+        """
+        self = object.__new__(cls)
+        self._builder = builder
+        self._pattern = None
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the lazy pattern's representation."""
+        return ''.join([
+            '<', type(self).__name__,
+            ' builder = ', self._builder.__name__,
+            ', built = ', repr(self._pattern is not None),
+            '>',
+        ])
+    
+    
+    def __getattr__(self, attribute_name):
+        """Returns the built pattern's attribute. Builds the pattern if not yet built."""
+        return getattr(self.get_pattern(), attribute_name)
+    
+    
+    def get_pattern(self):
+        """
+        Returns the built pattern. Builds it if not yet built.
+        
+        Returns
+        -------
+        pattern : `re.Pattern`
+        """
+        pattern = self._pattern
+        if pattern is None:
+            pattern = self._builder()
+            self._pattern = pattern
+        
+        return pattern
+
+
+EMOJI_ALL_RP = LazyPattern(build_all_emoji_pattern)
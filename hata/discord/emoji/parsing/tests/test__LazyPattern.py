@@ -0,0 +1,86 @@
+from re import compile as re_compile
+from types import FunctionType
+
+import vampytest
+
+from ..pattern import EMOJI_ALL_RP, LazyPattern
+
+
+def _assert_fields_set(lazy_pattern):
+    """
+    Asserts whether every fields are set of the given lazy pattern.
+    
+    Parameters
+    ----------
+    lazy_pattern : ``LazyPattern``
+        The lazy pattern to check.
+    """
+    vampytest.assert_instance(lazy_pattern, LazyPattern)
+    vampytest.assert_instance(lazy_pattern._builder, FunctionType)
+    vampytest.assert_instance(lazy_pattern._pattern, type(re_compile('')), nullable = True)
+
+
+def test__LazyPattern__new():
+    """
+    Tests whether ``LazyPattern.__new__`` works as intended.
+    """
+    def builder():
+        return re_compile('koishi')
+    
+    lazy_pattern = LazyPattern(builder)
+    _assert_fields_set(lazy_pattern)
+    vampytest.assert_is(lazy_pattern._builder, builder)
+    vampytest.assert_is(lazy_pattern._pattern, None)
+
+
+def test__LazyPattern__repr():
+    """
+    Tests whether ``LazyPattern.__repr__`` works as intended.
+    """
+    def builder():
+        return re_compile('koishi')
+    
+    lazy_pattern = LazyPattern(builder)
+    
+    output = repr(lazy_pattern)
+    vampytest.assert_instance(output, str)
+
+
+def test__LazyPattern__get_pattern():
+    """
+    Tests whether ``LazyPattern.get_pattern`` builds the pattern only once.
+    """
+    call_count = 0
+    
+    def builder():
+        nonlocal call_count
+        call_count += 1
+        return re_compile('koishi')
+    
+    lazy_pattern = LazyPattern(builder)
+    
+    output = lazy_pattern.get_pattern()
+    vampytest.assert_eq(output.pattern, 'koishi')
+    vampytest.assert_is(lazy_pattern.get_pattern(), output)
+    vampytest.assert_eq(call_count, 1)
+
+
+def test__LazyPattern__getattr():
+    """
+    Tests whether ``LazyPattern.__getattr__`` looks up the attributes of the built pattern.
+    """
+    def builder():
+        return re_compile('ko(i)shi')
+    
+    lazy_pattern = LazyPattern(builder)
+    
+    vampytest.assert_eq(lazy_pattern.findall('koishi satori koishi'), ['i', 'i'])
+    vampytest.assert_is_not(lazy_pattern._pattern, None)
+
+
+def test__EMOJI_ALL_RP():
+    """
+    Tests whether ``EMOJI_ALL_RP`` is a lazy pattern.
+    """
+    vampytest.assert_instance(EMOJI_ALL_RP, LazyPattern)
+    vampytest.assert_eq(len(EMOJI_ALL_RP.findall(':heart:')), 1)
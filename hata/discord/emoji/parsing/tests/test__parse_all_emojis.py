@@ -3,7 +3,7 @@ import vampytest
 from ....core import BUILTIN_EMOJIS, UNICODE_TO_EMOJI
 
 from ...emoji import Emoji
-from ...unicode.unicodes import UNICODES
+from ...unicode.unicodes import get_unicodes
 
 from ..utils import parse_all_emojis
 
@@ -14,7 +14,7 @@ def test__parse_all_emojis__unicode_all__0():
     
     Case: unicode
     """
-    for unicode in UNICODES:
+    for unicode in get_unicodes():
         emoji = UNICODE_TO_EMOJI[unicode.value]
         
         parsed_emojis = parse_all_emojis(unicode.value)
@@ -1,13 +1,13 @@
 import vampytest
 
-from ..unicodes import UNICODES
+from ..unicodes import get_unicodes
 
 
 def test__UNICODES():
     """
     Tests whether all unicodes are structured as expected.
     """
-    for unicode in UNICODES:
+    for unicode in get_unicodes():
         vampytest.assert_instance(unicode.name, str)
         vampytest.assert_instance(unicode.value, str)
         vampytest.assert_instance(unicode.variation_selector_16, bool)
@@ -0,0 +1,44 @@
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+import vampytest
+
+from ..unicode_type import Unicode
+from ..unicodes import dump_unicodes, get_unicodes, load_unicodes
+
+
+def test__dump_unicodes__load_unicodes():
+    """
+    Tests whether the dumped unicodes are loaded back the same.
+    """
+    unicodes = (
+        Unicode('heart', '❤', True, None, None, None),
+        Unicode('smile', '\U0001f604', False, ('smiley_face',), (':D', 'xD'), ('\ud83d\ude04',)),
+    )
+    
+    with TemporaryDirectory() as directory_path:
+        file_path = join_paths(directory_path, 'unicodes.txt')
+        dump_unicodes(unicodes, file_path)
+        output = load_unicodes(file_path)
+    
+    vampytest.assert_instance(output, tuple)
+    vampytest.assert_eq(len(output), len(unicodes))
+    
+    for loaded_unicode, unicode in zip(output, unicodes):
+        vampytest.assert_instance(loaded_unicode, Unicode)
+        vampytest.assert_eq(loaded_unicode.name, unicode.name)
+        vampytest.assert_eq(loaded_unicode.value, unicode.value)
+        vampytest.assert_eq(loaded_unicode.variation_selector_16, unicode.variation_selector_16)
+        vampytest.assert_eq(loaded_unicode.aliases, unicode.aliases)
+        vampytest.assert_eq(loaded_unicode.emoticons, unicode.emoticons)
+        vampytest.assert_eq(loaded_unicode.unicode_aliases, unicode.unicode_aliases)
+
+
+def test__get_unicodes():
+    """
+    Tests whether ``get_unicodes`` loads the builtin unicodes only once.
+    """
+    output = get_unicodes()
+    vampytest.assert_instance(output, tuple)
+    vampytest.assert_true(output)
+    vampytest.assert_is(get_unicodes(), output)
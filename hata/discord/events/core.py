@@ -715,4 +715,4 @@ def trigger_voice_client_ghost_event(client, voice_state):
     """
     event_handler = client.events.voice_client_ghost
     if (event_handler is not DEFAULT_EVENT_HANDLER):
-        Task(KOKORO, event_handler(client, voice_state))
+        client.events.dispatch(event_handler(client, voice_state))
@@ -18,7 +18,8 @@ from .default_event_handlers import (
 )
 from .event_handler_plugin import EventHandlerPlugin
 from .handling_helpers import (
-    ChunkWaiter, _iterate_event_handler, asynclist, check_name, check_parameter_count_and_convert
+    ChunkWaiter, _iterate_event_handler, asynclist, check_name, check_parameter_count_and_convert,
+    run_coroutine_inline
 )
 from .soundboard_sounds_event_handler import SoundboardSoundsEventHandler
 
@@ -39,6 +40,8 @@ DEFAULT_EVENT_HANDLERS = (
 EVENT_HANDLER_ATTRIBUTES = frozenset((
     '_launch_called',
     'client_reference',
+    'inline_dispatch',
+    'presence_coalescing_window',
     '_plugin_events',
     '_plugin_events_deprecated',
     '_plugins',
@@ -324,6 +327,15 @@ class EventHandlerManager(RichAttributeErrorBaseType):
     client_reference : `WeakReferer<Client>`
         Weak reference to the parent client to avoid reference loops.
     
+    inline_dispatch : `bool`
+        Whether event handlers are started right after their event's parser returned instead of on a later event loop
+        iteration. Defaults to `False`. See ``.dispatch``.
+    
+    presence_coalescing_window : `float`
+        When set, the presence updates of a user received within this many seconds are coalesced, only the latest one
+        is applied and a single event is dispatched with the attributes before the first one. Defaults to `0.0`
+        (disabled). Only applicable if presence caching is enabled.
+    
     Additional Event Attributes
     ---------------------------
     application_command_count_update(client: ``Client``, event: ``ApplicationCommandCountUpdate``)
@@ -1423,6 +1435,8 @@ class EventHandlerManager(RichAttributeErrorBaseType):
             object.__setattr__(self, name, DEFAULT_EVENT_HANDLER)
         
         object.__setattr__(self, '_launch_called', False)
+        object.__setattr__(self, 'inline_dispatch', False)
+        object.__setattr__(self, 'presence_coalescing_window', 0.0)
         
         for event_handler_name, event_handler, instance_event_handler in DEFAULT_EVENT_HANDLERS:
             if instance_event_handler:
@@ -1543,6 +1557,31 @@ class EventHandlerManager(RichAttributeErrorBaseType):
         return func
     
     
+    def dispatch(self, coroutine):
+        """
+        Runs an event handler's coroutine.
+        
+        By default a task is created for each, what is started on a later event loop iteration. If
+        ``.inline_dispatch`` is set, an eager task is created instead, what runs the coroutine till its first suspension
+        right after the event's parser returned, before the next event is parsed.
+        
+        With inline dispatch the event handlers still run inside of a task, so task bound utilities, like timeouts,
+        cancellation and waiting for events work the same. The requirements changing are:
+        - An event handler's code till its first suspension delays parsing the next event, so it should be short.
+        - Event handlers are started in the order their events were received and see the event's changes applied,
+            but not the changes of the events received after.
+        
+        Parameters
+        ----------
+        coroutine : `CoroutineType`
+            The event handler's coroutine.
+        """
+        if self.inline_dispatch:
+            run_coroutine_inline(coroutine)
+        else:
+            Task(KOKORO, coroutine)
+    
+    
     def clear(self):
         """
         Clears the ``EventHandlerManager`` to it's initial state.
@@ -6,6 +6,7 @@ from ..exceptions import DiscordException
 from ..core import KOKORO
 
 from .core import PARSERS
+from .handling_helpers import call_parser
 
 SYNC_REQUESTS = {}
 
@@ -43,12 +44,12 @@ async def sync_task(queue_id, coroutine, queue):
         for index in range(len(queue)):
             client, data, parser_and_checker = queue[index]
             if type(parser_and_checker) is str:
-                PARSERS[parser_and_checker](client, data)
+                call_parser(PARSERS[parser_and_checker], client, data)
                 continue
             
             parser_name, checker, value = parser_and_checker
             if checker(guild, value):
-                PARSERS[parser_name](client, data)
+                call_parser(PARSERS[parser_name], client, data)
     finally:
         del SYNC_REQUESTS[queue_id]
 
@@ -1913,6 +1913,103 @@ class WaitForHandler:
                 future.set_result_if_pending(args)
 
 
+class EagerTask(Task):
+    """
+    Task, which steps its coroutine right when created, instead of scheduling its first step on the event loop.
+    
+    The coroutine runs inside of the task from its start, so ``EventThread.current_task``, timeouts, cancellation and
+    waiting for events work as in any other task.
+    """
+    __slots__ = ()
+    
+    def __new__(cls, loop, coroutine):
+        """
+        Creates a new eager task and steps its coroutine till it first suspends.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop on what the coroutine will run.
+        coroutine : `CoroutineType`
+            The coroutine, what the task will run.
+        """
+        self = object.__new__(cls)
+        self._blocking = False
+        self._callbacks = []
+        self._coroutine = coroutine
+        self._loop = loop
+        self._result = None
+        self._state = 0
+        self._waited_future = None
+        
+        # `._step` un-sets the current task when it suspends, so restore the task we are called from.
+        current_task = loop.current_task
+        try:
+            self._step()
+        finally:
+            loop.current_task = current_task
+        
+        return self
+
+
+INLINE_DISPATCH_QUEUE = None
+
+
+def run_coroutine_inline(coroutine):
+    """
+    Runs the given coroutine in an eager task.
+    
+    If a parser is running, the task is created only after the parser returned (see ``call_parser``), so the
+    coroutine sees the event's changes fully applied.
+    
+    Parameters
+    ----------
+    coroutine : `CoroutineType`
+        The coroutine to run.
+    """
+    queue = INLINE_DISPATCH_QUEUE
+    if queue is None:
+        EagerTask(KOKORO, coroutine)
+    else:
+        queue.append(coroutine)
+
+
+def call_parser(parser, client, data):
+    """
+    Calls the given parser. The coroutines dispatched inline by it are ran in eager tasks after it returned, in the
+    order they were dispatched.
+    
+    Parameters
+    ----------
+    parser : `FunctionType`
+        The parser to call.
+    client : ``Client``
+        The client who received the event.
+    data : `object`
+        The event's data.
+    
+    Returns
+    -------
+    result : `object`
+        The parser's return.
+    """
+    global INLINE_DISPATCH_QUEUE
+    
+    # Nested parser call, dispatch after the outer one returned.
+    if (INLINE_DISPATCH_QUEUE is not None):
+        return parser(client, data)
+    
+    queue = []
+    INLINE_DISPATCH_QUEUE = queue
+    try:
+        return parser(client, data)
+    finally:
+        INLINE_DISPATCH_QUEUE = None
+        
+        for coroutine in queue:
+            EagerTask(KOKORO, coroutine)
+
+
 class asynclist(list):
     """
     Container used by events to call more events and by waitfor events to call more waiters.
@@ -2106,7 +2203,7 @@ def call_unknown_dispatch_event_event_handler(client, name, data):
     """
     event_handler = client.events.unknown_dispatch_event
     if (event_handler is not DEFAULT_EVENT_HANDLER):
-        Task(KOKORO, event_handler(client, name, data))
+        client.events.dispatch(event_handler(client, name, data))
 
 
 IGNORED_EVENT_HANDLER_TYPES = frozenset((
@@ -13,9 +13,10 @@ from ..application.subscription.fields import parse_id as parse_subscription_id
 from ..audit_logs import AuditLogEntry
 from ..auto_moderation import AutoModerationActionExecutionEvent, AutoModerationRule
 from ..channel import Channel, VoiceChannelEffect
+from ..channel.message_cache_policy import MESSAGE_CACHE_POLICY
 from ..core import (
     APPLICATION_COMMANDS, APPLICATION_ID_TO_CLIENT, AUTO_MODERATION_RULES, CHANNELS, CLIENTS, ENTITLEMENTS, GUILD_BOOSTS,
-    GUILDS, KOKORO, MESSAGES, ROLES, SCHEDULED_EVENTS, STAGES, SUBSCRIPTIONS, USERS
+    GUILDS, KOKORO, ROLES, SCHEDULED_EVENTS, STAGES, SUBSCRIPTIONS, USERS
 )
 from ..embedded_activity.embedded_activity.constants import (
     EMBEDDED_ACTIVITY_UPDATE_CREATE, EMBEDDED_ACTIVITY_UPDATE_DELETE, EMBEDDED_ACTIVITY_UPDATE_UPDATE,
@@ -92,6 +93,7 @@ from .intent import (
     INTENT_MASK_GUILD_SCHEDULED_EVENTS, INTENT_MASK_GUILD_USERS, INTENT_MASK_GUILD_VOICE_STATES,
     INTENT_SHIFT_GUILD_USERS
 )
+from .presence_coalescing import coalesce_presence_update
 
 
 Client = include('Client')
@@ -179,10 +181,12 @@ def USER_UPDATE__CAL(client, data):
     if not old_attributes:
         return
     
-    Task(KOKORO, client.events.client_update(client, old_attributes))
+    client._update_guild_user_name_indexes()
+    client.events.dispatch(client.events.client_update(client, old_attributes))
 
 def USER_UPDATE__OPT(client, data):
     client._update_attributes(data)
+    client._update_guild_user_name_indexes()
 
 add_parser(
     'USER_UPDATE',
@@ -210,7 +214,7 @@ def MESSAGE_CREATE__CAL(client, data):
     else:
         message = channel._create_new_message(data)
     
-    Task(KOKORO, client.events.message_create(client, message))
+    client.events.dispatch(client.events.message_create(client, message))
 
 def MESSAGE_CREATE__OPT(client, data):
     channel_id = int(data['channel_id'])
@@ -245,7 +249,7 @@ def MESSAGE_DELETE__CAL_SC(client, data):
     if (channel is not None):
         channel._pop_message(message.id)
     
-    Task(KOKORO, client.events.message_delete(client, message))
+    client.events.dispatch(client.events.message_delete(client, message))
 
 
 def MESSAGE_DELETE__CAL_MC(client, data):
@@ -282,12 +286,12 @@ def MESSAGE_DELETE__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.message_delete
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, message))
+            client.events.dispatch(event_handler(client, message))
     else:
         for client_ in clients:
             event_handler = client_.events.message_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, message))
+                client_.events.dispatch(event_handler(client_, message))
 
 
 def MESSAGE_DELETE__OPT_SC(client, data):
@@ -361,7 +365,7 @@ def MESSAGE_DELETE_BULK__CAL_SC(client, data):
     
     event_handler = client.events.message_delete
     for message in messages:
-        Task(KOKORO, event_handler(client, message))
+        client.events.dispatch(event_handler(client, message))
 
 
 def MESSAGE_DELETE_BULK__CAL_MC(client, data):
@@ -400,14 +404,14 @@ def MESSAGE_DELETE_BULK__CAL_MC(client, data):
         event_handler = client.events.message_delete
         if (event_handler is not DEFAULT_EVENT_HANDLER):
             for message in messages:
-                Task(KOKORO, event_handler(client, message))
+                client.events.dispatch(event_handler(client, message))
     
     else:
         for client_ in clients:
             event_handler = client_.events.message_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
                 for message in messages:
-                    Task(KOKORO, event_handler(client_, message))
+                    client_.events.dispatch(event_handler(client_, message))
 
 
 def MESSAGE_DELETE_BULK__OPT_SC(client, data):
@@ -454,14 +458,14 @@ del (
 
 def MESSAGE_UPDATE__CAL_SC(client, data):
     message_id = int(data['id'])
-    message = MESSAGES.get(message_id, None)
+    message = MESSAGE_CACHE_POLICY.get(message_id)
     if message is None:
         if 'edited_timestamp' not in data:
             return
         
         # Dead event handling
         message = Message.from_data(data)
-        Task(KOKORO, client.events.message_update(client, message, None))
+        client.events.dispatch(client.events.message_update(client, message, None))
         return
     
     
@@ -470,19 +474,19 @@ def MESSAGE_UPDATE__CAL_SC(client, data):
         if not old_attributes:
             return
         
-        Task(KOKORO, client.events.message_update(client, message, old_attributes))
+        client.events.dispatch(client.events.message_update(client, message, old_attributes))
     
     else:
         change_state = message._update_embed(data)
         if change_state == EMBED_UPDATE_NONE:
             return
         
-        Task(KOKORO, client.events.embed_update(client, message, change_state))
+        client.events.dispatch(client.events.embed_update(client, message, change_state))
 
 
 def MESSAGE_UPDATE__CAL_MC(client, data):
     message_id = int(data['id'])
-    message = MESSAGES.get(message_id, None)
+    message = MESSAGE_CACHE_POLICY.get(message_id)
     if message is None:
         if 'edited_timestamp' not in data:
             return
@@ -497,7 +501,7 @@ def MESSAGE_UPDATE__CAL_MC(client, data):
         # If channel is not there, we do not need to dispatch it for all the clients, because we just can't.
         event_handler = client.events.message_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, message, None))
+            client.events.dispatch(event_handler(client, message, None))
     
     clients = filter_content_intent_client(channel.iter_clients(), data, client)
     
@@ -517,7 +521,7 @@ def MESSAGE_UPDATE__CAL_MC(client, data):
         for client_ in clients:
             event_handler = client_.events.message_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, message, old_attributes))
+                client_.events.dispatch(event_handler(client_, message, old_attributes))
     else:
         if message_cached_before:
             result = message._update_embed(data)
@@ -528,12 +532,12 @@ def MESSAGE_UPDATE__CAL_MC(client, data):
             for client_ in clients:
                 event_handler = client_.events.embed_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, message, result))
+                    client_.events.dispatch(event_handler(client_, message, result))
 
 
 def MESSAGE_UPDATE__OPT_SC(client, data):
     message_id = int(data['id'])
-    message = MESSAGES.get(message_id, None)
+    message = MESSAGE_CACHE_POLICY.get(message_id)
     if message is None:
         return
     
@@ -545,7 +549,7 @@ def MESSAGE_UPDATE__OPT_SC(client, data):
 
 def MESSAGE_UPDATE__OPT_MC(client, data):
     message_id = int(data['id'])
-    message = MESSAGES.get(message_id, None)
+    message = MESSAGE_CACHE_POLICY.get(message_id)
     if message is None:
         return
     
@@ -578,7 +582,7 @@ def MESSAGE_REACTION_ADD__CAL_SC(client, data):
     event = ReactionAddEvent.from_data(data)
     event.message._add_reaction(event.reaction, event.user)
     
-    Task(KOKORO, client.events.reaction_add(client, event))
+    client.events.dispatch(client.events.reaction_add(client, event))
 
 
 def MESSAGE_REACTION_ADD__CAL_MC(client, data):
@@ -601,16 +605,16 @@ def MESSAGE_REACTION_ADD__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.reaction_add
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, event))
+            client.events.dispatch(event_handler(client, event))
     else:
         for client_ in clients:
             event_handler = client_.events.reaction_add
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, event))
+                client_.events.dispatch(event_handler(client_, event))
 
 
 def MESSAGE_REACTION_ADD__OPT_SC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -618,7 +622,7 @@ def MESSAGE_REACTION_ADD__OPT_SC(client, data):
 
 
 def MESSAGE_REACTION_ADD__OPT_MC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -663,7 +667,7 @@ def MESSAGE_REACTION_REMOVE_ALL__CAL_SC(client, data):
         reactions = old_reactions.copy()
         old_reactions.clear()
     
-    Task(KOKORO, client.events.reaction_clear(client, message, reactions))
+    client.events.dispatch(client.events.reaction_clear(client, message, reactions))
 
 
 def MESSAGE_REACTION_REMOVE_ALL__CAL_MC(client, data):
@@ -698,16 +702,16 @@ def MESSAGE_REACTION_REMOVE_ALL__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.reaction_clear
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, message, reactions))
+            client.events.dispatch(event_handler(client, message, reactions))
     else:
         for client_ in clients:
             event_handler = client_.events.reaction_clear
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, message, reactions))
+                client_.events.dispatch(event_handler(client_, message, reactions))
 
 
 def MESSAGE_REACTION_REMOVE_ALL__OPT_SC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -717,7 +721,7 @@ def MESSAGE_REACTION_REMOVE_ALL__OPT_SC(client, data):
 
 
 def MESSAGE_REACTION_REMOVE_ALL__OPT_MC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -753,7 +757,7 @@ def MESSAGE_REACTION_REMOVE__CAL_SC(client, data):
     event = ReactionDeleteEvent.from_data(data)
     event.message._remove_reaction(event.reaction, event.user)
     
-    Task(KOKORO, client.events.reaction_delete(client, event))
+    client.events.dispatch(client.events.reaction_delete(client, event))
 
 
 def MESSAGE_REACTION_REMOVE__CAL_MC(client, data):
@@ -777,16 +781,16 @@ def MESSAGE_REACTION_REMOVE__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.reaction_delete
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, event))
+            client.events.dispatch(event_handler(client, event))
     else:
         for client_ in clients:
             event_handler = client_.events.reaction_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, event))
+                client_.events.dispatch(event_handler(client_, event))
 
 
 def MESSAGE_REACTION_REMOVE__OPT_SC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -794,7 +798,7 @@ def MESSAGE_REACTION_REMOVE__OPT_SC(client, data):
 
 
 def MESSAGE_REACTION_REMOVE__OPT_MC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -836,7 +840,7 @@ def MESSAGE_REACTION_REMOVE_EMOJI__CAL_SC(client, data):
         if users is None:
             return
     
-    Task(KOKORO, client.events.reaction_delete_emoji(client, message, emoji, users))
+    client.events.dispatch(client.events.reaction_delete_emoji(client, message, emoji, users))
 
 
 def MESSAGE_REACTION_REMOVE_EMOJI__CAL_MC(client, data):
@@ -870,16 +874,16 @@ def MESSAGE_REACTION_REMOVE_EMOJI__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.reaction_delete_emoji
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, message, emoji, users))
+            client.events.dispatch(event_handler(client, message, emoji, users))
     else:
         for client_ in clients:
             event_handler = client_.events.reaction_delete_emoji
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, message, emoji, users))
+                client_.events.dispatch(event_handler(client_, message, emoji, users))
 
 
 def MESSAGE_REACTION_REMOVE_EMOJI__OPT_SC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -888,7 +892,7 @@ def MESSAGE_REACTION_REMOVE_EMOJI__OPT_SC(client, data):
 
 
 def MESSAGE_REACTION_REMOVE_EMOJI__OPT_MC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -920,7 +924,7 @@ del (
 
 
 if CACHE_PRESENCE:
-    def PRESENCE_UPDATE__CAL_SC(client, data):
+    def _apply_PRESENCE_UPDATE__CAL_SC(client, data):
         user_data = data['user']
         user_id = int(user_data.pop('id'))
         try:
@@ -932,6 +936,7 @@ if CACHE_PRESENCE:
             if user_data:
                 old_attributes = user._difference_update_attributes(user_data)
                 if old_attributes:
+                    user._update_guild_user_name_indexes()
                     presence = False
                     break
             
@@ -947,9 +952,9 @@ if CACHE_PRESENCE:
         else:
             event_handler = client.events.user_update
         
-        Task(KOKORO, event_handler(client, user, old_attributes))
+        client.events.dispatch(event_handler(client, user, old_attributes))
     
-    def PRESENCE_UPDATE__CAL_MC(client, data):
+    def _apply_PRESENCE_UPDATE__CAL_MC(client, data):
         user_data = data['user']
         user_id = int(user_data.pop('id'))
         try:
@@ -961,6 +966,7 @@ if CACHE_PRESENCE:
             if user_data:
                 old_attributes = user._difference_update_attributes(user_data)
                 if old_attributes:
+                    user._update_guild_user_name_indexes()
                     presence = False
                     break
             
@@ -979,7 +985,22 @@ if CACHE_PRESENCE:
                     event_handler = client_.events.user_update
                 
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, user, old_attributes))
+                    client_.events.dispatch(event_handler(client_, user, old_attributes))
+    
+    
+    def PRESENCE_UPDATE__CAL_SC(client, data):
+        window = client.events.presence_coalescing_window
+        if window:
+            coalesce_presence_update(client, data, window, _apply_PRESENCE_UPDATE__CAL_SC)
+        else:
+            _apply_PRESENCE_UPDATE__CAL_SC(client, data)
+    
+    def PRESENCE_UPDATE__CAL_MC(client, data):
+        window = client.events.presence_coalescing_window
+        if window:
+            coalesce_presence_update(client, data, window, _apply_PRESENCE_UPDATE__CAL_MC)
+        else:
+            _apply_PRESENCE_UPDATE__CAL_MC(client, data)
     
     
     def PRESENCE_UPDATE__OPT(client, data):
@@ -992,6 +1013,7 @@ if CACHE_PRESENCE:
         
         if user_data:
             user._update_attributes(user_data)
+            user._update_guild_user_name_indexes()
         
         user._update_presence(data)
 
@@ -1030,7 +1052,7 @@ if CACHE_USER:
         if (old_attributes is not None) and (not old_attributes):
             return
         
-        Task(KOKORO, client.events.guild_user_update(client, guild, user, old_attributes))
+        client.events.dispatch(client.events.guild_user_update(client, guild, user, old_attributes))
     
     
     def GUILD_MEMBER_UPDATE__CAL_MC(client, data):
@@ -1056,7 +1078,7 @@ if CACHE_USER:
         for client_ in clients:
             event_handler = client_.events.guild_user_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, guild, user, old_attributes))
+                client_.events.dispatch(event_handler(client_, guild, user, old_attributes))
     
     
     def GUILD_MEMBER_UPDATE__OPT_SC(client, data):
@@ -1101,7 +1123,7 @@ else:
         if (old_attributes is not None) and (not old_attributes):
             return
         
-        Task(KOKORO, client.events.guild_user_update(client, guild, client, old_attributes))
+        client.events.dispatch(client.events.guild_user_update(client, guild, client, old_attributes))
     
     
     GUILD_MEMBER_UPDATE__CAL_MC = GUILD_MEMBER_UPDATE__CAL_SC
@@ -1142,7 +1164,7 @@ del (
 
 def GUILD_POWERUP_ENTITLEMENTS_CREATE__CAL(client, data):
     event = GuildEnhancementEntitlementsCreateEvent.from_data(data)
-    Task(KOKORO, client.events.guild_enhancement_entitlements_create(client, event))
+    client.events.dispatch(client.events.guild_enhancement_entitlements_create(client, event))
 
 
 def GUILD_POWERUP_ENTITLEMENTS_CREATE__OPT(client, data):
@@ -1164,7 +1186,7 @@ del (
 
 def GUILD_POWERUP_ENTITLEMENTS_DELETE__CAL(client, data):
     event = GuildEnhancementEntitlementsDeleteEvent.from_data(data)
-    Task(KOKORO, client.events.guild_enhancement_entitlements_delete(client, event))
+    client.events.dispatch(client.events.guild_enhancement_entitlements_delete(client, event))
 
 
 def GUILD_POWERUP_ENTITLEMENTS_DELETE__OPT(client, data):
@@ -1198,7 +1220,7 @@ def GUILD_APPLIED_BOOSTS_UPDATE__CAL_SC(client, data):
         if not old_attributes:
             return
     
-    Task(KOKORO, client.events.guild_boost_update(client, guild_boost, old_attributes))
+    client.events.dispatch(client.events.guild_boost_update(client, guild_boost, old_attributes))
 
 
 def GUILD_APPLIED_BOOSTS_UPDATE__CAL_MC(client, data):
@@ -1268,7 +1290,7 @@ def CHANNEL_DELETE__CAL_SC(client, data):
     event_handler = client.events.channel_delete
     
     for channel in channel._iter_delete(client):
-        Task(KOKORO, event_handler(client, channel))
+        client.events.dispatch(event_handler(client, channel))
 
 
 def CHANNEL_DELETE__CAL_MC(client, data):
@@ -1291,7 +1313,7 @@ def CHANNEL_DELETE__CAL_MC(client, data):
         event_handler = client_.events.channel_delete
         if (event_handler is not DEFAULT_EVENT_HANDLER):
             for channel in channels:
-                Task(KOKORO, event_handler(client_, channel))
+                client_.events.dispatch(event_handler(client_, channel))
 
 
 def CHANNEL_DELETE__OPT(client, data):
@@ -1331,7 +1353,7 @@ def CHANNEL_UPDATE__CAL_SC(client, data):
     if not old_attributes:
         return
     
-    Task(KOKORO, client.events.channel_update(client, channel, old_attributes))
+    client.events.dispatch(client.events.channel_update(client, channel, old_attributes))
 
 
 def CHANNEL_UPDATE__CAL_MC(client, data):
@@ -1365,7 +1387,7 @@ def CHANNEL_UPDATE__CAL_MC(client, data):
     for client_ in clients:
         event_handler = client_.events.channel_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client_, channel, old_attributes))
+            client_.events.dispatch(event_handler(client_, channel, old_attributes))
 
 
 def CHANNEL_UPDATE__OPT_SC(client, data):
@@ -1437,7 +1459,7 @@ def THREAD_UPDATE__CAL_SC(client, data):
         if not old_attributes:
             return
     
-    Task(KOKORO, client.events.channel_update(client, channel, old_attributes))
+    client.events.dispatch(client.events.channel_update(client, channel, old_attributes))
 
 def THREAD_UPDATE__CAL_MC(client, data):
     guild_id = data.get('guild_id', None)
@@ -1475,12 +1497,12 @@ def THREAD_UPDATE__CAL_MC(client, data):
     if (clients is None):
         event_handler = client.events.channel_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, channel, old_attributes))
+            client.events.dispatch(event_handler(client, channel, old_attributes))
     else:
         for client_ in clients:
             event_handler = client_.events.channel_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, channel, old_attributes))
+                client_.events.dispatch(event_handler(client_, channel, old_attributes))
 
 def THREAD_UPDATE__OPT_SC(client, data):
     channel_id = int(data['id'])
@@ -1551,7 +1573,7 @@ def VOICE_CHANNEL_STATUS_UPDATE__CAL_SC(client, data):
     if not old_attributes:
         return
     
-    Task(KOKORO, client.events.channel_update(client, channel, old_attributes))
+    client.events.dispatch(client.events.channel_update(client, channel, old_attributes))
 
 
 def VOICE_CHANNEL_STATUS_UPDATE__CAL_MC(client, data):
@@ -1575,7 +1597,7 @@ def VOICE_CHANNEL_STATUS_UPDATE__CAL_MC(client, data):
     for client_ in clients:
         event_handler = client_.events.channel_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client_, channel, old_attributes))
+            client_.events.dispatch(event_handler(client_, channel, old_attributes))
 
 
 def VOICE_CHANNEL_STATUS_UPDATE__OPT_SC(client, data):
@@ -1630,7 +1652,7 @@ def VOICE_CHANNEL_START_TIME_UPDATE__CAL_SC(client, data):
     if not old_attributes:
         return
     
-    Task(KOKORO, client.events.channel_update(client, channel, old_attributes))
+    client.events.dispatch(client.events.channel_update(client, channel, old_attributes))
 
 
 def VOICE_CHANNEL_START_TIME_UPDATE__CAL_MC(client, data):
@@ -1654,7 +1676,7 @@ def VOICE_CHANNEL_START_TIME_UPDATE__CAL_MC(client, data):
     for client_ in clients:
         event_handler = client_.events.channel_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client_, channel, old_attributes))
+            client_.events.dispatch(event_handler(client_, channel, old_attributes))
 
 
 def VOICE_CHANNEL_START_TIME_UPDATE__OPT_SC(client, data):
@@ -1706,7 +1728,7 @@ def CHANNEL_CREATE__CAL(client, data):
     guild_id = int(guild_id)
     channel = Channel.from_data(data, client, guild_id)
     
-    Task(KOKORO, client.events.channel_create(client, channel))
+    client.events.dispatch(client.events.channel_create(client, channel))
 
 def CHANNEL_CREATE__OPT(client, data):
     guild_id = data.get('guild_id', None)
@@ -1740,7 +1762,7 @@ def CHANNEL_PINS_UPDATE__CAL(client, data):
         return
     
     # ignoring message search
-    Task(KOKORO, client.events.channel_pin_update(client, channel))
+    client.events.dispatch(client.events.channel_pin_update(client, channel))
 
 def CHANNEL_PINS_UPDATE__OPT(client, data):
     pass
@@ -1771,7 +1793,7 @@ def CHANNEL_RECIPIENT_ADD_CAL(client, data):
     if user not in users:
         users.append(user)
     
-    Task(KOKORO, client.events.channel_group_user_add(client, channel, user))
+    client.events.dispatch(client.events.channel_group_user_add(client, channel, user))
 
 def CHANNEL_RECIPIENT_ADD__OPT(client, data):
     channel_id = int(data['channel_id'])
@@ -1812,7 +1834,7 @@ def CHANNEL_RECIPIENT_REMOVE__CAL_SC(client, data):
         return
     
     if client != user:
-        Task(KOKORO, client.events.channel_group_user_delete(client, channel, user))
+        client.events.dispatch(client.events.channel_group_user_delete(client, channel, user))
 
 
 def CHANNEL_RECIPIENT_REMOVE__CAL_MC(client, data):
@@ -1832,7 +1854,7 @@ def CHANNEL_RECIPIENT_REMOVE__CAL_MC(client, data):
         if (client_ is client) or (client_ != user):
             event_handler = client_.events.channel_group_user_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, channel, user))
+                client_.events.dispatch(event_handler(client_, channel, user))
 
 
 def CHANNEL_RECIPIENT_REMOVE__OPT(client, data):
@@ -1880,19 +1902,19 @@ def GUILD_EMOJIS_UPDATE__CAL_SC(client, data):
         if action == EMOJI_EVENT_UPDATE:
             event_handler = client.events.emoji_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, emoji, old_attributes))
+                client.events.dispatch(event_handler(client, emoji, old_attributes))
             continue
             
         if action == EMOJI_EVENT_CREATE:
             event_handler = client.events.emoji_create
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, emoji))
+                client.events.dispatch(event_handler(client, emoji))
             continue
         
         if action == EMOJI_EVENT_DELETE:
             event_handler = client.events.emoji_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, emoji))
+                client.events.dispatch(event_handler(client, emoji))
             continue
         
         # no more case
@@ -1923,19 +1945,19 @@ def GUILD_EMOJIS_UPDATE__CAL_MC(client, data):
             if action == EMOJI_EVENT_UPDATE:
                 event_handler = client_.events.emoji_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, emoji, old_attributes))
+                    client_.events.dispatch(event_handler(client_, emoji, old_attributes))
                 continue
             
             if action == EMOJI_EVENT_CREATE:
                 event_handler = client_.events.emoji_create
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, emoji))
+                    client_.events.dispatch(event_handler(client_, emoji))
                 continue
             
             if action == EMOJI_EVENT_DELETE:
                 event_handler = client_.events.emoji_delete
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, emoji))
+                    client_.events.dispatch(event_handler(client_, emoji))
                 continue
             
             # no more case
@@ -1999,19 +2021,19 @@ def GUILD_STICKERS_UPDATE__CAL_SC(client, data):
         if action == STICKER_EVENT_UPDATE:
             event_handler = client.events.sticker_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, sticker, old_attributes))
+                client.events.dispatch(event_handler(client, sticker, old_attributes))
             continue
             
         if action == STICKER_EVENT_CREATE:
             event_handler = client.events.sticker_create
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, sticker))
+                client.events.dispatch(event_handler(client, sticker))
             continue
         
         if action == STICKER_EVENT_DELETE:
             event_handler = client.events.sticker_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, sticker))
+                client.events.dispatch(event_handler(client, sticker))
             continue
         
         # no more case
@@ -2040,19 +2062,19 @@ def GUILD_STICKERS_UPDATE__CAL_MC(client, data):
             if action == STICKER_EVENT_UPDATE:
                 event_handler = client_.events.sticker_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, sticker, old_attributes))
+                    client_.events.dispatch(event_handler(client_, sticker, old_attributes))
                 continue
                 
             if action == STICKER_EVENT_CREATE:
                 event_handler = client_.events.sticker_create
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, sticker))
+                    client_.events.dispatch(event_handler(client_, sticker))
                 continue
             
             if action == STICKER_EVENT_DELETE:
                 event_handler = client_.events.sticker_delete
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, sticker))
+                    client_.events.dispatch(event_handler(client_, sticker))
                 continue
             
             continue
@@ -2108,7 +2130,7 @@ def GUILD_MEMBER_ADD__CAL_SC(client, data):
     user = User.from_data(data['user'], data, guild_id)
     guild.user_count += 1
     
-    Task(KOKORO, client.events.guild_user_add(client, guild, user))
+    client.events.dispatch(client.events.guild_user_add(client, guild, user))
 
 
 def GUILD_MEMBER_ADD__CAL_MC(client, data):
@@ -2131,12 +2153,12 @@ def GUILD_MEMBER_ADD__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.guild_user_add
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, guild, user))
+            client.events.dispatch(event_handler(client, guild, user))
     else:
         for client_ in clients:
             event_handler = client_.events.guild_user_add
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, guild, user))
+                client_.events.dispatch(event_handler(client_, guild, user))
 
 if CACHE_USER:
     def GUILD_MEMBER_ADD__OPT_SC(client, data):
@@ -2222,7 +2244,7 @@ if CACHE_USER:
         
         guild.user_count -= 1
         
-        Task(KOKORO, client.events.guild_user_delete(client, guild, user, guild_profile))
+        client.events.dispatch(client.events.guild_user_delete(client, guild, user, guild_profile))
     
     def GUILD_MEMBER_REMOVE__CAL_MC(client, data):
         guild_id = int(data['guild_id'])
@@ -2254,7 +2276,7 @@ if CACHE_USER:
         for client_ in clients:
             event_handler = client_.events.guild_user_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, guild, user, guild_profile))
+                client_.events.dispatch(event_handler(client_, guild, user, guild_profile))
     
     def GUILD_MEMBER_REMOVE__OPT_SC(client, data):
         guild_id = int(data['guild_id'])
@@ -2317,7 +2339,7 @@ else:
         user = User.from_data(data['user'])
         guild.user_count -= 1
         
-        Task(KOKORO, client.events.guild_user_delete(client, guild, user, None))
+        client.events.dispatch(client.events.guild_user_delete(client, guild, user, None))
 
     def GUILD_MEMBER_REMOVE__CAL_MC(client, data):
         guild_id = int(data['guild_id'])
@@ -2338,7 +2360,7 @@ else:
         for client_ in clients:
             event_handler = client_.events.guild_user_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, guild, user, None))
+                client_.events.dispatch(event_handler(client_, guild, user, None))
     
     def GUILD_MEMBER_REMOVE__OPT_SC(client, data):
         guild_id = int(data['guild_id'])
@@ -2382,7 +2404,7 @@ del (
 def GUILD_JOIN_REQUEST_CREATE__CAL(client, data):
     event = GuildJoinRequest.from_data(data)
     
-    Task(KOKORO, client.events.guild_join_request_create(client, event))
+    client.events.dispatch(client.events.guild_join_request_create(client, event))
 
 def GUILD_JOIN_REQUEST_CREATE__OPT(client, data):
     pass
@@ -2405,7 +2427,7 @@ del (
 def GUILD_JOIN_REQUEST_DELETE__CAL(client, data):
     event = GuildJoinRequestDeleteEvent.from_data(data)
     
-    Task(KOKORO, client.events.guild_join_request_delete(client, event))
+    client.events.dispatch(client.events.guild_join_request_delete(client, event))
 
 def GUILD_JOIN_REQUEST_DELETE__OPT(client, data):
     pass
@@ -2427,7 +2449,7 @@ del (
 def GUILD_JOIN_REQUEST_UPDATE__CAL(client, data):
     event = GuildJoinRequest.from_data(data)
     
-    Task(KOKORO, client.events.guild_join_request_update(client, event))
+    client.events.dispatch(client.events.guild_join_request_update(client, event))
 
 def GUILD_JOIN_REQUEST_UPDATE__OPT(client, data):
     pass
@@ -2459,7 +2481,7 @@ if CACHE_PRESENCE:
             if (client.intents & INTENT_SHIFT_GUILD_USERS) and guild.large and client._should_request_users:
                 Task(KOKORO, client._request_users(guild.id))
             
-            Task(KOKORO, client.events.guild_create(client, guild))
+            client.events.dispatch(client.events.guild_create(client, guild))
 
 
     def GUILD_CREATE__OPT(client, data):
@@ -2487,7 +2509,7 @@ elif CACHE_USER:
             if (client.intents & INTENT_SHIFT_GUILD_USERS) and client._should_request_users:
                 Task(KOKORO, client._request_users(guild.id))
             
-            Task(KOKORO, client.events.guild_create(client, guild))
+            client.events.dispatch(client.events.guild_create(client, guild))
 
     def GUILD_CREATE__OPT(client, data):
         guild_state = data.get('unavailable', False)
@@ -2511,7 +2533,7 @@ else:
         
         ready_state = client.ready_state
         if (ready_state is None) or (not ready_state.feed_guild(client, guild)):
-            Task(KOKORO, client.events.guild_create(client, guild))
+            client.events.dispatch(client.events.guild_create(client, guild))
     
     def GUILD_CREATE__OPT(client, data):
         guild_state = data.get('unavailable', False)
@@ -2550,7 +2572,7 @@ def GUILD_UPDATE__CAL_SC(client, data):
     if not old_attributes:
         return
     
-    Task(KOKORO, client.events.guild_update(client, guild, old_attributes))
+    client.events.dispatch(client.events.guild_update(client, guild, old_attributes))
 
 def GUILD_UPDATE__CAL_MC(client, data):
     guild_id = int(data['guild_id'])
@@ -2573,7 +2595,7 @@ def GUILD_UPDATE__CAL_MC(client, data):
     for client_ in clients:
         event_handler = client_.events.guild_update
         if (event_handler is DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client_, guild, old_attributes))
+            client_.events.dispatch(event_handler(client_, guild, old_attributes))
 
 def GUILD_UPDATE__OPT_SC(client, data):
     guild_id = int(data['guild_id'])
@@ -2630,7 +2652,7 @@ def GUILD_DELETE__CAL(client, data):
     if (ready_state is not None):
         ready_state.discard_guild(guild)
     
-    Task(KOKORO, client.events.guild_delete(client, guild, guild_profile))
+    client.events.dispatch(client.events.guild_delete(client, guild, guild_profile))
     KOKORO.call_soon(type(guild)._delete, guild, client)
 
 
@@ -2672,7 +2694,7 @@ del (
 def GUILD_AUDIT_LOG_ENTRY_CREATE__CAL(client, data):
     audit_log_entry = AuditLogEntry.from_data(data)
     if (audit_log_entry is not None):
-        Task(KOKORO, client.events.audit_log_entry_create(client, audit_log_entry))
+        client.events.dispatch(client.events.audit_log_entry_create(client, audit_log_entry))
 
 def GUILD_AUDIT_LOG_ENTRY_CREATE__OPT(client, data):
     pass
@@ -2701,7 +2723,7 @@ def GUILD_BAN_ADD__CAL(client, data):
     
     user = User.from_data(data['user'])
     
-    Task(KOKORO, client.events.guild_ban_add(client, guild, user))
+    client.events.dispatch(client.events.guild_ban_add(client, guild, user))
 
 def GUILD_BAN_ADD__OPT(client, data):
     pass
@@ -2729,7 +2751,7 @@ def GUILD_BAN_REMOVE__CAL(client, data):
         return
     
     user = User.from_data(data['user'])
-    Task(KOKORO, client.events.guild_ban_delete(client, guild, user))
+    client.events.dispatch(client.events.guild_ban_delete(client, guild, user))
 
 def GUILD_BAN_REMOVE__OPT(client, data):
     pass
@@ -2751,7 +2773,7 @@ del (
 def GUILD_MEMBERS_CHUNK(client, data):
     event = GuildUserChunkEvent.from_data(data)
     
-    Task(KOKORO, client.events.guild_user_chunk(client, event))
+    client.events.dispatch(client.events.guild_user_chunk(client, event))
 
 
 add_parser(
@@ -2773,7 +2795,7 @@ def INTEGRATION_CREATE__CAL(client, data):
     
     integration = Integration.from_data(data)
     
-    Task(KOKORO, client.events.integration_create(client, guild, integration))
+    client.events.dispatch(client.events.integration_create(client, guild, integration))
 
 def INTEGRATION_CREATE__OPT(client, data):
     pass
@@ -2808,7 +2830,7 @@ def INTEGRATION_DELETE__CAL(client, data):
     else:
         application_id = int(application_id)
     
-    Task(KOKORO, client.events.integration_delete(client, guild, integration_id, application_id))
+    client.events.dispatch(client.events.integration_delete(client, guild, integration_id, application_id))
 
 def INTEGRATION_DELETE__OPT(client, data):
     pass
@@ -2837,7 +2859,7 @@ def INTEGRATION_UPDATE__CAL(client, data):
     
     integration = Integration.from_data(data)
     
-    Task(KOKORO, client.events.integration_update(client, guild, integration))
+    client.events.dispatch(client.events.integration_update(client, guild, integration))
 
 def INTEGRATION_UPDATE__OPT(client, data):
     pass
@@ -2864,7 +2886,7 @@ def GUILD_INTEGRATIONS_UPDATE__CAL(client, data):
         guild_sync(client, data, 'GUILD_INTEGRATIONS_UPDATE')
         return
     
-    Task(KOKORO, client.events.integration_update(client, guild))
+    client.events.dispatch(client.events.integration_update(client, guild))
 
 def GUILD_INTEGRATIONS_UPDATE__OPT(client, data):
     pass
@@ -2888,7 +2910,7 @@ def GUILD_ROLE_CREATE__CAL_SC(client, data):
     
     role = Role.from_data(data['role'], guild_id)
     
-    Task(KOKORO, client.events.role_create(client, role))
+    client.events.dispatch(client.events.role_create(client, role))
 
 
 def GUILD_ROLE_CREATE__CAL_MC(client, data):
@@ -2908,13 +2930,13 @@ def GUILD_ROLE_CREATE__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.role_create
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, role))
+            client.events.dispatch(event_handler(client, role))
     
     else:
         for client_ in clients:
             event_handler = client_.events.role_create
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, role))
+                client_.events.dispatch(event_handler(client_, role))
 
 
 def GUILD_ROLE_CREATE__OPT_SC(client, data):
@@ -2957,7 +2979,7 @@ def GUILD_ROLE_DELETE__CAL_SC(client, data):
     role = create_partial_role_from_id(role_id, guild_id)
     role._delete()
     
-    Task(KOKORO, client.events.role_delete(client, role))
+    client.events.dispatch(client.events.role_delete(client, role))
 
 
 def GUILD_ROLE_DELETE__CAL_MC(client, data):
@@ -2979,12 +3001,12 @@ def GUILD_ROLE_DELETE__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.role_delete
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, role))
+            client.events.dispatch(event_handler(client, role))
     else:
         for client_ in clients:
             event_handler = client_.events.role_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, role))
+                client_.events.dispatch(event_handler(client_, role))
 
 
 def GUILD_ROLE_DELETE__OPT_SC(client, data):
@@ -3048,7 +3070,7 @@ def GUILD_ROLE_UPDATE__CAL_SC(client, data):
     if not old_attributes:
         return
     
-    Task(KOKORO, client.events.role_update(client, role, old_attributes))
+    client.events.dispatch(client.events.role_update(client, role, old_attributes))
 
 def GUILD_ROLE_UPDATE__CAL_MC(client, data):
     guild_id = int(data['guild_id'])
@@ -3080,7 +3102,7 @@ def GUILD_ROLE_UPDATE__CAL_MC(client, data):
     for client_ in clients:
         event_handler = client_.events.role_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client_, role, old_attributes))
+            client_.events.dispatch(event_handler(client_, role, old_attributes))
 
 def GUILD_ROLE_UPDATE__OPT_SC(client, data):
     guild_id = int(data['guild_id'])
@@ -3137,7 +3159,7 @@ del (
 
 def WEBHOOKS_UPDATE__CAL(client, data):
     event = WebhookUpdateEvent(data)
-    Task(KOKORO, client.events.webhook_update(client, event))
+    client.events.dispatch(client.events.webhook_update(client, event))
 
 def WEBHOOKS_UPDATE__OPT(client, data):
     pass
@@ -3176,44 +3198,44 @@ def VOICE_STATE_UPDATE__CAL_SC(client, data):
             if action == VOICE_STATE_EVENT_JOIN:
                 event_handler = client.events.voice_client_join
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state))
+                    client.events.dispatch(event_handler(client, voice_state))
                 
                 event_handler = client.events.user_voice_join
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state))
+                    client.events.dispatch(event_handler(client, voice_state))
                 
                 continue
             
             if action == VOICE_STATE_EVENT_MOVE:
                 event_handler = client.events.voice_client_move
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(client, voice_state, change))
+                     client.events.dispatch(event_handler(client, voice_state, change))
                 
                 event_handler = client.events.user_voice_move
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state, change))
+                    client.events.dispatch(event_handler(client, voice_state, change))
                 
                 continue
             
             if action == VOICE_STATE_EVENT_LEAVE:
                 event_handler = client.events.voice_client_leave
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(client, voice_state, change))
+                     client.events.dispatch(event_handler(client, voice_state, change))
                 
                 event_handler = client.events.user_voice_leave
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state, change))
+                    client.events.dispatch(event_handler(client, voice_state, change))
                 
                 continue
             
             if action == VOICE_STATE_EVENT_UPDATE:
                 event_handler = client.events.voice_client_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(client, voice_state, change))
+                     client.events.dispatch(event_handler(client, voice_state, change))
                 
                 event_handler = client.events.user_voice_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state, change))
+                    client.events.dispatch(event_handler(client, voice_state, change))
                 
                 continue
     
@@ -3222,25 +3244,25 @@ def VOICE_STATE_UPDATE__CAL_SC(client, data):
             if action == VOICE_STATE_EVENT_JOIN:
                 event_handler = client.events.user_voice_join
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state))
+                    client.events.dispatch(event_handler(client, voice_state))
                 continue
             
             if action == VOICE_STATE_EVENT_MOVE:
                 event_handler = client.events.user_voice_move
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state, change))
+                    client.events.dispatch(event_handler(client, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_LEAVE:
                 event_handler = client.events.user_voice_leave
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state, change))
+                    client.events.dispatch(event_handler(client, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_UPDATE:
                 event_handler = client.events.user_voice_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state, change))
+                    client.events.dispatch(event_handler(client, voice_state, change))
                 continue
 
 
@@ -3278,25 +3300,25 @@ def VOICE_STATE_UPDATE__CAL_MC(client, data):
             if action == VOICE_STATE_EVENT_JOIN:
                 event_handler = user.events.voice_client_join
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(user, voice_state))
+                    user.events.dispatch(event_handler(user, voice_state))
                 continue
             
             if action == VOICE_STATE_EVENT_MOVE:
                 event_handler = user.events.voice_client_move
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(user, voice_state, change))
+                    user.events.dispatch(event_handler(user, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_LEAVE:
                 event_handler = user.events.voice_client_leave
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(user, voice_state, change))
+                    user.events.dispatch(event_handler(user, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_UPDATE:
                 event_handler = user.events.voice_client_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(user, voice_state, change))
+                    user.events.dispatch(event_handler(user, voice_state, change))
                 continue
     
     for client_ in clients:
@@ -3304,25 +3326,25 @@ def VOICE_STATE_UPDATE__CAL_MC(client, data):
             if action == VOICE_STATE_EVENT_JOIN:
                 event_handler = client_.events.user_voice_join
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, voice_state))
+                    client_.events.dispatch(event_handler(client_, voice_state))
                 continue
             
             if action == VOICE_STATE_EVENT_MOVE:
                 event_handler = client_.events.user_voice_move
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, voice_state, change))
+                    client_.events.dispatch(event_handler(client_, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_LEAVE:
                 event_handler = client_.events.user_voice_leave
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, voice_state, change))
+                    client_.events.dispatch(event_handler(client_, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_UPDATE:
                 event_handler = client_.events.user_voice_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, voice_state, change))
+                    client_.events.dispatch(event_handler(client_, voice_state, change))
                 continue
 
 
@@ -3348,25 +3370,25 @@ def VOICE_STATE_UPDATE__OPT_SC(client, data):
             if action == VOICE_STATE_EVENT_JOIN:
                 event_handler = client.events.voice_client_join
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, voice_state))
+                    client.events.dispatch(event_handler(client, voice_state))
                 continue
             
             if action == VOICE_STATE_EVENT_MOVE:
                 event_handler = client.events.voice_client_move
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(client, voice_state, change))
+                     client.events.dispatch(event_handler(client, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_LEAVE:
                 event_handler = client.events.voice_client_leave
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(client, voice_state, change))
+                     client.events.dispatch(event_handler(client, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_UPDATE:
                 event_handler = client.events.voice_client_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(client, voice_state, change))
+                     client.events.dispatch(event_handler(client, voice_state, change))
                 continue
     else:
         guild._update_voice_state_restricted(data, user)
@@ -3398,25 +3420,25 @@ def VOICE_STATE_UPDATE__OPT_MC(client, data):
             if action == VOICE_STATE_EVENT_JOIN:
                 event_handler = user.events.voice_client_join
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(user, voice_state))
+                    user.events.dispatch(event_handler(user, voice_state))
                 continue
             
             if action == VOICE_STATE_EVENT_MOVE:
                 event_handler = user.events.voice_client_move
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(user, voice_state, change))
+                    user.events.dispatch(event_handler(user, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_LEAVE:
                 event_handler = user.events.voice_client_leave
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(user, voice_state, change))
+                    user.events.dispatch(event_handler(user, voice_state, change))
                 continue
             
             if action == VOICE_STATE_EVENT_UPDATE:
                 event_handler = user.events.voice_client_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                     Task(KOKORO, event_handler(user, voice_state, change))
+                    user.events.dispatch(event_handler(user, voice_state, change))
                 continue
     
     else:
@@ -3441,7 +3463,7 @@ del (
 def VOICE_SERVER_UPDATE_CAL(client, data):
     event = VoiceServerUpdateEvent(data)
     
-    Task(KOKORO, client.events.voice_server_update(client, event))
+    client.events.dispatch(client.events.voice_server_update(client, event))
 
 def VOICE_SERVER_UPDATE__OPT(client, data):
     pass
@@ -3472,7 +3494,7 @@ if CACHE_PRESENCE:
         user = create_partial_user_from_id(user_id)
         timestamp = DateTime.fromtimestamp(data.get('timestamp', None), TimeZone.utc)
         
-        Task(KOKORO, client.events.typing(client, channel, user, timestamp))
+        client.events.dispatch(client.events.typing(client, channel, user, timestamp))
     
     def TYPING_START__OPT(client, data):
         return
@@ -3496,7 +3518,7 @@ del (
 
 def INVITE_CREATE__CAL(client, data):
     invite = Invite.from_data(data)
-    Task(KOKORO, client.events.invite_create(client, invite))
+    client.events.dispatch(client.events.invite_create(client, invite))
 
 
 def INVITE_CREATE__OPT(client, data):
@@ -3518,7 +3540,7 @@ del (
 
 def INVITE_DELETE__CAL(client, data):
     invite = create_partial_invite_from_data(data)
-    Task(KOKORO, client.events.invite_delete(client, invite))
+    client.events.dispatch(client.events.invite_delete(client, invite))
 
 
 def INVITE_DELETE__OPT(client, data):
@@ -3550,7 +3572,7 @@ def RELATIONSHIP_ADD__CAL(client, data):
         coroutine = client.events.relationship_add(client, new_relationship)
     else:
         coroutine = client.events.relationship_change(client, old_relationship, new_relationship)
-    Task(KOKORO, coroutine)
+    client.events.dispatch(coroutine)
 
 def RELATIONSHIP_ADD__OPT(client, data):
     user_id = int(data['id'])
@@ -3580,7 +3602,7 @@ def RELATIONSHIP_REMOVE__CAL(client, data):
     except KeyError:
         return
     
-    Task(KOKORO, client.events.relationship_delete(client, old_relationship))
+    client.events.dispatch(client.events.relationship_delete(client, old_relationship))
 
 def RELATIONSHIP_REMOVE__OPT(client, data):
     user_id = int(data['id'])
@@ -3634,7 +3656,7 @@ def GIFT_CODE_UPDATE__CAL(client, data):
         return
     
     gift = Gift(data)
-    Task(KOKORO, client.events.gift_update(client, channel, gift))
+    client.events.dispatch(client.events.gift_update(client, channel, gift))
 
 def GIFT_CODE_UPDATE__OPT(client, data):
     pass
@@ -3733,7 +3755,7 @@ def INTERACTION_CREATE__CAL(client, data):
     # channel & guild are not cached.
     event = InteractionEvent.from_data(data)
     
-    Task(KOKORO, client.events.interaction_create(client, event))
+    client.events.dispatch(client.events.interaction_create(client, event))
 
 def INTERACTION_CREATE__OPT(client, data):
     pass
@@ -3756,7 +3778,7 @@ def APPLICATION_COMMAND_CREATE__CAL(client, data):
     
     application_command = ApplicationCommand.from_data(data)
     
-    Task(KOKORO, client.events.application_command_create(client, guild_id, application_command))
+    client.events.dispatch(client.events.application_command_create(client, guild_id, application_command))
 
 def APPLICATION_COMMAND_CREATE__OPT(client, data):
     pass
@@ -3788,7 +3810,9 @@ def APPLICATION_COMMAND_UPDATE__CAL(client, data):
         if not old_attributes:
             return
     
-    Task(KOKORO, client.events.application_command_update(client, guild_id, application_command, old_attributes))
+    client.events.dispatch(
+        client.events.application_command_update(client, guild_id, application_command, old_attributes)
+    )
 
 def APPLICATION_COMMAND_UPDATE__OPT(client, data):
     application_command_id = data['id']
@@ -3816,7 +3840,7 @@ def APPLICATION_COMMAND_DELETE__CAL(client, data):
     guild_id = int(data['guild_id'])
     application_command = ApplicationCommand.from_data(data)
     
-    Task(KOKORO, client.events.application_command_delete(client, guild_id, application_command))
+    client.events.dispatch(client.events.application_command_delete(client, guild_id, application_command))
 
 def APPLICATION_COMMAND_DELETE__OPT(client, data):
     pass
@@ -3837,7 +3861,7 @@ del (
 def APPLICATION_COMMAND_PERMISSIONS_UPDATE__CAL(client, data):
     application_command_permission = ApplicationCommandPermission.from_data(data)
     
-    Task(KOKORO, client.events.application_command_permission_update(client, application_command_permission))
+    client.events.dispatch(client.events.application_command_permission_update(client, application_command_permission))
 
 def APPLICATION_COMMAND_PERMISSIONS_UPDATE__OPT(client, data):
     pass
@@ -3858,7 +3882,7 @@ del (
 def STAGE_INSTANCE_CREATE__CAL(client, data):
     stage = Stage.from_data(data)
     
-    Task(KOKORO, client.events.stage_create(client, stage))
+    client.events.dispatch(client.events.stage_create(client, stage))
 
 def STAGE_INSTANCE_CREATE__OPT(client, data):
     Stage.from_data(data)
@@ -3887,7 +3911,7 @@ def STAGE_INSTANCE_UPDATE__CAL_SC(client, data):
     if not old_attributes:
         return
     
-    Task(KOKORO, client.events.stage_update(client, stage, old_attributes))
+    client.events.dispatch(client.events.stage_update(client, stage, old_attributes))
 
 def STAGE_INSTANCE_UPDATE__CAL_MC(client, data):
     stage_id = int(data['id'])
@@ -3908,7 +3932,7 @@ def STAGE_INSTANCE_UPDATE__CAL_MC(client, data):
     for client_ in clients:
         event_handler = client_.events.stage_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client_, stage, old_attributes))
+            client_.events.dispatch(event_handler(client_, stage, old_attributes))
 
 
 def STAGE_INSTANCE_UPDATE__OPT(client, data):
@@ -3944,7 +3968,7 @@ def STAGE_INSTANCE_DELETE__CAL_SC(client, data):
     
     stage._delete()
     
-    Task(KOKORO, client.events.stage_delete(client, stage))
+    client.events.dispatch(client.events.stage_delete(client, stage))
 
 def STAGE_INSTANCE_DELETE__CAL_MC(client, data):
     stage_id = int(data['id'])
@@ -3963,7 +3987,7 @@ def STAGE_INSTANCE_DELETE__CAL_MC(client, data):
     for client_ in clients:
         event_handler = client_.events.stage_delete
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client_, stage))
+            client_.events.dispatch(event_handler(client_, stage))
 
 
 def STAGE_INSTANCE_DELETE__OPT(client, data):
@@ -4032,7 +4056,7 @@ def THREAD_MEMBER_UPDATE__CAL_SC(client, data):
     if (old_attributes is None):
         return
     
-    Task(KOKORO, client.events.thread_user_update(client, thread_channel, client, old_attributes))
+    client.events.dispatch(client.events.thread_user_update(client, thread_channel, client, old_attributes))
 
 
 def THREAD_MEMBER_UPDATE__CAL_MC(client, data):
@@ -4055,7 +4079,7 @@ def THREAD_MEMBER_UPDATE__CAL_MC(client, data):
     for client_ in clients:
         event_handler = client_.events.thread_user_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client_, thread_channel, client, old_attributes))
+            client_.events.dispatch(event_handler(client_, thread_channel, client, old_attributes))
 
 
 def THREAD_MEMBER_UPDATE__OPT(client, data):
@@ -4098,7 +4122,7 @@ def THREAD_MEMBERS_UPDATE__CAL_SC(client, data):
             if (thread_user_deletion is not None):
                 event_handler = client.events.thread_user_delete
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, thread_channel, *thread_user_deletion))
+                    client.events.dispatch(event_handler(client, thread_channel, *thread_user_deletion))
     
     thread_user_datas = data.get('added_members', None)
     if (thread_user_datas is not None) and thread_user_datas:
@@ -4110,7 +4134,7 @@ def THREAD_MEMBERS_UPDATE__CAL_SC(client, data):
             if created:
                 event_handler = client.events.thread_user_add
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, thread_channel, user))
+                    client.events.dispatch(event_handler(client, thread_channel, user))
 
 
 def THREAD_MEMBERS_UPDATE__CAL_MC(client, data):
@@ -4167,13 +4191,13 @@ def THREAD_MEMBERS_UPDATE__CAL_MC(client, data):
             event_handler = client_.events.thread_user_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
                 for thread_user_deletion in thread_user_deletions:
-                    Task(KOKORO, event_handler(client_, thread_channel, *thread_user_deletion))
+                    client_.events.dispatch(event_handler(client_, thread_channel, *thread_user_deletion))
         
         if (thread_user_additions is not None):
             event_handler = client_.events.thread_user_add
             if (event_handler is not DEFAULT_EVENT_HANDLER):
                 for user in thread_user_additions:
-                    Task(KOKORO, event_handler(client_, thread_channel, user))
+                    client_.events.dispatch(event_handler(client_, thread_channel, user))
 
 
 def THREAD_MEMBERS_UPDATE__OPT_SC(client, data):
@@ -4255,14 +4279,14 @@ del GUILD_APPLICATION_COMMAND_COUNTS_UPDATE
 def GUILD_SCHEDULED_EVENT_CREATE__CAL_SC(client, data):
     scheduled_event = ScheduledEvent.from_data(data)
     
-    Task(KOKORO, client.events.scheduled_event_create(client, scheduled_event))
+    client.events.dispatch(client.events.scheduled_event_create(client, scheduled_event))
 
 def GUILD_SCHEDULED_EVENT_CREATE__CAL_MC(client, data):
     scheduled_event = ScheduledEvent.from_data(data)
     
     event_handler = client.events.scheduled_event_create
     if (event_handler is not DEFAULT_EVENT_HANDLER):
-        Task(KOKORO, event_handler(client, scheduled_event))
+        client.events.dispatch(event_handler(client, scheduled_event))
 
 def GUILD_SCHEDULED_EVENT_CREATE__OPT(client, data):
     ScheduledEvent.from_data(data)
@@ -4283,7 +4307,7 @@ del (
 
 def GUILD_SCHEDULED_EVENT_DELETE__CAL_SC(client, data):
     scheduled_event = ScheduledEvent._create_from_data_and_delete(data)
-    Task(KOKORO, client.events.scheduled_event_delete(client, scheduled_event))
+    client.events.dispatch(client.events.scheduled_event_delete(client, scheduled_event))
 
 
 def GUILD_SCHEDULED_EVENT_DELETE__CAL_MC(client, data):
@@ -4303,13 +4327,13 @@ def GUILD_SCHEDULED_EVENT_DELETE__CAL_MC(client, data):
     if (guild is None):
         event_handler = client.events.scheduled_event_delete
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, scheduled_event))
+            client.events.dispatch(event_handler(client, scheduled_event))
     
     else:
         for client_ in clients:
             event_handler = client_.events.scheduled_event_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, scheduled_event))
+                client_.events.dispatch(event_handler(client_, scheduled_event))
 
 
 def GUILD_SCHEDULED_EVENT_DELETE__OPT(client, data):
@@ -4352,7 +4376,7 @@ def GUILD_SCHEDULED_EVENT_UPDATE__CAL_SC(client, data):
         if not old_attributes:
             return
     
-    Task(KOKORO, client.events.scheduled_event_update(client, scheduled_event, old_attributes))
+    client.events.dispatch(client.events.scheduled_event_update(client, scheduled_event, old_attributes))
 
 
 def GUILD_SCHEDULED_EVENT_UPDATE__CAL_MC(client, data):
@@ -4381,12 +4405,12 @@ def GUILD_SCHEDULED_EVENT_UPDATE__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.scheduled_event_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, scheduled_event, old_attributes))
+            client.events.dispatch(event_handler(client, scheduled_event, old_attributes))
     else:
         for client_ in clients:
             event_handler = client_.events.scheduled_event_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, scheduled_event, old_attributes))
+                client_.events.dispatch(event_handler(client_, scheduled_event, old_attributes))
 
 
 def GUILD_SCHEDULED_EVENT_UPDATE__OPT_SC(client, data):
@@ -4432,7 +4456,7 @@ del (
 def GUILD_SCHEDULED_EVENT_USER_ADD__CAL_SC(client, data):
     event = ScheduledEventSubscribeEvent.from_data(data)
     
-    Task(KOKORO, client.events.scheduled_event_user_subscribe(client, event))
+    client.events.dispatch(client.events.scheduled_event_user_subscribe(client, event))
 
 
 def GUILD_SCHEDULED_EVENT_USER_ADD__CAL_MC(client, data):
@@ -4440,7 +4464,7 @@ def GUILD_SCHEDULED_EVENT_USER_ADD__CAL_MC(client, data):
     if (event_handler is not DEFAULT_EVENT_HANDLER):
         event = ScheduledEventSubscribeEvent.from_data(data)
         
-        Task(KOKORO, event_handler(client, event))
+        client.events.dispatch(event_handler(client, event))
 
 
 def GUILD_SCHEDULED_EVENT_USER_ADD__OPT(client, data):
@@ -4463,7 +4487,7 @@ del (
 def GUILD_SCHEDULED_EVENT_USER_REMOVE__CAL_SC(client, data):
     event = ScheduledEventUnsubscribeEvent.from_data(data)
     
-    Task(KOKORO, client.events.scheduled_event_user_unsubscribe(client, event))
+    client.events.dispatch(client.events.scheduled_event_user_unsubscribe(client, event))
 
 
 def GUILD_SCHEDULED_EVENT_USER_REMOVE__CAL_MC(client, data):
@@ -4471,7 +4495,7 @@ def GUILD_SCHEDULED_EVENT_USER_REMOVE__CAL_MC(client, data):
     if (event_handler is not DEFAULT_EVENT_HANDLER):
         event = ScheduledEventUnsubscribeEvent.from_data(data)
         
-        Task(KOKORO, event_handler(client, event))
+        client.events.dispatch(event_handler(client, event))
 
 
 def GUILD_SCHEDULED_EVENT_USER_REMOVE__OPT(client, data):
@@ -4523,7 +4547,7 @@ def GUILD_SCHEDULED_EVENT_EXCEPTION_CREATE__CAL_SC(client, data):
         
         event_handler = client.events.scheduled_event_occasion_overwrite_create
         if (event_handler is DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, event))
+            client.events.dispatch(event_handler(client, event))
     
     else:
         event = ScheduledEventOccasionOverwriteUpdateEvent.from_fields(
@@ -4534,7 +4558,7 @@ def GUILD_SCHEDULED_EVENT_EXCEPTION_CREATE__CAL_SC(client, data):
         
         event_handler = client.events.scheduled_event_occasion_overwrite_update
         if (event_handler is DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, event))
+            client.events.dispatch(event_handler(client, event))
 
 
 def GUILD_SCHEDULED_EVENT_EXCEPTION_CREATE__CAL_MC(client, data):
@@ -4580,13 +4604,13 @@ def GUILD_SCHEDULED_EVENT_EXCEPTION_CREATE__CAL_MC(client, data):
         if clients is None:
             event_handler = client.events.scheduled_event_occasion_overwrite_create
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, event))
+                client.events.dispatch(event_handler(client, event))
         
         else:
             for client_ in clients:
                 event_handler = client_.events.scheduled_event_occasion_overwrite_create
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, event))
+                    client_.events.dispatch(event_handler(client_, event))
     
     else:
         event = ScheduledEventOccasionOverwriteUpdateEvent.from_fields(
@@ -4598,13 +4622,13 @@ def GUILD_SCHEDULED_EVENT_EXCEPTION_CREATE__CAL_MC(client, data):
         if clients is None:
             event_handler = client.events.scheduled_event_occasion_overwrite_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, event))
+                client.events.dispatch(event_handler(client, event))
         
         else:
             for client_ in clients:
                 event_handler = client_.events.scheduled_event_occasion_overwrite_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, event))
+                    client_.events.dispatch(event_handler(client_, event))
 
 
 def GUILD_SCHEDULED_EVENT_EXCEPTION_CREATE__OPT(client, data):
@@ -4661,7 +4685,7 @@ def GUILD_SCHEDULED_EVENT_EXCEPTION_DELETE__CAL_SC(client, data):
         scheduled_event_occasion_overwrite,
     )
     
-    Task(KOKORO, client.events.scheduled_event_occasion_overwrite_deletelation(client, event))
+    client.events.dispatch(client.events.scheduled_event_occasion_overwrite_deletelation(client, event))
 
 
 def GUILD_SCHEDULED_EVENT_EXCEPTION_DELETE__CAL_MC(client, data):
@@ -4706,13 +4730,13 @@ def GUILD_SCHEDULED_EVENT_EXCEPTION_DELETE__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.scheduled_event_occasion_overwrite_deletelation
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, event))
+            client.events.dispatch(event_handler(client, event))
     
     else:
         for client_ in clients:
             event_handler = client_.events.scheduled_event_occasion_overwrite_deletelation
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, event))
+                client_.events.dispatch(event_handler(client_, event))
 
 
 def GUILD_SCHEDULED_EVENT_EXCEPTION_DELETE__OPT(client, data):
@@ -4755,31 +4779,31 @@ def EMBEDDED_ACTIVITY_UPDATE__CAL_SC(client, data):
         if action == EMBEDDED_ACTIVITY_UPDATE_CREATE:
             event_handler = client.events.embedded_activity_create
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, embedded_activity))
+                client.events.dispatch(event_handler(client, embedded_activity))
             continue
         
         if action == EMBEDDED_ACTIVITY_UPDATE_DELETE:
             event_handler = client.events.embedded_activity_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, embedded_activity))
+                client.events.dispatch(event_handler(client, embedded_activity))
             continue
         
         if action == EMBEDDED_ACTIVITY_UPDATE_UPDATE:
             event_handler = client.events.embedded_activity_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, embedded_activity, value))
+                client.events.dispatch(event_handler(client, embedded_activity, value))
             continue
         
         if action == EMBEDDED_ACTIVITY_UPDATE_USER_ADD:
             event_handler = client.events.embedded_activity_user_add
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, embedded_activity, value))
+                client.events.dispatch(event_handler(client, embedded_activity, value))
             continue
         
         if action == EMBEDDED_ACTIVITY_UPDATE_USER_DELETE:
             event_handler = client.events.embedded_activity_user_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, embedded_activity, value))
+                client.events.dispatch(event_handler(client, embedded_activity, value))
             continue
         
         # no more cases
@@ -4809,31 +4833,31 @@ def EMBEDDED_ACTIVITY_UPDATE__CAL_MC(client, data):
             if action == EMBEDDED_ACTIVITY_UPDATE_CREATE:
                 event_handler = client.events.embedded_activity_create
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, embedded_activity))
+                    client.events.dispatch(event_handler(client, embedded_activity))
                 continue
             
             if action == EMBEDDED_ACTIVITY_UPDATE_DELETE:
                 event_handler = client.events.embedded_activity_delete
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, embedded_activity))
+                    client.events.dispatch(event_handler(client, embedded_activity))
                 continue
             
             if action == EMBEDDED_ACTIVITY_UPDATE_UPDATE:
                 event_handler = client.events.embedded_activity_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, embedded_activity, value))
+                    client.events.dispatch(event_handler(client, embedded_activity, value))
                 continue
             
             if action == EMBEDDED_ACTIVITY_UPDATE_USER_ADD:
                 event_handler = client.events.embedded_activity_user_add
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, embedded_activity, value))
+                    client.events.dispatch(event_handler(client, embedded_activity, value))
                 continue
             
             if action == EMBEDDED_ACTIVITY_UPDATE_USER_DELETE:
                 event_handler = client.events.embedded_activity_user_delete
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client, embedded_activity, value))
+                    client.events.dispatch(event_handler(client, embedded_activity, value))
                 continue
             
             # no more cases
@@ -4845,31 +4869,31 @@ def EMBEDDED_ACTIVITY_UPDATE__CAL_MC(client, data):
                 if action == EMBEDDED_ACTIVITY_UPDATE_CREATE:
                     event_handler = client_.events.embedded_activity_create
                     if (event_handler is not DEFAULT_EVENT_HANDLER):
-                        Task(KOKORO, event_handler(client_, embedded_activity))
+                        client_.events.dispatch(event_handler(client_, embedded_activity))
                     continue
                 
                 if action == EMBEDDED_ACTIVITY_UPDATE_DELETE:
                     event_handler = client_.events.embedded_activity_delete
                     if (event_handler is not DEFAULT_EVENT_HANDLER):
-                        Task(KOKORO, event_handler(client_, embedded_activity))
+                        client_.events.dispatch(event_handler(client_, embedded_activity))
                     continue
                 
                 if action == EMBEDDED_ACTIVITY_UPDATE_UPDATE:
                     event_handler = client_.events.embedded_activity_update
                     if (event_handler is not DEFAULT_EVENT_HANDLER):
-                        Task(KOKORO, event_handler(client_, embedded_activity, value))
+                        client_.events.dispatch(event_handler(client_, embedded_activity, value))
                     continue
                 
                 if action == EMBEDDED_ACTIVITY_UPDATE_USER_ADD:
                     event_handler = client_.events.embedded_activity_user_add
                     if (event_handler is not DEFAULT_EVENT_HANDLER):
-                        Task(KOKORO, event_handler(client_, embedded_activity, value))
+                        client_.events.dispatch(event_handler(client_, embedded_activity, value))
                     continue
                 
                 if action == EMBEDDED_ACTIVITY_UPDATE_USER_DELETE:
                     event_handler = client_.events.embedded_activity_user_delete
                     if (event_handler is not DEFAULT_EVENT_HANDLER):
-                        Task(KOKORO, event_handler(client_, embedded_activity, value))
+                        client_.events.dispatch(event_handler(client_, embedded_activity, value))
                     continue
                 
                 # no more cases
@@ -4917,7 +4941,7 @@ del (
 def GUILD_APPLICATION_COMMAND_INDEX_UPDATE__CAL(client, data):
     event = ApplicationCommandCountUpdate(data)
     
-    Task(KOKORO, client.events.application_command_count_update(client, event))
+    client.events.dispatch(client.events.application_command_count_update(client, event))
 
 
 def GUILD_APPLICATION_COMMAND_INDEX_UPDATE__OPT(client, data):
@@ -4938,7 +4962,7 @@ del (
 
 def AUTO_MODERATION_RULE_CREATE__CAL_SC(client, data):
     auto_moderation_rule = AutoModerationRule.from_data(data)
-    Task(KOKORO, client.events.auto_moderation_rule_create(client, auto_moderation_rule))
+    client.events.dispatch(client.events.auto_moderation_rule_create(client, auto_moderation_rule))
 
 
 def AUTO_MODERATION_RULE_CREATE__CAL_MC(client, data):
@@ -4946,7 +4970,7 @@ def AUTO_MODERATION_RULE_CREATE__CAL_MC(client, data):
     
     event_handler = client.events.auto_moderation_rule_create
     if (event_handler is not DEFAULT_EVENT_HANDLER):
-        Task(KOKORO, event_handler(client, auto_moderation_rule))
+        client.events.dispatch(event_handler(client, auto_moderation_rule))
 
 
 def AUTO_MODERATION_RULE_CREATE__OPT(client, data):
@@ -4978,7 +5002,7 @@ def AUTO_MODERATION_RULE_UPDATE__CAL_SC(client, data):
     else:
         old_attributes = auto_moderation_rule._difference_update_attributes(data)
     
-    Task(KOKORO, client.events.auto_moderation_rule_update(client, auto_moderation_rule, old_attributes))
+    client.events.dispatch(client.events.auto_moderation_rule_update(client, auto_moderation_rule, old_attributes))
 
 
 def AUTO_MODERATION_RULE_UPDATE__CAL_MC(client, data):
@@ -5004,7 +5028,7 @@ def AUTO_MODERATION_RULE_UPDATE__CAL_MC(client, data):
         
         event_handler = client.events.auto_moderation_rule_update
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, auto_moderation_rule, old_attributes))
+            client.events.dispatch(event_handler(client, auto_moderation_rule, old_attributes))
         
     else:
         clients = filter_clients(guild.iter_clients(), INTENT_MASK_AUTO_MODERATION_CONFIGURATION, client)
@@ -5028,7 +5052,7 @@ def AUTO_MODERATION_RULE_UPDATE__CAL_MC(client, data):
         for client_ in clients:
             event_handler = client_.events.auto_moderation_rule_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, auto_moderation_rule, old_attributes))
+                client_.events.dispatch(event_handler(client_, auto_moderation_rule, old_attributes))
 
 
 def AUTO_MODERATION_RULE_UPDATE__OPT(client, data):
@@ -5058,7 +5082,7 @@ del (
 
 def AUTO_MODERATION_RULE_DELETE__CAL_SC(client, data):
     auto_moderation_rule = AutoModerationRule.from_data(data)
-    Task(KOKORO, client.events.auto_moderation_rule_delete(client, auto_moderation_rule))
+    client.events.dispatch(client.events.auto_moderation_rule_delete(client, auto_moderation_rule))
 
 
 def AUTO_MODERATION_RULE_DELETE__CAL_MC(client, data):
@@ -5066,7 +5090,7 @@ def AUTO_MODERATION_RULE_DELETE__CAL_MC(client, data):
     
     event_handler = client.events.auto_moderation_rule_delete
     if (event_handler is not DEFAULT_EVENT_HANDLER):
-        Task(KOKORO, event_handler(client, auto_moderation_rule))
+        client.events.dispatch(event_handler(client, auto_moderation_rule))
 
 
 def AUTO_MODERATION_RULE_DELETE__OPT(client, data):
@@ -5089,7 +5113,7 @@ del (
 
 def AUTO_MODERATION_ACTION_EXECUTION__CAL_SC(client, data):
     event = AutoModerationActionExecutionEvent.from_data(data)
-    Task(KOKORO, client.events.auto_moderation_action_execution(client, event))
+    client.events.dispatch(client.events.auto_moderation_action_execution(client, event))
 
 
 def AUTO_MODERATION_ACTION_EXECUTION__CAL_MC(client, data):
@@ -5097,7 +5121,7 @@ def AUTO_MODERATION_ACTION_EXECUTION__CAL_MC(client, data):
     event_handler = client.events.auto_moderation_action_execution
     if (event_handler is not DEFAULT_EVENT_HANDLER):
         event = AutoModerationActionExecutionEvent.from_data(data)
-        Task(KOKORO, event_handler(client, event))
+        client.events.dispatch(event_handler(client, event))
 
 
 def AUTO_MODERATION_ACTION_EXECUTION__OPT(client, data):
@@ -5120,14 +5144,14 @@ del (
 
 def VOICE_CHANNEL_EFFECT_SEND__CAL_SC(client, data):
     event = VoiceChannelEffect.from_data(data)
-    Task(KOKORO, client.events.voice_channel_effect(client, event))
+    client.events.dispatch(client.events.voice_channel_effect(client, event))
 
 
 def VOICE_CHANNEL_EFFECT_SEND__CAL_MC(client, data):
     event_handler = client.events.voice_channel_effect
     if (event_handler is not DEFAULT_EVENT_HANDLER):
         event = VoiceChannelEffect.from_data(data)
-        Task(KOKORO, event_handler(client, event))
+        client.events.dispatch(event_handler(client, event))
 
 
 def VOICE_CHANNEL_EFFECT_SEND__OPT(client, data):
@@ -5150,7 +5174,7 @@ del (
 
 def SOUNDBOARD_SOUNDS__CAL(client, data):
     event = SoundboardSoundsEvent.from_data(data)
-    Task(KOKORO, client.events.soundboard_sounds(client, event))
+    client.events.dispatch(client.events.soundboard_sounds(client, event))
 
 
 def SOUNDBOARD_SOUNDS__OPT(client, data):
@@ -5172,7 +5196,7 @@ del (
 
 def GUILD_SOUNDBOARD_SOUND_CREATE__CAL(client, data):
     soundboard_sound = SoundboardSound.from_data(data)
-    Task(KOKORO, client.events.soundboard_sound_create(client, soundboard_sound))
+    client.events.dispatch(client.events.soundboard_sound_create(client, soundboard_sound))
 
 
 def GUILD_SOUNDBOARD_SOUND_CREATE__OPT(client, data):
@@ -5201,7 +5225,7 @@ def GUILD_SOUNDBOARD_SOUND_UPDATE__CAL__SC(client, data):
         if not old_attributes:
             return
     
-    Task(KOKORO, client.events.soundboard_sound_update(client, sound, old_attributes))
+    client.events.dispatch(client.events.soundboard_sound_update(client, sound, old_attributes))
 
 
 def GUILD_SOUNDBOARD_SOUND_UPDATE__CAL__MC(client, data):
@@ -5223,12 +5247,12 @@ def GUILD_SOUNDBOARD_SOUND_UPDATE__CAL__MC(client, data):
             return
     
     if clients is None:
-        Task(KOKORO, client.soundboard_sound_update(client, sound, old_attributes))
+        client.events.dispatch(client.events.soundboard_sound_update(client, sound, old_attributes))
     else:
         for client_ in clients:
             event_handler = client_.events.soundboard_sound_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, sound, old_attributes))
+                client_.events.dispatch(event_handler(client_, sound, old_attributes))
 
 
 def GUILD_SOUNDBOARD_SOUND_UPDATE__OPT(client, data):
@@ -5252,7 +5276,7 @@ del (
 def GUILD_SOUNDBOARD_SOUND_DELETE__CAL__SC(client, data):
     sound = create_partial_soundboard_sound_from_partial_data(data)
     sound._delete()
-    Task(KOKORO, client.events.soundboard_sound_delete(client, sound))
+    client.events.dispatch(client.events.soundboard_sound_delete(client, sound))
 
 
 def GUILD_SOUNDBOARD_SOUND_DELETE__CAL__MC(client, data):
@@ -5269,12 +5293,12 @@ def GUILD_SOUNDBOARD_SOUND_DELETE__CAL__MC(client, data):
     sound._delete()
     
     if clients is None:
-        Task(KOKORO, client.soundboard_sound_delete(client, sound))
+        client.events.dispatch(client.events.soundboard_sound_delete(client, sound))
     else:
         for client_ in clients:
             event_handler = client_.events.soundboard_sound_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, sound))
+                client_.events.dispatch(event_handler(client_, sound))
 
 
 def GUILD_SOUNDBOARD_SOUND_DELETE__OPT(client, data):
@@ -5313,19 +5337,19 @@ def GUILD_SOUNDBOARD_SOUNDS_UPDATE__CAL_SC(client, data):
         if action == SOUNDBOARD_SOUND_EVENT_UPDATE:
             event_handler = client.events.soundboard_sound_update
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, soundboard_sound, old_attributes))
+                client.events.dispatch(event_handler(client, soundboard_sound, old_attributes))
             continue
             
         if action == SOUNDBOARD_SOUND_EVENT_CREATE:
             event_handler = client.events.soundboard_sound_create
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, soundboard_sound))
+                client.events.dispatch(event_handler(client, soundboard_sound))
             continue
         
         if action == SOUNDBOARD_SOUND_EVENT_DELETE:
             event_handler = client.events.soundboard_sound_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client, soundboard_sound))
+                client.events.dispatch(event_handler(client, soundboard_sound))
             continue
         
         # no more case
@@ -5356,19 +5380,19 @@ def GUILD_SOUNDBOARD_SOUNDS_UPDATE__CAL_MC(client, data):
             if action == SOUNDBOARD_SOUND_EVENT_UPDATE:
                 event_handler = client_.events.soundboard_sound_update
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, soundboard_sound, old_attributes))
+                    client_.events.dispatch(event_handler(client_, soundboard_sound, old_attributes))
                 continue
             
             if action == SOUNDBOARD_SOUND_EVENT_CREATE:
                 event_handler = client_.events.soundboard_sound_create
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, soundboard_sound))
+                    client_.events.dispatch(event_handler(client_, soundboard_sound))
                 continue
             
             if action == SOUNDBOARD_SOUND_EVENT_DELETE:
                 event_handler = client_.events.soundboard_sound_delete
                 if (event_handler is not DEFAULT_EVENT_HANDLER):
-                    Task(KOKORO, event_handler(client_, soundboard_sound))
+                    client_.events.dispatch(event_handler(client_, soundboard_sound))
                 continue
             
             # no more case
@@ -5420,7 +5444,7 @@ del (
 
 def ENTITLEMENT_CREATE__CAL(client, data):
     entitlement = Entitlement.from_data(data)
-    Task(KOKORO, client.events.entitlement_create(client, entitlement))
+    client.events.dispatch(client.events.entitlement_create(client, entitlement))
 
 
 def ENTITLEMENT_CREATE__OPT(client, data):
@@ -5442,7 +5466,7 @@ del (
 
 def ENTITLEMENT_DELETE__CAL(client, data):
     entitlement = Entitlement.from_data(data)
-    Task(KOKORO, client.events.entitlement_delete(client, entitlement))
+    client.events.dispatch(client.events.entitlement_delete(client, entitlement))
 
 
 def ENTITLEMENT_DELETE__OPT(client, data):
@@ -5477,7 +5501,7 @@ def ENTITLEMENT_UPDATE__CAL(client, data):
         if not old_attributes:
             return
     
-    Task(KOKORO, client.events.entitlement_update(client, entitlement, old_attributes))
+    client.events.dispatch(client.events.entitlement_update(client, entitlement, old_attributes))
 
 
 def ENTITLEMENT_UPDATE__OPT(client, data):
@@ -5508,7 +5532,7 @@ def MESSAGE_POLL_VOTE_ADD__CAL_SC(client, data):
     event = PollVoteAddEvent.from_data(data)
     event.message._add_poll_vote(event.answer_id, event.user)
     
-    Task(KOKORO, client.events.poll_vote_add(client, event))
+    client.events.dispatch(client.events.poll_vote_add(client, event))
 
 
 def MESSAGE_POLL_VOTE_ADD__CAL_MC(client, data):
@@ -5531,16 +5555,16 @@ def MESSAGE_POLL_VOTE_ADD__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.poll_vote_add
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, event))
+            client.events.dispatch(event_handler(client, event))
     else:
         for client_ in clients:
             event_handler = client_.events.poll_vote_add
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, event))
+                client_.events.dispatch(event_handler(client_, event))
 
 
 def MESSAGE_POLL_VOTE_ADD__OPT_SC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -5548,7 +5572,7 @@ def MESSAGE_POLL_VOTE_ADD__OPT_SC(client, data):
 
 
 def MESSAGE_POLL_VOTE_ADD__OPT_MC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -5582,7 +5606,7 @@ def MESSAGE_POLL_VOTE_REMOVE__CAL_SC(client, data):
     event = PollVoteDeleteEvent.from_data(data)
     event.message._remove_poll_vote(event.answer_id, event.user)
     
-    Task(KOKORO, client.events.poll_vote_delete(client, event))
+    client.events.dispatch(client.events.poll_vote_delete(client, event))
 
 
 def MESSAGE_POLL_VOTE_REMOVE__CAL_MC(client, data):
@@ -5606,16 +5630,16 @@ def MESSAGE_POLL_VOTE_REMOVE__CAL_MC(client, data):
     if clients is None:
         event_handler = client.events.poll_vote_delete
         if (event_handler is not DEFAULT_EVENT_HANDLER):
-            Task(KOKORO, event_handler(client, event))
+            client.events.dispatch(event_handler(client, event))
     else:
         for client_ in clients:
             event_handler = client_.events.poll_vote_delete
             if (event_handler is not DEFAULT_EVENT_HANDLER):
-                Task(KOKORO, event_handler(client_, event))
+                client_.events.dispatch(event_handler(client_, event))
 
 
 def MESSAGE_POLL_VOTE_REMOVE__OPT_SC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -5623,7 +5647,7 @@ def MESSAGE_POLL_VOTE_REMOVE__OPT_SC(client, data):
 
 
 def MESSAGE_POLL_VOTE_REMOVE__OPT_MC(client, data):
-    message = MESSAGES.get(int(data['message_id']), None)
+    message = MESSAGE_CACHE_POLICY.get(int(data['message_id']))
     if message is None:
         return
     
@@ -5658,7 +5682,7 @@ del (
 
 def SUBSCRIPTION_CREATE__CAL(client, data):
     subscription = Subscription.from_data(data)
-    Task(KOKORO, client.events.subscription_create(client, subscription))
+    client.events.dispatch(client.events.subscription_create(client, subscription))
 
 
 def SUBSCRIPTION_CREATE__OPT(client, data):
@@ -5680,7 +5704,7 @@ del (
 
 def SUBSCRIPTION_DELETE__CAL(client, data):
     subscription = Subscription.from_data(data)
-    Task(KOKORO, client.events.subscription_delete(client, subscription))
+    client.events.dispatch(client.events.subscription_delete(client, subscription))
 
 
 def SUBSCRIPTION_DELETE__OPT(client, data):
@@ -5715,7 +5739,7 @@ def SUBSCRIPTION_UPDATE__CAL(client, data):
         if not old_attributes:
             return
     
-    Task(KOKORO, client.events.subscription_update(client, subscription, old_attributes))
+    client.events.dispatch(client.events.subscription_update(client, subscription, old_attributes))
 
 
 def SUBSCRIPTION_UPDATE__OPT(client, data):
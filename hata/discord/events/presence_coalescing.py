@@ -0,0 +1,76 @@
+__all__ = ()
+
+from ..core import KOKORO, USERS
+
+
+PRESENCE_UPDATES = {}
+
+
+def coalesce_presence_update(client, data, window, apply):
+    """
+    Buffers the given presence update payload, keeping only the latest one of each user. The first payload of a user
+    schedules `apply` to be called with the latest one after `window` seconds.
+    
+    Presence payloads contain the whole presence, so applying only the latest one results the same state. Since only
+    a single difference is calculated, the dispatched event's old attributes are the ones before the first buffered
+    payload. Payloads with user changes are not buffered.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client who received the payload.
+    
+    data : `dict<str, object>`
+        Presence update payload.
+    
+    window : `float`
+        The time to buffer the payloads for in seconds.
+    
+    apply : `FunctionType`
+        Presence update parser to call with the latest payload.
+    """
+    user_data = data['user']
+    user_id = int(user_data['id'])
+    
+    # User changes are not coalesced. Apply the buffered payload first to keep the order.
+    if len(user_data) > 1:
+        try:
+            pending_client, pending_data, pending_handle = PRESENCE_UPDATES.pop(user_id)
+        except KeyError:
+            pass
+        else:
+            pending_handle.cancel()
+            apply(pending_client, pending_data)
+        
+        apply(client, data)
+        return
+    
+    if user_id not in USERS:
+        return
+    
+    try:
+        pending_client, pending_data, handle = PRESENCE_UPDATES[user_id]
+    except KeyError:
+        handle = KOKORO.call_after(window, _apply_presence_update, user_id, apply)
+    
+    PRESENCE_UPDATES[user_id] = (client, data, handle)
+
+
+def _apply_presence_update(user_id, apply):
+    """
+    Applies the latest buffered presence update payload of the given user.
+    
+    Parameters
+    ----------
+    user_id : `int`
+        The user's identifier.
+    
+    apply : `FunctionType`
+        Presence update parser to call with the latest payload.
+    """
+    try:
+        client, data, handle = PRESENCE_UPDATES.pop(user_id)
+    except KeyError:
+        return
+    
+    apply(client, data)
@@ -0,0 +1,81 @@
+import vampytest
+from scarletio import CancelledError, Future, skip_ready_cycle
+
+from ...core import KOKORO
+
+from ..handling_helpers import EagerTask
+
+
+async def test__EagerTask__new():
+    """
+    Tests whether ``EagerTask.__new__`` works as intended.
+    
+    Case: the coroutine does not suspend.
+    
+    This function is a coroutine.
+    """
+    called = []
+    
+    async def coroutine_function():
+        nonlocal called
+        called.append(KOKORO.current_task)
+        return 12
+    
+    current_task = KOKORO.current_task
+    task = EagerTask(KOKORO, coroutine_function())
+    
+    vampytest.assert_instance(task, EagerTask)
+    vampytest.assert_eq(called, [task])
+    vampytest.assert_is(KOKORO.current_task, current_task)
+    vampytest.assert_true(task.is_done())
+    vampytest.assert_eq(task.get_result(), 12)
+
+
+async def test__EagerTask__new__exception():
+    """
+    Tests whether ``EagerTask.__new__`` works as intended.
+    
+    Case: the coroutine raises.
+    
+    This function is a coroutine.
+    """
+    async def coroutine_function():
+        raise ValueError('pudding')
+    
+    current_task = KOKORO.current_task
+    task = EagerTask(KOKORO, coroutine_function())
+    
+    vampytest.assert_is(KOKORO.current_task, current_task)
+    vampytest.assert_true(task.is_done())
+    vampytest.assert_instance(task.get_exception(), ValueError)
+
+
+async def test__EagerTask__cancel():
+    """
+    Tests whether ``EagerTask.cancel`` works as intended.
+    
+    Case: cancelling a suspended eager task.
+    
+    This function is a coroutine.
+    """
+    future = Future(KOKORO)
+    called = []
+    
+    async def coroutine_function():
+        nonlocal called
+        nonlocal future
+        try:
+            await future
+        except CancelledError:
+            called.append('cancelled')
+            raise
+    
+    task = EagerTask(KOKORO, coroutine_function())
+    vampytest.assert_false(task.is_done())
+    
+    task.cancel()
+    await skip_ready_cycle()
+    await skip_ready_cycle()
+    
+    vampytest.assert_eq(called, ['cancelled'])
+    vampytest.assert_true(task.is_cancelled())
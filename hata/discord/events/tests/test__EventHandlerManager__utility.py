@@ -1,6 +1,7 @@
 from warnings import catch_warnings, simplefilter as apply_simple_filter
 
 import vampytest
+from scarletio import skip_ready_cycle
 
 from ...client import Client
 
@@ -23,3 +24,60 @@ def test__EventHandlerManager__clear():
     finally:
         client._delete()
         client = None
+
+
+async def test__EventHandlerManager__dispatch__default():
+    """
+    Tests whether ``EventHandlerManager.dispatch`` works as intended.
+    
+    Case: default, creating a task.
+    
+    This function is a coroutine.
+    """
+    client = Client('token_20261017_0')
+    called = []
+    
+    async def event_handler(value):
+        nonlocal called
+        called.append(value)
+    
+    try:
+        vampytest.assert_false(client.events.inline_dispatch)
+        
+        client.events.dispatch(event_handler(1))
+        vampytest.assert_eq(called, [])
+        
+        await skip_ready_cycle()
+        vampytest.assert_eq(called, [1])
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__EventHandlerManager__dispatch__inline():
+    """
+    Tests whether ``EventHandlerManager.dispatch`` works as intended.
+    
+    Case: inline.
+    
+    This function is a coroutine.
+    """
+    client = Client('token_20261017_1')
+    called = []
+    
+    async def event_handler(value):
+        nonlocal called
+        called.append(value)
+    
+    try:
+        client.events.inline_dispatch = True
+        vampytest.assert_true(client.events.inline_dispatch)
+        
+        client.events.dispatch(event_handler(1))
+        client.events.dispatch(event_handler(2))
+        vampytest.assert_eq(called, [1, 2])
+    
+    finally:
+        client._delete()
+        client = None
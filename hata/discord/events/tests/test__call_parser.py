@@ -0,0 +1,58 @@
+import vampytest
+
+from ..handling_helpers import call_parser, run_coroutine_inline
+
+
+async def test__call_parser__nested():
+    """
+    Tests whether ``call_parser`` works as intended.
+    
+    Case: nested parser call, the coroutines run after the outer parser returned.
+    
+    This function is a coroutine.
+    """
+    called = []
+    
+    async def coroutine_function(value):
+        nonlocal called
+        called.append(value)
+    
+    def inner_parser(client, data):
+        run_coroutine_inline(coroutine_function(data))
+    
+    def outer_parser(client, data):
+        nonlocal called
+        run_coroutine_inline(coroutine_function(data))
+        call_parser(inner_parser, client, data + 1)
+        vampytest.assert_eq(called, [])
+    
+    call_parser(outer_parser, None, 1)
+    vampytest.assert_eq(called, [1, 2])
+
+
+async def test__call_parser__exception():
+    """
+    Tests whether ``call_parser`` works as intended.
+    
+    Case: the parser raises, the already dispatched coroutines still run.
+    
+    This function is a coroutine.
+    """
+    called = []
+    
+    async def coroutine_function(value):
+        nonlocal called
+        called.append(value)
+    
+    def parser(client, data):
+        run_coroutine_inline(coroutine_function(data))
+        raise ValueError('pudding')
+    
+    with vampytest.assert_raises(ValueError):
+        call_parser(parser, None, 1)
+    
+    vampytest.assert_eq(called, [1])
+    
+    # The queue is reset, so coroutines dispatched outside of parsers run instantly.
+    run_coroutine_inline(coroutine_function(2))
+    vampytest.assert_eq(called, [1, 2])
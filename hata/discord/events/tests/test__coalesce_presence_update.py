@@ -0,0 +1,90 @@
+import vampytest
+from scarletio import sleep
+
+from ...core import KOKORO, USERS
+from ...user import User
+
+from ..presence_coalescing import PRESENCE_UPDATES, coalesce_presence_update
+
+
+async def test__coalesce_presence_update__presence():
+    """
+    Tests whether ``coalesce_presence_update`` works as intended.
+    
+    Case: presence only payloads.
+    
+    This function is a coroutine.
+    """
+    user_id = 202610170600
+    user = User.precreate(user_id)
+    client = object()
+    applied = []
+    
+    def apply(client, data):
+        applied.append((client, data))
+    
+    datas = [
+        {'user': {'id': str(user_id)}, 'status': status, 'activities': []}
+        for status in ('online', 'idle', 'dnd')
+    ]
+    
+    for data in datas:
+        coalesce_presence_update(client, data, 0.01, apply)
+    
+    vampytest.assert_eq(applied, [])
+    vampytest.assert_in(user_id, PRESENCE_UPDATES)
+    
+    await sleep(0.05, KOKORO)
+    
+    vampytest.assert_eq(applied, [(client, datas[-1])])
+    vampytest.assert_not_in(user_id, PRESENCE_UPDATES)
+    vampytest.assert_is(USERS.get(user_id, None), user)
+
+
+async def test__coalesce_presence_update__user_change():
+    """
+    Tests whether ``coalesce_presence_update`` works as intended.
+    
+    Case: payload with user changes.
+    
+    This function is a coroutine.
+    """
+    user_id = 202610170601
+    user = User.precreate(user_id)
+    client = object()
+    applied = []
+    
+    def apply(client, data):
+        applied.append((client, data))
+    
+    data_0 = {'user': {'id': str(user_id)}, 'status': 'online', 'activities': []}
+    data_1 = {'user': {'id': str(user_id), 'username': 'koishi'}, 'status': 'idle', 'activities': []}
+    
+    coalesce_presence_update(client, data_0, 0.01, apply)
+    coalesce_presence_update(client, data_1, 0.01, apply)
+    
+    vampytest.assert_eq(applied, [(client, data_0), (client, data_1)])
+    vampytest.assert_not_in(user_id, PRESENCE_UPDATES)
+    
+    await sleep(0.05, KOKORO)
+    
+    vampytest.assert_eq(len(applied), 2)
+    vampytest.assert_is(USERS.get(user_id, None), user)
+
+
+def test__coalesce_presence_update__not_cached():
+    """
+    Tests whether ``coalesce_presence_update`` works as intended.
+    
+    Case: user not cached.
+    """
+    user_id = 202610170602
+    applied = []
+    
+    def apply(client, data):
+        applied.append((client, data))
+    
+    coalesce_presence_update(object(), {'user': {'id': str(user_id)}, 'status': 'online'}, 0.01, apply)
+    
+    vampytest.assert_eq(applied, [])
+    vampytest.assert_not_in(user_id, PRESENCE_UPDATES)
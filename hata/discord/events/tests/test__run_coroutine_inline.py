@@ -0,0 +1,119 @@
+import vampytest
+from scarletio import Future, skip_ready_cycle
+
+from ...core import KOKORO
+
+from ..handling_helpers import EagerTask, call_parser, run_coroutine_inline
+
+
+async def test__run_coroutine_inline__no_suspension():
+    """
+    Tests whether ``run_coroutine_inline`` works as intended.
+    
+    Case: the coroutine does not suspend.
+    
+    This function is a coroutine.
+    """
+    called = []
+    
+    async def coroutine_function():
+        nonlocal called
+        called.append(KOKORO.current_task)
+    
+    current_task = KOKORO.current_task
+    run_coroutine_inline(coroutine_function())
+    
+    vampytest.assert_eq(len(called), 1)
+    vampytest.assert_instance(called[0], EagerTask)
+    vampytest.assert_true(called[0].is_done())
+    vampytest.assert_is(KOKORO.current_task, current_task)
+
+
+async def test__run_coroutine_inline__suspending_on_future():
+    """
+    Tests whether ``run_coroutine_inline`` works as intended.
+    
+    Case: the coroutine suspends on a future.
+    
+    This function is a coroutine.
+    """
+    future = Future(KOKORO)
+    called = []
+    
+    async def coroutine_function():
+        nonlocal called
+        nonlocal future
+        called.append(KOKORO.current_task)
+        result = await future
+        called.append(result)
+        called.append(KOKORO.current_task)
+    
+    run_coroutine_inline(coroutine_function())
+    vampytest.assert_eq(len(called), 1)
+    
+    await skip_ready_cycle()
+    vampytest.assert_eq(len(called), 1)
+    
+    future.set_result(12)
+    await skip_ready_cycle()
+    await skip_ready_cycle()
+    vampytest.assert_eq(len(called), 3)
+    vampytest.assert_eq(called[1], 12)
+    vampytest.assert_instance(called[0], EagerTask)
+    vampytest.assert_is(called[2], called[0])
+
+
+async def test__run_coroutine_inline__suspending_on_ready_cycle():
+    """
+    Tests whether ``run_coroutine_inline`` works as intended.
+    
+    Case: the coroutine skips a ready cycle.
+    
+    This function is a coroutine.
+    """
+    called = []
+    
+    async def coroutine_function():
+        nonlocal called
+        called.append('start')
+        await skip_ready_cycle()
+        called.append('end')
+    
+    run_coroutine_inline(coroutine_function())
+    vampytest.assert_eq(called, ['start'])
+    
+    await skip_ready_cycle()
+    await skip_ready_cycle()
+    vampytest.assert_eq(called, ['start', 'end'])
+
+
+async def test__run_coroutine_inline__in_parser():
+    """
+    Tests whether ``run_coroutine_inline`` works as intended.
+    
+    Case: called from a parser, the coroutine runs after the parser returned.
+    
+    This function is a coroutine.
+    """
+    state = []
+    called = []
+    
+    async def coroutine_function(value):
+        nonlocal called
+        nonlocal state
+        called.append((value, [*state]))
+    
+    def parser(client, data):
+        nonlocal called
+        nonlocal state
+        state.append(data)
+        run_coroutine_inline(coroutine_function(1))
+        run_coroutine_inline(coroutine_function(2))
+        state.append(data + 1)
+        vampytest.assert_eq(called, [])
+        return data
+    
+    output = call_parser(parser, None, 5)
+    
+    vampytest.assert_eq(output, 5)
+    vampytest.assert_eq(called, [(1, [5, 6]), (2, [5, 6])])
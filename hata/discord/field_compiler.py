@@ -0,0 +1,577 @@
+__all__ = ()
+
+from scarletio import RichAttributeErrorBaseType
+
+from .field_parsers import (
+    _field_parser_factory, default_date_time_parser_factory, default_entity_parser_factory,
+    entity_id_array_parser_factory, entity_id_parser_factory, field_parser_factory, flag_parser_factory,
+    force_string_parser_factory, nullable_entity_array_parser_factory, nullable_int_parser_factory,
+    nullable_object_array_parser_factory, nullable_string_parser_factory, preinstanced_parser_factory
+)
+from .field_putters import (
+    entity_id_optional_putter_factory, entity_id_putter_factory, field_optional_putter_factory, field_putter_factory,
+    flag_optional_putter_factory, flag_putter_factory, force_string_putter_factory,
+    nullable_date_time_optional_putter_factory, nullable_date_time_putter_factory,
+    nullable_string_optional_putter_factory, nullable_string_putter_factory, string_flag_optional_putter_factory,
+    string_flag_putter_factory
+)
+from .utils import datetime_to_timestamp, timestamp_to_datetime
+
+
+PARSER_TEMPLATES = {}
+PUTTER_TEMPLATES = {}
+
+# Constants of these types are put directly into the generated source.
+INLINED_CONSTANT_TYPES = frozenset((bool, int, str, type(None)))
+
+GENERATED_GLOBALS = {
+    'datetime_to_timestamp': datetime_to_timestamp,
+    'timestamp_to_datetime': timestamp_to_datetime,
+}
+
+
+def register_parser_template(parser, template):
+    """
+    Registers the template of the parsers created by the same factory as the given one.
+    
+    Parameters
+    ----------
+    parser : `FunctionType`
+        A parser created by the factory.
+    template : `str`
+        Source assigning the parsed value to `{target}` from `data`. The factory's closure variables can be referenced
+        by their name.
+    """
+    PARSER_TEMPLATES[parser.__code__] = template
+
+
+def register_putter_template(putter, template):
+    """
+    Registers the template of the putters created by the same factory as the given one.
+    
+    Parameters
+    ----------
+    putter : `FunctionType`
+        A putter created by the factory.
+    template : `str`
+        Source putting `value` into `data`, respecting `defaults`. The factory's closure variables can be referenced by
+        their name.
+    """
+    PUTTER_TEMPLATES[putter.__code__] = template
+
+
+register_parser_template(
+    entity_id_parser_factory(''),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = 0 if value is None else int(value)\n'
+    ),
+)
+
+register_parser_template(
+    entity_id_array_parser_factory('', ordered = True),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = tuple(sorted(int(entity_id) for entity_id in value)) if value else None\n'
+    ),
+)
+
+register_parser_template(
+    entity_id_array_parser_factory('', ordered = False),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = (*(int(entity_id) for entity_id in value),) if value else None\n'
+    ),
+)
+
+register_parser_template(
+    preinstanced_parser_factory('', None, None),
+    (
+        'try:\n'
+        '    value = data[{field_key}]\n'
+        'except KeyError:\n'
+        '    {target} = {default_value}\n'
+        'else:\n'
+        '    {target} = {preinstanced_type}(value)\n'
+    ),
+)
+
+register_parser_template(
+    _field_parser_factory('', None),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = {default_value} if value is None else value\n'
+    ),
+)
+
+register_parser_template(
+    flag_parser_factory('', int),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = {default_value} if value is None else {flag_type}(value)\n'
+    ),
+)
+
+register_parser_template(
+    default_date_time_parser_factory('', None),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = {default} if value is None else timestamp_to_datetime(value)\n'
+    ),
+)
+
+register_parser_template(
+    force_string_parser_factory(''),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = \'\' if value is None else value\n'
+    ),
+)
+
+register_parser_template(
+    field_parser_factory(''),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = None if isinstance(value, str) and (not value) else value\n'
+    ),
+)
+
+register_parser_template(
+    nullable_string_parser_factory(''),
+    (
+        '{target} = data.get({field_key}, None) or None\n'
+    ),
+)
+
+register_parser_template(
+    nullable_int_parser_factory(''),
+    (
+        '{target} = data.get({field_key}, None)\n'
+    ),
+)
+
+register_parser_template(
+    default_entity_parser_factory('', None, default = None),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = {default} if value is None else {entity_type}.from_data(value)\n'
+    ),
+)
+
+register_parser_template(
+    nullable_entity_array_parser_factory('', None),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = tuple(sorted({entity_type}.from_data(entity_data) for entity_data in value)) if value else None\n'
+    ),
+)
+
+register_parser_template(
+    nullable_object_array_parser_factory('', None),
+    (
+        'value = data.get({field_key}, None)\n'
+        '{target} = (*({object_type}.from_data(object_data) for object_data in value),) if value else None\n'
+    ),
+)
+
+
+register_putter_template(
+    entity_id_putter_factory(''),
+    (
+        'data[{field_key}] = str(value) if value else None\n'
+    ),
+)
+
+register_putter_template(
+    entity_id_optional_putter_factory(''),
+    (
+        'if defaults or value:\n'
+        '    data[{field_key}] = str(value) if value else None\n'
+    ),
+)
+
+register_putter_template(
+    field_putter_factory(''),
+    (
+        'data[{field_key}] = value\n'
+    ),
+)
+
+register_putter_template(
+    field_optional_putter_factory('', None),
+    (
+        'if defaults or (value != {default_value}):\n'
+        '    data[{field_key}] = value\n'
+    ),
+)
+
+register_putter_template(
+    force_string_putter_factory(''),
+    (
+        'data[{field_key}] = value\n'
+    ),
+)
+
+register_putter_template(
+    nullable_string_putter_factory(''),
+    (
+        'data[{field_key}] = \'\' if value is None else value\n'
+    ),
+)
+
+register_putter_template(
+    nullable_string_optional_putter_factory(''),
+    (
+        'if value is not None:\n'
+        '    data[{field_key}] = value\n'
+        'elif defaults:\n'
+        '    data[{field_key}] = \'\'\n'
+    ),
+)
+
+register_putter_template(
+    flag_putter_factory(''),
+    (
+        'data[{field_key}] = int(value)\n'
+    ),
+)
+
+register_putter_template(
+    flag_optional_putter_factory('', 0),
+    (
+        'if defaults or (value != {default_value}):\n'
+        '    data[{field_key}] = int(value)\n'
+    ),
+)
+
+register_putter_template(
+    string_flag_putter_factory(''),
+    (
+        'data[{field_key}] = format(value, \'d\')\n'
+    ),
+)
+
+register_putter_template(
+    string_flag_optional_putter_factory('', 0),
+    (
+        'if defaults or (value != {default_value}):\n'
+        '    data[{field_key}] = format(value, \'d\')\n'
+    ),
+)
+
+register_putter_template(
+    nullable_date_time_putter_factory(''),
+    (
+        'data[{field_key}] = None if value is None else datetime_to_timestamp(value)\n'
+    ),
+)
+
+register_putter_template(
+    nullable_date_time_optional_putter_factory(''),
+    (
+        'if defaults or (value is not None):\n'
+        '    data[{field_key}] = None if value is None else datetime_to_timestamp(value)\n'
+    ),
+)
+
+
+def _render_template_variables(function, index, namespace):
+    """
+    Renders the closure variables of the given function to be used in a template.
+    
+    Constants are inlined, other values are put into the namespace.
+    
+    Parameters
+    ----------
+    function : `FunctionType`
+        The parser or putter.
+    index : `int`
+        The field's index, used to name the namespace entries.
+    namespace : `dict<str, object>`
+        The generated function's namespace.
+    
+    Returns
+    -------
+    variables : `dict<str, str>`
+    """
+    variables = {}
+    
+    closure = function.__closure__
+    if closure is None:
+        return variables
+    
+    for variable_name, cell in zip(function.__code__.co_freevars, closure):
+        value = cell.cell_contents
+        if type(value) in INLINED_CONSTANT_TYPES:
+            variables[variable_name] = repr(value)
+        else:
+            global_name = f'{variable_name}_{index}'
+            namespace[global_name] = value
+            variables[variable_name] = global_name
+    
+    return variables
+
+
+def _indent(source):
+    """
+    Indents the given source into a function's body.
+    
+    Parameters
+    ----------
+    source : `str`
+        The source to indent.
+    
+    Returns
+    -------
+    lines : `list<str>`
+    """
+    return ['    ' + line for line in source.splitlines()]
+
+
+def render_field_parser(function_name, fields, *, inline = True):
+    """
+    Renders a function which parses every given field into the attributes of an entity.
+    
+    Parsers created by a factory with a registered template are inlined, the others are called.
+    
+    Parameters
+    ----------
+    function_name : `str`
+        The generated function's name.
+    fields : `tuple<(str, FunctionType)>`
+        Attribute name - parser pairs.
+    
+    Returns
+    -------
+    source : `str`
+        The generated source.
+    namespace : `dict<str, object>`
+        The global namespace of the generated source.
+    """
+    namespace = {**GENERATED_GLOBALS}
+    lines = [f'def {function_name}(entity, data):']
+    
+    for index, (attribute_name, parser) in enumerate(fields):
+        target = f'entity.{attribute_name}'
+        template = PARSER_TEMPLATES.get(getattr(parser, '__code__', None), None) if inline else None
+        if template is None:
+            parser_name = f'parser_{index}'
+            namespace[parser_name] = parser
+            lines.append(f'    {target} = {parser_name}(data)')
+            continue
+        
+        variables = _render_template_variables(parser, index, namespace)
+        variables['target'] = target
+        lines.extend(_indent(template.format_map(variables)))
+    
+    if len(lines) == 1:
+        lines.append('    pass')
+    
+    return '\n'.join(lines) + '\n', namespace
+
+
+def render_field_putter(function_name, fields, *, inline = True):
+    """
+    Renders a function which puts every given attribute of an entity into a payload.
+    
+    Putters created by a factory with a registered template are inlined, the others are called.
+    
+    Parameters
+    ----------
+    function_name : `str`
+        The generated function's name.
+    fields : `tuple<(str, FunctionType)>`
+        Attribute name - putter pairs.
+    
+    Returns
+    -------
+    source : `str`
+        The generated source.
+    namespace : `dict<str, object>`
+        The global namespace of the generated source.
+    """
+    namespace = {**GENERATED_GLOBALS}
+    lines = [f'def {function_name}(entity, data, defaults):']
+    
+    for index, (attribute_name, putter) in enumerate(fields):
+        template = PUTTER_TEMPLATES.get(getattr(putter, '__code__', None), None) if inline else None
+        if template is None:
+            putter_name = f'putter_{index}'
+            namespace[putter_name] = putter
+            lines.append(f'    {putter_name}(entity.{attribute_name}, data, defaults)')
+            continue
+        
+        variables = _render_template_variables(putter, index, namespace)
+        lines.append(f'    value = entity.{attribute_name}')
+        lines.extend(_indent(template.format_map(variables)))
+    
+    lines.append('    return data')
+    return '\n'.join(lines) + '\n', namespace
+
+
+def _compile_function(function_name, source, namespace):
+    """
+    Compiles the given generated source and returns the function defined by it.
+    
+    Parameters
+    ----------
+    function_name : `str`
+        The generated function's name.
+    source : `str`
+        The generated source.
+    namespace : `dict<str, object>`
+        The global namespace of the generated source.
+    
+    Returns
+    -------
+    function : `FunctionType`
+    """
+    exec(compile(source, f'<generated {function_name}>', 'exec'), namespace)
+    return namespace[function_name]
+
+
+class FieldTable(RichAttributeErrorBaseType):
+    """
+    Field table of an entity type. Its parsers and putters are compiled into one function each, instead of calling
+    them one by one.
+    
+    The functions are compiled on their first call, so the types resolved by `include` are already set.
+    
+    Attributes
+    ----------
+    name : `str`
+        The table's name, used to name the generated functions.
+    parse : `FunctionType`
+        Parses the fields of the given payload into the entity's attributes.
+        
+        Accepts the following parameters:
+        
+        +-------------------+-----------------------+
+        | Name              | Type                  |
+        +===================+=======================+
+        | entity            | `object`              |
+        +-------------------+-----------------------+
+        | data              | `dict<str, object>`   |
+        +-------------------+-----------------------+
+    
+    parsers : `tuple<(str, FunctionType)>`
+        Attribute name - parser pairs.
+    put : `FunctionType`
+        Puts the entity's attributes into the given payload, then returns it.
+        
+        Accepts the following parameters:
+        
+        +-------------------+-----------------------+
+        | Name              | Type                  |
+        +===================+=======================+
+        | entity            | `object`              |
+        +-------------------+-----------------------+
+        | data              | `dict<str, object>`   |
+        +-------------------+-----------------------+
+        | defaults          | `bool`                |
+        +-------------------+-----------------------+
+    
+    putters : `tuple<(str, FunctionType)>`
+        Attribute name - putter pairs.
+    """
+    __slots__ = ('name', 'parse', 'parsers', 'put', 'putters')
+    
+    def __new__(cls, name, parsers, putters):
+        """
+        Creates a new field table.
+        
+        Parameters
+        ----------
+        name : `str`
+            The table's name, used to name the generated functions.
+        parsers : `iterable<(str, FunctionType)>`
+            Attribute name - parser pairs.
+        putters : `iterable<(str, FunctionType)>`
+            Attribute name - putter pairs.
+        """
+        self = object.__new__(cls)
+        self.name = name
+        self.parsers = tuple(parsers)
+        self.putters = tuple(putters)
+        self.parse = self._compile_and_parse
+        self.put = self._compile_and_put
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the field table's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' name = ')
+        repr_parts.append(repr(self.name))
+        
+        repr_parts.append(', parsers = ')
+        repr_parts.append(repr(len(self.parsers)))
+        
+        repr_parts.append(', putters = ')
+        repr_parts.append(repr(len(self.putters)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def compile_parse(self):
+        """
+        Compiles the table's parsers.
+        
+        Returns
+        -------
+        parse : `FunctionType`
+        """
+        function_name = f'parse_{self.name}_fields'
+        parse = _compile_function(function_name, *render_field_parser(function_name, self.parsers))
+        self.parse = parse
+        return parse
+    
+    
+    def compile_put(self):
+        """
+        Compiles the table's putters.
+        
+        Returns
+        -------
+        put : `FunctionType`
+        """
+        function_name = f'put_{self.name}_fields'
+        put = _compile_function(function_name, *render_field_putter(function_name, self.putters))
+        self.put = put
+        return put
+    
+    
+    def _compile_and_parse(self, entity, data):
+        """
+        Compiles the table's parsers, then parses the fields of the given payload into the entity's attributes.
+        
+        Parameters
+        ----------
+        entity : `object`
+            The entity to set the attributes of.
+        data : `dict<str, object>`
+            Entity data.
+        """
+        self.compile_parse()(entity, data)
+    
+    
+    def _compile_and_put(self, entity, data, defaults):
+        """
+        Compiles the table's putters, then puts the entity's attributes into the given payload.
+        
+        Parameters
+        ----------
+        entity : `object`
+            The entity to put the attributes of.
+        data : `dict<str, object>`
+            Entity data.
+        defaults : `bool`
+            Whether default field values should be included.
+        
+        Returns
+        -------
+        data : `dict<str, object>`
+        """
+        return self.compile_put()(entity, data, defaults)
@@ -1,10 +1,13 @@
 from .base import *
 from .client_base import *
 from .client_shard import *
+from .client_shard_group import *
 from .client_sharder import *
 from .constants import *
+from .etf import *
 from .heartbeat import *
 from .rate_limit import *
+from .transport import *
 from .utils import *
 from .voice import *
 from .voice_base import *
@@ -14,10 +17,13 @@ __all__ = (
     *base.__all__,
     *client_base.__all__,
     *client_shard.__all__,
+    *client_shard_group.__all__,
     *client_sharder.__all__,
     *constants.__all__,
+    *etf.__all__,
     *heartbeat.__all__,
     *rate_limit.__all__,
+    *transport.__all__,
     *utils.__all__,
     *voice.__all__,
     *voice_base.__all__,
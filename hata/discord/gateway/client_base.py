@@ -43,3 +43,46 @@ class DiscordGatewayClientBase(DiscordGatewayBase):
         gateway : ``DiscordGatewayClientBase``
         """
         return self
+    
+    
+    def get_rate_limit_delay(self, reserve):
+        """
+        Returns how much time should be waited before sending a non-urgent operation through the gateway.
+        
+        Parameters
+        ----------
+        reserve : `int`
+            The amount of operations to keep available for other purposes, like heartbeats.
+        
+        Returns
+        -------
+        delay : `float`
+        """
+        return 0.0
+    
+    
+    def get_shard_count(self):
+        """
+        Returns how much shards the gateway runs.
+        
+        Returns
+        -------
+        shard_count : `int`
+        """
+        return 1
+    
+    
+    def get_shard_gateway(self, shard_id):
+        """
+        Returns the gateway of the shard for the given identifier.
+        
+        Parameters
+        ----------
+        shard_id : `int`
+            The shard's identifier.
+        
+        Returns
+        -------
+        gateway : `None | DiscordGatewayClientBase`
+        """
+        return self
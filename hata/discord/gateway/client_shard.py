@@ -1,9 +1,8 @@
 __all__ = ()
 
 from sys import platform as PLATFORM
-from zlib import decompressobj as create_zlib_decompressor, error as ZlibError
 
-from scarletio import Task, copy_docs, from_json, repeat_timeout, skip_ready_cycle, sleep, to_json
+from scarletio import Task, copy_docs, repeat_timeout, skip_ready_cycle, sleep
 from scarletio.web_common import ConnectionClosed, InvalidHandshake, URL, WebSocketProtocolError
 
 from ...env import API_VERSION, CACHE_PRESENCE, LIBRARY_NAME
@@ -11,7 +10,7 @@ from ...env import API_VERSION, CACHE_PRESENCE, LIBRARY_NAME
 from ..activity import ACTIVITY_UNKNOWN
 from ..core import KOKORO
 from ..events.core import PARSERS
-from ..events.handling_helpers import call_unknown_dispatch_event_event_handler
+from ..events.handling_helpers import call_parser, call_unknown_dispatch_event_event_handler
 from ..exceptions import DiscordGatewayException, GATEWAY_EXCEPTION_CODE_TABLE
 from ..guild.guild.constants import LARGE_GUILD_LIMIT
 
@@ -25,6 +24,10 @@ from .constants import (
 )
 from .heartbeat import Kokoro
 from .rate_limit import GatewayRateLimiter
+from .transport import (
+    DECOMPRESSION_ERRORS, GATEWAY_COMPRESSION, GATEWAY_COMPRESSION_ZSTD_STREAM, GATEWAY_ENCODING,
+    create_gateway_decompressor, decode_gateway_message, encode_gateway_message
+)
 
 
 async def _poll_compressed_message(web_socket):
@@ -66,6 +69,37 @@ async def _poll_compressed_message(web_socket):
         continue
 
 
+async def _poll_zstd_stream_message(web_socket):
+    """
+    Polls a zstd-stream compressed message from the given web socket.
+    
+    When using zstd-stream every frame contains a whole flushed message, so there is no need for buffering.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    web_socket : ``WebSocketClient``
+        The web socket to poll with.
+    
+    Returns
+    -------
+    raw_message : `bytes`
+    
+    Raises
+    ------
+    ConnectionClosed
+        If the web socket connection closed.
+    """
+    return await web_socket.receive()
+
+
+if GATEWAY_COMPRESSION == GATEWAY_COMPRESSION_ZSTD_STREAM:
+    _poll_gateway_message = _poll_zstd_stream_message
+else:
+    _poll_gateway_message = _poll_compressed_message
+
+
 class DiscordGatewayClientShard(DiscordGatewayClientBase):
     """
     Gateway of a client representing a shard.
@@ -74,8 +108,8 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
     ----------
     _buffer : `list<bytes>`
         A buffer used to store not finished received payloads.
-    _decompressor : `ZlibDecompressorType`
-        Zlib decompressor used to decompress the received data.
+    _decompressor : `None | ZlibDecompressorType | ZstdDecompressorType`
+        Decompressor used to decompress the received data. Depends on the used transport compression.
     _operation_handlers : `dict<int, (instance, dict<str, object>) -> int>`
         Handler for each expected operation.
     _should_run : `bool`
@@ -243,6 +277,11 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         return latency
     
     
+    @copy_docs(DiscordGatewayClientBase.get_rate_limit_delay)
+    def get_rate_limit_delay(self, reserve):
+        return self.rate_limit_handler.get_delay(reserve)
+    
+    
     def _cancel_self_and_get_web_socket(self):
         """
         Cancels the gateway except its web_socket. Returns the web_socket if still running instead.
@@ -300,7 +339,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
             return
         
         try:
-            await web_socket.send(to_json(data))
+            await web_socket.send(encode_gateway_message(data))
         except ConnectionClosed:
             pass
     
@@ -383,9 +422,11 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         if gateway_url is None:
             gateway_url = await self.client.client_gateway_url()
         
-        gateway_url = URL(f'{gateway_url}?encoding=json&v={API_VERSION}&compress=zlib-stream', True)
+        gateway_url = URL(
+            f'{gateway_url}?encoding={GATEWAY_ENCODING!s}&v={API_VERSION}&compress={GATEWAY_COMPRESSION!s}', True
+        )
         
-        self._decompressor = create_zlib_decompressor()
+        self._decompressor = create_gateway_decompressor()
         
         self.web_socket = await self.client.http.connect_web_socket(gateway_url)
         self.kokoro.start()
@@ -468,7 +509,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
             return GATEWAY_ACTION_CONNECT
         
         try:
-            raw_message = await _poll_compressed_message(web_socket)
+            raw_message = await _poll_gateway_message(web_socket)
         except ConnectionClosed as exception:
             # propagate a few kind of `ConnectionClosed` exceptions while swallow the rest for reconnection.
             if exception.code in (1000, 1006, 4004, 4010, 4011, 4013, 4014):
@@ -478,12 +519,12 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         
         try:
             decompressed_message = self._decompressor.decompress(raw_message)
-        except ZlibError:
+        except DECOMPRESSION_ERRORS:
             # we need a full reset
             return GATEWAY_ACTION_CONNECT
         
         # This may raise `TimeoutError`
-        return (await self._handle_received_operation(decompressed_message.decode('utf-8')))
+        return (await self._handle_received_operation(decompressed_message))
     
     
     async def _handle_received_operation(self, message):
@@ -495,15 +536,15 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         
         Parameters
         ----------
-        message : `bytes`
-            The received message.
+        message : `bytes | str`
+            The received message. Decoded as json or as etf depending on the used encoding.
         
         Returns
         -------
         gateway_action : `int`
         """
         # return True if we should reconnect
-        message = from_json(message)
+        message = decode_gateway_message(message)
         
         sequence = message.get('s', None)
         if (sequence is not None):
@@ -679,7 +720,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
             return GATEWAY_ACTION_KEEP_GOING
         
         try:
-            if parser(client, data) is None:
+            if call_parser(parser, client, data) is None:
                 return GATEWAY_ACTION_KEEP_GOING
         except BaseException as err:
             Task(KOKORO, client.events.error(client, event, err))
@@ -769,7 +810,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
     
     async def _send_json(self, data):
         """
-        Internal function to send already converted json data.
+        Internal function to send already encoded data.
         
         If the given gateway has no web_socket, or if it is closed, will not raise.
         
@@ -777,8 +818,8 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         
         Parameters
         ----------
-        data : `str`
-            The data to send.
+        data : `bytes | str`
+            The data to send. Json encoded as `str`, etf encoded as `bytes`.
         """
         web_socket = self.web_socket
         if web_socket is None:
@@ -0,0 +1,102 @@
+__all__ = ()
+
+from scarletio import copy_docs
+
+from .client_base import DiscordGatewayClientBase
+from .client_shard import DiscordGatewayClientShard
+from .client_sharder import DiscordGatewayClientSharder
+
+
+class DiscordGatewayClientShardGroup(DiscordGatewayClientSharder):
+    """
+    Gateway of a client controlling only a subset of its shards. Used when the shards of a client are split between
+    multiple processes.
+    
+    The client's `shard_count` is the total amount of shards, meanwhile only the group's shards are connected.
+    
+    Attributes
+    ----------
+    client : ``Client``
+        The owner client of the gateway.
+    connected_callback : `None | callable`
+        Called without parameters every time when all of the group's shards connected.
+    gateways : `tuple<DiscordGatewayClientShard>`
+        The controlled gateways.
+    gateways_by_shard_id : `dict<int, DiscordGatewayClientShard>`
+        The controlled gateways by their shard identifier.
+    """
+    __slots__ = ('connected_callback', 'gateways_by_shard_id',)
+    
+    def __new__(cls, client, shard_ids, connected_callback = None):
+        """
+        Creates a shard group gateway.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The owner client of the gateway.
+        shard_ids : `iterable<int>`
+            The shards' identifiers to run.
+        connected_callback : `None | callable` = `None`, Optional
+            Called without parameters every time when all of the group's shards connected.
+        
+        Raises
+        ------
+        ValueError
+            - If `shard_ids` is empty.
+            - If a shard identifier is out of the client's shard count.
+        """
+        shard_count = client.shard_count
+        if shard_count <= 0:
+            shard_count = 1
+        
+        gateways_by_shard_id = {}
+        for shard_id in sorted(set(shard_ids)):
+            if (shard_id < 0) or (shard_id >= shard_count):
+                raise ValueError(
+                    f'`shard_id` out of the client\'s shard count; got shard_id = {shard_id!r}; '
+                    f'shard_count = {shard_count!r}.'
+                )
+            
+            gateways_by_shard_id[shard_id] = DiscordGatewayClientShard(client, shard_id)
+        
+        if not gateways_by_shard_id:
+            raise ValueError('`shard_ids` cannot be empty.')
+        
+        self = object.__new__(cls)
+        self.client = client
+        self.connected_callback = connected_callback
+        self.gateways = tuple(gateways_by_shard_id.values())
+        self.gateways_by_shard_id = gateways_by_shard_id
+        return self
+    
+    
+    @copy_docs(DiscordGatewayClientBase._put_repr_parts_into)
+    def _put_repr_parts_into(self, repr_parts):
+        DiscordGatewayClientSharder._put_repr_parts_into(self, repr_parts)
+        
+        repr_parts.append(', shard_ids = ')
+        repr_parts.append(repr([*self.gateways_by_shard_id.keys()]))
+    
+    
+    @copy_docs(DiscordGatewayClientSharder._handle_connected)
+    def _handle_connected(self):
+        connected_callback = self.connected_callback
+        if (connected_callback is not None):
+            connected_callback()
+    
+    
+    @copy_docs(DiscordGatewayClientBase.get_gateway)
+    def get_gateway(self, guild_id):
+        shard_count = self.client.shard_count
+        if guild_id and (shard_count > 1):
+            gateway = self.gateways_by_shard_id.get((guild_id >> 22) % shard_count, None)
+            if (gateway is not None):
+                return gateway
+        
+        return self.gateways[0]
+    
+    
+    @copy_docs(DiscordGatewayClientBase.get_shard_gateway)
+    def get_shard_gateway(self, shard_id):
+        return self.gateways_by_shard_id.get(shard_id, None)
@@ -2,13 +2,14 @@ __all__ = ()
 
 from itertools import islice
 
-from scarletio import Task, TaskGroup, copy_docs, sleep, to_json
+from scarletio import Task, TaskGroup, copy_docs, sleep
 
 from ..core import KOKORO
 
 from .client_base import DiscordGatewayClientBase
 from .client_shard import DiscordGatewayClientShard
 from .heartbeat import LATENCY_DEFAULT
+from .transport import encode_gateway_message
 
 
 def _create_gateways(client, shard_count, gateways):
@@ -204,6 +205,8 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
             result = await _connect_gateways(task_group, self.gateways, self.client._gateway_max_concurrency)
             
             if result:
+                self._handle_connected()
+                
                 # If all shards successfully connected we wait till the first is cancelled.
                 # Then we cancel the rest as well.
                 finished_task = await task_group.wait_first()
@@ -224,6 +227,13 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
         return False
     
     
+    def _handle_connected(self):
+        """
+        Called when every shard of the gateway connected. Does nothing by default.
+        """
+        pass
+    
+    
     @property
     @copy_docs(DiscordGatewayClientBase.latency)
     def latency(self):
@@ -264,7 +274,7 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
     
     @copy_docs(DiscordGatewayClientBase.send_as_json)
     async def send_as_json(self, data):
-        data = to_json(data)
+        data = encode_gateway_message(data)
         
         task_group = TaskGroup(KOKORO, (Task(KOKORO, gateway._send_json(data)) for gateway in self.gateways))
         failed_task = await task_group.wait_exception()
@@ -288,3 +298,17 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
             gateway = gateways[0]
         
         return gateway
+    
+    
+    @copy_docs(DiscordGatewayClientBase.get_shard_count)
+    def get_shard_count(self):
+        return len(self.gateways)
+    
+    
+    @copy_docs(DiscordGatewayClientBase.get_shard_gateway)
+    def get_shard_gateway(self, shard_id):
+        gateways = self.gateways
+        if (shard_id < 0) or (shard_id >= len(gateways)):
+            return None
+        
+        return gateways[shard_id]
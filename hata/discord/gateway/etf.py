@@ -0,0 +1,431 @@
+__all__ = ()
+
+from struct import Struct
+from zlib import decompress as zlib_decompress
+
+
+ETF_VERSION = 131
+
+ETF_TAG_COMPRESSED = 80
+ETF_TAG_NEW_FLOAT = 70
+ETF_TAG_SMALL_INTEGER = 97
+ETF_TAG_INTEGER = 98
+ETF_TAG_FLOAT = 99
+ETF_TAG_ATOM = 100
+ETF_TAG_SMALL_TUPLE = 104
+ETF_TAG_LARGE_TUPLE = 105
+ETF_TAG_NIL = 106
+ETF_TAG_STRING = 107
+ETF_TAG_LIST = 108
+ETF_TAG_BINARY = 109
+ETF_TAG_SMALL_BIG = 110
+ETF_TAG_LARGE_BIG = 111
+ETF_TAG_SMALL_ATOM = 115
+ETF_TAG_MAP = 116
+ETF_TAG_ATOM_UTF8 = 118
+ETF_TAG_SMALL_ATOM_UTF8 = 119
+
+STRUCT_UINT16 = Struct('>H')
+STRUCT_UINT32 = Struct('>I')
+STRUCT_INT32 = Struct('>i')
+STRUCT_DOUBLE = Struct('>d')
+
+UNPACK_UINT16 = STRUCT_UINT16.unpack_from
+UNPACK_UINT32 = STRUCT_UINT32.unpack_from
+UNPACK_INT32 = STRUCT_INT32.unpack_from
+UNPACK_DOUBLE = STRUCT_DOUBLE.unpack_from
+
+INT32_MIN = -(1 << 31)
+INT32_MAX = (1 << 31) - 1
+
+ATOM_VALUES = {
+    'nil': None,
+    'null': None,
+    'true': True,
+    'false': False,
+}
+
+# Atoms and map keys repeat in every payload, so we keep their decoded value to not build new strings each time.
+ATOM_CACHE = {}
+ATOM_CACHE_LIMIT = 4096
+
+
+class ETFDecodeError(ValueError):
+    """
+    Raised when an external term format payload could not be decoded.
+    """
+    __slots__ = ()
+
+
+def _decode_atom(data, start, end):
+    """
+    Decodes an atom.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The data to decode from.
+    start : `int`
+        The atom's start index.
+    end : `int`
+        The atom's end index.
+    
+    Returns
+    -------
+    value : `None | bool | str`
+    """
+    raw_atom = data[start : end]
+    try:
+        return ATOM_CACHE[raw_atom]
+    except KeyError:
+        pass
+    
+    value = raw_atom.decode('utf-8')
+    value = ATOM_VALUES.get(value, value)
+    
+    if len(ATOM_CACHE) < ATOM_CACHE_LIMIT:
+        ATOM_CACHE[raw_atom] = value
+    
+    return value
+
+
+def _decode_term(data, index):
+    """
+    Decodes a term from the given data starting at the given index.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The data to decode from.
+    index : `int`
+        The term's start index.
+    
+    Returns
+    -------
+    value : `object`
+        The decoded term.
+    index : `int`
+        The index after the decoded term.
+    
+    Raises
+    ------
+    ETFDecodeError
+    IndexError
+    struct.error
+    """
+    tag = data[index]
+    index += 1
+    
+    # Ordered by frequency in Discord payloads.
+    if tag == ETF_TAG_BINARY:
+        length, = UNPACK_UINT32(data, index)
+        index += 4
+        end = index + length
+        return str(data[index : end], 'utf-8'), end
+    
+    if tag == ETF_TAG_MAP:
+        arity, = UNPACK_UINT32(data, index)
+        index += 4
+        value = {}
+        for _ in range(arity):
+            # Keys are small atoms and values are binaries most of the time, so we inline them.
+            if data[index] == ETF_TAG_SMALL_ATOM_UTF8:
+                end = index + 2 + data[index + 1]
+                key = ATOM_CACHE.get(data[index + 2 : end], None)
+                if key is None:
+                    key = _decode_atom(data, index + 2, end)
+                index = end
+            
+            else:
+                key, index = _decode_term(data, index)
+            
+            element_tag = data[index]
+            if element_tag == ETF_TAG_BINARY:
+                length, = UNPACK_UINT32(data, index + 1)
+                index += 5
+                end = index + length
+                value[key] = str(data[index : end], 'utf-8')
+                index = end
+            
+            elif element_tag == ETF_TAG_SMALL_INTEGER:
+                value[key] = data[index + 1]
+                index += 2
+            
+            else:
+                value[key], index = _decode_term(data, index)
+        
+        return value, index
+    
+    if tag == ETF_TAG_SMALL_ATOM_UTF8 or tag == ETF_TAG_SMALL_ATOM:
+        end = index + 1 + data[index]
+        return _decode_atom(data, index + 1, end), end
+    
+    if tag == ETF_TAG_ATOM_UTF8 or tag == ETF_TAG_ATOM:
+        length, = UNPACK_UINT16(data, index)
+        end = index + 2 + length
+        return _decode_atom(data, index + 2, end), end
+    
+    if tag == ETF_TAG_SMALL_INTEGER:
+        return data[index], index + 1
+    
+    if tag == ETF_TAG_INTEGER:
+        return UNPACK_INT32(data, index)[0], index + 4
+    
+    if tag == ETF_TAG_SMALL_BIG:
+        length = data[index]
+        sign = data[index + 1]
+        index += 2
+        end = index + length
+        value = int.from_bytes(data[index : end], 'little')
+        if sign:
+            value = -value
+        return value, end
+    
+    if tag == ETF_TAG_LIST:
+        length, = UNPACK_UINT32(data, index)
+        index += 4
+        value = []
+        for _ in range(length):
+            element, index = _decode_term(data, index)
+            value.append(element)
+        
+        # Proper lists end with a `nil` tail.
+        if data[index] == ETF_TAG_NIL:
+            index += 1
+        else:
+            tail, index = _decode_term(data, index)
+            value.append(tail)
+        
+        return value, index
+    
+    if tag == ETF_TAG_NIL:
+        return [], index
+    
+    if tag == ETF_TAG_NEW_FLOAT:
+        return UNPACK_DOUBLE(data, index)[0], index + 8
+    
+    if tag == ETF_TAG_STRING:
+        # String ext is a list of bytes used for small integer lists.
+        length, = UNPACK_UINT16(data, index)
+        index += 2
+        end = index + length
+        return str(data[index : end], 'latin-1'), end
+    
+    if tag == ETF_TAG_LARGE_BIG:
+        length, = UNPACK_UINT32(data, index)
+        sign = data[index + 4]
+        index += 5
+        end = index + length
+        value = int.from_bytes(data[index : end], 'little')
+        if sign:
+            value = -value
+        return value, end
+    
+    if tag == ETF_TAG_SMALL_TUPLE or tag == ETF_TAG_LARGE_TUPLE:
+        if tag == ETF_TAG_SMALL_TUPLE:
+            arity = data[index]
+            index += 1
+        else:
+            arity, = UNPACK_UINT32(data, index)
+            index += 4
+        
+        elements = []
+        for _ in range(arity):
+            element, index = _decode_term(data, index)
+            elements.append(element)
+        
+        return tuple(elements), index
+    
+    if tag == ETF_TAG_FLOAT:
+        end = index + 31
+        return float(data[index : end].rstrip(b'\x00')), end
+    
+    if tag == ETF_TAG_COMPRESSED:
+        uncompressed_size, = UNPACK_UINT32(data, index)
+        decompressed = zlib_decompress(data[index + 4 :])
+        if len(decompressed) != uncompressed_size:
+            raise ETFDecodeError(
+                f'Compressed term size mismatch; expected {uncompressed_size!r}, got {len(decompressed)!r}.'
+            )
+        
+        value, decompressed_index = _decode_term(decompressed, 0)
+        return value, len(data)
+    
+    raise ETFDecodeError(f'Unknown term tag: {tag!r} at index {index - 1!r}.')
+
+
+def etf_decode(data):
+    """
+    Decodes the given external term format payload.
+    
+    Binaries are decoded as `str`, atoms as `str` or as their special value (`nil`, `null`, `true`, `false`),
+    maps as `dict`, lists as `list` and tuples as `tuple`.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The data to decode.
+    
+    Returns
+    -------
+    value : `object`
+    
+    Raises
+    ------
+    ETFDecodeError
+        - Invalid payload.
+    """
+    if (not data) or (data[0] != ETF_VERSION):
+        raise ETFDecodeError(f'Missing or invalid version; data = {bytes(data[:1])!r}.')
+    
+    try:
+        value, index = _decode_term(data, 1)
+    except ETFDecodeError:
+        raise
+    
+    except Exception as exception:
+        raise ETFDecodeError(f'Incomplete or corrupted payload: {exception!r}.') from exception
+    
+    return value
+
+
+def _encode_term_into(value, into):
+    """
+    Encodes the given term into the given buffer.
+    
+    Parameters
+    ----------
+    value : `object`
+        The value to encode.
+    into : `bytearray`
+        Buffer to extend.
+    
+    Raises
+    ------
+    TypeError
+        - Value with unsupported type.
+    """
+    if value is None:
+        into += b'\x77\x03nil'
+        return
+    
+    if value is True:
+        into += b'\x77\x04true'
+        return
+    
+    if value is False:
+        into += b'\x77\x05false'
+        return
+    
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+        into.append(ETF_TAG_BINARY)
+        into += STRUCT_UINT32.pack(len(value))
+        into += value
+        return
+    
+    if isinstance(value, int):
+        if value >= 0 and value < 256:
+            into.append(ETF_TAG_SMALL_INTEGER)
+            into.append(value)
+            return
+        
+        if value >= INT32_MIN and value <= INT32_MAX:
+            into.append(ETF_TAG_INTEGER)
+            into += STRUCT_INT32.pack(value)
+            return
+        
+        if value < 0:
+            sign = 1
+            value = -value
+        else:
+            sign = 0
+        
+        raw_value = value.to_bytes((value.bit_length() + 7) >> 3, 'little')
+        length = len(raw_value)
+        if length < 256:
+            into.append(ETF_TAG_SMALL_BIG)
+            into.append(length)
+        else:
+            into.append(ETF_TAG_LARGE_BIG)
+            into += STRUCT_UINT32.pack(length)
+        
+        into.append(sign)
+        into += raw_value
+        return
+    
+    if isinstance(value, float):
+        into.append(ETF_TAG_NEW_FLOAT)
+        into += STRUCT_DOUBLE.pack(value)
+        return
+    
+    if isinstance(value, dict):
+        into.append(ETF_TAG_MAP)
+        into += STRUCT_UINT32.pack(len(value))
+        for key, element in value.items():
+            # Encode `str` keys as atoms as Discord does.
+            if isinstance(key, str):
+                raw_key = key.encode('utf-8')
+                if len(raw_key) < 256:
+                    into.append(ETF_TAG_SMALL_ATOM_UTF8)
+                    into.append(len(raw_key))
+                    into += raw_key
+                else:
+                    into.append(ETF_TAG_ATOM_UTF8)
+                    into += STRUCT_UINT16.pack(len(raw_key))
+                    into += raw_key
+            
+            else:
+                _encode_term_into(key, into)
+            
+            _encode_term_into(element, into)
+        return
+    
+    if isinstance(value, (list, tuple)):
+        if not value:
+            into.append(ETF_TAG_NIL)
+            return
+        
+        into.append(ETF_TAG_LIST)
+        into += STRUCT_UINT32.pack(len(value))
+        for element in value:
+            _encode_term_into(element, into)
+        
+        into.append(ETF_TAG_NIL)
+        return
+    
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        into.append(ETF_TAG_BINARY)
+        into += STRUCT_UINT32.pack(len(value))
+        into += value
+        return
+    
+    raise TypeError(
+        f'Cannot encode value of type {type(value).__name__}; got {value!r}.'
+    )
+
+
+def etf_encode(value):
+    """
+    Encodes the given value to external term format.
+    
+    Strings are encoded as binaries, `None` as `nil` atom, lists and tuples as lists.
+    
+    Parameters
+    ----------
+    value : `object`
+        The value to encode.
+    
+    Returns
+    -------
+    data : `bytes`
+    
+    Raises
+    ------
+    TypeError
+        - Value with unsupported type.
+    """
+    into = bytearray()
+    into.append(ETF_VERSION)
+    _encode_term_into(value, into)
+    return bytes(into)
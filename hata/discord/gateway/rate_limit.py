@@ -123,6 +123,30 @@ class GatewayRateLimiter(RichAttributeErrorBaseType):
         self.remaining = remaining
     
     
+    def get_delay(self, reserve):
+        """
+        Returns how much time should be waited before the next action to keep the given amount of actions in reserve.
+        
+        Parameters
+        ----------
+        reserve : `int`
+            The amount of actions to keep available for other purposes, like heartbeats.
+        
+        Returns
+        -------
+        delay : `float`
+        """
+        now = LOOP_TIME()
+        resets_at = self.resets_at
+        if now >= resets_at:
+            return 0.0
+        
+        if self.remaining > reserve:
+            return 0.0
+        
+        return resets_at - now
+    
+    
     def cancel(self):
         """
         Cancels the gateway rate limiter's queue and it's `.wake_up_handle` if set.
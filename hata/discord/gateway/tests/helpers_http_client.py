@@ -22,6 +22,10 @@ class TestClientResponse:
         yield
     
     
+    async def read(self):
+        return self.response_value.encode()
+    
+    
     async def text(self, encoding = None):
         return self.response_value
     
@@ -0,0 +1,218 @@
+import vampytest
+
+from ...client import Client
+
+from ..client_shard import DiscordGatewayClientShard
+from ..client_shard_group import DiscordGatewayClientShardGroup
+from ..utils import reshard_gateway
+
+
+def _assert_fields_set(gateway):
+    """
+    Asserts whether shard group gateway has all of its fields set.
+    
+    Parameters
+    ----------
+    gateway : ``DiscordGatewayClientShardGroup``
+        The gateway to check.
+    """
+    vampytest.assert_instance(gateway, DiscordGatewayClientShardGroup)
+    vampytest.assert_instance(gateway.client, Client)
+    vampytest.assert_instance(gateway.gateways, tuple)
+    vampytest.assert_instance(gateway.gateways_by_shard_id, dict)
+
+
+def test__DiscordGatewayClientShardGroup__new():
+    """
+    Tests whether ``DiscordGatewayClientShardGroup.__new__`` works as intended.
+    """
+    client = Client(
+        'token_202610170300',
+        client_id = 202610170301,
+        shard_count = 6,
+    )
+    
+    try:
+        gateway = DiscordGatewayClientShardGroup(client, [4, 2, 3])
+        _assert_fields_set(gateway)
+        
+        vampytest.assert_eq([shard.shard_id for shard in gateway.gateways], [2, 3, 4])
+        vampytest.assert_eq([*gateway.gateways_by_shard_id.keys()], [2, 3, 4])
+        vampytest.assert_eq(gateway.get_shard_count(), 3)
+        vampytest.assert_is(gateway.connected_callback, None)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def _iter_options__new__value_error():
+    yield []
+    yield [6]
+    yield [-1]
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()))
+def test__DiscordGatewayClientShardGroup__new__value_error(shard_ids):
+    """
+    Tests whether ``DiscordGatewayClientShardGroup.__new__`` works as intended.
+    
+    Case: `ValueError`.
+    
+    Parameters
+    ----------
+    shard_ids : `list<int>`
+        Shard identifiers to create the gateway with.
+    """
+    client = Client(
+        'token_202610170302',
+        client_id = 202610170303,
+        shard_count = 6,
+    )
+    
+    try:
+        with vampytest.assert_raises(ValueError):
+            DiscordGatewayClientShardGroup(client, shard_ids)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__DiscordGatewayClientShardGroup__repr():
+    """
+    Tests whether ``DiscordGatewayClientShardGroup.__repr__`` works as intended.
+    """
+    client = Client(
+        'token_202610170304',
+        client_id = 202610170305,
+        shard_count = 6,
+    )
+    
+    try:
+        gateway = DiscordGatewayClientShardGroup(client, [2, 3])
+        
+        output = repr(gateway)
+        vampytest.assert_instance(output, str)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def _iter_options__get_gateway():
+    yield 0, 2
+    yield 3 << 22, 3
+    yield 9 << 22, 3
+    yield 5 << 22, 2
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_gateway()).returning_last())
+def test__DiscordGatewayClientShardGroup__get_gateway(guild_id):
+    """
+    Tests whether ``DiscordGatewayClientShardGroup.get_gateway`` works as intended.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The guild's identifier to get the gateway for.
+    
+    Returns
+    -------
+    output : `int`
+        The returned gateway's shard identifier.
+    """
+    client = Client(
+        'token_202610170306',
+        client_id = 202610170307,
+        shard_count = 6,
+    )
+    
+    try:
+        gateway = DiscordGatewayClientShardGroup(client, [2, 3])
+        
+        output = gateway.get_gateway(guild_id)
+        vampytest.assert_instance(output, DiscordGatewayClientShard)
+        return output.shard_id
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__DiscordGatewayClientShardGroup__handle_connected():
+    """
+    Tests whether ``DiscordGatewayClientShardGroup._handle_connected`` works as intended.
+    """
+    client = Client(
+        'token_202610170320',
+        client_id = 202610170321,
+        shard_count = 6,
+    )
+    
+    call_count = 0
+    
+    def connected_callback():
+        nonlocal call_count
+        call_count += 1
+    
+    try:
+        gateway = DiscordGatewayClientShardGroup(client, [2], connected_callback)
+        _assert_fields_set(gateway)
+        vampytest.assert_is(gateway.connected_callback, connected_callback)
+        
+        gateway._handle_connected()
+        vampytest.assert_eq(call_count, 1)
+        
+        # no callback -> should not raise
+        gateway = DiscordGatewayClientShardGroup(client, [2])
+        gateway._handle_connected()
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__DiscordGatewayClientShardGroup__get_shard_gateway():
+    """
+    Tests whether ``DiscordGatewayClientShardGroup.get_shard_gateway`` works as intended.
+    """
+    client = Client(
+        'token_202610170308',
+        client_id = 202610170309,
+        shard_count = 6,
+    )
+    
+    try:
+        gateway = DiscordGatewayClientShardGroup(client, [2, 3])
+        
+        vampytest.assert_is(gateway.get_shard_gateway(3), gateway.gateways[1])
+        vampytest.assert_is(gateway.get_shard_gateway(1), None)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__reshard_gateway__shard_group():
+    """
+    Tests whether ``reshard_gateway`` works as intended.
+    
+    Case: shard group gateways are not resharded.
+    """
+    client = Client(
+        'token_202610170310',
+        client_id = 202610170311,
+        shard_count = 6,
+    )
+    
+    try:
+        gateway = DiscordGatewayClientShardGroup(client, [2, 3])
+        client.gateway = gateway
+        
+        output = reshard_gateway(client)
+        vampytest.assert_is(output, gateway)
+    
+    finally:
+        client._delete()
+        client = None
@@ -439,3 +439,47 @@ async def test__DiscordGatewayClientSharder__run__default():
     finally:
         client._delete()
         client = None
+
+
+def test__DiscordGatewayClientSharder__get_shard_count():
+    """
+    Tests whether ``DiscordGatewayClientSharder.get_shard_count`` works as intended.
+    """
+    client = Client(
+        'token_202610170312',
+        client_id = 202610170313,
+    )
+    
+    shard_count = 4
+    
+    try:
+        gateway = DiscordGatewayClientSharder(client, shard_count, None)
+        
+        output = gateway.get_shard_count()
+        vampytest.assert_eq(output, shard_count)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__DiscordGatewayClientSharder__get_shard_gateway():
+    """
+    Tests whether ``DiscordGatewayClientSharder.get_shard_gateway`` works as intended.
+    """
+    client = Client(
+        'token_202610170314',
+        client_id = 202610170315,
+    )
+    
+    shard_count = 4
+    
+    try:
+        gateway = DiscordGatewayClientSharder(client, shard_count, None)
+        
+        vampytest.assert_is(gateway.get_shard_gateway(2), gateway.gateways[2])
+        vampytest.assert_is(gateway.get_shard_gateway(4), None)
+    
+    finally:
+        client._delete()
+        client = None
@@ -1,7 +1,7 @@
 from collections import deque
 
 import vampytest
-from scarletio import Task, TimerHandle, skip_ready_cycle, sleep
+from scarletio import LOOP_TIME, Task, TimerHandle, skip_ready_cycle, sleep
 
 from ...core import KOKORO
 
@@ -212,3 +212,40 @@ async def test__GatewayRateLimiter__cancel():
         vampytest.assert_is(rate_limiter.wake_up_handle, None)
     finally:
         rate_limiter.cancel()
+
+
+def _iter_options__get_delay():
+    yield 0.0, 0, 10, False
+    yield 30.0, 11, 10, False
+    yield 30.0, 10, 10, True
+    yield 30.0, 0, 10, True
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_delay()).returning_last())
+def test__GatewayRateLimiter__get_delay(resets_after, remaining, reserve):
+    """
+    Tests whether ``GatewayRateLimiter.get_delay`` works as intended.
+    
+    Parameters
+    ----------
+    resets_after : `float`
+        After how much time the rate limit resets.
+    remaining : `int`
+        The remaining actions.
+    reserve : `int`
+        The amount of actions to keep in reserve.
+    
+    Returns
+    -------
+    output : `bool`
+        Whether there is delay.
+    """
+    rate_limiter = GatewayRateLimiter()
+    rate_limiter.remaining = remaining
+    if resets_after:
+        rate_limiter.resets_at = LOOP_TIME() + resets_after
+    
+    output = rate_limiter.get_delay(reserve)
+    vampytest.assert_instance(output, float)
+    vampytest.assert_true(output <= resets_after)
+    return output > 0.0
@@ -0,0 +1,26 @@
+import vampytest
+
+from ..transport import decode_json_gateway_message
+
+
+def _iter_options():
+    yield b'{"op":11,"d":null}', {'op': 11, 'd': None}
+    yield '{"op":11,"d":null}', {'op': 11, 'd': None}
+    yield '{"t":"MESSAGE_CREATE","d":{"content":"\\u00e9"}}'.encode(), {'t': 'MESSAGE_CREATE', 'd': {'content': '\xe9'}}
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__decode_json_gateway_message(message):
+    """
+    Tests whether ``decode_json_gateway_message`` works as intended.
+    
+    Parameters
+    ----------
+    message : `bytes | str`
+        The message to decode.
+    
+    Returns
+    -------
+    output : `object`
+    """
+    return decode_json_gateway_message(message)
@@ -0,0 +1,86 @@
+import vampytest
+
+from ..etf import ETFDecodeError, etf_decode
+
+
+def _iter_options__passing():
+    yield b'\x83\x61\x0c', 12
+    yield b'\x83\x62\xff\xff\xff\xf6', -10
+    yield b'\x83\x62\x00\x01\x00\x00', 65536
+    yield b'\x83\x6e\x08\x00\x00\x00\x00\x00\x00\x00\x00\x01', 1 << 56
+    yield b'\x83\x6e\x01\x01\x05', -5
+    yield b'\x83\x6f\x00\x00\x00\x01\x00\x07', 7
+    yield b'\x83\x46\x3f\xf8\x00\x00\x00\x00\x00\x00', 1.5
+    yield b'\x83\x6d\x00\x00\x00\x05hello', 'hello'
+    yield b'\x83\x6d\x00\x00\x00\x02\xc3\xa9', '\xe9'
+    yield b'\x83\x77\x03nil', None
+    yield b'\x83\x73\x04null', None
+    yield b'\x83\x64\x00\x04true', True
+    yield b'\x83\x76\x00\x05false', False
+    yield b'\x83\x77\x05READY', 'READY'
+    yield b'\x83\x6a', []
+    yield b'\x83\x6c\x00\x00\x00\x02\x61\x01\x61\x02\x6a', [1, 2]
+    yield b'\x83\x6b\x00\x03\x01\x02\x03', '\x01\x02\x03'
+    yield b'\x83\x68\x02\x61\x01\x6d\x00\x00\x00\x01a', (1, 'a')
+    yield (
+        b'\x83\x74\x00\x00\x00\x02\x77\x02op\x61\x0a\x77\x01d\x74\x00\x00\x00\x01\x77\x12heartbeat_interval'
+        b'\x62\x00\x00\xa2\xc3',
+        {'op': 10, 'd': {'heartbeat_interval': 41667}},
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+def test__etf_decode__passing(data):
+    """
+    Tests whether ``etf_decode`` works as intended.
+    
+    Case: passing.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        Data to decode.
+    
+    Returns
+    -------
+    output : `object`
+    """
+    return etf_decode(data)
+
+
+def test__etf_decode__memory_view():
+    """
+    Tests whether ``etf_decode`` works as intended.
+    
+    Case: decoding from memory view.
+    """
+    output = etf_decode(memoryview(b'\x83\x6d\x00\x00\x00\x05hello'))
+    vampytest.assert_instance(output, str)
+    vampytest.assert_eq(output, 'hello')
+
+
+def _iter_options__failing():
+    yield b''
+    yield b'\x82\x61\x0c'
+    yield b'\x83\x01'
+    yield b'\x83\x6d\x00\x00'
+    yield b'\x83\x74\x00\x00\x00\x01\x77\x02op'
+
+
+@vampytest._(vampytest.call_from(_iter_options__failing()).raising(ETFDecodeError))
+def test__etf_decode__failing(data):
+    """
+    Tests whether ``etf_decode`` works as intended.
+    
+    Case: failing.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        Data to decode.
+    
+    Raises
+    ------
+    ETFDecodeError
+    """
+    etf_decode(data)
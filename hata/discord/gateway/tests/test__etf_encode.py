@@ -0,0 +1,74 @@
+import vampytest
+
+from ..etf import etf_decode, etf_encode
+
+
+def _iter_options__passing():
+    yield 12, b'\x83\x61\x0c'
+    yield -10, b'\x83\x62\xff\xff\xff\xf6'
+    yield 1 << 56, b'\x83\x6e\x08\x00\x00\x00\x00\x00\x00\x00\x00\x01'
+    yield -(1 << 40), b'\x83\x6e\x06\x01\x00\x00\x00\x00\x00\x01'
+    yield 1.5, b'\x83\x46\x3f\xf8\x00\x00\x00\x00\x00\x00'
+    yield 'hello', b'\x83\x6d\x00\x00\x00\x05hello'
+    yield b'hello', b'\x83\x6d\x00\x00\x00\x05hello'
+    yield None, b'\x83\x77\x03nil'
+    yield True, b'\x83\x77\x04true'
+    yield False, b'\x83\x77\x05false'
+    yield [], b'\x83\x6a'
+    yield (1, 2), b'\x83\x6c\x00\x00\x00\x02\x61\x01\x61\x02\x6a'
+    yield {'op': 1}, b'\x83\x74\x00\x00\x00\x01\x77\x02op\x61\x01'
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+def test__etf_encode__passing(value):
+    """
+    Tests whether ``etf_encode`` works as intended.
+    
+    Case: passing.
+    
+    Parameters
+    ----------
+    value : `object`
+        The value to encode.
+    
+    Returns
+    -------
+    output : `bytes`
+    """
+    output = etf_encode(value)
+    vampytest.assert_instance(output, bytes)
+    return output
+
+
+def test__etf_encode__round_trip():
+    """
+    Tests whether ``etf_encode`` works as intended.
+    
+    Case: round trip with ``etf_decode``.
+    """
+    value = {
+        'op': 2,
+        'd': {
+            'token': 'token_20260101',
+            'compress': True,
+            'intents': 1 << 40,
+            'shard': [0, 2],
+            'presence': {
+                'status': 'online',
+                'game': None,
+                'since': 0.0,
+            },
+        },
+    }
+    
+    vampytest.assert_eq(etf_decode(etf_encode(value)), value)
+
+
+def test__etf_encode__failing():
+    """
+    Tests whether ``etf_encode`` works as intended.
+    
+    Case: failing.
+    """
+    with vampytest.assert_raises(TypeError):
+        etf_encode(object())
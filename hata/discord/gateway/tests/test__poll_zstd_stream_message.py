@@ -0,0 +1,30 @@
+import vampytest
+from scarletio import Task
+
+from ...core import KOKORO
+
+from ..client_shard import _poll_zstd_stream_message
+
+from .helpers_web_socket_client import TestWebSocketClient
+
+
+async def test__poll_zstd_stream_message():
+    """
+    Tests whether ``_poll_zstd_stream_message`` works as intended.
+    
+    This function is a coroutine.
+    """
+    web_socket = await TestWebSocketClient(
+        KOKORO,
+        '',
+        in_operations = [
+            ('receive', False, b'abcdef'),
+        ],
+    )
+    
+    task = Task(KOKORO, _poll_zstd_stream_message(web_socket))
+    task.apply_timeout(0.01)
+    output = await task
+    
+    vampytest.assert_instance(output, bytes)
+    vampytest.assert_eq(output, b'abcdef')
@@ -0,0 +1,91 @@
+__all__ = ()
+
+from warnings import warn
+from zlib import decompressobj as create_zlib_decompressor, error as ZlibError
+
+from scarletio import from_json, to_json
+
+from ...env import GATEWAY_COMPRESSION, GATEWAY_ENCODING
+
+from .etf import etf_decode, etf_encode
+
+
+try:
+    # python 3.14+
+    from compression.zstd import ZstdDecompressor, ZstdError
+except ImportError:
+    try:
+        from zstandard import ZstdDecompressor as ZstdDecompressorFactory, ZstdError
+    except ImportError:
+        ZstdDecompressor = None
+        ZstdError = None
+    
+    else:
+        def ZstdDecompressor():
+            """
+            Creates a streaming zstd decompressor.
+            
+            Returns
+            -------
+            decompressor : `zstandard.ZstdDecompressionObj`
+            """
+            return ZstdDecompressorFactory().decompressobj()
+
+
+GATEWAY_ENCODING_JSON = 'json'
+GATEWAY_ENCODING_ETF = 'etf'
+
+GATEWAY_COMPRESSION_ZLIB_STREAM = 'zlib-stream'
+GATEWAY_COMPRESSION_ZSTD_STREAM = 'zstd-stream'
+
+
+if (GATEWAY_COMPRESSION == GATEWAY_COMPRESSION_ZSTD_STREAM) and (ZstdDecompressor is None):
+    warn(
+        (
+            f'`HATA_GATEWAY_COMPRESSION` given as {GATEWAY_COMPRESSION_ZSTD_STREAM!r}, but zstd is not available. '
+            f'Please use python 3.14 or install the `zstandard` package. '
+            f'Defaulting to {GATEWAY_COMPRESSION_ZLIB_STREAM!r}.'
+        ),
+        RuntimeWarning,
+    )
+    
+    GATEWAY_COMPRESSION = GATEWAY_COMPRESSION_ZLIB_STREAM
+
+
+if GATEWAY_COMPRESSION == GATEWAY_COMPRESSION_ZSTD_STREAM:
+    create_gateway_decompressor = ZstdDecompressor
+    DECOMPRESSION_ERRORS = (ZstdError, )
+
+else:
+    create_gateway_decompressor = create_zlib_decompressor
+    DECOMPRESSION_ERRORS = (ZlibError, )
+
+
+def decode_json_gateway_message(message):
+    """
+    Decodes a json gateway message.
+    
+    Parameters
+    ----------
+    message : `bytes | str`
+        The message to decode.
+    
+    Returns
+    -------
+    message : `object`
+    """
+    # The standard library decodes `bytes` with the `surrogatepass` error handler, which is noticeably slower than a
+    # plain utf-8 decode.
+    if isinstance(message, bytes):
+        message = message.decode('utf-8')
+    
+    return from_json(message)
+
+
+if GATEWAY_ENCODING == GATEWAY_ENCODING_ETF:
+    decode_gateway_message = etf_decode
+    encode_gateway_message = etf_encode
+
+else:
+    decode_gateway_message = decode_json_gateway_message
+    encode_gateway_message = to_json
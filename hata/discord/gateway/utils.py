@@ -2,6 +2,7 @@ __all__ = ()
 
 from .client_base import DiscordGatewayClientBase
 from .client_shard import DiscordGatewayClientShard
+from .client_shard_group import DiscordGatewayClientShardGroup
 from .client_sharder import DiscordGatewayClientSharder
 
 
@@ -50,6 +51,10 @@ def reshard_gateway(client):
         
         return DiscordGatewayClientSharder(client, shard_count, None)
     
+    # Using shard group gateway? The shards are partitioned between processes, so it is not resharded.
+    if isinstance(gateway, DiscordGatewayClientShardGroup):
+        return gateway
+    
     # Using sharder gateway?
     if isinstance(gateway, DiscordGatewayClientSharder):
         if shard_count <= 1:
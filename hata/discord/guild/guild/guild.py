@@ -26,6 +26,7 @@ from ...http.urls import (
 from ...localization.utils import LOCALE_DEFAULT
 from ...permission import Permission
 from ...permission.permission import PERMISSION_ALL, PERMISSION_MASK_ADMINISTRATOR, PERMISSION_NONE
+from ...permission.permission_cache_statistics import PERMISSION_CACHE_STATISTICS
 from ...precreate_helpers import process_precreate_parameters_and_raise_extra
 from ...role import Role
 from ...role.role.constants import NAME_LENGTH_MAX as ROLE_NAME_LENGTH_MAX, NAME_LENGTH_MIN as ROLE_NAME_LENGTH_MIN
@@ -39,10 +40,11 @@ from ...sticker.sticker.constants import (
     NAME_LENGTH_MAX as STICKER_NAME_LENGTH_MAX, NAME_LENGTH_MIN as STICKER_NAME_LENGTH_MIN
 )
 from ...sticker.sticker.fields import parse_id as parse_sticker_id
-from ...user import VoiceState, ZEROUSER, create_partial_user_from_id
+from ...user import ClientUserBase, VoiceState, ZEROUSER, create_partial_user_from_id
 from ...user.guild_profile.constants import (
     NICK_LENGTH_MAX as USER_NICK_LENGTH_MAX, NICK_LENGTH_MIN as USER_NICK_LENGTH_MIN
 )
+from ...user.guild_profile.guild_profile_mapping import discard_guild_profile_table
 from ...user.user.constants import NAME_LENGTH_MAX as USER_NAME_LENGTH_MAX, NAME_LENGTH_MIN as USER_NAME_LENGTH_MIN
 from ...user.user.matching import (
     _user_date_sort_key, _user_match_sort_key, USER_MATCH_WEIGHT_DISPLAY_NAME, USER_MATCH_WEIGHT_NAME,
@@ -98,13 +100,14 @@ from .preinstanced import (
     ExplicitContentFilterLevel, GuildFeature, HubType, MfaLevel, MessageNotificationLevel, NsfwLevel, VerificationLevel
 )
 from .sticker_counts import StickerCounts
+from .name_index import UserNameIndex
 from .helpers import (
-    _channel_match_sort_key, _emoji_match_sort_key, _role_match_sort_key, _soundboard_sound_match_sort_key,
-    _sticker_match_sort_key, _strip_emoji_name, STICKER_MATCH_WEIGHT_NAME, STICKER_MATCH_WEIGHT_TAG
+    _channel_match_sort_key, _emoji_match_sort_key, _get_fuzzy_name_pattern, _role_match_sort_key,
+    _soundboard_sound_match_sort_key, _sticker_match_sort_key, _strip_emoji_name, STICKER_MATCH_WEIGHT_NAME,
+    STICKER_MATCH_WEIGHT_TAG
 )
 
 
-Client = include('Client')
 trigger_voice_client_ghost_event = include('trigger_voice_client_ghost_event')
 
 
@@ -200,8 +203,11 @@ class Guild(DiscordEntity, immortal = True):
     _cache_boosters : ``None | list<ClientUserBase>``
         Cached slot for the boosters of the guild.
     
-    _cache_permission : ``None | dict<int, Permission>``
-        A `user_id` to ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    _cache_permission : ``None | dict<int, (None | tuple<int>, Permission)>``
+        A `user_id` to `role_ids` - ``Permission`` relation mapping for caching permissions. Defaults to `None`.
+    
+    _cache_user_name_index : ``None | UserNameIndex``
+        Index over the guild's users' names used by ``.get_user`` and ``.get_user_like``. Built when first used.
     
     _state : `int`
         Bitwise mask used to track the guild's state.
@@ -431,9 +437,10 @@ class Guild(DiscordEntity, immortal = True):
     - ``.inventory_settings``.
     """
     __slots__ = (
-        '_cache_boosters', '_cache_permission', '_state', 'afk_channel_id', 'afk_timeout', 'approximate_online_count',
-        'approximate_user_count', 'available', 'boost_count', 'boost_level', 'boost_progress_bar_enabled', 'channels',
-        'clients', 'default_message_notification_level', 'description', 'embedded_activities', 'emojis',
+        '_cache_boosters', '_cache_permission', '_cache_user_name_index', '_state', 'afk_channel_id', 'afk_timeout',
+        'approximate_online_count', 'approximate_user_count', 'available', 'boost_count', 'boost_level',
+        'boost_progress_bar_enabled', 'channels', 'clients', 'default_message_notification_level', 'description',
+        'embedded_activities', 'emojis',
         'explicit_content_filter_level', 'features', 'hub_type', 'incidents', 'inventory_settings', 'large', 'locale',
         'max_presences', 'max_stage_channel_video_users', 'max_users', 'max_voice_channel_video_users', 'mfa_level',
         'name', 'nsfw_level', 'owner_id', 'public_updates_channel_id', 'roles', 'rules_channel_id',
@@ -743,6 +750,7 @@ class Guild(DiscordEntity, immortal = True):
         self = object.__new__(cls)
         self._cache_boosters = None
         self._cache_permission = None
+        self._cache_user_name_index = None
         self._state = 0
         self.afk_channel_id = afk_channel_id
         self.afk_timeout = afk_timeout
@@ -1052,6 +1060,7 @@ class Guild(DiscordEntity, immortal = True):
         self = object.__new__(cls)
         self._cache_boosters = None
         self._cache_permission = None
+        self._cache_user_name_index = None
         self._state = 0
         self.afk_channel_id = 0
         self.afk_timeout = 0
@@ -1262,6 +1271,7 @@ class Guild(DiscordEntity, immortal = True):
             # Set cache
             self._cache_boosters = None
             self._cache_permission = None
+            self._cache_user_name_index = None
             self._state = 0
             
             # Set fields
@@ -1284,8 +1294,9 @@ class Guild(DiscordEntity, immortal = True):
             self.voice_states = parse_voice_states(data, None, guild_id)
             
         else:
-            # Clear permission cache
-            self._cache_permission = None
+            # Clear permission and user name index cache
+            self._invalidate_cache_permission()
+            self._cache_user_name_index = None
             
             # Update fields.
             self.channels = parse_channels(data, self.channels, guild_id)
@@ -1615,6 +1626,7 @@ class Guild(DiscordEntity, immortal = True):
         if self.owner_id != owner_id:
             old_attributes['owner_id'] = self.owner_id
             self.owner_id = owner_id
+            self._invalidate_cache_permission()
         
         # locale
         locale = parse_locale(data)
@@ -2073,6 +2085,7 @@ class Guild(DiscordEntity, immortal = True):
         new = object.__new__(type(self))
         new._cache_boosters = None
         new._cache_permission = None
+        new._cache_user_name_index = None
         new._state = 0
         new.afk_channel_id = self.afk_channel_id
         new.afk_timeout = self.afk_timeout
@@ -2429,6 +2442,7 @@ class Guild(DiscordEntity, immortal = True):
         new = object.__new__(type(self))
         new._cache_boosters = None
         new._cache_permission = None
+        new._cache_user_name_index = None
         new._state = 0
         new.afk_channel_id = afk_channel_id
         new.afk_timeout = afk_timeout
@@ -2524,6 +2538,9 @@ class Guild(DiscordEntity, immortal = True):
                     del user.guild_profiles[guild_id]
                 except KeyError:
                     pass
+            
+            # Columnar guild profiles of the users not in `.users`.
+            discard_guild_profile_table(guild_id)
     
     # ---- Extra Updaters ----
     
@@ -3412,7 +3429,10 @@ class Guild(DiscordEntity, immortal = True):
         """
         Invalidates the cached permissions of the guild.
         """
-        self._cache_permission = None
+        if (self._cache_permission is not None):
+            self._cache_permission = None
+            PERMISSION_CACHE_STATISTICS.invalidations += 1
+        
         for channel in self.channels.values():
             channel.metadata._invalidate_cache_permission()
     
@@ -3425,6 +3445,36 @@ class Guild(DiscordEntity, immortal = True):
         self._cache_boosters = None
     
     
+    def _get_user_name_index(self):
+        """
+        Returns the guild's user name index. If not yet built, builds it.
+        
+        Returns
+        -------
+        user_name_index : ``UserNameIndex``
+        """
+        user_name_index = self._cache_user_name_index
+        if user_name_index is None:
+            user_name_index = UserNameIndex(self.id, self.users)
+            self._cache_user_name_index = user_name_index
+        
+        return user_name_index
+    
+    
+    def _update_user_name_index(self, user_id):
+        """
+        Marks the user's names as changed in the guild's user name index.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The user's identifier.
+        """
+        user_name_index = self._cache_user_name_index
+        if (user_name_index is not None):
+            user_name_index.update(user_id)
+    
+    
     def _get_boosters(self):
         """
         Iterates over the users of the guild and selects the ones boosting. The output is sorted.
@@ -3544,7 +3594,7 @@ class Guild(DiscordEntity, immortal = True):
         if name_length > CHANNEL_NAME_LENGTH_MAX:
             return default
         
-        channel_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        channel_name_pattern = _get_fuzzy_name_pattern(name)
         
         accurate_channel = default
         accurate_match_key = None
@@ -3596,7 +3646,7 @@ class Guild(DiscordEntity, immortal = True):
         if name_length > CHANNEL_NAME_LENGTH_MAX:
             return []
         
-        channel_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        channel_name_pattern = _get_fuzzy_name_pattern(name)
         
         matches = []
         
@@ -3674,7 +3724,7 @@ class Guild(DiscordEntity, immortal = True):
         if name_length > EMOJI_NAME_LENGTH_MAX:
             return default
         
-        emoji_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        emoji_name_pattern = _get_fuzzy_name_pattern(name)
         
         accurate_emoji = default
         accurate_match_key = None
@@ -3718,7 +3768,7 @@ class Guild(DiscordEntity, immortal = True):
         if name_length > EMOJI_NAME_LENGTH_MAX:
             return []
         
-        emoji_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        emoji_name_pattern = _get_fuzzy_name_pattern(name)
         
         matches = []
         
@@ -3785,7 +3835,7 @@ class Guild(DiscordEntity, immortal = True):
         if (name_length > ROLE_NAME_LENGTH_MAX):
             return default
         
-        role_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        role_name_pattern = _get_fuzzy_name_pattern(name)
         
         accurate_role = default
         accurate_match_key = None
@@ -3828,7 +3878,7 @@ class Guild(DiscordEntity, immortal = True):
         if (name_length > ROLE_NAME_LENGTH_MAX):
             return []
         
-        role_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        role_name_pattern = _get_fuzzy_name_pattern(name)
         
         matches = []
         
@@ -3894,7 +3944,7 @@ class Guild(DiscordEntity, immortal = True):
         if name_length > SOUNDBOARDS_SOUND_NAME_LENGTH_MAX:
             return default
         
-        soundboard_sound_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        soundboard_sound_name_pattern = _get_fuzzy_name_pattern(name)
         
         accurate_soundboard_sound = default
         accurate_match_key = None
@@ -3937,7 +3987,7 @@ class Guild(DiscordEntity, immortal = True):
         if name_length > SOUNDBOARDS_SOUND_NAME_LENGTH_MAX:
             return []
         
-        soundboard_sound_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        soundboard_sound_name_pattern = _get_fuzzy_name_pattern(name)
         
         matches = []
         
@@ -4003,7 +4053,7 @@ class Guild(DiscordEntity, immortal = True):
         if name_length > STICKER_NAME_LENGTH_MAX:
             return default
         
-        sticker_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        sticker_name_pattern = _get_fuzzy_name_pattern(name)
         
         accurate_sticker = default
         accurate_match_key = None
@@ -4069,7 +4119,7 @@ class Guild(DiscordEntity, immortal = True):
         if name_length > STICKER_NAME_LENGTH_MAX:
             return []
         
-        sticker_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        sticker_name_pattern = _get_fuzzy_name_pattern(name)
         matches = []
         
         for sticker in self.stickers.values():
@@ -4143,12 +4193,13 @@ class Guild(DiscordEntity, immortal = True):
             return default
         
         users = self.users
+        user_name_index = self._get_user_name_index()
         
         # name with discriminator
         
         name_with_discriminator = _parse_name_with_discriminator(name)
         if (name_with_discriminator is not None):
-            for user in users.values():
+            for user in user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NAME, name_with_discriminator[0], False):
                 if _is_user_matching_name_with_discriminator(user, name_with_discriminator):
                     return user
         
@@ -4156,27 +4207,20 @@ class Guild(DiscordEntity, immortal = True):
             return default
         
         # name
-        for user in users.values():
+        for user in user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NAME, name, False):
             if user.name == name:
                 return user
         
         # global_name
-        for user in users.values():
-            user_display_name = user.display_name
-            if (user_display_name is not None) and (user_display_name == name):
+        for user in user_name_index.iter_matches(users, USER_MATCH_WEIGHT_DISPLAY_NAME, name, False):
+            if user.display_name == name:
                 return user
         
         # nick
         guild_id = self.id
-        for user in users.values():
-            try:
-                guild_profile = user.guild_profiles[guild_id]
-            except KeyError:
-                pass
-            else:
-                nick = guild_profile.nick
-                if (nick is not None) and (nick == name):
-                    return user
+        for user in user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NICK, name, False):
+            if user.guild_profiles[guild_id].nick == name:
+                return user
         
         return default
     
@@ -4202,20 +4246,28 @@ class Guild(DiscordEntity, immortal = True):
             return default
         
         users = self.users
+        user_name_index = self._get_user_name_index()
         
         # name with discriminator
         
         name_with_discriminator = _parse_name_with_discriminator(name)
         if (name_with_discriminator is not None):
-            for user in users.values():
+            for user in user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NAME, name_with_discriminator[0], False):
                 if _is_user_matching_name_with_discriminator(user, name_with_discriminator):
                     return user
         
         if name_length > USER_ALL_NAME_LENGTH_MAX:
             return default
         
-        user_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        user_name_pattern = _get_fuzzy_name_pattern(name)
         
+        # name prefix
+        # A prefix match is the best possible match, so if we find one through the index, we can return it.
+        if name_length:
+            for user in user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NAME, name, True):
+                parsed = user_name_pattern.match(user.name)
+                if (parsed is not None) and (parsed.end() == name_length):
+                    return user
         
         accurate_user = default
         accurate_match_key = None
@@ -4327,7 +4379,7 @@ class Guild(DiscordEntity, immortal = True):
         if name_length > USER_ALL_NAME_LENGTH_MAX:
             return []
         
-        user_name_pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+        user_name_pattern = _get_fuzzy_name_pattern(name)
         matches = []
         guild_id = self.id
         
@@ -4772,23 +4824,32 @@ class Guild(DiscordEntity, immortal = True):
         
         Notes
         -----
-        Mainly designed for getting clients' permissions and stores only their as well. Do not caches other user's
-        permissions.
+        The cache is dropped when a role, the owner or a client's guild profile changes. The entries of other users
+        are stored together with their role identifiers and are recalculated if these are changed.
         """
-        if not isinstance(user, Client):
+        if not isinstance(user, ClientUserBase):
             return self.permissions_for(user)
         
+        # Users outside of the guild are marked with `...`.
+        guild_profile = user.guild_profiles.get(self.id, None)
+        role_ids = ... if guild_profile is None else guild_profile.role_ids
+        
         cache_permission = self._cache_permission
         if cache_permission is None:
             self._cache_permission = cache_permission = {}
         else:
             try:
-                return cache_permission[user.id]
+                cached_role_ids, permissions = cache_permission[user.id]
             except KeyError:
                 pass
+            else:
+                if cached_role_ids is role_ids:
+                    PERMISSION_CACHE_STATISTICS.hits += 1
+                    return permissions
         
+        PERMISSION_CACHE_STATISTICS.misses += 1
         permissions = self.permissions_for(user)
-        cache_permission[user.id] = permissions
+        cache_permission[user.id] = (role_ids, permissions)
         return permissions
     
     
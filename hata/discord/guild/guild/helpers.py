@@ -1,5 +1,42 @@
 __all__ = ()
 
+from re import I as re_ignore_case, compile as re_compile, escape as re_escape
+
+
+# ---- generic ----
+
+FUZZY_NAME_PATTERN_CACHE = {}
+FUZZY_NAME_PATTERN_CACHE_LIMIT = 1024
+
+
+def _get_fuzzy_name_pattern(name):
+    """
+    Returns a case insensitive pattern matching the characters of the given name in order.
+    
+    Autocomplete handlers call the `..._like` lookups with the same names repeatedly, so the patterns are cached.
+    
+    Parameters
+    ----------
+    name : `str`
+        The name to create pattern for.
+    
+    Returns
+    -------
+    pattern : `re.Pattern`
+    """
+    try:
+        return FUZZY_NAME_PATTERN_CACHE[name]
+    except KeyError:
+        pass
+    
+    pattern = re_compile('.*?'.join(re_escape(char) for char in name), re_ignore_case)
+    
+    if len(FUZZY_NAME_PATTERN_CACHE) >= FUZZY_NAME_PATTERN_CACHE_LIMIT:
+        del FUZZY_NAME_PATTERN_CACHE[next(iter(FUZZY_NAME_PATTERN_CACHE))]
+    
+    FUZZY_NAME_PATTERN_CACHE[name] = pattern
+    return pattern
+
 
 # ---- channel ----
 
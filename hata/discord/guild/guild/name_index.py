@@ -0,0 +1,245 @@
+__all__ = ()
+
+from bisect import bisect_left
+from math import sqrt
+
+from ...user.user.matching import USER_MATCH_WEIGHT_DISPLAY_NAME, USER_MATCH_WEIGHT_NAME, USER_MATCH_WEIGHT_NICK
+
+
+USER_NAME_INDEX_PENDING_LIMIT_MIN = 64
+
+
+def _iter_user_name_keys(user, guild_id):
+    """
+    Iterates over the index keys of the given user.
+    
+    This method is an iterable generator.
+    
+    Parameters
+    ----------
+    user : ``ClientUserBase``
+        The user to get its keys of.
+    guild_id : `int`
+        The respective guild's identifier.
+    
+    Yields
+    ------
+    key : `tuple<int, str>`
+        Match weight - lower cased name pair.
+    """
+    yield USER_MATCH_WEIGHT_NAME, user.name.lower()
+    
+    display_name = user.display_name
+    if (display_name is not None):
+        yield USER_MATCH_WEIGHT_DISPLAY_NAME, display_name.lower()
+    
+    guild_profile = user.guild_profiles.get(guild_id, None)
+    if (guild_profile is not None):
+        nick = guild_profile.nick
+        if (nick is not None):
+            yield USER_MATCH_WEIGHT_NICK, nick.lower()
+
+
+def _get_user_name_value(user, guild_id, weight):
+    """
+    Returns the user's name for the given match weight.
+    
+    Parameters
+    ----------
+    user : ``ClientUserBase``
+        The user to get its name of.
+    guild_id : `int`
+        The respective guild's identifier.
+    weight : `int`
+        The name's match weight.
+    
+    Returns
+    -------
+    value : `None | str`
+    """
+    if weight == USER_MATCH_WEIGHT_NAME:
+        return user.name
+    
+    if weight == USER_MATCH_WEIGHT_DISPLAY_NAME:
+        return user.display_name
+    
+    guild_profile = user.guild_profiles.get(guild_id, None)
+    if guild_profile is None:
+        return None
+    
+    return guild_profile.nick
+
+
+class UserNameIndex:
+    """
+    Sorted index over the lower cased names, display names and nicks of a guild's users.
+    
+    The index is built when first queried. After that, changed users are only collected as pending and merged into the
+    sorted entries in bulk, when enough of them accumulated. Every returned user is validated against its current
+    names, so removed and renamed users are never returned.
+    
+    Attributes
+    ----------
+    entries : `list<tuple<int, str, int>>`
+        Match weight - lower cased name - user identifier triplets in sorted order.
+    guild_id : `int`
+        The respective guild's identifier.
+    pending : `set<int>`
+        User identifiers whose entries might be outdated.
+    """
+    __slots__ = ('entries', 'guild_id', 'pending')
+    
+    def __new__(cls, guild_id, users):
+        """
+        Creates a new user name index.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The respective guild's identifier.
+        users : `dict<int, ClientUserBase>`
+            The guild's users.
+        """
+        entries = [
+            (weight, key, user_id)
+            for user_id, user in users.items()
+            for weight, key in _iter_user_name_keys(user, guild_id)
+        ]
+        entries.sort()
+        
+        self = object.__new__(cls)
+        self.entries = entries
+        self.guild_id = guild_id
+        self.pending = set()
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the user name index's representation."""
+        return f'<{type(self).__name__} entries = {len(self.entries)!r}, pending = {len(self.pending)!r}>'
+    
+    
+    def update(self, user_id):
+        """
+        Marks the user's entries as outdated.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The user's identifier.
+        """
+        self.pending.add(user_id)
+    
+    
+    def _maybe_merge(self, users):
+        """
+        Merges the pending users into the sorted entries if there are too many of them.
+        
+        Pending users are checked one by one on each query, meanwhile merging costs linear time, so we allow up to
+        square root of the entries to be pending.
+        
+        Parameters
+        ----------
+        users : `dict<int, ClientUserBase>`
+            The guild's users.
+        """
+        pending = self.pending
+        if len(pending) <= max(USER_NAME_INDEX_PENDING_LIMIT_MIN, int(sqrt(len(self.entries)))):
+            return
+        
+        guild_id = self.guild_id
+        # Drop the outdated entries and the ones of the users who left meanwhile.
+        entries = [entry for entry in self.entries if (entry[2] not in pending) and (entry[2] in users)]
+        
+        new_entries = []
+        for user_id in pending:
+            user = users.get(user_id, None)
+            if (user is not None):
+                for weight, key in _iter_user_name_keys(user, guild_id):
+                    new_entries.append((weight, key, user_id))
+        
+        new_entries.sort()
+        entries.extend(new_entries)
+        # Two sorted runs, merged in linear time.
+        entries.sort()
+        
+        self.entries = entries
+        pending.clear()
+    
+    
+    def iter_matches(self, users, weight, name, prefix):
+        """
+        Iterates over the users whose name of the given weight matches the given one case insensitively.
+        
+        This method is an iterable generator.
+        
+        Parameters
+        ----------
+        users : `dict<int, ClientUserBase>`
+            The guild's users.
+        weight : `int`
+            The match weight of the name to match.
+        name : `str`
+            The name to match.
+        prefix : `bool`
+            Whether prefix match is enough.
+        
+        Yields
+        ------
+        user : ``ClientUserBase``
+        """
+        self._maybe_merge(users)
+        
+        guild_id = self.guild_id
+        key = name.lower()
+        entries = self.entries
+        pending = self.pending
+        
+        index = bisect_left(entries, (weight, key))
+        entries_length = len(entries)
+        while index < entries_length:
+            entry_weight, entry_key, user_id = entries[index]
+            index += 1
+            
+            if (entry_weight != weight):
+                break
+            
+            if prefix:
+                if not entry_key.startswith(key):
+                    break
+            else:
+                if entry_key != key:
+                    break
+            
+            if (user_id in pending):
+                continue
+            
+            user = users.get(user_id, None)
+            if (user is None):
+                continue
+            
+            # Validate, the user might have been renamed without us knowing.
+            value = _get_user_name_value(user, guild_id, weight)
+            if (value is None) or (value.lower() != entry_key):
+                continue
+            
+            yield user
+        
+        for user_id in [*pending]:
+            user = users.get(user_id, None)
+            if (user is None):
+                continue
+            
+            value = _get_user_name_value(user, guild_id, weight)
+            if value is None:
+                continue
+            
+            value = value.lower()
+            if prefix:
+                if not value.startswith(key):
+                    continue
+            else:
+                if value != key:
+                    continue
+            
+            yield user
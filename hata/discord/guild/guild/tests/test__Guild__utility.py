@@ -2572,6 +2572,40 @@ def test__Guild__cached_permissions_for():
         client = None
 
 
+def test__Guild__cached_permissions_for__role_ids_change():
+    """
+    Tests whether ``Guild.cached_permissions_for`` works as intended.
+    
+    Case: user, role identifiers change.
+    """
+    guild_id = 202610170000
+    user_id = 202610170001
+    role_id = 202610170002
+    default_permissions = Permission().update_by_keys(moderate_users = True)
+    role_permissions = Permission().update_by_keys(ban_users = True)
+    
+    user = User.precreate(user_id)
+    user.guild_profiles[guild_id] = GuildProfile()
+    role_default = Role.precreate(guild_id, permissions = default_permissions)
+    role = Role.precreate(role_id, permissions = role_permissions)
+    
+    guild = Guild.precreate(guild_id, users = [user], roles = [role_default, role])
+    
+    permissions = guild.cached_permissions_for(user)
+    vampytest.assert_eq(permissions, default_permissions)
+    vampytest.assert_in(user_id, guild._cache_permission)
+    
+    user.guild_profiles[guild_id].role_ids = (role_id,)
+    
+    permissions = guild.cached_permissions_for(user)
+    vampytest.assert_eq(permissions, default_permissions | role_permissions)
+    
+    del user.guild_profiles[guild_id]
+    
+    permissions = guild.cached_permissions_for(user)
+    vampytest.assert_eq(permissions, PERMISSION_NONE)
+
+
 def test__Guild__permissions_for_roles__no_default():
     """
     Tests whether ``Guild.permissions_for_roles`` works as intended.
@@ -3136,3 +3170,28 @@ def test__Guild__vanity_url(guild_id, vanity_code):
     output = guild.vanity_url
     vampytest.assert_instance(output, str, nullable = True)
     return (output is not None)
+
+
+def test__Guild__get_user__name_index_update():
+    """
+    Tests whether ``Guild.get_user`` works as intended.
+    
+    Case: User added and renamed after the user name index was built.
+    """
+    guild_id = 202410170450
+    user_0 = User.precreate(202410170451, name = 'orin')
+    user_1 = User.precreate(202410170452, name = 'okuu')
+    
+    guild = Guild.precreate(guild_id, users = [user_0])
+    
+    vampytest.assert_is(guild.get_user('orin'), user_0)
+    
+    user_0.name = 'rin'
+    guild._update_user_name_index(user_0.id)
+    guild.users[user_1.id] = user_1
+    guild._update_user_name_index(user_1.id)
+    
+    vampytest.assert_is(guild.get_user('orin'), None)
+    vampytest.assert_is(guild.get_user('rin'), user_0)
+    vampytest.assert_is(guild.get_user('okuu'), user_1)
+    vampytest.assert_is(guild.get_user_like('ok'), user_1)
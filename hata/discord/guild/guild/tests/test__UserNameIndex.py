@@ -0,0 +1,155 @@
+import vampytest
+
+from ....user import GuildProfile, User
+from ....user.user.matching import USER_MATCH_WEIGHT_DISPLAY_NAME, USER_MATCH_WEIGHT_NAME, USER_MATCH_WEIGHT_NICK
+
+from ..name_index import USER_NAME_INDEX_PENDING_LIMIT_MIN, UserNameIndex
+
+
+def _assert_fields_set(user_name_index):
+    """
+    Asserts whether every attribute is set of the given user name index.
+    
+    Parameters
+    ----------
+    user_name_index : ``UserNameIndex``
+        The user name index to check.
+    """
+    vampytest.assert_instance(user_name_index, UserNameIndex)
+    vampytest.assert_instance(user_name_index.entries, list)
+    vampytest.assert_instance(user_name_index.guild_id, int)
+    vampytest.assert_instance(user_name_index.pending, set)
+
+
+def test__UserNameIndex__new():
+    """
+    Tests whether ``UserNameIndex.__new__`` works as intended.
+    """
+    guild_id = 202410170400
+    user_0 = User.precreate(202410170401, name = 'Orin', display_name = 'Rin')
+    user_1 = User.precreate(202410170402, name = 'Okuu')
+    user_1.guild_profiles[guild_id] = GuildProfile(nick = 'Utsuho')
+    
+    users = {user.id: user for user in (user_0, user_1)}
+    
+    user_name_index = UserNameIndex(guild_id, users)
+    _assert_fields_set(user_name_index)
+    
+    vampytest.assert_eq(user_name_index.guild_id, guild_id)
+    vampytest.assert_eq(
+        user_name_index.entries,
+        [
+            (USER_MATCH_WEIGHT_NAME, 'okuu', user_1.id),
+            (USER_MATCH_WEIGHT_NAME, 'orin', user_0.id),
+            (USER_MATCH_WEIGHT_DISPLAY_NAME, 'rin', user_0.id),
+            (USER_MATCH_WEIGHT_NICK, 'utsuho', user_1.id),
+        ],
+    )
+
+
+def test__UserNameIndex__repr():
+    """
+    Tests whether ``UserNameIndex.__repr__`` works as intended.
+    """
+    user_name_index = UserNameIndex(202410170410, {})
+    
+    output = repr(user_name_index)
+    vampytest.assert_instance(output, str)
+
+
+def _iter_options__iter_matches():
+    guild_id = 202410170420
+    user_0 = User.precreate(202410170421, name = 'orin')
+    user_1 = User.precreate(202410170422, name = 'Orange', display_name = 'orin')
+    user_2 = User.precreate(202410170423, name = 'okuu')
+    user_2.guild_profiles[guild_id] = GuildProfile(nick = 'ORIN')
+    
+    users = {user.id: user for user in (user_0, user_1, user_2)}
+    
+    yield guild_id, users, USER_MATCH_WEIGHT_NAME, 'orin', False, [user_0]
+    yield guild_id, users, USER_MATCH_WEIGHT_NAME, 'or', False, []
+    yield guild_id, users, USER_MATCH_WEIGHT_NAME, 'or', True, [user_1, user_0]
+    yield guild_id, users, USER_MATCH_WEIGHT_NAME, 'OR', True, [user_1, user_0]
+    yield guild_id, users, USER_MATCH_WEIGHT_DISPLAY_NAME, 'Orin', False, [user_1]
+    yield guild_id, users, USER_MATCH_WEIGHT_NICK, 'orin', False, [user_2]
+    yield guild_id, users, USER_MATCH_WEIGHT_NICK, 'okuu', True, []
+
+
+@vampytest._(vampytest.call_from(_iter_options__iter_matches()).returning_last())
+def test__UserNameIndex__iter_matches(guild_id, users, weight, name, prefix):
+    """
+    Tests whether ``UserNameIndex.iter_matches`` works as intended.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The respective guild's identifier.
+    users : `dict<int, ClientUserBase>`
+        The guild's users.
+    weight : `int`
+        The match weight of the name to match.
+    name : `str`
+        The name to match.
+    prefix : `bool`
+        Whether prefix match is enough.
+    
+    Returns
+    -------
+    output : `list<ClientUserBase>`
+    """
+    user_name_index = UserNameIndex(guild_id, users)
+    return [*user_name_index.iter_matches(users, weight, name, prefix)]
+
+
+def test__UserNameIndex__iter_matches__outdated():
+    """
+    Tests whether ``UserNameIndex.iter_matches`` works as intended.
+    
+    Case: Renamed and removed users.
+    """
+    guild_id = 202410170430
+    user_0 = User.precreate(202410170431, name = 'orin')
+    user_1 = User.precreate(202410170432, name = 'okuu')
+    user_2 = User.precreate(202410170433, name = 'koishi')
+    
+    users = {user.id: user for user in (user_0, user_1, user_2)}
+    user_name_index = UserNameIndex(guild_id, users)
+    
+    # Renamed, but the index was not notified
+    user_1.name = 'satori'
+    
+    # Removed
+    del users[user_2.id]
+    
+    # Renamed and notified
+    user_0.name = 'rin'
+    user_name_index.update(user_0.id)
+    
+    vampytest.assert_eq([*user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NAME, 'okuu', False)], [])
+    vampytest.assert_eq([*user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NAME, 'koishi', False)], [])
+    vampytest.assert_eq([*user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NAME, 'orin', False)], [])
+    vampytest.assert_eq([*user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NAME, 'rin', False)], [user_0])
+
+
+def test__UserNameIndex__iter_matches__merge():
+    """
+    Tests whether ``UserNameIndex.iter_matches`` works as intended.
+    
+    Case: Merging pending users.
+    """
+    guild_id = 202410170440
+    base_user_id = 202410170441000
+    
+    users = {}
+    user_name_index = UserNameIndex(guild_id, users)
+    
+    for index in range(USER_NAME_INDEX_PENDING_LIMIT_MIN + 1):
+        user = User.precreate(base_user_id + index, name = f'satori_{index:03}')
+        users[user.id] = user
+        user_name_index.update(user.id)
+    
+    output = [*user_name_index.iter_matches(users, USER_MATCH_WEIGHT_NAME, 'satori_00', True)]
+    
+    vampytest.assert_eq(len(user_name_index.pending), 0)
+    vampytest.assert_eq(len(user_name_index.entries), USER_NAME_INDEX_PENDING_LIMIT_MIN + 1)
+    vampytest.assert_eq(output, [users[base_user_id + index] for index in range(10)])
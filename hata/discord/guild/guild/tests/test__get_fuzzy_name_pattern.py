@@ -0,0 +1,36 @@
+import vampytest
+
+from ..helpers import _get_fuzzy_name_pattern
+
+
+def _iter_options():
+    yield 'rin', 'Orin', (1, 4)
+    yield 'oi', 'koishi', (1, 3)
+    yield 'a.b', 'A.xb', (0, 4)
+    yield 'a.b', 'axb', None
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_fuzzy_name_pattern(name, value):
+    """
+    Tests whether ``_get_fuzzy_name_pattern`` works as intended.
+    
+    Parameters
+    ----------
+    name : `str`
+        The name to create pattern for.
+    value : `str`
+        The value to match.
+    
+    Returns
+    -------
+    output : `None | tuple<int, int>`
+    """
+    pattern = _get_fuzzy_name_pattern(name)
+    vampytest.assert_is(_get_fuzzy_name_pattern(name), pattern)
+    
+    parsed = pattern.search(value)
+    if parsed is None:
+        return None
+    
+    return parsed.span()
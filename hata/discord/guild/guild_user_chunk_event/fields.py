@@ -74,6 +74,7 @@ def parse_users__cache_presence(data, guild_id = 0):
             for guild_profile_data in guild_profile_datas:
                 user = User.from_data(guild_profile_data['user'], guild_profile_data, guild_id, strong_cache = False)
                 guild_users[user.id] = user
+                guild._update_user_name_index(user.id)
                 users.append(user)
         
         presence_datas = data.get('presences', None)
@@ -107,6 +108,7 @@ def parse_users__no_cache_presence(data, guild_id = 0):
             for guild_profile_data in guild_profile_datas:
                 user = User.from_data(guild_profile_data['user'], guild_profile_data, guild_id, strong_cache = False)
                 guild_users[user.id] = user
+                guild._update_user_name_index(user.id)
                 users.append(user)
     
     return users
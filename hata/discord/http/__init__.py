@@ -4,6 +4,7 @@ from .headers import *
 from .rate_limit import *
 from .rate_limit_groups import *
 from .rate_limit_proxy import *
+from .rate_limit_state import *
 from .urls import *
 
 from . import rate_limit_groups as RATE_LIMIT_GROUPS
@@ -18,5 +19,6 @@ __all__ = (
     *rate_limit.__all__,
     *rate_limit_groups.__all__,
     *rate_limit_proxy.__all__,
+    *rate_limit_state.__all__,
     *urls.__all__,
 )
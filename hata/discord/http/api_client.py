@@ -17,14 +17,56 @@ from . import rate_limit_groups as RATE_LIMIT_GROUPS
 from .connector_cache import get_connector
 from .headers import AUDIT_LOG_REASON, build_headers
 from .rate_limit import NO_SPECIFIC_RATE_LIMITER, RateLimitHandler, StackedStaticRateLimitHandler
+from .rate_limit_state import create_rate_limit_state
 from .urls import API_ENDPOINT, STATUS_ENDPOINT
 
 
+try:
+    from orjson import loads as from_json_bytes
+except ImportError:
+    from_json_bytes = None
+
+
 NON_JSON_TYPES = (FormData, bytes, type(None))
 
 REQUEST_RETRY_LIMIT = 5
 
 
+def _decode_response_body(body, content_type_headers):
+    """
+    Decodes the given response body.
+    
+    If the response is json, and `orjson` is available, it is parsed directly from the raw body bytes without
+    creating an intermediate `str`.
+    
+    Parameters
+    ----------
+    body : `None | bytes`
+        The response's body.
+    
+    content_type_headers : `None | str`
+        The response's content type.
+    
+    Returns
+    -------
+    response_data : `None | object`
+    """
+    if body is None:
+        return None
+    
+    if (content_type_headers is None) or (not content_type_headers.startswith('application/json')):
+        return body.decode('utf-8')
+    
+    if (from_json_bytes is not None):
+        try:
+            return from_json_bytes(body)
+        except ValueError:
+            # Let the default parser handle edge cases, like integers exceeding 64 bits.
+            pass
+    
+    return from_json(body.decode('utf-8'))
+
+
 class DiscordApiClient(RichAttributeErrorBaseType):
     """
     Discord api client that adds http information to requests.
@@ -37,16 +79,16 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         Debug options used when requesting towards Discord.
     http : ``HTTPClient``
         The used http client.
-    global_rate_limit_expires_at : `float`
-        The time when global rate limit will expire in monotonic time.
     handlers : ``WeakMap<RateLimitHandler>``
         Rate limit handlers of the Discord requests.
     headers : ``IgnoreCaseMultiValueDictionary``
         Headers used by every every Discord request.
+    rate_limit_state : ``RateLimitState``
+        Rate limit state shared by the requests, like the global rate limit's expiration.
     """
-    __slots__ = ('debug_options', 'http', 'global_rate_limit_expires_at', 'handlers', 'headers')
+    __slots__ = ('debug_options', 'http', 'handlers', 'headers', 'rate_limit_state')
     
-    def __new__(cls, bot, token, *, debug_options = None, http = None):
+    def __new__(cls, bot, token, *, debug_options = None, http = None, rate_limit_state = None):
         """
         Creates a new Discord api client.
         
@@ -62,6 +104,10 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         
         http : `None | HTTPClient`` = `None`, Optional (Keyword only)
             The http client to use instead of creating a new one.
+        
+        rate_limit_state : ``None | RateLimitState`` = `None`, Optional (Keyword only)
+            Rate limit state to use instead of creating a new one. By default an in-process state is created, or a
+            shared one if `HATA_RATE_LIMIT_STATE_DIRECTORY` is set.
         """
         connector = get_connector()
         headers = build_headers(bot, token, debug_options)
@@ -69,15 +115,35 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         if http is None:
             http = HTTPClient(KOKORO, connector = connector)
         
+        if rate_limit_state is None:
+            rate_limit_state = create_rate_limit_state(token)
+        
         self = object.__new__(cls)
         self.debug_options = debug_options
         self.http = http
-        self.global_rate_limit_expires_at = 0.0
         self.handlers = WeakMap()
         self.headers = headers
+        self.rate_limit_state = rate_limit_state
         return self
     
     
+    @property
+    def global_rate_limit_expires_at(self):
+        """
+        Returns when the global rate limit will expire in monotonic time.
+        
+        Returns
+        -------
+        global_rate_limit_expires_at : `float`
+        """
+        return self.rate_limit_state.get_global_rate_limit_expires_at()
+    
+    
+    @global_rate_limit_expires_at.setter
+    def global_rate_limit_expires_at(self, value):
+        self.rate_limit_state.set_global_rate_limit_expires_at(value)
+    
+    
     async def discord_request(
         self, handler, method, url, data = None, query = None, headers = None, reason = None, *, params = ...
     ):
@@ -158,7 +224,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         causes = None
         
         while True:
-            global_rate_limit_expires_at = self.global_rate_limit_expires_at
+            global_rate_limit_expires_at = self.rate_limit_state.get_global_rate_limit_expires_at()
             if global_rate_limit_expires_at > LOOP_TIME():
                 future = Future(KOKORO)
                 KOKORO.call_at(global_rate_limit_expires_at, Future.set_result_if_pending, future, None)
@@ -170,7 +236,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
                     async with RequestContextManager(
                         self.http._request(method, url, headers, data = data, query = query)
                     ) as response:
-                        response_data = await response.text(encoding = 'utf-8')
+                        response_data = await response.read()
                 except (OSError, PayloadError) as exception:
                     if causes is None:
                         causes = []
@@ -193,9 +259,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
                 response_headers = response.headers
                 status = response.status
                 
-                content_type_headers = response_headers.get(CONTENT_TYPE, None)
-                if (content_type_headers is not None) and content_type_headers.startswith('application/json'):
-                    response_data = from_json(response_data)
+                response_data = _decode_response_body(response_data, response_headers.get(CONTENT_TYPE, None))
                 
                 if 199 < status < 305:
                     lock.exit(response_headers)
@@ -213,7 +277,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
                     retry_after = response_data.get('retry_after', 0.0)
                     if response_data.get('global', False):
                         global_rate_limit_expires_at = LOOP_TIME() + retry_after
-                        self.global_rate_limit_expires_at = global_rate_limit_expires_at
+                        self.rate_limit_state.set_global_rate_limit_expires_at(global_rate_limit_expires_at)
                         future = Future(KOKORO)
                         KOKORO.call_at(global_rate_limit_expires_at, Future.set_result_if_pending, future, None)
                         await future
@@ -3,7 +3,7 @@ __all__ = ()
 from collections import deque
 from datetime import datetime as DateTime, timezone as TimeZone
 
-from scarletio import Future, LOOP_TIME, ScarletLock
+from scarletio import Future, LOOP_TIME, ScarletLock, include
 from scarletio.web_common.headers import DATE
 
 from ..core import KOKORO
@@ -12,6 +12,9 @@ from ..utils import parse_date_header_to_datetime
 from .headers import RATE_LIMIT_HASH, RATE_LIMIT_LIMIT, RATE_LIMIT_REMAINING, RATE_LIMIT_RESET, RATE_LIMIT_RESET_AFTER
 
 
+RATE_LIMIT_GROUP_SNAPSHOT = include('RATE_LIMIT_GROUP_SNAPSHOT')
+
+
 GLOBALLY_LIMITED = 0x4000000000000000
 RATE_LIMIT_DROP_ROUND = 0.20
 MAXIMAL_UNLIMITED_PARARELLITY = -50
@@ -681,6 +684,7 @@ class RateLimitHandler:
         
         if size != current_size:
             self.parent.size = size
+            RATE_LIMIT_GROUP_SNAPSHOT.update(self.parent)
             
             if optimistic:
                 current_size = -current_size
@@ -0,0 +1,425 @@
+__all__ = ('RATE_LIMIT_GROUP_SNAPSHOT', 'RateLimitGroupSnapshot', 'RateLimitState', 'RateLimitStateSharedMemory',)
+
+from hashlib import sha256
+from mmap import mmap
+from os import (
+    O_CREAT, O_RDWR, close as close_file_descriptor, fstat, ftruncate, getpid, makedirs, open as open_file_descriptor,
+    replace as replace_file
+)
+from os.path import dirname as get_directory_name, join as join_paths
+from struct import pack_into, unpack_from
+from time import time as time_now
+from warnings import warn
+
+try:
+    from fcntl import LOCK_EX, LOCK_UN, flock
+except ImportError:
+    # Not available on windows.
+    flock = None
+
+from scarletio import LOOP_TIME, RichAttributeErrorBaseType, copy_docs, export, from_json, to_json
+
+from ...env import RATE_LIMIT_STATE_DIRECTORY
+
+from ..core import KOKORO
+
+from . import rate_limit_groups as RATE_LIMIT_GROUPS
+from .rate_limit import RateLimitGroup, UNLIMITED_SIZE_VALUE
+
+
+RATE_LIMIT_GROUP_SNAPSHOT_FILE_NAME = 'rate_limit_groups.json'
+RATE_LIMIT_GROUP_SNAPSHOT_SAVE_DELAY = 5.0
+RATE_LIMIT_GROUP_SNAPSHOT_VERSION = 1
+
+SHARED_MEMORY_FORMAT = '<d'
+SHARED_MEMORY_SIZE = 8
+
+
+class RateLimitState(RichAttributeErrorBaseType):
+    """
+    Rate limit state of a Discord api client, which is shared by every of its requests.
+    
+    The default implementation stores the state in the process' memory.
+    
+    Attributes
+    ----------
+    _global_rate_limit_expires_at : `float`
+        The time when global rate limit will expire in monotonic time.
+    """
+    __slots__ = ('_global_rate_limit_expires_at',)
+    
+    def __new__(cls):
+        """
+        Creates a new rate limit state.
+        """
+        self = object.__new__(cls)
+        self._global_rate_limit_expires_at = 0.0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the rate limit state's representation."""
+        return f'<{type(self).__name__} global_rate_limit_expires_at = {self.get_global_rate_limit_expires_at()!r}>'
+    
+    
+    def get_global_rate_limit_expires_at(self):
+        """
+        Returns when the global rate limit will expire.
+        
+        Returns
+        -------
+        global_rate_limit_expires_at : `float`
+            Monotonic time.
+        """
+        return self._global_rate_limit_expires_at
+    
+    
+    def set_global_rate_limit_expires_at(self, global_rate_limit_expires_at):
+        """
+        Sets when the global rate limit will expire.
+        
+        Parameters
+        ----------
+        global_rate_limit_expires_at : `float`
+            Monotonic time.
+        """
+        self._global_rate_limit_expires_at = global_rate_limit_expires_at
+    
+    
+    def close(self):
+        """
+        Releases the resources used by the rate limit state.
+        """
+        pass
+
+
+class RateLimitStateSharedMemory(RateLimitState):
+    """
+    Rate limit state shared by the processes of the same host through a memory mapped file.
+    
+    Processes using the same token should use the same file, so if one of them hits the global rate limit, the others
+    will wait as well. The expiration is stored in wall clock time, because the monotonic clock of the processes might
+    differ.
+    
+    Setting the expiration locks the file, so a process cannot overwrite an other one's later expiration with an
+    earlier one. On platforms without `fcntl` (windows) the file is not locked and a concurrent earlier expiration can
+    overwrite a later one. This is accepted, since the next request hitting the global rate limit sets it again.
+    
+    Attributes
+    ----------
+    _file_descriptor : `int`
+        File descriptor of the shared file. Used for locking. `-1` if the state is closed.
+    _global_rate_limit_expires_at : `float`
+        The time when global rate limit will expire in monotonic time. Used after the state is closed.
+    _memory : `None | mmap`
+        The shared memory.
+    path : `str`
+        Path to the shared file.
+    """
+    __slots__ = ('_file_descriptor', '_memory', 'path')
+    
+    def __new__(cls, path):
+        """
+        Creates a new shared memory rate limit state.
+        
+        Parameters
+        ----------
+        path : `str`
+            Path to the shared file. Created if not yet exists.
+        
+        Raises
+        ------
+        OSError
+            - If the file cannot be opened.
+        """
+        file_descriptor = open_file_descriptor(path, O_RDWR | O_CREAT, 0o600)
+        try:
+            if fstat(file_descriptor).st_size < SHARED_MEMORY_SIZE:
+                ftruncate(file_descriptor, SHARED_MEMORY_SIZE)
+            
+            memory = mmap(file_descriptor, SHARED_MEMORY_SIZE)
+        except:
+            close_file_descriptor(file_descriptor)
+            raise
+        
+        self = object.__new__(cls)
+        self._file_descriptor = file_descriptor
+        self._global_rate_limit_expires_at = 0.0
+        self._memory = memory
+        self.path = path
+        return self
+    
+    
+    @copy_docs(RateLimitState.get_global_rate_limit_expires_at)
+    def get_global_rate_limit_expires_at(self):
+        memory = self._memory
+        if memory is None:
+            return self._global_rate_limit_expires_at
+        
+        expires_at, = unpack_from(SHARED_MEMORY_FORMAT, memory, 0)
+        if not expires_at:
+            return 0.0
+        
+        return LOOP_TIME() + (expires_at - time_now())
+    
+    
+    @copy_docs(RateLimitState.set_global_rate_limit_expires_at)
+    def set_global_rate_limit_expires_at(self, global_rate_limit_expires_at):
+        self._global_rate_limit_expires_at = global_rate_limit_expires_at
+        
+        memory = self._memory
+        if memory is None:
+            return
+        
+        expires_at = time_now() + (global_rate_limit_expires_at - LOOP_TIME())
+        
+        file_descriptor = self._file_descriptor
+        if (flock is not None):
+            flock(file_descriptor, LOCK_EX)
+        
+        try:
+            # Another process might have set a later expiration meanwhile.
+            if unpack_from(SHARED_MEMORY_FORMAT, memory, 0)[0] < expires_at:
+                pack_into(SHARED_MEMORY_FORMAT, memory, 0, expires_at)
+        finally:
+            if (flock is not None):
+                flock(file_descriptor, LOCK_UN)
+    
+    
+    @copy_docs(RateLimitState.close)
+    def close(self):
+        memory = self._memory
+        if (memory is not None):
+            self._global_rate_limit_expires_at = self.get_global_rate_limit_expires_at()
+            self._memory = None
+            memory.close()
+            
+            file_descriptor = self._file_descriptor
+            self._file_descriptor = -1
+            close_file_descriptor(file_descriptor)
+
+
+def create_rate_limit_state(token):
+    """
+    Creates the default rate limit state for the given token.
+    
+    If `HATA_RATE_LIMIT_STATE_DIRECTORY` is set, the state is shared with the other processes using the same token.
+    
+    Parameters
+    ----------
+    token : `str`
+        The token of the respective client.
+    
+    Returns
+    -------
+    rate_limit_state : ``RateLimitState``
+    """
+    if RATE_LIMIT_STATE_DIRECTORY is None:
+        return RateLimitState()
+    
+    # Never store the token itself.
+    path = join_paths(RATE_LIMIT_STATE_DIRECTORY, f'{sha256(token.encode()).hexdigest()[:32]}.global')
+    
+    try:
+        makedirs(RATE_LIMIT_STATE_DIRECTORY, exist_ok = True)
+        return RateLimitStateSharedMemory(path)
+    except OSError as exception:
+        warn(
+            f'Could not create shared rate limit state at {path!r}, using in-process state instead: {exception!r}',
+            RuntimeWarning,
+        )
+        return RateLimitState()
+
+
+def _iter_rate_limit_groups():
+    """
+    Iterates over the named rate limit groups which can learn their size.
+    
+    This function is an iterable generator.
+    
+    Yields
+    ------
+    name : `str`
+        The rate limit group's name.
+    rate_limit_group : ``RateLimitGroup``
+        The rate limit group.
+    """
+    for name, rate_limit_group in vars(RATE_LIMIT_GROUPS).items():
+        if isinstance(rate_limit_group, RateLimitGroup) and rate_limit_group.group_id:
+            yield name, rate_limit_group
+
+
+class RateLimitGroupSnapshot(RichAttributeErrorBaseType):
+    """
+    On-disk snapshot of the learned rate limit group sizes.
+    
+    The snapshot is loaded when created, so after a restart the rate limit groups do not need to relearn their size.
+    Changes are saved after a short delay, merged into the file's current content, so processes sharing the file do
+    not overwrite each other's entries. Clients save the pending changes when disconnecting as well.
+    
+    Attributes
+    ----------
+    _group_names : `None | dict<int, str>`
+        Rate limit group identifier to name relation. Built when first required.
+    _save_handle : `None | TimerHandle`
+        Handle of the scheduled save.
+    changed : `set<str>`
+        The names of the rate limit groups changed since the last save.
+    path : `None | str`
+        Path to the snapshot file. If `None`, the snapshot is disabled.
+    """
+    __slots__ = ('_group_names', '_save_handle', 'changed', 'path')
+    
+    def __new__(cls, path):
+        """
+        Creates a new rate limit group snapshot and loads it.
+        
+        Parameters
+        ----------
+        path : `None | str`
+            Path to the snapshot file. If `None`, the snapshot is disabled.
+        """
+        self = object.__new__(cls)
+        self._group_names = None
+        self._save_handle = None
+        self.changed = set()
+        self.path = path
+        self.load()
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the rate limit group snapshot's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' path = ')
+        repr_parts.append(repr(self.path))
+        
+        repr_parts.append(', changed = ')
+        repr_parts.append(repr(len(self.changed)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def _read(self):
+        """
+        Reads the snapshot's file.
+        
+        Returns
+        -------
+        groups : `dict<str, dict<str, object>>`
+        """
+        try:
+            with open(self.path, 'r') as file:
+                data = from_json(file.read())
+        except (OSError, ValueError):
+            return {}
+        
+        if (not isinstance(data, dict)) or (data.get('version', None) != RATE_LIMIT_GROUP_SNAPSHOT_VERSION):
+            return {}
+        
+        groups = data.get('groups', None)
+        if not isinstance(groups, dict):
+            return {}
+        
+        return groups
+    
+    
+    def load(self):
+        """
+        Loads the snapshot and applies it on the rate limit groups, which did not learn their size yet.
+        """
+        if self.path is None:
+            return
+        
+        groups = self._read()
+        if not groups:
+            return
+        
+        for name, rate_limit_group in _iter_rate_limit_groups():
+            try:
+                group_data = groups[name]
+                size = group_data['size']
+            except (KeyError, TypeError):
+                continue
+            
+            if (not isinstance(size, int)) or (size == UNLIMITED_SIZE_VALUE):
+                continue
+            
+            # Do not overwrite sizes learned meanwhile.
+            if rate_limit_group.size not in (0, -1):
+                continue
+            
+            rate_limit_group.size = size
+    
+    
+    def update(self, rate_limit_group):
+        """
+        Called when a rate limit group's size is changed. Schedules saving the snapshot.
+        
+        Parameters
+        ----------
+        rate_limit_group : ``RateLimitGroup``
+            The changed rate limit group.
+        """
+        if self.path is None:
+            return
+        
+        group_names = self._group_names
+        if group_names is None:
+            group_names = {}
+            for name, group in _iter_rate_limit_groups():
+                group_names.setdefault(group.group_id, name)
+            
+            self._group_names = group_names
+        
+        name = group_names.get(rate_limit_group.group_id, None)
+        if name is None:
+            return
+        
+        self.changed.add(name)
+        
+        if self._save_handle is None:
+            self._save_handle = KOKORO.call_after(RATE_LIMIT_GROUP_SNAPSHOT_SAVE_DELAY, type(self).save, self)
+    
+    
+    def save(self):
+        """
+        Saves the changed rate limit groups into the snapshot's file.
+        """
+        save_handle = self._save_handle
+        if (save_handle is not None):
+            save_handle.cancel()
+            self._save_handle = None
+        
+        changed = self.changed
+        if (self.path is None) or (not changed):
+            return
+        
+        groups = self._read()
+        for name, rate_limit_group in _iter_rate_limit_groups():
+            if name in changed:
+                groups[name] = {
+                    'size': rate_limit_group.size,
+                }
+        
+        changed.clear()
+        
+        temporary_path = f'{self.path}.{getpid()}.tmp'
+        try:
+            makedirs(get_directory_name(self.path), exist_ok = True)
+            with open(temporary_path, 'w') as file:
+                file.write(to_json({'groups': groups, 'version': RATE_LIMIT_GROUP_SNAPSHOT_VERSION}))
+            
+            replace_file(temporary_path, self.path)
+        except OSError as exception:
+            warn(f'Could not save rate limit group snapshot to {self.path!r}: {exception!r}', RuntimeWarning)
+
+
+RATE_LIMIT_GROUP_SNAPSHOT = RateLimitGroupSnapshot(
+    None if RATE_LIMIT_STATE_DIRECTORY is None else
+    join_paths(RATE_LIMIT_STATE_DIRECTORY, RATE_LIMIT_GROUP_SNAPSHOT_FILE_NAME)
+)
+
+export(RATE_LIMIT_GROUP_SNAPSHOT, 'RATE_LIMIT_GROUP_SNAPSHOT')
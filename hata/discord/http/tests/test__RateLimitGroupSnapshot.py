@@ -0,0 +1,95 @@
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+import vampytest
+
+from .. import rate_limit_groups as RATE_LIMIT_GROUPS
+from ..rate_limit_state import RateLimitGroupSnapshot
+
+
+def test__RateLimitGroupSnapshot__disabled():
+    """
+    Tests whether ``RateLimitGroupSnapshot`` works as intended.
+    
+    Case: disabled.
+    """
+    rate_limit_group_snapshot = RateLimitGroupSnapshot(None)
+    rate_limit_group_snapshot.update(RATE_LIMIT_GROUPS.client_edit)
+    
+    vampytest.assert_eq(rate_limit_group_snapshot.changed, set())
+    vampytest.assert_instance(repr(rate_limit_group_snapshot), str)
+
+
+def test__RateLimitGroupSnapshot__save_and_load():
+    """
+    Tests whether ``RateLimitGroupSnapshot.save`` and ``.load`` works as intended.
+    """
+    rate_limit_group = RATE_LIMIT_GROUPS.client_edit
+    original_size = rate_limit_group.size
+    
+    try:
+        with TemporaryDirectory() as directory_path:
+            path = join_paths(directory_path, 'rate_limit_groups.json')
+            
+            rate_limit_group_snapshot = RateLimitGroupSnapshot(path)
+            rate_limit_group.size = 5
+            rate_limit_group_snapshot.update(rate_limit_group)
+            vampytest.assert_eq(rate_limit_group_snapshot.changed, {'client_edit'})
+            
+            rate_limit_group_snapshot.save()
+            vampytest.assert_eq(rate_limit_group_snapshot.changed, set())
+            
+            # Simulate restart.
+            rate_limit_group.size = 0
+            rate_limit_group_snapshot = RateLimitGroupSnapshot(path)
+            
+            vampytest.assert_eq(rate_limit_group.size, 5)
+    
+    finally:
+        rate_limit_group.size = original_size
+
+
+def test__RateLimitGroupSnapshot__load__learned():
+    """
+    Tests whether ``RateLimitGroupSnapshot.load`` works as intended.
+    
+    Case: size learned meanwhile.
+    """
+    rate_limit_group = RATE_LIMIT_GROUPS.client_edit
+    original_size = rate_limit_group.size
+    
+    try:
+        with TemporaryDirectory() as directory_path:
+            path = join_paths(directory_path, 'rate_limit_groups.json')
+            with open(path, 'w') as file:
+                file.write('{"version": 1, "groups": {"client_edit": {"size": 5}}}')
+            
+            rate_limit_group.size = 2
+            RateLimitGroupSnapshot(path)
+            vampytest.assert_eq(rate_limit_group.size, 2)
+    
+    finally:
+        rate_limit_group.size = original_size
+
+
+def test__RateLimitGroupSnapshot__load__invalid():
+    """
+    Tests whether ``RateLimitGroupSnapshot.load`` works as intended.
+    
+    Case: invalid file.
+    """
+    rate_limit_group = RATE_LIMIT_GROUPS.client_edit
+    original_size = rate_limit_group.size
+    
+    try:
+        with TemporaryDirectory() as directory_path:
+            path = join_paths(directory_path, 'rate_limit_groups.json')
+            with open(path, 'w') as file:
+                file.write('koishi')
+            
+            rate_limit_group.size = 0
+            RateLimitGroupSnapshot(path)
+            vampytest.assert_eq(rate_limit_group.size, 0)
+    
+    finally:
+        rate_limit_group.size = original_size
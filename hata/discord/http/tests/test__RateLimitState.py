@@ -0,0 +1,155 @@
+from os import O_RDWR, close as close_file_descriptor, open as open_file_descriptor
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+from threading import Thread
+
+import vampytest
+from scarletio import LOOP_TIME
+
+from ..rate_limit_state import RateLimitState, RateLimitStateSharedMemory, flock
+
+
+def test__RateLimitState__new():
+    """
+    Tests whether ``RateLimitState.__new__`` works as intended.
+    """
+    rate_limit_state = RateLimitState()
+    vampytest.assert_instance(rate_limit_state, RateLimitState)
+    vampytest.assert_eq(rate_limit_state.get_global_rate_limit_expires_at(), 0.0)
+
+
+def test__RateLimitState__repr():
+    """
+    Tests whether ``RateLimitState.__repr__`` works as intended.
+    """
+    rate_limit_state = RateLimitState()
+    
+    output = repr(rate_limit_state)
+    vampytest.assert_instance(output, str)
+
+
+def test__RateLimitState__set_global_rate_limit_expires_at():
+    """
+    Tests whether ``RateLimitState.set_global_rate_limit_expires_at`` works as intended.
+    """
+    global_rate_limit_expires_at = 123.5
+    
+    rate_limit_state = RateLimitState()
+    rate_limit_state.set_global_rate_limit_expires_at(global_rate_limit_expires_at)
+    vampytest.assert_eq(rate_limit_state.get_global_rate_limit_expires_at(), global_rate_limit_expires_at)
+
+
+def test__RateLimitStateSharedMemory__shared():
+    """
+    Tests whether ``RateLimitStateSharedMemory`` shares the global rate limit between its instances.
+    """
+    with TemporaryDirectory() as directory_path:
+        path = join_paths(directory_path, 'koishi.global')
+        
+        rate_limit_state_0 = RateLimitStateSharedMemory(path)
+        rate_limit_state_1 = RateLimitStateSharedMemory(path)
+        
+        try:
+            vampytest.assert_eq(rate_limit_state_1.get_global_rate_limit_expires_at(), 0.0)
+            
+            global_rate_limit_expires_at = LOOP_TIME() + 20.0
+            rate_limit_state_0.set_global_rate_limit_expires_at(global_rate_limit_expires_at)
+            
+            output = rate_limit_state_1.get_global_rate_limit_expires_at()
+            vampytest.assert_instance(output, float)
+            vampytest.assert_true(abs(output - global_rate_limit_expires_at) < 1.0)
+            
+            # Earlier expiration should not overwrite the later one.
+            rate_limit_state_1.set_global_rate_limit_expires_at(LOOP_TIME() + 1.0)
+            output = rate_limit_state_0.get_global_rate_limit_expires_at()
+            vampytest.assert_true(abs(output - global_rate_limit_expires_at) < 1.0)
+        
+        finally:
+            rate_limit_state_0.close()
+            rate_limit_state_1.close()
+
+
+def test__RateLimitStateSharedMemory__set_global_rate_limit_expires_at__out_of_order():
+    """
+    Tests whether ``RateLimitStateSharedMemory.set_global_rate_limit_expires_at`` works as intended.
+    
+    Case: two states sharing a file set expirations out of order.
+    """
+    with TemporaryDirectory() as directory_path:
+        path = join_paths(directory_path, 'koishi.global')
+        
+        rate_limit_state_0 = RateLimitStateSharedMemory(path)
+        rate_limit_state_1 = RateLimitStateSharedMemory(path)
+        
+        try:
+            now = LOOP_TIME()
+            for rate_limit_state, global_rate_limit_expires_at in (
+                (rate_limit_state_0, now + 10.0),
+                (rate_limit_state_1, now + 30.0),
+                (rate_limit_state_0, now + 20.0),
+                (rate_limit_state_1, now + 5.0),
+            ):
+                rate_limit_state.set_global_rate_limit_expires_at(global_rate_limit_expires_at)
+            
+            for rate_limit_state in (rate_limit_state_0, rate_limit_state_1):
+                output = rate_limit_state.get_global_rate_limit_expires_at()
+                vampytest.assert_true(abs(output - (now + 30.0)) < 1.0)
+        
+        finally:
+            rate_limit_state_0.close()
+            rate_limit_state_1.close()
+
+
+@vampytest.skip_if(flock is None)
+def test__RateLimitStateSharedMemory__set_global_rate_limit_expires_at__locked():
+    """
+    Tests whether ``RateLimitStateSharedMemory.set_global_rate_limit_expires_at`` works as intended.
+    
+    Case: waits for the file's lock held by an other process.
+    """
+    from fcntl import LOCK_EX, LOCK_UN
+    
+    with TemporaryDirectory() as directory_path:
+        path = join_paths(directory_path, 'koishi.global')
+        rate_limit_state = RateLimitStateSharedMemory(path)
+        
+        # A separate open file acts as an other process.
+        file_descriptor = open_file_descriptor(path, O_RDWR)
+        try:
+            flock(file_descriptor, LOCK_EX)
+            
+            global_rate_limit_expires_at = LOOP_TIME() + 20.0
+            thread = Thread(
+                target = rate_limit_state.set_global_rate_limit_expires_at, args = (global_rate_limit_expires_at,)
+            )
+            thread.start()
+            
+            thread.join(0.1)
+            vampytest.assert_true(thread.is_alive())
+            vampytest.assert_eq(rate_limit_state.get_global_rate_limit_expires_at(), 0.0)
+            
+            flock(file_descriptor, LOCK_UN)
+            thread.join(5.0)
+            vampytest.assert_false(thread.is_alive())
+            
+            output = rate_limit_state.get_global_rate_limit_expires_at()
+            vampytest.assert_true(abs(output - global_rate_limit_expires_at) < 1.0)
+        
+        finally:
+            close_file_descriptor(file_descriptor)
+            rate_limit_state.close()
+
+
+def test__RateLimitStateSharedMemory__close():
+    """
+    Tests whether ``RateLimitStateSharedMemory.close`` works as intended.
+    """
+    with TemporaryDirectory() as directory_path:
+        rate_limit_state = RateLimitStateSharedMemory(join_paths(directory_path, 'koishi.global'))
+        global_rate_limit_expires_at = LOOP_TIME() + 20.0
+        rate_limit_state.set_global_rate_limit_expires_at(global_rate_limit_expires_at)
+        
+        rate_limit_state.close()
+        
+        output = rate_limit_state.get_global_rate_limit_expires_at()
+        vampytest.assert_true(abs(output - global_rate_limit_expires_at) < 1.0)
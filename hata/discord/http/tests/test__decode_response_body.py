@@ -0,0 +1,34 @@
+import vampytest
+
+from ..api_client import _decode_response_body
+
+
+def _iter_options():
+    yield None, None, None
+    yield None, 'application/json', None
+    yield b'', None, ''
+    yield b'hey mister', 'text/plain', 'hey mister'
+    yield b'{"id":"202601010000"}', None, '{"id":"202601010000"}'
+    yield b'{"id":"202601010000"}', 'application/json', {'id': '202601010000'}
+    yield b'[{"name":"\\u00e9"}]', 'application/json; charset=utf-8', [{'name': '\xe9'}]
+    yield b'{"value":18446744073709551616}', 'application/json', {'value': 18446744073709551616}
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__decode_response_body(body, content_type_headers):
+    """
+    Tests whether ``_decode_response_body`` works as intended.
+    
+    Parameters
+    ----------
+    body : `None | bytes`
+        The response's body.
+    
+    content_type_headers : `None | str`
+        The response's content type.
+    
+    Returns
+    -------
+    output : `None | object`
+    """
+    return _decode_response_body(body, content_type_headers)
@@ -6,6 +6,7 @@ from ...bases import DiscordEntity, id_sort_key
 from ...core import CHANNELS, GUILDS, MESSAGES
 from ...embed import EXTRA_EMBED_TYPES, Embed
 from ...emoji import ReactionMapping
+from ...field_compiler import FieldTable
 from ...http.urls import build_message_jump_url
 from ...poll import Poll
 from ...precreate_helpers import process_precreate_parameters_and_raise_extra
@@ -92,6 +93,36 @@ PRECREATE_FIELDS = {
     'tts': ('tts', validate_tts),
 }
 
+# Fields parsed only from the payload by `Message._set_attributes`.
+MESSAGE_FIELDS = FieldTable(
+    'message',
+    (
+        ('type', parse_type),
+        ('activity', parse_activity),
+        ('application', parse_application),
+        ('application_id', parse_application_id),
+        ('attachments', parse_attachments),
+        ('call', parse_call),
+        ('components', parse_components),
+        ('content', parse_content),
+        ('edited_at', parse_edited_at),
+        ('embeds', parse_embeds),
+        ('flags', parse_flags),
+        ('mentioned_channels_cross_guild', parse_mentioned_channels_cross_guild),
+        ('mentioned_everyone', parse_mentioned_everyone),
+        ('mentioned_role_ids', parse_mentioned_role_ids),
+        ('nonce', parse_nonce),
+        ('pinned', parse_pinned),
+        ('referenced_message', parse_referenced_message),
+        ('role_subscription', parse_role_subscription),
+        ('shared_client_theme', parse_shared_client_theme),
+        ('soundboard_sounds', parse_soundboard_sounds),
+        ('stickers', parse_stickers),
+        ('tts', parse_tts),
+    ),
+    (),
+)
+
 
 @export
 class Message(DiscordEntity, immortal = True):
@@ -810,38 +841,17 @@ class Message(DiscordEntity, immortal = True):
         # Set default fields
         self.channel_id = channel_id
         self.guild_id = guild_id
-        self.type = parse_type(data)
         self.author = parse_author(data, guild_id, channel_id)
         
         # Parse and set extra fields
-        self.activity = parse_activity(data)
-        self.application = parse_application(data)
-        self.application_id = parse_application_id(data)
-        self.attachments = parse_attachments(data)
-        self.call = parse_call(data)
-        self.components = parse_components(data)
-        self.content = parse_content(data)
-        self.edited_at = parse_edited_at(data)
-        self.embeds = parse_embeds(data)
-        self.flags = parse_flags(data)
+        MESSAGE_FIELDS.parse(self, data)
         self.interaction = interaction = parse_interaction(data)
-        self.mentioned_channels_cross_guild = parse_mentioned_channels_cross_guild(data)
-        self.mentioned_everyone = parse_mentioned_everyone(data)
-        self.mentioned_role_ids = parse_mentioned_role_ids(data)
         self.mentioned_users = parse_mentioned_users(data, guild_id)
-        self.nonce = parse_nonce(data)
-        self.pinned = parse_pinned(data)
         self.poll = parse_poll(data, (None if creation else self.poll))
         self.reactions = parse_reactions(data, (None if creation else self.reactions))
-        self.referenced_message = parse_referenced_message(data)
         self.resolved = parse_resolved(data, guild_id = guild_id)
-        self.role_subscription = parse_role_subscription(data)
-        self.shared_client_theme = parse_shared_client_theme(data)
         self.snapshots = parse_snapshots(data, guild_id)
-        self.soundboard_sounds = parse_soundboard_sounds(data)
-        self.stickers = parse_stickers(data)
         self.thread = parse_thread(data, guild_id)
-        self.tts = parse_tts(data)
         
         # Postprocess
         if (interaction is not None):
@@ -1,8 +1,10 @@
 from .constants import *
 from .permission import *
+from .permission_cache_statistics import *
 
 
 __all__ = (
     *constants.__all__,
     *permission.__all__,
+    *permission_cache_statistics.__all__,
 )
@@ -0,0 +1,90 @@
+__all__ = ('PERMISSION_CACHE_STATISTICS', 'PermissionCacheStatistics',)
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class PermissionCacheStatistics(RichAttributeErrorBaseType):
+    """
+    Process wide counters of the guild and channel permission caches.
+    
+    Attributes
+    ----------
+    hits : `int`
+        The amount of permission lookups served from cache.
+    invalidations : `int`
+        The amount of times a non-empty permission cache was dropped.
+    misses : `int`
+        The amount of permission lookups when the permissions had to be calculated.
+    """
+    __slots__ = ('hits', 'invalidations', 'misses')
+    
+    def __new__(cls):
+        """
+        Creates a new permission cache statistics.
+        """
+        self = object.__new__(cls)
+        self.hits = 0
+        self.invalidations = 0
+        self.misses = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the permission cache statistics' representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' hits = ')
+        repr_parts.append(repr(self.hits))
+        
+        repr_parts.append(', misses = ')
+        repr_parts.append(repr(self.misses))
+        
+        repr_parts.append(', invalidations = ')
+        repr_parts.append(repr(self.invalidations))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    @property
+    def hit_rate(self):
+        """
+        Returns the ratio of the lookups served from cache.
+        
+        Returns
+        -------
+        hit_rate : `float`
+        """
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        
+        return self.hits / lookups
+    
+    
+    def clear(self):
+        """
+        Resets the counters.
+        """
+        self.hits = 0
+        self.invalidations = 0
+        self.misses = 0
+    
+    
+    def get_statistics(self):
+        """
+        Returns the counters.
+        
+        Returns
+        -------
+        statistics : `dict<str, int | float>`
+        """
+        return {
+            'hit_rate': self.hit_rate,
+            'hits': self.hits,
+            'invalidations': self.invalidations,
+            'misses': self.misses,
+        }
+
+
+PERMISSION_CACHE_STATISTICS = PermissionCacheStatistics()
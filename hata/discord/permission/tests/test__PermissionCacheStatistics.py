@@ -0,0 +1,90 @@
+import vampytest
+
+from ..permission_cache_statistics import PermissionCacheStatistics
+
+
+def _assert_fields_set(permission_cache_statistics):
+    """
+    Asserts whether every attributes are set of the given permission cache statistics.
+    
+    Parameters
+    ----------
+    permission_cache_statistics : ``PermissionCacheStatistics``
+        The instance to check.
+    """
+    vampytest.assert_instance(permission_cache_statistics, PermissionCacheStatistics)
+    vampytest.assert_instance(permission_cache_statistics.hits, int)
+    vampytest.assert_instance(permission_cache_statistics.invalidations, int)
+    vampytest.assert_instance(permission_cache_statistics.misses, int)
+
+
+def test__PermissionCacheStatistics__new():
+    """
+    Tests whether ``PermissionCacheStatistics.__new__`` works as intended.
+    """
+    permission_cache_statistics = PermissionCacheStatistics()
+    _assert_fields_set(permission_cache_statistics)
+    vampytest.assert_eq(permission_cache_statistics.get_statistics()['hits'], 0)
+
+
+def test__PermissionCacheStatistics__repr():
+    """
+    Tests whether ``PermissionCacheStatistics.__repr__`` works as intended.
+    """
+    permission_cache_statistics = PermissionCacheStatistics()
+    
+    output = repr(permission_cache_statistics)
+    vampytest.assert_instance(output, str)
+
+
+def _iter_options__hit_rate():
+    yield 0, 0, 0.0
+    yield 3, 1, 0.75
+    yield 0, 5, 0.0
+
+
+@vampytest._(vampytest.call_from(_iter_options__hit_rate()).returning_last())
+def test__PermissionCacheStatistics__hit_rate(hits, misses):
+    """
+    Tests whether ``PermissionCacheStatistics.hit_rate`` works as intended.
+    
+    Parameters
+    ----------
+    hits : `int`
+        Hits to set.
+    misses : `int`
+        Misses to set.
+    
+    Returns
+    -------
+    output : `float`
+    """
+    permission_cache_statistics = PermissionCacheStatistics()
+    permission_cache_statistics.hits = hits
+    permission_cache_statistics.misses = misses
+    
+    output = permission_cache_statistics.hit_rate
+    vampytest.assert_instance(output, float)
+    return output
+
+
+def test__PermissionCacheStatistics__clear():
+    """
+    Tests whether ``PermissionCacheStatistics.clear`` works as intended.
+    """
+    permission_cache_statistics = PermissionCacheStatistics()
+    permission_cache_statistics.hits = 2
+    permission_cache_statistics.invalidations = 3
+    permission_cache_statistics.misses = 4
+    
+    permission_cache_statistics.clear()
+    
+    vampytest.assert_eq(
+        permission_cache_statistics.get_statistics(),
+        {
+            'hit_rate': 0.0,
+            'hits': 0,
+            'invalidations': 0,
+            'misses': 0,
+        },
+    )
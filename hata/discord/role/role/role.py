@@ -5,6 +5,7 @@ from scarletio import copy_docs, export
 from ...bases import DiscordEntity, ICON_TYPE_NONE, IconSlot
 from ...color import Color
 from ...core import GUILDS, ROLES
+from ...field_compiler import FieldTable
 from ...http.urls import build_role_icon_url, build_role_icon_url_as
 from ...permission.constants import PERMISSION_KEY
 from ...permission.permission import PERMISSION_NONE, Permission
@@ -29,6 +30,32 @@ from .preinstanced import RoleManagerType
 
 ROLE_ICON = IconSlot('icon', 'icon')
 
+ROLE_FIELDS = FieldTable(
+    'role',
+    (
+        ('color', parse_color),
+        ('color_configuration', parse_color_configuration),
+        ('flags', parse_flags),
+        ('mentionable', parse_mentionable),
+        ('name', parse_name),
+        ('permissions', parse_permissions),
+        ('position', parse_position),
+        ('separated', parse_separated),
+        ('unicode_emoji', parse_unicode_emoji),
+    ),
+    (
+        ('color', put_color),
+        ('color_configuration', put_color_configuration),
+        ('flags', put_flags),
+        ('mentionable', put_mentionable),
+        ('name', put_name),
+        ('permissions', put_permissions),
+        ('position', put_position),
+        ('separated', put_separated),
+        ('unicode_emoji', put_unicode_emoji),
+    ),
+)
+
 
 PRECREATE_FIELDS = {
     'color': ('color', validate_color),
@@ -338,16 +365,8 @@ class Role(DiscordEntity, immortal = True):
         -------
         data : `dict<str, object>`
         """
-        data = {}
-        
-        # color
-        put_color(self.color, data, defaults)
-        
-        # color_configuration
-        put_color_configuration(self.color_configuration, data, defaults)
-        
-        # flags
-        put_flags(self.flags, data, defaults)
+        # color, color_configuration, flags, mentionable, name, permissions, position, separated, unicode_emoji
+        data = ROLE_FIELDS.put(self, {}, defaults)
         
         # icon
         type(self).icon.put_into(self.icon, data, defaults, as_data = not include_internals)
@@ -360,24 +379,6 @@ class Role(DiscordEntity, immortal = True):
         if include_internals:
             put_manager((self.manager_type, self.manager_metadata), data, defaults)
         
-        # mentionable
-        put_mentionable(self.mentionable, data, defaults)
-        
-        # name
-        put_name(self.name, data, defaults)
-        
-        # permissions
-        put_permissions(self.permissions, data, defaults)
-        
-        # position
-        put_position(self.position, data, defaults)
-        
-        # separated
-        put_separated(self.separated, data, defaults)
-        
-        # unicode_emoji
-        put_unicode_emoji(self.unicode_emoji, data, defaults)
-        
         return data
     
     
@@ -392,17 +393,9 @@ class Role(DiscordEntity, immortal = True):
         data : `dict<str, object>`
             Received role data.
         """
-        self.color = parse_color(data)
-        self.color_configuration = parse_color_configuration(data)
-        self.flags = parse_flags(data)
+        ROLE_FIELDS.parse(self, data)
         self._set_icon(data)
         self.manager_type, self.manager_metadata = parse_manager(data)
-        self.mentionable = parse_mentionable(data)
-        self.name = parse_name(data)
-        self.permissions = parse_permissions(data)
-        self.position = parse_position(data)
-        self.separated = parse_separated(data)
-        self.unicode_emoji = parse_unicode_emoji(data)
 
     
     @classmethod
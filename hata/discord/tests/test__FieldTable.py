@@ -0,0 +1,227 @@
+from datetime import datetime as DateTime, timezone as TimeZone
+
+import vampytest
+
+from ..color import Color
+from ..field_compiler import FieldTable, render_field_parser, render_field_putter
+from ..field_parsers import (
+    bool_parser_factory, entity_id_array_parser_factory, entity_id_parser_factory, flag_parser_factory,
+    force_string_parser_factory, nullable_date_time_parser_factory, nullable_string_parser_factory
+)
+from ..field_putters import (
+    bool_optional_putter_factory, entity_id_putter_factory, flag_optional_putter_factory, force_string_putter_factory,
+    nullable_date_time_optional_putter_factory, nullable_string_putter_factory
+)
+from ..utils import datetime_to_timestamp
+
+
+class Entity:
+    """
+    Entity to set the fields of.
+    """
+    __slots__ = ('color', 'created_at', 'description', 'id', 'name', 'pinned', 'role_ids', 'special')
+
+
+def parse_special(data):
+    """
+    Parser without a template.
+    
+    Parameters
+    ----------
+    data : `dict<str, object>`
+        Entity data.
+    
+    Returns
+    -------
+    special : `int`
+    """
+    return data.get('special', 0) * 2
+
+
+def put_special(special, data, defaults):
+    """
+    Putter without a template.
+    
+    Parameters
+    ----------
+    special : `int`
+        The value to put.
+    data : `dict<str, object>`
+        Entity data.
+    defaults : `bool`
+        Whether default field values should be included.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    data['special'] = special // 2
+    return data
+
+
+PARSERS = (
+    ('color', flag_parser_factory('color', Color)),
+    ('created_at', nullable_date_time_parser_factory('created_at')),
+    ('description', nullable_string_parser_factory('description')),
+    ('id', entity_id_parser_factory('id')),
+    ('name', force_string_parser_factory('name')),
+    ('pinned', bool_parser_factory('pinned', False)),
+    ('role_ids', entity_id_array_parser_factory('role_ids')),
+    ('special', parse_special),
+)
+
+
+PUTTERS = (
+    ('color', flag_optional_putter_factory('color', Color())),
+    ('created_at', nullable_date_time_optional_putter_factory('created_at')),
+    ('description', nullable_string_putter_factory('description')),
+    ('id', entity_id_putter_factory('id')),
+    ('name', force_string_putter_factory('name')),
+    ('pinned', bool_optional_putter_factory('pinned', False)),
+    ('special', put_special),
+)
+
+
+def _iter_options__parse():
+    created_at = DateTime(2016, 5, 24, 14, 27, 42, tzinfo = TimeZone.utc)
+    
+    yield {}
+    yield {
+        'color': 123,
+        'created_at': datetime_to_timestamp(created_at),
+        'description': 'koishi',
+        'id': '202610170000',
+        'name': 'satori',
+        'pinned': True,
+        'role_ids': ['202610170002', '202610170001'],
+        'special': 4,
+    }
+    yield {
+        'color': None,
+        'created_at': None,
+        'description': '',
+        'id': None,
+        'name': None,
+        'pinned': None,
+        'role_ids': [],
+    }
+
+
+@vampytest.call_from(_iter_options__parse())
+def test__FieldTable__parse(input_data):
+    """
+    Tests whether ``FieldTable.parse`` works as intended.
+    
+    Parameters
+    ----------
+    input_data : `dict<str, object>`
+        Data to parse.
+    """
+    field_table = FieldTable('test', PARSERS, PUTTERS)
+    
+    entity = Entity()
+    field_table.parse(entity, input_data)
+    
+    for attribute_name, parser in PARSERS:
+        vampytest.assert_eq(getattr(entity, attribute_name), parser(input_data))
+
+
+def _iter_options__put():
+    yield (
+        {},
+        False,
+    )
+    yield (
+        {},
+        True,
+    )
+    yield (
+        {
+            'color': 123,
+            'created_at': datetime_to_timestamp(DateTime(2016, 5, 24, 14, 27, 42, tzinfo = TimeZone.utc)),
+            'description': 'koishi',
+            'id': '202610170000',
+            'name': 'satori',
+            'pinned': True,
+            'special': 4,
+        },
+        False,
+    )
+
+
+@vampytest.call_from(_iter_options__put())
+def test__FieldTable__put(input_data, defaults):
+    """
+    Tests whether ``FieldTable.put`` works as intended.
+    
+    Parameters
+    ----------
+    input_data : `dict<str, object>`
+        Data to create the entity from.
+    defaults : `bool`
+        Whether default field values should be included.
+    """
+    field_table = FieldTable('test', PARSERS, PUTTERS)
+    
+    entity = Entity()
+    field_table.parse(entity, input_data)
+    
+    expected_output = {}
+    for attribute_name, putter in PUTTERS:
+        putter(getattr(entity, attribute_name), expected_output, defaults)
+    
+    output = field_table.put(entity, {}, defaults)
+    vampytest.assert_eq(output, expected_output)
+
+
+def test__FieldTable__compile():
+    """
+    Tests whether ``FieldTable`` compiles its functions only once.
+    """
+    field_table = FieldTable('test', PARSERS, PUTTERS)
+    
+    field_table.parse(Entity(), {})
+    parse = field_table.parse
+    field_table.parse(Entity(), {})
+    vampytest.assert_is(field_table.parse, parse)
+    
+    put = field_table.compile_put()
+    vampytest.assert_is(field_table.put, put)
+
+
+def test__FieldTable__repr():
+    """
+    Tests whether ``FieldTable.__repr__`` works as intended.
+    """
+    field_table = FieldTable('test', PARSERS, PUTTERS)
+    
+    output = repr(field_table)
+    vampytest.assert_instance(output, str)
+
+
+def test__render_field_parser():
+    """
+    Tests whether ``render_field_parser`` works as intended.
+    """
+    source, namespace = render_field_parser('parse_test_fields', PARSERS)
+    vampytest.assert_instance(source, str)
+    vampytest.assert_instance(namespace, dict)
+    
+    # inlined ones do not call their parser, the others do.
+    vampytest.assert_in('data.get(\'id\', None)', source)
+    vampytest.assert_in('parser_7(data)', source)
+    
+    source, namespace = render_field_parser('parse_test_fields', PARSERS, inline = False)
+    vampytest.assert_in('parser_3(data)', source)
+
+
+def test__render_field_putter():
+    """
+    Tests whether ``render_field_putter`` works as intended.
+    """
+    source, namespace = render_field_putter('put_test_fields', PUTTERS)
+    vampytest.assert_instance(source, str)
+    vampytest.assert_instance(namespace, dict)
+    
+    vampytest.assert_in('data[\'name\'] = value', source)
+    vampytest.assert_in('putter_6(entity.special, data, defaults)', source)
@@ -0,0 +1,24 @@
+import vampytest
+
+from ..core import BUILTIN_EMOJIS, BuiltinEmojiTable, LazyBuiltinEmojiTable, UNICODE_TO_EMOJI
+
+
+def test__LazyBuiltinEmojiTable__load():
+    """
+    Tests whether the builtin emojis are created when a builtin emoji table is accessed.
+    """
+    emoji = BUILTIN_EMOJIS['heart']
+    
+    vampytest.assert_is(type(BUILTIN_EMOJIS), BuiltinEmojiTable)
+    vampytest.assert_is(type(UNICODE_TO_EMOJI), BuiltinEmojiTable)
+    vampytest.assert_is(UNICODE_TO_EMOJI[emoji.unicode], emoji)
+
+
+def test__LazyBuiltinEmojiTable__methods():
+    """
+    Tests whether ``LazyBuiltinEmojiTable`` overwrites the `dict` methods with the same names.
+    """
+    for method_name in ('__contains__', '__getitem__', '__iter__', '__len__', 'get', 'items', 'keys', 'values'):
+        method = getattr(LazyBuiltinEmojiTable, method_name)
+        vampytest.assert_is_not(method, getattr(dict, method_name))
+        vampytest.assert_eq(method.__name__, method_name)
@@ -2,6 +2,9 @@ from .constants import *
 from .fields import *
 from .flags import *
 from .guild_profile import *
+from .guild_profile_mapping import *
+from .guild_profile_table import *
+from .guild_profile_view import *
 from .utils import *
 
 
@@ -10,5 +13,8 @@ __all__ = (
     *fields.__all__,
     *flags.__all__,
     *guild_profile.__all__,
+    *guild_profile_mapping.__all__,
+    *guild_profile_table.__all__,
+    *guild_profile_view.__all__,
     *utils.__all__,
 )
@@ -0,0 +1,347 @@
+__all__ = ('GuildProfileMapping',)
+
+from scarletio import RichAttributeErrorBaseType
+
+from ...core import USERS
+
+from .guild_profile_table import GUILD_PROFILE_TABLES, get_guild_profile_table
+from .guild_profile_view import GuildProfileView
+
+
+class GuildProfileMapping(RichAttributeErrorBaseType):
+    """
+    Guild identifier to guild profile mapping of a user, storing the guild profiles in their guild's
+    ``GuildProfileTable``. Used instead of a `dict` when columnar guild profiles are enabled.
+    
+    Looking up a guild profile returns a ``GuildProfileView`` bound to the table. Removing a guild profile returns a
+    detached ``GuildProfile``.
+    
+    Attributes
+    ----------
+    guild_ids : `tuple<int>`
+        The guilds' identifiers where the user has guild profile.
+    
+    user_id : `int`
+        The respective user's identifier.
+    """
+    __slots__ = ('guild_ids', 'user_id')
+    
+    def __new__(cls, user_id):
+        """
+        Creates a new guild profile mapping.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        """
+        self = object.__new__(cls)
+        self.guild_ids = ()
+        self.user_id = user_id
+        return self
+    
+    
+    def __del__(self):
+        """Removes the user's guild profiles from the tables, except the ones used by the user's new mapping."""
+        user_id = self.user_id
+        guild_profiles = getattr(USERS.get(user_id, None), 'guild_profiles', None)
+        if isinstance(guild_profiles, GuildProfileMapping):
+            guild_ids_in_use = guild_profiles.guild_ids
+        else:
+            guild_ids_in_use = ()
+        
+        for guild_id in self.guild_ids:
+            if guild_id not in guild_ids_in_use:
+                _remove_row(guild_id, user_id)
+    
+    
+    def __repr__(self):
+        """Returns the guild profile mapping's representation."""
+        return ''.join([
+            '<', type(self).__name__,
+            ' user_id = ', repr(self.user_id),
+            ', guild_ids = ', repr(self.guild_ids),
+            '>',
+        ])
+    
+    
+    def __len__(self):
+        """Returns the amount of guild profiles of the user."""
+        return len(self.guild_ids)
+    
+    
+    def __iter__(self):
+        """Iterates over the guild identifiers."""
+        return iter(self.guild_ids)
+    
+    
+    def __contains__(self, guild_id):
+        """Returns whether the user has guild profile in the given guild."""
+        return guild_id in self.guild_ids
+    
+    
+    def __getitem__(self, guild_id):
+        """
+        Returns the user's guild profile in the given guild.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The respective guild's identifier.
+        
+        Returns
+        -------
+        guild_profile : ``GuildProfileView``
+        
+        Raises
+        ------
+        KeyError
+            - If the user has no guild profile in the guild.
+        """
+        if guild_id not in self.guild_ids:
+            raise KeyError(guild_id)
+        
+        return GuildProfileView(GUILD_PROFILE_TABLES[guild_id], self.user_id)
+    
+    
+    def __setitem__(self, guild_id, guild_profile):
+        """
+        Stores the user's guild profile in the given guild.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The respective guild's identifier.
+        
+        guild_profile : ``GuildProfile``
+            The guild profile to store.
+        """
+        get_guild_profile_table(guild_id).add(self.user_id, guild_profile)
+        
+        guild_ids = self.guild_ids
+        if guild_id not in guild_ids:
+            self.guild_ids = (*guild_ids, guild_id)
+    
+    
+    def __delitem__(self, guild_id):
+        """
+        Removes the user's guild profile in the given guild.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The respective guild's identifier.
+        
+        Raises
+        ------
+        KeyError
+            - If the user has no guild profile in the guild.
+        """
+        guild_ids = self.guild_ids
+        if guild_id not in guild_ids:
+            raise KeyError(guild_id)
+        
+        self.guild_ids = tuple(iter_guild_id for iter_guild_id in guild_ids if iter_guild_id != guild_id)
+        _remove_row(guild_id, self.user_id)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two mappings contain the same guild profiles."""
+        if isinstance(other, type(self)):
+            other = dict(other.items())
+        
+        elif not isinstance(other, dict):
+            return NotImplemented
+        
+        return dict(self.items()) == other
+    
+    
+    __hash__ = None
+    
+    
+    def get(self, guild_id, default = None):
+        """
+        Returns the user's guild profile in the given guild.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The respective guild's identifier.
+        
+        default : `object` = `None`, Optional
+            Value to return if the user has no guild profile in the guild.
+        
+        Returns
+        -------
+        guild_profile : ``GuildProfileView | default``
+        """
+        if guild_id not in self.guild_ids:
+            return default
+        
+        return GuildProfileView(GUILD_PROFILE_TABLES[guild_id], self.user_id)
+    
+    
+    def pop(self, guild_id, *default):
+        """
+        Removes the user's guild profile in the given guild and returns it.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The respective guild's identifier.
+        
+        *default : `object`
+            Value to return if the user has no guild profile in the guild.
+        
+        Returns
+        -------
+        guild_profile : ``GuildProfile | default``
+        
+        Raises
+        ------
+        KeyError
+            - If the user has no guild profile in the guild and `default` is not given.
+        """
+        if guild_id not in self.guild_ids:
+            if default:
+                return default[0]
+            
+            raise KeyError(guild_id)
+        
+        guild_profile = GUILD_PROFILE_TABLES[guild_id].get_guild_profile(self.user_id)
+        del self[guild_id]
+        return guild_profile
+    
+    
+    def popitem(self):
+        """
+        Removes the last added guild profile of the user and returns it with its guild's identifier.
+        
+        Returns
+        -------
+        item : `(int, GuildProfile)`
+        
+        Raises
+        ------
+        KeyError
+            - If the user has no guild profiles.
+        """
+        guild_ids = self.guild_ids
+        if not guild_ids:
+            raise KeyError('popitem(): mapping is empty')
+        
+        guild_id = guild_ids[-1]
+        return guild_id, self.pop(guild_id)
+    
+    
+    def clear(self):
+        """
+        Removes all the guild profiles of the user.
+        """
+        guild_ids = self.guild_ids
+        self.guild_ids = ()
+        
+        user_id = self.user_id
+        for guild_id in guild_ids:
+            _remove_row(guild_id, user_id)
+    
+    
+    def copy(self):
+        """
+        Copies the guild profiles of the user into a `dict`.
+        
+        Returns
+        -------
+        new : `dict<int, GuildProfile>`
+        """
+        user_id = self.user_id
+        return {
+            guild_id: GUILD_PROFILE_TABLES[guild_id].get_guild_profile(user_id) for guild_id in self.guild_ids
+        }
+    
+    
+    def keys(self):
+        """
+        Returns the guild identifiers.
+        
+        Returns
+        -------
+        guild_ids : `tuple<int>`
+        """
+        return self.guild_ids
+    
+    
+    def values(self):
+        """
+        Iterates over the user's guild profiles.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        guild_profile : ``GuildProfileView``
+        """
+        user_id = self.user_id
+        for guild_id in self.guild_ids:
+            yield GuildProfileView(GUILD_PROFILE_TABLES[guild_id], user_id)
+    
+    
+    def items(self):
+        """
+        Iterates over the guild identifier - guild profile pairs of the user.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        item : ``(int, GuildProfileView)``
+        """
+        user_id = self.user_id
+        for guild_id in self.guild_ids:
+            yield guild_id, GuildProfileView(GUILD_PROFILE_TABLES[guild_id], user_id)
+
+
+def _remove_row(guild_id, user_id):
+    """
+    Removes the user's row from the guild's table. If the table gets empty, it removes itself as well.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The respective guild's identifier.
+    
+    user_id : `int`
+        The respective user's identifier.
+    """
+    table = GUILD_PROFILE_TABLES.get(guild_id, None)
+    if table is None:
+        return
+    
+    try:
+        table.remove(user_id)
+    except KeyError:
+        pass
+
+
+def discard_guild_profile_table(guild_id):
+    """
+    Removes the guild's table with every guild profile in it. Called when the guild is deleted, because not every
+    user with guild profile in it is in the guild's users.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The respective guild's identifier.
+    """
+    table = GUILD_PROFILE_TABLES.pop(guild_id, None)
+    if table is None:
+        return
+    
+    for user_id in table:
+        guild_profiles = getattr(USERS.get(user_id, None), 'guild_profiles', None)
+        if isinstance(guild_profiles, GuildProfileMapping):
+            guild_ids = guild_profiles.guild_ids
+            if guild_id in guild_ids:
+                guild_profiles.guild_ids = tuple(
+                    iter_guild_id for iter_guild_id in guild_ids if iter_guild_id != guild_id
+                )
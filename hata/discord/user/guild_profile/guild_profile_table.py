@@ -0,0 +1,472 @@
+__all__ = ('GuildProfileTable',)
+
+from array import array
+from datetime import datetime as DateTime, timedelta as TimeDelta, timezone as TimeZone
+
+from scarletio import RichAttributeErrorBaseType
+
+from ...bases import IconType
+
+from .flags import GuildProfileFlag
+from .guild_profile import GuildProfile
+
+
+GUILD_PROFILE_TABLES = {}
+
+JOINED_AT_EPOCH = DateTime(1970, 1, 1, tzinfo = TimeZone.utc)
+JOINED_AT_NONE = -(1 << 63)
+JOINED_AT_UNIT = TimeDelta(microseconds = 1)
+
+ROLE_IDS_CACHE_SIZE_MIN = 64
+
+SPARSE_FIELDS = (
+    ('avatar_decoration', None),
+    ('avatar_hash', 0),
+    ('avatar_type', IconType.none),
+    ('banner_hash', 0),
+    ('banner_type', IconType.none),
+    ('boosts_since', None),
+    ('pending', False),
+    ('timed_out_until', None),
+)
+
+
+class GuildProfileTable(RichAttributeErrorBaseType):
+    """
+    Stores the guild profiles of a guild's users in columns instead of an object for each.
+    
+    The frequently set fields are stored in arrays and lists indexed by the user's row. Role identifier tuples are
+    shared between the users having the same roles. The rarely set fields are only stored for the users who have them
+    set.
+    
+    Attributes
+    ----------
+    flags : `array<int>`
+        The guild profiles' flags.
+    
+    guild_id : `int`
+        The respective guild's identifier.
+    
+    joined_ats : `array<int>`
+        When the users joined the guild in microseconds since unix epoch. `JOINED_AT_NONE` if not known.
+    
+    nicks : `list<None | str>`
+        The users' nicks.
+    
+    role_ids : `list<None | tuple<int>>`
+        The users' role identifiers.
+    
+    role_ids_cache : `dict<tuple<int>, tuple<int>>`
+        Role identifier tuples to share.
+    
+    role_ids_cache_size_max : `int`
+        The size of ``.role_ids_cache`` after which it is compacted.
+    
+    rows : `dict<int, int>`
+        User identifier to row relation.
+    
+    sparse : `dict<int, dict<str, object>>`
+        The rarely set fields of the users who have them set in user identifier to field name to value relation.
+    
+    user_ids : `array<int>`
+        The users' identifiers.
+    """
+    __slots__ = (
+        'flags', 'guild_id', 'joined_ats', 'nicks', 'role_ids', 'role_ids_cache', 'role_ids_cache_size_max', 'rows',
+        'sparse', 'user_ids'
+    )
+    
+    def __new__(cls, guild_id):
+        """
+        Creates a new guild profile table.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The respective guild's identifier.
+        """
+        self = object.__new__(cls)
+        self.flags = array('Q')
+        self.guild_id = guild_id
+        self.joined_ats = array('q')
+        self.nicks = []
+        self.role_ids = []
+        self.role_ids_cache = {}
+        self.role_ids_cache_size_max = ROLE_IDS_CACHE_SIZE_MIN
+        self.rows = {}
+        self.sparse = {}
+        self.user_ids = array('Q')
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the guild profile table's representation."""
+        return ''.join([
+            '<', type(self).__name__,
+            ' guild_id = ', repr(self.guild_id),
+            ', length = ', repr(len(self.rows)),
+            '>',
+        ])
+    
+    
+    def __len__(self):
+        """Returns the amount of guild profiles in the table."""
+        return len(self.rows)
+    
+    
+    def __contains__(self, user_id):
+        """Returns whether the user has a guild profile in the table."""
+        return user_id in self.rows
+    
+    
+    def __iter__(self):
+        """
+        Iterates over the user identifiers in the table.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        user_id : `int`
+        """
+        yield from self.user_ids
+    
+    
+    def add(self, user_id, guild_profile):
+        """
+        Stores the given guild profile for the user. If the user is already in the table, overwrites its row.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        guild_profile : ``GuildProfile``
+            The guild profile to store.
+        """
+        # Read every field first, the profile can be a view of the same row.
+        field_values = [getattr(guild_profile, field_name) for field_name, default in SPARSE_FIELDS]
+        flags = guild_profile.flags
+        joined_at = guild_profile.joined_at
+        nick = guild_profile.nick
+        role_ids = guild_profile.role_ids
+        
+        rows = self.rows
+        if user_id not in rows:
+            rows[user_id] = len(self.user_ids)
+            self.flags.append(0)
+            self.joined_ats.append(JOINED_AT_NONE)
+            self.nicks.append(None)
+            self.role_ids.append(None)
+            self.user_ids.append(user_id)
+        
+        self.sparse.pop(user_id, None)
+        for (field_name, default), field_value in zip(SPARSE_FIELDS, field_values):
+            self.set_sparse(user_id, field_name, field_value, default)
+        
+        self.set_flags(user_id, flags)
+        self.set_joined_at(user_id, joined_at)
+        self.set_nick(user_id, nick)
+        self.set_role_ids(user_id, role_ids)
+    
+    
+    def remove(self, user_id):
+        """
+        Removes the user's guild profile from the table. The last row is moved into its place. If the table gets
+        empty, removes it from the registered tables as well.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        Raises
+        ------
+        KeyError
+            - If the user has no guild profile in the table.
+        """
+        row = self.rows.pop(user_id)
+        self.sparse.pop(user_id, None)
+        
+        user_ids = self.user_ids
+        last_user_id = user_ids.pop()
+        flags = self.flags.pop()
+        joined_at = self.joined_ats.pop()
+        nick = self.nicks.pop()
+        role_ids = self.role_ids.pop()
+        
+        if last_user_id != user_id:
+            user_ids[row] = last_user_id
+            self.flags[row] = flags
+            self.joined_ats[row] = joined_at
+            self.nicks[row] = nick
+            self.role_ids[row] = role_ids
+            self.rows[last_user_id] = row
+        
+        if not self.rows:
+            guild_id = self.guild_id
+            if GUILD_PROFILE_TABLES.get(guild_id, None) is self:
+                del GUILD_PROFILE_TABLES[guild_id]
+    
+    
+    def get_guild_profile(self, user_id):
+        """
+        Creates a guild profile from the user's row. The returned guild profile is not bound to the table.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        Returns
+        -------
+        guild_profile : ``GuildProfile``
+        
+        Raises
+        ------
+        KeyError
+            - If the user has no guild profile in the table.
+        """
+        guild_profile = GuildProfile._create_empty()
+        
+        for field_name, field_value in self.sparse.get(user_id, {}).items():
+            setattr(guild_profile, field_name, field_value)
+        
+        guild_profile.flags = self.get_flags(user_id)
+        guild_profile.joined_at = self.get_joined_at(user_id)
+        guild_profile.nick = self.get_nick(user_id)
+        guild_profile.role_ids = self.get_role_ids(user_id)
+        return guild_profile
+    
+    
+    def get_sparse(self, user_id, field_name, default):
+        """
+        Returns a rarely set field's value of the user.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        field_name : `str`
+            The field's name.
+        
+        default : `object`
+            Value to return if the field is not set.
+        
+        Returns
+        -------
+        field_value : `object`
+        """
+        field_values = self.sparse.get(user_id, None)
+        if field_values is None:
+            return default
+        
+        return field_values.get(field_name, default)
+    
+    
+    def set_sparse(self, user_id, field_name, field_value, default):
+        """
+        Sets a rarely set field's value of the user. If the value is the default, removes the field.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        field_name : `str`
+            The field's name.
+        
+        field_value : `object`
+            The value to set.
+        
+        default : `object`
+            The field's default value.
+        """
+        sparse = self.sparse
+        field_values = sparse.get(user_id, None)
+        
+        if field_value == default:
+            if (field_values is not None):
+                field_values.pop(field_name, None)
+                if not field_values:
+                    del sparse[user_id]
+            return
+        
+        if field_values is None:
+            field_values = {}
+            sparse[user_id] = field_values
+        
+        field_values[field_name] = field_value
+    
+    
+    def get_flags(self, user_id):
+        """
+        Returns the user's guild profile flags.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        Returns
+        -------
+        flags : ``GuildProfileFlag``
+        """
+        return GuildProfileFlag(self.flags[self.rows[user_id]])
+    
+    
+    def set_flags(self, user_id, flags):
+        """
+        Sets the user's guild profile flags.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        flags : ``GuildProfileFlag``
+            The flags to set.
+        """
+        self.flags[self.rows[user_id]] = flags
+    
+    
+    def get_joined_at(self, user_id):
+        """
+        Returns when the user joined the guild.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        Returns
+        -------
+        joined_at : `None | DateTime`
+        """
+        joined_at = self.joined_ats[self.rows[user_id]]
+        if joined_at == JOINED_AT_NONE:
+            return self.get_sparse(user_id, 'joined_at', None)
+        
+        return JOINED_AT_EPOCH + joined_at * JOINED_AT_UNIT
+    
+    
+    def set_joined_at(self, user_id, joined_at):
+        """
+        Sets when the user joined the guild. Date times not in utc are stored as rarely set fields to keep their
+        time zone.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        joined_at : `None | DateTime`
+            The date time to set.
+        """
+        if (joined_at is None) or (joined_at.tzinfo is not TimeZone.utc):
+            self.joined_ats[self.rows[user_id]] = JOINED_AT_NONE
+            self.set_sparse(user_id, 'joined_at', joined_at, None)
+            return
+        
+        self.joined_ats[self.rows[user_id]] = (joined_at - JOINED_AT_EPOCH) // JOINED_AT_UNIT
+        self.set_sparse(user_id, 'joined_at', None, None)
+    
+    
+    def get_nick(self, user_id):
+        """
+        Returns the user's nick.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        Returns
+        -------
+        nick : `None | str`
+        """
+        return self.nicks[self.rows[user_id]]
+    
+    
+    def set_nick(self, user_id, nick):
+        """
+        Sets the user's nick.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        nick : `None | str`
+            The nick to set.
+        """
+        self.nicks[self.rows[user_id]] = nick
+    
+    
+    def get_role_ids(self, user_id):
+        """
+        Returns the user's role identifiers.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        Returns
+        -------
+        role_ids : `None | tuple<int>`
+        """
+        return self.role_ids[self.rows[user_id]]
+    
+    
+    def set_role_ids(self, user_id, role_ids):
+        """
+        Sets the user's role identifiers. Equal tuples are shared between the users.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The respective user's identifier.
+        
+        role_ids : `None | tuple<int>`
+            The role identifiers to set.
+        """
+        if (role_ids is not None):
+            role_ids = self.role_ids_cache.setdefault(role_ids, role_ids)
+        
+        self.role_ids[self.rows[user_id]] = role_ids
+        
+        if len(self.role_ids_cache) > self.role_ids_cache_size_max:
+            self._compact_role_ids_cache()
+    
+    
+    def _compact_role_ids_cache(self):
+        """
+        Removes the role identifier tuples from ``.role_ids_cache``, which are not used anymore.
+        """
+        role_ids_cache = {role_ids: role_ids for role_ids in self.role_ids if (role_ids is not None)}
+        self.role_ids_cache = role_ids_cache
+        self.role_ids_cache_size_max = max(ROLE_IDS_CACHE_SIZE_MIN, len(role_ids_cache) << 1)
+
+
+def get_guild_profile_table(guild_id):
+    """
+    Returns the guild profile table of the given guild. If the guild has no table yet, creates one.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The respective guild's identifier.
+    
+    Returns
+    -------
+    table : ``GuildProfileTable``
+    """
+    try:
+        table = GUILD_PROFILE_TABLES[guild_id]
+    except KeyError:
+        table = GuildProfileTable(guild_id)
+        GUILD_PROFILE_TABLES[guild_id] = table
+    
+    return table
@@ -0,0 +1,156 @@
+__all__ = ('GuildProfileView',)
+
+from scarletio import copy_docs
+
+from ...bases import IconType
+
+from .guild_profile import GuildProfile
+from .guild_profile_table import GuildProfileTable
+
+
+def _column_property_factory(field_name, getter, setter):
+    """
+    Creates a property, which gets and sets a field of the guild profile view through its table.
+    
+    Parameters
+    ----------
+    field_name : `str`
+        The field's name.
+    
+    getter : `FunctionType`
+        Table method to get the field's value with.
+    
+    setter : `FunctionType`
+        Table method to set the field's value with.
+    
+    Returns
+    -------
+    field_property : `property`
+    """
+    def get_field(self):
+        return getter(self.table, self.user_id)
+    
+    def set_field(self, value):
+        setter(self.table, self.user_id, value)
+    
+    get_field.__name__ = field_name
+    set_field.__name__ = field_name
+    
+    return property(get_field, set_field)
+
+
+def _sparse_property_factory(field_name, default):
+    """
+    Creates a property, which gets and sets a rarely set field of the guild profile view through its table.
+    
+    Parameters
+    ----------
+    field_name : `str`
+        The field's name.
+    
+    default : `object`
+        The field's default value.
+    
+    Returns
+    -------
+    field_property : `property`
+    """
+    def get_field(self):
+        return self.table.get_sparse(self.user_id, field_name, default)
+    
+    def set_field(self, value):
+        self.table.set_sparse(self.user_id, field_name, value, default)
+    
+    get_field.__name__ = field_name
+    set_field.__name__ = field_name
+    
+    return property(get_field, set_field)
+
+
+class GuildProfileView(GuildProfile):
+    """
+    A guild profile stored in a ``GuildProfileTable``. Reading an attribute reads the respective table's row and
+    setting an attribute writes it.
+    
+    Views are created on access and are not kept. Removing the user from the table invalidates the view.
+    
+    Attributes
+    ----------
+    table : ``GuildProfileTable``
+        The table storing the guild profile.
+    
+    user_id : `int`
+        The respective user's identifier.
+    """
+    __slots__ = ('table', 'user_id')
+    
+    def __new__(cls, table, user_id):
+        """
+        Creates a new guild profile view.
+        
+        Parameters
+        ----------
+        table : ``GuildProfileTable``
+            The table storing the guild profile.
+        
+        user_id : `int`
+            The respective user's identifier.
+        """
+        self = object.__new__(cls)
+        self.table = table
+        self.user_id = user_id
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the guild profile view's representation."""
+        return ''.join(['<', type(self).__name__, ' user_id = ', repr(self.user_id), '>'])
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two guild profiles are equal."""
+        if not isinstance(other, GuildProfile):
+            return NotImplemented
+        
+        if isinstance(other, GuildProfileView):
+            other = other.materialize()
+        
+        return self.materialize() == other
+    
+    
+    __hash__ = GuildProfile.__hash__
+    
+    
+    def materialize(self):
+        """
+        Creates a guild profile from the view's current values. The returned guild profile is not bound to the table.
+        
+        Returns
+        -------
+        guild_profile : ``GuildProfile``
+        """
+        return self.table.get_guild_profile(self.user_id)
+    
+    
+    @copy_docs(GuildProfile.copy)
+    def copy(self):
+        return self.materialize()
+    
+    
+    @copy_docs(GuildProfile.copy_with)
+    def copy_with(self, **keyword_parameters):
+        return self.materialize().copy_with(**keyword_parameters)
+    
+    
+    avatar_decoration = _sparse_property_factory('avatar_decoration', None)
+    avatar_hash = _sparse_property_factory('avatar_hash', 0)
+    avatar_type = _sparse_property_factory('avatar_type', IconType.none)
+    banner_hash = _sparse_property_factory('banner_hash', 0)
+    banner_type = _sparse_property_factory('banner_type', IconType.none)
+    boosts_since = _sparse_property_factory('boosts_since', None)
+    flags = _column_property_factory('flags', GuildProfileTable.get_flags, GuildProfileTable.set_flags)
+    joined_at = _column_property_factory('joined_at', GuildProfileTable.get_joined_at, GuildProfileTable.set_joined_at)
+    nick = _column_property_factory('nick', GuildProfileTable.get_nick, GuildProfileTable.set_nick)
+    pending = _sparse_property_factory('pending', False)
+    role_ids = _column_property_factory('role_ids', GuildProfileTable.get_role_ids, GuildProfileTable.set_role_ids)
+    timed_out_until = _sparse_property_factory('timed_out_until', None)
@@ -0,0 +1,162 @@
+import vampytest
+
+from ...user import User
+
+from ..guild_profile import GuildProfile
+from ..guild_profile_mapping import GuildProfileMapping, discard_guild_profile_table
+from ..guild_profile_table import GUILD_PROFILE_TABLES
+from ..guild_profile_view import GuildProfileView
+
+
+def _assert_fields_set(guild_profile_mapping):
+    """
+    Asserts whether all fields of the given guild profile mapping are set.
+    
+    Parameters
+    ----------
+    guild_profile_mapping : ``GuildProfileMapping``
+        The guild profile mapping to check.
+    """
+    vampytest.assert_instance(guild_profile_mapping, GuildProfileMapping)
+    vampytest.assert_instance(guild_profile_mapping.guild_ids, tuple)
+    vampytest.assert_instance(guild_profile_mapping.user_id, int)
+
+
+def test__GuildProfileMapping__new():
+    """
+    Tests whether ``GuildProfileMapping.__new__`` works as intended.
+    """
+    user_id = 202610170750
+    
+    guild_profile_mapping = GuildProfileMapping(user_id)
+    _assert_fields_set(guild_profile_mapping)
+    
+    vampytest.assert_eq(guild_profile_mapping.user_id, user_id)
+    vampytest.assert_eq(len(guild_profile_mapping), 0)
+
+
+def test__GuildProfileMapping__repr():
+    """
+    Tests whether ``GuildProfileMapping.__repr__`` works as intended.
+    """
+    guild_profile_mapping = GuildProfileMapping(202610170751)
+    
+    output = repr(guild_profile_mapping)
+    vampytest.assert_instance(output, str)
+
+
+def test__GuildProfileMapping__set_and_get():
+    """
+    Tests whether ``GuildProfileMapping.__setitem__`` and ``GuildProfileMapping.__getitem__`` works as intended.
+    """
+    user_id = 202610170752
+    guild_id = 202610170753
+    guild_profile = GuildProfile(nick = 'Ayumi')
+    
+    guild_profile_mapping = GuildProfileMapping(user_id)
+    guild_profile_mapping[guild_id] = guild_profile
+    
+    vampytest.assert_in(guild_id, guild_profile_mapping)
+    vampytest.assert_eq([*guild_profile_mapping.keys()], [guild_id])
+    
+    output = guild_profile_mapping[guild_id]
+    vampytest.assert_instance(output, GuildProfileView)
+    vampytest.assert_eq(output, guild_profile)
+    vampytest.assert_eq(guild_profile_mapping.get(guild_id, None), guild_profile)
+    vampytest.assert_eq(guild_profile_mapping, {guild_id: guild_profile})
+    vampytest.assert_eq([*guild_profile_mapping.items()], [(guild_id, guild_profile)])
+    
+    output.nick = 'Yuuka'
+    vampytest.assert_eq(guild_profile_mapping[guild_id].nick, 'Yuuka')
+    
+    guild_profile_mapping.clear()
+    vampytest.assert_not_in(guild_id, GUILD_PROFILE_TABLES)
+
+
+def test__GuildProfileMapping__get__missing():
+    """
+    Tests whether ``GuildProfileMapping.__getitem__`` and ``GuildProfileMapping.get`` works as intended.
+    
+    Case: missing.
+    """
+    guild_id = 202610170755
+    guild_profile_mapping = GuildProfileMapping(202610170754)
+    
+    vampytest.assert_is(guild_profile_mapping.get(guild_id, None), None)
+    
+    with vampytest.assert_raises(KeyError):
+        guild_profile_mapping[guild_id]
+
+
+def test__GuildProfileMapping__pop():
+    """
+    Tests whether ``GuildProfileMapping.pop`` works as intended.
+    """
+    user_id = 202610170756
+    guild_id_0 = 202610170757
+    guild_id_1 = 202610170758
+    guild_profile_0 = GuildProfile(nick = 'Ayumi')
+    guild_profile_1 = GuildProfile(nick = 'Yuuka')
+    
+    guild_profile_mapping = GuildProfileMapping(user_id)
+    guild_profile_mapping[guild_id_0] = guild_profile_0
+    guild_profile_mapping[guild_id_1] = guild_profile_1
+    
+    output = guild_profile_mapping.pop(guild_id_0)
+    vampytest.assert_is(type(output), GuildProfile)
+    vampytest.assert_eq(output, guild_profile_0)
+    vampytest.assert_eq(guild_profile_mapping, {guild_id_1: guild_profile_1})
+    vampytest.assert_not_in(guild_id_0, GUILD_PROFILE_TABLES)
+    
+    vampytest.assert_is(guild_profile_mapping.pop(guild_id_0, None), None)
+    
+    with vampytest.assert_raises(KeyError):
+        guild_profile_mapping.pop(guild_id_0)
+    
+    output = guild_profile_mapping.popitem()
+    vampytest.assert_eq(output, (guild_id_1, guild_profile_1))
+    vampytest.assert_eq(len(guild_profile_mapping), 0)
+
+
+def test__GuildProfileMapping__del():
+    """
+    Tests whether ``GuildProfileMapping.__del__`` works as intended.
+    """
+    user_id = 202610170759
+    guild_id = 202610170760
+    
+    guild_profile_mapping = GuildProfileMapping(user_id)
+    guild_profile_mapping[guild_id] = GuildProfile(nick = 'Ayumi')
+    vampytest.assert_in(guild_id, GUILD_PROFILE_TABLES)
+    
+    guild_profile_mapping = None
+    vampytest.assert_not_in(guild_id, GUILD_PROFILE_TABLES)
+
+
+def test__discard_guild_profile_table():
+    """
+    Tests whether ``discard_guild_profile_table`` works as intended.
+    """
+    user_id = 202610170761
+    guild_id_0 = 202610170762
+    guild_id_1 = 202610170763
+    
+    user = User.precreate(user_id)
+    guild_profile_mapping = GuildProfileMapping(user_id)
+    user.guild_profiles = guild_profile_mapping
+    
+    guild_profile_mapping[guild_id_0] = GuildProfile(nick = 'Ayumi')
+    guild_profile_mapping[guild_id_1] = GuildProfile(nick = 'Yuuka')
+    
+    try:
+        discard_guild_profile_table(guild_id_0)
+        vampytest.assert_not_in(guild_id_0, GUILD_PROFILE_TABLES)
+        vampytest.assert_in(guild_id_1, GUILD_PROFILE_TABLES)
+        vampytest.assert_eq(guild_profile_mapping.guild_ids, (guild_id_1,))
+        vampytest.assert_eq(guild_profile_mapping.get(guild_id_0), None)
+        
+        # no table -> should not raise
+        discard_guild_profile_table(guild_id_0)
+    
+    finally:
+        guild_profile_mapping.clear()
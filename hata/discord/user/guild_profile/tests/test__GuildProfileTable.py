@@ -0,0 +1,202 @@
+from datetime import datetime as DateTime, timedelta as TimeDelta, timezone as TimeZone
+
+import vampytest
+
+from ....bases import Icon, IconType
+
+from ...avatar_decoration import AvatarDecoration
+
+from ..flags import GuildProfileFlag
+from ..guild_profile import GuildProfile
+from ..guild_profile_table import GUILD_PROFILE_TABLES, GuildProfileTable, get_guild_profile_table
+
+
+def _assert_fields_set(table):
+    """
+    Asserts whether all fields of the given guild profile table are set.
+    
+    Parameters
+    ----------
+    table : ``GuildProfileTable``
+        The table to check.
+    """
+    vampytest.assert_instance(table, GuildProfileTable)
+    vampytest.assert_instance(table.flags, object)
+    vampytest.assert_instance(table.guild_id, int)
+    vampytest.assert_instance(table.joined_ats, object)
+    vampytest.assert_instance(table.nicks, list)
+    vampytest.assert_instance(table.role_ids, list)
+    vampytest.assert_instance(table.role_ids_cache, dict)
+    vampytest.assert_instance(table.role_ids_cache_size_max, int)
+    vampytest.assert_instance(table.rows, dict)
+    vampytest.assert_instance(table.sparse, dict)
+    vampytest.assert_instance(table.user_ids, object)
+
+
+def test__GuildProfileTable__new():
+    """
+    Tests whether ``GuildProfileTable.__new__`` works as intended.
+    """
+    guild_id = 202610170700
+    
+    table = GuildProfileTable(guild_id)
+    _assert_fields_set(table)
+    
+    vampytest.assert_eq(table.guild_id, guild_id)
+    vampytest.assert_eq(len(table), 0)
+
+
+def test__GuildProfileTable__repr():
+    """
+    Tests whether ``GuildProfileTable.__repr__`` works as intended.
+    """
+    table = GuildProfileTable(202610170701)
+    
+    output = repr(table)
+    vampytest.assert_instance(output, str)
+
+
+def _iter_options__add():
+    yield GuildProfile()
+    
+    yield GuildProfile(
+        joined_at = DateTime(2016, 5, 15, 12, 5, 6, 123456, tzinfo = TimeZone.utc),
+        nick = 'Ayumi',
+        role_ids = [202610170702, 202610170703],
+    )
+    
+    yield GuildProfile(
+        avatar = Icon(IconType.static, 12),
+        avatar_decoration = AvatarDecoration(asset = Icon(IconType.static, 2), sku_id = 202610170704),
+        banner = Icon(IconType.static, 15),
+        boosts_since = DateTime(2016, 5, 14, tzinfo = TimeZone.utc),
+        flags = GuildProfileFlag(3),
+        joined_at = DateTime(2016, 5, 15, tzinfo = TimeZone(TimeDelta(hours = 2))),
+        nick = 'Ayumi',
+        pending = True,
+        role_ids = [202610170702],
+        timed_out_until = DateTime(2016, 5, 20, tzinfo = TimeZone.utc),
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__add()))
+def test__GuildProfileTable__add(guild_profile):
+    """
+    Tests whether ``GuildProfileTable.add`` and ``GuildProfileTable.get_guild_profile`` works as intended.
+    
+    Parameters
+    ----------
+    guild_profile : ``GuildProfile``
+        Guild profile to add.
+    """
+    user_id = 202610170705
+    
+    table = GuildProfileTable(202610170706)
+    table.add(user_id, guild_profile)
+    
+    vampytest.assert_eq(len(table), 1)
+    vampytest.assert_in(user_id, table)
+    
+    output = table.get_guild_profile(user_id)
+    vampytest.assert_is(type(output), GuildProfile)
+    vampytest.assert_eq(output, guild_profile)
+    vampytest.assert_eq(output.joined_at, guild_profile.joined_at)
+
+
+def test__GuildProfileTable__add__overwrite():
+    """
+    Tests whether ``GuildProfileTable.add`` works as intended.
+    
+    Case: overwriting a row.
+    """
+    user_id = 202610170707
+    
+    table = GuildProfileTable(202610170708)
+    table.add(user_id, GuildProfile(nick = 'Ayumi', pending = True))
+    table.add(user_id, GuildProfile(nick = 'Yuuka'))
+    
+    vampytest.assert_eq(len(table), 1)
+    vampytest.assert_eq(table.get_guild_profile(user_id), GuildProfile(nick = 'Yuuka'))
+    vampytest.assert_eq(table.sparse, {})
+
+
+def test__GuildProfileTable__remove():
+    """
+    Tests whether ``GuildProfileTable.remove`` works as intended.
+    """
+    user_id_0 = 202610170709
+    user_id_1 = 202610170710
+    user_id_2 = 202610170711
+    
+    guild_profile_0 = GuildProfile(nick = 'Ayumi', pending = True)
+    guild_profile_1 = GuildProfile(nick = 'Yuuka')
+    guild_profile_2 = GuildProfile(nick = 'Reimu', role_ids = [202610170712])
+    
+    table = GuildProfileTable(202610170713)
+    table.add(user_id_0, guild_profile_0)
+    table.add(user_id_1, guild_profile_1)
+    table.add(user_id_2, guild_profile_2)
+    
+    table.remove(user_id_0)
+    
+    vampytest.assert_eq(len(table), 2)
+    vampytest.assert_not_in(user_id_0, table)
+    vampytest.assert_eq([*table], [user_id_2, user_id_1])
+    vampytest.assert_eq(table.get_guild_profile(user_id_1), guild_profile_1)
+    vampytest.assert_eq(table.get_guild_profile(user_id_2), guild_profile_2)
+    vampytest.assert_eq(table.sparse, {})
+    
+    with vampytest.assert_raises(KeyError):
+        table.remove(user_id_0)
+
+
+def test__GuildProfileTable__remove__empty():
+    """
+    Tests whether ``GuildProfileTable.remove`` works as intended.
+    
+    Case: table gets empty -> removed from the registered tables.
+    """
+    user_id = 202610170714
+    guild_id = 202610170715
+    
+    table = get_guild_profile_table(guild_id)
+    table.add(user_id, GuildProfile(nick = 'Ayumi'))
+    vampytest.assert_is(GUILD_PROFILE_TABLES.get(guild_id, None), table)
+    
+    table.remove(user_id)
+    vampytest.assert_eq(len(table), 0)
+    vampytest.assert_not_in(guild_id, GUILD_PROFILE_TABLES)
+
+
+def test__GuildProfileTable__set_role_ids__shared():
+    """
+    Tests whether ``GuildProfileTable.set_role_ids`` works as intended.
+    
+    Case: equal role identifiers are shared.
+    """
+    user_id_0 = 202610170714
+    user_id_1 = 202610170715
+    
+    table = GuildProfileTable(202610170716)
+    table.add(user_id_0, GuildProfile(role_ids = [202610170717, 202610170718]))
+    table.add(user_id_1, GuildProfile(role_ids = [202610170717, 202610170718]))
+    
+    vampytest.assert_is(table.get_role_ids(user_id_0), table.get_role_ids(user_id_1))
+
+
+def test__GuildProfileTable__set_role_ids__compact():
+    """
+    Tests whether ``GuildProfileTable.set_role_ids`` works as intended.
+    
+    Case: the role identifiers cache is compacted.
+    """
+    user_id = 202610170719
+    
+    table = GuildProfileTable(202610170720)
+    table.add(user_id, GuildProfile())
+    
+    for role_id in range(table.role_ids_cache_size_max + 1):
+        table.set_role_ids(user_id, (role_id,))
+    
+    vampytest.assert_eq(table.role_ids_cache, {(role_id,): (role_id,)})
+    vampytest.assert_eq(table.get_role_ids(user_id), (role_id,))
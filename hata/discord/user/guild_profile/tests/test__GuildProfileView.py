@@ -0,0 +1,130 @@
+from datetime import datetime as DateTime, timezone as TimeZone
+
+import vampytest
+
+from ..flags import GuildProfileFlag
+from ..guild_profile import GuildProfile
+from ..guild_profile_table import GuildProfileTable
+from ..guild_profile_view import GuildProfileView
+
+
+def _assert_fields_set(guild_profile_view):
+    """
+    Asserts whether all fields of the given guild profile view are set.
+    
+    Parameters
+    ----------
+    guild_profile_view : ``GuildProfileView``
+        The guild profile view to check.
+    """
+    vampytest.assert_instance(guild_profile_view, GuildProfileView)
+    vampytest.assert_instance(guild_profile_view.table, GuildProfileTable)
+    vampytest.assert_instance(guild_profile_view.user_id, int)
+
+
+def test__GuildProfileView__new():
+    """
+    Tests whether ``GuildProfileView.__new__`` works as intended.
+    """
+    user_id = 202610170730
+    table = GuildProfileTable(202610170731)
+    
+    guild_profile_view = GuildProfileView(table, user_id)
+    _assert_fields_set(guild_profile_view)
+    
+    vampytest.assert_is(guild_profile_view.table, table)
+    vampytest.assert_eq(guild_profile_view.user_id, user_id)
+
+
+def test__GuildProfileView__repr():
+    """
+    Tests whether ``GuildProfileView.__repr__`` works as intended.
+    """
+    guild_profile_view = GuildProfileView(GuildProfileTable(202610170732), 202610170733)
+    
+    output = repr(guild_profile_view)
+    vampytest.assert_instance(output, str)
+
+
+def test__GuildProfileView__fields():
+    """
+    Tests whether ``GuildProfileView``'s fields read and write the table.
+    """
+    user_id = 202610170734
+    guild_profile = GuildProfile(
+        flags = GuildProfileFlag(3),
+        joined_at = DateTime(2016, 5, 15, tzinfo = TimeZone.utc),
+        nick = 'Ayumi',
+        role_ids = [202610170735],
+    )
+    
+    table = GuildProfileTable(202610170736)
+    table.add(user_id, guild_profile)
+    guild_profile_view = GuildProfileView(table, user_id)
+    
+    vampytest.assert_eq(guild_profile_view.flags, GuildProfileFlag(3))
+    vampytest.assert_eq(guild_profile_view.joined_at, DateTime(2016, 5, 15, tzinfo = TimeZone.utc))
+    vampytest.assert_eq(guild_profile_view.nick, 'Ayumi')
+    vampytest.assert_eq(guild_profile_view.pending, False)
+    vampytest.assert_eq(guild_profile_view.role_ids, (202610170735,))
+    
+    guild_profile_view.nick = 'Yuuka'
+    guild_profile_view.pending = True
+    
+    vampytest.assert_eq(table.get_nick(user_id), 'Yuuka')
+    vampytest.assert_eq(table.get_sparse(user_id, 'pending', False), True)
+
+
+def test__GuildProfileView__eq():
+    """
+    Tests whether ``GuildProfileView.__eq__`` works as intended.
+    """
+    user_id = 202610170737
+    guild_profile = GuildProfile(nick = 'Ayumi', role_ids = [202610170738])
+    
+    table = GuildProfileTable(202610170739)
+    table.add(user_id, guild_profile)
+    guild_profile_view = GuildProfileView(table, user_id)
+    
+    vampytest.assert_eq(guild_profile_view, guild_profile)
+    vampytest.assert_eq(guild_profile, guild_profile_view)
+    vampytest.assert_eq(guild_profile_view, GuildProfileView(table, user_id))
+    vampytest.assert_ne(guild_profile_view, GuildProfile(nick = 'Yuuka'))
+    vampytest.assert_eq(hash(guild_profile_view), hash(guild_profile))
+
+
+def test__GuildProfileView__difference_update_attributes():
+    """
+    Tests whether ``GuildProfileView._difference_update_attributes`` works as intended.
+    """
+    user_id = 202610170740
+    
+    table = GuildProfileTable(202610170741)
+    table.add(user_id, GuildProfile(nick = 'Ayumi', pending = True))
+    guild_profile_view = GuildProfileView(table, user_id)
+    
+    output = guild_profile_view._difference_update_attributes({'nick': 'Yuuka', 'pending': False})
+    
+    vampytest.assert_eq(output, {'nick': 'Ayumi', 'pending': True})
+    vampytest.assert_eq(table.get_guild_profile(user_id), GuildProfile(nick = 'Yuuka'))
+
+
+def test__GuildProfileView__copy():
+    """
+    Tests whether ``GuildProfileView.copy`` works as intended.
+    """
+    user_id = 202610170742
+    guild_profile = GuildProfile(nick = 'Ayumi')
+    
+    table = GuildProfileTable(202610170743)
+    table.add(user_id, guild_profile)
+    guild_profile_view = GuildProfileView(table, user_id)
+    
+    copy = guild_profile_view.copy()
+    vampytest.assert_is(type(copy), GuildProfile)
+    vampytest.assert_eq(copy, guild_profile)
+    
+    copy = guild_profile_view.copy_with(nick = 'Yuuka')
+    vampytest.assert_is(type(copy), GuildProfile)
+    vampytest.assert_eq(copy, GuildProfile(nick = 'Yuuka'))
+    vampytest.assert_eq(guild_profile_view.nick, 'Ayumi')
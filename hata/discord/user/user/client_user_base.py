@@ -207,6 +207,8 @@ class ClientUserBase(OrinUserBase):
     
     @copy_docs(OrinUserBase._difference_update_profile)
     def _difference_update_profile(self, data, guild):
+        guild._update_user_name_index(self.id)
+        
         guild_profile = self.guild_profiles.get(guild.id, None)
         if guild_profile is None:
             self.guild_profiles[guild.id] = GuildProfile.from_data(data)
@@ -234,6 +236,8 @@ class ClientUserBase(OrinUserBase):
     
     @copy_docs(OrinUserBase._update_profile)
     def _update_profile(self, data, guild):
+        guild._update_user_name_index(self.id)
+        
         guild_profile = self.guild_profiles.get(guild.id, None)
         if guild_profile is None:
             self.guild_profiles[guild.id] = GuildProfile.from_data(data)
@@ -481,6 +485,17 @@ class ClientUserBase(OrinUserBase):
         return hash_value
     
     
+    def _update_guild_user_name_indexes(self):
+        """
+        Marks the user's names as changed in the user name indexes of its guilds.
+        """
+        user_id = self.id
+        for guild_id in self.guild_profiles.keys():
+            guild = GUILDS.get(guild_id, None)
+            if (guild is not None):
+                guild._update_user_name_index(user_id)
+    
+    
     @copy_docs(OrinUserBase._delete)
     def _delete(self):
         # we cannot full delete a user, because of the mentions, so we delete it only from the guilds
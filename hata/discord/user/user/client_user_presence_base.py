@@ -237,7 +237,7 @@ class ClientUserPBase(ClientUserBase):
     
     @copy_docs(ClientUserBase._update_presence)
     def _update_presence(self, data):
-        self.activities = parse_activities(data)
+        self.activities = parse_activities(data, self.activities)
         self.status = parse_status(data)
         self.status_by_platform = parse_status_by_platform(data)
     
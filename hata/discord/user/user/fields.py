@@ -1,6 +1,7 @@
 __all__ = ()
 
 from ...activity import Activity
+from ...activity.activity_field_base.interning import digest_data
 from ...color import Color
 from ...field_parsers import (
     bool_parser_factory, entity_id_parser_factory, flag_parser_factory, nullable_entity_parser_factory,
@@ -32,7 +33,7 @@ from .preinstanced import PremiumType
 
 # activities
 
-def parse_activities(data):
+def parse_activities(data, old_activities = None):
     """
     Parses the activities out from the given presence data.
     
@@ -41,6 +42,9 @@ def parse_activities(data):
     data : `dict<str, object>`
         User presence data.
     
+    old_activities : ``None | list<Activity>`` = `None`, Optional
+        The user's current activities. The ones created from the same data are reused.
+    
     Returns
     -------
     activities : ``None | list<Activity>``
@@ -49,7 +53,21 @@ def parse_activities(data):
     if (activity_datas is None) or (not activity_datas):
         return None
     
-    return [Activity.from_data(activity_data) for activity_data in activity_datas]
+    if old_activities is None:
+        return [Activity.from_data(activity_data) for activity_data in activity_datas]
+    
+    activities = []
+    for activity_data in activity_datas:
+        data_digest = digest_data(activity_data)
+        for activity in old_activities:
+            if activity._data_digest == data_digest:
+                break
+        else:
+            activity = Activity.from_data(activity_data)
+        
+        activities.append(activity)
+    
+    return activities
 
 
 def put_activities(activities, data, defaults):
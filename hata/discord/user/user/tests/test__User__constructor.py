@@ -8,6 +8,7 @@ from ....color import Color
 from ....guild import GuildBadge
 
 from ...avatar_decoration import AvatarDecoration
+from ...guild_profile import GuildProfileMapping
 from ...name_plate import NamePlate
 from ...status_by_platform import Status, StatusByPlatform
 
@@ -33,7 +34,7 @@ def _assert_fields_set(user):
     vampytest.assert_instance(user.discriminator, int)
     vampytest.assert_instance(user.display_name, str, nullable = True)
     vampytest.assert_instance(user.flags, UserFlag)
-    vampytest.assert_instance(user.guild_profiles, dict)
+    vampytest.assert_instance(user.guild_profiles, dict, GuildProfileMapping)
     vampytest.assert_instance(user.id, int)
     vampytest.assert_instance(user.name, str)
     vampytest.assert_instance(user.name_plate, NamePlate, nullable = True)
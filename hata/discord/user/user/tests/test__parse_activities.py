@@ -21,3 +21,43 @@ def test__parse_activities():
     ):
         output = parse_activities(input_data)
         vampytest.assert_eq(output, expected_output)
+
+
+def test__parse_activities__old_activities():
+    """
+    Tests whether ``parse_activities`` works as intended.
+    
+    Case: reusing old activities.
+    """
+    activity_0 = Activity.from_data({'type': 0, 'name': 'my master'})
+    activity_1 = Activity('my lord')
+    
+    output = parse_activities(
+        {'activities': [{'type': 0, 'name': 'my master'}, activity_1.to_data()]},
+        [activity_0],
+    )
+    
+    vampytest.assert_eq(output, [activity_0, activity_1])
+    vampytest.assert_is(output[0], activity_0)
+
+
+def test__parse_activities__old_activities__hash_collision():
+    """
+    Tests whether ``parse_activities`` works as intended.
+    
+    Case: old activity with data of the same hash value, but not equal.
+    """
+    # `hash(-1) == hash(-2)`
+    activity_0 = Activity.from_data({'type': 0, 'name': 'my master', 'sequence': -1})
+    vampytest.assert_eq(
+        hash(frozenset({'type': 0, 'name': 'my master', 'sequence': -1}.items())),
+        hash(frozenset({'type': 0, 'name': 'my master', 'sequence': -2}.items())),
+    )
+    
+    output = parse_activities(
+        {'activities': [{'type': 0, 'name': 'my master', 'sequence': -2}]},
+        [activity_0],
+    )
+    
+    vampytest.assert_eq(len(output), 1)
+    vampytest.assert_is_not(output[0], activity_0)
@@ -4,12 +4,12 @@ from warnings import warn
 
 from scarletio import copy_docs
 
-from ....env import CACHE_PRESENCE, CACHE_USER
+from ....env import CACHE_PRESENCE, CACHE_USER, COLUMNAR_GUILD_PROFILES
 
 from ...core import GUILDS, USERS
 from ...precreate_helpers import process_precreate_parameters_and_raise_extra
 
-from ..guild_profile import GuildProfile
+from ..guild_profile import GuildProfile, GuildProfileMapping
 from ..status_by_platform import Status, StatusByPlatform
 
 from .client_user_base import ClientUserBase
@@ -124,9 +124,9 @@ class User(USER_BASE_TYPE):
     flags : ``UserFlag``
         The user's user flags.
     
-    guild_profiles : ``dict<int, GuildProfile>``
+    guild_profiles : ``dict<int, GuildProfile> | GuildProfileMapping``
         A dictionary, which contains the user's guild profiles. If a user is member of a guild, then it should
-        have a respective guild profile accordingly.
+        have a respective guild profile accordingly. A ``GuildProfileMapping`` if columnar guild profiles are enabled.
     
     id : `int`
         The user's unique identifier number.
@@ -171,7 +171,10 @@ class User(USER_BASE_TYPE):
             except KeyError:
                 self = object.__new__(cls)
                 self.id = user_id
-                self.guild_profiles = {}
+                if COLUMNAR_GUILD_PROFILES:
+                    self.guild_profiles = GuildProfileMapping(user_id)
+                else:
+                    self.guild_profiles = {}
                 self.thread_profiles = None
                 self.status = Status.offline
                 self.status_by_platform = None
@@ -198,6 +201,7 @@ class User(USER_BASE_TYPE):
                         pass
                     else:
                         guild.users[user_id] = self
+                        guild._update_user_name_index(user_id)
             
             return self
     
@@ -212,7 +216,10 @@ class User(USER_BASE_TYPE):
             except KeyError:
                 self = object.__new__(cls)
                 self.id = user_id
-                self.guild_profiles = {}
+                if COLUMNAR_GUILD_PROFILES:
+                    self.guild_profiles = GuildProfileMapping(user_id)
+                else:
+                    self.guild_profiles = {}
                 self.thread_profiles = None
                 
                 USERS[user_id] = self
@@ -236,6 +243,7 @@ class User(USER_BASE_TYPE):
                         pass
                     else:
                         guild.users[user_id] = self
+                        guild._update_user_name_index(user_id)
             
             return self
     
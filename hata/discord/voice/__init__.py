@@ -1,8 +1,10 @@
 from .audio_settings import *
 from .encryption_adapters import *
+from .opus_containers import *
 from .packets import *
 
 from .audio_source import *
+from .broadcast import *
 from .opus import *
 from .player import *
 from .reader import *
@@ -13,9 +15,11 @@ from .voice_client import *
 __all__ = (
     *audio_settings.__all__,
     *encryption_adapters.__all__,
+    *opus_containers.__all__,
     *packets.__all__,
     
     *audio_source.__all__,
+    *broadcast.__all__,
     *opus.__all__,
     *player.__all__,
     *reader.__all__,
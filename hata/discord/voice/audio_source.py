@@ -1,6 +1,7 @@
-__all__ = ('AudioSource', 'DownloadError', 'LocalAudio', 'RawAudio', 'YTAudio')
+__all__ = ('AudioSource', 'DownloadError', 'LocalAudio', 'OpusAudio', 'RawAudio', 'YTAudio')
 
 import os, subprocess
+from collections import deque
 from os.path import isfile as is_file
 from pathlib import Path
 from shlex import split
@@ -10,6 +11,8 @@ from scarletio import CancelledError, Task, alchemy_incendiary, copy_docs
 from ..core import KOKORO
 
 from .audio_settings import AUDIO_SETTINGS_DEFAULT
+from .opus_containers.detect import create_opus_demuxer
+from .opus_containers.utils import get_opus_packet_sample_count
 
 
 DEFAULT_EXECUTABLE = 'ffmpeg'
@@ -192,7 +195,7 @@ class RawAudio(AudioSource):
     @copy_docs(AudioSource.read)
     async def read(self):
         chunk_start = self.position
-      
+        
         if chunk_start < self.length:
             chunk_end = chunk_start + self.AUDIO_SETTINGS.frame_size
             self.position = chunk_end
@@ -483,6 +486,292 @@ class LocalAudio(AudioSource):
         self.process = None
 
 
+class OpusAudio(AudioSource):
+    """
+    Represents a pre-encoded opus audio from an Ogg or a WebM container.
+    
+    The containers are demuxed in python and their opus packets are sent as they are, so no ffmpeg process is started
+    and the player does not encode them either. The packets must be 20 ms long, which is what most encoders produce
+    by default. Since the player sends a packet every 20 ms, reading a packet of different length raises `ValueError`.
+    
+    Attributes
+    ----------
+    _demuxer : `None | OpusDemuxerBase`
+        The demuxer of the source's container. Created on postprocess.
+    _file : `None | file-like`
+        The opened file.
+    _packets : `deque<bytes>`
+        The demuxed packets not yet read.
+    _seek_to : `float`
+        Position to seek to in seconds before reading next. `-1.0` if not seeking.
+    path : `None`, `str`
+        The audio source's path if applicable. Defaults to `None`.
+    title : `str`
+        The audio source's title if applicable. Defaults to empty string.
+    
+    Class Attributes
+    ----------------
+    AUDIO_SETTINGS : ``AudioSettings`` = `AUDIO_SETTINGS_DEFAULT`
+        Settings containing how the audio should be played.
+    NEEDS_ENCODE : `bool` = `False`
+        Whether the source is not opus encoded.
+    REPEATABLE : `bool` = `True`
+        Whether the source can be repeated after it is exhausted once.
+    """
+    __slots__ = ('_demuxer', '_file', '_packets', '_seek_to', 'path', 'title')
+    
+    NEEDS_ENCODE = False
+    REPEATABLE = True
+    
+    def __new__(cls, source, *, start = 0.0, title = None):
+        """
+        Creates a new opus audio.
+        
+        Parameters
+        ----------
+        source : `str`, `Path`, `file-like`
+            The source audio file's path or a `file-like` opened in binary mode supporting seeking.
+        
+        start : `float` = `0.0`, Optional (Keyword only)
+            Position to start playing from in seconds.
+        
+        title : `None`, `str` = `None`, Optional (Keyword only)
+            The audio source's title.
+        
+        Returns
+        -------
+        self : ``OpusAudio``
+        
+        Raises
+        ------
+        TypeError
+            - If `source` is neither `str`, `Path`, nor `file-like`.
+        ValueError
+            - If `source` is a path, but not of a file.
+            - If `start` is negative.
+        """
+        if isinstance(source, (str, Path)):
+            path = str(source)
+            if not is_file(path):
+                raise ValueError(
+                    f'`source` is not a file. Got: {source!r}',
+                )
+            
+            file = None
+        
+        elif hasattr(source, 'read') and hasattr(source, 'seek'):
+            path = None
+            file = source
+        
+        else:
+            raise TypeError(
+                f'`source` can be `str`, `Path`, `file-like`, got {type(source).__name__}; {source!r}.'
+            )
+        
+        if start < 0.0:
+            raise ValueError(
+                f'`start` cannot be negative, got {start!r}.'
+            )
+        
+        if title is None:
+            name = path if (path is not None) else getattr(source, 'name', None)
+            if isinstance(name, str):
+                title = os.path.splitext(os.path.basename(name))[0].replace('_', ' ')
+            else:
+                title = ''
+        
+        self = object.__new__(cls)
+        self._demuxer = None
+        self._file = file
+        self._packets = deque()
+        self._seek_to = start if start else -1.0
+        self.path = path
+        self.title = title
+        return self
+    
+    
+    def _open_demuxer(self, seek_to):
+        """
+        Opens the source's demuxer if not yet opened and seeks it.
+        
+        This method runs inside of an executor thread.
+        
+        Parameters
+        ----------
+        seek_to : `float`
+            Position to seek to in seconds. `-1.0` if not seeking.
+        
+        Returns
+        -------
+        demuxer : ``OpusDemuxerBase``
+        
+        Raises
+        ------
+        OSError
+            If opening the file failed.
+        ValueError
+            - If the file's container is not supported.
+            - If the file contains no opus stream.
+        """
+        demuxer = self._demuxer
+        if demuxer is None:
+            file = self._file
+            if file is None:
+                file = open(self.path, 'rb')
+                self._file = file
+            
+            demuxer = create_opus_demuxer(file)
+        
+        if seek_to >= 0.0:
+            demuxer.seek(seek_to)
+        
+        return demuxer
+    
+    
+    def _read_packets(self, demuxer, seek_to):
+        """
+        Seeks the demuxer if requested, then reads the next packets.
+        
+        This method runs inside of an executor thread.
+        
+        Parameters
+        ----------
+        demuxer : ``OpusDemuxerBase``
+            The demuxer to read with.
+        seek_to : `float`
+            Position to seek to in seconds. `-1.0` if not seeking.
+        
+        Returns
+        -------
+        packets : `None | list<bytes>`
+        
+        Raises
+        ------
+        ValueError
+            - If a packet is not a frame long.
+        """
+        if seek_to >= 0.0:
+            demuxer.seek(seek_to)
+        
+        packets = demuxer.read_packets()
+        if (packets is not None):
+            samples_per_frame = self.AUDIO_SETTINGS.samples_per_frame
+            for packet in packets:
+                sample_count = get_opus_packet_sample_count(packet)
+                if sample_count != samples_per_frame:
+                    raise ValueError(
+                        f'{type(self).__name__} can only play opus packets of {samples_per_frame!r} samples '
+                        f'({self.AUDIO_SETTINGS.frame_length!r} ms), got a packet of {sample_count!r} samples. '
+                        f'Re-encode the file with `-frame_duration {self.AUDIO_SETTINGS.frame_length!r}` or play it '
+                        f'with `LocalAudio`.'
+                    )
+        
+        return packets
+    
+    
+    @copy_docs(AudioSource.postprocess)
+    async def postprocess(self):
+        seek_to = self._seek_to
+        self._seek_to = -1.0
+        
+        # Repeated, start from the beginning.
+        if (seek_to < 0.0) and (self._demuxer is not None):
+            seek_to = 0.0
+        
+        self._packets.clear()
+        self._demuxer = await KOKORO.run_in_executor(alchemy_incendiary(self._open_demuxer, (seek_to,)))
+    
+    
+    async def read(self):
+        """
+        Reads an opus packet.
+        
+        Indicates end of stream by returning `None`.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        audio_data : `bytes`, `None`
+        
+        Raises
+        ------
+        ValueError
+            - If a packet is not a frame long.
+        """
+        packets = self._packets
+        while not packets:
+            demuxer = self._demuxer
+            if demuxer is None:
+                return None
+            
+            seek_to = self._seek_to
+            self._seek_to = -1.0
+            
+            new_packets = await KOKORO.run_in_executor(
+                alchemy_incendiary(self._read_packets, (demuxer, seek_to))
+            )
+            
+            # Seeked meanwhile, drop the read packets.
+            if self._seek_to >= 0.0:
+                continue
+            
+            if new_packets is None:
+                return None
+            
+            packets.extend(new_packets)
+        
+        return packets.popleft()
+    
+    
+    def seek(self, seconds):
+        """
+        Seeks to the given position. Already prepared frames of the player are still played.
+        
+        Parameters
+        ----------
+        seconds : `float`
+            The position to seek to in seconds.
+        
+        Raises
+        ------
+        ValueError
+            If `seconds` is negative.
+        """
+        if seconds < 0.0:
+            raise ValueError(
+                f'`seconds` cannot be negative, got {seconds!r}.'
+            )
+        
+        self._packets.clear()
+        self._seek_to = seconds
+    
+    
+    @copy_docs(AudioSource.cleanup)
+    async def cleanup(self):
+        self._close_file()
+    
+    
+    @copy_docs(AudioSource.__del__)
+    def __del__(self):
+        self._close_file()
+    
+    
+    def _close_file(self):
+        """
+        Closes the file if it was opened by the audio source.
+        """
+        if self.path is None:
+            return
+        
+        file = self._file
+        self._demuxer = None
+        self._file = None
+        self._packets.clear()
+        if (file is not None):
+            file.close()
+
+
 try:
     import youtube_dl
 except ImportError:
@@ -527,7 +816,7 @@ else:
             The audio source's title if applicable. Defaults to empty string.
         url : `str`
             The source url of the downloaded audio.
-            
+        
         Class Attributes
         ----------------
         AUDIO_SETTINGS : ``AudioSettings`` = `AUDIO_SETTINGS_DEFAULT`
@@ -0,0 +1,410 @@
+__all__ = ('BroadcastAudio', 'BroadcastAudioListener', 'BroadcastAudioReencodingListener')
+
+from time import perf_counter
+
+from scarletio import CancelledError, Future, Task, alchemy_incendiary, copy_docs, sleep, write_exception_async
+
+from ..core import KOKORO
+
+from .audio_source import AudioSource
+from .opus import OpusEncoder
+
+
+BROADCAST_AUDIO_FRAME_HISTORY = 50
+BROADCAST_AUDIO_FRAME_LEAD = 5
+
+BROADCAST_FRAME_OPUS = 0
+BROADCAST_FRAME_PCM = 1
+
+
+class BroadcastAudio:
+    """
+    Plays an audio source to many voice clients, reading and encoding it only once.
+    
+    Each voice client plays its own listener created by ``.create_listener``. The encoded frames are shared between the
+    listeners, and every voice client's player still sends them with its own sequence, timestamp and encryption.
+    Voice clients' preferred volume is only applied to listeners which re-encode the frames.
+    
+    The broadcast plays in real time from when the first listener starts, regardless whether the listeners are paused
+    (like a radio) till its source is exhausted or it is stopped.
+    
+    Attributes
+    ----------
+    _encoder : `None | OpusEncoder`
+        Encoder of the source's frames. Created when the broadcast starts if the source is not opus encoded.
+    _frame_count : `int`
+        How much frames were broadcasted.
+    _frame_waiter : `None | Future`
+        Waiter of the listeners for the next frame.
+    _frames : `list<None | (bytes, None | bytes)>`
+        The last broadcasted (opus, pcm) frames in a ring buffer. Pcm frames are only present if the source is not
+        opus encoded.
+    _task : `None | Task`
+        The task broadcasting the source.
+    ended : `bool`
+        Whether the broadcast ended.
+    listeners : `set<BroadcastAudioListener>`
+        The listeners playing the broadcast.
+    source : ``AudioSource``
+        The broadcasted audio source.
+    """
+    __slots__ = (
+        '_encoder', '_frame_count', '_frame_waiter', '_frames', '_task', 'ended', 'listeners', 'source'
+    )
+    
+    def __new__(cls, source):
+        """
+        Creates a new broadcast.
+        
+        Parameters
+        ----------
+        source : ``AudioSource``
+            The audio source to broadcast.
+        """
+        self = object.__new__(cls)
+        self._encoder = None
+        self._frame_count = 0
+        self._frame_waiter = None
+        self._frames = [None] * BROADCAST_AUDIO_FRAME_HISTORY
+        self._task = None
+        self.ended = False
+        self.listeners = set()
+        self.source = source
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the broadcast's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' source = ')
+        repr_parts.append(repr(self.source))
+        
+        repr_parts.append(', listeners = ')
+        repr_parts.append(repr(len(self.listeners)))
+        
+        repr_parts.append(', frame_count = ')
+        repr_parts.append(repr(self._frame_count))
+        
+        if self.ended:
+            repr_parts.append(', ended')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def create_listener(self, *, reencode = False):
+        """
+        Creates a new listener of the broadcast to be played by a voice client.
+        
+        Parameters
+        ----------
+        reencode : `bool` = `False`, Optional (Keyword only)
+            Whether the listener should re-encode the frames, so the voice client's preferred volume is applied.
+        
+        Returns
+        -------
+        listener : ``BroadcastAudioListener``
+        
+        Raises
+        ------
+        ValueError
+            - If `reencode` is `True`, but the source is already opus encoded.
+        """
+        if reencode:
+            if not self.source.NEEDS_ENCODE:
+                raise ValueError(
+                    f'Cannot re-encode the frames of an opus encoded source; source = {self.source!r}.'
+                )
+            
+            return BroadcastAudioReencodingListener(self)
+        
+        return BroadcastAudioListener(self)
+    
+    
+    def start(self):
+        """
+        Starts the broadcast if not yet started.
+        """
+        if (self._task is None) and (not self.ended):
+            self._task = Task(KOKORO, self._run())
+    
+    
+    def stop(self):
+        """
+        Stops the broadcast. Its listeners are exhausted.
+        """
+        task = self._task
+        if (task is not None):
+            self._task = None
+            task.cancel()
+        
+        self._end()
+    
+    
+    async def _run(self):
+        """
+        Reads, encodes and broadcasts the source's frames in real time.
+        
+        This method is a coroutine.
+        """
+        source = self.source
+        try:
+            await source.postprocess()
+            
+            if source.NEEDS_ENCODE:
+                encoder = OpusEncoder(audio_settings = source.AUDIO_SETTINGS)
+                self._encoder = encoder
+            else:
+                encoder = None
+            
+            frame_length = source.AUDIO_SETTINGS.frame_length * 0.001
+            start = perf_counter()
+            loops = 0
+            
+            while True:
+                data = await source.read()
+                if data is None:
+                    break
+                
+                if encoder is None:
+                    frame = (data, None)
+                else:
+                    frame = (await KOKORO.run_in_executor(alchemy_incendiary(encoder.encode, (data,))), data)
+                
+                self._add_frame(frame)
+                
+                # Frames are broadcasted ahead, so the listeners' players can prepare them in time.
+                loops += 1
+                if loops > BROADCAST_AUDIO_FRAME_LEAD:
+                    delay = (start + frame_length * (loops - BROADCAST_AUDIO_FRAME_LEAD)) - perf_counter()
+                    await sleep(delay, KOKORO)
+        
+        except GeneratorExit:
+            raise
+        
+        except CancelledError:
+            pass
+        
+        except BaseException as err:
+            await write_exception_async(
+                err,
+                [
+                    'Exception occurred at \n',
+                    repr(self),
+                    '\n',
+                ],
+                loop = KOKORO
+            )
+        
+        finally:
+            self._task = None
+            self._end()
+            await source.cleanup()
+    
+    
+    def _add_frame(self, frame):
+        """
+        Adds a frame to the broadcast and wakes up the waiting listeners.
+        
+        Parameters
+        ----------
+        frame : `(bytes, None | bytes)`
+            The opus and the pcm frame.
+        """
+        frame_count = self._frame_count
+        self._frames[frame_count % BROADCAST_AUDIO_FRAME_HISTORY] = frame
+        self._frame_count = frame_count + 1
+        self._wake_up_listeners()
+    
+    
+    def _end(self):
+        """
+        Marks the broadcast as ended and wakes up the waiting listeners.
+        """
+        self.ended = True
+        self._wake_up_listeners()
+    
+    
+    def _wake_up_listeners(self):
+        """
+        Wakes up the listeners waiting for a frame.
+        """
+        frame_waiter = self._frame_waiter
+        if (frame_waiter is not None):
+            self._frame_waiter = None
+            frame_waiter.set_result_if_pending(None)
+    
+    
+    def _get_start_position(self):
+        """
+        Returns the position where a listener starts or resumes listening from.
+        
+        Returns
+        -------
+        position : `int`
+        """
+        return max(self._frame_count - BROADCAST_AUDIO_FRAME_LEAD, 0)
+    
+    
+    async def _get_frame(self, position):
+        """
+        Returns the frame at the given position. Waits for it if it was not yet broadcasted.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        position : `int`
+            The frame's position.
+        
+        Returns
+        -------
+        position : `int`
+            The frame's position. Can be later than the requested one if it is not in the history anymore.
+        frame : `None | (bytes, None | bytes)`
+            The opus and the pcm frame. `None` if the broadcast ended.
+        """
+        while position >= self._frame_count:
+            if self.ended:
+                return position, None
+            
+            frame_waiter = self._frame_waiter
+            if frame_waiter is None:
+                frame_waiter = Future(KOKORO)
+                self._frame_waiter = frame_waiter
+            
+            await frame_waiter
+        
+        # Lagged out of the history (paused for example), continue live.
+        if position < self._frame_count - BROADCAST_AUDIO_FRAME_HISTORY:
+            position = self._get_start_position()
+        
+        return position, self._frames[position % BROADCAST_AUDIO_FRAME_HISTORY]
+
+
+class BroadcastAudioListener(AudioSource):
+    """
+    Audio source playing a broadcast's opus frames.
+    
+    Attributes
+    ----------
+    broadcast : ``BroadcastAudio``
+        The played broadcast.
+    position : `int`
+        The position of the next frame to play.
+    
+    Class Attributes
+    ----------------
+    FRAME_INDEX : `int` = `BROADCAST_FRAME_OPUS`
+        Which one of the broadcasted frames is played.
+    NEEDS_ENCODE : `bool` = `False`
+        Whether the source is not opus encoded.
+    REPEATABLE : `bool` = `False`
+        Whether the source can be repeated after it is exhausted once.
+    """
+    __slots__ = ('broadcast', 'position')
+    
+    NEEDS_ENCODE = False
+    REPEATABLE = False
+    
+    FRAME_INDEX = BROADCAST_FRAME_OPUS
+    
+    def __new__(cls, broadcast):
+        """
+        Creates a new broadcast listener.
+        
+        Parameters
+        ----------
+        broadcast : ``BroadcastAudio``
+            The broadcast to play.
+        """
+        self = object.__new__(cls)
+        self.broadcast = broadcast
+        self.position = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the broadcast listener's representation."""
+        return f'<{type(self).__name__} position = {self.position!r}>'
+    
+    
+    @property
+    def AUDIO_SETTINGS(self):
+        """
+        Returns the broadcasted source's audio settings.
+        
+        Returns
+        -------
+        audio_settings : ``AudioSettings``
+        """
+        return self.broadcast.source.AUDIO_SETTINGS
+    
+    
+    @property
+    @copy_docs(AudioSource.title)
+    def title(self):
+        return self.broadcast.source.title
+    
+    
+    @property
+    @copy_docs(AudioSource.path)
+    def path(self):
+        return self.broadcast.source.path
+    
+    
+    @copy_docs(AudioSource.postprocess)
+    async def postprocess(self):
+        broadcast = self.broadcast
+        broadcast.listeners.add(self)
+        broadcast.start()
+        self.position = broadcast._get_start_position()
+    
+    
+    @copy_docs(AudioSource.read)
+    async def read(self):
+        position, frame = await self.broadcast._get_frame(self.position)
+        if frame is None:
+            return None
+        
+        self.position = position + 1
+        return frame[self.FRAME_INDEX]
+    
+    
+    @copy_docs(AudioSource.cleanup)
+    async def cleanup(self):
+        self.broadcast.listeners.discard(self)
+    
+    
+    @copy_docs(AudioSource.__del__)
+    def __del__(self):
+        self.broadcast.listeners.discard(self)
+
+
+class BroadcastAudioReencodingListener(BroadcastAudioListener):
+    """
+    Audio source playing a broadcast's pcm frames, so they are re-encoded by the voice client's player and its
+    preferred volume is applied.
+    
+    Attributes
+    ----------
+    broadcast : ``BroadcastAudio``
+        The played broadcast.
+    position : `int`
+        The position of the next frame to play.
+    
+    Class Attributes
+    ----------------
+    FRAME_INDEX : `int` = `BROADCAST_FRAME_PCM`
+        Which one of the broadcasted frames is played.
+    NEEDS_ENCODE : `bool` = `True`
+        Whether the source is not opus encoded.
+    REPEATABLE : `bool` = `False`
+        Whether the source can be repeated after it is exhausted once.
+    """
+    __slots__ = ()
+    
+    NEEDS_ENCODE = True
+    
+    FRAME_INDEX = BROADCAST_FRAME_PCM
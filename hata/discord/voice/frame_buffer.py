@@ -0,0 +1,206 @@
+__all__ = ()
+
+from scarletio import Future, RichAttributeErrorBaseType
+
+from ..core import KOKORO
+
+
+class FrameBuffer(RichAttributeErrorBaseType):
+    """
+    Bounded ring buffer of the frames an audio player prepared ahead.
+    
+    Attributes
+    ----------
+    closed : `bool`
+        Whether no more frames will be put into the buffer.
+    exception : `None | BaseException`
+        Exception raised while preparing the frames.
+    frame_waiter : `None | Future`
+        Waiter of the consumer for a frame.
+    frames : `list<None | bytes>`
+        The ring buffer's frames.
+    length : `int`
+        How much frames are in the buffer.
+    space_waiter : `None | Future`
+        Waiter of the producer for free space.
+    start : `int`
+        The index of the first frame.
+    """
+    __slots__ = ('closed', 'exception', 'frame_waiter', 'frames', 'length', 'space_waiter', 'start')
+    
+    def __new__(cls, size):
+        """
+        Creates a new frame buffer.
+        
+        Parameters
+        ----------
+        size : `int`
+            How much frames the buffer can hold.
+        """
+        self = object.__new__(cls)
+        self.closed = False
+        self.exception = None
+        self.frame_waiter = None
+        self.frames = [None] * size
+        self.length = 0
+        self.space_waiter = None
+        self.start = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the frame buffer's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' length = ')
+        repr_parts.append(repr(self.length))
+        
+        repr_parts.append(', size = ')
+        repr_parts.append(repr(len(self.frames)))
+        
+        if self.closed:
+            repr_parts.append(', closed')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns how much frames are in the buffer."""
+        return self.length
+    
+    
+    def is_full(self):
+        """
+        Returns whether the buffer is full.
+        
+        Returns
+        -------
+        is_full : `bool`
+        """
+        return self.length == len(self.frames)
+    
+    
+    def put(self, frame):
+        """
+        Puts a frame into the buffer. The buffer should not be full.
+        
+        Parameters
+        ----------
+        frame : `bytes`
+            The frame to put.
+        """
+        frames = self.frames
+        frames[(self.start + self.length) % len(frames)] = frame
+        self.length += 1
+        self._wake_up_frame_waiter()
+    
+    
+    def pop(self):
+        """
+        Pops the first frame of the buffer.
+        
+        Returns
+        -------
+        frame : `None | bytes`
+            Returns `None` if the buffer is empty.
+        """
+        length = self.length
+        if not length:
+            return None
+        
+        frames = self.frames
+        start = self.start
+        frame = frames[start]
+        frames[start] = None
+        self.start = (start + 1) % len(frames)
+        self.length = length - 1
+        
+        space_waiter = self.space_waiter
+        if (space_waiter is not None):
+            self.space_waiter = None
+            space_waiter.set_result_if_pending(None)
+        
+        return frame
+    
+    
+    def close(self, exception):
+        """
+        Closes the buffer, marking that no more frames will be put into it.
+        
+        Parameters
+        ----------
+        exception : `None | BaseException`
+            Exception raised while preparing the frames.
+        """
+        self.closed = True
+        self.exception = exception
+        self._wake_up_frame_waiter()
+    
+    
+    def clear(self):
+        """
+        Removes every frame from the buffer and reopens it.
+        """
+        frames = self.frames
+        for index in range(len(frames)):
+            frames[index] = None
+        
+        self.closed = False
+        self.exception = None
+        self.length = 0
+        self.start = 0
+        
+        space_waiter = self.space_waiter
+        if (space_waiter is not None):
+            self.space_waiter = None
+            space_waiter.set_result_if_pending(None)
+    
+    
+    async def wait_for_frame(self):
+        """
+        Waits till a frame is put into the buffer, the buffer is closed or ``.wake_up`` is called.
+        
+        This method is a coroutine.
+        """
+        if self.length or self.closed:
+            return
+        
+        frame_waiter = self.frame_waiter
+        if frame_waiter is None:
+            frame_waiter = Future(KOKORO)
+            self.frame_waiter = frame_waiter
+        
+        await frame_waiter
+    
+    
+    async def wait_for_space(self):
+        """
+        Waits till the buffer has free space.
+        
+        This method is a coroutine.
+        """
+        while self.is_full():
+            space_waiter = self.space_waiter
+            if space_waiter is None:
+                space_waiter = Future(KOKORO)
+                self.space_waiter = space_waiter
+            
+            await space_waiter
+    
+    
+    def wake_up(self):
+        """
+        Wakes up the consumer waiting for a frame.
+        """
+        self._wake_up_frame_waiter()
+    
+    
+    def _wake_up_frame_waiter(self):
+        """
+        Wakes up the consumer waiting for a frame.
+        """
+        frame_waiter = self.frame_waiter
+        if (frame_waiter is not None):
+            self.frame_waiter = None
+            frame_waiter.set_result_if_pending(None)
@@ -0,0 +1,161 @@
+__all__ = ()
+
+from scarletio import RichAttributeErrorBaseType
+
+
+JITTER_BUFFER_SIZE = 8
+JITTER_BUFFER_DELAY = 0.1
+JITTER_BUFFER_CONCEAL_LIMIT = 10
+JITTER_BUFFER_LATE_LIMIT = 64
+JITTER_BUFFER_RESYNC_DISTANCE = 1000
+
+SEQUENCE_MASK = 0xffff
+
+
+class JitterBuffer(RichAttributeErrorBaseType):
+    """
+    Reorders the received voice packets of a source by their sequence number.
+    
+    Packets are released as soon as they are in order. A missing packet is marked as lost (`None`) when the buffer is
+    full, or when the packets after it waited for `delay` seconds.
+    
+    Attributes
+    ----------
+    delay : `float`
+        How much time the packets after a missing one may wait for it in seconds.
+    late_count : `int`
+        How much packets were dropped, because they arrived after they were marked as lost or they were duplicates.
+    lost_count : `int`
+        How much packets were marked as lost.
+    next_sequence : `int`
+        The sequence number of the next packet to release. `-1` before the first packet.
+    packets : `dict<int, (float, VoicePacket)>`
+        Sequence number - (receive time, packet) relations of the buffered packets.
+    size : `int`
+        How much packets can be buffered waiting for a missing one.
+    """
+    __slots__ = ('delay', 'late_count', 'lost_count', 'next_sequence', 'packets', 'size')
+    
+    def __new__(cls, size, delay):
+        """
+        Creates a new jitter buffer.
+        
+        Parameters
+        ----------
+        size : `int`
+            How much packets can be buffered waiting for a missing one.
+        delay : `float`
+            How much time the packets after a missing one may wait for it in seconds.
+        """
+        self = object.__new__(cls)
+        self.delay = delay
+        self.late_count = 0
+        self.lost_count = 0
+        self.next_sequence = -1
+        self.packets = {}
+        self.size = size
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the jitter buffer's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' buffered = ')
+        repr_parts.append(repr(len(self.packets)))
+        
+        repr_parts.append(', lost_count = ')
+        repr_parts.append(repr(self.lost_count))
+        
+        repr_parts.append(', late_count = ')
+        repr_parts.append(repr(self.late_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def put(self, sequence, packet, now):
+        """
+        Puts a packet into the buffer.
+        
+        Parameters
+        ----------
+        sequence : `int`
+            The packet's sequence number.
+        packet : ``VoicePacket``
+            The packet to put.
+        now : `float`
+            The current time.
+        
+        Returns
+        -------
+        added : `bool`
+            Whether the packet was added. Late and duplicate packets are dropped.
+        """
+        next_sequence = self.next_sequence
+        if next_sequence == -1:
+            self.next_sequence = sequence
+        
+        elif ((next_sequence - sequence) & SEQUENCE_MASK) <= JITTER_BUFFER_LATE_LIMIT:
+            if sequence != next_sequence:
+                self.late_count += 1
+                return False
+        
+        elif ((sequence - next_sequence) & SEQUENCE_MASK) > JITTER_BUFFER_RESYNC_DISTANCE:
+            # The source probably restarted, the buffered packets will never be in order.
+            self.lost_count += len(self.packets)
+            self.packets.clear()
+            self.next_sequence = sequence
+        
+        packets = self.packets
+        if sequence in packets:
+            self.late_count += 1
+            return False
+        
+        packets[sequence] = (now, packet)
+        return True
+    
+    
+    def release(self, now):
+        """
+        Releases the packets which are in order. Missing packets are marked as lost if waited enough for them.
+        
+        Parameters
+        ----------
+        now : `float`
+            The current time.
+        
+        Returns
+        -------
+        released : `list<None | VoicePacket>`
+            The released packets. Lost packets are represented by `None`.
+        """
+        released = []
+        packets = self.packets
+        
+        while packets:
+            next_sequence = self.next_sequence
+            try:
+                received_at, packet = packets.pop(next_sequence)
+            except KeyError:
+                if (
+                    (len(packets) < self.size) and
+                    (now - min(received_at for received_at, packet in packets.values()) < self.delay)
+                ):
+                    break
+                
+                missing_count = min((sequence - next_sequence) & SEQUENCE_MASK for sequence in packets.keys())
+                self.lost_count += missing_count
+                
+                # Concealing a long gap is not worth it, just skip it.
+                if missing_count <= JITTER_BUFFER_CONCEAL_LIMIT:
+                    released.extend([None] * missing_count)
+                
+                self.next_sequence = (next_sequence + missing_count) & SEQUENCE_MASK
+                continue
+            
+            released.append(packet)
+            self.next_sequence = (next_sequence + 1) & SEQUENCE_MASK
+        
+        return released
+
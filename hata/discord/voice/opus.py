@@ -494,6 +494,27 @@ class OpusDecoder:
         return opus.opus_packet_get_samples_per_frame(data, self.audio_settings.sampling_rate)
     
     
+    def packet_get_decoded_size(self, data):
+        """
+        Returns the size of the given packet's decoded data in bytes. A packet can contain multiple frames.
+        
+        Parameters
+        ----------
+        data : `bytes-like`
+        
+        Returns
+        -------
+        decoded_size : `int`
+        
+        Raises
+        ------
+        OpusError
+            - If the packet is invalid.
+        """
+        samples = self.packet_get_frame_count(data) * self.packet_get_samples_per_frame(data)
+        return (samples << 1) * self.audio_settings.channels
+    
+    
     def set_gain(self, adjustment): #sets decibel
         """
         Sets the gain of the decoder in decibel
@@ -552,10 +573,125 @@ class OpusDecoder:
         buffer = self._buffer
         buffer_ptr = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_int16))
         
-        end = opus.opus_decode(self._decoder, data, len(data), buffer_ptr, frame_size, True)
+        end = opus.opus_decode(self._decoder, data, len(data), buffer_ptr, frame_size, False)
         return bytes(buffer[:((end << 1) * self.audio_settings.channels)])
     
     
+    def decode_lost(self, next_data):
+        """
+        Decodes a lost packet. If the next packet is known, its forward error correction data is decoded, else packet
+        loss concealment is used.
+        
+        Parameters
+        ----------
+        next_data : `None | bytes-like`
+            The packet after the lost one.
+        
+        Returns
+        -------
+        data : `bytes`
+        """
+        buffer = self._buffer
+        buffer_ptr = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_int16))
+        
+        end = self._decode_lost_to(next_data, buffer_ptr)
+        return bytes(buffer[:((end << 1) * self.audio_settings.channels)])
+    
+    
+    def decode_into(self, data, buffer, offset):
+        """
+        Decodes the given packet directly into the given buffer.
+        
+        Parameters
+        ----------
+        data : `bytes-like`
+            The packet to decode.
+        buffer : `bytearray`
+            The buffer to decode into. Must have at least ``.packet_get_decoded_size`` free space after `offset`.
+        offset : `int`
+            The byte offset to decode at.
+        
+        Returns
+        -------
+        size : `int`
+            The decoded data's size in bytes.
+        
+        Raises
+        ------
+        OpusError
+            - If the packet is invalid or could not be decoded.
+        """
+        audio_settings = self.audio_settings
+        frame_size = self.packet_get_frame_count(data) * self.packet_get_samples_per_frame(data)
+        buffer_ptr = (ctypes.c_int16 * (frame_size * audio_settings.channels)).from_buffer(buffer, offset)
+        
+        end = opus.opus_decode(self._decoder, data, len(data), buffer_ptr, frame_size, False)
+        if end < 0:
+            raise OpusError(end)
+        
+        return (end << 1) * audio_settings.channels
+    
+    
+    def decode_lost_into(self, next_data, buffer, offset):
+        """
+        Decodes a lost packet directly into the given buffer. If the next packet is known, its forward error correction
+        data is decoded, else packet loss concealment is used.
+        
+        Parameters
+        ----------
+        next_data : `None | bytes-like`
+            The packet after the lost one.
+        buffer : `bytearray`
+            The buffer to decode into. Must have at least a frame's size of free space after `offset`.
+        offset : `int`
+            The byte offset to decode at.
+        
+        Returns
+        -------
+        size : `int`
+            The decoded data's size in bytes.
+        
+        Raises
+        ------
+        OpusError
+            - If the packet could not be concealed.
+        """
+        audio_settings = self.audio_settings
+        buffer_ptr = (ctypes.c_int16 * (audio_settings.samples_per_frame * audio_settings.channels)).from_buffer(
+            buffer, offset
+        )
+        
+        end = self._decode_lost_to(next_data, buffer_ptr)
+        if end < 0:
+            raise OpusError(end)
+        
+        return (end << 1) * audio_settings.channels
+    
+    
+    def _decode_lost_to(self, next_data, buffer_ptr):
+        """
+        Decodes a lost packet into the given pointer. The lost packet is expected to be a frame long.
+        
+        Parameters
+        ----------
+        next_data : `None | bytes-like`
+            The packet after the lost one.
+        buffer_ptr : `ctypes.POINTER(ctypes.c_int16)`
+            Pointer to decode into.
+        
+        Returns
+        -------
+        end : `int`
+            The amount of decoded samples per channel.
+        """
+        # Forward error correction requires the exact duration of the lost packet.
+        frame_size = self.audio_settings.samples_per_frame
+        if next_data is None:
+            return opus.opus_decode(self._decoder, None, 0, buffer_ptr, frame_size, False)
+        
+        return opus.opus_decode(self._decoder, next_data, len(next_data), buffer_ptr, frame_size, True)
+    
+    
     def set_audio_settings(self, audio_settings):
         """
         Sets a new audio settings to the opus decoder.
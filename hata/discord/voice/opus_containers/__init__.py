@@ -0,0 +1,14 @@
+from .base import *
+from .detect import *
+from .ogg import *
+from .utils import *
+from .webm import *
+
+
+__all__ = (
+    *base.__all__,
+    *detect.__all__,
+    *ogg.__all__,
+    *utils.__all__,
+    *webm.__all__,
+)
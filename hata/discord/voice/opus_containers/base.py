@@ -0,0 +1,83 @@
+__all__ = ()
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class OpusDemuxerBase(RichAttributeErrorBaseType):
+    """
+    Base type for demuxing opus packets from a container.
+    
+    Attributes
+    ----------
+    channels : `int`
+        The stream's channel count.
+    file : `file-like`
+        The file to read from. Must be opened in binary mode and support seeking.
+    """
+    __slots__ = ('channels', 'file')
+    
+    def __new__(cls, file):
+        """
+        Creates a new demuxer reading the stream's header from the given file.
+        
+        Parameters
+        ----------
+        file : `file-like`
+            The file to read from. Must be opened in binary mode and support seeking.
+        
+        Raises
+        ------
+        ValueError
+            - If the file is not a supported container.
+            - If the file contains no opus stream.
+        """
+        self = object.__new__(cls)
+        self.channels = 0
+        self.file = file
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the demuxer's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' channels = ')
+        repr_parts.append(repr(self.channels))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def read_packets(self):
+        """
+        Reads the next opus packets.
+        
+        Returns
+        -------
+        packets : `None | list<bytes>`
+            Returns `None` if the stream is exhausted.
+        
+        Raises
+        ------
+        ValueError
+            If the container is malformed.
+        """
+        return None
+    
+    
+    def seek(self, seconds):
+        """
+        Seeks to the given position. The next read packet is the one containing it.
+        
+        Parameters
+        ----------
+        seconds : `float`
+            The position to seek to in seconds.
+        
+        Raises
+        ------
+        ValueError
+            - If `seconds` is negative.
+            - If the container is malformed.
+        """
+        pass
@@ -0,0 +1,39 @@
+__all__ = ()
+
+from .ogg import OGG_CAPTURE_PATTERN, OggOpusDemuxer
+from .webm import EBML_ELEMENT_ID_EBML, WebMOpusDemuxer
+
+
+EBML_MAGIC = EBML_ELEMENT_ID_EBML.to_bytes(4, 'big')
+
+
+def create_opus_demuxer(file):
+    """
+    Creates an opus demuxer for the given file detecting its container by its magic.
+    
+    Parameters
+    ----------
+    file : `file-like`
+        The file to read from. Must be opened in binary mode and support seeking.
+    
+    Returns
+    -------
+    demuxer : ``OpusDemuxerBase``
+    
+    Raises
+    ------
+    ValueError
+        - If the file's container is not supported.
+        - If the file contains no opus stream.
+    """
+    offset = file.tell()
+    magic = file.read(4)
+    file.seek(offset)
+    
+    if magic == OGG_CAPTURE_PATTERN:
+        return OggOpusDemuxer(file)
+    
+    if magic == EBML_MAGIC:
+        return WebMOpusDemuxer(file)
+    
+    raise ValueError(f'Unsupported container; magic = {magic!r}.')
@@ -0,0 +1,396 @@
+__all__ = ()
+
+from bisect import bisect_right
+from struct import Struct
+
+from .base import OpusDemuxerBase
+from .utils import (
+    OPUS_HEAD_MAGIC, OPUS_SAMPLING_RATE, OPUS_TAGS_MAGIC, get_opus_packet_sample_count, parse_opus_head
+)
+
+
+OGG_CAPTURE_PATTERN = b'OggS'
+OGG_PAGE_HEADER = Struct('<4sBBqIIIB')
+
+OGG_PAGE_FLAG_CONTINUED = 1 << 0
+OGG_PAGE_FLAG_FIRST = 1 << 1
+OGG_PAGE_FLAG_LAST = 1 << 2
+
+OGG_LACING_VALUE_MAX = 255
+
+
+class OggOpusDemuxer(OpusDemuxerBase):
+    """
+    Demuxes opus packets from an Ogg container.
+    
+    The first opus logical stream is played. Chained streams following it are played as well.
+    
+    Attributes
+    ----------
+    channels : `int`
+        The stream's channel count.
+    data_offset : `int`
+        The offset of the first page after the stream's headers.
+    file : `file-like`
+        The file to read from. Must be opened in binary mode and support seeking.
+    header_packets_left : `int`
+        How much header packets are left to be skipped.
+    index : `None | (list<int>, list<int>)`
+        The granule positions and the offsets of the stream's pages. Built on the first seek.
+    partial_packet : `None | list<bytes>`
+        The segments of the packet continued on the next page. `None` if the continued packet should be dropped.
+    pre_skip : `int`
+        How much samples should be discarded from the start of the decoded stream.
+    serial : `int`
+        The played logical stream's serial number.
+    skip_till : `int`
+        Granule position till the packets are dropped after seeking. `-1` if none.
+    stream_ended : `bool`
+        Whether the played logical stream ended, so a chained one can be played.
+    """
+    __slots__ = (
+        'data_offset', 'header_packets_left', 'index', 'partial_packet', 'pre_skip', 'serial', 'skip_till',
+        'stream_ended'
+    )
+    
+    def __new__(cls, file):
+        """
+        Creates a new ogg opus demuxer reading the stream's header from the given file.
+        
+        Parameters
+        ----------
+        file : `file-like`
+            The file to read from. Must be opened in binary mode and support seeking.
+        
+        Raises
+        ------
+        ValueError
+            - If the file is not an ogg container.
+            - If the file contains no opus stream.
+        """
+        self = OpusDemuxerBase.__new__(cls, file)
+        self.data_offset = 0
+        self.header_packets_left = 0
+        self.index = None
+        self.partial_packet = None
+        self.pre_skip = 0
+        self.serial = -1
+        self.skip_till = -1
+        self.stream_ended = True
+        
+        while True:
+            page = self._read_page()
+            if page is None:
+                raise ValueError('The ogg container contains no opus stream.')
+            
+            if self._try_start_stream(page):
+                break
+        
+        while self.header_packets_left:
+            page = self._read_page()
+            if page is None:
+                raise ValueError('The ogg container has no opus comment header.')
+            
+            header_type, granule, serial, segment_table, body = page
+            if serial == self.serial:
+                self._drop_header_packets(self._split_packets(header_type, segment_table, body))
+        
+        self.data_offset = file.tell()
+        return self
+    
+    
+    def _read_page(self):
+        """
+        Reads the next page.
+        
+        Returns
+        -------
+        page : `None | (int, int, int, bytes, bytes)`
+            The page's header type, granule position, serial number, segment table and body.
+            Returns `None` at the end of the file.
+        
+        Raises
+        ------
+        ValueError
+            If the page is malformed.
+        """
+        file = self.file
+        header = file.read(OGG_PAGE_HEADER.size)
+        if not header:
+            return None
+        
+        if len(header) != OGG_PAGE_HEADER.size:
+            raise ValueError(f'Truncated ogg page header; length = {len(header)!r}.')
+        
+        capture_pattern, version, header_type, granule, serial, sequence, checksum, segment_count = (
+            OGG_PAGE_HEADER.unpack(header)
+        )
+        if capture_pattern != OGG_CAPTURE_PATTERN:
+            raise ValueError(f'Not an ogg page; capture_pattern = {capture_pattern!r}.')
+        
+        segment_table = file.read(segment_count)
+        body_size = sum(segment_table)
+        body = file.read(body_size)
+        if (len(segment_table) != segment_count) or (len(body) != body_size):
+            raise ValueError('Truncated ogg page.')
+        
+        return header_type, granule, serial, segment_table, body
+    
+    
+    def _try_start_stream(self, page):
+        """
+        Starts playing the logical stream of the given page if it is the first page of an opus stream.
+        
+        Parameters
+        ----------
+        page : `(int, int, int, bytes, bytes)`
+            The page.
+        
+        Returns
+        -------
+        started : `bool`
+        """
+        header_type, granule, serial, segment_table, body = page
+        if (not header_type & OGG_PAGE_FLAG_FIRST) or (not body.startswith(OPUS_HEAD_MAGIC)):
+            return False
+        
+        self.channels, self.pre_skip = parse_opus_head(body)
+        self.header_packets_left = 1
+        self.index = None
+        self.partial_packet = None
+        self.serial = serial
+        self.stream_ended = False
+        return True
+    
+    
+    def read_packets(self):
+        """
+        Reads the next opus packets.
+        
+        Returns
+        -------
+        packets : `None | list<bytes>`
+            Returns `None` if the stream is exhausted.
+        
+        Raises
+        ------
+        ValueError
+            If the container is malformed.
+        """
+        while True:
+            page = self._read_page()
+            if page is None:
+                return None
+            
+            if self.stream_ended:
+                self._try_start_stream(page)
+                continue
+            
+            header_type, granule, serial, segment_table, body = page
+            if serial != self.serial:
+                continue
+            
+            if header_type & OGG_PAGE_FLAG_LAST:
+                self.stream_ended = True
+            
+            packets = self._split_packets(header_type, segment_table, body)
+            
+            if self.header_packets_left:
+                self._drop_header_packets(packets)
+            
+            if (self.skip_till != -1) and packets:
+                packets = self._trim_packets(packets, granule)
+            
+            if packets:
+                return packets
+    
+    
+    def _split_packets(self, header_type, segment_table, body):
+        """
+        Splits the given page body into packets.
+        
+        Parameters
+        ----------
+        header_type : `int`
+            The page's header type.
+        segment_table : `bytes`
+            The page's segment table.
+        body : `bytes`
+            The page's body.
+        
+        Returns
+        -------
+        packets : `list<bytes>`
+            The packets completed on the page.
+        """
+        packets = []
+        
+        partial_packet = self.partial_packet
+        self.partial_packet = None
+        if header_type & OGG_PAGE_FLAG_CONTINUED:
+            segments = partial_packet
+        else:
+            segments = []
+        
+        position = 0
+        for segment_size in segment_table:
+            if (segments is not None):
+                segments.append(body[position : position + segment_size])
+            
+            position += segment_size
+            
+            if segment_size < OGG_LACING_VALUE_MAX:
+                if (segments is not None):
+                    packets.append(b''.join(segments))
+                
+                segments = []
+        
+        if segment_table and (segment_table[-1] == OGG_LACING_VALUE_MAX):
+            self.partial_packet = segments
+        
+        return packets
+    
+    
+    def _drop_header_packets(self, packets):
+        """
+        Drops the header packets from the start of the given packets.
+        
+        Parameters
+        ----------
+        packets : `list<bytes>`
+            The packets completed on a page.
+        
+        Raises
+        ------
+        ValueError
+            If the stream has no comment header.
+        """
+        header_packets_left = self.header_packets_left
+        if packets and (not packets[0].startswith(OPUS_TAGS_MAGIC)):
+            raise ValueError(f'Expected an opus comment header; got {packets[0][:8]!r}.')
+        
+        dropped = min(header_packets_left, len(packets))
+        self.header_packets_left = header_packets_left - dropped
+        del packets[:dropped]
+    
+    
+    def _trim_packets(self, packets, granule):
+        """
+        Drops the packets ending before the position seeked to.
+        
+        Parameters
+        ----------
+        packets : `list<bytes>`
+            The packets completed on a page.
+        granule : `int`
+            The page's granule position.
+        
+        Returns
+        -------
+        packets : `list<bytes>`
+        """
+        skip_till = self.skip_till
+        
+        end = granule
+        keep_from = len(packets)
+        for index in reversed(range(len(packets))):
+            if end <= skip_till:
+                break
+            
+            keep_from = index
+            end -= get_opus_packet_sample_count(packets[index])
+        
+        if keep_from < len(packets):
+            self.skip_till = -1
+        
+        return packets[keep_from:]
+    
+    
+    def _get_index(self):
+        """
+        Returns the granule positions and the offsets of the stream's pages. Builds the index if not yet built.
+        
+        Returns
+        -------
+        index : `(list<int>, list<int>)`
+        
+        Raises
+        ------
+        ValueError
+            If the container is malformed.
+        """
+        index = self.index
+        if (index is not None):
+            return index
+        
+        file = self.file
+        file.seek(self.data_offset)
+        
+        granules = []
+        offsets = []
+        serial = self.serial
+        
+        while True:
+            offset = file.tell()
+            header = file.read(OGG_PAGE_HEADER.size)
+            if len(header) != OGG_PAGE_HEADER.size:
+                break
+            
+            capture_pattern, version, header_type, granule, page_serial, sequence, checksum, segment_count = (
+                OGG_PAGE_HEADER.unpack(header)
+            )
+            if capture_pattern != OGG_CAPTURE_PATTERN:
+                raise ValueError(f'Not an ogg page; capture_pattern = {capture_pattern!r}.')
+            
+            file.seek(sum(file.read(segment_count)), 1)
+            
+            if page_serial != serial:
+                continue
+            
+            if granule != -1:
+                granules.append(granule)
+                offsets.append(offset)
+            
+            if header_type & OGG_PAGE_FLAG_LAST:
+                break
+        
+        index = (granules, offsets)
+        self.index = index
+        return index
+    
+    
+    def seek(self, seconds):
+        """
+        Seeks to the given position. The next read packet is the one containing it.
+        
+        The page to continue from is looked up in the page granule position index.
+        
+        Parameters
+        ----------
+        seconds : `float`
+            The position to seek to in seconds.
+        
+        Raises
+        ------
+        ValueError
+            - If `seconds` is negative.
+            - If the container is malformed.
+        """
+        if seconds < 0.0:
+            raise ValueError(f'`seconds` cannot be negative, got {seconds!r}.')
+        
+        granules, offsets = self._get_index()
+        target = self.pre_skip + int(seconds * OPUS_SAMPLING_RATE)
+        
+        # The page before the first one ending after the target holds the start of the packet containing it.
+        position = bisect_right(granules, target)
+        if position:
+            offset = offsets[position - 1]
+        else:
+            offset = self.data_offset
+        
+        self.file.seek(offset)
+        self.header_packets_left = 0
+        self.partial_packet = None
+        self.skip_till = target
+        self.stream_ended = False
@@ -0,0 +1,265 @@
+from ..ogg import OGG_CAPTURE_PATTERN, OGG_PAGE_FLAG_FIRST, OGG_PAGE_FLAG_LAST, OGG_PAGE_HEADER
+from ..utils import OPUS_HEAD, OPUS_HEAD_MAGIC, OPUS_TAGS_MAGIC
+from ..webm import (
+    EBML_ELEMENT_ID_BLOCK, EBML_ELEMENT_ID_BLOCK_GROUP, EBML_ELEMENT_ID_CHANNELS, EBML_ELEMENT_ID_CLUSTER,
+    EBML_ELEMENT_ID_CLUSTER_TIMECODE, EBML_ELEMENT_ID_CODEC_ID, EBML_ELEMENT_ID_CODEC_PRIVATE, EBML_ELEMENT_ID_EBML,
+    EBML_ELEMENT_ID_AUDIO, EBML_ELEMENT_ID_INFO, EBML_ELEMENT_ID_SEGMENT, EBML_ELEMENT_ID_SIMPLE_BLOCK,
+    EBML_ELEMENT_ID_TIMECODE_SCALE, EBML_ELEMENT_ID_TRACK_ENTRY, EBML_ELEMENT_ID_TRACK_NUMBER, EBML_ELEMENT_ID_TRACKS
+)
+
+
+# CELT, fullband, 20 ms, 1 frame.
+OPUS_TOC_20_MS = 0xf8
+PRE_SKIP = 312
+SERIAL = 202610170
+
+
+def create_packet(index):
+    """
+    Creates a 20 ms opus packet identifiable by its index.
+    
+    Parameters
+    ----------
+    index : `int`
+        The packet's index.
+    
+    Returns
+    -------
+    packet : `bytes`
+    """
+    return bytes((OPUS_TOC_20_MS,)) + index.to_bytes(4, 'big')
+
+
+def create_opus_head(channels):
+    """
+    Creates an opus identification header.
+    
+    Parameters
+    ----------
+    channels : `int`
+        Channel count.
+    
+    Returns
+    -------
+    data : `bytes`
+    """
+    return OPUS_HEAD.pack(OPUS_HEAD_MAGIC, 1, channels, PRE_SKIP, 48000, 0, 0)
+
+
+def create_ogg_page(header_type, granule, serial, packets, continued = b''):
+    """
+    Creates an ogg page.
+    
+    Parameters
+    ----------
+    header_type : `int`
+        The page's header type.
+    granule : `int`
+        The page's granule position.
+    serial : `int`
+        The page's serial number.
+    packets : `list<bytes>`
+        The packets completed on the page.
+    continued : `bytes` = `b''`, Optional
+        The start of a packet which continues on the next page. Its length must be a multiple of 255.
+    
+    Returns
+    -------
+    page : `bytes`
+    """
+    segment_table = []
+    for packet in packets:
+        size = len(packet)
+        while size >= 255:
+            segment_table.append(255)
+            size -= 255
+        
+        segment_table.append(size)
+    
+    segment_table.extend([255] * (len(continued) // 255))
+    
+    return b''.join([
+        OGG_PAGE_HEADER.pack(OGG_CAPTURE_PATTERN, 0, header_type, granule, serial, 0, 0, len(segment_table)),
+        bytes(segment_table),
+        *packets,
+        continued,
+    ])
+
+
+def create_ogg_opus_file(packet_count, packets_per_page):
+    """
+    Creates an ogg opus file.
+    
+    Parameters
+    ----------
+    packet_count : `int`
+        The amount of packets to create.
+    packets_per_page : `int`
+        The amount of packets on a page.
+    
+    Returns
+    -------
+    data : `bytes`
+    """
+    pages = [
+        create_ogg_page(OGG_PAGE_FLAG_FIRST, 0, SERIAL, [create_opus_head(2)]),
+        create_ogg_page(0, 0, SERIAL, [OPUS_TAGS_MAGIC + b'\x00' * 8]),
+    ]
+    
+    granule = PRE_SKIP
+    for start in range(0, packet_count, packets_per_page):
+        packets = [create_packet(index) for index in range(start, min(start + packets_per_page, packet_count))]
+        granule += 960 * len(packets)
+        header_type = OGG_PAGE_FLAG_LAST if start + packets_per_page >= packet_count else 0
+        pages.append(create_ogg_page(header_type, granule, SERIAL, packets))
+    
+    return b''.join(pages)
+
+
+def create_vint(value, length):
+    """
+    Creates an ebml variable length integer.
+    
+    Parameters
+    ----------
+    value : `int`
+        The value.
+    length : `int`
+        The integer's length.
+    
+    Returns
+    -------
+    data : `bytes`
+    """
+    return (value | (1 << (7 * length))).to_bytes(length, 'big')
+
+
+def create_ebml_element(element_id, data):
+    """
+    Creates an ebml element.
+    
+    Parameters
+    ----------
+    element_id : `int`
+        The element's identifier.
+    data : `bytes`
+        The element's body.
+    
+    Returns
+    -------
+    element : `bytes`
+    """
+    return element_id.to_bytes((element_id.bit_length() + 7) >> 3, 'big') + create_vint(len(data), 8) + data
+
+
+def create_block(track_number, relative_timecode, frame):
+    """
+    Creates a block's body without lacing.
+    
+    Parameters
+    ----------
+    track_number : `int`
+        The block's track.
+    relative_timecode : `int`
+        The block's timecode relative to its cluster's.
+    frame : `bytes`
+        The block's frame.
+    
+    Returns
+    -------
+    data : `bytes`
+    """
+    return create_vint(track_number, 1) + relative_timecode.to_bytes(2, 'big', signed = True) + b'\x80' + frame
+
+
+def create_webm_opus_file(packet_count, packets_per_cluster):
+    """
+    Creates a webm file with a video and an opus track.
+    
+    Parameters
+    ----------
+    packet_count : `int`
+        The amount of packets to create.
+    packets_per_cluster : `int`
+        The amount of packets in a cluster.
+    
+    Returns
+    -------
+    data : `bytes`
+    """
+    tracks = create_ebml_element(
+        EBML_ELEMENT_ID_TRACKS,
+        b''.join([
+            create_ebml_element(
+                EBML_ELEMENT_ID_TRACK_ENTRY,
+                create_ebml_element(EBML_ELEMENT_ID_TRACK_NUMBER, b'\x01') +
+                create_ebml_element(EBML_ELEMENT_ID_CODEC_ID, b'V_VP9'),
+            ),
+            create_ebml_element(
+                EBML_ELEMENT_ID_TRACK_ENTRY,
+                create_ebml_element(EBML_ELEMENT_ID_TRACK_NUMBER, b'\x02') +
+                create_ebml_element(EBML_ELEMENT_ID_CODEC_ID, b'A_OPUS') +
+                create_ebml_element(EBML_ELEMENT_ID_CODEC_PRIVATE, create_opus_head(2)) +
+                create_ebml_element(EBML_ELEMENT_ID_AUDIO, create_ebml_element(EBML_ELEMENT_ID_CHANNELS, b'\x02')),
+            ),
+        ]),
+    )
+    
+    clusters = []
+    for start in range(0, packet_count, packets_per_cluster):
+        cluster_parts = [create_ebml_element(EBML_ELEMENT_ID_CLUSTER_TIMECODE, (start * 20).to_bytes(4, 'big'))]
+        
+        for index in range(start, min(start + packets_per_cluster, packet_count)):
+            relative_timecode = (index - start) * 20
+            cluster_parts.append(
+                create_ebml_element(EBML_ELEMENT_ID_SIMPLE_BLOCK, create_block(1, relative_timecode, b'video'))
+            )
+            
+            block = create_block(2, relative_timecode, create_packet(index))
+            if index & 1:
+                cluster_parts.append(
+                    create_ebml_element(EBML_ELEMENT_ID_BLOCK_GROUP, create_ebml_element(EBML_ELEMENT_ID_BLOCK, block))
+                )
+            else:
+                cluster_parts.append(create_ebml_element(EBML_ELEMENT_ID_SIMPLE_BLOCK, block))
+        
+        clusters.append(create_ebml_element(EBML_ELEMENT_ID_CLUSTER, b''.join(cluster_parts)))
+    
+    return b''.join([
+        create_ebml_element(EBML_ELEMENT_ID_EBML, b''),
+        create_ebml_element(
+            EBML_ELEMENT_ID_SEGMENT,
+            b''.join([
+                create_ebml_element(
+                    EBML_ELEMENT_ID_INFO,
+                    create_ebml_element(EBML_ELEMENT_ID_TIMECODE_SCALE, (1000000).to_bytes(3, 'big')),
+                ),
+                tracks,
+                *clusters,
+            ]),
+        ),
+    ])
+
+
+def read_all_packets(demuxer):
+    """
+    Reads every packet of the given demuxer.
+    
+    Parameters
+    ----------
+    demuxer : ``OpusDemuxerBase``
+        The demuxer to read with.
+    
+    Returns
+    -------
+    packets : `list<bytes>`
+    """
+    packets = []
+    while True:
+        new_packets = demuxer.read_packets()
+        if new_packets is None:
+            break
+        
+        packets.extend(new_packets)
+    
+    return packets
@@ -0,0 +1,130 @@
+from io import BytesIO
+
+import vampytest
+
+from ..ogg import OGG_PAGE_FLAG_CONTINUED, OGG_PAGE_FLAG_FIRST, OGG_PAGE_FLAG_LAST, OggOpusDemuxer
+from ..utils import OPUS_TAGS_MAGIC
+
+from .helpers import (
+    PRE_SKIP, SERIAL, create_ogg_opus_file, create_ogg_page, create_opus_head, create_packet, read_all_packets
+)
+
+
+def _assert_fields_set(demuxer):
+    """
+    Asserts whether every field of the given demuxer is set.
+    
+    Parameters
+    ----------
+    demuxer : ``OggOpusDemuxer``
+        The demuxer to check.
+    """
+    vampytest.assert_instance(demuxer, OggOpusDemuxer)
+    vampytest.assert_instance(demuxer.channels, int)
+    vampytest.assert_instance(demuxer.data_offset, int)
+    vampytest.assert_instance(demuxer.header_packets_left, int)
+    vampytest.assert_instance(demuxer.index, tuple, nullable = True)
+    vampytest.assert_instance(demuxer.partial_packet, list, nullable = True)
+    vampytest.assert_instance(demuxer.pre_skip, int)
+    vampytest.assert_instance(demuxer.serial, int)
+    vampytest.assert_instance(demuxer.skip_till, int)
+    vampytest.assert_instance(demuxer.stream_ended, bool)
+
+
+def test__OggOpusDemuxer__new():
+    """
+    Tests whether ``OggOpusDemuxer.__new__`` works as intended.
+    """
+    file = BytesIO(create_ogg_opus_file(10, 4))
+    
+    demuxer = OggOpusDemuxer(file)
+    _assert_fields_set(demuxer)
+    
+    vampytest.assert_eq(demuxer.channels, 2)
+    vampytest.assert_eq(demuxer.pre_skip, PRE_SKIP)
+    vampytest.assert_eq(demuxer.serial, SERIAL)
+    vampytest.assert_eq(demuxer.header_packets_left, 0)
+
+
+def test__OggOpusDemuxer__new__no_opus():
+    """
+    Tests whether ``OggOpusDemuxer.__new__`` works as intended.
+    
+    Case: no opus stream.
+    """
+    file = BytesIO(create_ogg_page(OGG_PAGE_FLAG_FIRST | OGG_PAGE_FLAG_LAST, 0, SERIAL, [b'\x01vorbis']))
+    
+    with vampytest.assert_raises(ValueError):
+        OggOpusDemuxer(file)
+
+
+def test__OggOpusDemuxer__read_packets():
+    """
+    Tests whether ``OggOpusDemuxer.read_packets`` works as intended.
+    """
+    file = BytesIO(create_ogg_opus_file(10, 4))
+    demuxer = OggOpusDemuxer(file)
+    
+    output = read_all_packets(demuxer)
+    vampytest.assert_eq(output, [create_packet(index) for index in range(10)])
+    vampytest.assert_is(demuxer.read_packets(), None)
+
+
+def test__OggOpusDemuxer__read_packets__continued():
+    """
+    Tests whether ``OggOpusDemuxer.read_packets`` works as intended.
+    
+    Case: packet continued on the next page and an interleaved stream.
+    """
+    long_packet = create_packet(0) + b'\x00' * 505
+    
+    file = BytesIO(b''.join([
+        create_ogg_page(OGG_PAGE_FLAG_FIRST, 0, SERIAL, [create_opus_head(1)]),
+        create_ogg_page(OGG_PAGE_FLAG_FIRST, 0, SERIAL + 1, [b'\x01vorbis']),
+        create_ogg_page(0, 0, SERIAL, [OPUS_TAGS_MAGIC]),
+        create_ogg_page(0, -1, SERIAL, [], long_packet[:510]),
+        create_ogg_page(OGG_PAGE_FLAG_CONTINUED, 0, SERIAL + 1, [b'vorbis']),
+        create_ogg_page(
+            OGG_PAGE_FLAG_CONTINUED | OGG_PAGE_FLAG_LAST, 1920, SERIAL, [long_packet[510:], create_packet(1)]
+        ),
+    ]))
+    demuxer = OggOpusDemuxer(file)
+    
+    output = read_all_packets(demuxer)
+    vampytest.assert_eq(len(output), 2)
+    vampytest.assert_eq(output[1], create_packet(1))
+    vampytest.assert_eq(len(output[0]), len(long_packet))
+    vampytest.assert_eq(output[0][:5], create_packet(0))
+
+
+def test__OggOpusDemuxer__seek():
+    """
+    Tests whether ``OggOpusDemuxer.seek`` works as intended.
+    """
+    file = BytesIO(create_ogg_opus_file(100, 7))
+    demuxer = OggOpusDemuxer(file)
+    
+    for seconds, expected_index in ((1.0, 50), (0.0, 0), (0.51, 25), (1.99, 99), (2.5, None)):
+        demuxer.seek(seconds)
+        packets = read_all_packets(demuxer)
+        
+        if expected_index is None:
+            vampytest.assert_eq(packets, [])
+        else:
+            vampytest.assert_eq(packets[0], create_packet(expected_index))
+            vampytest.assert_eq(packets[-1], create_packet(99))
+    
+    vampytest.assert_is_not(demuxer.index, None)
+
+
+def test__OggOpusDemuxer__seek__negative():
+    """
+    Tests whether ``OggOpusDemuxer.seek`` works as intended.
+    
+    Case: negative.
+    """
+    file = BytesIO(create_ogg_opus_file(10, 4))
+    demuxer = OggOpusDemuxer(file)
+    
+    with vampytest.assert_raises(ValueError):
+        demuxer.seek(-1.0)
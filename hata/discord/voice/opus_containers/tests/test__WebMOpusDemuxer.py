@@ -0,0 +1,84 @@
+from io import BytesIO
+
+import vampytest
+
+from ..webm import WebMOpusDemuxer
+
+from .helpers import create_packet, create_webm_opus_file, read_all_packets
+
+
+def _assert_fields_set(demuxer):
+    """
+    Asserts whether every field of the given demuxer is set.
+    
+    Parameters
+    ----------
+    demuxer : ``WebMOpusDemuxer``
+        The demuxer to check.
+    """
+    vampytest.assert_instance(demuxer, WebMOpusDemuxer)
+    vampytest.assert_instance(demuxer.channels, int)
+    vampytest.assert_instance(demuxer.cluster_timecode, int)
+    vampytest.assert_instance(demuxer.data_offset, int)
+    vampytest.assert_instance(demuxer.index, tuple, nullable = True)
+    vampytest.assert_instance(demuxer.skip_till, int)
+    vampytest.assert_instance(demuxer.timecode_scale, int)
+    vampytest.assert_instance(demuxer.track_number, int)
+
+
+def test__WebMOpusDemuxer__new():
+    """
+    Tests whether ``WebMOpusDemuxer.__new__`` works as intended.
+    """
+    file = BytesIO(create_webm_opus_file(10, 4))
+    
+    demuxer = WebMOpusDemuxer(file)
+    _assert_fields_set(demuxer)
+    
+    vampytest.assert_eq(demuxer.channels, 2)
+    vampytest.assert_eq(demuxer.timecode_scale, 1000000)
+    vampytest.assert_eq(demuxer.track_number, 2)
+
+
+def test__WebMOpusDemuxer__new__not_ebml():
+    """
+    Tests whether ``WebMOpusDemuxer.__new__`` works as intended.
+    
+    Case: not an ebml container.
+    """
+    file = BytesIO(b'OggS' + b'\x00' * 32)
+    
+    with vampytest.assert_raises(ValueError):
+        WebMOpusDemuxer(file)
+
+
+def test__WebMOpusDemuxer__read_packets():
+    """
+    Tests whether ``WebMOpusDemuxer.read_packets`` works as intended.
+    """
+    file = BytesIO(create_webm_opus_file(120, 25))
+    demuxer = WebMOpusDemuxer(file)
+    
+    output = read_all_packets(demuxer)
+    vampytest.assert_eq(output, [create_packet(index) for index in range(120)])
+    vampytest.assert_is(demuxer.read_packets(), None)
+
+
+def test__WebMOpusDemuxer__seek():
+    """
+    Tests whether ``WebMOpusDemuxer.seek`` works as intended.
+    """
+    file = BytesIO(create_webm_opus_file(100, 7))
+    demuxer = WebMOpusDemuxer(file)
+    
+    for seconds, expected_index in ((1.0, 50), (0.0, 0), (0.51, 25), (1.99, 99), (2.5, None)):
+        demuxer.seek(seconds)
+        packets = read_all_packets(demuxer)
+        
+        if expected_index is None:
+            vampytest.assert_eq(packets, [])
+        else:
+            vampytest.assert_eq(packets[0], create_packet(expected_index))
+            vampytest.assert_eq(packets[-1], create_packet(99))
+    
+    vampytest.assert_eq(len(demuxer.index[0]), 15)
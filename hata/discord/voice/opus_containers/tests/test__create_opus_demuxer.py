@@ -0,0 +1,41 @@
+from io import BytesIO
+
+import vampytest
+
+from ..detect import create_opus_demuxer
+from ..ogg import OggOpusDemuxer
+from ..webm import WebMOpusDemuxer
+
+from .helpers import create_ogg_opus_file, create_webm_opus_file
+
+
+def _iter_options():
+    yield create_ogg_opus_file(4, 4), OggOpusDemuxer
+    yield create_webm_opus_file(4, 4), WebMOpusDemuxer
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__create_opus_demuxer(data):
+    """
+    Tests whether ``create_opus_demuxer`` works as intended.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The file's content.
+    
+    Returns
+    -------
+    output : `type<OpusDemuxerBase>`
+    """
+    return type(create_opus_demuxer(BytesIO(data)))
+
+
+def test__create_opus_demuxer__unsupported():
+    """
+    Tests whether ``create_opus_demuxer`` works as intended.
+    
+    Case: unsupported container.
+    """
+    with vampytest.assert_raises(ValueError):
+        create_opus_demuxer(BytesIO(b'RIFF' + b'\x00' * 40))
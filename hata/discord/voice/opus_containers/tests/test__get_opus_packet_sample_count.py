@@ -0,0 +1,37 @@
+import vampytest
+
+from ..utils import get_opus_packet_sample_count
+
+
+def _iter_options():
+    yield b'', 0
+    # CELT, 20 ms, 1 frame
+    yield b'\xf8', 960
+    # CELT, 2.5 ms, 2 frames
+    yield b'\x81', 240
+    # SILK, 60 ms, 2 frames
+    yield b'\x1a', 5760
+    # hybrid, 10 ms, 1 frame
+    yield b'\x60', 480
+    # CELT, 20 ms, arbitrary frame count (3)
+    yield b'\xfb\x03', 2880
+    yield b'\xfb', 0
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_opus_packet_sample_count(packet):
+    """
+    Tests whether ``get_opus_packet_sample_count`` works as intended.
+    
+    Parameters
+    ----------
+    packet : `bytes`
+        Opus packet.
+    
+    Returns
+    -------
+    output : `int`
+    """
+    output = get_opus_packet_sample_count(packet)
+    vampytest.assert_instance(output, int)
+    return output
@@ -0,0 +1,38 @@
+import vampytest
+
+from ..utils import OPUS_HEAD, OPUS_HEAD_MAGIC, parse_opus_head
+
+
+def test__parse_opus_head():
+    """
+    Tests whether ``parse_opus_head`` works as intended.
+    """
+    data = OPUS_HEAD.pack(OPUS_HEAD_MAGIC, 1, 2, 312, 44100, 0, 0)
+    
+    output = parse_opus_head(data)
+    vampytest.assert_eq(output, (2, 312))
+
+
+def _iter_options__value_error():
+    yield b''
+    yield b'OpusTags' + b'\x00' * 11
+    yield OPUS_HEAD.pack(OPUS_HEAD_MAGIC, 16, 2, 312, 44100, 0, 0)
+
+
+@vampytest._(vampytest.call_from(_iter_options__value_error()).raising(ValueError))
+def test__parse_opus_head__value_error(data):
+    """
+    Tests whether ``parse_opus_head`` works as intended.
+    
+    Case: value error.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The header's data.
+    
+    Raises
+    ------
+    ValueError
+    """
+    parse_opus_head(data)
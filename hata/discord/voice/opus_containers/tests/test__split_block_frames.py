@@ -0,0 +1,44 @@
+import vampytest
+
+from ..webm import split_block_frames
+
+
+def _iter_options():
+    # no lacing
+    yield b'\x81\x00\x14\x80abc', (1, 20, [b'abc'])
+    # xiph lacing
+    yield b'\x82\xff\xec\x82\x02\x01\x02abcdef', (2, -20, [b'a', b'bc', b'def'])
+    # fixed lacing
+    yield b'\x81\x00\x00\x84\x01abcdef', (1, 0, [b'abc', b'def'])
+    # ebml lacing, the second size is stored as a signed difference: `0xbf` is `0`, `0xc0` is `+1`
+    yield b'\x81\x00\x00\x86\x02\x81\xbfabcdef', (1, 0, [b'a', b'b', b'cdef'])
+    yield b'\x81\x00\x00\x86\x02\x82\xc0abcdef', (1, 0, [b'ab', b'cde', b'f'])
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__split_block_frames(data):
+    """
+    Tests whether ``split_block_frames`` works as intended.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The block's body.
+    
+    Returns
+    -------
+    output : `(int, int, list<bytes>)`
+    """
+    output = split_block_frames(data)
+    vampytest.assert_instance(output, tuple)
+    return output
+
+
+def test__split_block_frames__truncated():
+    """
+    Tests whether ``split_block_frames`` works as intended.
+    
+    Case: truncated.
+    """
+    with vampytest.assert_raises(ValueError):
+        split_block_frames(b'\x81\x00')
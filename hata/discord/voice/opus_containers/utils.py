@@ -0,0 +1,85 @@
+__all__ = ()
+
+from struct import Struct
+
+
+OPUS_SAMPLING_RATE = 48000
+
+OPUS_HEAD_MAGIC = b'OpusHead'
+OPUS_HEAD = Struct('<8sBBHIhB')
+OPUS_TAGS_MAGIC = b'OpusTags'
+
+# Frame sizes in samples at 48 kHz by the configuration's last bits.
+OPUS_FRAME_SIZES_SILK = (480, 960, 1920, 2880)
+OPUS_FRAME_SIZES_HYBRID = (480, 960)
+OPUS_FRAME_SIZES_CELT = (120, 240, 480, 960)
+
+
+def get_opus_packet_sample_count(packet):
+    """
+    Returns how much samples (at 48 kHz) the given opus packet contains based on its table of contents byte.
+    
+    Parameters
+    ----------
+    packet : `bytes`
+        Opus packet.
+    
+    Returns
+    -------
+    sample_count : `int`
+    """
+    if not packet:
+        return 0
+    
+    toc = packet[0]
+    config = toc >> 3
+    if config < 12:
+        frame_size = OPUS_FRAME_SIZES_SILK[config & 3]
+    elif config < 16:
+        frame_size = OPUS_FRAME_SIZES_HYBRID[config & 1]
+    else:
+        frame_size = OPUS_FRAME_SIZES_CELT[config & 3]
+    
+    code = toc & 3
+    if code == 0:
+        frame_count = 1
+    elif code < 3:
+        frame_count = 2
+    elif len(packet) < 2:
+        frame_count = 0
+    else:
+        frame_count = packet[1] & 0x3f
+    
+    return frame_size * frame_count
+
+
+def parse_opus_head(data):
+    """
+    Parses an opus identification header.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The header's data.
+    
+    Returns
+    -------
+    channels : `int`
+        The stream's channel count.
+    pre_skip : `int`
+        How much samples should be discarded from the start of the decoded stream.
+    
+    Raises
+    ------
+    ValueError
+        - If `data` is not an opus identification header.
+        - If the header's version is not supported.
+    """
+    if (len(data) < OPUS_HEAD.size) or (not data.startswith(OPUS_HEAD_MAGIC)):
+        raise ValueError(f'Not an opus identification header; data = {bytes(data[:OPUS_HEAD.size])!r}.')
+    
+    magic, version, channels, pre_skip, input_sampling_rate, output_gain, mapping_family = OPUS_HEAD.unpack_from(data)
+    if version >> 4:
+        raise ValueError(f'Unsupported opus identification header version; version = {version!r}.')
+    
+    return channels, pre_skip
@@ -0,0 +1,554 @@
+__all__ = ()
+
+from bisect import bisect_right
+
+from .base import OpusDemuxerBase
+from .utils import OPUS_SAMPLING_RATE, get_opus_packet_sample_count, parse_opus_head
+
+
+EBML_ELEMENT_ID_EBML = 0x1a45dfa3
+EBML_ELEMENT_ID_SEGMENT = 0x18538067
+EBML_ELEMENT_ID_INFO = 0x1549a966
+EBML_ELEMENT_ID_TIMECODE_SCALE = 0x2ad7b1
+EBML_ELEMENT_ID_TRACKS = 0x1654ae6b
+EBML_ELEMENT_ID_TRACK_ENTRY = 0xae
+EBML_ELEMENT_ID_TRACK_NUMBER = 0xd7
+EBML_ELEMENT_ID_CODEC_ID = 0x86
+EBML_ELEMENT_ID_CODEC_PRIVATE = 0x63a2
+EBML_ELEMENT_ID_AUDIO = 0xe1
+EBML_ELEMENT_ID_CHANNELS = 0x9f
+EBML_ELEMENT_ID_CLUSTER = 0x1f43b675
+EBML_ELEMENT_ID_CLUSTER_TIMECODE = 0xe7
+EBML_ELEMENT_ID_SIMPLE_BLOCK = 0xa3
+EBML_ELEMENT_ID_BLOCK_GROUP = 0xa0
+EBML_ELEMENT_ID_BLOCK = 0xa1
+
+# Elements whose children are read as if they would be on the same level.
+EBML_ELEMENT_IDS_DESCENDED = frozenset((
+    EBML_ELEMENT_ID_SEGMENT,
+    EBML_ELEMENT_ID_CLUSTER,
+    EBML_ELEMENT_ID_BLOCK_GROUP,
+))
+
+EBML_SIZE_UNKNOWN = -1
+EBML_ELEMENT_HEADER_SIZE_MAX = 12
+
+WEBM_CODEC_ID_OPUS = b'A_OPUS'
+WEBM_LACING_NONE = 0
+WEBM_LACING_XIPH = 1
+WEBM_LACING_FIXED = 2
+WEBM_LACING_EBML = 3
+WEBM_PACKET_BATCH_SIZE = 50
+WEBM_TIMECODE_SCALE_DEFAULT = 1000000
+
+
+def parse_vint(data, position, keep_marker):
+    """
+    Parses an ebml variable length integer.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The data to parse from.
+    position : `int`
+        The position to parse from.
+    keep_marker : `bool`
+        Whether the length marker bit should be kept, like in case of element identifiers.
+    
+    Returns
+    -------
+    value : `int`
+        The parsed value. `EBML_SIZE_UNKNOWN` if every value bit is set and the marker is not kept.
+    position : `int`
+        The position after the integer.
+    
+    Raises
+    ------
+    ValueError
+        If the integer is malformed.
+    """
+    if position >= len(data):
+        raise ValueError('Truncated ebml variable length integer.')
+    
+    first = data[position]
+    if not first:
+        raise ValueError(f'Invalid ebml variable length integer at {position!r}.')
+    
+    length = 9 - first.bit_length()
+    end = position + length
+    if end > len(data):
+        raise ValueError('Truncated ebml variable length integer.')
+    
+    value = int.from_bytes(data[position : end], 'big')
+    if not keep_marker:
+        value_bit_count = 7 * length
+        value &= (1 << value_bit_count) - 1
+        if value == (1 << value_bit_count) - 1:
+            value = EBML_SIZE_UNKNOWN
+    
+    return value, end
+
+
+def read_element_header(file):
+    """
+    Reads an ebml element's header from the given file.
+    
+    Parameters
+    ----------
+    file : `file-like`
+        The file to read from.
+    
+    Returns
+    -------
+    header : `None | (int, int)`
+        The element's identifier and size. Returns `None` at the end of the file.
+    
+    Raises
+    ------
+    ValueError
+        If the header is malformed.
+    """
+    # Read the longest possible header at once, then step back to its end.
+    data = file.read(EBML_ELEMENT_HEADER_SIZE_MAX)
+    if not data:
+        return None
+    
+    element_id, position = parse_vint(data, 0, True)
+    size, position = parse_vint(data, position, False)
+    
+    if position != len(data):
+        file.seek(position - len(data), 1)
+    
+    return element_id, size
+
+
+def iter_elements(data):
+    """
+    Iterates over the ebml elements of the given master element's body.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The master element's body.
+    
+    Yields
+    ------
+    element : `(int, bytes)`
+        The element's identifier and body.
+    
+    Raises
+    ------
+    ValueError
+        If an element is malformed.
+    """
+    position = 0
+    length = len(data)
+    while position < length:
+        element_id, position = parse_vint(data, position, True)
+        size, position = parse_vint(data, position, False)
+        if size == EBML_SIZE_UNKNOWN:
+            size = length - position
+        
+        yield element_id, data[position : position + size]
+        position += size
+
+
+def split_block_frames(data):
+    """
+    Splits a block's body into its track number, relative timecode and frames.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The block's body.
+    
+    Returns
+    -------
+    track_number : `int`
+        The block's track.
+    relative_timecode : `int`
+        The block's timecode relative to its cluster's.
+    frames : `list<bytes>`
+        The block's frames.
+    
+    Raises
+    ------
+    ValueError
+        If the block is malformed.
+    """
+    track_number, position = parse_vint(data, 0, False)
+    if position + 3 > len(data):
+        raise ValueError('Truncated block header.')
+    
+    relative_timecode = int.from_bytes(data[position : position + 2], 'big', signed = True)
+    lacing = (data[position + 2] >> 1) & 3
+    position += 3
+    
+    if lacing == WEBM_LACING_NONE:
+        return track_number, relative_timecode, [data[position:]]
+    
+    if position >= len(data):
+        raise ValueError('Truncated block lacing header.')
+    
+    frame_count = data[position] + 1
+    position += 1
+    
+    if lacing == WEBM_LACING_FIXED:
+        frame_size, remainder = divmod(len(data) - position, frame_count)
+        if remainder:
+            raise ValueError('Fixed size lacing with uneven frames.')
+        
+        frame_sizes = [frame_size] * (frame_count - 1)
+    
+    elif lacing == WEBM_LACING_XIPH:
+        frame_sizes = []
+        for index in range(frame_count - 1):
+            frame_size = 0
+            while True:
+                if position >= len(data):
+                    raise ValueError('Truncated xiph lacing.')
+                
+                value = data[position]
+                position += 1
+                frame_size += value
+                if value != 255:
+                    break
+            
+            frame_sizes.append(frame_size)
+    
+    else:
+        frame_size, position = parse_vint(data, position, False)
+        frame_sizes = [frame_size]
+        for index in range(frame_count - 2):
+            start = position
+            difference, position = parse_vint(data, position, False)
+            # Signed: subtract the half of the value range.
+            difference -= (1 << (7 * (position - start) - 1)) - 1
+            frame_size += difference
+            frame_sizes.append(frame_size)
+    
+    frames = []
+    for frame_size in frame_sizes:
+        frames.append(data[position : position + frame_size])
+        position += frame_size
+    
+    if position > len(data):
+        raise ValueError('Laced frames overflow their block.')
+    
+    frames.append(data[position:])
+    return track_number, relative_timecode, frames
+
+
+class WebMOpusDemuxer(OpusDemuxerBase):
+    """
+    Demuxes opus packets from a WebM (or Matroska) container.
+    
+    The first opus track is played.
+    
+    Attributes
+    ----------
+    channels : `int`
+        The stream's channel count.
+    cluster_timecode : `int`
+        The actual cluster's timecode.
+    data_offset : `int`
+        The offset of the first cluster.
+    file : `file-like`
+        The file to read from. Must be opened in binary mode and support seeking.
+    index : `None | (list<int>, list<int>)`
+        The timecodes and the offsets of the clusters. Built on the first seek.
+    skip_till : `int`
+        Time in nanoseconds till the packets are dropped after seeking. `-1` if none.
+    timecode_scale : `int`
+        Nanoseconds per timecode unit.
+    track_number : `int`
+        The played track.
+    """
+    __slots__ = ('cluster_timecode', 'data_offset', 'index', 'skip_till', 'timecode_scale', 'track_number')
+    
+    def __new__(cls, file):
+        """
+        Creates a new webm opus demuxer reading the stream's header from the given file.
+        
+        Parameters
+        ----------
+        file : `file-like`
+            The file to read from. Must be opened in binary mode and support seeking.
+        
+        Raises
+        ------
+        ValueError
+            - If the file is not an ebml container.
+            - If the file contains no opus track.
+        """
+        self = OpusDemuxerBase.__new__(cls, file)
+        self.cluster_timecode = 0
+        self.data_offset = 0
+        self.index = None
+        self.skip_till = -1
+        self.timecode_scale = WEBM_TIMECODE_SCALE_DEFAULT
+        self.track_number = 0
+        
+        header = read_element_header(file)
+        if (header is None) or (header[0] != EBML_ELEMENT_ID_EBML):
+            raise ValueError('Not an ebml container.')
+        
+        file.seek(header[1], 1)
+        
+        while True:
+            offset = file.tell()
+            header = read_element_header(file)
+            if header is None:
+                break
+            
+            element_id, size = header
+            if element_id == EBML_ELEMENT_ID_CLUSTER:
+                file.seek(offset)
+                break
+            
+            if element_id == EBML_ELEMENT_ID_SEGMENT:
+                continue
+            
+            if size == EBML_SIZE_UNKNOWN:
+                raise ValueError(f'Unknown size for element 0x{element_id:x}.')
+            
+            if element_id == EBML_ELEMENT_ID_INFO:
+                self._parse_info(file.read(size))
+            
+            elif element_id == EBML_ELEMENT_ID_TRACKS:
+                self._parse_tracks(file.read(size))
+            
+            else:
+                file.seek(size, 1)
+        
+        if not self.track_number:
+            raise ValueError('The ebml container contains no opus track.')
+        
+        self.data_offset = file.tell()
+        return self
+    
+    
+    def _parse_info(self, data):
+        """
+        Parses the segment's information.
+        
+        Parameters
+        ----------
+        data : `bytes`
+            The element's body.
+        """
+        for element_id, element_data in iter_elements(data):
+            if element_id == EBML_ELEMENT_ID_TIMECODE_SCALE:
+                self.timecode_scale = int.from_bytes(element_data, 'big') or WEBM_TIMECODE_SCALE_DEFAULT
+    
+    
+    def _parse_tracks(self, data):
+        """
+        Parses the segment's tracks, selecting the first opus one.
+        
+        Parameters
+        ----------
+        data : `bytes`
+            The element's body.
+        """
+        for element_id, element_data in iter_elements(data):
+            if (element_id != EBML_ELEMENT_ID_TRACK_ENTRY) or self.track_number:
+                continue
+            
+            track_number = 0
+            codec_id = b''
+            codec_private = b''
+            channels = 0
+            
+            for sub_element_id, sub_element_data in iter_elements(element_data):
+                if sub_element_id == EBML_ELEMENT_ID_TRACK_NUMBER:
+                    track_number = int.from_bytes(sub_element_data, 'big')
+                
+                elif sub_element_id == EBML_ELEMENT_ID_CODEC_ID:
+                    codec_id = sub_element_data.rstrip(b'\x00')
+                
+                elif sub_element_id == EBML_ELEMENT_ID_CODEC_PRIVATE:
+                    codec_private = sub_element_data
+                
+                elif sub_element_id == EBML_ELEMENT_ID_AUDIO:
+                    for audio_element_id, audio_element_data in iter_elements(sub_element_data):
+                        if audio_element_id == EBML_ELEMENT_ID_CHANNELS:
+                            channels = int.from_bytes(audio_element_data, 'big')
+            
+            if (codec_id != WEBM_CODEC_ID_OPUS) or (not track_number):
+                continue
+            
+            if codec_private:
+                channels, pre_skip = parse_opus_head(codec_private)
+            
+            self.channels = channels
+            self.track_number = track_number
+    
+    
+    def read_packets(self):
+        """
+        Reads the next opus packets.
+        
+        Returns
+        -------
+        packets : `None | list<bytes>`
+            Returns `None` if the stream is exhausted.
+        
+        Raises
+        ------
+        ValueError
+            If the container is malformed.
+        """
+        file = self.file
+        packets = []
+        
+        while len(packets) < WEBM_PACKET_BATCH_SIZE:
+            header = read_element_header(file)
+            if header is None:
+                break
+            
+            element_id, size = header
+            if element_id in EBML_ELEMENT_IDS_DESCENDED:
+                continue
+            
+            if size == EBML_SIZE_UNKNOWN:
+                raise ValueError(f'Unknown size for element 0x{element_id:x}.')
+            
+            if element_id == EBML_ELEMENT_ID_CLUSTER_TIMECODE:
+                self.cluster_timecode = int.from_bytes(file.read(size), 'big')
+            
+            elif (element_id == EBML_ELEMENT_ID_SIMPLE_BLOCK) or (element_id == EBML_ELEMENT_ID_BLOCK):
+                self._add_block_packets(file.read(size), packets)
+            
+            else:
+                file.seek(size, 1)
+        
+        if not packets:
+            return None
+        
+        return packets
+    
+    
+    def _add_block_packets(self, data, packets):
+        """
+        Adds the packets of the given block to `packets` if it belongs to the played track.
+        
+        Parameters
+        ----------
+        data : `bytes`
+            The block's body.
+        packets : `list<bytes>`
+            The packets to extend.
+        """
+        track_number, relative_timecode, frames = split_block_frames(data)
+        if track_number != self.track_number:
+            return
+        
+        skip_till = self.skip_till
+        if skip_till == -1:
+            packets.extend(frames)
+            return
+        
+        # Drop the frames ending before the position seeked to.
+        start = (self.cluster_timecode + relative_timecode) * self.timecode_scale
+        for index, frame in enumerate(frames):
+            start += get_opus_packet_sample_count(frame) * 1000000000 // OPUS_SAMPLING_RATE
+            if start > skip_till:
+                self.skip_till = -1
+                packets.extend(frames[index:])
+                break
+    
+    
+    def _get_index(self):
+        """
+        Returns the timecodes and the offsets of the clusters. Builds the index if not yet built.
+        
+        Returns
+        -------
+        index : `(list<int>, list<int>)`
+        
+        Raises
+        ------
+        ValueError
+            If the container is malformed.
+        """
+        index = self.index
+        if (index is not None):
+            return index
+        
+        file = self.file
+        file.seek(self.data_offset)
+        
+        timecodes = []
+        offsets = []
+        cluster_offset = -1
+        cluster_end = -1
+        
+        while True:
+            offset = file.tell()
+            header = read_element_header(file)
+            if header is None:
+                break
+            
+            element_id, size = header
+            if element_id == EBML_ELEMENT_ID_CLUSTER:
+                cluster_offset = offset
+                cluster_end = -1 if size == EBML_SIZE_UNKNOWN else file.tell() + size
+                continue
+            
+            if element_id in EBML_ELEMENT_IDS_DESCENDED:
+                continue
+            
+            if size == EBML_SIZE_UNKNOWN:
+                raise ValueError(f'Unknown size for element 0x{element_id:x}.')
+            
+            if (element_id == EBML_ELEMENT_ID_CLUSTER_TIMECODE) and (cluster_offset != -1):
+                timecodes.append(int.from_bytes(file.read(size), 'big'))
+                offsets.append(cluster_offset)
+                cluster_offset = -1
+                
+                # Clusters with known size can be skipped without reading their blocks.
+                if cluster_end != -1:
+                    file.seek(cluster_end)
+                
+                continue
+            
+            file.seek(size, 1)
+        
+        index = (timecodes, offsets)
+        self.index = index
+        return index
+    
+    
+    def seek(self, seconds):
+        """
+        Seeks to the given position. The next read packet is the one containing it.
+        
+        The cluster to continue from is looked up in the cluster timecode index.
+        
+        Parameters
+        ----------
+        seconds : `float`
+            The position to seek to in seconds.
+        
+        Raises
+        ------
+        ValueError
+            - If `seconds` is negative.
+            - If the container is malformed.
+        """
+        if seconds < 0.0:
+            raise ValueError(f'`seconds` cannot be negative, got {seconds!r}.')
+        
+        timecodes, offsets = self._get_index()
+        target = int(seconds * 1000000000)
+        
+        position = bisect_right(timecodes, target // self.timecode_scale)
+        if position:
+            offset = offsets[position - 1]
+        else:
+            offset = self.data_offset
+        
+        self.file.seek(offset)
+        self.cluster_timecode = 0
+        self.skip_till = target
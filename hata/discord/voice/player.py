@@ -3,19 +3,59 @@ __all__ = ()
 from audioop import mul as audio_mul
 from time import perf_counter
 
-from scarletio import CancelledError, Event, Task, sleep, write_exception_async
+from scarletio import CancelledError, Event, Task, alchemy_incendiary, sleep, write_exception_async
 
 from ..core import KOKORO
 
+from .frame_buffer import FrameBuffer
+from .player_metrics import AudioPlayerMetrics
+
+
+AUDIO_PLAYER_BUFFER_SIZE = 10
+AUDIO_PLAYER_LATE_THRESHOLD = 0.005
+
+
+def encode_frame(voice_client, data):
+    """
+    Applies the voice client's preferred volume on the given audio data and encodes it. Ran inside of an executor.
+    
+    Parameters
+    ----------
+    voice_client : ``VoiceClient``
+        The voice client to encode the data with.
+    data : `bytes`
+        Not opus encoded audio data.
+    
+    Returns
+    -------
+    data : `bytes`
+    """
+    pref_volume = voice_client._preferred_volume
+    if (pref_volume != 1.0):
+        data = audio_mul(data, 2, pref_volume)
+    
+    with voice_client._encoder_lock:
+        return voice_client._encoder.encode(data)
+
 
 class AudioPlayer:
     """
     Sends voice data through the voice client's socket.
     
+    The frames are read and encoded ahead by a separate task into a bounded buffer. Encoding runs inside of an
+    executor, so it does not delay the event loop. The frames are encrypted when sent, since their header and nonce
+    depend on the send order.
+    
     Attributes
     ----------
+    buffer : ``FrameBuffer``
+        The frames prepared ahead.
     done : `bool`
         Whether the audio player finished playing it's source.
+    metrics : ``AudioPlayerMetrics``
+        Frame delivery metrics of the player.
+    prepare_task : `None`, ``Task``
+        Task preparing the frames of the actual source.
     resumed_waiter : `threading.Event`
         Indicates whether the the audio player is not paused.
     source : ``AudioSource``
@@ -27,7 +67,10 @@ class AudioPlayer:
     voice_client : ``VoiceClient``
         The voice client of audio player.
     """
-    __slots__ = ('done', 'resumed_waiter', 'should_update', 'source', 'task', 'voice_client')
+    __slots__ = (
+        'buffer', 'done', 'metrics', 'prepare_task', 'resumed_waiter', 'should_update', 'source', 'task',
+        'voice_client'
+    )
     
     def __init__(self, voice_client, source):
         """
@@ -49,6 +92,10 @@ class AudioPlayer:
         self.should_update = True
         self.done = False
         
+        self.buffer = FrameBuffer(AUDIO_PLAYER_BUFFER_SIZE)
+        self.metrics = AudioPlayerMetrics()
+        self.prepare_task = None
+        
         self.task = Task(KOKORO, self.run())
     
     
@@ -59,6 +106,8 @@ class AudioPlayer:
         This method is a coroutine.
         """
         voice_client = self.voice_client
+        buffer = self.buffer
+        metrics = self.metrics
         start = perf_counter()
         loops = 0
         
@@ -71,6 +120,9 @@ class AudioPlayer:
                     if source is None:
                         break
                     
+                    # Let the first frame be prepared, so it is not counted as underrun.
+                    await buffer.wait_for_frame()
+                    
                     start = perf_counter()
                     loops = 0
                     continue
@@ -84,11 +136,21 @@ class AudioPlayer:
                     loops = 0
                     continue
                 
-                loops += 1
-                
-                data = await source.read()
-                
+                data = buffer.pop()
                 if data is None:
+                    if not buffer.closed:
+                        # The frame was not prepared in time.
+                        metrics.underrun_count += 1
+                        await buffer.wait_for_frame()
+                        
+                        start = perf_counter()
+                        loops = 0
+                        continue
+                    
+                    exception = buffer.exception
+                    if (exception is not None):
+                        raise exception
+                    
                     self.source = None
                     await source.cleanup()
                     self.pause()
@@ -100,20 +162,18 @@ class AudioPlayer:
                     self.should_update = True # safety first
                     continue
                 
-                if source.NEEDS_ENCODE:
-                    pref_volume = voice_client._preferred_volume
-                    if (pref_volume != 1.0):
-                        data = audio_mul(data, 2, pref_volume)
-                    
-                    data = voice_client._encoder.encode(data)
-                
+                loops += 1
                 
                 voice_client._sequence += 1
                 data = voice_client._encryption_adapter.create_send_packet(voice_client, data)
                 voice_client.send_packet(data)
                 voice_client._timestamp += source.AUDIO_SETTINGS.samples_per_frame
                 
-                delay = (start + source.AUDIO_SETTINGS.frame_length * 0.001 * (loops + 1)) - perf_counter()
+                frame_length = source.AUDIO_SETTINGS.frame_length * 0.001
+                now = perf_counter()
+                metrics.add_frame(now - (start + frame_length * loops), AUDIO_PLAYER_LATE_THRESHOLD)
+                
+                delay = (start + frame_length * (loops + 1)) - now
                 await sleep(delay, KOKORO)
         
         
@@ -122,6 +182,7 @@ class AudioPlayer:
                 voice_client.player = None
             
             self.done = True
+            self.cancel_preparing()
             
             self.source = None
             if (source is not None):
@@ -143,13 +204,14 @@ class AudioPlayer:
                 ],
                 loop = KOKORO
             )
-            
+        
         else:
             if voice_client.player is self:
                 voice_client.player = None
         
         finally:
             self.task = None
+            self.cancel_preparing()
             
             # Force resume if applicable.
             if voice_client.player is None:
@@ -158,6 +220,56 @@ class AudioPlayer:
                     voice_client.player = type(self)(voice_client, queue.pop(0))
     
     
+    async def prepare(self, source):
+        """
+        Reads and encodes the frames of the given source ahead into ``.buffer``. Closes the buffer when the source is
+        exhausted.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        source : ``AudioSource``
+            The audio source to prepare the frames of.
+        """
+        buffer = self.buffer
+        voice_client = self.voice_client
+        
+        try:
+            while True:
+                await buffer.wait_for_space()
+                
+                data = await source.read()
+                if data is None:
+                    break
+                
+                if source.NEEDS_ENCODE:
+                    data = await KOKORO.run_in_executor(alchemy_incendiary(encode_frame, (voice_client, data)))
+                
+                buffer.put(data)
+        
+        except (CancelledError, GeneratorExit):
+            raise
+        
+        except BaseException as err:
+            buffer.close(err)
+        
+        else:
+            buffer.close(None)
+    
+    
+    def cancel_preparing(self):
+        """
+        Cancels preparing frames and drops the prepared ones.
+        """
+        prepare_task = self.prepare_task
+        if (prepare_task is not None):
+            self.prepare_task = None
+            prepare_task.cancel()
+        
+        self.buffer.clear()
+    
+    
     async def update(self, actual_source):
         """
         Updates the player if ``.should_update`` is set as `True`.
@@ -186,6 +298,8 @@ class AudioPlayer:
         self.should_update = False
         new_source = self.source
         if (new_source is None):
+            self.cancel_preparing()
+            
             if (self.voice_client.player is not self):
                 self.done = True
                 return None
@@ -198,11 +312,18 @@ class AudioPlayer:
         if (new_source is actual_source):
             return actual_source
         
+        self.cancel_preparing()
+        
         if (actual_source is not None):
             await actual_source.cleanup()
         
         await new_source.postprocess()
-        self.voice_client._encoder.set_audio_settings(new_source.AUDIO_SETTINGS)
+        
+        voice_client = self.voice_client
+        with voice_client._encoder_lock:
+            voice_client._encoder.set_audio_settings(new_source.AUDIO_SETTINGS)
+        
+        self.prepare_task = Task(KOKORO, self.prepare(new_source))
         return new_source
     
     
@@ -212,6 +333,7 @@ class AudioPlayer:
         """
         self.resumed_waiter.clear()
         self.should_update = True
+        self.buffer.wake_up()
     
     
     def resume(self):
@@ -222,6 +344,7 @@ class AudioPlayer:
         if not resumed_waiter.is_set():
             resumed_waiter.set()
             self.should_update = True
+            self.buffer.wake_up()
     
     
     def stop(self):
@@ -252,6 +375,7 @@ class AudioPlayer:
         """
         self.source = source
         self.should_update = True
+        self.buffer.wake_up()
         
         resumed_waiter = self.resumed_waiter
         if not resumed_waiter.is_set():
@@ -0,0 +1,92 @@
+__all__ = ()
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class AudioPlayerMetrics(RichAttributeErrorBaseType):
+    """
+    Frame delivery metrics of an audio player.
+    
+    Attributes
+    ----------
+    frame_count : `int`
+        How much frames were sent.
+    late_count : `int`
+        How much frames were sent later than ``AUDIO_PLAYER_LATE_THRESHOLD`` after their deadline.
+    lateness_max : `float`
+        The highest lateness of a frame in seconds.
+    lateness_total : `float`
+        The summed lateness of the frames in seconds.
+    underrun_count : `int`
+        How much times a frame was not prepared by its deadline.
+    """
+    __slots__ = ('frame_count', 'late_count', 'lateness_max', 'lateness_total', 'underrun_count')
+    
+    def __new__(cls):
+        """
+        Creates a new audio player metrics.
+        """
+        self = object.__new__(cls)
+        self.frame_count = 0
+        self.late_count = 0
+        self.lateness_max = 0.0
+        self.lateness_total = 0.0
+        self.underrun_count = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the audio player metrics' representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' frame_count = ')
+        repr_parts.append(repr(self.frame_count))
+        
+        repr_parts.append(', late_count = ')
+        repr_parts.append(repr(self.late_count))
+        
+        repr_parts.append(', lateness_max = ')
+        repr_parts.append(repr(self.lateness_max))
+        
+        repr_parts.append(', underrun_count = ')
+        repr_parts.append(repr(self.underrun_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def add_frame(self, lateness, late_threshold):
+        """
+        Adds a sent frame to the metrics.
+        
+        Parameters
+        ----------
+        lateness : `float`
+            How much seconds later the frame was sent than its deadline.
+        late_threshold : `float`
+            Lateness counted as late.
+        """
+        self.frame_count += 1
+        
+        if lateness > 0.0:
+            self.lateness_total += lateness
+            if lateness > self.lateness_max:
+                self.lateness_max = lateness
+            
+            if lateness > late_threshold:
+                self.late_count += 1
+    
+    
+    def get_average_lateness(self):
+        """
+        Returns the average lateness of the sent frames in seconds.
+        
+        Returns
+        -------
+        average_lateness : `float`
+        """
+        frame_count = self.frame_count
+        if not frame_count:
+            return 0.0
+        
+        return self.lateness_total / frame_count
@@ -2,11 +2,13 @@ __all__ = ()
 
 from collections import deque
 
-from scarletio import CancelledError, Task, sleep, write_exception_async
+from scarletio import CancelledError, Future, LOOP_TIME, Task, alchemy_incendiary, sleep, write_exception_async
 
 from ..core import KOKORO
 
 from .audio_source import AudioSource
+from .jitter_buffer import JITTER_BUFFER_DELAY, JITTER_BUFFER_SIZE, JitterBuffer
+from .opus import OpusDecoder, OpusError
 from .packets.constants import RTP_PACKET_TYPE_VOICE
 from .packets.rtp_packet import RTPPacket
 from .packets.voice_packet import VoicePacket
@@ -15,6 +17,9 @@ from .packets.voice_packet import VoicePacket
 EMPTY_VOICE_FRAME_ENCODED = b'\xf8\xff\xfe'
 EMPTY_VOICE_FRAME_DECODED = b'\x00' * 3840
 
+AUDIO_STREAM_BLOCK_SIZE_DEFAULT = 3840 * 50
+AUDIO_STREAM_DECODE_BATCH_SIZE = 50
+
 
 class AudioStream(AudioSource):
     """
@@ -22,8 +27,20 @@ class AudioStream(AudioSource):
     
     Attributes
     ----------
-    buffer : `deque` of `VoicePacket`
-        A queue of received voice packets.
+    block_buffer : `None | bytearray`
+        Buffer of the decoded data used by ``.read_block``.
+    block_end : `int`
+        The end of the decoded data inside of ``.block_buffer``.
+    block_size : `int`
+        The size of the blocks returned by ``.read_block`` in bytes.
+    block_start : `int`
+        The start of the decoded data inside of ``.block_buffer``.
+    block_view : `None | memoryview`
+        View of ``.block_buffer``.
+    buffer : `deque<None | VoicePacket>`
+        A queue of received voice packets. Lost packets are represented by `None`.
+    decoder : `None | OpusDecoder`
+        The decoder of the audio stream. Created when first required.
     done : `bool`
         Whether the audio stream is stopped.
     source : `None | int`
@@ -34,6 +51,8 @@ class AudioStream(AudioSource):
         Whether the audio stream should yield encoded data.
     voice_client : ``VoiceClient``
         Weakreference to the parent ``AudioReader`` to avoid reference loops.
+    waiter : `None | Future`
+        Waiter of ``.read_block`` for a packet.
     
     Class Attributes
     ----------------
@@ -42,9 +61,12 @@ class AudioStream(AudioSource):
     REPEATABLE : `bool` = `False`
         Whether the source can be repeated after it is exhausted once.
     """
-    __slots__ = ('buffer', 'done', 'source', 'user', 'yield_decoded', 'voice_client')
+    __slots__ = (
+        'block_buffer', 'block_end', 'block_size', 'block_start', 'block_view', 'buffer', 'decoder', 'done', 'source',
+        'user', 'yield_decoded', 'voice_client', 'waiter'
+    )
     
-    def __init__(self, voice_client, user, *, yield_decoded = False):
+    def __init__(self, voice_client, user, *, block_size = ..., yield_decoded = False):
         """
         Creates a new audio stream instance.
         
@@ -54,20 +76,43 @@ class AudioStream(AudioSource):
             Parent ``AudioReader``.
         user : ``ClientUserBase``
             The user, who's audio is received.
+        block_size : `int`, Optional (Keyword only)
+            The size of the blocks returned by ``.read_block`` in bytes. Defaults to a second of audio.
         yield_decoded : `bool` = `False`, Optional (Keyword only)
             Whether the audio stream should yield decoded data.
+        
+        Raises
+        ------
+        ValueError
+            - If `block_size` is not a positive multiple of a sample's size.
         """
+        if block_size is ...:
+            block_size = AUDIO_STREAM_BLOCK_SIZE_DEFAULT
+        else:
+            sample_size = self.AUDIO_SETTINGS.sample_size
+            if (block_size <= 0) or (block_size % sample_size):
+                raise ValueError(
+                    f'`block_size` must be a positive multiple of {sample_size!r}, got {block_size!r}.'
+                )
+        
         try:
             audio_source = voice_client._audio_sources[user.id]
         except KeyError:
             audio_source = None
         
         self.voice_client = voice_client
+        self.block_buffer = None
+        self.block_end = 0
+        self.block_size = block_size
+        self.block_start = 0
+        self.block_view = None
         self.buffer = deque()
+        self.decoder = None
         self.yield_decoded = yield_decoded
         self.done = False
         self.user = user
         self.source = audio_source
+        self.waiter = None
     
     
     def stop(self):
@@ -79,6 +124,7 @@ class AudioStream(AudioSource):
         
         self.done = True
         self.voice_client._unlink_audio_stream(self)
+        self._wake_up()
     
     
     async def cleanup(self):
@@ -110,9 +156,39 @@ class AudioStream(AudioSource):
         
         Parameters
         ----------
-        packet : ``VoicePacket``
+        packet : `None | VoicePacket`
+            The packet to add. Lost packets are represented by `None`.
         """
         self.buffer.append(packet)
+        self._wake_up()
+    
+    
+    def _wake_up(self):
+        """
+        Wakes up ``.read_block`` waiting for a packet.
+        """
+        waiter = self.waiter
+        if (waiter is not None):
+            self.waiter = None
+            waiter.set_result_if_pending(None)
+    
+    
+    def _get_decoder(self):
+        """
+        Returns the audio stream's decoder, creating it if required.
+        
+        Each audio stream decodes with its own decoder, since decoding depends on the previously decoded packets.
+        
+        Returns
+        -------
+        decoder : ``OpusDecoder``
+        """
+        decoder = self.decoder
+        if decoder is None:
+            decoder = OpusDecoder(audio_settings = self.AUDIO_SETTINGS)
+            self.decoder = decoder
+        
+        return decoder
     
     
     async def read(self):
@@ -131,9 +207,18 @@ class AudioStream(AudioSource):
         if buffer:
             packet = buffer.popleft()
             if self.yield_decoded:
-                data = packet.decoded
+                decoder = self._get_decoder()
+                if packet is None:
+                    next_packet = buffer[0] if buffer else None
+                    data = decoder.decode_lost(None if next_packet is None else next_packet.encoded)
+                else:
+                    data = decoder.decode(packet.encoded)
+            
             else:
-                data = packet.encoded
+                if packet is None:
+                    data = EMPTY_VOICE_FRAME_ENCODED
+                else:
+                    data = packet.encoded
         
         else:
             if self.done:
@@ -147,6 +232,162 @@ class AudioStream(AudioSource):
         return data
     
     
+    async def read_block(self):
+        """
+        Reads a block of decoded data from the audio stream. The packets are decoded in batches in an executor.
+        
+        The returned view is only valid till the next call, since the block buffer is reused. The last block is padded
+        with silence. Yielding `None` indicates end of stream.
+        
+        Should not be called concurrently and should not be mixed with ``.read``.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        block : `None | memoryview`
+        
+        Raises
+        ------
+        RuntimeError
+            If opus is not loaded.
+        """
+        block_size = self.block_size
+        block_buffer = self.block_buffer
+        if block_buffer is None:
+            block_buffer = bytearray(block_size + AUDIO_STREAM_DECODE_BATCH_SIZE * self.AUDIO_SETTINGS.frame_size)
+            self.block_buffer = block_buffer
+            self.block_view = memoryview(block_buffer)
+        
+        block_view = self.block_view
+        buffer = self.buffer
+        
+        while True:
+            block_start = self.block_start
+            block_end = self.block_end
+            available = block_end - block_start
+            
+            if available >= block_size:
+                self.block_start = block_start + block_size
+                return block_view[block_start : block_start + block_size]
+            
+            # Move the decoded data to the start, so the block and the next batch fit after it.
+            if block_start:
+                block_view[:available] = block_view[block_start : block_end]
+                self.block_start = 0
+                self.block_end = available
+            
+            if not buffer:
+                if not self.done:
+                    waiter = Future(KOKORO)
+                    self.waiter = waiter
+                    await waiter
+                    continue
+                
+                if not available:
+                    return None
+                
+                block_view[available : block_size] = bytes(block_size - available)
+                self.block_end = 0
+                return block_view[:block_size]
+            
+            batch_size = self._get_batch_size(len(block_buffer) - available)
+            packets = [buffer.popleft() for counter in range(batch_size)]
+            next_packet = buffer[0] if buffer else None
+            
+            self.block_end = await KOKORO.run_in_executor(
+                alchemy_incendiary(self._decode_batch, (packets, next_packet, available))
+            )
+    
+    
+    def _get_batch_size(self, free_size):
+        """
+        Returns how much packets can be decoded into the given free space. A packet can contain multiple frames, so
+        their decoded size is checked one by one.
+        
+        The block buffer always has space for a whole packet (up to 120 ms) after the decoded data, so at least one
+        packet is decoded.
+        
+        Parameters
+        ----------
+        free_size : `int`
+            Free space in the block buffer in bytes.
+        
+        Returns
+        -------
+        batch_size : `int`
+        """
+        decoder = self._get_decoder()
+        frame_size = self.AUDIO_SETTINGS.frame_size
+        batch_size = 0
+        
+        for packet in self.buffer:
+            if packet is None:
+                decoded_size = frame_size
+            else:
+                try:
+                    decoded_size = decoder.packet_get_decoded_size(packet.encoded)
+                except OpusError:
+                    # Invalid packets are concealed as lost ones.
+                    decoded_size = frame_size
+            
+            free_size -= decoded_size
+            if free_size < 0:
+                break
+            
+            batch_size += 1
+        
+        return batch_size
+    
+    
+    def _decode_batch(self, packets, next_packet, offset):
+        """
+        Decodes the given packets into the block buffer. Called inside of an executor.
+        
+        Parameters
+        ----------
+        packets : `list<None | VoicePacket>`
+            The packets to decode. Lost packets are represented by `None`.
+        next_packet : `None | VoicePacket`
+            The packet after the batch if known.
+        offset : `int`
+            The byte offset to decode at.
+        
+        Returns
+        -------
+        offset : `int`
+            The end of the decoded data.
+        """
+        decoder = self._get_decoder()
+        block_buffer = self.block_buffer
+        
+        packets.append(next_packet)
+        for index in range(len(packets) - 1):
+            packet = packets[index]
+            if (packet is not None):
+                try:
+                    offset += decoder.decode_into(packet.encoded, block_buffer, offset)
+                except OpusError:
+                    # Corrupted packet, conceal it as a lost one.
+                    pass
+                else:
+                    continue
+            
+            next_packet = packets[index + 1]
+            if (next_packet is not None):
+                try:
+                    offset += decoder.decode_lost_into(next_packet.encoded, block_buffer, offset)
+                except OpusError:
+                    # The next packet is corrupted too, its forward error correction data cannot be used.
+                    pass
+                else:
+                    continue
+            
+            offset += decoder.decode_lost_into(None, block_buffer, offset)
+        
+        return offset
+    
+    
     @property
     def title(self):
         """
@@ -169,12 +410,14 @@ class AudioReader:
         `source` - ``AudioStream`` relation to store the receiving audio streams.
     done : `bool`
         Whether the audio reader is done receiving and should stop.
+    jitter_buffers : `dict<int, JitterBuffer>`
+        `source` - jitter buffer relation to reorder the received packets of each source.
     task : `None`, ``Task``
         Audio reader task. Set as `None` if the reader is stopped.
     voice_client : ``VoiceClient``
         The parent voice client.
     """
-    __slots__ = ('audio_streams', 'done', 'task', 'voice_client', )
+    __slots__ = ('audio_streams', 'done', 'jitter_buffers', 'task', 'voice_client', )
     
     def __init__(self, voice_client):
         """
@@ -188,6 +431,7 @@ class AudioReader:
         self.voice_client = voice_client
         self.done = False
         self.audio_streams = {}
+        self.jitter_buffers = {}
         self.task = Task(KOKORO, self.run())
     
     
@@ -200,6 +444,7 @@ class AudioReader:
         """
         voice_client = self.voice_client
         audio_streams = self.audio_streams
+        jitter_buffers = self.jitter_buffers
         
         try:
             await voice_client.wait_connected()
@@ -237,7 +482,7 @@ class AudioReader:
                 
                 if not audio_streams:
                     continue
-            
+                
                 try:
                     rtp_packet = RTPPacket(data)
                     if rtp_packet.payload_type != RTP_PACKET_TYPE_VOICE:
@@ -245,19 +490,21 @@ class AudioReader:
                         continue
                     
                     source = rtp_packet.source
-                    try:
-                        audio_stream = audio_streams[source]
-                    except KeyError:
-                        pass
-                    else:
+                    if source in audio_streams:
                         voice_packet = VoicePacket(
                             voice_client._encryption_adapter.process_received_payload(rtp_packet)
                         )
-                        if type(audio_stream) is list:
-                            for audio_stream in audio_stream:
-                                audio_stream.feed(voice_packet)
-                        else:
-                            audio_stream.feed(voice_packet)
+                        
+                        try:
+                            jitter_buffer = jitter_buffers[source]
+                        except KeyError:
+                            jitter_buffer = JitterBuffer(JITTER_BUFFER_SIZE, JITTER_BUFFER_DELAY)
+                            jitter_buffers[source] = jitter_buffer
+                        
+                        jitter_buffer.put(rtp_packet.sequence, voice_packet, LOOP_TIME())
+                    
+                    # Release the packets of every source, so the ones waiting for a missing packet are not stuck.
+                    self._release_packets(LOOP_TIME())
                 
                 except GeneratorExit:
                     raise
@@ -297,6 +544,42 @@ class AudioReader:
         self.stop()
     
     
+    def _release_packets(self, now):
+        """
+        Releases the packets of the jitter buffers and feeds them to their audio streams. Jitter buffers of sources
+        without audio streams are removed.
+        
+        Parameters
+        ----------
+        now : `float`
+            The current time.
+        """
+        audio_streams = self.audio_streams
+        jitter_buffers = self.jitter_buffers
+        
+        for source, jitter_buffer in [*jitter_buffers.items()]:
+            try:
+                audio_stream = audio_streams[source]
+            except KeyError:
+                del jitter_buffers[source]
+                continue
+            
+            if not jitter_buffer.packets:
+                continue
+            
+            voice_packets = jitter_buffer.release(now)
+            if not voice_packets:
+                continue
+            
+            if type(audio_stream) is list:
+                for audio_stream in audio_stream:
+                    for voice_packet in voice_packets:
+                        audio_stream.feed(voice_packet)
+            else:
+                for voice_packet in voice_packets:
+                    audio_stream.feed(voice_packet)
+    
+    
     def stop(self):
         """
         Stops the streams of the audio player.
@@ -313,6 +596,10 @@ class AudioReader:
         if voice_client.reader is self:
             voice_client.reader = None
         
+        # Deliver the packets waiting for a missing one.
+        self._release_packets(float('inf'))
+        self.jitter_buffers.clear()
+        
         audio_streams = self.audio_streams
         if audio_streams:
             collected_audio_streams = []
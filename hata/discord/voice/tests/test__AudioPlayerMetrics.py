@@ -0,0 +1,68 @@
+import vampytest
+
+from ..player_metrics import AudioPlayerMetrics
+
+
+def _assert_fields_set(metrics):
+    """
+    Asserts whether every field of the given metrics is set.
+    
+    Parameters
+    ----------
+    metrics : ``AudioPlayerMetrics``
+        The metrics to check.
+    """
+    vampytest.assert_instance(metrics, AudioPlayerMetrics)
+    vampytest.assert_instance(metrics.frame_count, int)
+    vampytest.assert_instance(metrics.late_count, int)
+    vampytest.assert_instance(metrics.lateness_max, float)
+    vampytest.assert_instance(metrics.lateness_total, float)
+    vampytest.assert_instance(metrics.underrun_count, int)
+
+
+def test__AudioPlayerMetrics__new():
+    """
+    Tests whether ``AudioPlayerMetrics.__new__`` works as intended.
+    """
+    metrics = AudioPlayerMetrics()
+    _assert_fields_set(metrics)
+
+
+def test__AudioPlayerMetrics__repr():
+    """
+    Tests whether ``AudioPlayerMetrics.__repr__`` works as intended.
+    """
+    metrics = AudioPlayerMetrics()
+    
+    output = repr(metrics)
+    vampytest.assert_instance(output, str)
+
+
+def test__AudioPlayerMetrics__add_frame():
+    """
+    Tests whether ``AudioPlayerMetrics.add_frame`` works as intended.
+    """
+    metrics = AudioPlayerMetrics()
+    
+    metrics.add_frame(-0.01, 0.005)
+    metrics.add_frame(0.002, 0.005)
+    metrics.add_frame(0.008, 0.005)
+    
+    vampytest.assert_eq(metrics.frame_count, 3)
+    vampytest.assert_eq(metrics.late_count, 1)
+    vampytest.assert_eq(metrics.lateness_max, 0.008)
+    vampytest.assert_eq(round(metrics.lateness_total, 6), 0.01)
+    vampytest.assert_eq(round(metrics.get_average_lateness(), 6), round(0.01 / 3, 6))
+
+
+def test__AudioPlayerMetrics__get_average_lateness__empty():
+    """
+    Tests whether ``AudioPlayerMetrics.get_average_lateness`` works as intended.
+    
+    Case: no frames.
+    """
+    metrics = AudioPlayerMetrics()
+    
+    output = metrics.get_average_lateness()
+    vampytest.assert_instance(output, float)
+    vampytest.assert_eq(output, 0.0)
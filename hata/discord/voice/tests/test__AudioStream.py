@@ -0,0 +1,388 @@
+import vampytest
+
+from ...user import User
+
+from ..opus import OpusError
+from ..packets.voice_packet import VoicePacket
+from ..reader import AUDIO_STREAM_DECODE_BATCH_SIZE, AudioStream
+
+
+FRAME_SIZE = AudioStream.AUDIO_SETTINGS.frame_size
+
+DECODED_FEC = 0xfe
+DECODED_PLC = 0xfd
+
+
+class VoiceClientStub:
+    """
+    Voice client stub to create audio streams with.
+    
+    Attributes
+    ----------
+    _audio_sources : `dict<int, int>`
+        Audio source identifiers by user identifier.
+    """
+    __slots__ = ('_audio_sources',)
+    
+    def __new__(cls):
+        """
+        Creates a new voice client stub.
+        """
+        self = object.__new__(cls)
+        self._audio_sources = {}
+        return self
+    
+    
+    def _unlink_audio_stream(self, audio_stream):
+        """
+        Called when the audio stream is stopped.
+        
+        Parameters
+        ----------
+        audio_stream : ``AudioStream``
+            The stopped audio stream.
+        """
+        pass
+
+
+class OpusDecoderStub:
+    """
+    Opus decoder stub, since opus might not be available.
+    
+    The first byte of a packet is its frame count and the second is the value it decodes into. Packets with `0` frame
+    count are invalid ones. Forward error correction and packet loss concealment decode into ``DECODED_FEC`` and
+    ``DECODED_PLC`` respectively.
+    
+    Attributes
+    ----------
+    calls : `list<(str, None | bytes)>`
+        The received calls.
+    """
+    __slots__ = ('calls',)
+    
+    def __new__(cls):
+        """
+        Creates a new opus decoder stub.
+        """
+        self = object.__new__(cls)
+        self.calls = []
+        return self
+    
+    
+    def packet_get_decoded_size(self, data):
+        """
+        Returns the size of the given packet's decoded data in bytes.
+        
+        Parameters
+        ----------
+        data : `bytes`
+            The packet.
+        
+        Returns
+        -------
+        decoded_size : `int`
+        
+        Raises
+        ------
+        OpusError
+        """
+        frame_count = data[0]
+        if not frame_count:
+            raise _create_opus_error()
+        
+        return frame_count * FRAME_SIZE
+    
+    
+    def decode_into(self, data, buffer, offset):
+        """
+        Decodes the given packet into the given buffer.
+        
+        Parameters
+        ----------
+        data : `bytes`
+            The packet to decode.
+        buffer : `bytearray`
+            The buffer to decode into.
+        offset : `int`
+            The byte offset to decode at.
+        
+        Returns
+        -------
+        size : `int`
+        
+        Raises
+        ------
+        OpusError
+        """
+        self.calls.append(('decode', data))
+        size = self.packet_get_decoded_size(data)
+        buffer[offset : offset + size] = bytes((data[1],)) * size
+        return size
+    
+    
+    def decode_lost_into(self, next_data, buffer, offset):
+        """
+        Decodes a lost packet into the given buffer.
+        
+        Parameters
+        ----------
+        next_data : `None | bytes`
+            The packet after the lost one.
+        buffer : `bytearray`
+            The buffer to decode into.
+        offset : `int`
+            The byte offset to decode at.
+        
+        Returns
+        -------
+        size : `int`
+        
+        Raises
+        ------
+        OpusError
+        """
+        if next_data is None:
+            self.calls.append(('plc', None))
+            value = DECODED_PLC
+        else:
+            self.calls.append(('fec', next_data))
+            self.packet_get_decoded_size(next_data)
+            value = DECODED_FEC
+        
+        buffer[offset : offset + FRAME_SIZE] = bytes((value,)) * FRAME_SIZE
+        return FRAME_SIZE
+
+
+def _create_opus_error():
+    """
+    Creates an opus error. ``OpusError.__new__`` cannot be used if opus is not loaded.
+    
+    Returns
+    -------
+    error : ``OpusError``
+    """
+    error = Exception.__new__(OpusError)
+    error.code = -4
+    return error
+
+
+def _create_packet(frame_count, value):
+    """
+    Creates a voice packet for the opus decoder stub.
+    
+    Parameters
+    ----------
+    frame_count : `int`
+        The packet's frame count. Pass `0` to create an invalid packet.
+    value : `int`
+        The value the packet decodes into.
+    
+    Returns
+    -------
+    packet : ``VoicePacket``
+    """
+    return VoicePacket(bytes((frame_count, value)))
+
+
+def _create_audio_stream(block_size, packets):
+    """
+    Creates an audio stream using the opus decoder stub.
+    
+    Parameters
+    ----------
+    block_size : `int`
+        The size of the blocks returned by ``.read_block`` in bytes.
+    packets : `list<None | VoicePacket>`
+        The packets to feed.
+    
+    Returns
+    -------
+    audio_stream : ``AudioStream``
+    """
+    audio_stream = AudioStream(VoiceClientStub(), User.precreate(202610171100), block_size = block_size)
+    audio_stream.decoder = OpusDecoderStub()
+    audio_stream.buffer.extend(packets)
+    return audio_stream
+
+
+def _iter_options__get_batch_size():
+    yield [], 10 * FRAME_SIZE, 0
+    yield [_create_packet(1, 1), _create_packet(2, 2), _create_packet(1, 3)], 10 * FRAME_SIZE, 3
+    yield [_create_packet(1, 1), _create_packet(2, 2), _create_packet(1, 3)], 3 * FRAME_SIZE, 2
+    yield [_create_packet(2, 1), _create_packet(2, 2), _create_packet(2, 3)], 5 * FRAME_SIZE, 2
+    yield [_create_packet(3, 1), _create_packet(1, 2)], 2 * FRAME_SIZE, 0
+    yield [None, _create_packet(0, 1), _create_packet(1, 2)], 3 * FRAME_SIZE, 3
+    yield [None, _create_packet(0, 1), _create_packet(1, 2)], 2 * FRAME_SIZE, 2
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_batch_size()).returning_last())
+def test__AudioStream__get_batch_size(packets, free_size):
+    """
+    Tests whether ``AudioStream._get_batch_size`` works as intended.
+    
+    Parameters
+    ----------
+    packets : `list<None | VoicePacket>`
+        Packets in the buffer.
+    free_size : `int`
+        Free space in the block buffer in bytes.
+    
+    Returns
+    -------
+    output : `int`
+    """
+    audio_stream = _create_audio_stream(FRAME_SIZE, packets)
+    output = audio_stream._get_batch_size(free_size)
+    vampytest.assert_instance(output, int)
+    return output
+
+
+def _iter_options__decode_batch():
+    packet_0 = _create_packet(1, 1)
+    packet_1 = _create_packet(2, 2)
+    packet_2 = _create_packet(1, 3)
+    packet_invalid = _create_packet(0, 4)
+    
+    # Decoded
+    yield (
+        [packet_0, packet_1],
+        None,
+        (
+            [('decode', packet_0.encoded), ('decode', packet_1.encoded)],
+            bytes((1,)) * FRAME_SIZE + bytes((2,)) * (2 * FRAME_SIZE),
+        ),
+    )
+    
+    # Lost, forward error correction from the next packet in the batch
+    yield (
+        [None, packet_0],
+        None,
+        (
+            [('fec', packet_0.encoded), ('decode', packet_0.encoded)],
+            bytes((DECODED_FEC,)) * FRAME_SIZE + bytes((1,)) * FRAME_SIZE,
+        ),
+    )
+    
+    # Lost, forward error correction from the packet after the batch
+    yield (
+        [packet_0, None],
+        packet_2,
+        (
+            [('decode', packet_0.encoded), ('fec', packet_2.encoded)],
+            bytes((1,)) * FRAME_SIZE + bytes((DECODED_FEC,)) * FRAME_SIZE,
+        ),
+    )
+    
+    # Lost, no next packet, packet loss concealment
+    yield (
+        [packet_0, None],
+        None,
+        (
+            [('decode', packet_0.encoded), ('plc', None)],
+            bytes((1,)) * FRAME_SIZE + bytes((DECODED_PLC,)) * FRAME_SIZE,
+        ),
+    )
+    
+    # Lost twice, packet loss concealment for the first one
+    yield (
+        [None, None],
+        packet_0,
+        (
+            [('plc', None), ('fec', packet_0.encoded)],
+            bytes((DECODED_PLC,)) * FRAME_SIZE + bytes((DECODED_FEC,)) * FRAME_SIZE,
+        ),
+    )
+    
+    # Invalid, concealed by forward error correction from the next packet
+    yield (
+        [packet_invalid, packet_0],
+        None,
+        (
+            [('decode', packet_invalid.encoded), ('fec', packet_0.encoded), ('decode', packet_0.encoded)],
+            bytes((DECODED_FEC,)) * FRAME_SIZE + bytes((1,)) * FRAME_SIZE,
+        ),
+    )
+    
+    # Lost before an invalid packet, falls back to packet loss concealment; invalid at the end, concealed too
+    yield (
+        [None, packet_invalid],
+        None,
+        (
+            [('fec', packet_invalid.encoded), ('plc', None), ('decode', packet_invalid.encoded), ('plc', None)],
+            bytes((DECODED_PLC,)) * (2 * FRAME_SIZE),
+        ),
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__decode_batch()).returning_last())
+def test__AudioStream__decode_batch(packets, next_packet):
+    """
+    Tests whether ``AudioStream._decode_batch`` works as intended.
+    
+    Parameters
+    ----------
+    packets : `list<None | VoicePacket>`
+        The packets to decode.
+    next_packet : `None | VoicePacket`
+        The packet after the batch.
+    
+    Returns
+    -------
+    output : `(list<(str, None | bytes)>, bytes)`
+    """
+    offset = 3
+    
+    audio_stream = _create_audio_stream(FRAME_SIZE, [])
+    audio_stream.block_buffer = bytearray(offset + AUDIO_STREAM_DECODE_BATCH_SIZE * FRAME_SIZE)
+    
+    end = audio_stream._decode_batch([*packets], next_packet, offset)
+    vampytest.assert_instance(end, int)
+    
+    return audio_stream.decoder.calls, bytes(audio_stream.block_buffer[offset : end])
+
+
+async def test__AudioStream__read_block__padding():
+    """
+    Tests whether ``AudioStream.read_block`` works as intended.
+    
+    Case: The last block is padded with silence.
+    """
+    audio_stream = _create_audio_stream(
+        2 * FRAME_SIZE, [_create_packet(2, 1), None, _create_packet(1, 2)]
+    )
+    audio_stream.done = True
+    
+    output = await audio_stream.read_block()
+    vampytest.assert_instance(output, memoryview)
+    vampytest.assert_eq(bytes(output), bytes((1,)) * (2 * FRAME_SIZE))
+    
+    output = await audio_stream.read_block()
+    vampytest.assert_instance(output, memoryview)
+    vampytest.assert_eq(bytes(output), bytes((DECODED_FEC,)) * FRAME_SIZE + bytes((2,)) * FRAME_SIZE)
+    
+    output = await audio_stream.read_block()
+    vampytest.assert_is(output, None)
+
+
+async def test__AudioStream__read_block__partial():
+    """
+    Tests whether ``AudioStream.read_block`` works as intended.
+    
+    Case: Blocks are split from the decoded packets.
+    """
+    audio_stream = _create_audio_stream(
+        2 * FRAME_SIZE, [_create_packet(3, 1), _create_packet(2, 2)]
+    )
+    audio_stream.done = True
+    
+    output = await audio_stream.read_block()
+    vampytest.assert_eq(bytes(output), bytes((1,)) * (2 * FRAME_SIZE))
+    
+    output = await audio_stream.read_block()
+    vampytest.assert_eq(bytes(output), bytes((1,)) * FRAME_SIZE + bytes((2,)) * FRAME_SIZE)
+    
+    output = await audio_stream.read_block()
+    vampytest.assert_eq(bytes(output), bytes((2,)) * FRAME_SIZE + bytes(FRAME_SIZE))
+    
+    output = await audio_stream.read_block()
+    vampytest.assert_is(output, None)
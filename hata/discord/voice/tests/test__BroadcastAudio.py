@@ -0,0 +1,180 @@
+import vampytest
+from scarletio import skip_ready_cycle
+
+from ..audio_source import AudioSource, RawAudio
+from ..broadcast import (
+    BROADCAST_AUDIO_FRAME_HISTORY, BROADCAST_AUDIO_FRAME_LEAD, BroadcastAudio, BroadcastAudioListener,
+    BroadcastAudioReencodingListener
+)
+
+
+class TestOpusSource(AudioSource):
+    __slots__ = ('cleaned_up', 'frames')
+    
+    NEEDS_ENCODE = False
+    
+    def __new__(cls, frames):
+        self = object.__new__(cls)
+        self.cleaned_up = False
+        self.frames = [*frames]
+        return self
+    
+    
+    def __del__(self):
+        pass
+    
+    
+    async def read(self):
+        frames = self.frames
+        if frames:
+            return frames.pop(0)
+    
+    
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+def _assert_fields_set(broadcast):
+    """
+    Asserts whether every field of the given broadcast is set.
+    
+    Parameters
+    ----------
+    broadcast : ``BroadcastAudio``
+        The broadcast to check.
+    """
+    vampytest.assert_instance(broadcast, BroadcastAudio)
+    vampytest.assert_instance(broadcast._frame_count, int)
+    vampytest.assert_instance(broadcast._frames, list)
+    vampytest.assert_instance(broadcast.ended, bool)
+    vampytest.assert_instance(broadcast.listeners, set)
+    vampytest.assert_instance(broadcast.source, AudioSource)
+
+
+def test__BroadcastAudio__new():
+    """
+    Tests whether ``BroadcastAudio.__new__`` works as intended.
+    """
+    source = TestOpusSource([])
+    
+    broadcast = BroadcastAudio(source)
+    _assert_fields_set(broadcast)
+    
+    vampytest.assert_is(broadcast.source, source)
+    vampytest.assert_false(broadcast.ended)
+
+
+def test__BroadcastAudio__repr():
+    """
+    Tests whether ``BroadcastAudio.__repr__`` works as intended.
+    """
+    broadcast = BroadcastAudio(TestOpusSource([]))
+    
+    output = repr(broadcast)
+    vampytest.assert_instance(output, str)
+
+
+def test__BroadcastAudio__create_listener():
+    """
+    Tests whether ``BroadcastAudio.create_listener`` works as intended.
+    """
+    broadcast = BroadcastAudio(RawAudio(b''))
+    
+    listener = broadcast.create_listener()
+    vampytest.assert_is(type(listener), BroadcastAudioListener)
+    vampytest.assert_false(listener.NEEDS_ENCODE)
+    vampytest.assert_is(listener.AUDIO_SETTINGS, RawAudio.AUDIO_SETTINGS)
+    
+    listener = broadcast.create_listener(reencode = True)
+    vampytest.assert_instance(listener, BroadcastAudioReencodingListener)
+    vampytest.assert_true(listener.NEEDS_ENCODE)
+
+
+def test__BroadcastAudio__create_listener__reencode_opus():
+    """
+    Tests whether ``BroadcastAudio.create_listener`` works as intended.
+    
+    Case: re-encoding an opus source.
+    """
+    broadcast = BroadcastAudio(TestOpusSource([]))
+    
+    with vampytest.assert_raises(ValueError):
+        broadcast.create_listener(reencode = True)
+
+
+async def test__BroadcastAudio__listeners():
+    """
+    Tests whether ``BroadcastAudio`` broadcasts to its listeners.
+    
+    This function is a coroutine.
+    """
+    frames = [index.to_bytes(2, 'big') for index in range(10)]
+    source = TestOpusSource(frames)
+    broadcast = BroadcastAudio(source)
+    
+    listener_0 = broadcast.create_listener()
+    listener_1 = broadcast.create_listener()
+    
+    await listener_0.postprocess()
+    await listener_1.postprocess()
+    vampytest.assert_eq(broadcast.listeners, {listener_0, listener_1})
+    
+    for listener in (listener_0, listener_1):
+        output = []
+        while True:
+            frame = await listener.read()
+            if frame is None:
+                break
+            
+            output.append(frame)
+        
+        vampytest.assert_eq(output, frames)
+    
+    await skip_ready_cycle()
+    vampytest.assert_true(broadcast.ended)
+    vampytest.assert_true(source.cleaned_up)
+    
+    await listener_0.cleanup()
+    vampytest.assert_eq(broadcast.listeners, {listener_1})
+
+
+async def test__BroadcastAudio__stop():
+    """
+    Tests whether ``BroadcastAudio.stop`` works as intended.
+    
+    This function is a coroutine.
+    """
+    source = TestOpusSource([b'a'] * 100)
+    broadcast = BroadcastAudio(source)
+    
+    listener = broadcast.create_listener()
+    await listener.postprocess()
+    
+    vampytest.assert_eq(await listener.read(), b'a')
+    
+    broadcast.stop()
+    await skip_ready_cycle()
+    
+    vampytest.assert_true(broadcast.ended)
+    vampytest.assert_true(source.cleaned_up)
+
+
+async def test__BroadcastAudio__get_frame__lagged():
+    """
+    Tests whether ``BroadcastAudio._get_frame`` works as intended.
+    
+    Case: lagged out of the history.
+    """
+    broadcast = BroadcastAudio(TestOpusSource([]))
+    
+    frame_count = BROADCAST_AUDIO_FRAME_HISTORY * 2
+    for index in range(frame_count):
+        broadcast._add_frame((index.to_bytes(2, 'big'), None))
+    
+    position, frame = await broadcast._get_frame(0)
+    vampytest.assert_eq(position, frame_count - BROADCAST_AUDIO_FRAME_LEAD)
+    vampytest.assert_eq(frame, (position.to_bytes(2, 'big'), None))
+    
+    broadcast._end()
+    position, frame = await broadcast._get_frame(frame_count)
+    vampytest.assert_is(frame, None)
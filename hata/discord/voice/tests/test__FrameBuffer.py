@@ -0,0 +1,127 @@
+import vampytest
+from scarletio import Task, get_event_loop, skip_ready_cycle
+
+from ..frame_buffer import FrameBuffer
+
+
+def _assert_fields_set(frame_buffer):
+    """
+    Asserts whether every field of the given frame buffer is set.
+    
+    Parameters
+    ----------
+    frame_buffer : ``FrameBuffer``
+        The frame buffer to check.
+    """
+    vampytest.assert_instance(frame_buffer, FrameBuffer)
+    vampytest.assert_instance(frame_buffer.closed, bool)
+    vampytest.assert_instance(frame_buffer.exception, BaseException, nullable = True)
+    vampytest.assert_instance(frame_buffer.frame_waiter, object, nullable = True)
+    vampytest.assert_instance(frame_buffer.frames, list)
+    vampytest.assert_instance(frame_buffer.length, int)
+    vampytest.assert_instance(frame_buffer.space_waiter, object, nullable = True)
+    vampytest.assert_instance(frame_buffer.start, int)
+
+
+def test__FrameBuffer__new():
+    """
+    Tests whether ``FrameBuffer.__new__`` works as intended.
+    """
+    size = 4
+    
+    frame_buffer = FrameBuffer(size)
+    _assert_fields_set(frame_buffer)
+    
+    vampytest.assert_eq(len(frame_buffer.frames), size)
+    vampytest.assert_eq(len(frame_buffer), 0)
+    vampytest.assert_false(frame_buffer.closed)
+
+
+def test__FrameBuffer__repr():
+    """
+    Tests whether ``FrameBuffer.__repr__`` works as intended.
+    """
+    frame_buffer = FrameBuffer(4)
+    frame_buffer.close(None)
+    
+    output = repr(frame_buffer)
+    vampytest.assert_instance(output, str)
+
+
+def test__FrameBuffer__put_and_pop():
+    """
+    Tests whether ``FrameBuffer.put`` and ``.pop`` work as intended.
+    
+    Case: wrapping around.
+    """
+    frame_buffer = FrameBuffer(2)
+    
+    vampytest.assert_is(frame_buffer.pop(), None)
+    
+    frame_buffer.put(b'a')
+    frame_buffer.put(b'b')
+    vampytest.assert_true(frame_buffer.is_full())
+    
+    vampytest.assert_eq(frame_buffer.pop(), b'a')
+    frame_buffer.put(b'c')
+    
+    vampytest.assert_eq(frame_buffer.pop(), b'b')
+    vampytest.assert_eq(frame_buffer.pop(), b'c')
+    vampytest.assert_is(frame_buffer.pop(), None)
+    vampytest.assert_eq(frame_buffer.frames, [None, None])
+
+
+def test__FrameBuffer__clear():
+    """
+    Tests whether ``FrameBuffer.clear`` works as intended.
+    """
+    exception = ValueError()
+    
+    frame_buffer = FrameBuffer(2)
+    frame_buffer.put(b'a')
+    frame_buffer.close(exception)
+    
+    vampytest.assert_true(frame_buffer.closed)
+    vampytest.assert_is(frame_buffer.exception, exception)
+    
+    frame_buffer.clear()
+    
+    vampytest.assert_false(frame_buffer.closed)
+    vampytest.assert_is(frame_buffer.exception, None)
+    vampytest.assert_eq(len(frame_buffer), 0)
+    vampytest.assert_is(frame_buffer.pop(), None)
+
+
+async def test__FrameBuffer__wait_for_frame():
+    """
+    Tests whether ``FrameBuffer.wait_for_frame`` works as intended.
+    
+    This function is a coroutine.
+    """
+    frame_buffer = FrameBuffer(2)
+    
+    task = Task(get_event_loop(), frame_buffer.wait_for_frame())
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    frame_buffer.put(b'a')
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
+
+
+async def test__FrameBuffer__wait_for_space():
+    """
+    Tests whether ``FrameBuffer.wait_for_space`` works as intended.
+    
+    This function is a coroutine.
+    """
+    frame_buffer = FrameBuffer(1)
+    frame_buffer.put(b'a')
+    
+    task = Task(get_event_loop(), frame_buffer.wait_for_space())
+    await skip_ready_cycle()
+    vampytest.assert_false(task.is_done())
+    
+    frame_buffer.pop()
+    await skip_ready_cycle()
+    vampytest.assert_true(task.is_done())
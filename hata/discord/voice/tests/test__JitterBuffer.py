@@ -0,0 +1,159 @@
+import vampytest
+
+from ..jitter_buffer import JitterBuffer
+from ..packets.voice_packet import VoicePacket
+
+
+def _assert_fields_set(jitter_buffer):
+    """
+    Asserts whether every field of the given jitter buffer is set.
+    
+    Parameters
+    ----------
+    jitter_buffer : ``JitterBuffer``
+        The jitter buffer to check.
+    """
+    vampytest.assert_instance(jitter_buffer, JitterBuffer)
+    vampytest.assert_instance(jitter_buffer.delay, float)
+    vampytest.assert_instance(jitter_buffer.late_count, int)
+    vampytest.assert_instance(jitter_buffer.lost_count, int)
+    vampytest.assert_instance(jitter_buffer.next_sequence, int)
+    vampytest.assert_instance(jitter_buffer.packets, dict)
+    vampytest.assert_instance(jitter_buffer.size, int)
+
+
+def test__JitterBuffer__new():
+    """
+    Tests whether ``JitterBuffer.__new__`` works as intended.
+    """
+    size = 4
+    delay = 0.1
+    
+    jitter_buffer = JitterBuffer(size, delay)
+    _assert_fields_set(jitter_buffer)
+    
+    vampytest.assert_eq(jitter_buffer.size, size)
+    vampytest.assert_eq(jitter_buffer.delay, delay)
+
+
+def test__JitterBuffer__repr():
+    """
+    Tests whether ``JitterBuffer.__repr__`` works as intended.
+    """
+    jitter_buffer = JitterBuffer(4, 0.1)
+    
+    output = repr(jitter_buffer)
+    vampytest.assert_instance(output, str)
+
+
+def test__JitterBuffer__reorder():
+    """
+    Tests whether ``JitterBuffer`` works as intended.
+    
+    Case: reordering.
+    """
+    packets = [VoicePacket(bytes([index])) for index in range(3)]
+    
+    jitter_buffer = JitterBuffer(4, 0.1)
+    
+    vampytest.assert_true(jitter_buffer.put(10, packets[0], 0.0))
+    vampytest.assert_eq(jitter_buffer.release(0.0), [packets[0]])
+    
+    vampytest.assert_true(jitter_buffer.put(12, packets[2], 0.0))
+    vampytest.assert_eq(jitter_buffer.release(0.0), [])
+    
+    vampytest.assert_true(jitter_buffer.put(11, packets[1], 0.01))
+    vampytest.assert_eq(jitter_buffer.release(0.01), [packets[1], packets[2]])
+    
+    vampytest.assert_eq(jitter_buffer.lost_count, 0)
+
+
+def test__JitterBuffer__lost_by_delay():
+    """
+    Tests whether ``JitterBuffer`` works as intended.
+    
+    Case: lost packet by delay.
+    """
+    packets = [VoicePacket(bytes([index])) for index in range(3)]
+    
+    jitter_buffer = JitterBuffer(4, 0.1)
+    
+    jitter_buffer.put(10, packets[0], 0.0)
+    jitter_buffer.put(12, packets[2], 0.0)
+    vampytest.assert_eq(jitter_buffer.release(0.05), [packets[0]])
+    vampytest.assert_eq(jitter_buffer.release(0.1), [None, packets[2]])
+    
+    vampytest.assert_eq(jitter_buffer.lost_count, 1)
+    
+    # Arriving after marked as lost
+    vampytest.assert_false(jitter_buffer.put(11, packets[1], 0.2))
+    vampytest.assert_eq(jitter_buffer.late_count, 1)
+
+
+def test__JitterBuffer__lost_by_size():
+    """
+    Tests whether ``JitterBuffer`` works as intended.
+    
+    Case: lost packets by size.
+    """
+    packets = [VoicePacket(bytes([index])) for index in range(4)]
+    
+    jitter_buffer = JitterBuffer(2, 0.1)
+    
+    jitter_buffer.put(10, packets[0], 0.0)
+    jitter_buffer.put(13, packets[2], 0.0)
+    jitter_buffer.put(14, packets[3], 0.0)
+    vampytest.assert_eq(jitter_buffer.release(0.0), [packets[0], None, None, packets[2], packets[3]])
+    
+    vampytest.assert_eq(jitter_buffer.lost_count, 2)
+
+
+def test__JitterBuffer__wrap_around():
+    """
+    Tests whether ``JitterBuffer`` works as intended.
+    
+    Case: sequence number wrapping around.
+    """
+    packets = [VoicePacket(bytes([index])) for index in range(3)]
+    
+    jitter_buffer = JitterBuffer(4, 0.1)
+    
+    jitter_buffer.put(0xffff, packets[0], 0.0)
+    jitter_buffer.put(1, packets[2], 0.0)
+    jitter_buffer.put(0, packets[1], 0.0)
+    vampytest.assert_eq(jitter_buffer.release(0.0), [packets[0], packets[1], packets[2]])
+    vampytest.assert_eq(jitter_buffer.next_sequence, 2)
+
+
+def test__JitterBuffer__duplicate():
+    """
+    Tests whether ``JitterBuffer`` works as intended.
+    
+    Case: duplicate packet.
+    """
+    packets = [VoicePacket(bytes([index])) for index in range(2)]
+    
+    jitter_buffer = JitterBuffer(4, 0.1)
+    
+    jitter_buffer.put(10, packets[0], 0.0)
+    vampytest.assert_false(jitter_buffer.put(10, packets[1], 0.0))
+    vampytest.assert_eq(jitter_buffer.release(0.0), [packets[0]])
+    vampytest.assert_eq(jitter_buffer.late_count, 1)
+
+
+def test__JitterBuffer__resync():
+    """
+    Tests whether ``JitterBuffer`` works as intended.
+    
+    Case: sequence number jumping far ahead.
+    """
+    packets = [VoicePacket(bytes([index])) for index in range(3)]
+    
+    jitter_buffer = JitterBuffer(4, 0.1)
+    
+    jitter_buffer.put(10, packets[0], 0.0)
+    vampytest.assert_eq(jitter_buffer.release(0.0), [packets[0]])
+    jitter_buffer.put(13, packets[1], 0.0)
+    jitter_buffer.put(30000, packets[2], 0.0)
+    vampytest.assert_eq(jitter_buffer.release(0.0), [packets[2]])
+    vampytest.assert_eq(jitter_buffer.lost_count, 1)
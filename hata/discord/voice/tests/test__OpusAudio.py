@@ -0,0 +1,176 @@
+from io import BytesIO
+
+import vampytest
+
+from ..audio_source import OpusAudio
+from ..opus_containers.ogg import OGG_PAGE_FLAG_FIRST, OGG_PAGE_FLAG_LAST
+from ..opus_containers.tests.helpers import (
+    SERIAL, create_ogg_opus_file, create_ogg_page, create_opus_head, create_packet, create_webm_opus_file
+)
+from ..opus_containers.utils import OPUS_TAGS_MAGIC
+
+
+def _assert_fields_set(audio):
+    """
+    Asserts whether every field of the given audio is set.
+    
+    Parameters
+    ----------
+    audio : ``OpusAudio``
+        The audio to check.
+    """
+    vampytest.assert_instance(audio, OpusAudio)
+    vampytest.assert_instance(audio._seek_to, float)
+    vampytest.assert_instance(audio.path, str, nullable = True)
+    vampytest.assert_instance(audio.title, str)
+
+
+def test__OpusAudio__new():
+    """
+    Tests whether ``OpusAudio.__new__`` works as intended.
+    """
+    file = BytesIO(create_ogg_opus_file(10, 4))
+    title = 'koishi'
+    
+    audio = OpusAudio(file, title = title)
+    _assert_fields_set(audio)
+    
+    vampytest.assert_false(audio.NEEDS_ENCODE)
+    vampytest.assert_is(audio.path, None)
+    vampytest.assert_eq(audio.title, title)
+
+
+def _iter_options__type_error():
+    yield 12
+    yield None
+
+
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+def test__OpusAudio__new__type_error(source):
+    """
+    Tests whether ``OpusAudio.__new__`` works as intended.
+    
+    Case: type error.
+    
+    Parameters
+    ----------
+    source : `object`
+        Source to create from.
+    
+    Raises
+    ------
+    TypeError
+    """
+    OpusAudio(source)
+
+
+def test__OpusAudio__new__value_error():
+    """
+    Tests whether ``OpusAudio.__new__`` works as intended.
+    
+    Case: value error.
+    """
+    with vampytest.assert_raises(ValueError):
+        OpusAudio('/koishi/satori.opus')
+    
+    with vampytest.assert_raises(ValueError):
+        OpusAudio(BytesIO(), start = -1.0)
+
+
+async def _read_all(audio):
+    """
+    Reads every packet of the given audio.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    audio : ``OpusAudio``
+        The audio to read.
+    
+    Returns
+    -------
+    packets : `list<bytes>`
+    """
+    packets = []
+    while True:
+        packet = await audio.read()
+        if packet is None:
+            break
+        
+        packets.append(packet)
+    
+    return packets
+
+
+def _iter_options__read():
+    yield create_ogg_opus_file(60, 7)
+    yield create_webm_opus_file(60, 7)
+
+
+@vampytest._(vampytest.call_from(_iter_options__read()))
+async def test__OpusAudio__read(data):
+    """
+    Tests whether ``OpusAudio.read`` works as intended.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The file's content.
+    """
+    audio = OpusAudio(BytesIO(data), start = 0.5)
+    
+    await audio.postprocess()
+    packets = await _read_all(audio)
+    vampytest.assert_eq(packets, [create_packet(index) for index in range(25, 60)])
+    
+    # Repeating starts from the beginning.
+    await audio.postprocess()
+    packets = await _read_all(audio)
+    vampytest.assert_eq(packets, [create_packet(index) for index in range(60)])
+    
+    audio.seek(1.0)
+    packets = await _read_all(audio)
+    vampytest.assert_eq(packets, [create_packet(index) for index in range(50, 60)])
+    
+    await audio.cleanup()
+
+
+def _iter_options__read__value_error():
+    # CELT, fullband, 20 ms, 2 frames.
+    yield bytes((0xf9,)) + b'koishi'
+    # CELT, fullband, 10 ms, 1 frame.
+    yield bytes((0xf0,)) + b'koishi'
+    # SILK, wideband, 60 ms, 1 frame.
+    yield bytes((0x58,)) + b'koishi'
+
+
+@vampytest._(vampytest.call_from(_iter_options__read__value_error()))
+async def test__OpusAudio__read__value_error(packet):
+    """
+    Tests whether ``OpusAudio.read`` works as intended.
+    
+    Case: packet not a frame long.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    packet : `bytes`
+        The packet not 20 ms long.
+    """
+    data = b''.join([
+        create_ogg_page(OGG_PAGE_FLAG_FIRST, 0, SERIAL, [create_opus_head(2)]),
+        create_ogg_page(0, 0, SERIAL, [OPUS_TAGS_MAGIC + b'\x00' * 8]),
+        create_ogg_page(OGG_PAGE_FLAG_LAST, 960 * 4, SERIAL, [create_packet(0), packet]),
+    ])
+    
+    audio = OpusAudio(BytesIO(data))
+    await audio.postprocess()
+    
+    with vampytest.assert_raises(ValueError):
+        await audio.read()
+    
+    await audio.cleanup()
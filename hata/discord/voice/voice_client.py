@@ -3,6 +3,7 @@ __all__ = ('VoiceClient', )
 import socket as module_socket
 from datetime import datetime as DateTime, timezone as TimeZone
 from functools import partial as partial_func
+from threading import Lock as SyncLock
 
 from scarletio import (
     DOCS_ENABLED, DatagramMergerReadProtocol, Future, Lock, Task, export, RichAttributeErrorBaseType, skip_poll_cycle
@@ -49,6 +50,8 @@ class VoiceClient(RichAttributeErrorBaseType):
         Waiter futures waiting for the voice client to be connected again.
     _encoder : ``OpusEncoder``
         Encode not opus encoded audio data.
+    _encoder_lock : `threading.Lock`
+        Lock used to access ``._encoder``, since the player encodes inside of an executor.
     _encryption_adapter : ``EncryptionAdapterBase``
         Data encoder & decoder of the voice client.
     _encryption_adapter_type : `type<EncryptionAdapterBase>`
@@ -133,10 +136,11 @@ class VoiceClient(RichAttributeErrorBaseType):
     """
     __slots__ = (
         '_audio_source', '_audio_sources', '_audio_streams', '_connected', '_connected_waiters', '_encoder',
-        '_encryption_adapter', '_encryption_adapter_type', '_endpoint', '_endpoint_ip', '_endpoint_port',
-        '_handshake_complete', '_ip', '_port', '_preferred_volume', '_protocol', '_sequence', '_set_speaking_task',
-        '_socket', '_timestamp', '_token', '_transport', '_video_source', '_video_sources', 'call_after', 'channel_id',
-        'client', 'gateway', 'guild_id', 'lock', 'player', 'running', 'queue', 'reader', 'region', 'speaking'
+        '_encoder_lock', '_encryption_adapter', '_encryption_adapter_type', '_endpoint', '_endpoint_ip',
+        '_endpoint_port', '_handshake_complete', '_ip', '_port', '_preferred_volume', '_protocol', '_sequence',
+        '_set_speaking_task', '_socket', '_timestamp', '_token', '_transport', '_video_source', '_video_sources',
+        'call_after', 'channel_id', 'client', 'gateway', 'guild_id', 'lock', 'player', 'running', 'queue', 'reader',
+        'region', 'speaking'
     )
     
     def __new__(cls, client, guild_id, channel_id):
@@ -193,6 +197,7 @@ class VoiceClient(RichAttributeErrorBaseType):
         self.reader = None
         self._handshake_complete = Future(KOKORO)
         self._encoder = OpusEncoder()
+        self._encoder_lock = SyncLock()
         self._sequence = 0
         self._timestamp = 0
         self._audio_source = 0
@@ -322,6 +327,8 @@ class VoiceClient(RichAttributeErrorBaseType):
         ----------------
         auto_decode : `bool`
             Whether the received packets should be auto decoded.
+        block_size : `int`
+            The size of the blocks returned by ``AudioStream.read_block`` in bytes.
         yield_decoded : `bool`
             Whether the audio stream should yield encoded data.
         
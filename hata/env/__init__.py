@@ -20,15 +20,39 @@ HATA_CACHE_PRESENCE : `bool` = `True`
     
     If `HATA_CACHE_USERS` is defined as `False`, `HATA_CACHE_PRESENCE` will be set as `False` as well.
 
+HATA_CACHE_SNAPSHOT_DIRECTORY : `None | str` = `None`
+    Directory to store the clients' cache snapshots in. If given, each client saves its guilds with their channels,
+    roles, emojis, stickers and users there when disconnecting, and loads them back into the caches when connecting
+    next time. See ``CacheSnapshot``.
+
 HATA_CACHE_USERS : `bool` = `True`
     Whether hata should cache users. Disabling it can cause many hata features to disappear.
 
 HATA_CDN_ENDPOINT : `None | str` = `None`
     The cdn (content delivery network) endpoint to use instead of the Discord's default.
 
+HATA_COLUMNAR_GUILD_PROFILES : `bool` = `False`
+    Whether the guild profiles of the cached users should be stored in a column based table of each guild instead of
+    an object for each. Reduces the memory used by the members of large guilds by about half.
+    ``User.guild_profiles`` returns ``GuildProfileView``-s, which read and write the table, so looking up a guild
+    profile is about 14 times slower (~729 ns instead of ~50 ns).
+
 HATA_DISCORD_ENDPOINT : `None | str` = `None`
     The endpoint of Discord, to use instead of it's own.
 
+HATA_GATEWAY_COMPRESSION : `str` = `'zlib-stream'`
+    The transport compression used by the client gateways. The accepted values are `'zlib-stream'` and
+    `'zstd-stream'`.
+    
+    `'zstd-stream'` requires either python 3.14 or the `zstandard` package. If neither is available, a warning is
+    shown and `'zlib-stream'` is used instead.
+
+HATA_GATEWAY_ENCODING : `str` = `'json'`
+    The payload encoding used by the client gateways. The accepted values are `'json'` and `'etf'`.
+    
+    `'etf'` (erlang external term format) payloads are decoded directly from the decompressed bytes.
+    Note that when using `'etf'` snowflakes may be received as integers.
+
 HATA_INVITE_ENDPOINT : `None | str` = `None`
     The endpoint used for Discord invites.
 
@@ -51,9 +75,19 @@ HATA_LIBRARY_URL : `str` = `'https://github.com/HuyaneMatsu/hata'`
 HATA_LIBRARY_VERSION : `str` = `None`
     Library version used in user agents.
 
+HATA_MESSAGE_CACHE_GLOBAL_LIMIT : `int` = `0`
+    The maximal amount of new messages kept in the channels' message histories altogether. When exceeded, the least
+    recently used messages are removed from their channel's message history. `0` means no global limit.
+    
+    Can be changed runtime through `MESSAGE_CACHE_POLICY.limit`.
+
 HATA_MESSAGE_CACHE_SIZE : `int` = `10`
     The default message cache size per channel.
 
+HATA_RATE_LIMIT_STATE_DIRECTORY : `None | str` = `None`
+    Directory to store the rate limit state in. If given, the learned rate limit group sizes are saved there and
+    loaded after restart, and the processes of the same host using the same token share the global rate limit.
+
 HATA_RICH_DISCORD_EXCEPTION : `bool` = `False`
     Whether ``DiscordException``-s should show the request data as well.
 
@@ -1,8 +1,9 @@
 __all__ = (
-    'ALLOW_DEBUG_MESSAGES', 'API_VERSION', 'CACHE_PRESENCE', 'CACHE_USER', 'CUSTOM_API_ENDPOINT', 'CUSTOM_CDN_ENDPOINT',
-    'CUSTOM_DISCORD_ENDPOINT', 'CUSTOM_INVITE_ENDPOINT', 'CUSTOM_MEDIA_ENDPOINT', 'CUSTOM_STATUS_ENDPOINT',
-    'DOCS_ENABLED', 'LIBRARY_AGENT_APPENDIX', 'LIBRARY_NAME', 'LIBRARY_URL', 'LIBRARY_VERSION', 'MESSAGE_CACHE_SIZE',
-    'RICH_DISCORD_EXCEPTION'
+    'ALLOW_DEBUG_MESSAGES', 'API_VERSION', 'CACHE_PRESENCE', 'CACHE_SNAPSHOT_DIRECTORY', 'CACHE_USER',
+    'COLUMNAR_GUILD_PROFILES', 'CUSTOM_API_ENDPOINT', 'CUSTOM_CDN_ENDPOINT', 'CUSTOM_DISCORD_ENDPOINT',
+    'CUSTOM_INVITE_ENDPOINT', 'CUSTOM_MEDIA_ENDPOINT', 'CUSTOM_STATUS_ENDPOINT', 'DOCS_ENABLED', 'GATEWAY_COMPRESSION',
+    'GATEWAY_ENCODING', 'LIBRARY_AGENT_APPENDIX', 'LIBRARY_NAME', 'LIBRARY_URL', 'LIBRARY_VERSION',
+    'MESSAGE_CACHE_GLOBAL_LIMIT', 'MESSAGE_CACHE_SIZE', 'RATE_LIMIT_STATE_DIRECTORY', 'RICH_DISCORD_EXCEPTION'
 )
 
 from warnings import warn
@@ -23,11 +24,17 @@ del already_loaded, file_path
 
 CACHE_PRESENCE = get_bool_env('HATA_CACHE_PRESENCE', True)
 CACHE_USER = get_bool_env('HATA_CACHE_USERS', True)
+COLUMNAR_GUILD_PROFILES = get_bool_env('HATA_COLUMNAR_GUILD_PROFILES', False)
 MESSAGE_CACHE_SIZE = get_int_env('HATA_MESSAGE_CACHE_SIZE', 10)
 
 if (MESSAGE_CACHE_SIZE < 0):
     MESSAGE_CACHE_SIZE = 0
 
+MESSAGE_CACHE_GLOBAL_LIMIT = get_int_env('HATA_MESSAGE_CACHE_GLOBAL_LIMIT', 0)
+
+if (MESSAGE_CACHE_GLOBAL_LIMIT < 0):
+    MESSAGE_CACHE_GLOBAL_LIMIT = 0
+
 DOCS_ENABLED = get_bool_env('HATA_DOCS_ENABLED', (get_bool_env is not None))
 if not DOCS_ENABLED:
     get_bool_env.__doc__ = None
@@ -75,10 +82,35 @@ if API_VERSION != DEFAULT_API_VERSION:
         )
 
 
+GATEWAY_ENCODING = get_str_env('HATA_GATEWAY_ENCODING', 'json')
+
+if GATEWAY_ENCODING not in ('json', 'etf'):
+    warn(
+        f'`HATA_GATEWAY_ENCODING` given with an unknown value, got {GATEWAY_ENCODING!r}, defaulting to `\'json\'`!'
+    )
+    GATEWAY_ENCODING = 'json'
+
+
+GATEWAY_COMPRESSION = get_str_env('HATA_GATEWAY_COMPRESSION', 'zlib-stream')
+
+if GATEWAY_COMPRESSION not in ('zlib-stream', 'zstd-stream'):
+    warn(
+        f'`HATA_GATEWAY_COMPRESSION` given with an unknown value, got {GATEWAY_COMPRESSION!r}, defaulting to '
+        f'`\'zlib-stream\'`!'
+    )
+    GATEWAY_COMPRESSION = 'zlib-stream'
+
+
 LIBRARY_AGENT_APPENDIX = get_str_env('HATA_LIBRARY_AGENT_APPENDIX', None)
 LIBRARY_NAME = get_str_env('HATA_LIBRARY_NAME', 'hata')
 LIBRARY_URL = get_str_env('HATA_LIBRARY_URL', 'https://github.com/HuyaneMatsu/hata')
 LIBRARY_VERSION = get_str_env('HATA_LIBRARY_VERSION', None)
 
 
+CACHE_SNAPSHOT_DIRECTORY = get_str_env('HATA_CACHE_SNAPSHOT_DIRECTORY', None)
+
+
+RATE_LIMIT_STATE_DIRECTORY = get_str_env('HATA_RATE_LIMIT_STATE_DIRECTORY', None)
+
+
 RICH_DISCORD_EXCEPTION = get_bool_env('HATA_RICH_DISCORD_EXCEPTION', False)
@@ -1,5 +1,7 @@
 __all__ = ('CooldownHandler', )
 
+from array import array
+
 from scarletio import LOOP_TIME
 
 from ...discord.core import KOKORO
@@ -7,36 +9,214 @@ from ...discord.core import KOKORO
 from .exceptions import CommandCooldownError
 
 
-class CooldownUnit:
+COOLDOWN_SWEEP_DELAY = 1.0
+
+
+class CooldownStore:
     """
-    A cooldown unit stored by a ``CommandCooldownWrapper``-s.
+    Stores the cooldown units of a ``CooldownHandler``.
+    
+    Every unit of a store lives for the same duration, so they expire in the order they were created. The expiries
+    are queued in creation order and swept by a single timer handle, which also collects the units expiring within
+    ``COOLDOWN_SWEEP_DELAY`` of each other, instead of scheduling a timer handle for each unit. The units' fields are
+    stored in arrays indexed by slots.
     
     Attributes
     ----------
-    expires_at : `float`
-        When the cooldown unit will expire in LOOP_TIME time.
-    uses_left : `int`
-        How much uses are left till the respective entity will be locked by cooldown.
+    expires_ats : `array<float>`
+        When the unit at the given slot expires in LOOP_TIME time.
+    free_slots : `array<int>`
+        Slots not used by any units.
+    handle : `None | TimerHandle`
+        The sweep's timer handle.
+    queue_expires_ats : `array<float>`
+        The queued expiries.
+    queue_keys : `array<int>`
+        The keys of the queued expiries.
+    queue_start : `int`
+        The index of the first queued expiry not yet swept.
+    reset : `float`
+        The time after the units expire.
+    slots : `dict<int, int>`
+        Entity identifier - slot relations.
+    uses_lefts : `array<int>`
+        How much uses are left at the given slot till the respective entity will be locked by cooldown.
     """
-    __slots__ = ('expires_at', 'uses_left',)
+    __slots__ = (
+        'expires_ats', 'free_slots', 'handle', 'queue_expires_ats', 'queue_keys', 'queue_start', 'reset', 'slots',
+        'uses_lefts'
+    )
     
-    def __init__(self, expires_at, uses_left):
+    def __new__(cls, reset):
         """
-        Creates a new ``CooldownUnit`` with the given parameters.
+        Creates a new cooldown store.
         
         Parameters
         ----------
-        expires_at : `float`
-            When the cooldown unit will expire in LOOP_TIME time.
-        uses_left : `int`
-            How much uses are left till the respective entity will be locked by cooldown.
+        reset : `float`
+            The time after the units expire.
         """
-        self.expires_at = expires_at
-        self.uses_left = uses_left
+        self = object.__new__(cls)
+        self.expires_ats = array('d')
+        self.free_slots = array('Q')
+        self.handle = None
+        self.queue_expires_ats = array('d')
+        self.queue_keys = array('Q')
+        self.queue_start = 0
+        self.reset = reset
+        self.slots = {}
+        self.uses_lefts = array('q')
+        return self
+    
     
     def __repr__(self):
-        """Returns the object's representation."""
-        return f'{self.__class__.__name__}(expires_at={self.expires_at}, uses_left={self.uses_left})'
+        """Returns the cooldown store's representation."""
+        return f'<{self.__class__.__name__} reset = {self.reset!r}, units = {len(self.slots)!r}>'
+    
+    
+    def __len__(self):
+        """Returns how much units are stored."""
+        return len(self.slots)
+    
+    
+    def get(self, key):
+        """
+        Returns the unit of the given entity.
+        
+        Parameters
+        ----------
+        key : `int`
+            The entity's identifier.
+        
+        Returns
+        -------
+        unit : `None | (float, int)`
+            When the unit expires and how much uses are left.
+        """
+        slot = self.slots.get(key, None)
+        if slot is None:
+            return None
+        
+        return self.expires_ats[slot], self.uses_lefts[slot]
+    
+    
+    def check(self, key, limit, weight):
+        """
+        Uses the given entity's cooldown.
+        
+        Parameters
+        ----------
+        key : `int`
+            The entity's identifier.
+        limit : `int`
+            The uses left after creating a new unit.
+        weight : `int`
+            The weight of one use.
+        
+        Returns
+        -------
+        expires_at : `float`
+            When the cooldown for the given entity will expire. `0.0` if it is not on cooldown.
+        """
+        now = LOOP_TIME()
+        slot = self.slots.get(key, None)
+        if (slot is not None):
+            expires_at = self.expires_ats[slot]
+            if expires_at > now:
+                left = self.uses_lefts[slot]
+                if left > 0:
+                    self.uses_lefts[slot] = left - weight
+                    return 0.0
+                
+                return expires_at
+        
+        else:
+            free_slots = self.free_slots
+            if free_slots:
+                slot = free_slots.pop()
+            else:
+                slot = len(self.expires_ats)
+                self.expires_ats.append(0.0)
+                self.uses_lefts.append(0)
+            
+            self.slots[key] = slot
+        
+        expires_at = now + self.reset
+        self.expires_ats[slot] = expires_at
+        self.uses_lefts[slot] = limit
+        
+        self.queue_keys.append(key)
+        self.queue_expires_ats.append(expires_at)
+        if self.handle is None:
+            self.handle = KOKORO.call_at(expires_at + COOLDOWN_SWEEP_DELAY, type(self)._sweep, self)
+        
+        return 0.0
+    
+    
+    def _sweep(self):
+        """
+        Removes the expired units and schedules the next sweep.
+        """
+        self.handle = None
+        now = LOOP_TIME()
+        
+        expires_ats = self.expires_ats
+        free_slots = self.free_slots
+        queue_expires_ats = self.queue_expires_ats
+        queue_keys = self.queue_keys
+        slots = self.slots
+        
+        index = self.queue_start
+        length = len(queue_keys)
+        
+        while index < length:
+            expires_at = queue_expires_ats[index]
+            if expires_at > now:
+                break
+            
+            key = queue_keys[index]
+            slot = slots.get(key, None)
+            # If the unit was renewed, it is queued again.
+            if (slot is not None) and (expires_ats[slot] == expires_at):
+                del slots[key]
+                free_slots.append(slot)
+            
+            index += 1
+        
+        if index == length:
+            del queue_keys[:]
+            del queue_expires_ats[:]
+            index = 0
+        
+        elif index > (length >> 1):
+            del queue_keys[:index]
+            del queue_expires_ats[:index]
+            index = 0
+        
+        self.queue_start = index
+        
+        if index < len(queue_keys):
+            self.handle = KOKORO.call_at(
+                queue_expires_ats[index] + COOLDOWN_SWEEP_DELAY, type(self)._sweep, self
+            )
+    
+    
+    def clear(self):
+        """
+        Removes every unit and cancels the sweep.
+        """
+        handle = self.handle
+        if (handle is not None):
+            self.handle = None
+            handle.cancel()
+        
+        del self.expires_ats[:]
+        del self.free_slots[:]
+        del self.queue_expires_ats[:]
+        del self.queue_keys[:]
+        self.queue_start = 0
+        self.slots.clear()
+        del self.uses_lefts[:]
 
 
 def _check_user(cooldown_handler, command_context):
@@ -59,21 +239,7 @@ def _check_user(cooldown_handler, command_context):
     """
     user_id = command_context.message.author.id
     
-    cache = cooldown_handler.cache
-    try:
-        unit = cache[user_id]
-    except KeyError:
-        at_ = LOOP_TIME() + cooldown_handler.reset
-        cache[user_id] = CooldownUnit(at_, cooldown_handler.limit)
-        KOKORO.call_at(at_, dict.__delitem__, cache, user_id)
-        return 0.
-    
-    left = unit.uses_left
-    if left > 0:
-        unit.uses_left = left - cooldown_handler.weight
-        return 0.
-    
-    return unit.expires_at
+    return cooldown_handler.cache.check(user_id, cooldown_handler.limit, cooldown_handler.weight)
 
 
 def _check_channel(cooldown_handler, command_context):
@@ -96,21 +262,7 @@ def _check_channel(cooldown_handler, command_context):
     """
     channel_id = command_context. message.channel.id
     
-    cache = cooldown_handler.cache
-    try:
-        unit = cache[channel_id]
-    except KeyError:
-        at_ = LOOP_TIME() + cooldown_handler.reset
-        cache[channel_id] = CooldownUnit(at_, cooldown_handler.limit)
-        KOKORO.call_at(at_, dict.__delitem__, cache, channel_id)
-        return 0.
-    
-    left = unit.uses_left
-    if left > 0:
-        unit.uses_left = left - cooldown_handler.weight
-        return 0.
-    
-    return unit.expires_at
+    return cooldown_handler.cache.check(channel_id, cooldown_handler.limit, cooldown_handler.weight)
 
 
 def _check_guild(cooldown_handler, command_context):
@@ -139,21 +291,7 @@ def _check_guild(cooldown_handler, command_context):
     
     guild_id = channel.guild.id
     
-    cache = cooldown_handler.cache
-    try:
-        unit = cache[guild_id]
-    except KeyError:
-        at_ = LOOP_TIME() + cooldown_handler.reset
-        cache[guild_id] = CooldownUnit(at_, cooldown_handler.limit)
-        KOKORO.call_at(at_, dict.__delitem__, cache, guild_id)
-        return 0.
-    
-    left = unit.uses_left
-    if left > 0:
-        unit.uses_left = left - cooldown_handler.weight
-        return 0.
-    
-    return unit.expires_at
+    return cooldown_handler.cache.check(guild_id, cooldown_handler.limit, cooldown_handler.weight)
 
 
 class CooldownHandler:
@@ -162,7 +300,7 @@ class CooldownHandler:
     
     Attributes
     ----------
-    cache : `dict` of (``DiscordEntity``, ``CooldownUnit``) items
+    cache : ``CooldownStore``
         Cache to remember how much use of the given entity are exhausted already.
     checker : `function`
         Checks after how much time the given entity can use again the respective command.
@@ -266,7 +404,7 @@ class CooldownHandler:
         self.reset = reset
         self.weight = weight
         self.limit = limit - weight
-        self.cache = {}
+        self.cache = CooldownStore(reset)
         
         return self
     
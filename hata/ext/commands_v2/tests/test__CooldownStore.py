@@ -0,0 +1,149 @@
+from array import array
+
+import vampytest
+
+from ..cooldown import CooldownStore
+
+
+def _assert_fields_set(store):
+    """
+    Asserts whether every field of the given store is set.
+    
+    Parameters
+    ----------
+    store : ``CooldownStore``
+        The store to check.
+    """
+    vampytest.assert_instance(store, CooldownStore)
+    vampytest.assert_instance(store.expires_ats, array)
+    vampytest.assert_instance(store.free_slots, array)
+    vampytest.assert_instance(store.handle, object, nullable = True)
+    vampytest.assert_instance(store.queue_expires_ats, array)
+    vampytest.assert_instance(store.queue_keys, array)
+    vampytest.assert_instance(store.queue_start, int)
+    vampytest.assert_instance(store.reset, float)
+    vampytest.assert_instance(store.slots, dict)
+    vampytest.assert_instance(store.uses_lefts, array)
+
+
+def test__CooldownStore__new():
+    """
+    Tests whether ``CooldownStore.__new__`` works as intended.
+    """
+    reset = 60.0
+    
+    store = CooldownStore(reset)
+    _assert_fields_set(store)
+    
+    vampytest.assert_eq(store.reset, reset)
+    vampytest.assert_eq(len(store), 0)
+    vampytest.assert_is(store.handle, None)
+
+
+def test__CooldownStore__repr():
+    """
+    Tests whether ``CooldownStore.__repr__`` works as intended.
+    """
+    store = CooldownStore(60.0)
+    
+    output = repr(store)
+    vampytest.assert_instance(output, str)
+
+
+def test__CooldownStore__check__limit():
+    """
+    Tests whether ``CooldownStore.check`` works as intended.
+    
+    Case: limit.
+    """
+    key_0 = 202610170000
+    key_1 = 202610170001
+    
+    store = CooldownStore(60.0)
+    try:
+        vampytest.assert_eq(store.check(key_0, 1, 1), 0.0)
+        vampytest.assert_eq(store.check(key_0, 1, 1), 0.0)
+        
+        expires_at = store.check(key_0, 1, 1)
+        vampytest.assert_ne(expires_at, 0.0)
+        vampytest.assert_eq(store.get(key_0), (expires_at, 0))
+        
+        vampytest.assert_eq(store.check(key_1, 1, 1), 0.0)
+        vampytest.assert_eq(len(store), 2)
+        vampytest.assert_is_not(store.handle, None)
+    
+    finally:
+        store.clear()
+    
+    vampytest.assert_eq(len(store), 0)
+    vampytest.assert_is(store.handle, None)
+
+
+def test__CooldownStore__check__expired():
+    """
+    Tests whether ``CooldownStore.check`` works as intended.
+    
+    Case: expired, but not swept unit is renewed.
+    """
+    key = 202610170002
+    
+    store = CooldownStore(-2.0)
+    try:
+        vampytest.assert_eq(store.check(key, 0, 1), 0.0)
+        vampytest.assert_eq(store.check(key, 0, 1), 0.0)
+        vampytest.assert_eq(len(store), 1)
+        vampytest.assert_eq(len(store.queue_keys), 2)
+    
+    finally:
+        store.clear()
+
+
+def test__CooldownStore__sweep():
+    """
+    Tests whether ``CooldownStore._sweep`` works as intended.
+    """
+    key_0 = 202610170003
+    key_1 = 202610170004
+    
+    store = CooldownStore(-2.0)
+    try:
+        store.check(key_0, 0, 1)
+        store.check(key_1, 0, 1)
+        
+        store.handle.cancel()
+        store._sweep()
+        
+        vampytest.assert_eq(len(store), 0)
+        vampytest.assert_eq(len(store.queue_keys), 0)
+        vampytest.assert_eq(sorted(store.free_slots), [0, 1])
+        vampytest.assert_is(store.handle, None)
+        
+        # Freed slots are reused.
+        store.check(key_0, 0, 1)
+        vampytest.assert_eq(len(store.expires_ats), 2)
+    
+    finally:
+        store.clear()
+
+
+def test__CooldownStore__sweep__not_expired():
+    """
+    Tests whether ``CooldownStore._sweep`` works as intended.
+    
+    Case: not expired units are kept and the next sweep is scheduled.
+    """
+    key = 202610170005
+    
+    store = CooldownStore(60.0)
+    try:
+        store.check(key, 0, 1)
+        
+        store.handle.cancel()
+        store._sweep()
+        
+        vampytest.assert_eq(len(store), 1)
+        vampytest.assert_eq(len(store.queue_keys), 1)
+        vampytest.assert_is_not(store.handle, None)
+    
+    finally:
+        store.clear()
@@ -18,6 +18,7 @@ from .responding import *
 from .response_modifier import *
 from .router import *
 from .slasher import *
+from .sync_state import *
 from .utils import *
 from .waiters import *
 from .wrappers import *
@@ -46,6 +47,7 @@ __all__ = (
     *response_modifier.__all__,
     *router.__all__,
     *slasher.__all__,
+    *sync_state.__all__,
     *utils.__all__,
     *waiters.__all__,
     *wrappers.__all__,
@@ -84,6 +86,10 @@ def setup_ext_slash(client, **kwargs):
             = `None`, Optional (Keyword only)
         Guilds, where permission overwrites missmatch should be asserted.
     
+    bulk_sync : `bool` = `False`, Optional (Keyword only)
+        Whether the commands of a scope should be synced by overwriting all of them with one request, skipping the
+        scopes which did not change since their last sync.
+    
     delete_commands_on_unload: `bool`, Optional (Keyword only)
         Whether commands should be deleted when unloaded.
     
@@ -94,6 +100,9 @@ def setup_ext_slash(client, **kwargs):
     random_error_message_getter : `None`, `FunctionType` = `None`, Optional (Keyword only)
         Random error message getter used by the default exception handler.
     
+    sync_state_path : `None | str` = `None`, Optional (Keyword only)
+        Path to persist the schema hashes of the bulk synced scopes at, so they are skipped after restart too.
+    
     translation_table : `None`, `str`, `dict` of ((``Locale``, `str`),
             (`None`, `dict` of (`str`, (`None`, `str`)) items)) items, Optional
         Translation table for the commands of the slasher.
@@ -114,11 +123,17 @@ def setup_ext_slash(client, **kwargs):
         If the client has an attribute set what the slasher would use.
     FileNotFoundError
         - If `translation_table` is a string, but not a file.
+    OSError
+        - If reading `sync_state_path` failed.
     TypeError
         - If `client` was not given as ``Client`` instance.
+        - If `bulk_sync` was not given as `bool` instance.
         - If `delete_commands_on_unload` was not given as `bool` instance.
+        - If `sync_state_path` was not given as `None`, `str` instance.
         - If `use_default_exception_handler` was not given as `bool` instance.
         - If `translation_table`'s structure is incorrect.
+    ValueError
+        - If `sync_state_path` is given, but `bulk_sync` is not enabled.
     """
     for attr_name in ('slasher', 'interactions'):
         if hasattr(client, attr_name):
@@ -150,9 +165,11 @@ register_setup_function(
     None,
     (
         'assert_application_command_permission_missmatch_at',
+        'bulk_sync',
         'delete_commands_on_unload',
         'enforce_application_command_permissions',
         'random_error_message_getter',
+        'sync_state_path',
         'translation_table',
         'use_default_exception_handler',
     ),
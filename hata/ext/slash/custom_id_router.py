@@ -0,0 +1,435 @@
+__all__ = ()
+
+from re import UNICODE as RE_UNICODE, compile as re_compile, error as RegexError
+
+from scarletio import RichAttributeErrorBaseType
+
+
+ROUTE_GROUP_POSITIONS = 0
+ROUTE_GROUP_COMBINED_PATTERN = 1
+ROUTE_GROUP_GROUP_POSITIONS = 2
+
+
+def get_combinable_pattern(regex_pattern):
+    """
+    Returns the source of the given regex pattern which can be combined with other ones into a single alternation.
+    
+    Named groups are made non-capturing, so their names cannot collide between the patterns. Patterns with flags,
+    back references or conditional groups cannot be combined, since their meaning would change.
+    
+    Parameters
+    ----------
+    regex_pattern : `re.Pattern`
+        The regex pattern to get combinable source of.
+    
+    Returns
+    -------
+    pattern : `None | str`
+    """
+    if regex_pattern.flags != RE_UNICODE:
+        return None
+    
+    pattern = regex_pattern.pattern
+    if not isinstance(pattern, str):
+        return None
+    
+    parts = []
+    index = 0
+    length = len(pattern)
+    in_class = False
+    
+    while index < length:
+        character = pattern[index]
+        
+        if character == '\\':
+            if index + 1 >= length:
+                return None
+            
+            next_character = pattern[index + 1]
+            if (not in_class) and next_character.isdigit():
+                return None
+            
+            parts.append(pattern[index : index + 2])
+            index += 2
+            continue
+        
+        if in_class:
+            if character == ']':
+                in_class = False
+            
+            parts.append(character)
+            index += 1
+            continue
+        
+        if character == '[':
+            in_class = True
+            parts.append(character)
+            index += 1
+            
+            # `^` and a leading `]` are part of the class.
+            if (index < length) and (pattern[index] == '^'):
+                parts.append('^')
+                index += 1
+            
+            if (index < length) and (pattern[index] == ']'):
+                parts.append(']')
+                index += 1
+            
+            continue
+        
+        if (character == '(') and pattern.startswith('(?', index):
+            if pattern.startswith('(?P<', index):
+                end = pattern.find('>', index)
+                if end == -1:
+                    return None
+                
+                parts.append('(?:')
+                index = end + 1
+                continue
+            
+            if pattern.startswith('(?P=', index) or pattern.startswith('(?(', index):
+                return None
+        
+        parts.append(character)
+        index += 1
+    
+    return ''.join(parts)
+
+
+def get_literal_prefix(pattern):
+    """
+    Returns the literal prefix every string matched by the given pattern starts with.
+    
+    Parameters
+    ----------
+    pattern : `str`
+        Combinable regex pattern source.
+    
+    Returns
+    -------
+    prefix : `str`
+    """
+    # A top level alternation has no common prefix.
+    index = 0
+    length = len(pattern)
+    depth = 0
+    in_class = False
+    
+    while index < length:
+        character = pattern[index]
+        if character == '\\':
+            index += 2
+            continue
+        
+        if in_class:
+            if character == ']':
+                in_class = False
+        
+        elif character == '[':
+            in_class = True
+            if pattern.startswith('^', index + 1):
+                index += 1
+            
+            if pattern.startswith(']', index + 1):
+                index += 1
+        
+        elif character == '(':
+            depth += 1
+        
+        elif character == ')':
+            depth -= 1
+        
+        elif (character == '|') and (not depth):
+            return ''
+        
+        index += 1
+    
+    prefix = []
+    index = 0
+    
+    while index < length:
+        character = pattern[index]
+        if character == '\\':
+            next_character = pattern[index + 1]
+            if next_character.isalnum():
+                break
+            
+            character = next_character
+            index += 2
+        
+        elif character in '.^$*+?{}[]()|':
+            break
+        
+        else:
+            index += 1
+        
+        # A quantified character is not part of the prefix.
+        if (index < length) and (pattern[index] in '*+?{'):
+            break
+        
+        prefix.append(character)
+    
+    return ''.join(prefix)
+
+
+class CustomIdRouter(RichAttributeErrorBaseType):
+    """
+    Routes `custom_id`-s to regex based custom id commands.
+    
+    The patterns are bucketed by their literal prefix and the patterns of each bucket are combined into a single
+    alternation, so routing costs one lookup for each distinct prefix length and one match for each bucket the custom id
+    falls into, regardless of the command count. The buckets are rebuilt on the first routing after a pattern is added
+    or removed.
+    
+    Supports the mapping protocol with ``RegexMatcher`` keys and ``CommandBaseCustomId`` values. The patterns are
+    matched in insertion order.
+    
+    Attributes
+    ----------
+    _dirty : `bool`
+        Whether the route groups should be rebuilt.
+    _fallback_group : `None | (list<int>, None, None)`
+        Route group of the patterns which cannot be combined.
+    _matchers : `list<RegexMatcher>`
+        The routes' matchers in insertion order.
+    _prefixed_groups : `list<(int, dict<str, (list<int>, None | re.Pattern, None | dict<str, int>)>)>`
+        Prefix length - prefix - route group relations of the prefixed patterns.
+    _sources : `dict<RegexMatcher, (None | str, str)>`
+        The combinable source and literal prefix of each route's pattern.
+    _unprefixed_group : `None | (list<int>, None | re.Pattern, None | dict<str, int>)`
+        Route group of the combinable patterns without literal prefix.
+    routes : `dict<RegexMatcher, CommandBaseCustomId>`
+        Regex matcher - command relations.
+    """
+    __slots__ = (
+        '_dirty', '_fallback_group', '_matchers', '_prefixed_groups', '_sources', '_unprefixed_group', 'routes'
+    )
+    
+    def __new__(cls):
+        """
+        Creates a new custom id router.
+        """
+        self = object.__new__(cls)
+        self._dirty = False
+        self._fallback_group = None
+        self._matchers = []
+        self._prefixed_groups = []
+        self._sources = {}
+        self._unprefixed_group = None
+        self.routes = {}
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the custom id router's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' routes = ')
+        repr_parts.append(repr(len(self.routes)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __getitem__(self, regex_matcher):
+        """Returns the command of the given regex matcher."""
+        return self.routes[regex_matcher]
+    
+    
+    def __setitem__(self, regex_matcher, command):
+        """Sets the command of the given regex matcher."""
+        routes = self.routes
+        if regex_matcher not in routes:
+            source = get_combinable_pattern(regex_matcher.regex_pattern)
+            if source is None:
+                prefix = ''
+            else:
+                prefix = get_literal_prefix(source)
+            
+            self._sources[regex_matcher] = (source, prefix)
+            self._dirty = True
+        
+        routes[regex_matcher] = command
+    
+    
+    def __delitem__(self, regex_matcher):
+        """Removes the command of the given regex matcher."""
+        del self.routes[regex_matcher]
+        del self._sources[regex_matcher]
+        self._dirty = True
+    
+    
+    def __contains__(self, regex_matcher):
+        """Returns whether the router has a command for the given regex matcher."""
+        return regex_matcher in self.routes
+    
+    
+    def __iter__(self):
+        """Iterates over the regex matchers of the router."""
+        return iter(self.routes)
+    
+    
+    def __len__(self):
+        """Returns how much routes the router has."""
+        return len(self.routes)
+    
+    
+    def _build(self):
+        """
+        Rebuilds the route groups.
+        """
+        sources = self._sources
+        matchers = [*self.routes.keys()]
+        fallback_positions = []
+        unprefixed_positions = []
+        prefixed_positions = {}
+        
+        for position, regex_matcher in enumerate(matchers):
+            source, prefix = sources[regex_matcher]
+            if source is None:
+                fallback_positions.append(position)
+            
+            elif prefix:
+                prefixed_positions.setdefault(len(prefix), {}).setdefault(prefix, []).append(position)
+            
+            else:
+                unprefixed_positions.append(position)
+        
+        self._dirty = False
+        self._matchers = matchers
+        self._fallback_group = (fallback_positions, None, None) if fallback_positions else None
+        self._unprefixed_group = self._create_group(unprefixed_positions) if unprefixed_positions else None
+        self._prefixed_groups = [
+            (length, {prefix: self._create_group(positions) for prefix, positions in groups.items()})
+            for length, groups in sorted(prefixed_positions.items())
+        ]
+    
+    
+    def _create_group(self, positions):
+        """
+        Creates a route group combining the patterns at the given positions.
+        
+        Parameters
+        ----------
+        positions : `list<int>`
+            The positions of the patterns.
+        
+        Returns
+        -------
+        group : `(list<int>, None | re.Pattern, None | dict<str, int>)`
+        """
+        if len(positions) == 1:
+            return (positions, None, None)
+        
+        matchers = self._matchers
+        sources = self._sources
+        group_positions = {}
+        parts = []
+        
+        for position in positions:
+            group_name = f'_{position}'
+            group_positions[group_name] = position
+            parts.append(f'(?P<{group_name}>{sources[matchers[position]][0]})')
+        
+        try:
+            combined_pattern = re_compile('|'.join(parts))
+        except RegexError:
+            return (positions, None, None)
+        
+        return (positions, combined_pattern, group_positions)
+    
+    
+    def _match_group(self, group, custom_id, limit):
+        """
+        Matches the given custom id with the patterns of the given route group which were added before `limit`.
+        
+        Parameters
+        ----------
+        group : `(list<int>, None | re.Pattern, None | dict<str, int>)`
+            The route group.
+        custom_id : `str`
+            The custom id to match.
+        limit : `int`
+            Position of the best match so far.
+        
+        Returns
+        -------
+        position : `int`
+            The position of the first matched pattern. `limit` if there is none.
+        regex_match : `None | RegexMatch`
+            The match if it is known.
+        """
+        positions = group[ROUTE_GROUP_POSITIONS]
+        combined_pattern = group[ROUTE_GROUP_COMBINED_PATTERN]
+        
+        if combined_pattern is None:
+            for position in positions:
+                if position >= limit:
+                    break
+                
+                regex_match = self._matchers[position](custom_id)
+                if (regex_match is not None):
+                    return position, regex_match
+            
+            return limit, None
+        
+        if positions[0] >= limit:
+            return limit, None
+        
+        matched = combined_pattern.fullmatch(custom_id)
+        if matched is None:
+            return limit, None
+        
+        position = group[ROUTE_GROUP_GROUP_POSITIONS][matched.lastgroup]
+        if position >= limit:
+            return limit, None
+        
+        return position, None
+    
+    
+    def route(self, custom_id):
+        """
+        Routes the given custom id to the first command with a matching pattern.
+        
+        Parameters
+        ----------
+        custom_id : `str`
+            The custom id to route.
+        
+        Returns
+        -------
+        route : `None | (CommandBaseCustomId, RegexMatch)`
+            The matched command and the match.
+        """
+        if self._dirty:
+            self._build()
+        
+        matchers = self._matchers
+        limit = len(matchers)
+        regex_match = None
+        
+        for length, groups in self._prefixed_groups:
+            group = groups.get(custom_id[:length], None)
+            if (group is not None):
+                position, group_regex_match = self._match_group(group, custom_id, limit)
+                if position < limit:
+                    limit = position
+                    regex_match = group_regex_match
+        
+        for group in (self._unprefixed_group, self._fallback_group):
+            if (group is not None):
+                position, group_regex_match = self._match_group(group, custom_id, limit)
+                if position < limit:
+                    limit = position
+                    regex_match = group_regex_match
+        
+        if limit == len(matchers):
+            return None
+        
+        regex_matcher = matchers[limit]
+        if regex_match is None:
+            regex_match = regex_matcher(custom_id)
+            if regex_match is None:
+                return None
+        
+        return self.routes[regex_matcher], regex_match
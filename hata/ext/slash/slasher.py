@@ -10,6 +10,9 @@ from scarletio import (
 from ...discord.application_command import (
     ApplicationCommand, ApplicationCommandTargetType, CONTEXT_TARGET_TYPES as APPLICATION_COMMAND_CONTEXT_TARGET_TYPES
 )
+from ...discord.application_command.application_command.constants import (
+    LIMIT_GLOBAL as APPLICATION_COMMAND_LIMIT_GLOBAL, LIMIT_GUILD as APPLICATION_COMMAND_LIMIT_GUILD
+)
 from ...discord.client import Client
 from ...discord.client.request_helpers import get_guild_id
 from ...discord.core import KOKORO
@@ -24,6 +27,7 @@ from .command import (
 )
 from .command.component_command.constants import COMMAND_TARGETS_COMPONENT_COMMAND
 from .command.form_submit_command.constants import COMMAND_TARGETS_FORM_COMPONENT_COMMAND
+from .custom_id_router import CustomIdRouter
 from .exceptions import (
     SlasherSyncError, _validate_random_error_message_getter, default_slasher_exception_handler,
     default_slasher_random_error_message_getter
@@ -37,6 +41,7 @@ from .permission_mismatch import (
     PermissionMismatchWarning, are_application_command_permission_overwrites_equal,
     check_and_warn_can_request_owners_access_of, create_permission_mismatch_message
 )
+from .sync_state import SlasherSyncState, count_changed_commands, get_command_key, get_schema_hash, get_scope_hash
 from .utils import (
     RUNTIME_SYNC_HOOKS, SYNC_ID_GLOBAL, SYNC_ID_MAIN, SYNC_ID_NON_GLOBAL, UNLOADING_BEHAVIOUR_DELETE,
     UNLOADING_BEHAVIOUR_KEEP
@@ -909,11 +914,11 @@ class Slasher(
     _form_submit_commands : `set` of ``FormSubmitCommand``
         The form commands added to the slasher.
     
-    _regex_custom_id_to_component_command : `dict` of (``RegexMatcher``, ``ComponentCommand``) items
-        A dictionary which contains component commands based on regex patterns.
+    _regex_custom_id_to_component_command : ``CustomIdRouter``
+        Router which contains component commands based on regex patterns.
     
-    _regex_custom_id_to_form_submit_command : `dict` of (``RegexMatcher``, ``FormSubmitCommand``) items
-        A dictionary which contains form submit commands based on regex patterns.
+    _regex_custom_id_to_form_submit_command : ``CustomIdRouter``
+        Router which contains form submit commands based on regex patterns.
     
     _self_reference : `None | WeakReferer<instance>`
         Reference back to the slasher. Used to reference back from commands.
@@ -945,6 +950,9 @@ class Slasher(
     _sync_should : `set` of `int`
         A set of guild id-s which should be synced.
     
+    _sync_state : ``None | SlasherSyncState``
+        Stores the schema hashes of the scopes synced by bulk overwriting. Set only if bulk syncing is enabled.
+    
     _sync_tasks : `dict` of (`int, ``Task``) items
         A dictionary of guilds, which are in sync at the moment.
     
@@ -979,7 +987,8 @@ class Slasher(
         '_owners_access_get_impossible', '_owners_access_get_task', '_random_error_message_getter',
         '_regex_custom_id_to_component_command', '_regex_custom_id_to_form_submit_command', '_self_reference',
         '_string_custom_id_to_component_command', '_string_custom_id_to_form_submit_command', '_sync_done',
-        '_sync_should', '_sync_tasks', '_synced_permissions', '_translation_table', 'command_id_to_command'
+        '_sync_should', '_sync_state', '_sync_tasks', '_synced_permissions', '_translation_table',
+        'command_id_to_command'
     )
     
     __event_name__ = 'interaction_create'
@@ -994,7 +1003,9 @@ class Slasher(
         enforce_application_command_permissions = False,
         use_default_exception_handler = True,
         random_error_message_getter = None,
-        translation_table = None
+        translation_table = None,
+        bulk_sync = False,
+        sync_state_path = None,
     ):
         """
         Creates a new interaction event handler.
@@ -1008,6 +1019,10 @@ class Slasher(
                 = `None`, Optional (Keyword only)
             Guilds, where permission overwrites missmatch should be asserted.
         
+        bulk_sync : `bool` = `False`, Optional (Keyword only)
+            Whether the commands of a scope should be synced by overwriting all of them with one request, skipping
+            the scopes which did not change since their last sync.
+        
         delete_commands_on_unload: `bool`, Optional (Keyword only)
             Whether commands should be deleted when unloaded.
         
@@ -1019,6 +1034,9 @@ class Slasher(
         random_error_message_getter : `None`, `FunctionType` = `None`, Optional (Keyword only)
             Random error message getter used by the default exception handler.
         
+        sync_state_path : `None | str` = `None`, Optional (Keyword only)
+            Path to persist the schema hashes of the bulk synced scopes at, so they are skipped after restart too.
+        
         translation_table : `None`, `str`, `dict` of ((``Locale``, `str`),
                 (`None`, `dict` of (`str`, (`None`, `str`)) items)) items, Optional
             Translation table for the commands of the slasher.
@@ -1030,11 +1048,17 @@ class Slasher(
         ------
         FileNotFoundError
             - If `translation_table` is a string, but not a file.
+        OSError
+            - If reading `sync_state_path` failed.
         TypeError
+            - If `bulk_sync` was not given as `bool`.
             - If `delete_commands_on_unload` was not given as `bool`.
+            - If `sync_state_path` was not given as `None`, `str`.
             - If `use_default_exception_handler` was not given as `bool`.
             - If `client` was not given as ``Client``.
             - If `translation_table`'s structure is incorrect.
+        ValueError
+            - If `sync_state_path` is given, but `bulk_sync` is not enabled.
         """
         # client
         if not isinstance(client, Client):
@@ -1141,6 +1165,34 @@ class Slasher(
         else:
             exception_handlers = None
         
+        # bulk_sync
+        if type(bulk_sync) is bool:
+            pass
+        elif isinstance(bulk_sync, bool):
+            bulk_sync = bool(bulk_sync)
+        else:
+            raise TypeError(
+                f'`bulk_sync` can be `bool`, got {type(bulk_sync).__name__}; {bulk_sync!r}.'
+            )
+        
+        # sync_state_path
+        if (sync_state_path is not None) and (not isinstance(sync_state_path, str)):
+            raise TypeError(
+                f'`sync_state_path` can be `None`, `str`, got {type(sync_state_path).__name__}; {sync_state_path!r}.'
+            )
+        
+        if bulk_sync:
+            sync_state = SlasherSyncState(sync_state_path)
+            sync_state.load()
+        
+        elif (sync_state_path is None):
+            sync_state = None
+        
+        else:
+            raise ValueError(
+                f'`sync_state_path` can only be given if `bulk_sync` is enabled; sync_state_path = {sync_state_path!r}.'
+            )
+        
         
         self = object.__new__(cls)
         self._call_later = None
@@ -1150,6 +1202,7 @@ class Slasher(
         self._sync_tasks = {}
         self._sync_should = set()
         self._sync_done = set()
+        self._sync_state = sync_state
         self._get_permission_tasks = {}
         self._synced_permissions = {}
         self._component_interaction_waiters = WeakKeyDictionary()
@@ -1160,11 +1213,11 @@ class Slasher(
         
         self._component_commands = set()
         self._string_custom_id_to_component_command = {}
-        self._regex_custom_id_to_component_command = {}
+        self._regex_custom_id_to_component_command = CustomIdRouter()
         
         self._form_submit_commands = set()
         self._string_custom_id_to_form_submit_command = {}
-        self._regex_custom_id_to_form_submit_command = {}
+        self._regex_custom_id_to_form_submit_command = CustomIdRouter()
         
         self._exception_handlers = exception_handlers
         self._self_reference = None
@@ -1266,15 +1319,11 @@ class Slasher(
         try:
             component_command = self._string_custom_id_to_component_command[custom_id]
         except KeyError:
-            for regex_matcher in self._regex_custom_id_to_component_command:
-                regex_match = regex_matcher(custom_id)
-                if (regex_match is None):
-                    continue
-                
-                component_command = self._regex_custom_id_to_component_command[regex_matcher]
-                break
-            else:
+            route = self._regex_custom_id_to_component_command.route(custom_id)
+            if route is None:
                 return
+            
+            component_command, regex_match = route
         else:
             regex_match = None
         
@@ -1331,15 +1380,11 @@ class Slasher(
         try:
             form_submit_command = self._string_custom_id_to_form_submit_command[custom_id]
         except KeyError:
-            for regex_matcher in self._regex_custom_id_to_form_submit_command:
-                regex_match = regex_matcher(custom_id)
-                if (regex_match is None):
-                    continue
-                
-                form_submit_command = self._regex_custom_id_to_form_submit_command[regex_matcher]
-                break
-            else:
+            route = self._regex_custom_id_to_form_submit_command.route(custom_id)
+            if route is None:
                 return
+            
+            form_submit_command, regex_match = route
         else:
             regex_match = None
         
@@ -1700,10 +1745,14 @@ class Slasher(
         else:
             return command
         
+        # If the command is not found in a scope synced from the stored sync state, the state might be outdated.
+        self._invalidate_restored_sync(SYNC_ID_GLOBAL)
+        
         # First request guild commands
         guild = interaction_event.guild
         if (guild is not None):
             guild_id = guild.id
+            self._invalidate_restored_sync(guild_id)
             if not await self._sync_guild(client, guild_id):
                 return None
             
@@ -1749,7 +1798,13 @@ class Slasher(
         try:
             task = self._sync_tasks[guild_id]
         except KeyError:
-            task = self._sync_tasks[guild_id] = Task(KOKORO, self._sync_guild_task(client, guild_id))
+            if self._should_bulk_sync(guild_id):
+                coroutine = self._bulk_sync_task(client, guild_id)
+            else:
+                self._discard_sync_state_scope(guild_id)
+                coroutine = self._sync_guild_task(client, guild_id)
+            
+            task = self._sync_tasks[guild_id] = Task(KOKORO, coroutine)
         
         return await task
     
@@ -1775,11 +1830,98 @@ class Slasher(
         try:
             task = self._sync_tasks[SYNC_ID_GLOBAL]
         except KeyError:
-            task = self._sync_tasks[SYNC_ID_GLOBAL] = Task(KOKORO, self._sync_global_task(client))
+            if self._should_bulk_sync(SYNC_ID_GLOBAL):
+                coroutine = self._bulk_sync_task(client, SYNC_ID_GLOBAL)
+            else:
+                self._discard_sync_state_scope(SYNC_ID_GLOBAL)
+                coroutine = self._sync_global_task(client)
+            
+            task = self._sync_tasks[SYNC_ID_GLOBAL] = Task(KOKORO, coroutine)
         
         return await task
     
     
+    def _should_bulk_sync(self, sync_id):
+        """
+        Returns whether the given scope should be synced by overwriting all of its commands.
+        
+        Bulk syncing is not used for guilds while non-global commands are added, since those are only matched to the
+        guilds' existing commands, and for scopes without commands or with more commands than what can be overwritten
+        at once.
+        
+        Parameters
+        ----------
+        sync_id : `int`
+            The scope's sync identifier.
+        
+        Returns
+        -------
+        should_bulk_sync : `bool`
+        """
+        if self._sync_state is None:
+            return False
+        
+        if sync_id == SYNC_ID_GLOBAL:
+            limit = APPLICATION_COMMAND_LIMIT_GLOBAL
+        
+        else:
+            limit = APPLICATION_COMMAND_LIMIT_GUILD
+            
+            non_global_command_state = self._command_states.get(SYNC_ID_NON_GLOBAL, None)
+            if (non_global_command_state is not None) and (
+                non_global_command_state.get_should_add_application_commands() or
+                non_global_command_state.get_should_keep_commands()
+            ):
+                return False
+        
+        command_state = self._command_states.get(sync_id, None)
+        if command_state is None:
+            return False
+        
+        command_count = (
+            len(command_state.get_should_add_application_commands()) +
+            len(command_state.get_should_keep_commands())
+        )
+        return (command_count > 0) and (command_count < limit)
+    
+    
+    def _discard_sync_state_scope(self, sync_id):
+        """
+        Discards the given scope from the sync state if applicable. Called when the scope is synced one by one, since
+        then its commands might be changed by other means than overwriting.
+        
+        Parameters
+        ----------
+        sync_id : `int`
+            The scope's sync identifier.
+        """
+        sync_state = self._sync_state
+        if (sync_state is not None):
+            sync_state.discard_scope(sync_id)
+    
+    
+    def _invalidate_restored_sync(self, sync_id):
+        """
+        Invalidates the given scope if it was synced from the stored sync state, so it is synced again.
+        
+        Parameters
+        ----------
+        sync_id : `int`
+            The scope's sync identifier.
+        
+        Returns
+        -------
+        invalidated : `bool`
+        """
+        sync_state = self._sync_state
+        if (sync_state is None) or (sync_id not in sync_state.restored_sync_ids):
+            return False
+        
+        sync_state.discard_scope(sync_id)
+        self._sync_done.discard(sync_id)
+        return True
+    
+    
     def _unregister_helper(self, command, command_state, guild_id):
         """
         Unregisters all the call relations of the given command.
@@ -2193,6 +2335,190 @@ class Slasher(
         return success
     
     
+    async def _bulk_sync_task(self, client, sync_id):
+        """
+        Syncs the commands of the given scope by overwriting all of them with one request. If the scope's commands
+        did not change since it was last synced, registers them from the stored sync state without any requests.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The respective client.
+        sync_id : `int`
+            The scope's sync identifier.
+        
+        Returns
+        -------
+        success : `bool`
+            Whether syncing was successful.
+        """
+        success = False
+        sync_state = self._sync_state
+        
+        try:
+            command_state = self._command_states[sync_id]
+            
+            commands = {}
+            schemas = []
+            schema_hashes = {}
+            
+            for command, kept in (
+                *((command, False) for command in command_state.get_should_add_application_commands()),
+                *((command, True) for command in command_state.get_should_keep_commands()),
+            ):
+                schema = command.get_schema()
+                key = get_command_key(schema)
+                commands[key] = (command, kept)
+                schemas.append(schema)
+                schema_hashes[key] = get_schema_hash(schema)
+            
+            scope_hash = get_scope_hash(schema_hashes)
+            
+            sync_state.bind(client.application.id)
+            stored_scope = sync_state.get_scope(sync_id)
+            
+            assert_application_command_permission_missmatch_at = \
+                self._assert_application_command_permission_missmatch_at
+            
+            # Permissions are synced by application command, so we cannot skip if they are asserted.
+            if (
+                (stored_scope is not None) and
+                (stored_scope[0] == scope_hash) and
+                (assert_application_command_permission_missmatch_at is None) and
+                all(key in stored_scope[1] for key in commands.keys())
+            ):
+                stored_commands = stored_scope[1]
+                for key, (command, kept) in commands.items():
+                    if kept:
+                        self._keep_helper(command, command_state, sync_id)
+                    else:
+                        self._register_helper(command, command_state, sync_id, stored_commands[key][0])
+                
+                sync_state.restored_sync_ids.add(sync_id)
+                sync_state.skip_count += 1
+                # Syncing one by one requests the scope's commands.
+                sync_state.requests_avoided += 1
+                success = True
+            
+            else:
+                try:
+                    if sync_id == SYNC_ID_GLOBAL:
+                        coroutine = client.application_command_global_update_multiple(schemas)
+                    else:
+                        coroutine = client.application_command_guild_update_multiple(sync_id, schemas)
+                    application_commands = await coroutine
+                except GeneratorExit:
+                    raise
+                
+                except BaseException as err:
+                    # No internet connection
+                    if not isinstance(err, ConnectionError):
+                        await client.events.error(client, f'{self!r}._bulk_sync_task', err)
+                
+                else:
+                    sync_state.request_count += 1
+                    if (stored_scope is not None):
+                        # Syncing one by one requests the scope's commands, then creates, edits and deletes them.
+                        sync_state.requests_avoided += count_changed_commands(stored_scope[1], schema_hashes)
+                    
+                    stored_commands = {}
+                    permission_sync_callbacks = None
+                    
+                    for application_command in application_commands:
+                        key = get_command_key(application_command)
+                        try:
+                            command, kept = commands[key]
+                        except KeyError:
+                            continue
+                        
+                        stored_commands[key] = (application_command.id, schema_hashes[key])
+                        
+                        if kept:
+                            self._keep_helper(command, command_state, sync_id)
+                            continue
+                        
+                        self._register_helper(command, command_state, sync_id, application_command.id)
+                        
+                        if (assert_application_command_permission_missmatch_at is not None):
+                            callback = (
+                                type(self)._sync_permissions, self, client, command, sync_id, application_command
+                            )
+                            if permission_sync_callbacks is None:
+                                permission_sync_callbacks = []
+                            permission_sync_callbacks.append(callback)
+                    
+                    # If not every command was returned, we cannot restore them next time, so sync them again.
+                    if len(stored_commands) == len(commands):
+                        sync_state.set_scope(sync_id, scope_hash, stored_commands)
+                    else:
+                        sync_state.discard_scope(sync_id)
+                    
+                    success = True
+                    
+                    if (
+                        (assert_application_command_permission_missmatch_at is not None) and
+                        (sync_id in assert_application_command_permission_missmatch_at)
+                    ):
+                        callback = (type(self)._sync_permissions_task, self, client, sync_id, None, None)
+                        if permission_sync_callbacks is None:
+                            permission_sync_callbacks = []
+                        permission_sync_callbacks.append(callback)
+                    
+                    if (permission_sync_callbacks is not None):
+                        task_group = TaskGroup(
+                            KOKORO, (Task(KOKORO, callback[0](*callback[1:])) for callback in permission_sync_callbacks)
+                        )
+                        failed_task = await task_group.wait_exception()
+                        if (failed_task is not None):
+                            task_group.cancel_all()
+                            failed_task.get_result()
+                        
+                        for future in task_group.done:
+                            if not future.get_result():
+                                success = False
+            
+            if success:
+                for command in command_state.get_should_remove_application_commands():
+                    self._unregister_helper(command, command_state, sync_id)
+        
+        finally:
+            try:
+                del self._sync_tasks[sync_id]
+            except KeyError:
+                pass
+        
+        if success:
+            self._sync_should.discard(sync_id)
+            self._sync_done.add(sync_id)
+        
+        # If a main sync is running, it saves the state when done.
+        if SYNC_ID_MAIN not in self._sync_tasks:
+            self._save_sync_state(client)
+        
+        return success
+    
+    
+    def _save_sync_state(self, client):
+        """
+        Saves the sync state if applicable. If saving fails, reports it to the client's error event handler.
+        
+        Parameters
+        ----------
+        client : ``Client``
+            The respective client.
+        """
+        sync_state = self._sync_state
+        if sync_state is None:
+            return
+        
+        try:
+            sync_state.save()
+        except OSError as err:
+            Task(KOKORO, client.events.error(client, f'{self!r}._save_sync_state', err))
+    
+    
     async def _sync_permissions_then_register(self, client, command, command_state, guild_id, application_command):
         """
         Syncs the command's permissions, then registers it.
@@ -2731,6 +3057,8 @@ class Slasher(
                 del self._sync_tasks[SYNC_ID_MAIN]
             except KeyError:
                 pass
+            
+            self._save_sync_state(client)
     
     
     def discard_kept_commands(self):
@@ -3077,8 +3405,8 @@ class Slasher(
             A set of all the added commands.
         string_custom_id_to_custom_id_based_command : `dict` of (`str`, ``CommandBaseCustomId``) items
             A dictionary which contains commands by their `custom_id`.
-        regex_custom_id_to_custom_id_based_command : ``dict` of (``RegexMatcher``, ``CommandBaseCustomId``) items
-            A dictionary which contains commands based on regex patterns.
+        regex_custom_id_to_custom_id_based_command : ``CustomIdRouter``
+            Router which contains commands based on regex patterns.
         
         Raises
         ------
@@ -3178,7 +3506,7 @@ class Slasher(
         form_submit_command : ``FormSubmitCommand``
             The command to remove.
         """
-        self._add_custom_id_based_command(
+        self._remove_custom_id_based_command(
             form_submit_command, self._form_submit_commands, self._string_custom_id_to_form_submit_command,
             self._regex_custom_id_to_form_submit_command
         )
@@ -3199,8 +3527,8 @@ class Slasher(
             A set of all the added commands.
         string_custom_id_to_custom_id_based_command : `dict` of (`str`, ``CommandBaseCustomId``) items
             A dictionary which contains commands by their `custom_id`.
-        regex_custom_id_to_custom_id_based_command : ``dict` of (``RegexMatcher``, ``CommandBaseCustomId``) items
-            A dictionary which contains commands based on regex patterns.
+        regex_custom_id_to_custom_id_based_command : ``CustomIdRouter``
+            Router which contains commands based on regex patterns.
         """
         try:
             custom_id_based_commands.remove(custom_id_based_command)
@@ -3536,6 +3864,20 @@ class Slasher(
         self._sync_done.discard(guild_id)
     
     
+    @property
+    def sync_state(self):
+        """
+        Returns the slasher's sync state, which stores the schema hashes of the bulk synced scopes and counts the done
+        and avoided sync requests.
+        
+        Returns
+        -------
+        sync_state : ``None | SlasherSyncState``
+            Set only if bulk syncing is enabled.
+        """
+        return self._sync_state
+    
+    
     @property
     def random_error_message_getter(self):
         """
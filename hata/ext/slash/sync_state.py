@@ -0,0 +1,343 @@
+__all__ = ('SlasherSyncState',)
+
+from hashlib import sha256
+from json import dumps as dump_json
+from os import getpid, replace as replace_file
+
+from scarletio import RichAttributeErrorBaseType, from_json, to_json
+
+
+SYNC_STATE_VERSION = 1
+
+
+def get_command_key(schema):
+    """
+    Returns the key used to identify the given application command schema inside of its scope.
+    
+    Parameters
+    ----------
+    schema : ``ApplicationCommand``
+        The application command schema.
+    
+    Returns
+    -------
+    key : `str`
+    """
+    return f'{schema.target_type.value}:{schema.name}'
+
+
+def get_schema_hash(schema):
+    """
+    Returns a stable hash of the given application command schema.
+    
+    Parameters
+    ----------
+    schema : ``ApplicationCommand``
+        The application command schema.
+    
+    Returns
+    -------
+    schema_hash : `str`
+    """
+    return sha256(
+        dump_json(schema.to_data(defaults = True), sort_keys = True, separators = (',', ':')).encode()
+    ).hexdigest()
+
+
+def get_scope_hash(schema_hashes):
+    """
+    Returns a stable hash of a scope's application command schemas.
+    
+    Parameters
+    ----------
+    schema_hashes : `dict<str, str>`
+        Command key - schema hash relations.
+    
+    Returns
+    -------
+    scope_hash : `str`
+    """
+    return sha256(
+        '\n'.join(sorted(f'{key}={schema_hash}' for key, schema_hash in schema_hashes.items())).encode()
+    ).hexdigest()
+
+
+def count_changed_commands(stored_commands, schema_hashes):
+    """
+    Counts how much create, edit and delete requests would be required to go from the stored commands to the given
+    ones.
+    
+    Parameters
+    ----------
+    stored_commands : `dict<str, (int, str)>`
+        Command key - (application command identifier, schema hash) relations.
+    schema_hashes : `dict<str, str>`
+        Command key - schema hash relations.
+    
+    Returns
+    -------
+    changed_count : `int`
+    """
+    changed_count = 0
+    
+    for key, schema_hash in schema_hashes.items():
+        try:
+            application_command_id, stored_schema_hash = stored_commands[key]
+        except KeyError:
+            changed_count += 1
+        else:
+            if stored_schema_hash != schema_hash:
+                changed_count += 1
+    
+    for key in stored_commands.keys():
+        if key not in schema_hashes:
+            changed_count += 1
+    
+    return changed_count
+
+
+class SlasherSyncState(RichAttributeErrorBaseType):
+    """
+    Stores a hash of the application command schemas of each scope synced by bulk overwriting, so the scopes which
+    did not change can be skipped on startup.
+    
+    Attributes
+    ----------
+    application_id : `int`
+        The application's identifier the stored scopes belong to.
+    changed : `bool`
+        Whether the state changed since it was last saved.
+    path : `None | str`
+        Path to persist the state at.
+    request_count : `int`
+        How much requests were done to sync the application commands.
+    requests_avoided : `int`
+        How much requests were avoided compared to syncing the application commands one by one.
+    restored_sync_ids : `set<int>`
+        The scopes which were synced from the stored state without requesting their application commands.
+    scopes : `dict<int, (str, dict<str, (int, str)>)>`
+        Scope hash and command key - (application command identifier, schema hash) relations for each stored scope.
+    skip_count : `int`
+        How much scopes were skipped.
+    """
+    __slots__ = (
+        'application_id', 'changed', 'path', 'request_count', 'requests_avoided', 'restored_sync_ids', 'scopes',
+        'skip_count'
+    )
+    
+    def __new__(cls, path):
+        """
+        Creates a new sync state.
+        
+        Parameters
+        ----------
+        path : `None | str`
+            Path to persist the state at.
+        """
+        self = object.__new__(cls)
+        self.application_id = 0
+        self.changed = False
+        self.path = path
+        self.request_count = 0
+        self.requests_avoided = 0
+        self.restored_sync_ids = set()
+        self.scopes = {}
+        self.skip_count = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the sync state's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        path = self.path
+        if (path is not None):
+            repr_parts.append(' path = ')
+            repr_parts.append(repr(path))
+            repr_parts.append(',')
+        
+        repr_parts.append(' scopes = ')
+        repr_parts.append(repr(len(self.scopes)))
+        
+        repr_parts.append(', request_count = ')
+        repr_parts.append(repr(self.request_count))
+        
+        repr_parts.append(', requests_avoided = ')
+        repr_parts.append(repr(self.requests_avoided))
+        
+        repr_parts.append(', skip_count = ')
+        repr_parts.append(repr(self.skip_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def bind(self, application_id):
+        """
+        Binds the state to the given application. If it was bound to an other one, the stored scopes are cleared.
+        
+        Parameters
+        ----------
+        application_id : `int`
+            The application's identifier.
+        """
+        if self.application_id != application_id:
+            self.application_id = application_id
+            self.scopes.clear()
+            self.restored_sync_ids.clear()
+            self.changed = True
+    
+    
+    def get_scope(self, sync_id):
+        """
+        Returns the stored scope for the given sync identifier.
+        
+        Parameters
+        ----------
+        sync_id : `int`
+            The scope's sync identifier.
+        
+        Returns
+        -------
+        scope : `None | (str, dict<str, (int, str)>)`
+        """
+        return self.scopes.get(sync_id, None)
+    
+    
+    def set_scope(self, sync_id, scope_hash, commands):
+        """
+        Stores the scope of the given sync identifier.
+        
+        Parameters
+        ----------
+        sync_id : `int`
+            The scope's sync identifier.
+        scope_hash : `str`
+            The scope's hash.
+        commands : `dict<str, (int, str)>`
+            Command key - (application command identifier, schema hash) relations.
+        """
+        self.scopes[sync_id] = (scope_hash, commands)
+        self.restored_sync_ids.discard(sync_id)
+        self.changed = True
+    
+    
+    def discard_scope(self, sync_id):
+        """
+        Discards the scope of the given sync identifier, so it is synced again.
+        
+        Parameters
+        ----------
+        sync_id : `int`
+            The scope's sync identifier.
+        """
+        if self.scopes.pop(sync_id, None) is not None:
+            self.changed = True
+        
+        self.restored_sync_ids.discard(sync_id)
+    
+    
+    def to_data(self):
+        """
+        Converts the sync state to json serializable data.
+        
+        Returns
+        -------
+        data : `dict<str, object>`
+        """
+        return {
+            'version': SYNC_STATE_VERSION,
+            'application_id': str(self.application_id),
+            'scopes': {
+                str(sync_id): {
+                    'hash': scope_hash,
+                    'commands': {
+                        key: [str(application_command_id), schema_hash]
+                        for key, (application_command_id, schema_hash) in commands.items()
+                    },
+                }
+                for sync_id, (scope_hash, commands) in self.scopes.items()
+            },
+        }
+    
+    
+    def update_from_data(self, data):
+        """
+        Updates the sync state from the given data. If the data is of an other version or is malformed, it is ignored.
+        
+        Parameters
+        ----------
+        data : `object`
+            Data created by ``.to_data``.
+        """
+        try:
+            if data['version'] != SYNC_STATE_VERSION:
+                return
+            
+            application_id = int(data['application_id'])
+            scopes = {
+                int(sync_id): (
+                    scope_data['hash'],
+                    {
+                        key: (int(application_command_id), schema_hash)
+                        for key, (application_command_id, schema_hash) in scope_data['commands'].items()
+                    },
+                )
+                for sync_id, scope_data in data['scopes'].items()
+            }
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return
+        
+        self.application_id = application_id
+        self.scopes = scopes
+        self.restored_sync_ids.clear()
+        self.changed = False
+    
+    
+    def load(self):
+        """
+        Loads the state from its path. If the file does not exist or is malformed, does nothing.
+        
+        Raises
+        ------
+        OSError
+            If reading the file failed.
+        """
+        path = self.path
+        if path is None:
+            return
+        
+        try:
+            with open(path, 'r') as file:
+                raw_data = file.read()
+        except FileNotFoundError:
+            return
+        
+        try:
+            data = from_json(raw_data)
+        except ValueError:
+            return
+        
+        self.update_from_data(data)
+    
+    
+    def save(self):
+        """
+        Saves the state to its path if it changed. The file is replaced atomically.
+        
+        Raises
+        ------
+        OSError
+            If writing the file failed.
+        """
+        path = self.path
+        if (path is None) or (not self.changed):
+            return
+        
+        temporary_path = f'{path}.{getpid()}.tmp'
+        
+        with open(temporary_path, 'w') as file:
+            file.write(to_json(self.to_data()))
+        
+        replace_file(temporary_path, path)
+        self.changed = False
@@ -0,0 +1,173 @@
+from re import I as re_ignore_case, compile as re_compile
+
+import vampytest
+
+from ..converters import RegexMatch, RegexMatcher
+from ..custom_id_router import CustomIdRouter
+
+
+def _assert_fields_set(custom_id_router):
+    """
+    Asserts whether every fields are set of the given custom id router.
+    
+    Parameters
+    ----------
+    custom_id_router : ``CustomIdRouter``
+        The custom id router to check.
+    """
+    vampytest.assert_instance(custom_id_router, CustomIdRouter)
+    vampytest.assert_instance(custom_id_router._dirty, bool)
+    vampytest.assert_instance(custom_id_router._fallback_group, tuple, nullable = True)
+    vampytest.assert_instance(custom_id_router._matchers, list)
+    vampytest.assert_instance(custom_id_router._prefixed_groups, list)
+    vampytest.assert_instance(custom_id_router._sources, dict)
+    vampytest.assert_instance(custom_id_router._unprefixed_group, tuple, nullable = True)
+    vampytest.assert_instance(custom_id_router.routes, dict)
+
+
+def test__CustomIdRouter__new():
+    """
+    Tests whether ``CustomIdRouter.__new__`` works as intended.
+    """
+    custom_id_router = CustomIdRouter()
+    _assert_fields_set(custom_id_router)
+    
+    vampytest.assert_eq(custom_id_router.routes, {})
+
+
+def test__CustomIdRouter__repr():
+    """
+    Tests whether ``CustomIdRouter.__repr__`` works as intended.
+    """
+    custom_id_router = CustomIdRouter()
+    custom_id_router[RegexMatcher(re_compile('koishi'))] = 'koishi'
+    
+    output = repr(custom_id_router)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(custom_id_router).__name__, output)
+
+
+def test__CustomIdRouter__mapping():
+    """
+    Tests whether ``CustomIdRouter`` mapping methods work as intended.
+    """
+    regex_matcher_0 = RegexMatcher(re_compile('koishi'))
+    regex_matcher_1 = RegexMatcher(re_compile('satori'))
+    
+    custom_id_router = CustomIdRouter()
+    custom_id_router[regex_matcher_0] = 'koishi'
+    custom_id_router[regex_matcher_1] = 'satori'
+    
+    vampytest.assert_eq(len(custom_id_router), 2)
+    vampytest.assert_eq([*custom_id_router], [regex_matcher_0, regex_matcher_1])
+    vampytest.assert_in(regex_matcher_0, custom_id_router)
+    vampytest.assert_eq(custom_id_router[regex_matcher_1], 'satori')
+    
+    del custom_id_router[regex_matcher_0]
+    vampytest.assert_eq(len(custom_id_router), 1)
+    vampytest.assert_not_in(regex_matcher_0, custom_id_router)
+    
+    with vampytest.assert_raises(KeyError):
+        custom_id_router[regex_matcher_0]
+
+
+def _iter_options__route():
+    routes = [
+        (re_compile('koishi_(\\d+)'), 'koishi'),
+        (re_compile('satori_(?P<id>\\d+)'), 'satori'),
+        (re_compile('(\\w)\\1_orin'), 'orin'),
+        (re_compile('okuu', re_ignore_case), 'okuu'),
+        (re_compile('satori_(?P<id>\\d+)_(?P<index>\\d+)|satori_.*'), 'satori_late'),
+    ]
+    
+    yield routes, 'koishi_12', ('koishi', RegexMatch(False, ('12',)))
+    yield routes, 'satori_12', ('satori', RegexMatch(True, {'id': '12'}))
+    yield routes, 'aa_orin', ('orin', RegexMatch(False, ('a',)))
+    yield routes, 'OKUU', ('okuu', RegexMatch(False, ()))
+    yield routes, 'satori_12_6', ('satori_late', RegexMatch(True, {'id': '12', 'index': '6'}))
+    yield routes, 'satori_', ('satori_late', RegexMatch(True, {'id': None, 'index': None}))
+    yield routes, 'koishi_', None
+    yield routes, 'ab_orin', None
+    
+    # not combinable pattern takes precedence if added earlier
+    routes = [
+        (re_compile('(\\w)\\1_.*'), 'orin'),
+        (re_compile('aa_(\\w+)'), 'koishi'),
+    ]
+    
+    yield routes, 'aa_hey', ('orin', RegexMatch(False, ('a',)))
+    yield routes, 'ab_hey', None
+    
+    # insertion order is kept between prefixes
+    routes = [
+        (re_compile('a_.*'), 'satori'),
+        (re_compile('a_b_(\\w+)'), 'koishi'),
+        (re_compile('.*_c'), 'orin'),
+        (re_compile('a_b_c_(\\w+)'), 'okuu'),
+        (re_compile('a_b_c_d'), 'koishi'),
+    ]
+    
+    yield routes, 'a_b_hey', ('satori', RegexMatch(False, ()))
+    yield routes, 'x_b_c_d', None
+    yield routes, 'b_c', ('orin', RegexMatch(False, ()))
+    yield routes, 'a_b_c_d', ('satori', RegexMatch(False, ()))
+
+
+@vampytest._(vampytest.call_from(_iter_options__route()).returning_last())
+def test__CustomIdRouter__route(routes, custom_id):
+    """
+    Tests whether ``CustomIdRouter.route`` works as intended.
+    
+    Parameters
+    ----------
+    routes : `list<(re.Pattern, str)>`
+        Routes to add.
+    custom_id : `str`
+        Custom id to route.
+    
+    Returns
+    -------
+    output : `None | (str, RegexMatch)`
+    """
+    custom_id_router = CustomIdRouter()
+    for regex_pattern, command in routes:
+        custom_id_router[RegexMatcher(regex_pattern)] = command
+    
+    output = custom_id_router.route(custom_id)
+    vampytest.assert_instance(output, tuple, nullable = True)
+    return output
+
+
+def test__CustomIdRouter__route__rebuild():
+    """
+    Tests whether ``CustomIdRouter.route`` works as intended.
+    
+    Case: rebuilding after change.
+    """
+    regex_matcher_0 = RegexMatcher(re_compile('koishi_(\\d+)'))
+    regex_matcher_1 = RegexMatcher(re_compile('koishi_(\\w+)'))
+    
+    custom_id_router = CustomIdRouter()
+    custom_id_router[regex_matcher_1] = 'satori'
+    
+    output = custom_id_router.route('koishi_12')
+    vampytest.assert_eq(output, ('satori', RegexMatch(False, ('12',))))
+    
+    # Replacing keeps the position.
+    custom_id_router[regex_matcher_1] = 'orin'
+    vampytest.assert_false(custom_id_router._dirty)
+    output = custom_id_router.route('koishi_12')
+    vampytest.assert_eq(output, ('orin', RegexMatch(False, ('12',))))
+    
+    custom_id_router[regex_matcher_0] = 'koishi'
+    vampytest.assert_true(custom_id_router._dirty)
+    output = custom_id_router.route('koishi_12')
+    vampytest.assert_eq(output, ('orin', RegexMatch(False, ('12',))))
+    
+    del custom_id_router[regex_matcher_1]
+    output = custom_id_router.route('koishi_12')
+    vampytest.assert_eq(output, ('koishi', RegexMatch(False, ('12',))))
+    
+    del custom_id_router[regex_matcher_0]
+    output = custom_id_router.route('koishi_12')
+    vampytest.assert_is(output, None)
@@ -0,0 +1,210 @@
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+import vampytest
+
+from ..sync_state import SYNC_STATE_VERSION, SlasherSyncState
+
+
+def _assert_fields_set(sync_state):
+    """
+    Asserts whether every fields are set of the given sync state.
+    
+    Parameters
+    ----------
+    sync_state : ``SlasherSyncState``
+        The sync state to check.
+    """
+    vampytest.assert_instance(sync_state, SlasherSyncState)
+    vampytest.assert_instance(sync_state.application_id, int)
+    vampytest.assert_instance(sync_state.changed, bool)
+    vampytest.assert_instance(sync_state.path, str, nullable = True)
+    vampytest.assert_instance(sync_state.request_count, int)
+    vampytest.assert_instance(sync_state.requests_avoided, int)
+    vampytest.assert_instance(sync_state.restored_sync_ids, set)
+    vampytest.assert_instance(sync_state.scopes, dict)
+    vampytest.assert_instance(sync_state.skip_count, int)
+
+
+def test__SlasherSyncState__new():
+    """
+    Tests whether ``SlasherSyncState.__new__`` works as intended.
+    """
+    path = 'sync_state.json'
+    
+    sync_state = SlasherSyncState(path)
+    _assert_fields_set(sync_state)
+    
+    vampytest.assert_eq(sync_state.path, path)
+    vampytest.assert_eq(sync_state.scopes, {})
+    vampytest.assert_eq(sync_state.request_count, 0)
+    vampytest.assert_eq(sync_state.requests_avoided, 0)
+
+
+def test__SlasherSyncState__repr():
+    """
+    Tests whether ``SlasherSyncState.__repr__`` works as intended.
+    """
+    sync_state = SlasherSyncState('sync_state.json')
+    sync_state.request_count = 2
+    sync_state.requests_avoided = 12
+    
+    output = repr(sync_state)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(sync_state).__name__, output)
+    vampytest.assert_in('requests_avoided = 12', output)
+
+
+def test__SlasherSyncState__bind():
+    """
+    Tests whether ``SlasherSyncState.bind`` works as intended.
+    """
+    application_id_0 = 202610170010
+    application_id_1 = 202610170011
+    guild_id = 202610170012
+    
+    sync_state = SlasherSyncState(None)
+    sync_state.bind(application_id_0)
+    vampytest.assert_eq(sync_state.application_id, application_id_0)
+    
+    sync_state.set_scope(guild_id, 'hash', {'1:ping': (202610170013, 'ping')})
+    sync_state.restored_sync_ids.add(guild_id)
+    sync_state.changed = False
+    
+    # same -> kept
+    sync_state.bind(application_id_0)
+    vampytest.assert_eq(len(sync_state.scopes), 1)
+    vampytest.assert_false(sync_state.changed)
+    
+    # other -> cleared
+    sync_state.bind(application_id_1)
+    vampytest.assert_eq(sync_state.application_id, application_id_1)
+    vampytest.assert_eq(sync_state.scopes, {})
+    vampytest.assert_eq(sync_state.restored_sync_ids, set())
+    vampytest.assert_true(sync_state.changed)
+
+
+def test__SlasherSyncState__scope():
+    """
+    Tests whether ``SlasherSyncState.get_scope``, ``.set_scope`` and ``.discard_scope`` work as intended.
+    """
+    guild_id = 202610170014
+    commands = {'1:ping': (202610170015, 'ping')}
+    
+    sync_state = SlasherSyncState(None)
+    vampytest.assert_is(sync_state.get_scope(guild_id), None)
+    
+    sync_state.restored_sync_ids.add(guild_id)
+    sync_state.set_scope(guild_id, 'hash', commands)
+    vampytest.assert_eq(sync_state.get_scope(guild_id), ('hash', commands))
+    vampytest.assert_true(sync_state.changed)
+    vampytest.assert_not_in(guild_id, sync_state.restored_sync_ids)
+    
+    sync_state.changed = False
+    sync_state.restored_sync_ids.add(guild_id)
+    sync_state.discard_scope(guild_id)
+    vampytest.assert_is(sync_state.get_scope(guild_id), None)
+    vampytest.assert_true(sync_state.changed)
+    vampytest.assert_not_in(guild_id, sync_state.restored_sync_ids)
+
+
+def test__SlasherSyncState__to_data__update_from_data():
+    """
+    Tests whether ``SlasherSyncState.to_data`` and ``.update_from_data`` work as intended.
+    """
+    application_id = 202610170016
+    guild_id = 202610170017
+    application_command_id_0 = 202610170018
+    application_command_id_1 = 202610170019
+    
+    sync_state = SlasherSyncState(None)
+    sync_state.bind(application_id)
+    sync_state.set_scope(0, 'global', {'1:ping': (application_command_id_0, 'ping')})
+    sync_state.set_scope(guild_id, 'guild', {'2:pong': (application_command_id_1, 'pong')})
+    
+    data = sync_state.to_data()
+    vampytest.assert_eq(
+        data,
+        {
+            'version': SYNC_STATE_VERSION,
+            'application_id': str(application_id),
+            'scopes': {
+                '0': {'hash': 'global', 'commands': {'1:ping': [str(application_command_id_0), 'ping']}},
+                str(guild_id): {'hash': 'guild', 'commands': {'2:pong': [str(application_command_id_1), 'pong']}},
+            },
+        },
+    )
+    
+    loaded = SlasherSyncState(None)
+    loaded.update_from_data(data)
+    vampytest.assert_eq(loaded.application_id, application_id)
+    vampytest.assert_eq(loaded.scopes, sync_state.scopes)
+    vampytest.assert_false(loaded.changed)
+
+
+def _iter_options__update_from_data__ignored():
+    yield None
+    yield {}
+    yield {'version': SYNC_STATE_VERSION + 1, 'application_id': '1', 'scopes': {}}
+    yield {'version': SYNC_STATE_VERSION, 'application_id': 'koishi', 'scopes': {}}
+    yield {'version': SYNC_STATE_VERSION, 'application_id': '1', 'scopes': {'1': {'hash': 'hash'}}}
+
+
+@vampytest._(vampytest.call_from(_iter_options__update_from_data__ignored()))
+def test__SlasherSyncState__update_from_data__ignored(data):
+    """
+    Tests whether ``SlasherSyncState.update_from_data`` works as intended.
+    
+    Case: ignored data.
+    
+    Parameters
+    ----------
+    data : `object`
+        Data to update from.
+    """
+    application_id = 202610170020
+    guild_id = 202610170021
+    scopes = {guild_id: ('hash', {})}
+    
+    sync_state = SlasherSyncState(None)
+    sync_state.bind(application_id)
+    sync_state.set_scope(guild_id, 'hash', {})
+    
+    sync_state.update_from_data(data)
+    vampytest.assert_eq(sync_state.application_id, application_id)
+    vampytest.assert_eq(sync_state.scopes, scopes)
+
+
+def test__SlasherSyncState__save__load():
+    """
+    Tests whether ``SlasherSyncState.save`` and ``.load`` work as intended.
+    """
+    application_id = 202610170022
+    guild_id = 202610170023
+    application_command_id = 202610170024
+    
+    with TemporaryDirectory() as directory_path:
+        path = join_paths(directory_path, 'sync_state.json')
+        
+        # missing file -> nothing
+        sync_state = SlasherSyncState(path)
+        sync_state.load()
+        vampytest.assert_eq(sync_state.scopes, {})
+        
+        sync_state.bind(application_id)
+        sync_state.set_scope(guild_id, 'hash', {'1:ping': (application_command_id, 'ping')})
+        sync_state.save()
+        vampytest.assert_false(sync_state.changed)
+        
+        loaded = SlasherSyncState(path)
+        loaded.load()
+        vampytest.assert_eq(loaded.application_id, application_id)
+        vampytest.assert_eq(loaded.scopes, sync_state.scopes)
+        
+        # malformed file -> nothing
+        with open(path, 'w') as file:
+            file.write('koishi')
+        
+        loaded = SlasherSyncState(path)
+        loaded.load()
+        vampytest.assert_eq(loaded.scopes, {})
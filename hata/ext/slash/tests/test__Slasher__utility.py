@@ -1,9 +1,11 @@
 import vampytest
 
 from ....discord import Client
+from ....discord.client.compounds.tests.helpers import TestDiscordApiClient
 
 from ..exceptions import default_slasher_random_error_message_getter
 from ..slasher import Slasher
+from ..sync_state import SlasherSyncState
 
 
 
@@ -30,7 +32,7 @@ def test__Slasher__random_error_message_getter():
         slasher.random_error_message_getter = random_error_message_getter
         output = slasher.random_error_message_getter
         vampytest.assert_is(output, random_error_message_getter)
-    
+        
         # set none -> default
         random_error_message_getter = None
         slasher.random_error_message_getter = random_error_message_getter
@@ -46,3 +48,192 @@ def test__Slasher__random_error_message_getter():
     finally:
         client._delete()
         client = None
+
+
+def test__Slasher__sync_state():
+    """
+    Tests whether ``Slasher.sync_state`` works as intended.
+    """
+    client_id = 202610170040
+    
+    client = Client(
+        token = 'token_' + str(client_id),
+        client_id = client_id,
+    )
+    
+    try:
+        slasher = Slasher(client)
+        vampytest.assert_is(slasher.sync_state, None)
+        
+        slasher = Slasher(client, bulk_sync = True)
+        vampytest.assert_instance(slasher.sync_state, SlasherSyncState)
+        vampytest.assert_is(slasher.sync_state.path, None)
+        
+        with vampytest.assert_raises(ValueError):
+            Slasher(client, sync_state_path = 'sync_state.json')
+        
+        with vampytest.assert_raises(TypeError):
+            Slasher(client, bulk_sync = True, sync_state_path = 12)
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__Slasher__bulk_sync():
+    """
+    Tests whether ``Slasher`` bulk syncing works as intended.
+    
+    This function is a coroutine.
+    """
+    client_id = 202610170041
+    guild_id = 202610170042
+    application_command_id = 202610170043
+    
+    request_count = 0
+    
+    async def mock_api_application_command_guild_update_multiple(
+        input_application_id, input_guild_id, input_application_command_datas
+    ):
+        nonlocal request_count
+        request_count += 1
+        
+        vampytest.assert_eq(input_application_id, client_id)
+        vampytest.assert_eq(input_guild_id, guild_id)
+        vampytest.assert_eq(len(input_application_command_datas), 1)
+        
+        return [
+            {
+                **input_application_command_datas[0],
+                'id': str(application_command_id),
+                'application_id': str(client_id),
+            },
+        ]
+    
+    async def mock_api_application_command_guild_get_all(input_application_id, input_guild_id):
+        raise RuntimeError('Should not be called.')
+    
+    async def command(client, interaction_event):
+        pass
+    
+    token = 'token_' + str(client_id)
+    api = TestDiscordApiClient(False, token)
+    api.application_command_guild_update_multiple = mock_api_application_command_guild_update_multiple
+    api.application_command_guild_get_all = mock_api_application_command_guild_get_all
+    
+    client = Client(token, api = api, client_id = client_id, application_id = client_id)
+    
+    try:
+        slasher = Slasher(client, bulk_sync = True)
+        slasher.create_event(command, name = 'ping', guild = guild_id)
+        
+        # first sync -> overwrite
+        output = await slasher._sync_guild(client, guild_id)
+        vampytest.assert_true(output)
+        vampytest.assert_eq(request_count, 1)
+        vampytest.assert_in(application_command_id, slasher.command_id_to_command)
+        
+        sync_state = slasher.sync_state
+        vampytest.assert_eq(sync_state.request_count, 1)
+        vampytest.assert_is_not(sync_state.get_scope(guild_id), None)
+        
+        # "restart" with the same state -> skipped
+        slasher = Slasher(client, bulk_sync = True)
+        slasher._sync_state = sync_state
+        slasher.create_event(command, name = 'ping', guild = guild_id)
+        
+        output = await slasher._sync_guild(client, guild_id)
+        vampytest.assert_true(output)
+        vampytest.assert_eq(request_count, 1)
+        vampytest.assert_in(application_command_id, slasher.command_id_to_command)
+        vampytest.assert_eq(sync_state.skip_count, 1)
+        vampytest.assert_eq(sync_state.requests_avoided, 1)
+        vampytest.assert_in(guild_id, sync_state.restored_sync_ids)
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__Slasher__bulk_sync__missing_command():
+    """
+    Tests whether ``Slasher`` bulk syncing syncs again if a command's identifier is not stored.
+    
+    This function is a coroutine.
+    """
+    client_id = 202610170044
+    guild_id = 202610170045
+    application_command_id = 202610170046
+    
+    request_count = 0
+    return_commands = False
+    
+    async def mock_api_application_command_guild_update_multiple(
+        input_application_id, input_guild_id, input_application_command_datas
+    ):
+        nonlocal request_count
+        request_count += 1
+        
+        if not return_commands:
+            return []
+        
+        return [
+            {
+                **input_application_command_datas[0],
+                'id': str(application_command_id),
+                'application_id': str(client_id),
+            },
+        ]
+    
+    async def mock_api_application_command_guild_get_all(input_application_id, input_guild_id):
+        raise RuntimeError('Should not be called.')
+    
+    async def command(client, interaction_event):
+        pass
+    
+    token = 'token_' + str(client_id)
+    api = TestDiscordApiClient(False, token)
+    api.application_command_guild_update_multiple = mock_api_application_command_guild_update_multiple
+    api.application_command_guild_get_all = mock_api_application_command_guild_get_all
+    
+    client = Client(token, api = api, client_id = client_id, application_id = client_id)
+    
+    try:
+        # command not returned -> scope not stored
+        slasher = Slasher(client, bulk_sync = True)
+        slasher.create_event(command, name = 'ping', guild = guild_id)
+        
+        output = await slasher._sync_guild(client, guild_id)
+        vampytest.assert_true(output)
+        vampytest.assert_eq(request_count, 1)
+        
+        sync_state = slasher.sync_state
+        vampytest.assert_is(sync_state.get_scope(guild_id), None)
+        
+        # scope not stored -> synced again
+        return_commands = True
+        slasher = Slasher(client, bulk_sync = True)
+        slasher._sync_state = sync_state
+        slasher.create_event(command, name = 'ping', guild = guild_id)
+        
+        output = await slasher._sync_guild(client, guild_id)
+        vampytest.assert_true(output)
+        vampytest.assert_eq(request_count, 2)
+        vampytest.assert_in(application_command_id, slasher.command_id_to_command)
+        
+        stored_scope = sync_state.get_scope(guild_id)
+        vampytest.assert_is_not(stored_scope, None)
+        
+        # matching scope hash with the command missing from the stored ones -> synced again
+        sync_state.set_scope(guild_id, stored_scope[0], {})
+        
+        slasher = Slasher(client, bulk_sync = True)
+        slasher._sync_state = sync_state
+        slasher.create_event(command, name = 'ping', guild = guild_id)
+        
+        output = await slasher._sync_guild(client, guild_id)
+        vampytest.assert_true(output)
+        vampytest.assert_eq(request_count, 3)
+        vampytest.assert_in(application_command_id, slasher.command_id_to_command)
+        vampytest.assert_eq(sync_state.skip_count, 0)
+    finally:
+        client._delete()
+        client = None
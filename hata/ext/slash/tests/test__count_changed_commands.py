@@ -0,0 +1,37 @@
+import vampytest
+
+from ..sync_state import count_changed_commands
+
+
+def _iter_options():
+    yield {}, {}, 0
+    yield {}, {'1:ping': 'ping'}, 1
+    yield {'1:ping': (202610170030, 'ping')}, {'1:ping': 'ping'}, 0
+    yield {'1:ping': (202610170030, 'ping')}, {'1:ping': 'pong'}, 1
+    yield {'1:ping': (202610170030, 'ping')}, {}, 1
+    yield (
+        {'1:ping': (202610170030, 'ping'), '1:pong': (202610170031, 'pong'), '2:user': (202610170032, 'user')},
+        {'1:ping': 'ping', '1:pong': 'pang', '3:message': 'message'},
+        3,
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__count_changed_commands(stored_commands, schema_hashes):
+    """
+    Tests whether ``count_changed_commands`` works as intended.
+    
+    Parameters
+    ----------
+    stored_commands : `dict<str, (int, str)>`
+        Command key - (application command identifier, schema hash) relations.
+    schema_hashes : `dict<str, str>`
+        Command key - schema hash relations.
+    
+    Returns
+    -------
+    output : `int`
+    """
+    output = count_changed_commands(stored_commands, schema_hashes)
+    vampytest.assert_instance(output, int)
+    return output
@@ -0,0 +1,40 @@
+from re import I as re_ignore_case, compile as re_compile
+
+import vampytest
+
+from ..custom_id_router import get_combinable_pattern
+
+
+def _iter_options():
+    yield re_compile('koishi'), 'koishi'
+    yield re_compile('koishi_(\\d+)'), 'koishi_(\\d+)'
+    yield re_compile('koishi_(?P<id>\\d+)'), 'koishi_(?:\\d+)'
+    yield re_compile('[(?P<]+_(?P<id>\\d+)'), '[(?P<]+_(?:\\d+)'
+    yield re_compile('[]a]_(?P<id>\\d+)'), '[]a]_(?:\\d+)'
+    yield re_compile('\\(?P<id>'), '\\(?P<id>'
+    yield re_compile('(?i:koishi)'), '(?i:koishi)'
+    yield re_compile('koishi', re_ignore_case), None
+    yield re_compile('(?i)koishi'), None
+    yield re_compile('(\\w)\\1'), None
+    yield re_compile('(?P<name>\\w)(?P=name)'), None
+    yield re_compile('(a)?(?(1)b|c)'), None
+    yield re_compile(b'koishi'), None
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_combinable_pattern(regex_pattern):
+    """
+    Tests whether ``get_combinable_pattern`` works as intended.
+    
+    Parameters
+    ----------
+    regex_pattern : `re.Pattern`
+        Regex pattern to get combinable source of.
+    
+    Returns
+    -------
+    output : `None | str`
+    """
+    output = get_combinable_pattern(regex_pattern)
+    vampytest.assert_instance(output, str, nullable = True)
+    return output
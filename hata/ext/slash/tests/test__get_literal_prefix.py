@@ -0,0 +1,40 @@
+import vampytest
+
+from ..custom_id_router import get_literal_prefix
+
+
+def _iter_options():
+    yield '', ''
+    yield 'koishi', 'koishi'
+    yield 'koishi_(?:\\d+)', 'koishi_'
+    yield 'koishi_.*', 'koishi_'
+    yield 'koishi_\\.\\d+', 'koishi_.'
+    yield 'koishi_[ab]', 'koishi_'
+    yield 'koishi?', 'koish'
+    yield 'koishi{2}', 'koish'
+    yield 'koishi\\.+', 'koishi'
+    yield 'koishi|satori', ''
+    yield 'koishi_(?:a|b)', 'koishi_'
+    yield 'koishi_[|]', 'koishi_'
+    yield '\\dkoishi', ''
+    yield '.*koishi', ''
+    yield '^koishi', ''
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_literal_prefix(pattern):
+    """
+    Tests whether ``get_literal_prefix`` works as intended.
+    
+    Parameters
+    ----------
+    pattern : `str`
+        Combinable regex pattern source.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    output = get_literal_prefix(pattern)
+    vampytest.assert_instance(output, str)
+    return output
@@ -0,0 +1,18 @@
+import vampytest
+
+from ..sync_state import get_scope_hash
+
+
+def test__get_scope_hash():
+    """
+    Tests whether ``get_scope_hash`` works as intended.
+    """
+    output = get_scope_hash({'1:ping': 'ping', '1:pong': 'pong'})
+    vampytest.assert_instance(output, str)
+    
+    # stable for the same content in any order
+    vampytest.assert_eq(output, get_scope_hash({'1:pong': 'pong', '1:ping': 'ping'}))
+    
+    # different for different content
+    vampytest.assert_ne(output, get_scope_hash({'1:ping': 'ping', '1:pong': 'pang'}))
+    vampytest.assert_ne(output, get_scope_hash({'1:ping': 'ping'}))
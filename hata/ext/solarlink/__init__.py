@@ -22,6 +22,7 @@ from .player_base import *
 from .route_planner import *
 from .stats import *
 from .track import *
+from .track_cache import *
 from .track_end_reasons import *
 
 from . import  track_end_reasons as TRACK_END_REASONS
@@ -42,6 +43,7 @@ __all__ = (
     *route_planner.__all__,
     *stats.__all__,
     *track.__all__,
+    *track_cache.__all__,
     *track_end_reasons.__all__,
 )
 
@@ -1,7 +1,5 @@
 __all__ = ('SolarClient', )
 
-from random import choice
-
 from scarletio import RichAttributeErrorBaseType, Task, TaskGroup, WeakReferer, run_coroutine, to_json
 from scarletio.web_common.headers import AUTHORIZATION, CONTENT_TYPE
 
@@ -18,6 +16,7 @@ from .player import SolarPlayer
 from .player_base import SolarPlayerBase
 from .route_planner import get_route_planner
 from .track import GetTracksResult, Track
+from .track_cache import TrackCache
 
 
 class SolarClient(RichAttributeErrorBaseType):
@@ -32,12 +31,18 @@ class SolarClient(RichAttributeErrorBaseType):
         Event plugin for solarlink specific events.
     _player_queue : `None`, `list` of ``SolarPlayerBase``
         Solar players to join back to a node.
+    decoded_track_cache : ``TrackCache``
+        Cache of the decoded tracks by their base64-encoded string.
     nodes : `set` of ``SolarNode``
         All nodes the client is connected to.
     players : `dict` of (`int`, ``SolarPlayerBase``) items
         Active players of the client by their guild's identifier as key.
+    track_cache : ``TrackCache``
+        Cache of the track lookups by their query.
     """
-    __slots__ = ('_client_reference', '_events', '_player_queue', 'nodes', 'players')
+    __slots__ = (
+        '_client_reference', '_events', '_player_queue', 'decoded_track_cache', 'nodes', 'players', 'track_cache'
+    )
     
     def __new__(cls, client):
         """
@@ -64,6 +69,8 @@ class SolarClient(RichAttributeErrorBaseType):
         self.players = {}
         self._player_queue = None
         self._events = event_plugin
+        self.decoded_track_cache = TrackCache()
+        self.track_cache = TrackCache()
         return self
     
     
@@ -133,6 +140,37 @@ class SolarClient(RichAttributeErrorBaseType):
         """
         Gets all tracks associated with the given query.
         
+        The results are cached in ``.track_cache`` and concurrent lookups of the same query share one request.
+        
+        Parameters
+        ----------
+        query: : `str`
+            The query to perform a search for.
+        
+        Returns
+        -------
+        tracks : `None`, ``GetTracksResult``
+            Decoded tracks. `None` if the request failed or if there are no matching tracks.
+        
+        Raises
+        ------
+        RuntimeError
+            - If there are no available nodes.
+            - If the ``SolarClient``'s client is already deconstructed.
+        SolarAuthenticationError
+            Authentication failed towards the node.
+        """
+        return await self.track_cache.get_or_load(query, self._load_tracks, query)
+    
+    
+    async def _load_tracks(self, query):
+        """
+        Requests all tracks associated with the given query from the ideal node.
+        
+        Failed loads and loads without matches return `None`, so they are not cached, since they can be temporary.
+        
+        This method is a coroutine.
+        
         Parameters
         ----------
         query: : `str`
@@ -151,15 +189,42 @@ class SolarClient(RichAttributeErrorBaseType):
         SolarAuthenticationError
             Authentication failed towards the node.
         """
-        available_nodes = self.available_nodes
-        if not available_nodes:
-            raise RuntimeError('No available nodes!')
+        data = await self._request_tracks(query)
+        if data is None:
+            return None
         
-        client = self._client_reference()
-        if client is None:
-            raise RuntimeError(f'`{self.__class__.__name__}` client is deconstructed.')
+        result = GetTracksResult(data)
+        if result.tracks is None:
+            return None
+        
+        return result
+    
+    
+    async def _request_tracks(self, query):
+        """
+        Requests all tracks associated with the given query from the ideal node.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        query: : `str`
+            The query to perform a search for.
         
-        node = choice(self.available_nodes)
+        Returns
+        -------
+        data : `None | dict<str, object>`
+            The received data. `None` if the request failed.
+        
+        Raises
+        ------
+        RuntimeError
+            - If there are no available nodes.
+            - If the ``SolarClient``'s client is already deconstructed.
+        SolarAuthenticationError
+            Authentication failed towards the node.
+        """
+        client, node = self._get_client_and_request_node()
         
         async with client.http.get(
             f'http://{node._host}:{node._port}/loadtracks',
@@ -179,18 +244,16 @@ class SolarClient(RichAttributeErrorBaseType):
             else:
                 data = None
         
-        if data is None:
-            result = None
-        else:
-            result = GetTracksResult(data)
-        
-        return result
+        return data
     
     
     async def decode_track(self, track):
         """
         Decodes a base64-encoded track string into a dictionary.
         
+        The decoded tracks are cached in ``.decoded_track_cache`` and concurrent decodes of the same track share one
+        request.
+        
         Parameters
         ----------
         track : `str`
@@ -209,15 +272,34 @@ class SolarClient(RichAttributeErrorBaseType):
         SolarAuthenticationError
             Authentication failed towards the node.
         """
-        client = self._client_reference()
-        if client is None:
-            raise RuntimeError(f'`{self.__class__.__name__}` client is deconstructed.')
+        return await self.decoded_track_cache.get_or_load(track, self._load_decoded_track, track)
+    
+    
+    async def _load_decoded_track(self, track):
+        """
+        Requests the ideal node to decode the given base64-encoded track string.
         
-        available_nodes = self.available_nodes
-        if not available_nodes:
-            raise RuntimeError('No available nodes!')
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        track : `str`
+            The base64-encoded track string.
+        
+        Returns
+        -------
+        track : `None`, ``Track``
+            Decoded track data.
         
-        node = choice(self.available_nodes)
+        Raises
+        ------
+        RuntimeError
+            - If there are no available nodes.
+            - If the ``SolarClient``'s client is already deconstructed.
+        SolarAuthenticationError
+            Authentication failed towards the node.
+        """
+        client, node = self._get_client_and_request_node()
         
         async with client.http.get(
             f'http://{node._host}:{node._port}/decodetrack',
@@ -249,6 +331,8 @@ class SolarClient(RichAttributeErrorBaseType):
         """
         Decodes a list of base64-encoded track strings.
         
+        The tracks cached in ``.decoded_track_cache`` are not requested again and the requested ones are cached.
+        
         Parameters
         ----------
         tracks : `list` of `str`
@@ -267,15 +351,55 @@ class SolarClient(RichAttributeErrorBaseType):
         SolarAuthenticationError
             Authentication failed towards the node.
         """
-        client = self._client_reference()
-        if client is None:
-            raise RuntimeError(f'`{self.__class__.__name__}` client is deconstructed.')
+        decoded_track_cache = self.decoded_track_cache
+        decoded_tracks = [decoded_track_cache.get(track) for track in tracks]
         
-        available_nodes = self.available_nodes
-        if not available_nodes:
-            raise RuntimeError('No available nodes!')
+        missing_tracks = [track for track, decoded_track in zip(tracks, decoded_tracks) if decoded_track is None]
+        if missing_tracks:
+            requested_tracks = await self._load_decoded_tracks(missing_tracks)
+            
+            # Lavalink leaves out the tracks it could not decode, so we cannot pair them.
+            if len(requested_tracks) != len(missing_tracks):
+                if len(missing_tracks) == len(tracks):
+                    return requested_tracks
+                
+                return await self._load_decoded_tracks(tracks)
+            
+            requested_tracks = iter(requested_tracks)
+            for index, decoded_track in enumerate(decoded_tracks):
+                if decoded_track is None:
+                    decoded_track = next(requested_tracks)
+                    decoded_track_cache.set(tracks[index], decoded_track)
+                    decoded_tracks[index] = decoded_track
+        
+        return decoded_tracks
+    
+    
+    async def _load_decoded_tracks(self, tracks):
+        """
+        Requests the ideal node to decode the given base64-encoded track strings.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        tracks : `list` of `str`
+            A list of base64-encoded track strings.
         
-        node = choice(available_nodes)
+        Returns
+        -------
+        tracks : `list` of ``Track``
+            The decoded tracks.
+        
+        Raises
+        ------
+        RuntimeError
+            - If there are no available nodes.
+            - If the ``SolarClient``'s client is already deconstructed.
+        SolarAuthenticationError
+            Authentication failed towards the node.
+        """
+        client, node = self._get_client_and_request_node()
         
         async with client.http.post(
             f'http://{node._host}:{node._port}/decodetracks',
@@ -302,6 +426,34 @@ class SolarClient(RichAttributeErrorBaseType):
         return tracks
     
     
+    def _get_client_and_request_node(self):
+        """
+        Returns the client and the node with the least penalty to do a request with.
+        
+        Returns
+        -------
+        client : ``Client``
+            The extended client.
+        node : ``SolarNode``
+            The node to request from.
+        
+        Raises
+        ------
+        RuntimeError
+            - If there are no available nodes.
+            - If the ``SolarClient``'s client is already deconstructed.
+        """
+        client = self._client_reference()
+        if client is None:
+            raise RuntimeError(f'`{self.__class__.__name__}` client is deconstructed.')
+        
+        node = self.find_ideal_node()
+        if node is None:
+            raise RuntimeError('No available nodes!')
+        
+        return client, node
+    
+    
     async def routeplanner_status(self, node):
         """
         Gets the routeplanner status of the target node.
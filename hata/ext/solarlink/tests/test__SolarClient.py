@@ -0,0 +1,242 @@
+import vampytest
+from scarletio import Future, Task, get_event_loop, skip_ready_cycle
+
+from ....discord.client import Client
+
+from ..client import SolarClient
+from ..track import GetTracksResult
+
+
+class FakeNode:
+    """
+    Node replacement with fixed penalty.
+    
+    Attributes
+    ----------
+    available : `bool`
+        Whether the node is available.
+    penalty : `float`
+        The node's penalty.
+    region : `None`
+        The node's region.
+    """
+    __slots__ = ('available', 'penalty', 'region')
+    
+    def __new__(cls, penalty, available):
+        """
+        Creates a new fake node.
+        
+        Parameters
+        ----------
+        penalty : `float`
+            The node's penalty.
+        available : `bool`
+            Whether the node is available.
+        """
+        self = object.__new__(cls)
+        self.available = available
+        self.penalty = penalty
+        self.region = None
+        return self
+
+
+class CountingSolarClient(SolarClient):
+    """
+    Solar client counting its track loads instead of requesting them.
+    
+    Attributes
+    ----------
+    load_waiter : ``Future``
+        Waited by the loads.
+    loaded_queries : `list<str>`
+        The loaded queries.
+    """
+    __slots__ = ('load_waiter', 'loaded_queries')
+    
+    async def _load_tracks(self, query):
+        self.loaded_queries.append(query)
+        await self.load_waiter
+        return query.upper()
+
+
+class ResponseSolarClient(SolarClient):
+    """
+    Solar client returning fixed response data instead of requesting it.
+    
+    Attributes
+    ----------
+    request_count : `int`
+        How much times were the tracks requested.
+    response_data : `None | dict<str, object>`
+        The data to return.
+    """
+    __slots__ = ('request_count', 'response_data')
+    
+    async def _request_tracks(self, query):
+        self.request_count += 1
+        return self.response_data
+
+
+def test__SolarClient__get_client_and_request_node():
+    """
+    Tests whether ``SolarClient._get_client_and_request_node`` works as intended.
+    """
+    client = Client(
+        'token_20261017_0000',
+    )
+    
+    try:
+        solar_client = SolarClient(client)
+        
+        node_0 = FakeNode(100.0, True)
+        node_1 = FakeNode(20.0, True)
+        node_2 = FakeNode(10.0, False)
+        solar_client.nodes.update((node_0, node_1, node_2))
+        
+        output = solar_client._get_client_and_request_node()
+        vampytest.assert_eq(output, (client, node_1))
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__SolarClient__get_client_and_request_node__no_nodes():
+    """
+    Tests whether ``SolarClient._get_client_and_request_node`` works as intended.
+    
+    Case: no available nodes.
+    """
+    client = Client(
+        'token_20261017_0001',
+    )
+    
+    try:
+        solar_client = SolarClient(client)
+        solar_client.nodes.add(FakeNode(10.0, False))
+        
+        with vampytest.assert_raises(RuntimeError):
+            solar_client._get_client_and_request_node()
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__SolarClient__get_tracks__cached():
+    """
+    Tests whether ``SolarClient.get_tracks`` works as intended.
+    
+    Case: concurrent and repeated queries.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_20261017_0002',
+    )
+    
+    try:
+        solar_client = CountingSolarClient(client)
+        solar_client.load_waiter = Future(get_event_loop())
+        solar_client.loaded_queries = []
+        
+        task_0 = Task(get_event_loop(), solar_client.get_tracks('koishi'))
+        task_1 = Task(get_event_loop(), solar_client.get_tracks('koishi'))
+        await skip_ready_cycle()
+        
+        solar_client.load_waiter.set_result(None)
+        vampytest.assert_eq(await task_0, 'KOISHI')
+        vampytest.assert_eq(await task_1, 'KOISHI')
+        vampytest.assert_eq(await solar_client.get_tracks('koishi'), 'KOISHI')
+        
+        vampytest.assert_eq(solar_client.loaded_queries, ['koishi'])
+        vampytest.assert_eq(solar_client.track_cache.hit_count, 1)
+        vampytest.assert_eq(solar_client.track_cache.shared_count, 1)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def _iter_options__get_tracks__not_cached():
+    yield None
+    yield {'loadType': 'NO_MATCHES', 'playlistInfo': None, 'tracks': []}
+    yield {'loadType': 'LOAD_FAILED', 'playlistInfo': None, 'tracks': None}
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_tracks__not_cached()))
+async def test__SolarClient__get_tracks__not_cached(response_data):
+    """
+    Tests whether ``SolarClient.get_tracks`` works as intended.
+    
+    Case: failed loads and loads without matches are not cached.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    response_data : `None | dict<str, object>`
+        The data to return.
+    """
+    client = Client(
+        'token_20261017_0003',
+    )
+    
+    try:
+        solar_client = ResponseSolarClient(client)
+        solar_client.request_count = 0
+        solar_client.response_data = response_data
+        
+        vampytest.assert_is(await solar_client.get_tracks('koishi'), None)
+        vampytest.assert_is(await solar_client.get_tracks('koishi'), None)
+        vampytest.assert_eq(solar_client.request_count, 2)
+        vampytest.assert_eq(len(solar_client.track_cache), 0)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__SolarClient__get_tracks__cached_result():
+    """
+    Tests whether ``SolarClient.get_tracks`` works as intended.
+    
+    Case: loads with matches are cached.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_20261017_0004',
+    )
+    
+    try:
+        solar_client = ResponseSolarClient(client)
+        solar_client.request_count = 0
+        solar_client.response_data = {
+            'loadType': 'TRACK_LOADED',
+            'playlistInfo': None,
+            'tracks': [
+                {
+                    'track': 'koishi',
+                    'info': {
+                        'author': 'Satori',
+                        'length': 1000,
+                        'identifier': 'koishi',
+                        'isStream': False,
+                        'isSeekable': True,
+                        'title': 'Hartmann\'s Youkai Girl',
+                        'uri': 'https://orindance.party/',
+                        'position': 0,
+                    },
+                },
+            ],
+        }
+        
+        output = await solar_client.get_tracks('koishi')
+        vampytest.assert_instance(output, GetTracksResult)
+        vampytest.assert_is(await solar_client.get_tracks('koishi'), output)
+        vampytest.assert_eq(solar_client.request_count, 1)
+    
+    finally:
+        client._delete()
+        client = None
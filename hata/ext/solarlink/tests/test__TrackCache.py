@@ -0,0 +1,158 @@
+import vampytest
+from scarletio import Future, Task, get_event_loop, skip_ready_cycle
+
+from ..track_cache import TrackCache
+
+
+def _assert_fields_set(track_cache):
+    """
+    Asserts whether every field of the given track cache is set.
+    
+    Parameters
+    ----------
+    track_cache : ``TrackCache``
+        The track cache to check.
+    """
+    vampytest.assert_instance(track_cache, TrackCache)
+    vampytest.assert_instance(track_cache.entries, dict)
+    vampytest.assert_instance(track_cache.eviction_count, int)
+    vampytest.assert_instance(track_cache.hit_count, int)
+    vampytest.assert_instance(track_cache.miss_count, int)
+    vampytest.assert_instance(track_cache.pending, dict)
+    vampytest.assert_instance(track_cache.shared_count, int)
+    vampytest.assert_instance(track_cache.size, int)
+    vampytest.assert_instance(track_cache.time_to_live, float)
+
+
+def test__TrackCache__new():
+    """
+    Tests whether ``TrackCache.__new__`` works as intended.
+    """
+    size = 12
+    time_to_live = 60.0
+    
+    track_cache = TrackCache(size, time_to_live)
+    _assert_fields_set(track_cache)
+    
+    vampytest.assert_eq(track_cache.size, size)
+    vampytest.assert_eq(track_cache.time_to_live, time_to_live)
+    vampytest.assert_eq(len(track_cache), 0)
+
+
+def test__TrackCache__repr():
+    """
+    Tests whether ``TrackCache.__repr__`` works as intended.
+    """
+    track_cache = TrackCache(12, 60.0)
+    
+    output = repr(track_cache)
+    vampytest.assert_instance(output, str)
+
+
+def test__TrackCache__get_and_set():
+    """
+    Tests whether ``TrackCache.get`` and ``.set`` work as intended.
+    """
+    result = object()
+    track_cache = TrackCache(12, 60.0)
+    
+    vampytest.assert_is(track_cache.get('koishi'), None)
+    track_cache.set('koishi', result)
+    vampytest.assert_is(track_cache.get('koishi'), result)
+    
+    vampytest.assert_eq(track_cache.hit_count, 1)
+    vampytest.assert_eq(track_cache.miss_count, 1)
+
+
+def test__TrackCache__eviction():
+    """
+    Tests whether ``TrackCache.set`` works as intended.
+    
+    Case: evicting the least recently used entry.
+    """
+    track_cache = TrackCache(2, 60.0)
+    
+    track_cache.set('koishi', 1)
+    track_cache.set('satori', 2)
+    track_cache.get('koishi')
+    track_cache.set('orin', 3)
+    
+    vampytest.assert_eq(len(track_cache), 2)
+    vampytest.assert_eq(track_cache.eviction_count, 1)
+    vampytest.assert_is(track_cache.get('satori'), None)
+    vampytest.assert_eq(track_cache.get('koishi'), 1)
+    vampytest.assert_eq(track_cache.get('orin'), 3)
+
+
+def test__TrackCache__expiration():
+    """
+    Tests whether ``TrackCache.get`` works as intended.
+    
+    Case: expired entry.
+    """
+    track_cache = TrackCache(2, 0.0)
+    
+    track_cache.set('koishi', 1)
+    vampytest.assert_is(track_cache.get('koishi'), None)
+    vampytest.assert_eq(len(track_cache), 0)
+
+
+async def test__TrackCache__get_or_load():
+    """
+    Tests whether ``TrackCache.get_or_load`` works as intended.
+    
+    Case: concurrent loads share one load.
+    
+    This function is a coroutine.
+    """
+    result = object()
+    waiter = Future(get_event_loop())
+    calls = []
+    
+    async def load(key):
+        
+        calls.append(key)
+        await waiter
+        return result
+    
+    track_cache = TrackCache(12, 60.0)
+    
+    task_0 = Task(get_event_loop(), track_cache.get_or_load('koishi', load, 'koishi'))
+    task_1 = Task(get_event_loop(), track_cache.get_or_load('koishi', load, 'koishi'))
+    await skip_ready_cycle()
+    
+    waiter.set_result(None)
+    vampytest.assert_is(await task_0, result)
+    vampytest.assert_is(await task_1, result)
+    
+    vampytest.assert_is(await track_cache.get_or_load('koishi', load, 'koishi'), result)
+    
+    vampytest.assert_eq(calls, ['koishi'])
+    vampytest.assert_eq(track_cache.miss_count, 1)
+    vampytest.assert_eq(track_cache.shared_count, 1)
+    vampytest.assert_eq(track_cache.hit_count, 1)
+    vampytest.assert_eq(track_cache.pending, {})
+
+
+async def test__TrackCache__get_or_load__none():
+    """
+    Tests whether ``TrackCache.get_or_load`` works as intended.
+    
+    Case: `None` is not cached.
+    
+    This function is a coroutine.
+    """
+    calls = []
+    
+    async def load(key):
+        
+        calls.append(key)
+        return None
+    
+    track_cache = TrackCache(12, 60.0)
+    
+    vampytest.assert_is(await track_cache.get_or_load('koishi', load, 'koishi'), None)
+    vampytest.assert_is(await track_cache.get_or_load('koishi', load, 'koishi'), None)
+    
+    vampytest.assert_eq(calls, ['koishi', 'koishi'])
+    vampytest.assert_eq(len(track_cache), 0)
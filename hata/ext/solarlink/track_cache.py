@@ -0,0 +1,237 @@
+__all__ = ('TrackCache',)
+
+from collections import OrderedDict
+
+from scarletio import LOOP_TIME, RichAttributeErrorBaseType, Task, shield
+
+from ...discord.core import KOKORO
+
+
+TRACK_CACHE_SIZE_DEFAULT = 1024
+TRACK_CACHE_TIME_TO_LIVE_DEFAULT = 600.0
+
+
+class TrackCache(RichAttributeErrorBaseType):
+    """
+    Least recently used cache of track lookups, with entries expiring after a time. Concurrent loads of the same key
+    share a single request.
+    
+    The cached results are shared between the callers, so they should not be modified.
+    
+    Attributes
+    ----------
+    entries : `OrderedDict<str, (float, object)>`
+        Key - (expiration time, result) relations in least recently used order.
+    eviction_count : `int`
+        How much entries were evicted, because the cache was full.
+    hit_count : `int`
+        How much lookups were served from the cache.
+    miss_count : `int`
+        How much lookups required loading.
+    pending : `dict<str, Task>`
+        Key - loader task relations of the loading entries.
+    shared_count : `int`
+        How much lookups waited for an other one's load.
+    size : `int`
+        The maximal amount of entries to cache.
+    time_to_live : `float`
+        After how much time the entries expire in seconds.
+    """
+    __slots__ = (
+        'entries', 'eviction_count', 'hit_count', 'miss_count', 'pending', 'shared_count', 'size', 'time_to_live'
+    )
+    
+    def __new__(cls, size = TRACK_CACHE_SIZE_DEFAULT, time_to_live = TRACK_CACHE_TIME_TO_LIVE_DEFAULT):
+        """
+        Creates a new track cache.
+        
+        Parameters
+        ----------
+        size : `int` = `TRACK_CACHE_SIZE_DEFAULT`, Optional
+            The maximal amount of entries to cache.
+        time_to_live : `float` = `TRACK_CACHE_TIME_TO_LIVE_DEFAULT`, Optional
+            After how much time the entries expire in seconds.
+        """
+        self = object.__new__(cls)
+        self.entries = OrderedDict()
+        self.eviction_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.pending = {}
+        self.shared_count = 0
+        self.size = size
+        self.time_to_live = time_to_live
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the track cache's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' entries = ')
+        repr_parts.append(repr(len(self.entries)))
+        
+        repr_parts.append(', hit_count = ')
+        repr_parts.append(repr(self.hit_count))
+        
+        repr_parts.append(', miss_count = ')
+        repr_parts.append(repr(self.miss_count))
+        
+        repr_parts.append(', shared_count = ')
+        repr_parts.append(repr(self.shared_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns how much entries the cache has."""
+        return len(self.entries)
+    
+    
+    def _get(self, key):
+        """
+        Returns the cached result for the given key without counting the lookup. Expired entries are removed.
+        
+        Parameters
+        ----------
+        key : `str`
+            The key to look up.
+        
+        Returns
+        -------
+        result : `None | object`
+        """
+        entries = self.entries
+        try:
+            expires_at, result = entries[key]
+        except KeyError:
+            return None
+        
+        if expires_at <= LOOP_TIME():
+            del entries[key]
+            return None
+        
+        entries.move_to_end(key)
+        return result
+    
+    
+    def get(self, key):
+        """
+        Returns the cached result for the given key.
+        
+        Parameters
+        ----------
+        key : `str`
+            The key to look up.
+        
+        Returns
+        -------
+        result : `None | object`
+        """
+        result = self._get(key)
+        if result is None:
+            self.miss_count += 1
+        else:
+            self.hit_count += 1
+        
+        return result
+    
+    
+    def set(self, key, result):
+        """
+        Caches the given result, evicting the least recently used entries if the cache is full.
+        
+        Parameters
+        ----------
+        key : `str`
+            The key to cache the result with.
+        result : `object`
+            The result to cache.
+        """
+        entries = self.entries
+        entries[key] = (LOOP_TIME() + self.time_to_live, result)
+        entries.move_to_end(key)
+        
+        while len(entries) > self.size:
+            entries.popitem(last = False)
+            self.eviction_count += 1
+    
+    
+    def clear(self):
+        """
+        Clears the cached entries.
+        """
+        self.entries.clear()
+    
+    
+    async def get_or_load(self, key, function, *positional_parameters):
+        """
+        Returns the cached result for the given key. If it is not cached, loads it. If the key is already loading,
+        waits for that load instead of starting a new one.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        key : `str`
+            The key to look up.
+        function : `CoroutineFunctionType`
+            Coroutine function to load the result with. If it returns `None`, the result is not cached.
+        *positional_parameters : Positional parameters
+            Additional positional parameters to call `function` with.
+        
+        Returns
+        -------
+        result : `None | object`
+        
+        Raises
+        ------
+        BaseException
+            Any exception raised by `function`.
+        """
+        result = self._get(key)
+        if (result is not None):
+            self.hit_count += 1
+            return result
+        
+        pending = self.pending
+        try:
+            task = pending[key]
+        except KeyError:
+            self.miss_count += 1
+            task = Task(KOKORO, self._load(key, function(*positional_parameters)))
+            pending[key] = task
+        else:
+            self.shared_count += 1
+        
+        # Shield the task, so one caller being cancelled does not cancel the others.
+        return await shield(task, KOKORO)
+    
+    
+    async def _load(self, key, coroutine):
+        """
+        Loads the result for the given key and caches it.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        key : `str`
+            The key to load.
+        coroutine : `CoroutineType`
+            Coroutine loading the result.
+        
+        Returns
+        -------
+        result : `None | object`
+        """
+        try:
+            result = await coroutine
+        finally:
+            del self.pending[key]
+        
+        if (result is not None):
+            self.set(key, result)
+        
+        return result
@@ -241,6 +241,7 @@ setup(
         'hata.discord.voice',
         'hata.discord.voice.audio_settings',
         'hata.discord.voice.encryption_adapters',
+        'hata.discord.voice.opus_containers',
         'hata.discord.voice.packets',
         'hata.discord.webhook',
         'hata.discord.webhook.webhook',
@@ -322,6 +323,9 @@ setup(
             'libopus-0.x64.dll',
             'libopus-0.x86.dll',
         ],
+        'hata.discord.emoji.unicode': [
+            'unicodes.txt',
+        ],
     },
     python_requires = '>=3.6,<3.12',
     install_requires = [
@@ -333,6 +337,7 @@ setup(
             'PyNaCl>=1.3.0',
             'cchardet>=2.0',
             'inotify_simple>=1.3.5',
+            'orjson>=3.0',
             'python-dateutil>=2.0',
             'snakeviz',
             'yappi',
@@ -342,6 +347,7 @@ setup(
         ],
         'cpythonspeedups': [
             'cchardet>=2.0',
+            'orjson>=3.0',
         ],
         'profiling': [
             'snakeviz',